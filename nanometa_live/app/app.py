@@ -82,7 +82,10 @@ def _sweep_dead_run_caches(base_cache_dir: str) -> None:
             logging.debug("Could not remove stale cache dir %s: %s", target, exc)
 
 
-def _ensure_background_callback_manager(base_cache_dir: str) -> DiskcacheManager:
+def _ensure_background_callback_manager(
+    base_cache_dir: str,
+    workers: Optional[Dict[str, int]] = None,
+) -> DiskcacheManager:
     """Construct the Diskcache-backed background callback manager.
 
     The on-disk path is per-process (``run-<pid>-<ts>/``) so concurrent
@@ -90,6 +93,10 @@ def _ensure_background_callback_manager(base_cache_dir: str) -> DiskcacheManager
     results, and a restart starts with an empty cache. Stale ``run-*``
     directories from prior crashes are swept on first call.
     Idempotent for a given base directory.
+
+    *workers* maps lane name to worker-process count (see
+    ``app/utils/background_pool.py``). ``None`` uses the pool defaults;
+    all-zero falls back to Dash's spawn-per-job ``DiskcacheManager``.
     """
     global background_callback_manager, _cache, _cache_dir_for_atexit
     if (
@@ -103,7 +110,16 @@ def _ensure_background_callback_manager(base_cache_dir: str) -> DiskcacheManager
     run_dir = _per_run_cache_dir(base_cache_dir)
     os.makedirs(run_dir, exist_ok=True)
     _cache = diskcache.FanoutCache(run_dir, shards=8, timeout=1.0)
-    background_callback_manager = DiskcacheManager(_cache, expire=3600)
+    from nanometa_live.app.utils.background_pool import (
+        DEFAULT_WORKERS, PooledDiskcacheManager,
+    )
+    lane_sizes = dict(DEFAULT_WORKERS if workers is None else workers)
+    if any(lane_sizes.values()):
+        background_callback_manager = PooledDiskcacheManager(
+            _cache, expire=3600, workers=lane_sizes,
+        )
+    else:
+        background_callback_manager = DiskcacheManager(_cache, expire=3600)
 
     # Tear down the per-process cache on graceful exit so the typical
     # ``Ctrl-C`` flow does not leave stale shards around. Crashes are
@@ -113,6 +129,12 @@ def _ensure_background_callback_manager(base_cache_dir: str) -> DiskcacheManager
         import shutil as _shutil
 
         def _cleanup() -> None:
+            shutdown = getattr(background_callback_manager, "shutdown", None)
+            if shutdown is not None:
+                try:
+                    shutdown()
+                except Exception:
+                    pass
             try:
                 if _cache is not None:
                     _cache.close()
@@ -129,15 +151,6 @@ def _ensure_background_callback_manager(base_cache_dir: str) -> DiskcacheManager
     return background_callback_manager
 
 from nanometa_live import __version__
-from nanometa_live.app.layouts.main_layout import create_main_layout
-from nanometa_live.app.layouts.qc_layout import create_qc_layout
-from nanometa_live.app.layouts.classification_layout import create_classification_layout
-from nanometa_live.app.layouts.config_layout import create_config_layout
-from nanometa_live.app.layouts.dashboard_layout import create_dashboard_layout
-from nanometa_live.app.layouts.validation_layout import create_validation_layout
-from nanometa_live.app.layouts.reports_layout import create_reports_layout
-from nanometa_live.app.layouts.watchlist_preparation_layout import create_watchlist_preparation_layout
-from nanometa_live.app.layouts.deployment_layout import create_deployment_layout
 from nanometa_live.app.components.header import create_header
 from nanometa_live.app.components.collision_modal import create_collision_modal
 from nanometa_live.core.workflow.backend_manager import BackendManager
@@ -149,13 +162,92 @@ def _tab_label(icon_class: str, text: str):
     return text
 
 
-def _init_offline_mode(offline: bool, genome_cache_dir: Optional[str] = None) -> None:
+# Main tabs in display order: (tab_id, icon, label, tabClassName, layout
+# builder as "module:function"). Builders are imported on demand so that in
+# lazy_tabs mode a tab's layout module -- and the plotting stack some of
+# them import -- is not loaded until the operator first opens that tab.
+_TAB_SPECS = (
+    # Overview group
+    ("dashboard-tab", "bi-grid", "Dashboard", "fw-semibold tab-dashboard",
+     "nanometa_live.app.layouts.dashboard_layout:create_dashboard_layout"),
+    # Analysis group
+    ("main-tab", "bi-bug", "Organisms", "tab-organisms tab-group-start",
+     "nanometa_live.app.layouts.main_layout:create_main_layout"),
+    ("qc-tab", "bi-clipboard-check", "Quality Control", "tab-qc",
+     "nanometa_live.app.layouts.qc_layout:create_qc_layout"),
+    ("classification-tab", "bi-diagram-3", "Taxonomy", "tab-taxonomy",
+     "nanometa_live.app.layouts.classification_layout:create_classification_layout"),
+    ("validation-tab", "bi-shield-check", "Validation", "tab-validation",
+     "nanometa_live.app.layouts.validation_layout:create_validation_layout"),
+    ("reports-tab", "bi-journal-text", "Reports", "tab-reports",
+     "nanometa_live.app.layouts.reports_layout:create_reports_layout"),
+    # Setup group (ordered by workflow: configure -> prepare -> deploy)
+    ("config-tab", "bi-gear", "Configuration", "tab-config tab-group-start",
+     "nanometa_live.app.layouts.config_layout:create_config_layout"),
+    # Watchlist + Preparation merged into one tab (reuses the
+    # watchlist-tab id so session-persisted active_tab and the
+    # config "Next" navigation keep resolving).
+    ("watchlist-tab", "bi-clipboard2-check", "Watchlist & Preparation", "tab-watchlist",
+     "nanometa_live.app.layouts.watchlist_preparation_layout:"
+     "create_watchlist_preparation_layout"),
+    ("deployment-tab", "bi-rocket-takeoff", "Deployment", "tab-deployment",
+     "nanometa_live.app.layouts.deployment_layout:create_deployment_layout"),
+)
+
+# Tabs built at startup even in lazy_tabs mode. The Dashboard is the
+# landing tab and carries the verdict banner, so it is never deferred.
+EAGER_TABS = frozenset({"dashboard-tab"})
+
+LAZY_TAB_BODY = "lazy-tab-body"
+
+
+def build_tab_layout(tab_id: str):
+    """Import and call the layout builder registered for *tab_id*."""
+    import importlib
+
+    for spec_id, _icon, _label, _cls, builder in _TAB_SPECS:
+        if spec_id == tab_id:
+            module_name, func_name = builder.split(":")
+            return getattr(importlib.import_module(module_name), func_name)()
+    raise KeyError(f"unknown tab id {tab_id!r}")
+
+
+def _create_main_tabs(lazy: bool) -> dbc.Tabs:
+    """Build the main tab strip.
+
+    With *lazy*, every tab outside :data:`EAGER_TABS` gets an empty
+    pattern-matched container that ``render_lazy_tab`` fills on first
+    navigation. Callbacks are still registered for every tab at startup --
+    the browser fetches the callback graph once, on page load -- so a
+    deferred tab's callbacks simply fire when its components first mount.
+    A store that callbacks outside its tab read belongs in the shell
+    instead (see the cross-tab stores in ``create_app``).
+    """
+    tabs = []
+    for tab_id, icon, label, tab_class, _builder in _TAB_SPECS:
+        if lazy and tab_id not in EAGER_TABS:
+            children = html.Div(id={"type": LAZY_TAB_BODY, "tab": tab_id})
+        else:
+            children = build_tab_layout(tab_id)
+        tabs.append(dbc.Tab(
+            label=_tab_label(icon, label),
+            tab_id=tab_id,
+            children=children,
+            tabClassName=tab_class,
+        ))
+    return dbc.Tabs(tabs, id="tabs", active_tab="dashboard-tab",
+                    persistence=True, persistence_type="session")
+
+
+def _init_offline_mode(offline: bool, genome_cache_dir: Optional[str] = None,
+                       blast_db_mode: Optional[str] = None) -> None:
     """Propagate offline_mode to all API client singletons.
 
     Must be called before any callback fires so that lazily-created
     singletons inherit the correct mode. ``genome_cache_dir`` is
     threaded into the GenomeManager so first-time creation lands at
-    the operator-configured path instead of the legacy default.
+    the operator-configured path instead of the legacy default, and
+    ``blast_db_mode`` so its startup auto-build honours the config.
     """
     from nanometa_live.core.taxonomy.taxonomy_api import get_ncbi_client, get_gtdb_client
     from nanometa_live.core.utils.offline_cache import get_cache
@@ -164,7 +256,8 @@ def _init_offline_mode(offline: bool, genome_cache_dir: Optional[str] = None) ->
     get_cache(offline_mode=offline)
     get_ncbi_client(offline_mode=offline)
     get_gtdb_client(offline_mode=offline)
-    get_genome_manager(cache_dir=genome_cache_dir, offline_mode=offline)
+    get_genome_manager(cache_dir=genome_cache_dir, offline_mode=offline,
+                       blast_db_mode=blast_db_mode)
 
 
 def create_app(
@@ -199,7 +292,10 @@ def create_app(
 
     # Initialise the background-callback Diskcache lazily so its shards
     # land under ``data_dir/cache`` instead of ``~/.nanometa/cache``.
-    _ensure_background_callback_manager(str(paths.cache))
+    from nanometa_live.app.utils.background_pool import worker_counts_from_config
+    _ensure_background_callback_manager(
+        str(paths.cache), workers=worker_counts_from_config(config),
+    )
 
     # Load Kraken2 database registry. The package ships a download
     # manifest of public DBs (genome-idx URLs); operators can also
@@ -345,6 +441,20 @@ def create_app(
             abort(404)
         return send_file(str(path))
 
+    # Prometheus-text /metrics: loader durations, cache hit ratios and
+    # per-output callback timings (app/utils/metrics_endpoint.py).
+    from nanometa_live.app.utils.metrics_endpoint import register_metrics
+    register_metrics(app)
+
+    # Coverage depth tiles for the validation tab's zoomable depth plot
+    # (app/utils/coverage_tiles.py).
+    from nanometa_live.app.utils.coverage_tiles import register_coverage_tiles
+    register_coverage_tiles(app)
+
+    # lazy_tabs: build only the shell and the Dashboard at startup and lay
+    # out every other tab on first navigation (see _create_main_tabs).
+    lazy_tabs = bool(config.get("lazy_tabs", False))
+
     # Create app layout with tabs
     app.layout = html.Div([
         # Accessibility: Skip to main content link
@@ -408,14 +518,18 @@ def create_app(
         dcc.Store(id='user-stop-requested', data=False),
         dcc.Store(id='readiness-state', data={"ready": False, "checks": []}),
         # {fingerprint, ts} of the last ReadinessChecker run. update_readiness_state
-        # is a background callback, and DiskcacheManager spawns a fresh process
-        # per invocation, so its TTL state cannot live in a module global -- it
-        # would reset every call and the docker/nextflow probes would run on
+        # is a background callback running in whichever pooled worker is free,
+        # so its TTL state cannot live in a module global -- it would not be
+        # shared between calls and the docker/nextflow probes would run on
         # every poll. Deliberately separate from readiness-state, which is left
         # unwritten when the result is unchanged so the checklist does not
         # re-open under the operator; this Store has no renderer and so can be
         # written every recompute, which is what keeps the TTL window renewable.
         dcc.Store(id='readiness-probe-stamp', data=None),
+        # {done, total, started_at, checks} streamed by update_readiness_state's
+        # progress output while a recompute the operator is waiting on runs;
+        # the header pill shows it until readiness-state lands.
+        dcc.Store(id='readiness-partial', data=None),
 
         # Per-list "show all" toggles for the BLAST + minimap2 result-
         # card containers. Default False renders only the top 30; the
@@ -456,6 +570,19 @@ def create_app(
         dcc.Store(id='genome-download-complete', data=None),
         dcc.Store(id='blast-build-complete', data=None),
 
+        # Stores owned by a tab but read by callbacks whose outputs live
+        # elsewhere (the Dashboard verdict and alert panel, the watchlist
+        # snapshot hydration). They sit in the shell so that, with
+        # lazy_tabs, those callbacks see them before the owning tab is
+        # first opened. tests/test_lazy_tabs.py walks the callback map for
+        # any new cross-tab read.
+        dcc.Store(id='watchlist-tab-state', data={}),
+        dcc.Store(id='watchlist-table-refresh', data=0),
+        dcc.Store(id='validation-data-store', data={}),
+        # Rendered-fingerprint memo for validation-data-store; see
+        # load_validation_data.
+        dcc.Store(id='validation-rendered-fp'),
+
         # Interval for updating data
         dcc.Interval(
             id='update-interval',
@@ -571,69 +698,7 @@ def create_app(
         # Main content area with accessibility landmark
         html.Main([
             # Main tabs container - Dashboard first for monitoring workflow
-            dbc.Tabs([
-                # Overview group
-                dbc.Tab(
-                    label=_tab_label("bi-grid", "Dashboard"),
-                    tab_id="dashboard-tab",
-                    children=create_dashboard_layout(),
-                    tabClassName="fw-semibold tab-dashboard"
-                ),
-                # Analysis group
-                dbc.Tab(
-                    label=_tab_label("bi-bug", "Organisms"),
-                    tab_id="main-tab",
-                    children=create_main_layout(),
-                    tabClassName="tab-organisms tab-group-start"
-                ),
-                dbc.Tab(
-                    label=_tab_label("bi-clipboard-check", "Quality Control"),
-                    tab_id="qc-tab",
-                    children=create_qc_layout(),
-                    tabClassName="tab-qc"
-                ),
-                dbc.Tab(
-                    label=_tab_label("bi-diagram-3", "Taxonomy"),
-                    tab_id="classification-tab",
-                    children=create_classification_layout(),
-                    tabClassName="tab-taxonomy"
-                ),
-                dbc.Tab(
-                    label=_tab_label("bi-shield-check", "Validation"),
-                    tab_id="validation-tab",
-                    children=create_validation_layout(),
-                    tabClassName="tab-validation"
-                ),
-                dbc.Tab(
-                    label=_tab_label("bi-journal-text", "Reports"),
-                    tab_id="reports-tab",
-                    children=create_reports_layout(),
-                    tabClassName="tab-reports"
-                ),
-                # Setup group (ordered by workflow: configure -> prepare -> deploy)
-                dbc.Tab(
-                    label=_tab_label("bi-gear", "Configuration"),
-                    tab_id="config-tab",
-                    children=create_config_layout(),
-                    tabClassName="tab-config tab-group-start"
-                ),
-                # Watchlist + Preparation merged into one tab (reuses the
-                # watchlist-tab id so session-persisted active_tab and the
-                # config "Next" navigation keep resolving).
-                dbc.Tab(
-                    label=_tab_label("bi-clipboard2-check", "Watchlist & Preparation"),
-                    tab_id="watchlist-tab",
-                    children=create_watchlist_preparation_layout(),
-                    tabClassName="tab-watchlist"
-                ),
-                dbc.Tab(
-                    label=_tab_label("bi-rocket-takeoff", "Deployment"),
-                    tab_id="deployment-tab",
-                    children=create_deployment_layout(),
-                    tabClassName="tab-deployment"
-                )
-            ], id="tabs", active_tab="dashboard-tab",
-               persistence=True, persistence_type="session"),
+            _create_main_tabs(lazy_tabs),
         ], id="main-content", role="main"),
 
         # Pathogen report modal and data store - placed at root level so the
@@ -883,14 +948,38 @@ def create_app(
     offline = config.get("offline_mode", False)
     if offline:
         logging.info("Offline mode enabled — API clients will use cached data only")
-    _init_offline_mode(offline, genome_cache_dir=config.get("genome_cache_dir"))
+    _init_offline_mode(offline, genome_cache_dir=config.get("genome_cache_dir"),
+                       blast_db_mode=config.get("blast_db_mode"))
 
     # Register all callbacks
     register_callbacks(app, backend_manager)
+    if lazy_tabs:
+        register_lazy_tab_callback(app)
 
     return app
 
 
+def register_lazy_tab_callback(app: Dash) -> None:
+    """Fill a deferred tab's container the first time that tab is opened."""
+    from dash import ALL, no_update
+
+    @app.callback(
+        Output({"type": LAZY_TAB_BODY, "tab": ALL}, "children"),
+        Input("tabs", "active_tab"),
+        State({"type": LAZY_TAB_BODY, "tab": ALL}, "children"),
+        State({"type": LAZY_TAB_BODY, "tab": ALL}, "id"),
+    )
+    def render_lazy_tab(active_tab, bodies, ids):
+        """Lay out *active_tab* once; every other container is left alone."""
+        out = []
+        for body, component_id in zip(bodies, ids):
+            if component_id["tab"] == active_tab and not body:
+                out.append(build_tab_layout(active_tab))
+            else:
+                out.append(no_update)
+        return out
+
+
 def register_callbacks(app: Dash, backend_manager: BackendManager):
     """
     Register all callbacks for the application.
@@ -16,6 +16,7 @@ from nanometa_live.app.callbacks.samples import register_samples
 from nanometa_live.app.callbacks.indicators import register_indicators
 from nanometa_live.app.callbacks.progress import register_progress
 from nanometa_live.app.callbacks.navigation import register_navigation
+from nanometa_live.app.callbacks.profiling import register_profiling
 
 
 __all__ = ["register_core_callbacks"]
@@ -38,3 +39,4 @@ def register_core_callbacks(app: Dash, backend_manager: BackendManager):
     register_indicators(app, backend_manager)
     register_progress(app, backend_manager)
     register_navigation(app, backend_manager)
+    register_profiling(app, backend_manager)
@@ -0,0 +1,88 @@
+"""Sampling-profiler controls (Configuration tab) and callback tagging."""
+
+import logging
+import os
+import time
+
+import dash
+from dash import Input, Output, State, html
+import dash_bootstrap_components as dbc
+from flask import request
+
+from nanometa_live.app.utils.metrics_endpoint import DISPATCH_PATH_SUFFIX, callback_output
+from nanometa_live.core.utils.stack_sampler import (
+    default_profile_dir,
+    profiler_running,
+    profiler_status,
+    start_profiler,
+    stop_profiler,
+    tag_current_thread,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def tag_callback_threads(server) -> None:
+    """Tag sampler stacks with the Dash callback a request thread is serving.
+
+    Costs one flag check per request while the sampler is off.
+    """
+
+    @server.before_request
+    def _tag_profiled_callback():
+        if profiler_running() and request.path.endswith(DISPATCH_PATH_SUFFIX):
+            tag_current_thread(callback_output())
+
+    @server.teardown_request
+    def _untag_profiled_callback(_exc=None):
+        tag_current_thread(None)
+
+
+def _status_body(status):
+    if status is None:
+        return html.Span("Not started.", className="text-muted")
+    state = dbc.Badge("Sampling" if status["running"] else "Stopped",
+                      color="danger" if status["running"] else "secondary",
+                      className="me-2")
+    since = (time.strftime("%H:%M:%S", time.localtime(status["started_at"]))
+             if status.get("started_at") else "-")
+    return html.Div([
+        html.Div([state,
+                  html.Small(f"{status['hz']:.0f} Hz since {since}, "
+                             f"{status['samples']} samples, "
+                             f"{status['files']} file(s)", className="text-muted")]),
+        html.Small(["Folded stacks in ", html.Code(status["out_dir"])],
+                   className="d-block text-break mt-1"),
+    ])
+
+
+def register_profiling(app, backend_manager):
+    tag_callback_threads(app.server)
+
+    @app.callback(
+        Output("profiler-status", "children"),
+        Output("profiler-start-btn", "disabled"),
+        Output("profiler-stop-btn", "disabled"),
+        Input("profiler-start-btn", "n_clicks"),
+        Input("profiler-stop-btn", "n_clicks"),
+        State("app-data-dir", "data"),
+    )
+    def control_profiler(_start_clicks, _stop_clicks, data_dir):
+        """Start or stop the stack sampler; on load, report its state.
+
+        A sampler started with ``--profile`` shows as running here and can
+        be stopped from the tab like one started here.
+        """
+        if dash.ctx.triggered_id == "profiler-start-btn" and not profiler_running():
+            data_root = data_dir or os.path.expanduser("~/.nanometa")
+            try:
+                start_profiler(default_profile_dir(data_root))
+            except OSError as e:
+                logger.warning("Could not start the stack sampler: %s", e)
+                return (dbc.Alert(f"Could not start the profiler: {e}",
+                                  color="danger", className="small py-2 mb-0"),
+                        False, True)
+        elif dash.ctx.triggered_id == "profiler-stop-btn":
+            stop_profiler()
+        running = profiler_running()
+        return _status_body(profiler_status()), running, not running
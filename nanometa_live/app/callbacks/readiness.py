@@ -45,20 +45,39 @@ def _serialize_report(report) -> Dict[str, Any]:
     return {
         "ready": report.ready,
         "summary": report.summary(),
-        "checks": [
-            {
-                "name": c.name,
-                "passed": c.passed,
-                "severity": c.severity.value,
-                "message": c.message,
-            }
-            for c in report.checks
-        ],
+        "checks": [_serialize_check(c) for c in report.checks],
         "computed_at": time.time(),
         "error": None,
     }
 
 
+def _serialize_check(c) -> Dict[str, Any]:
+    return {
+        "name": c.name,
+        "passed": c.passed,
+        "severity": c.severity.value,
+        "message": c.message,
+    }
+
+
+# A readiness-partial value older than this is a run that died mid-way
+# (worker killed); the pill falls back to readiness-state instead of
+# showing "Checking..." forever.
+_PARTIAL_STALE_AFTER = 120.0
+
+
+def _partial_in_progress(partial: Optional[Dict[str, Any]], now: float) -> bool:
+    """True while a streamed recompute is still filling in its checks."""
+    if not isinstance(partial, dict):
+        return False
+    try:
+        done, total = int(partial.get("done", 0)), int(partial.get("total", 0))
+        started = float(partial.get("started_at") or 0.0)
+    except (TypeError, ValueError):
+        return False
+    return done < total and (now - started) < _PARTIAL_STALE_AFTER
+
+
 def _empty_readiness_state(message: str) -> Dict[str, Any]:
     """Readiness-state value when there is no config or the check errored."""
     return {
@@ -76,12 +95,14 @@ def _empty_readiness_state(message: str) -> Dict[str, Any]:
 # ~10 s) when the readiness-relevant config is unchanged.
 #
 # The state MUST live in a Store, not in this module. This callback is
-# background=True, and DiskcacheManager starts a NEW OS process per invocation
-# (app.py forces the "spawn" start method), so a module-level dict is
-# re-initialised on every single call and the TTL never once fired -- the
-# probes ran on every tick for the life of the session. The Store is written
-# by the worker and read back as State on the next call, which is the only
-# channel that survives the process boundary.
+# background=True and runs in a worker process: one of several pooled workers
+# (app/utils/background_pool.py), any of which may take the next call and
+# each recycled after a number of jobs, or a fresh process per call when the
+# pool is disabled. A module-level dict is therefore not shared between calls;
+# when it was, under spawn-per-call, the TTL never once fired and the probes
+# ran on every tick. The Store is written by the worker and read back as
+# State on the next call, which is the only channel that survives the
+# process boundary.
 _READINESS_TTL = 60.0
 
 
@@ -154,6 +175,23 @@ def _readiness_unchanged(prev: Optional[Dict[str, Any]],
     )
 
 
+def _readiness_popover_items(checks) -> html.Div:
+    """One icon + name row per serialized check, for the header popover."""
+    popover_items = []
+    for c in checks:
+        if c.get("passed"):
+            icon_cls = "bi bi-check-circle-fill text-success"
+        else:
+            icon_cls = _SEVERITY_ICON.get(c.get("severity"), "bi bi-dash-circle text-muted")
+        popover_items.append(
+            html.Div([
+                html.I(className=f"{icon_cls} me-2"),
+                html.Span(c.get("name", ""), className="small"),
+            ], className="mb-1", title=c.get("message", ""))
+        )
+    return html.Div(popover_items, style={"maxHeight": "300px", "overflowY": "auto"})
+
+
 def register_readiness(app, backend_manager):
     # Recompute callback: the ONLY place that runs ReadinessChecker. It writes
     # the shared readiness-state Store; both the header pill (below) and the
@@ -163,22 +201,32 @@ def register_readiness(app, backend_manager):
     # ``nextflow -version`` (10 s) plus other probes -- up to ~15-20 s on the
     # first run after a config change. A DiskcacheManager worker keeps the
     # Werkzeug request thread responsive. ``check-readiness-btn`` is a direct
-    # Input so the operator's "Check Everything" forces an immediate recompute.
+    # Input so the operator's "Check Everything" forces an immediate recompute;
+    # it is optional because the button lives in the Watchlist & Preparation
+    # tab, which lazy_tabs builds only on first visit.
+    #
+    # Checks run concurrently and each reuses its on-disk result while its
+    # inputs are unchanged and its TTL holds (readiness_engine). When the
+    # operator is waiting -- nothing shown yet, or "Check Everything" --
+    # each finished check is streamed to ``readiness-partial`` so the pill
+    # fills in while the slow probes are still running.
     @app.callback(
         Output("readiness-state", "data"),
         Output("readiness-probe-stamp", "data"),
         Input("update-interval", "n_intervals"),
         Input("app-config", "data"),
-        Input("check-readiness-btn", "n_clicks"),
+        Input("check-readiness-btn", "n_clicks", allow_optional=True),
         Input("genome-download-complete", "data"),
         State("readiness-state", "data"),
         State("watchlist-entries-snapshot", "data"),
         State("readiness-probe-stamp", "data"),
         background=True,
         manager=background_callback_manager,
+        progress=Output("readiness-partial", "data"),
     )
-    def update_readiness_state(n_intervals, config, n_clicks, genome_change,
-                               prev_state, watchlist_entries, probe_stamp):
+    def update_readiness_state(set_progress, n_intervals, config, n_clicks,
+                               genome_change, prev_state, watchlist_entries,
+                               probe_stamp):
         """Compute readiness and publish it to the shared Store, deduplicated.
 
         Idle update-interval ticks must not re-run the checker's subprocess
@@ -190,6 +238,7 @@ def register_readiness(app, backend_manager):
         (and the renderers) stay put.
         """
         from nanometa_live.core.workflow.readiness_checker import ReadinessChecker
+        from nanometa_live.core.workflow.readiness_engine import CheckCache
 
         # A genome import/download/delete changes neither config nor watchlist,
         # so the fingerprint/TTL gate below would skip the recompute and the
@@ -217,18 +266,30 @@ def register_readiness(app, backend_manager):
             # recompute, including the docker/nextflow subprocess probes.
             return no_update, no_update
 
+        on_result = None
+        if forced or not (prev_state or {}).get("checks"):
+            def on_result(results, done, total):
+                set_progress({
+                    "done": done, "total": total, "started_at": now,
+                    "checks": [_serialize_check(c) for c in results],
+                })
+
         try:
             # Pass the watchlist snapshot: this callback runs in a background
             # worker where the WatchlistManager singleton is empty, so the
             # watchlist checks would otherwise always report "not enabled".
-            report = ReadinessChecker().check_readiness(
+            checker = ReadinessChecker(cache=CheckCache.for_config(config))
+            report = checker.check_readiness(
                 config, watchlist_entries=watchlist_entries,
                 reload_genomes=genome_set_changed,
+                on_result=on_result, refresh=forced,
             )
             new = _serialize_report(report)
         except Exception as e:
             logging.error(f"Readiness check failed: {e}")
             new = _empty_readiness_state(str(e))
+            if on_result is not None:
+                set_progress(None)
 
         # Always refresh the probe window, even when the report itself is
         # unchanged and readiness-state is left alone below. No renderer reads
@@ -247,9 +308,21 @@ def register_readiness(app, backend_manager):
         Output("readiness-badge", "color"),
         Output("readiness-popover-body", "children"),
         Input("readiness-state", "data"),
+        Input("readiness-partial", "data"),
     )
-    def render_readiness_badge(state):
-        """Render the header readiness pill from the shared Store (no I/O)."""
+    def render_readiness_badge(state, partial=None):
+        """Render the header readiness pill from the shared Store (no I/O).
+
+        While a streamed recompute is in flight, shows its progress and the
+        checks finished so far instead.
+        """
+        if _partial_in_progress(partial, time.time()):
+            return (
+                [html.I(className="bi bi-hourglass-split me-1"),
+                 f"Checking {partial['done']}/{partial['total']}"],
+                "secondary",
+                _readiness_popover_items(partial.get("checks") or []),
+            )
         state = state or {}
         checks = state.get("checks") or []
         error = state.get("error")
@@ -287,19 +360,7 @@ def register_readiness(app, backend_manager):
             ]
             badge_color = "danger" if summary.get("critical_failures", 0) > 0 else "warning"
 
-        popover_items = []
-        for c in checks:
-            if c.get("passed"):
-                icon_cls = "bi bi-check-circle-fill text-success"
-            else:
-                icon_cls = _SEVERITY_ICON.get(c.get("severity"), "bi bi-dash-circle text-muted")
-            popover_items.append(
-                html.Div([
-                    html.I(className=f"{icon_cls} me-2"),
-                    html.Span(c.get("name", ""), className="small"),
-                ], className="mb-1", title=c.get("message", ""))
-            )
-        popover_content = html.Div(popover_items, style={"maxHeight": "300px", "overflowY": "auto"})
+        popover_content = _readiness_popover_items(checks)
         if not ready:
             popover_content = html.Div([
                 popover_content,
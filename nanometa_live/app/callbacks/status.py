@@ -212,6 +212,27 @@ def register_status(app, backend_manager):
             return config["analysis_name"]
         return "Nanometa Live Analysis"
 
+    @app.callback(
+        Output("background-jobs-indicator", "children"),
+        Output("background-jobs-indicator", "style"),
+        Input("update-interval", "n_intervals"),
+    )
+    def update_background_jobs_indicator(_):
+        """Show per-lane background-job queue depth in the header.
+
+        Reads the manager through the module attribute at call time: it is
+        constructed by create_app, after this module was imported. Hidden
+        when no job is queued or running, and under the spawn-per-job
+        fallback, which has no queue to report.
+        """
+        from nanometa_live.app import app as app_module
+        from nanometa_live.app.utils.background_pool import format_queue_depth
+        metrics_fn = getattr(app_module.background_callback_manager, "queue_metrics", None)
+        text = format_queue_depth(metrics_fn() if metrics_fn else None)
+        if not text:
+            return "", {"display": "none"}
+        return text, {}
+
     # NOTE: the former show_notification callback (which rendered the
     # notification-trigger channel into a separate header notification-container)
     # has been folded into the single display_toast renderer below, so there is
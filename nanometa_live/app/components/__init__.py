@@ -9,51 +9,43 @@ Components are organized as follows:
 - modern_components.py: Operator-friendly cards, badges, meters
 - organism_components.py: Organism display cards
 - pathogen_alert.py: Critical pathogen alert banners and panels
+
+Re-exports are resolved lazily (PEP 562), so importing one leaf module such
+as ``header`` does not import every component module with it.
 """
 
-from nanometa_live.app.components.header import create_header
-from nanometa_live.app.components.config_form import create_config_form
-from nanometa_live.app.components.pathogen_alert import (
-    CriticalPathogenAlert,
-    HighRiskPathogenAlert,
-    WatchedSpeciesAlert,
-)
-from nanometa_live.app.components.modern_components import (
-    QualityScoreBadge,
-    N50Badge,
-    ClassificationRateBadge,
-    StatusCard,
-    StatCard,
-    AlertBanner,
-    SampleStatusBadge,
-    EmptyStateMessage,
-    TrendIndicator,
-    DecisionBanner,
-)
-from nanometa_live.app.components.organism_components import (
-    OrganismCard,
-    OrganismSummaryCard,
-)
-
-__all__ = [
-    "create_header",
-    "create_config_form",
+import importlib
+
+_EXPORTS = {
+    "create_header": "nanometa_live.app.components.header",
+    "create_config_form": "nanometa_live.app.components.config_form",
     # Pathogen alerts
-    "CriticalPathogenAlert",
-    "HighRiskPathogenAlert",
-    "WatchedSpeciesAlert",
+    "CriticalPathogenAlert": "nanometa_live.app.components.pathogen_alert",
+    "HighRiskPathogenAlert": "nanometa_live.app.components.pathogen_alert",
+    "WatchedSpeciesAlert": "nanometa_live.app.components.pathogen_alert",
     # Modern components
-    "QualityScoreBadge",
-    "N50Badge",
-    "ClassificationRateBadge",
-    "StatusCard",
-    "StatCard",
-    "AlertBanner",
-    "SampleStatusBadge",
-    "EmptyStateMessage",
-    "TrendIndicator",
-    "DecisionBanner",
+    "QualityScoreBadge": "nanometa_live.app.components.modern_components",
+    "N50Badge": "nanometa_live.app.components.modern_components",
+    "ClassificationRateBadge": "nanometa_live.app.components.modern_components",
+    "StatusCard": "nanometa_live.app.components.modern_components",
+    "StatCard": "nanometa_live.app.components.modern_components",
+    "AlertBanner": "nanometa_live.app.components.modern_components",
+    "SampleStatusBadge": "nanometa_live.app.components.modern_components",
+    "EmptyStateMessage": "nanometa_live.app.components.modern_components",
+    "TrendIndicator": "nanometa_live.app.components.modern_components",
+    "DecisionBanner": "nanometa_live.app.components.modern_components",
     # Organism components
-    "OrganismCard",
-    "OrganismSummaryCard",
-]
+    "OrganismCard": "nanometa_live.app.components.organism_components",
+    "OrganismSummaryCard": "nanometa_live.app.components.organism_components",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,85 @@
+"""
+Abundance trend chart for the classification tab.
+
+Plots reads per batch for the taxa rising fastest, read from the per-batch
+abundance series (``core.utils.abundance_timeseries``). Each batch is one
+point at its report's arrival time, so a pathogen climbing across batches
+shows as a rising line and its first appearance as the line's first point.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+import plotly.graph_objects as go
+# Importing plotly_theme registers the "nanometa" Plotly template.
+import nanometa_live.app.utils.plotly_theme  # noqa: F401
+
+from nanometa_live.core.utils.abundance_timeseries import DEFAULT_WINDOW, AbundanceStore
+
+#: Batches drawn per line; older history is still held by the store.
+TREND_HISTORY_BATCHES = 50
+
+
+def create_abundance_trend_figure(
+    store: AbundanceStore,
+    sample: Optional[str] = None,
+    top_k: int = 8,
+    window: int = DEFAULT_WINDOW,
+    color_palette: Optional[list] = None,
+) -> Optional[go.Figure]:
+    """
+    Create a reads-per-batch line chart for the top rising species.
+
+    Args:
+        store: Refreshed abundance store for the results directory.
+        sample: Sample name, or None / "All Samples" for every sample.
+        top_k: Number of (sample, species) lines to draw.
+        window: Batches over which the rise is measured.
+        color_palette: Optional list of line colors.
+
+    Returns:
+        Plotly Figure, or None when no species is rising.
+    """
+    risers = store.top_risers(k=top_k, window=window, sample=sample)
+    if not risers:
+        return None
+
+    multi_sample = len({r["sample"] for r in risers}) > 1
+    fig = go.Figure()
+    for i, riser in enumerate(risers):
+        trend = store.rate_trend(riser["taxid"], sample=riser["sample"],
+                                 last_k=TREND_HISTORY_BATCHES)
+        label = riser["name"] or f"taxid {riser['taxid']}"
+        if multi_sample:
+            label = f"{label} ({riser['sample']})"
+        line = {"width": 2}
+        if color_palette:
+            line["color"] = color_palette[i % len(color_palette)]
+        fig.add_trace(go.Scatter(
+            x=[datetime.fromtimestamp(ts) for ts in trend["ts"]],
+            y=trend["reads"],
+            customdata=trend[["batch", "reads_per_min"]].to_numpy(),
+            mode="lines+markers",
+            name=label,
+            line=line,
+            hovertemplate=(
+                f"<b>{label}</b><br>Batch %{{customdata[0]}}<br>"
+                "DNA sequences: %{y:,}<br>Rate: %{customdata[1]:.1f}/min<extra></extra>"
+            ),
+        ))
+
+    fig.update_layout(
+        title=dict(
+            text=f"Fastest-rising species over the last {window} batches",
+            font=dict(size=14, color="#374151"),
+        ),
+        xaxis=dict(title="Batch arrival time"),
+        yaxis=dict(title="DNA sequences per batch", rangemode="tozero"),
+        template="nanometa",
+        height=450,
+        margin=dict(l=50, r=30, t=50, b=30),
+        font=dict(family="Arial, sans-serif", size=12),
+        legend=dict(orientation="h", yanchor="top", y=-0.15, font=dict(size=11)),
+        hovermode="closest",
+    )
+    return fig
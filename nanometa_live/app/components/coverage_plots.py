@@ -7,8 +7,13 @@ coverage from minimap2 PAF alignments:
 1. Genome coverage depth (area chart with range slider)
 2. Cumulative coverage curve
 3. Depth distribution histogram
+
+All three read a :class:`CoveragePyramid` (per-level min / mean / max depth
+plus the depth histogram) rather than the raw depth array.
 """
 
+from typing import Optional
+
 import numpy as np
 import plotly.graph_objects as go
 from dash import html
@@ -20,50 +25,69 @@ import dash_bootstrap_components as dbc
 # worker-process import for no benefit.
 import nanometa_live.app.utils.plotly_theme  # noqa: F401
 
+from nanometa_live.core.parsers.coverage_pyramid import CoveragePyramid
 from nanometa_live.core.parsers.paf_coverage_parser import CoverageData
 
 
+#: Bins across the visible range of the depth plot; roughly one per pixel.
+DEPTH_PLOT_BINS = 1500
+#: Bins across the whole reference outside a zoomed window (range slider).
+DEPTH_OVERVIEW_BINS = 500
+#: Route serving depth tiles; see app/utils/coverage_tiles.py.
+COVERAGE_TILE_ROUTE = "/coverage-tiles/"
+
+
+def _pyramid(coverage: CoverageData, pyramid: Optional[CoveragePyramid]) -> CoveragePyramid:
+    return pyramid if pyramid is not None else CoveragePyramid(coverage)
+
+
+def _initial_window(coverage: CoverageData):
+    """``(lo, hi)`` to zoom to for a single tight locus, else None.
+
+    Amplicon-aware zoom: when reads concentrate on a short locus (e.g. 16S)
+    the peak would be an invisible spike on a flat multi-Mb axis. A
+    multi-copy rRNA gene spans megabases between operons, so zooming to
+    min..max would not help -- only a single tight locus is zoomed.
+    """
+    single_locus = (0 < coverage.covered_span <= coverage.ref_length * 0.05)
+    if not (getattr(coverage, "is_concentrated", False) and single_locus):
+        return None
+    pad = max(coverage.covered_span // 2, 200)
+    return (max(0, coverage.covered_start - pad),
+            min(coverage.ref_length, coverage.covered_end + pad))
+
+
 def create_coverage_depth_figure(
     coverage: CoverageData,
     threshold: int = 10,
     window_size: int = 0,
+    pyramid: Optional[CoveragePyramid] = None,
 ) -> go.Figure:
     """
     Create a genome coverage depth area chart.
 
+    Depth is drawn from a :class:`CoveragePyramid` as per-bin mean depth
+    with a min-max band. When the pyramid has a token, the tile route and
+    threshold go into ``layout.meta["coverage_tiles"]`` and the validation
+    tab refetches the visible window on zoom, down to base-pair resolution.
+
     Args:
         coverage: CoverageData with depth array.
         threshold: Depth threshold for horizontal line.
-        window_size: Rolling average window. 0 = auto (1000 for genomes > 500 Kbp).
+        window_size: Bin width in bp for the initial view. 0 = auto
+            (``DEPTH_PLOT_BINS`` bins across the visible range).
+        pyramid: Pyramid for ``coverage``; built here when omitted.
 
     Returns:
         Plotly Figure.
     """
-    depth = coverage.depth_array
-
-    # Auto window size
-    if window_size == 0:
-        if coverage.ref_length > 500_000:
-            window_size = max(1, coverage.ref_length // 5000)
-        else:
-            window_size = max(1, coverage.ref_length // 1000)
-
-    # Smooth for display
-    if window_size > 1 and len(depth) > window_size:
-        kernel = np.ones(window_size) / window_size
-        smoothed = np.convolve(depth, kernel, mode="same")
-    else:
-        smoothed = depth.astype(float)
-
-    # Downsample to max ~5000 points for performance
-    max_points = 5000
-    if len(smoothed) > max_points:
-        step = len(smoothed) // max_points
-        x = np.arange(0, len(smoothed), step)
-        y = smoothed[::step]
-    else:
-        x = np.arange(len(smoothed))
-        y = smoothed
+    pyramid = _pyramid(coverage, pyramid)
+    window = _initial_window(coverage)
+    lo, hi = window or (0, coverage.ref_length)
+    bins = -(-(hi - lo) // window_size) if window_size > 0 else DEPTH_PLOT_BINS
+    tile = pyramid.view(lo, hi, bins, overview=DEPTH_OVERVIEW_BINS if window else 0)
+    x = np.asarray(tile["x"])
+    y = np.asarray(tile["mean"], dtype=float)
 
     fig = go.Figure()
 
@@ -90,6 +114,24 @@ def create_coverage_depth_figure(
         showlegend=True,
     ))
 
+    # Min-max band: a bin's mean hides single-base dropouts and spikes.
+    fig.add_trace(go.Scatter(
+        x=x, y=tile["max"],
+        mode="lines",
+        line=dict(width=0),
+        hoverinfo="skip",
+        showlegend=False,
+    ))
+    fig.add_trace(go.Scatter(
+        x=x, y=tile["min"],
+        mode="lines",
+        fill="tonexty",
+        fillcolor="rgba(31, 119, 180, 0.12)",
+        line=dict(width=0),
+        name="Min-max range",
+        hoverinfo="skip",
+    ))
+
     # Threshold line
     fig.add_hline(
         y=threshold,
@@ -128,37 +170,43 @@ def create_coverage_depth_figure(
         hovermode="x unified",
     )
 
-    # Amplicon-aware zoom: when reads concentrate on a short locus (e.g. 16S),
-    # default the x-range to that region (+padding) so the peak is visible rather
-    # than an invisible spike on a flat multi-Mb axis. The range slider still
-    # exposes the whole reference.
-    # Only zoom for a single tight locus; a multi-copy rRNA gene spans megabases
-    # between operons, so zooming to min..max would not help -- leave full view.
-    _single_locus = (0 < coverage.covered_span <= coverage.ref_length * 0.05)
-    if getattr(coverage, "is_concentrated", False) and _single_locus:
-        pad = max(coverage.covered_span // 2, 200)
-        lo = max(0, coverage.covered_start - pad)
-        hi = min(coverage.ref_length, coverage.covered_end + pad)
+    # The range slider still exposes the whole reference.
+    if window:
         fig.update_xaxes(
-            range=[lo, hi],
+            range=list(window),
             title="Position along genome (zoomed to covered region)",
         )
 
+    if pyramid.token:
+        fig.update_layout(
+            uirevision=pyramid.token,
+            meta={"coverage_tiles": {
+                "url": COVERAGE_TILE_ROUTE + pyramid.token,
+                "threshold": threshold,
+                "width": DEPTH_PLOT_BINS,
+                "overview": DEPTH_OVERVIEW_BINS,
+                "ref_length": coverage.ref_length,
+            }},
+        )
+
     return fig
 
 
-def create_cumulative_coverage_figure(coverage: CoverageData) -> go.Figure:
+def create_cumulative_coverage_figure(
+    coverage: CoverageData, pyramid: Optional[CoveragePyramid] = None,
+) -> go.Figure:
     """
     Create a cumulative coverage curve showing fraction of genome at >= N depth.
 
     Args:
         coverage: CoverageData with depth array.
+        pyramid: Pyramid for ``coverage``; built here when omitted.
 
     Returns:
         Plotly Figure.
     """
-    depth = coverage.depth_array
-    max_d = min(int(np.percentile(depth[depth > 0], 99)) if np.any(depth > 0) else 1, 500)
+    pyramid = _pyramid(coverage, pyramid)
+    max_d = min(int(pyramid.covered_percentile(99)) if coverage.covered_bp else 1, 500)
 
     # Amplicon-aware scaling: for concentrated coverage (a short locus in a
     # large genome) the genome-relative fraction is < 0.1% at every depth, so
@@ -180,14 +228,9 @@ def create_cumulative_coverage_figure(coverage: CoverageData) -> go.Figure:
         title = "How much of the genome is covered at each depth"
         hover = "Depth >= %{x}x<br>Genome covered: %{y:.1f}%<extra></extra>"
 
-    # Vectorized: count(depth >= t) for every threshold at once. Sorting once
-    # then searchsorted is O(N log N + max_d) instead of the previous
-    # O(max_d * N) Python loop (up to ~2.5e9 comparisons on a 5 Mbp genome).
-    # count(depth >= t) == N - (number of elements < t).
-    sorted_depth = np.sort(depth)
-    counts_at_or_above = sorted_depth.size - np.searchsorted(
-        sorted_depth, thresholds, side="left"
-    )
+    # count(depth >= t) for every threshold at once, from the pyramid's
+    # depth histogram: O(max depth) instead of sorting the depth array.
+    counts_at_or_above = pyramid.count_at_or_above(thresholds)
     fractions = counts_at_or_above / denominator * 100
 
     fig = go.Figure()
@@ -224,7 +267,8 @@ def create_cumulative_coverage_figure(coverage: CoverageData) -> go.Figure:
 
 
 def create_depth_histogram_figure(
-    coverage: CoverageData, n_bins: int = 50
+    coverage: CoverageData, n_bins: int = 50,
+    pyramid: Optional[CoveragePyramid] = None,
 ) -> go.Figure:
     """
     Create a depth distribution histogram.
@@ -232,23 +276,28 @@ def create_depth_histogram_figure(
     Args:
         coverage: CoverageData with depth array.
         n_bins: Number of histogram bins.
+        pyramid: Pyramid for ``coverage``; built here when omitted.
 
     Returns:
         Plotly Figure.
     """
-    depth = coverage.depth_array
+    pyramid = _pyramid(coverage, pyramid)
     # Histogram COVERED positions only. Uncovered positions used to be counted
     # too, so any genome with low breadth (an amplicon above all: ~1.87 M zero
     # positions vs ~400 covered ones) collapsed into one giant bar at zero
-    # that made every real bar invisible.
-    nonzero = depth[depth > 0]
-    if len(nonzero) == 0:
-        nonzero = depth
-
-    max_d = int(np.percentile(nonzero, 99)) if len(nonzero) > 0 else 1
+    # that made every real bar invisible. An all-zero genome keeps its zeros.
+    depth_counts = pyramid.depth_counts.copy()
+    if depth_counts[1:].any():
+        depth_counts[0] = 0
+        max_d = int(pyramid.covered_percentile(99))
+    else:
+        max_d = 0
     max_d = max(max_d, 1)  # all-zero coverage would make every bin edge 0
     bins = np.linspace(0, max_d, n_bins + 1)
-    counts, edges = np.histogram(nonzero, bins=bins)
+    # Rebin the per-depth counts; np.histogram's last bin is closed.
+    values = np.arange(len(depth_counts))
+    counts, edges = np.histogram(values, bins=bins, weights=depth_counts)
+    counts = counts.astype(np.int64)
     centers = (edges[:-1] + edges[1:]) / 2
 
     fig = go.Figure()
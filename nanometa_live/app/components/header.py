@@ -87,6 +87,17 @@ def create_header(title="Nanometa Live"):
                             role="status",
                             **{"aria-live": "polite"},
                         ),
+                        # Background-job queue depth per lane; owned by
+                        # update_background_jobs_indicator, hidden when idle.
+                        html.Div(
+                            id="background-jobs-indicator",
+                            children="",
+                            className="background-jobs ms-3 small text-muted",
+                            title="Background jobs (downloads, builds, exports) "
+                                  "queued or running",
+                            role="status",
+                            style={"display": "none"},
+                        ),
                         # Elapsed time display (prominent when running)
                         html.Div([
                             html.I(className="bi bi-stopwatch me-1"),
@@ -27,6 +27,10 @@ def create_classification_layout() -> html.Div:
         # Apply), so it needs this explicit signal to redraw at the new floor
         # instead of the value it captured before the rescale landed.
         dcc.Store(id='classification-autoscale-applied', data=None),
+        # Topology and value hashes of the figure last sent to
+        # classification-plot, so a refresh with the same nodes and links
+        # sends only the values that changed (app.utils.figure_delta).
+        dcc.Store(id='classification-plot-topology', data=None),
 
         # Header row with title, view toggle, and color scheme
         dbc.Row([
@@ -41,7 +45,8 @@ def create_classification_layout() -> html.Div:
                     id='classification-view-type',
                     options=[
                         {'label': ' Flow View (Sankey)', 'value': 'sankey'},
-                        {'label': ' Ring View (Sunburst)', 'value': 'sunburst'}
+                        {'label': ' Ring View (Sunburst)', 'value': 'sunburst'},
+                        {'label': ' Trend View', 'value': 'trend'}
                     ],
                     value='sankey',
                     inline=True,
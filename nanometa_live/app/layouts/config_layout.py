@@ -379,6 +379,39 @@ def create_config_layout():
                     ]),
                     item_id="storage-locations-item",
                 ),
+                # Sampling profiler (callbacks/profiling.py). For
+                # diagnosing stalls in a live run; also started at launch
+                # by ``nanometa-live --profile``.
+                dbc.AccordionItem(
+                    html.Div([
+                        html.P(
+                            "Records where the dashboard spends its time, a few "
+                            "samples a second, into flame-graph files under the "
+                            "logs folder. Leave it running while reproducing a "
+                            "slow or frozen view, then send the files with the "
+                            "bug report.",
+                            className="small text-muted",
+                        ),
+                        html.Div(id="profiler-status", className="mb-2"),
+                        dbc.Button([html.I(className="bi bi-record-circle me-1"),
+                                    "Start profiler"],
+                                   id="profiler-start-btn", color="danger",
+                                   outline=True, size="sm", className="me-2"),
+                        dbc.Button([html.I(className="bi bi-stop-circle me-1"),
+                                    "Stop"],
+                                   id="profiler-stop-btn", color="secondary",
+                                   outline=True, size="sm", disabled=True),
+                    ]),
+                    title=html.Span([
+                        html.I(className="bi bi-activity me-2"),
+                        "Performance Profiler",
+                        html.Small(
+                            " - for diagnosing a slow or frozen dashboard",
+                            className="text-muted ms-2",
+                        ),
+                    ]),
+                    item_id="profiler-item",
+                ),
             ],
             id="storage-locations-accordion",
             start_collapsed=True,
@@ -215,6 +215,57 @@ def _main_advanced_filters():
     ], start_collapsed=True, className="mb-4")
 
 
+def _organism_table_columns():
+    """Column definitions of the detailed organism table."""
+    return [
+        {"headerName": "Organism Name", "field": "name"},
+        {
+            "headerName": "Classification Level",
+            "field": "rank",
+            "valueFormatter": {
+                "function": (
+                    "function(params) {"
+                    "  var m = {D:'Domain',K:'Kingdom',P:'Phylum',C:'Class',"
+                    "           O:'Order',F:'Family',G:'Genus',S:'Species',U:'Unclassified'};"
+                    "  return m[params.value] || params.value;"
+                    "}"
+                )
+            },
+        },
+        {
+            "headerName": "DNA Sequences",
+            "field": "reads",
+            "type": "numericColumn",
+            "valueFormatter": {"function": "d3.format(',')(params.value)"},
+        },
+        {
+            "headerName": "Abundance (%)",
+            "field": "abundance",
+            "cellStyle": {"fontWeight": "bold"},
+        },
+        {
+            "headerName": "Median Read Length (bp)",
+            "field": "median_length",
+            "type": "numericColumn",
+            "headerTooltip": "Median length of the reads assigned to exactly this organism",
+        },
+        {
+            "headerName": "k-mer Support (%)",
+            "field": "kmer_support",
+            "type": "numericColumn",
+            "headerTooltip": (
+                "Median share of each read's k-mers that matched this organism. "
+                "Low values mean the call rests on few k-mers."
+            ),
+        },
+        {
+            "headerName": "Database ID",
+            "field": "taxid",
+            "hide": True,
+        },
+    ]
+
+
 def _main_detailed_table():
     """Collapsible detailed organism data table for power users."""
     return dbc.Accordion([
@@ -227,38 +278,7 @@ def _main_detailed_table():
                 ),
                 dag.AgGrid(
                     id="detailed-organism-table",
-                    columnDefs=[
-                        {"headerName": "Organism Name", "field": "name"},
-                        {
-                            "headerName": "Classification Level",
-                            "field": "rank",
-                            "valueFormatter": {
-                                "function": (
-                                    "function(params) {"
-                                    "  var m = {D:'Domain',K:'Kingdom',P:'Phylum',C:'Class',"
-                                    "           O:'Order',F:'Family',G:'Genus',S:'Species',U:'Unclassified'};"
-                                    "  return m[params.value] || params.value;"
-                                    "}"
-                                )
-                            },
-                        },
-                        {
-                            "headerName": "DNA Sequences",
-                            "field": "reads",
-                            "type": "numericColumn",
-                            "valueFormatter": {"function": "d3.format(',')(params.value)"},
-                        },
-                        {
-                            "headerName": "Abundance (%)",
-                            "field": "abundance",
-                            "cellStyle": {"fontWeight": "bold"},
-                        },
-                        {
-                            "headerName": "Database ID",
-                            "field": "taxid",
-                            "hide": True,
-                        },
-                    ],
+                    columnDefs=_organism_table_columns(),
                     rowData=[],
                     defaultColDef={"sortable": True, "filter": True, "resizable": True},
                     # ``getRowId`` keys each row by its taxid so AgGrid
@@ -579,9 +599,10 @@ def _main_tab_stores():
         # Hidden store for species watchlist (synced with config)
         dcc.Store(id="main-watchlist-store", data=[], storage_type="session"),
         # Results fingerprint update_main_results last rendered. The callback is
-        # background=True, and DiskcacheManager spawns a fresh worker process
-        # per invocation, so its interval-backstop memo cannot live in a module
-        # global -- it reset on every call and the guard never fired, making the
+        # background=True and runs in whichever pooled worker is free (or a
+        # fresh process per call with the pool disabled), so its
+        # interval-backstop memo cannot live in a module global -- under
+        # spawn-per-call it reset on every call and the guard never fired, making the
         # backstop tick re-parse the whole Kraken2 tree every poll. Not
         # session-persisted: a reload should re-render rather than trust a memo
         # for output it is no longer showing.
@@ -589,6 +610,7 @@ def _main_tab_stores():
 
         # On-demand validation stores
         dcc.Store(id="on-demand-validation-target", data=None),  # {taxid, name} of organism being validated
+        dcc.Store(id="on-demand-validation-request", data=None),  # {n_clicks, request_id} queued at click time
         dcc.Store(id="on-demand-validation-results", data={}),  # {taxid: validation_result}
     ]
 
@@ -112,11 +112,9 @@ def create_watchlist_preparation_layout() -> html.Div:
     """Assemble the merged Watchlist & Preparation tab."""
     return html.Div([
         WorkflowStepper(active_step=2),
-        # Shared state stores (watchlist + the prep genome-import store). Keeping
-        # watchlist-table-refresh here is what keeps watchlist-entries-snapshot
-        # hydrated for the background prep/rescan workers.
-        dcc.Store(id="watchlist-tab-state", data={}),
-        dcc.Store(id="watchlist-table-refresh", data=0),
+        # Tab-local stores. watchlist-tab-state and watchlist-table-refresh
+        # live in the app shell: the Dashboard and the watchlist snapshot
+        # hydration read them before this tab is first opened (lazy_tabs).
         dcc.Store(id="api-lookup-result", data=None),
         build_genome_import_store(),
 
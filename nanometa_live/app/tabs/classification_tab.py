@@ -35,6 +35,149 @@ from nanometa_live.app.tabs.classification_helpers import (
     create_sunburst_data,
 )
 from nanometa_live.app.utils.outdir_resolution import resolve_outdir_for_fingerprint
+from nanometa_live.app.utils.figure_delta import delta_update
+
+
+def _trend_view(main_dir, selected_sample, color_scheme, empty_state,
+                graph_visible, graph_hidden, empty_figure):
+    """Figure, info and style outputs for the per-batch trend view."""
+    from nanometa_live.app.components.abundance_trend_plot import (
+        create_abundance_trend_figure,
+    )
+    from nanometa_live.core.utils.abundance_timeseries import AbundanceStore
+
+    try:
+        store = AbundanceStore.for_results(main_dir)
+    except OSError as e:
+        logging.error(f"Error loading abundance trends: {e}")
+        return empty_figure(), empty_state, graph_hidden
+    if not store.series:
+        return empty_figure(), EmptyStateMessage(
+            title="No Batch Reports Yet",
+            message="Trends are drawn from per-batch classification reports, "
+                    "which appear once the pipeline has processed a few batches.",
+            icon="bi-graph-up-arrow",
+        ), graph_hidden
+    palette = list(COLOR_SCHEMES.get(color_scheme or "tableau", COLORS_TABLEAU).values())
+    figure = create_abundance_trend_figure(store, selected_sample, color_palette=palette)
+    if figure is None:
+        return empty_figure(), html.Div(
+            "No species is rising over the last few batches.",
+            className="text-muted p-3",
+        ), graph_hidden
+    return figure, None, graph_visible
+
+
+def _empty_figure():
+    """A minimal empty figure (used when the graph is hidden)."""
+    fig = go.Figure()
+    fig.update_layout(
+        height=50,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False),
+    )
+    return fig
+
+
+def _resolve_tax_levels(tax_levels, config):
+    """Selected taxonomy levels with defaults, in canonical order."""
+    # Canonical ordering includes K (Kingdom) between D and P
+    canonical_order = ["D", "K", "P", "C", "O", "F", "G", "S"]
+    if not tax_levels:
+        tax_levels = config.get("default_hierarchy_letters", ["D", "C", "G", "S"])
+    # Keep only valid taxonomy levels in canonical order
+    return [level for level in canonical_order if level in tax_levels]
+
+
+def _load_classification_df(main_dir, selected_sample, config):
+    """Kraken2 data (per-sample or aggregated) with authoritative parents."""
+    logging.debug(f"Loading Kraken data for sample='{selected_sample}' (type={type(selected_sample)})")
+    kraken_df = load_kraken_data(main_dir, selected_sample)
+    if kraken_df.empty:
+        return kraken_df
+
+    # Replace indentation-derived parent_taxid with authoritative values
+    # from the Kraken2 database's inspect.txt. Per-sample reports from
+    # PlusPFP can have out-of-order nodes that break the indentation
+    # parser; inspect.txt is always in correct DFS order.
+    kraken_db_path = config.get("kraken_db", "") if config else ""
+    if kraken_db_path:
+        taxonomy = load_kraken2_taxonomy(kraken_db_path)
+        if taxonomy:
+            kraken_df = apply_authoritative_taxonomy(kraken_df, taxonomy)
+    return kraken_df
+
+
+def _classification_figure(view_type, selected_sample, tax_levels, color_scheme,
+                           max_taxa_value, chart_height, filter_value, domains, config):
+    """Build the classification figure; returns (figure, info_message, graph_style)."""
+    # Style constants for showing/hiding the graph
+    graph_visible = {"width": "100%"}
+    graph_hidden = {"width": "100%", "display": "none"}
+
+    # Empty state for when no data is available
+    empty_state = EmptyStateMessage(
+        title="No Classification Data Yet",
+        message="This view will show how detected organisms are grouped and "
+                "related once analysis results are available. "
+                "Check that a sample is selected and the pipeline is running.",
+        icon="bi-diagram-3"
+    )
+
+    # Validate config and get output directory using centralized helper
+    main_dir = validate_config_and_get_main_dir(config)
+    if not main_dir or not os.path.isdir(main_dir):
+        return _empty_figure(), empty_state, graph_hidden
+
+    # CRITICAL FIX: Ensure selected_sample is a string, not a list
+    # If it's a list, it means parameters are mismatched - use default
+    if isinstance(selected_sample, list) or selected_sample is None:
+        logging.warning(f"selected_sample has wrong type: {type(selected_sample)} = {selected_sample}")
+        logging.debug(f"  filter_value={filter_value}, domains={domains}, tax_levels={tax_levels}")
+        selected_sample = "All Samples"  # Use safe default
+
+    # Set defaults
+    filter_value = filter_value or 10
+    domains = domains or ["Bacteria", "Archaea", "Eukaryota", "Viruses"]
+
+    # Process max_taxa parameter
+    max_taxa = int(max_taxa_value) if max_taxa_value else 10
+    if max_taxa == 0:
+        max_taxa = 9999  # Effectively no limit
+
+    tax_levels = _resolve_tax_levels(tax_levels, config)
+
+    if view_type == "trend":
+        return _trend_view(main_dir, selected_sample, color_scheme, empty_state,
+                           graph_visible, graph_hidden, _empty_figure)
+
+    try:
+        kraken_df = _load_classification_df(main_dir, selected_sample, config)
+        if kraken_df.empty:
+            return _empty_figure(), empty_state, graph_hidden
+
+        # Get the selected color palette (default to tableau)
+        color_palette = COLOR_SCHEMES.get(color_scheme or "tableau", COLORS_TABLEAU)
+
+        # Generate visualization based on type
+        if view_type == "sunburst":
+            figure = create_sunburst_data(kraken_df, domains, tax_levels, filter_value, config, color_palette, max_taxa_per_level=max_taxa)
+            if figure is None:
+                return create_empty_sunburst("No data matches the selected filters"), None, graph_visible
+            return figure, None, graph_visible
+        else:  # sankey
+            figure = create_sankey_data(kraken_df, domains, tax_levels, filter_value, max_taxa, chart_height, color_palette)
+            if figure is None:
+                return create_placeholder_sankey("No data matches the selected filters"), None, graph_visible
+            return figure, None, graph_visible
+
+    except Exception as e:
+        logging.error(f"Error updating classification plot: {e}")
+        if view_type == "sunburst":
+            return create_empty_sunburst(f"Error: {str(e)}"), None, graph_visible
+        else:
+            return create_placeholder_sankey(f"Error: {str(e)}"), None, graph_visible
 
 
 def register_classification_callbacks(app: Dash):
@@ -149,6 +292,7 @@ def register_classification_callbacks(app: Dash):
             Output("classification-plot", "figure"),
             Output("classification-info-message", "children"),
             Output("classification-plot", "style"),
+            Output("classification-plot-topology", "data"),
         ],
         [
             Input("results-fingerprint", "data"),
@@ -171,6 +315,7 @@ def register_classification_callbacks(app: Dash):
             State("classification-domains-input", "value"),
             State("app-config", "data"),
             State("backend-status", "data"),
+            State("classification-plot-topology", "data"),
         ],
     )
     def update_classification_plot(
@@ -189,6 +334,7 @@ def register_classification_callbacks(app: Dash):
         domains,          # State
         config,
         status,
+        previous_topology,  # figure_delta state of the figure the client shows
     ):
         """
         Update classification visualization based on view type and filters.
@@ -197,7 +343,8 @@ def register_classification_callbacks(app: Dash):
         Supports per-sample and aggregated data views.
 
         Returns:
-            Tuple of (figure, info_message_children, graph_style)
+            Tuple of (figure, Patch or no_update; info_message_children;
+            graph_style; figure_delta state)
         """
 
         # Debounce interval-triggered refreshes
@@ -205,105 +352,13 @@ def register_classification_callbacks(app: Dash):
             raise PreventUpdate
         mark_rendered("classification_plot", _fingerprint)
 
-        # Style constants for showing/hiding the graph
-        graph_visible = {"width": "100%"}
-        graph_hidden = {"width": "100%", "display": "none"}
-
-        # Empty state for when no data is available
-        empty_state = EmptyStateMessage(
-            title="No Classification Data Yet",
-            message="This view will show how detected organisms are grouped and "
-                    "related once analysis results are available. "
-                    "Check that a sample is selected and the pipeline is running.",
-            icon="bi-diagram-3"
+        figure, message, style = _classification_figure(
+            view_type, selected_sample, tax_levels, color_scheme, max_taxa_value,
+            chart_height, filter_value, domains, config,
         )
-
-        # Helper to create a minimal empty figure (used when graph is hidden)
-        def _empty_figure():
-            fig = go.Figure()
-            fig.update_layout(
-                height=50,
-                margin=dict(l=0, r=0, t=0, b=0),
-                xaxis=dict(visible=False),
-                yaxis=dict(visible=False),
-            )
-            return fig
-
-        # Validate config and get output directory using centralized helper
-        main_dir = validate_config_and_get_main_dir(config)
-        if not main_dir or not os.path.isdir(main_dir):
-            return _empty_figure(), empty_state, graph_hidden
-
-        # CRITICAL FIX: Ensure selected_sample is a string, not a list
-        # If it's a list, it means parameters are mismatched - use default
-        if isinstance(selected_sample, list) or selected_sample is None:
-            logging.warning(f"selected_sample has wrong type: {type(selected_sample)} = {selected_sample}")
-            logging.debug(f"  filter_value={filter_value}, domains={domains}, tax_levels={tax_levels}")
-            selected_sample = "All Samples"  # Use safe default
-
-        # Set defaults
-        filter_value = filter_value or 10
-        domains = domains or ["Bacteria", "Archaea", "Eukaryota", "Viruses"]
-
-        # Process max_taxa parameter
-        max_taxa = int(max_taxa_value) if max_taxa_value else 10
-        if max_taxa == 0:
-            max_taxa = 9999  # Effectively no limit
-
-        # Get taxonomy levels with defaults
-        # Canonical ordering includes K (Kingdom) between D and P
-        canonical_order = ["D", "K", "P", "C", "O", "F", "G", "S"]
-        all_tax_levels = config.get(
-            "taxonomic_hierarchy_letters", ["D", "P", "C", "O", "F", "G", "S"]
-        )
-        # Ensure K is always in the allowed set so user can select it even if config omits it
-        if "K" not in all_tax_levels:
-            all_tax_levels = canonical_order
-        if not tax_levels:
-            tax_levels = config.get("default_hierarchy_letters", ["D", "C", "G", "S"])
-
-        # Keep only valid taxonomy levels in canonical order
-        tax_levels = [level for level in canonical_order if level in tax_levels]
-
-        try:
-            # Load Kraken2 data (per-sample or aggregated)
-            logging.debug(f"Loading Kraken data for sample='{selected_sample}' (type={type(selected_sample)})")
-            kraken_df = load_kraken_data(main_dir, selected_sample)
-
-            if kraken_df.empty:
-                return _empty_figure(), empty_state, graph_hidden
-
-            # Replace indentation-derived parent_taxid with authoritative values
-            # from the Kraken2 database's inspect.txt. Per-sample reports from
-            # PlusPFP can have out-of-order nodes that break the indentation
-            # parser; inspect.txt is always in correct DFS order.
-            kraken_db_path = config.get("kraken_db", "") if config else ""
-            if kraken_db_path:
-                taxonomy = load_kraken2_taxonomy(kraken_db_path)
-                if taxonomy:
-                    kraken_df = apply_authoritative_taxonomy(kraken_df, taxonomy)
-
-            # Get the selected color palette (default to tableau)
-            color_palette = COLOR_SCHEMES.get(color_scheme or "tableau", COLORS_TABLEAU)
-
-            # Generate visualization based on type
-            if view_type == "sunburst":
-                figure = create_sunburst_data(kraken_df, domains, tax_levels, filter_value, config, color_palette, max_taxa_per_level=max_taxa)
-                if figure is None:
-                    return create_empty_sunburst("No data matches the selected filters"), None, graph_visible
-                return figure, None, graph_visible
-            else:  # sankey
-                figure = create_sankey_data(kraken_df, domains, tax_levels, filter_value, max_taxa, chart_height, color_palette)
-                if figure is None:
-                    return create_placeholder_sankey("No data matches the selected filters"), None, graph_visible
-                return figure, None, graph_visible
-
-        except Exception as e:
-            logging.error(f"Error updating classification plot: {e}")
-            if view_type == "sunburst":
-                return create_empty_sunburst(f"Error: {str(e)}"), None, graph_visible
-            else:
-                return create_placeholder_sankey(f"Error: {str(e)}"), None, graph_visible
+        # Between batches the node set rarely changes: ship only the values.
+        figure, topology = delta_update(figure, previous_topology)
+        return figure, message, style, topology
 
     # NOTE: toggle_levels_visibility callback removed (Dash 4 cleanup).
     # It always returned {"display": "block"} regardless of input.
@@ -316,7 +371,18 @@ def register_classification_callbacks(app: Dash):
     )
     def update_help_section(view_type):
         """Update help section to show guidance for the selected visualization."""
-        if view_type == "sunburst":
+        if view_type == "trend":
+            chart_help = [
+                html.H6("Reading the Trend Chart", className="fw-bold mb-2"),
+                html.Ul([
+                    html.Li([html.Strong("Lines: "), "The species rising fastest over the last few batches"]),
+                    html.Li([html.Strong("Points: "), "DNA sequences classified in one batch, at the time it arrived"]),
+                    html.Li([html.Strong("First point: "), "When the species was first seen in this sample"]),
+                ], className="mb-1"),
+                html.Small("Best for spotting an organism that is increasing while the run is still going.",
+                           className="text-muted"),
+            ]
+        elif view_type == "sunburst":
             chart_help = [
                 html.H6("Reading the Sunburst Chart", className="fw-bold mb-2"),
                 html.Ul([
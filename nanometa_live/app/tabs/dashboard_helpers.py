@@ -10,17 +10,17 @@ register_dashboard_callbacks() block.
 
 import os
 import glob
-from collections import OrderedDict
 
 import pandas as pd
 from dataclasses import dataclass
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Mapping, Tuple, Optional
 from datetime import datetime
 import logging
 
 from dash import html
 import dash_bootstrap_components as dbc
 
+from nanometa_live.core.utils.bounded_cache import BoundedCache, estimate_size
 from nanometa_live.core.utils.classification_loaders import load_kraken_data
 from nanometa_live.core.utils.qc_loaders import (
     get_qc_stats,
@@ -28,7 +28,6 @@ from nanometa_live.core.utils.qc_loaders import (
     load_seqkit_stats,
 )
 from nanometa_live.core.utils.alert_engine import get_alert_engine
-from nanometa_live.core.taxonomy.ranks import species_rank_mask
 from nanometa_live.core.utils.attribution import (  # noqa: F401  (re-exported)
     PER_SAMPLE_DISCOVERY_FLOOR,
     PathogenAttribution,
@@ -39,6 +38,10 @@ from nanometa_live.core.utils.attribution import (  # noqa: F401  (re-exported)
     samples_for_detection,
 )
 from nanometa_live.core.utils.pathogen_database import check_for_dangerous_pathogens
+from nanometa_live.core.watchlist.screening import (
+    species_attribution,
+    species_discovery_df as _species_discovery_df,
+)
 from nanometa_live.core.watchlist.watchlist_manager import get_watchlist_manager
 from nanometa_live.app.utils.callback_helpers import (
     safe_load_kraken_data,
@@ -62,7 +65,9 @@ def _count_input_files(nanopore_dir: str) -> int:
     """
     Count input FASTQ files in the nanopore output directory.
 
-    Supports both flat directories and barcoded subdirectories.
+    Supports both flat directories and per-sample subdirectories. Reads the
+    shared ingest tracker's running count, so repeated calls re-list only
+    the directories that changed.
 
     Args:
         nanopore_dir: Path to nanopore output directory
@@ -70,26 +75,10 @@ def _count_input_files(nanopore_dir: str) -> int:
     Returns:
         Total count of FASTQ files (.fastq, .fastq.gz, .fq, .fq.gz)
     """
-    if not nanopore_dir or not os.path.exists(nanopore_dir):
+    if not nanopore_dir or not os.path.isdir(nanopore_dir):
         return 0
-
-    count = 0
-    extensions = ('.fastq', '.fastq.gz', '.fq', '.fq.gz')
-
-    # Check for files in main directory
-    for f in os.listdir(nanopore_dir):
-        if f.lower().endswith(extensions):
-            count += 1
-
-    # Also check for barcoded subdirectories (barcode01, barcode02, etc.)
-    for subdir in os.listdir(nanopore_dir):
-        subdir_path = os.path.join(nanopore_dir, subdir)
-        if os.path.isdir(subdir_path) and subdir.startswith('barcode'):
-            for f in os.listdir(subdir_path):
-                if f.lower().endswith(extensions):
-                    count += 1
-
-    return count
+    from nanometa_live.core.utils.ingest_tracker import get_ingest_tracker
+    return get_ingest_tracker(nanopore_dir).refresh().files
 
 
 _ATTRIBUTION_STYLE = {
@@ -1677,12 +1666,31 @@ def _generate_alerts(
         qc_stats,
         detected_organisms=detected_organisms,
         watched_species=species_of_interest,
-        taxid_to_samples=taxid_to_samples
+        taxid_to_samples=taxid_to_samples,
+        abundance_trends=_load_abundance_trends(main_dir)
     )
 
     return alerts
 
 
+def _load_abundance_trends(main_dir: str) -> List[Dict]:
+    """Species-level risers from the per-batch abundance series.
+
+    Absorbs only batch reports that arrived since the last poll; an empty
+    list when the run has no batch reports (a cumulative-only layout).
+    Every riser is returned: the alert engine keeps only watched pathogens,
+    and a cut to the steepest few would let rising commensals crowd out a
+    slower-rising pathogen.
+    """
+    from nanometa_live.core.utils.abundance_timeseries import AbundanceStore
+
+    try:
+        return AbundanceStore.for_results(main_dir).top_risers(k=None)
+    except (OSError, ValueError, KeyError) as e:
+        logger.debug(f"Abundance trends unavailable for alerts: {e}")
+        return []
+
+
 def _estimate_pass_rate_from_quality(quality_score: Optional[int]) -> float:
     """
     Map quality score to pass rate for alerts.
@@ -1897,24 +1905,6 @@ def _create_pathogen_alert_panel(
         return html.Div(), {"display": "none"}
 
 
-def _species_discovery_df(
-    kraken_df: pd.DataFrame, floor: int = PER_SAMPLE_DISCOVERY_FLOOR
-) -> pd.DataFrame:
-    """Species-level rows at or above the discovery floor.
-
-    Gates on ``cumul_reads`` when present (falling back to ``reads``) -- the
-    SAME column ``_species_df_to_organisms`` reports. Gating on the per-rank
-    ``reads`` column while displaying ``cumul_reads`` let a species whose
-    reads sit on its subspecies children (0-4 direct against thousands
-    cumulative on a subspecies-resolving database) be dropped before watchlist
-    matching ever saw it, so the verdict banner rendered ALL CLEAR over a
-    real detection. All discovery-floor consumers must filter through this
-    helper so the gate and the displayed count cannot disagree.
-    """
-    floor_col = "cumul_reads" if "cumul_reads" in kraken_df.columns else "reads"
-    return kraken_df[species_rank_mask(kraken_df) & (kraken_df[floor_col] >= floor)]
-
-
 def _species_df_to_organisms(species_df: pd.DataFrame) -> List[Dict[str, Any]]:
     """
     Convert species DataFrame to list of organism dicts (vectorized).
@@ -1963,13 +1953,26 @@ def _species_df_to_organisms(species_df: pd.DataFrame) -> List[Dict[str, Any]]:
     })
     return result_df.to_dict('records')
 
+# Memo for _load_per_sample_organisms: (main_dir, samples, declared controls)
+# -> (the per-sample frames it was built from, attribution). The verdict
+# banner, alert panel and modal each ask for the same attribution every
+# tick. load_kraken_data hands back the same cached frame object until a
+# report changes, so frame identity is an exact freshness check, and the
+# memo holding the frames keeps their ids from being reused -- so an entry
+# is charged for the frames it pins as well as the read matrix.
+_PER_SAMPLE_MEMO_KEYS = 2
+_per_sample_memo = BoundedCache(
+    "per_sample_attribution", max_entries=_PER_SAMPLE_MEMO_KEYS,
+    sizeof=lambda entry: estimate_size(entry[0]) + estimate_size(vars(entry[1].matrix)))
+
+
 def _load_per_sample_organisms(
     main_dir: str,
     available_samples: List[str],
     config: Optional[Dict[str, Any]] = None,
-) -> Dict[int, List[Dict[str, Any]]]:
+) -> Mapping[int, List[Dict[str, Any]]]:
     """
-    Load species-level organisms from each sample and return a per-taxid attribution dict.
+    Load species-level organisms from each sample and return a per-taxid attribution mapping.
 
     Keyed by the Kraken2 database taxid (as it appears in reports), each value is a
     list of sample-level dicts sorted descending by reads. Negative controls are
@@ -1983,51 +1986,42 @@ def _load_per_sample_organisms(
     gate lives in ``build_pathogen_attribution``, which knows the per-entry
     threshold.
 
+    The result is a :class:`SampleAttributionMap` over one taxa x samples
+    read matrix (``core.watchlist.screening``). Rows are built only for the
+    taxids looked up, rather than a dict per species per sample.
+
     Args:
         main_dir: Results output directory
         available_samples: All sample names including "All Samples"
         config: Application configuration dict (for declared negative controls)
 
     Returns:
-        Dict[int, List[{sample, reads, abundance, is_negative_control}]]
+        Mapping[int, List[{sample, reads, abundance, is_negative_control}]]
     """
     real_samples = [s for s in available_samples if s != "All Samples"]
     if not real_samples:
         return {}
 
-    taxid_to_samples: Dict[int, List[Dict[str, Any]]] = {}
-
+    frames: Dict[str, pd.DataFrame] = {}
     for sample in real_samples:
-        is_nc = is_negative_control(sample, config)
         try:
-            kraken_df = load_kraken_data(main_dir, sample)
-            if kraken_df.empty:
-                continue
-            # Gate on the same column the organisms are reported with, or the
-            # floor and the displayed count disagree: a real negative control
-            # had 4 direct reads against 6 cumulative and was dropped by a
-            # floor of 5, so its contamination never reached the display.
-            species_df = _species_discovery_df(kraken_df)
-            if species_df.empty:
-                continue
-            for org in _species_df_to_organisms(species_df):
-                taxid = org["taxid"]
-                if taxid not in taxid_to_samples:
-                    taxid_to_samples[taxid] = []
-                taxid_to_samples[taxid].append({
-                    "sample": sample,
-                    "reads": org["reads"],
-                    "abundance": org["abundance"],
-                    "is_negative_control": is_nc,
-                })
+            frames[sample] = load_kraken_data(main_dir, sample)
         except Exception as exc:
             logger.debug(f"Per-sample organism load failed for {sample}: {exc}")
 
-    # Sort each sample list descending by reads
-    for taxid in taxid_to_samples:
-        taxid_to_samples[taxid].sort(key=lambda x: x["reads"], reverse=True)
+    declared = tuple(str(s) for s in ((config or {}).get("negative_control_samples") or []))
+    key = (main_dir, tuple(real_samples), declared)
+    cached = _per_sample_memo.get(key)
+    if cached is not None:
+        cached_frames, attribution = cached
+        if cached_frames.keys() == frames.keys() and all(
+            cached_frames[s] is frames[s] for s in frames
+        ):
+            return attribution
 
-    return taxid_to_samples
+    attribution = species_attribution(frames, config)
+    _per_sample_memo[key] = (frames, attribution)
+    return attribution
 
 def _get_active_watchlist_entries(config: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
@@ -2088,8 +2082,9 @@ def _get_active_watchlist_entries(config: Dict[str, Any]) -> List[Dict[str, Any]
 # seconds of identical recomputation per tick. Content-keyed, so watchlist
 # edits and new results invalidate by construction. Two keys retained:
 # the ticking callbacks share one, and one edit-in-flight can coexist.
-_pathogen_check_memo: "OrderedDict[tuple, tuple]" = OrderedDict()
 _PATHOGEN_CHECK_MEMO_KEYS = 2
+_pathogen_check_memo = BoundedCache(
+    "pathogen_check", max_entries=_PATHOGEN_CHECK_MEMO_KEYS)
 
 
 def _copy_alerts(alerts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -2162,8 +2157,6 @@ def _check_pathogens_both(
 
         if key is not None:
             _pathogen_check_memo[key] = (dangerous, subthreshold)
-            while len(_pathogen_check_memo) > _PATHOGEN_CHECK_MEMO_KEYS:
-                _pathogen_check_memo.popitem(last=False)
         return _copy_alerts(dangerous), _copy_alerts(subthreshold)
 
     except Exception as e:
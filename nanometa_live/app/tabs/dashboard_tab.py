@@ -24,6 +24,7 @@ from nanometa_live.core.utils.qc_loaders import (
     load_seqkit_stats,
 )
 from nanometa_live.core.utils.alert_engine import get_alert_engine
+from nanometa_live.core.utils.alert_latency import begin_alert_trace
 from nanometa_live.core.utils.pathogen_database import check_for_dangerous_pathogens
 from nanometa_live.core.watchlist.watchlist_manager import get_watchlist_manager
 from nanometa_live.app.utils.callback_helpers import (
@@ -41,6 +42,7 @@ from nanometa_live.app.utils.throughput import (
     BUFFER_LIMIT,
     append_tick,
     classify_state,
+    compute_input_rate,
     compute_rates,
     format_age_seconds,
     last_nonzero_delta_ts,
@@ -95,6 +97,19 @@ from nanometa_live.app.utils.outdir_resolution import resolve_outdir_for_fingerp
 _VERDICT_LAST_RUN_STATE: dict = {}
 
 logger = logging.getLogger(__name__)
+
+
+def _finish_panel_trace(alert_trace, samples, panel):
+    """Record the alert panel's time-to-alert trace and pass ``panel`` through."""
+    alert_trace.mark("alert")
+    shown = panel[1].get("display") != "none"
+    alert_trace.finish(
+        "ALERTS_SHOWN" if shown else "NO_ALERTS",
+        len([s for s in samples or [] if s != "All Samples"]),
+    )
+    return panel
+
+
 def register_dashboard_callbacks(app: Dash):
     """
     Register callbacks for the dashboard tab.
@@ -272,12 +287,17 @@ def register_dashboard_callbacks(app: Dash):
         # "zero reads" -- the verdict keeps its previous behaviour then.
         total_reads: Optional[int] = None
         highest_alert_threshold: Optional[int] = None
+        # Time-to-alert: stamped with the newest Kraken2 report's mtime, so
+        # the stages below measure landing -> loaded -> verdict -> response.
+        alert_trace = None
         # Only touch disk when there is a configured, ready results directory
         # and we are not already short-circuiting on "starting" -- mirrors the
         # original control flow so no Kraken load runs in those states.
         if has_config and not overall_status_starting and main_dir_available:
             try:
+                alert_trace = begin_alert_trace("verdict", main_dir)
                 kraken_df = load_kraken_data(main_dir, "All Samples")
+                alert_trace.mark("loaded")
                 if not kraken_df.empty:
                     species_df = _species_discovery_df(kraken_df)
                     detected_organisms = _species_df_to_organisms(species_df)
@@ -338,6 +358,8 @@ def register_dashboard_callbacks(app: Dash):
                 or DEFAULT_LOW_READ_FLOOR
             ),
         )
+        if alert_trace is not None:
+            alert_trace.mark("alert")
 
         # Per-sample attribution for the ACTION REQUIRED subhead (closes
         # P0-T02 from docs/audit-2026-04-28-throughput-ux.md). The per-sample
@@ -400,6 +422,14 @@ def register_dashboard_callbacks(app: Dash):
                 attribution_failed = True
             total_real_samples = total_count or None
 
+        if alert_trace is not None and kraken_has_data:
+            alert_trace.finish(
+                descriptor.state,
+                total_real_samples or len(
+                    [s for s in (available_samples or []) if s != "All Samples"]
+                ),
+            )
+
         return (
             _make_banner_content(
                 descriptor.icon, descriptor.icon_color,
@@ -747,8 +777,10 @@ def register_dashboard_callbacks(app: Dash):
                 return html.Div(), {"display": "none"}
 
         try:
+            alert_trace = begin_alert_trace("alert_panel", main_dir)
             # Load aggregated Kraken2 data for pathogen detection
             kraken_df = load_kraken_data(main_dir, "All Samples")
+            alert_trace.mark("loaded")
 
             if kraken_df.empty:
                 return html.Div(), {"display": "none"}
@@ -770,10 +802,10 @@ def register_dashboard_callbacks(app: Dash):
             # validation badges. main_dir lets the panel load
             # validation_results.json so each card can show whether the
             # detection has been validated and at what confidence.
-            return _create_pathogen_alert_panel(
+            return _finish_panel_trace(alert_trace, resolved_samples, _create_pathogen_alert_panel(
                 detected_organisms, watched_species, config, taxid_to_samples,
                 main_dir=main_dir,
-            )
+            ))
 
         except Exception as e:
             logger.error(f"Error updating pathogen alert panel: {e}")
@@ -1233,9 +1265,14 @@ def register_dashboard_callbacks(app: Dash):
             except (TypeError, ValueError):
                 total_files = 0
 
+        input_reads = (status or {}).get("input_reads_estimated")
+        if not isinstance(input_reads, (int, float)) or not running:
+            input_reads = None
+
         now = _time.time()
-        new_ticks = append_tick(ticks, now, total_reads, total_files)
+        new_ticks = append_tick(ticks, now, total_reads, total_files, input_reads)
         rpm, fpm = compute_rates(new_ticks)
+        in_rpm = compute_input_rate(new_ticks)
         state = classify_state(new_ticks, now, running)
 
         new_buffer = {
@@ -1243,21 +1280,30 @@ def register_dashboard_callbacks(app: Dash):
             "ticks": new_ticks,
             "reads_per_min": rpm,
             "files_per_min": fpm,
+            "input_reads_per_min": in_rpm,
             "stalled_since": (
                 last_nonzero_delta_ts(new_ticks) if state == "stalled" else None
             ),
         }
 
         children, class_name = _render_throughput_tile(
-            state, rpm, fpm, new_ticks, now
+            state, rpm, fpm, new_ticks, now, in_rpm
         )
         return children, class_name, new_buffer
 
 # Helper functions
 
 
-def _render_throughput_tile(state, rpm, fpm, ticks, now):
-    """(children, className) for the header throughput tile."""
+def _render_throughput_tile(state, rpm, fpm, ticks, now, in_rpm=None):
+    """(children, className) for the header throughput tile.
+
+    ``in_rpm`` (estimated reads/min arriving from MinKNOW) adds an "in"
+    figure, which tells a stalled pipeline apart from a stalled sequencer.
+    """
+    incoming = [] if in_rpm is None else [html.Span(
+        f"  ~{int(round(in_rpm)):,} in/min", className="ms-2 text-muted",
+        title="Estimated reads/min arriving in the input directory",
+    )]
     if state == "idle":
         return (
             [
@@ -1280,6 +1326,7 @@ def _render_throughput_tile(state, rpm, fpm, ticks, now):
                     f"  0 reads/min   last data {format_age_seconds(age)}",
                     className="ms-2",
                 ),
+                *incoming,
             ],
             # Amber tokens reused from _verdict_banner_style call sites.
             "throughput-tile ms-3 small fw-semibold throughput-tile-stalled",
@@ -1291,6 +1338,7 @@ def _render_throughput_tile(state, rpm, fpm, ticks, now):
             html.I(className="bi bi-speedometer2 me-2 text-primary"),
             html.Span(rpm_text, className="fw-semibold me-2"),
             html.Span(fpm_text, className="text-muted"),
+            *incoming,
         ],
         "throughput-tile ms-3 small",
     )
@@ -10,6 +10,8 @@ visualizations.
 import logging
 import pandas as pd
 
+from nanometa_live.core.utils.bounded_cache import BoundedCache
+
 
 # ============================================================================
 # Kraken2 Rank Constants
@@ -139,7 +141,9 @@ TAXONOMY_COLORS = COLORS_TABLEAU
 # order, so parsing it once gives us authoritative taxid -> parent_taxid
 # mappings that we can apply to the per-sample reports.
 
-_TAXONOMY_CACHE: dict = {}
+# One parsed inspect.txt per database. The taxonomy does not change between
+# runs, so run boundaries keep it.
+_TAXONOMY_CACHE = BoundedCache("kraken2_taxonomy", max_entries=4, run_scoped=False)
 
 
 def load_kraken2_taxonomy(kraken_db_path: str) -> dict:
@@ -164,8 +168,9 @@ def load_kraken2_taxonomy(kraken_db_path: str) -> dict:
 
     # Cache on the database directory so a gz-only DB is cached too (the cache
     # key used to be the plain inspect.txt path).
-    if kraken_db_path in _TAXONOMY_CACHE:
-        return _TAXONOMY_CACHE[kraken_db_path]
+    cached = _TAXONOMY_CACHE.get(kraken_db_path)
+    if cached is not None:
+        return cached
 
     # Prefer a plain inspect.txt; fall back to a gzipped inspect.txt.gz. Some
     # Kraken2 builds (e.g. GTDB-derived / size-conscious DBs) ship only the
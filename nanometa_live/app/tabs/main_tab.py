@@ -61,9 +61,14 @@ from nanometa_live.app.tabs.main_tab_helpers import (  # noqa: E402
     get_all_watchlist_with_detection,
     create_species_alert_banner,
     build_organism_export,
+    attach_read_profiles,
     render_validation_results_card,
     validation_store_entry,
     not_detected_caveat,
+    has_kraken_read_outputs,
+    on_demand_method,
+    submit_on_demand_request,
+    watchlist_threat_level,
 )
 from nanometa_live.app.tabs.dashboard_helpers import (  # noqa: E402
     DEFAULT_LOW_READ_FLOOR,
@@ -613,6 +618,7 @@ def register_main_callbacks(app: Dash):
                 'reads': filtered_df['cumul_reads'].astype(int),
                 'abundance': filtered_df['%'].astype(float).round(2)
             })
+            table_df = attach_read_profiles(table_df, main_dir, selected_sample)
             table_data = table_df.to_dict('records')
 
             # Count detected vs total watchlist entries
@@ -1118,6 +1124,35 @@ def register_main_callbacks(app: Dash):
 
         return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update
 
+    @app.callback(
+        Output("on-demand-validation-request", "data"),
+        Input("start-on-demand-validation", "n_clicks"),
+        [
+            State("on-demand-validation-target", "data"),
+            State("app-config", "data"),
+            State("on-demand-method-select", "value"),
+        ],
+        prevent_initial_call=True,
+    )
+    def queue_on_demand_validation(n_clicks, target, config, validation_method):
+        """Put the click in the validation queue before a worker picks it up.
+
+        The run itself waits for a heavy-lane worker, and there are only a
+        couple. Submitting here means every click inside the coalescing
+        window is on file when the first batch is claimed, however many
+        callbacks are still waiting for a worker.
+        """
+        if not n_clicks or not target or not target.get("taxid"):
+            return no_update
+        try:
+            request_id = submit_on_demand_request(
+                resolve_outdir_for_fingerprint(config), config, target, validation_method)
+        except (OSError, TypeError, ValueError) as e:
+            # The background callback submits the request itself.
+            logging.warning(f"Could not queue on-demand validation at click time: {e}")
+            request_id = None
+        return {"n_clicks": n_clicks, "request_id": request_id}
+
     @app.callback(
         [
             Output("validation-progress-bar", "value", allow_duplicate=True),
@@ -1130,7 +1165,7 @@ def register_main_callbacks(app: Dash):
             Output("close-on-demand-validation", "style", allow_duplicate=True),
             Output("on-demand-validation-results", "data", allow_duplicate=True),
         ],
-        Input("start-on-demand-validation", "n_clicks"),
+        Input("on-demand-validation-request", "data"),
         [
             State("on-demand-validation-target", "data"),
             State("app-config", "data"),
@@ -1149,9 +1184,9 @@ def register_main_callbacks(app: Dash):
         running=[(Output("start-on-demand-validation", "disabled"), True, False)],
         prevent_initial_call=True,
     )
-    def run_on_demand_validation(set_progress, n_clicks, target, config, existing_results, validation_method):
+    def run_on_demand_validation(set_progress, request, target, config, existing_results, validation_method):
         """Run on-demand BLAST validation for the selected organism (background)."""
-        if not n_clicks or not target:
+        if not (request or {}).get("n_clicks") or not target:
             return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update
 
         taxid = target.get("taxid")
@@ -1192,15 +1227,7 @@ def register_main_callbacks(app: Dash):
                 )
 
             # Check that Kraken2 per-read output files exist before attempting validation
-            kraken2_dir = os.path.join(main_dir, "kraken2")
-            has_output_files = False
-            if os.path.isdir(kraken2_dir):
-                for f in os.listdir(kraken2_dir):
-                    if ".output" in f or f.endswith(".kraken2"):
-                        has_output_files = True
-                        break
-
-            if not has_output_files:
+            if not has_kraken_read_outputs(main_dir):
                 add_log("Kraken2 per-read output files not found", "error")
                 return (
                     0,
@@ -1225,17 +1252,22 @@ def register_main_callbacks(app: Dash):
             add_log("Checking reference genome...", "info")
             set_progress((f"Validating {name} (taxid {taxid})...",))
 
-            method = validation_method if validation_method in ("blast", "minimap2", "both") else "blast"
             # Passing ``config`` routes through the nanometanf
             # validation_only entry point (with -resume) when a
-            # pipeline_source is configured. The legacy subprocess
-            # path is now a fallback for the no-Nextflow case.
+            # pipeline_source is configured. The queue coalesces clicks
+            # that land within a few seconds (from any tab) into one run;
+            # the request was submitted at click time, and critical-threat
+            # detections jump the queue.
             result = validator.validate_organism(
                 taxid=taxid,
                 name=name,
                 sample=sample or "all",
-                method=method,
+                method=on_demand_method(validation_method),
                 config=config,
+                progress_callback=lambda message, _pct: set_progress((f"{name}: {message}",)),
+                queue=validator.validation_queue(),
+                threat_level=watchlist_threat_level(taxid),
+                request_id=request.get("request_id"),
             )
 
             if result.success:
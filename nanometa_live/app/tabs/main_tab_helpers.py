@@ -10,6 +10,9 @@ main_tab.py re-exports these names for backward compatibility.
 """
 
 import logging
+import os
+from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 
@@ -88,6 +91,50 @@ def validation_store_entry(result, taxid, name):
     }
 
 
+ON_DEMAND_METHODS = ("blast", "minimap2", "both")
+
+
+def on_demand_method(value) -> str:
+    """The method select's value, or ``blast`` when it is not a known method."""
+    return value if value in ON_DEMAND_METHODS else "blast"
+
+
+def has_kraken_read_outputs(main_dir: str) -> bool:
+    """Whether ``<main_dir>/kraken2`` holds Kraken2 per-read output files."""
+    kraken2_dir = os.path.join(main_dir, "kraken2")
+    if not os.path.isdir(kraken2_dir):
+        return False
+    return any(".output" in f or f.endswith(".kraken2") for f in os.listdir(kraken2_dir))
+
+
+def watchlist_threat_level(taxid):
+    """The watchlist threat level of ``taxid``, or None if it is not watched."""
+    try:
+        entry = get_watchlist_manager().get_entry_by_taxid(int(taxid))
+    except (TypeError, ValueError, AttributeError):
+        return None
+    return entry.threat_level if entry else None
+
+
+def submit_on_demand_request(main_dir, config, target, method) -> Optional[str]:
+    """Queue an on-demand validation at click time; return its request id.
+
+    Returns None, without queueing, when the run could not start anyway
+    (no results dir, no per-read Kraken2 output, no pipeline configured);
+    the background callback reports why.
+    """
+    from nanometa_live.core.workflow.validation_queue import ValidationQueue
+
+    if not (main_dir and has_kraken_read_outputs(main_dir)
+            and config and config.get("pipeline_source")):
+        return None
+    # Same directory as OnDemandValidator.validation_dir.
+    queue = ValidationQueue(Path(main_dir) / "on_demand_validation")
+    return queue.submit(int(target["taxid"]), target.get("name"),
+                        target.get("sample") or "all", on_demand_method(method),
+                        watchlist_threat_level(target["taxid"]))
+
+
 def species_in_watchlist(taxid: int, watchlist: list) -> bool:
     """Check if a species is in the watchlist by taxid."""
     if not watchlist:
@@ -379,6 +426,33 @@ def get_all_watchlist_with_detection(kraken_df, watchlist: list) -> list:
     return result
 
 
+def attach_read_profiles(table_df: pd.DataFrame, main_dir: str, sample) -> pd.DataFrame:
+    """Add per-taxon read-length and k-mer support columns to the organism table.
+
+    Values describe the reads Kraken2 assigned to exactly that taxid, from
+    the tailed per-read output (``core.parsers.kraken_read_profiles``).
+    Columns are left empty when the run kept no per-read output.
+    """
+    table_df = table_df.assign(median_length=None, kmer_support=None)
+    try:
+        from nanometa_live.core.parsers.kraken_read_profiles import load_read_profiles
+        profiles = load_read_profiles(main_dir, sample)
+    except Exception as exc:
+        logging.debug(f"Read profiles unavailable: {exc}")
+        return table_df
+    if not len(profiles):
+        return table_df
+    summaries = [profiles.profile(t) for t in table_df["taxid"].tolist()]
+    # object dtype keeps missing values as None (JSON null), not NaN.
+    table_df["median_length"] = pd.Series(
+        [round(p["median_length"]) if p else None for p in summaries],
+        index=table_df.index, dtype=object)
+    table_df["kmer_support"] = pd.Series(
+        [round(100 * p["median_confidence"], 1) if p else None for p in summaries],
+        index=table_df.index, dtype=object)
+    return table_df
+
+
 def build_organism_export(table_data: list, export_format: str, filename: str = "") -> dict:
     """Build the dcc.Download payload for an organism-table export.
 
@@ -650,10 +650,10 @@ def register_preparation_callbacks(app):
 
         # Run readiness check
         try:
-            from nanometa_live.core.workflow.readiness_checker import (
-                ReadinessChecker, Severity,
-            )
-            checker = ReadinessChecker()
+            from nanometa_live.core.workflow.readiness_checker import ReadinessChecker
+            from nanometa_live.core.workflow.readiness_engine import CheckCache
+            # Reuse the header pill's per-check results (unchanged inputs only).
+            checker = ReadinessChecker(cache=CheckCache.for_config(config or {}))
             report = checker.check_readiness(config or {}, watchlist_entries=watchlist_snapshot)
         except Exception as e:
             logger.error(f"Readiness check failed: {e}", exc_info=True)
@@ -981,7 +981,9 @@ def register_preparation_callbacks(app):
             from nanometa_live.core.utils.genome_manager import get_genome_manager
             cache_dir = config.get("genome_cache_dir") if config else None
             imported, unrecognized = get_genome_manager(
-                cache_dir=cache_dir).import_genomes_from_directory(dir_path)
+                cache_dir=cache_dir,
+                blast_db_mode=config.get("blast_db_mode") if config else None,
+            ).import_genomes_from_directory(dir_path)
             return _genome_import_payload(n_clicks, {
                 "source": "dir", "imported": imported, "unrecognized": unrecognized})
         except Exception as e:
@@ -1016,7 +1018,9 @@ def register_preparation_callbacks(app):
             from nanometa_live.core.utils.genome_manager import get_genome_manager
             cache_dir = config.get("genome_cache_dir") if config else None
             imported, unrecognized = get_genome_manager(
-                cache_dir=cache_dir).import_genomes_from_archive(archive_path)
+                cache_dir=cache_dir,
+                blast_db_mode=config.get("blast_db_mode") if config else None,
+            ).import_genomes_from_archive(archive_path)
             return _genome_import_payload(n_clicks, {
                 "source": "archive", "imported": imported, "unrecognized": unrecognized})
         except Exception as e:
@@ -1733,9 +1737,11 @@ def register_preparation_callbacks(app):
             return log_entries[-20:]
 
         cache_dir = None
+        blast_db_mode = None
         if config:
             cache_dir = config.get("genome_cache_dir")
-        genome_mgr = get_genome_manager(cache_dir=cache_dir)
+            blast_db_mode = config.get("blast_db_mode")
+        genome_mgr = get_genome_manager(cache_dir=cache_dir, blast_db_mode=blast_db_mode)
 
         set_progress((0, "Scanning for missing genomes...", "Checking watchlist entries", add_log("Starting genome download process"), []))
 
@@ -1834,7 +1840,9 @@ def register_preparation_callbacks(app):
                     add_log(f"Building BLAST databases for {len(successful_taxids)} genome(s)"),
                     dbc.Badge("BLAST", color="info", className="me-2"),
                 ))
-                built = genome_mgr.build_blast_dbs_batch(successful_taxids, max_workers=2)
+                built = genome_mgr.build_blast_dbs_batch(
+                    successful_taxids, max_workers=2,
+                    consolidated=blast_db_mode == "consolidated")
                 add_log(f"Built {built} BLAST database(s)", "success" if built > 0 else "warning")
                 # A genome without a BLAST database cannot be validated
                 # against, so a build failure is not cosmetic. `failed`
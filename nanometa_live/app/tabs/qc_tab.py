@@ -19,10 +19,12 @@ import dash_bootstrap_components as dbc
 import plotly.express as px
 
 from nanometa_live.core.utils.classification_loaders import load_kraken_data
+from nanometa_live.core.utils.json_ingest import FASTP_SUMMARY_KEYS, cached_json
 from nanometa_live.core.utils.qc_loaders import (
     get_qc_stats,
     get_sample_statistics_summary,
     load_fastp_data,
+    load_seqkit_sketch,
     load_seqkit_stats,
 )
 from nanometa_live.app.components.organism_components import (
@@ -258,9 +260,10 @@ def register_qc_callbacks(app: Dash):
             State("app-config", "data"),
             State("backend-status", "data"),
             # The interval-backstop memo has to round-trip through a Store:
-            # this callback is background=True and DiskcacheManager spawns a
-            # fresh process per invocation, so a module-level memo is empty on
-            # entry every time and the guard never fired.
+            # this callback is background=True and runs in whichever pooled
+            # worker is free, so a module-level memo is not shared between
+            # calls (under spawn-per-call it was empty on every entry and the
+            # guard never fired).
             State("qc-stats-rendered-fp", "data"),
         ],
         # Audit item #3 (docs/audit/threading-2026-05-10.md): the QC summary
@@ -637,21 +640,24 @@ def register_qc_callbacks(app: Dash):
 
                     for fastp_file in fastp_files:
                         try:
-                            with open(fastp_file, 'r') as f:
-                                fastp_data = json.load(f)
-                                after = fastp_data.get("summary", {}).get("after_filtering", {})
-                                total_bases += after.get("total_bases", 0)
-                                if "q20_bases" in after or "q30_bases" in after:
-                                    saw_quality_fields = True
-                                total_q20_bases += after.get("q20_bases", 0)
-                                total_q30_bases += after.get("q30_bases", 0)
-
-                                # Get quality curve (use first file's curve)
-                                if not quality_curve:
-                                    read1_after = fastp_data.get("read1_after_filtering", {})
-                                    curve = read1_after.get("quality_curves", {}).get("mean", [])
-                                    if curve:
-                                        quality_curve = curve
+                            fastp_data = cached_json(fastp_file, FASTP_SUMMARY_KEYS)
+                            after = fastp_data.get("summary", {}).get("after_filtering", {})
+                            total_bases += after.get("total_bases", 0)
+                            if "q20_bases" in after or "q30_bases" in after:
+                                saw_quality_fields = True
+                            total_q20_bases += after.get("q20_bases", 0)
+                            total_q30_bases += after.get("q30_bases", 0)
+
+                            # Get quality curve (use first file's curve). The
+                            # curves are the bulk of the document, so they
+                            # are read separately and only until one is found.
+                            if not quality_curve:
+                                read1_after = cached_json(
+                                    fastp_file, ("read1_after_filtering",)
+                                ).get("read1_after_filtering", {})
+                                curve = read1_after.get("quality_curves", {}).get("mean", [])
+                                if curve:
+                                    quality_curve = curve
                         except (json.JSONDecodeError, IOError, KeyError, TypeError) as e:
                             logging.debug(f"Error reading FASTP quality data from {fastp_file}: {e}")
                             continue
@@ -749,8 +755,9 @@ def register_qc_callbacks(app: Dash):
                     summaries = []
                     for fastp_file in fastp_files:
                         try:
-                            with open(fastp_file, 'r') as f:
-                                summaries.append(json.load(f).get("summary", {}))
+                            summaries.append(
+                                cached_json(fastp_file, FASTP_SUMMARY_KEYS).get("summary", {})
+                            )
                         except (json.JSONDecodeError, IOError, KeyError, TypeError) as e:
                             logging.debug(f"Error reading FASTP length data from {fastp_file}: {e}")
                             continue
@@ -767,7 +774,11 @@ def register_qc_callbacks(app: Dash):
                 if not seqkit_df.empty:
                     source = "seqkit"
                     mean_length = float(seqkit_df['avg_len'].mean()) if 'avg_len' in seqkit_df.columns else 0.0
-                    n50 = int(seqkit_df['N50'].mean()) if 'N50' in seqkit_df.columns else None
+                    sketch = load_seqkit_sketch(main_dir, selected_sample)
+                    if sketch is not None and sketch.num_seqs > 0:
+                        n50 = int(round(sketch.n50()))
+                    else:
+                        n50 = int(seqkit_df['N50'].mean()) if 'N50' in seqkit_df.columns else None
                     gc_content = float(seqkit_df['GC(%)'].mean()) if 'GC(%)' in seqkit_df.columns else None
 
             # If no data, show empty state
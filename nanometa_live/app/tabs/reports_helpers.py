@@ -2,7 +2,8 @@
 
 Renders the run-level artifacts the pipeline produces but the GUI did not
 previously surface: links to the MultiQC + Nextflow execution reports (gap 2),
-the realtime performance panel (gap 3), and the assembly summary (gap 4).
+the realtime performance panel (gap 3), and the assembly summary (gap 4), plus
+the time-to-alert latency the dashboard records for the run.
 """
 
 from __future__ import annotations
@@ -13,6 +14,8 @@ from dash import html, dcc
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 
+from nanometa_live.core.utils.alert_latency import HISTOGRAM_BOUNDS_S
+
 
 def _kpi_tile(value: str, label: str, icon: str) -> dbc.Col:
     return dbc.Col(html.Div([
@@ -243,6 +246,78 @@ def build_taxpasta_panel(rows: List[Dict[str, Any]],
     ], className="mb-4")
 
 
+def _fmt_seconds(value: Optional[float]) -> str:
+    if value is None:
+        return "--"
+    if value >= 120:
+        return f"{value / 60:.1f} min"
+    return f"{value:.1f} s"
+
+
+def build_alert_latency_panel(rows: List[Dict[str, Any]]) -> Any:
+    """Time-to-alert latency per surface, verdict state and sample count.
+
+    ``rows`` is the output of ``alert_latency.alert_latency_summary`` ([] =>
+    nothing recorded yet, render nothing). Each stage is shown as p50 / p95
+    seconds since the newest Kraken2 report landed; the chart is the
+    histogram of the verdict banner's response stage.
+    """
+    if not rows:
+        return ""
+
+    def stage_cell(row: Dict[str, Any], stage: str) -> html.Td:
+        stats = row.get(stage) or {}
+        return html.Td(f"{_fmt_seconds(stats.get('p50'))} / "
+                       f"{_fmt_seconds(stats.get('p95'))}")
+
+    body_rows = [
+        html.Tr([
+            html.Td(r["surface"].replace("_", " ")),
+            html.Td(r["state"].replace("_", " ")),
+            html.Td(r["samples"]),
+            html.Td(f"{(r.get('response') or {}).get('n', 0):,}"),
+            stage_cell(r, "loaded"),
+            stage_cell(r, "alert"),
+            stage_cell(r, "response"),
+        ]) for r in rows
+    ]
+    table = dbc.Table([
+        html.Thead(html.Tr([
+            html.Th("Surface"), html.Th("State"), html.Th("Samples"),
+            html.Th("Epochs"), html.Th("Loaded p50 / p95"),
+            html.Th("Alert p50 / p95"), html.Th("Response p50 / p95"),
+        ])),
+        html.Tbody(body_rows),
+    ], size="sm", striped=True, responsive=True, className="mb-2")
+
+    counts = [0] * (len(HISTOGRAM_BOUNDS_S) + 1)
+    for r in rows:
+        if r["surface"] != "verdict":
+            continue
+        for i, c in enumerate((r.get("response") or {}).get("histogram") or []):
+            counts[i] += c
+    chart = ""
+    if any(counts):
+        labels = [f"<={b}s" for b in HISTOGRAM_BOUNDS_S] + [f">{HISTOGRAM_BOUNDS_S[-1]}s"]
+        fig = go.Figure(go.Bar(x=labels, y=counts, marker_color="#0d6efd"))
+        fig.update_layout(
+            height=200, margin=dict(l=40, r=10, t=10, b=30),
+            xaxis_title="Report landed -> verdict rendered", yaxis_title="Epochs",
+            paper_bgcolor="white", plot_bgcolor="white",
+        )
+        chart = dcc.Graph(figure=fig, config={"displayModeBar": False})
+
+    return dbc.Card([
+        dbc.CardHeader([
+            html.I(className="bi bi-stopwatch me-2"),
+            html.Strong("Time to Alert"),
+            html.Small(" (seconds since the newest Kraken2 report landed)",
+                       className="text-muted ms-1"),
+        ]),
+        dbc.CardBody([table, chart]),
+    ], className="mb-4")
+
+
 def build_multiqc_embed(reports: List[Dict[str, Any]]) -> Any:
     """Inline iframe of the MultiQC report when present, else empty."""
     mqc = next((r for r in reports if r["key"] == "multiqc" and r["exists"]), None)
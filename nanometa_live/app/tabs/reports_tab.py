@@ -2,7 +2,8 @@
 
 Builds the Reports-tab content from the operator's current results directory:
 links to the MultiQC + Nextflow reports (gap 2), the realtime performance panel
-(gap 3), and the assembly summary (gap 4). The render is gated on the
+(gap 3), the assembly summary (gap 4), and the dashboard's time-to-alert
+latency. The render is gated on the
 results-fingerprint + interval backstop like the other tabs, and only does work
 while the Reports tab is active.
 """
@@ -20,12 +21,14 @@ from nanometa_live.core.utils.reports_loader import set_reports_dir, detect_repo
 from nanometa_live.core.utils.realtime_stats_loader import load_realtime_stats
 from nanometa_live.core.utils.assembly_loader import load_assembly_stats
 from nanometa_live.core.utils.taxpasta_loader import load_taxpasta_long
+from nanometa_live.core.utils.alert_latency import alert_latency_summary
 from nanometa_live.app.tabs.reports_helpers import (
     build_pipeline_reports_card,
     build_multiqc_embed,
     build_realtime_performance_panel,
     build_assembly_panel,
     build_taxpasta_panel,
+    build_alert_latency_panel,
 )
 from nanometa_live.app.utils.outdir_resolution import resolve_outdir_for_fingerprint
 
@@ -77,8 +80,10 @@ def register_reports_callbacks(app, backend_manager=None):
         assemblies = load_assembly_stats(results_dir)
         taxpasta_rows = load_taxpasta_long(results_dir)
         taxpasta_names = _name_by_taxid(results_dir) if taxpasta_rows else {}
+        latency_rows = alert_latency_summary(results_dir) if results_dir else []
         return html.Div([
             build_realtime_performance_panel(realtime),
+            build_alert_latency_panel(latency_rows),
             build_taxpasta_panel(taxpasta_rows, taxpasta_names),
             build_assembly_panel(assemblies),
             build_pipeline_reports_card(reports),
@@ -17,11 +17,11 @@ from dash import html
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 
-from nanometa_live.core.parsers.paf_coverage_parser import (
-    parse_paf_coverage,
-    aggregate_contig_coverage,
-    CoverageData,
+from nanometa_live.core.parsers.coverage_pyramid import (
+    CoveragePyramid,
+    load_coverage_pyramid,
 )
+from nanometa_live.core.parsers.paf_coverage_parser import CoverageData
 from nanometa_live.app.layouts.validation_layout import create_validation_result_card
 
 
@@ -289,6 +289,27 @@ def _build_blast_detail_selector_options(
     return options, first_value
 
 
+def _kmer_support(config: Optional[dict], sample_id: Optional[str], taxid) -> Optional[float]:
+    """Median k-mer hit fraction of the reads Kraken2 assigned to ``taxid``.
+
+    Read from the per-read profiles; None when the run kept no per-read
+    output or the taxon has no reads in it.
+    """
+    if not config or not sample_id or not taxid:
+        return None
+    try:
+        from nanometa_live.app.utils.outdir_resolution import resolve_outdir_for_fingerprint
+        from nanometa_live.core.parsers.kraken_read_profiles import load_read_profiles
+        results_dir = resolve_outdir_for_fingerprint(config)
+        if not results_dir:
+            return None
+        profile = load_read_profiles(results_dir, sample_id).profile(int(taxid))
+    except Exception as e:
+        logging.debug(f"k-mer support unavailable for {sample_id}/{taxid}: {e}")
+        return None
+    return profile["median_confidence"] if profile else None
+
+
 def _blast_tsv_path(config: Optional[dict], selected_key: Optional[str]):
     """Resolve the flat ``validation/blast/<sample>_taxid<tid>.blast.tsv``.
 
@@ -581,6 +602,20 @@ def _load_real_coverage(
 ) -> Tuple[Optional[CoverageData], str]:
     """Load coverage from a real PAF file.
 
+    ``(coverage, state)`` from :func:`_load_coverage_pyramid`; see there.
+    """
+    pyramid, state = _load_coverage_pyramid(selected_key, config, min_mapq, batch_id)
+    return (pyramid.coverage if pyramid is not None else None), state
+
+
+def _load_coverage_pyramid(
+    selected_key: str,
+    config: Optional[dict],
+    min_mapq: int,
+    batch_id: Optional[str] = None,
+) -> Tuple[Optional[CoveragePyramid], str]:
+    """Load the coverage pyramid for a real PAF file.
+
     ``batch_id`` selects which PAF to read:
 
     - ``None`` (default, "cumulative" view) -> the canonical flat PAF
@@ -589,7 +624,10 @@ def _load_real_coverage(
     - a batch id -> the preserved per-batch PAF
       ``validation/minimap2/batch/<sample>_taxid<tid>_<batch_id>.paf``.
 
-    Returns ``(coverage, state)``. ``state`` distinguishes the None cases so
+    The pyramid is cached per (PAF, ``min_mapq``) until the file changes, so
+    switching back to a species does not re-parse its PAF.
+
+    Returns ``(pyramid, state)``. ``state`` distinguishes the None cases so
     the caller can render an accurate message: ``"ok"``, ``"no_config"``,
     ``"bad_key"``, ``"no_paf"`` (no file on disk), or ``"filtered"`` (a PAF
     exists but no alignment passes ``min_mapq`` -- the fix is the on-screen
@@ -620,9 +658,9 @@ def _load_real_coverage(
 
     for paf_path in candidates:
         if paf_path.exists():
-            cov_dict = parse_paf_coverage(paf_path, min_mapq=min_mapq)
-            if cov_dict:
-                return aggregate_contig_coverage(cov_dict), "ok"
+            pyramid = load_coverage_pyramid(paf_path, min_mapq=min_mapq)
+            if pyramid is not None:
+                return pyramid, "ok"
             logger.info(
                 "PAF file found but has no alignments passing min_mapq=%d: %s",
                 min_mapq, paf_path,
@@ -0,0 +1,439 @@
+"""
+Lane-partitioned worker pool behind the background-callback manager.
+
+Dash's stock ``DiskcacheManager`` starts a NEW OS process for every
+background callback. Under the ``spawn`` start method (see app.py) that
+process re-imports the whole application before the callback body runs,
+so even a trivial interactive callback pays several seconds of start-up,
+and while a multi-hour genome download or ``makeblastdb`` build holds the
+machine those start-ups get slower still.
+
+:class:`PooledDiskcacheManager` keeps a fixed set of pre-started worker
+processes per *lane* instead:
+
+* ``interactive`` -- report previews, validation status, readiness, QC and
+  anything not listed in :data:`HEAVY_CALLBACKS`. Workers are warm, so a
+  job starts as soon as one is free.
+* ``heavy`` -- genome downloads, BLAST database builds, bundle export and
+  import, the preparation wizard. A full heavy lane queues further heavy
+  jobs; it never delays the interactive lane.
+
+Results, progress and ``set_props`` still flow through the same diskcache
+handle, so callbacks see no difference. Job handles are opaque strings
+(``<lane>-<hex>``) rather than PIDs, which is what lets Dash's cancel
+machinery (``terminate_job``) drop a queued job without touching a worker,
+and kill only the worker running a cancelled job. A killed worker is
+replaced as soon as it is cancelled; one that exits after its job quota is
+replaced on the next submission, or on the next status or metrics poll
+that finds jobs queued behind a short-handed lane.
+
+Workers are long-lived, so module-level state now survives between jobs in
+the same worker. Every cache in the loader stack is keyed on file
+fingerprints or content, so that is a warm cache rather than a stale one;
+:data:`DEFAULT_MAX_JOBS_PER_WORKER` recycles each worker anyway so a leak in
+one callback cannot accumulate for the lifetime of the app.
+
+Setting both lane sizes to 0 (``background_interactive_workers`` /
+``background_heavy_workers``) restores the spawn-per-job behaviour.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from dash import DiskcacheManager
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+HEAVY = "heavy"
+LANES = (INTERACTIVE, HEAVY)
+
+# Callback function names routed to the heavy lane. Matched on the
+# undecorated function's ``__name__``; a new long-running background
+# callback belongs here or it will occupy an interactive worker.
+HEAVY_CALLBACKS = frozenset({
+    "run_preparation",
+    "export_bundle",
+    "force_export_bundle",
+    "import_bundle_worker",
+    "regenerate_mappings",
+    "import_genomes_from_dir_worker",
+    "import_genomes_from_archive_worker",
+    "import_mapped_genomes_worker",
+    "download_missing_genomes",
+    "download_single_genome",
+    "build_missing_blast_dbs",
+    "test_genome_download",
+    "run_all_wizard_steps",
+    "download_kraken_database",
+    "run_on_demand_validation",
+})
+
+DEFAULT_WORKERS: Dict[str, int] = {INTERACTIVE: 2, HEAVY: 2}
+CONFIG_KEYS: Dict[str, str] = {
+    INTERACTIVE: "background_interactive_workers",
+    HEAVY: "background_heavy_workers",
+}
+
+# Jobs a worker runs before it exits and is replaced.
+DEFAULT_MAX_JOBS_PER_WORKER = 50
+
+# Job states, stored in the diskcache handle under _status_key(job_id).
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
+
+_STATUS_PREFIX = "__nm_pool__"
+# Status records outlive their job by this long so a late job_running
+# poll still sees DONE rather than "unknown".
+_STATUS_EXPIRE_S = 6 * 3600
+
+
+def _status_key(job_id: str) -> str:
+    return f"{_STATUS_PREFIX}{job_id}"
+
+
+def lane_for(fn: Callable) -> str:
+    """Return the lane a background callback function runs in."""
+    return HEAVY if getattr(fn, "__name__", "") in HEAVY_CALLBACKS else INTERACTIVE
+
+
+def worker_counts_from_config(config: Optional[Mapping[str, Any]]) -> Dict[str, int]:
+    """Read per-lane worker counts from *config*, falling back to defaults.
+
+    Negative or non-integer values fall back to the default for that lane
+    rather than disabling it, so a typo cannot silently switch the app back
+    to spawn-per-job.
+    """
+    counts = dict(DEFAULT_WORKERS)
+    for lane, key in CONFIG_KEYS.items():
+        raw = (config or {}).get(key)
+        if raw is None:
+            continue
+        try:
+            value = int(raw)
+        except (TypeError, ValueError):
+            logger.warning("Ignoring invalid %s=%r", key, raw)
+            continue
+        if value < 0:
+            logger.warning("Ignoring negative %s=%r", key, raw)
+            continue
+        counts[lane] = value
+    return counts
+
+
+def _worker_main(lane: str, tasks: Any, handle: Any, max_jobs: int) -> None:
+    """Worker process body: run queued jobs until a sentinel or *max_jobs*."""
+    completed = 0
+    while completed < max_jobs:
+        task = tasks.get()
+        if task is None:
+            return
+        job_id, job_fn, key, progress_key, args, context = task
+        status_key = _status_key(job_id)
+        with handle.transact():
+            status = handle.get(status_key) or {}
+            if status.get("state") == CANCELLED:
+                continue
+            handle.set(status_key, {
+                "state": RUNNING, "lane": lane, "pid": os.getpid(),
+                "started": time.time(),
+            }, expire=_STATUS_EXPIRE_S)
+        try:
+            job_fn(key, progress_key, args, context)
+        except Exception:  # job_fn records callback errors itself
+            logger.exception("Background job %s failed in the %s lane", job_id, lane)
+        finally:
+            with handle.transact():
+                status = handle.get(status_key) or {}
+                if status.get("state") != CANCELLED:
+                    handle.set(status_key, {"state": DONE, "lane": lane},
+                               expire=_STATUS_EXPIRE_S)
+        completed += 1
+
+
+class _Lane:
+    """One queue plus its fixed set of worker processes."""
+
+    def __init__(self, name: str, size: int, handle: Any, max_jobs: int):
+        self.name = name
+        self.size = size
+        self.handle = handle
+        self.max_jobs = max_jobs
+        self.queue: Any = None
+        self.workers: List[Any] = []
+        self._lock = threading.Lock()
+
+    def ensure_started(self) -> None:
+        """Start the queue and top the worker set back up to ``size``."""
+        from multiprocess import Process, Queue
+
+        with self._lock:
+            if self.queue is None:
+                self.queue = Queue()
+            self.workers = [w for w in self.workers if w.is_alive()]
+            while len(self.workers) < self.size:
+                # daemon: workers must not outlive the app. No background
+                # callback starts multiprocessing children of its own.
+                proc = Process(
+                    target=_worker_main,
+                    args=(self.name, self.queue, self.handle, self.max_jobs),
+                    daemon=True,
+                    name=f"nanometa-{self.name}-worker",
+                )
+                proc.start()
+                self.workers.append(proc)
+
+    def alive(self) -> int:
+        return sum(1 for w in self.workers if w.is_alive())
+
+    def worker(self, pid: int) -> Any:
+        """The worker process with ``pid``, or None if it is not one of ours."""
+        return next((w for w in self.workers if w.pid == pid), None)
+
+    def refill(self) -> None:
+        """Replace exited workers, once the lane has been started."""
+        if self.size and self.queue is not None and self.alive() < self.size:
+            self.ensure_started()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for proc in self.workers:
+                if proc.is_alive():
+                    proc.terminate()
+            self.workers = []
+
+
+class PooledDiskcacheManager(DiskcacheManager):
+    """``DiskcacheManager`` that runs jobs on pre-started per-lane workers.
+
+    A lane configured with 0 workers falls back to the stock
+    spawn-per-job path for its callbacks, and those jobs keep integer PID
+    handles; every override below passes such handles to the parent class.
+    """
+
+    def __init__(self, cache=None, cache_by=None, expire=None,
+                 workers: Optional[Mapping[str, int]] = None,
+                 max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER):
+        # Set before super().__init__: the base class replays every
+        # already-registered callback through make_job_fn.
+        self._job_lanes: Dict[Any, str] = {}
+        super().__init__(cache, cache_by=cache_by, expire=expire)
+        sizes = dict(DEFAULT_WORKERS)
+        sizes.update(workers or {})
+        self._lanes: Dict[str, _Lane] = {
+            lane: _Lane(lane, int(sizes[lane]), self.handle, max_jobs_per_worker)
+            for lane in LANES
+        }
+        self._active: Dict[str, str] = {}
+        self._finished: Dict[str, Dict[str, int]] = {
+            lane: {DONE: 0, CANCELLED: 0} for lane in LANES
+        }
+        self._active_lock = threading.Lock()
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> None:
+        """Pre-start every lane's workers so the first job is not cold."""
+        for lane in self._lanes.values():
+            if lane.size:
+                lane.ensure_started()
+
+    def shutdown(self) -> None:
+        for lane in self._lanes.values():
+            lane.shutdown()
+
+    # -- Dash manager protocol ----------------------------------------------
+
+    def make_job_fn(self, fn, progress, key=None):
+        job_fn = super().make_job_fn(fn, progress, key)
+        self._job_lanes[id(job_fn)] = lane_for(fn)
+        return job_fn
+
+    def call_job_fn(self, key, job_fn, args, context):
+        lane = self._lanes[self._job_lanes.get(id(job_fn), INTERACTIVE)]
+        if not lane.size:
+            return super().call_job_fn(key, job_fn, args, context)
+        lane.ensure_started()
+        job_id = f"{lane.name}-{uuid.uuid4().hex}"
+        self.handle.set(_status_key(job_id), {"state": QUEUED, "lane": lane.name},
+                        expire=_STATUS_EXPIRE_S)
+        with self._active_lock:
+            self._active[job_id] = lane.name
+        lane.queue.put(
+            (job_id, job_fn, key, self._make_progress_key(key), args, context)
+        )
+        return job_id
+
+    def job_running(self, job):
+        if _is_pid(job):
+            return super().job_running(job)
+        state = self._state(job)
+        if state == QUEUED:
+            # Dash polls this while the job waits: a lane whose workers all
+            # exited must not leave it queued until an unrelated submission.
+            lane = self._lanes.get(str(job).split("-", 1)[0])
+            if lane is not None:
+                lane.refill()
+        return state in (QUEUED, RUNNING)
+
+    def terminate_job(self, job):
+        if job is None:
+            return
+        if _is_pid(job):
+            super().terminate_job(job)
+            return
+        self.cancel(str(job))
+
+    def get_result(self, key, job):
+        # Dash calls terminate_job as soon as the result exists, but the
+        # worker marks the job DONE only after job_fn returns, so
+        # terminate_job could still see RUNNING and kill a healthy worker.
+        # A written result means the job has finished: record that first.
+        if job and not _is_pid(job) and self.result_ready(key):
+            self._mark_done(str(job))
+        return super().get_result(key, job)
+
+    def terminate_unhealthy_job(self, job):
+        if _is_pid(job):
+            return super().terminate_unhealthy_job(job)
+        status = self.handle.get(_status_key(str(job))) or {}
+        if status.get("state") == RUNNING and not _pid_alive(status.get("pid")):
+            self.cancel(str(job))
+            return True
+        return False
+
+    # -- pool API ------------------------------------------------------------
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job. Returns True when one was stopped.
+
+        A queued job is marked cancelled and skipped by whichever worker
+        dequeues it. A running job's worker is killed along with any child
+        processes (``nextflow``, ``makeblastdb``) and replaced straight
+        away, so jobs queued behind it keep moving.
+        """
+        status_key = _status_key(job_id)
+        with self.handle.transact():
+            status = self.handle.get(status_key) or {}
+            state = status.get("state")
+            if state not in (QUEUED, RUNNING):
+                return False
+            self.handle.set(status_key, {"state": CANCELLED, "lane": status.get("lane")},
+                            expire=_STATUS_EXPIRE_S)
+        if state == RUNNING and status.get("pid"):
+            pid = int(status["pid"])
+            lane = self._lanes.get(status.get("lane"))
+            worker = lane.worker(pid) if lane is not None else None
+            # Our own worker is reaped through multiprocess: reaping it
+            # behind its back would leave is_alive() True for ever.
+            _kill_tree(pid, wait=worker is None)
+            if worker is not None:
+                worker.join(1)
+                lane.refill()
+        logger.info("Cancelled %s background job %s", state, job_id)
+        return True
+
+    def queue_metrics(self) -> Dict[str, Dict[str, int]]:
+        """Per-lane ``queued``/``running``/``workers``/``done``/``cancelled``.
+
+        Read from the status records of jobs submitted by this process, so
+        the call is cheap enough for the header poll.
+        """
+        metrics = {
+            lane: {"queued": 0, "running": 0, "workers": self._lanes[lane].alive(),
+                   "capacity": self._lanes[lane].size, **self._finished[lane]}
+            for lane in LANES
+        }
+        with self._active_lock:
+            for job_id, lane in list(self._active.items()):
+                state = self._state(job_id)
+                if state == QUEUED:
+                    metrics[lane]["queued"] += 1
+                elif state == RUNNING:
+                    metrics[lane]["running"] += 1
+                else:
+                    del self._active[job_id]
+                    if state in (DONE, CANCELLED):
+                        self._finished[lane][state] += 1
+                        metrics[lane][state] += 1
+        for name, m in metrics.items():
+            if m["queued"] and m["workers"] < m["capacity"]:
+                self._lanes[name].refill()
+                m["workers"] = self._lanes[name].alive()
+        return metrics
+
+    def _mark_done(self, job_id: str) -> None:
+        status_key = _status_key(job_id)
+        with self.handle.transact():
+            status = self.handle.get(status_key) or {}
+            if status.get("state") == RUNNING:
+                self.handle.set(status_key, {"state": DONE, "lane": status.get("lane")},
+                                expire=_STATUS_EXPIRE_S)
+
+    def _state(self, job_id: Any) -> Optional[str]:
+        status = self.handle.get(_status_key(str(job_id))) or {}
+        return status.get("state")
+
+
+def _is_pid(job: Any) -> bool:
+    return isinstance(job, int) or (isinstance(job, str) and job.isdigit())
+
+
+def _pid_alive(pid: Any) -> bool:
+    import psutil
+
+    try:
+        return bool(pid) and psutil.pid_exists(int(pid))
+    except (TypeError, ValueError):
+        return False
+
+
+def _kill_tree(pid: int, wait: bool = True) -> None:
+    """Kill ``pid`` and its descendants; ``wait`` reaps ``pid`` as well."""
+    import psutil
+
+    try:
+        proc = psutil.Process(pid)
+    except psutil.NoSuchProcess:
+        return
+    for child in proc.children(recursive=True):
+        try:
+            child.kill()
+        except psutil.NoSuchProcess:
+            pass
+    try:
+        proc.kill()
+        if wait:
+            proc.wait(1)
+    except (psutil.NoSuchProcess, psutil.TimeoutExpired):
+        pass
+
+
+def format_queue_depth(metrics: Optional[Mapping[str, Mapping[str, int]]]) -> str:
+    """Header text for the job-queue indicator; empty when nothing is pending.
+
+    Example: ``"Jobs: interactive 1 running · heavy 1 running, 2 queued"``.
+    """
+    if not metrics:
+        return ""
+    parts = []
+    for lane in LANES:
+        m = metrics.get(lane) or {}
+        running, queued = int(m.get("running", 0)), int(m.get("queued", 0))
+        if not running and not queued:
+            continue
+        bits = []
+        if running:
+            bits.append(f"{running} running")
+        if queued:
+            bits.append(f"{queued} queued")
+        parts.append(f"{lane} {', '.join(bits)}")
+    return f"Jobs: {' · '.join(parts)}" if parts else ""
@@ -0,0 +1,45 @@
+"""
+Serve coverage depth tiles at ``/coverage-tiles/<token>``.
+
+The validation tab's depth plot carries the route and its pyramid token in
+``layout.meta["coverage_tiles"]`` (``create_coverage_depth_figure``). On
+zoom a clientside callback asks for ``?start=&end=&width=&overview=`` and
+redraws from the JSON returned here (``CoveragePyramid.view``), so zooming
+needs no Dash round-trip and costs the same at any scale.
+
+Tokens name pyramids the server built for an earlier render, so no path
+ever comes from the URL. An unknown or evicted token is a 404; the plot
+then keeps what it shows.
+"""
+
+from __future__ import annotations
+
+from flask import abort, jsonify, request
+
+from nanometa_live.app.components.coverage_plots import COVERAGE_TILE_ROUTE
+
+
+def _int_arg(name: str, default: int) -> int:
+    try:
+        return int(float(request.args.get(name, default)))
+    except (TypeError, ValueError):
+        abort(400)
+
+
+def register_coverage_tiles(app) -> None:
+    """Add the tile route to ``app.server``."""
+
+    @app.server.route(COVERAGE_TILE_ROUTE + "<token>")
+    def serve_coverage_tile(token):
+        from nanometa_live.core.parsers.coverage_pyramid import published_pyramid
+
+        pyramid = published_pyramid(token)
+        if pyramid is None:
+            abort(404)
+        tile = pyramid.view(
+            _int_arg("start", 0),
+            _int_arg("end", pyramid.ref_length),
+            _int_arg("width", 1000),
+            overview=_int_arg("overview", 0),
+        )
+        return jsonify(tile)
@@ -11,6 +11,8 @@ import logging
 from collections import OrderedDict
 from typing import Dict, Optional
 
+from nanometa_live.core.utils.bounded_cache import BoundedCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,11 +21,10 @@ logger = logging.getLogger(__name__)
 # and can therefore generate one debounce key per pathogen-card-button
 # pair) do not grow the dict without limit during long-running 24-barcode
 # sessions. Closes P1-T08 from
-# docs/audit-2026-04-28-throughput-gui.md. OrderedDict preserves
-# insertion order, so when capacity is reached the least-recently-
-# inserted key is evicted.
+# docs/audit-2026-04-28-throughput-gui.md. When capacity is reached the
+# least-recently-used key is evicted.
 _DEBOUNCE_MAX_KEYS = 512
-_debounce_timestamps: "OrderedDict[str, float]" = OrderedDict()
+_debounce_timestamps = BoundedCache("debounce", max_entries=_DEBOUNCE_MAX_KEYS)
 _debounce_lock = threading.Lock()
 
 
@@ -68,19 +69,13 @@ def should_skip_update(
                 f"Debounce skip: {callback_id} "
                 f"(last: {time_since_last:.0f}ms ago, threshold: {debounce_ms}ms)"
             )
-            # Mark as recently used so LRU eviction below does not
-            # discard a key we just consulted.
-            _debounce_timestamps.move_to_end(debounce_key)
+            # The lookup above marked the key recently used, so LRU
+            # eviction does not discard a key we just consulted.
             return True
 
-        # Update timestamp for this callback. If a stale entry already
-        # exists for this key we overwrite it; OrderedDict.__setitem__
-        # places it at the end. When the dict exceeds capacity, drop
-        # the oldest entry.
+        # Update timestamp for this callback; the cache drops the least
+        # recently used key past capacity.
         _debounce_timestamps[debounce_key] = current_time
-        _debounce_timestamps.move_to_end(debounce_key)
-        if len(_debounce_timestamps) > _DEBOUNCE_MAX_KEYS:
-            _debounce_timestamps.popitem(last=False)
         return False
 
 
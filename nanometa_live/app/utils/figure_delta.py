@@ -0,0 +1,180 @@
+"""
+Send only what changed when a figure's structure is unchanged.
+
+The taxonomy tab rebuilds its Sankey / Sunburst on every results update.
+Between batches the node and link set is usually identical and only read
+counts (and the colours and positions derived from them) move. Shipping
+the whole figure each time makes the browser re-layout thousands of nodes.
+
+``delta_update`` splits a single-trace figure into its *topology* -- every
+property except the ones listed in ``VOLATILE_PATHS`` -- and its volatile
+arrays. The builders order nodes and links by read count, so a change in
+counts can reorder otherwise identical arrays; the figure is first put in
+a canonical order (by node identity), which does not change what is drawn
+because Sankey positions are explicit and Sunburst sorts by value itself.
+The topology and each volatile array are then hashed; when the topology
+hash matches the one the client last received, a ``dash.Patch`` carrying
+just the arrays whose hash changed is returned instead of the figure
+(colour arrays often stay put while counts move). Volatile floats are
+rounded to ``FLOAT_DIGITS`` significant digits in both paths, far below
+what a hover label or a pixel can show. The caller keeps the returned
+state in a ``dcc.Store`` next to the graph and must clear it whenever
+something else is drawn there.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import plotly.graph_objects as go
+from plotly.utils import PlotlyJSONEncoder
+
+# Per trace type: properties that may change without a full redraw.
+VOLATILE_PATHS = {
+    "sankey": (
+        ("node", "customdata"),
+        ("node", "color"),
+        ("node", "y"),
+        ("link", "value"),
+        ("link", "color"),
+    ),
+    "sunburst": (
+        ("values",),
+        ("customdata",),
+        ("marker", "colors"),
+    ),
+}
+FLOAT_DIGITS = 6
+
+
+def _round_floats(value: Any) -> Any:
+    if isinstance(value, float):
+        return float(f"{value:.{FLOAT_DIGITS}g}")
+    if isinstance(value, list):
+        return [_round_floats(v) for v in value]
+    return value
+
+
+def _digest(value: Any) -> str:
+    text = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def _path_key(path: Tuple[str, ...]) -> str:
+    return ".".join(path)
+
+
+def _pop_path(obj: Dict, path: Tuple[str, ...]) -> Any:
+    """Remove ``obj[path[0]][path[1]]...`` and return it (None if absent)."""
+    for key in path[:-1]:
+        obj = obj.get(key)
+        if not isinstance(obj, dict):
+            return None
+    return obj.pop(path[-1], None)
+
+
+def _permute(container: Dict, order: List[int]) -> None:
+    """Reorder every per-item list in ``container`` (and one level down)."""
+    n = len(order)
+    for key, value in container.items():
+        if isinstance(value, list) and len(value) == n:
+            container[key] = [value[i] for i in order]
+        elif isinstance(value, dict):
+            _permute(value, order)
+
+
+def _canonical_sankey(trace: Dict) -> bool:
+    node, link = trace.get("node", {}), trace.get("link", {})
+    labels = node.get("label") or []
+    # customdata rows are [reads, pct, rank name, full name]; x is the column.
+    names = [(row[2], row[3]) if isinstance(row, list) and len(row) > 3 else label
+             for row, label in zip(node.get("customdata") or [None] * len(labels), labels)]
+    keys = [json.dumps([name, x]) for name, x in zip(names, node.get("x") or [0] * len(labels))]
+    if len(set(keys)) != len(keys):
+        return False
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    _permute(node, order)
+    new_index = {old: new for new, old in enumerate(order)}
+    sources = [new_index[i] for i in link.get("source") or []]
+    targets = [new_index[i] for i in link.get("target") or []]
+    link["source"], link["target"] = sources, targets
+    _permute(link, sorted(range(len(sources)), key=lambda i: (sources[i], targets[i])))
+    return True
+
+
+def _canonical_sunburst(trace: Dict) -> bool:
+    ids = trace.get("ids") or []
+    if len(set(ids)) != len(ids):
+        return False
+    _permute(trace, sorted(range(len(ids)), key=ids.__getitem__))
+    return True
+
+
+_CANONICAL = {"sankey": _canonical_sankey, "sunburst": _canonical_sunburst}
+
+
+def split_figure(fig) -> Optional[Tuple[Dict, str, Dict[Tuple[str, ...], Any]]]:
+    """``(canonical_spec, topology_hash, {path: volatile_value})``, or None.
+
+    Only single-trace figures of a type in ``VOLATILE_PATHS`` whose nodes
+    have unique identities are split. Volatile floats are rounded in the
+    returned spec as well as in the volatile values.
+    """
+    if isinstance(fig, go.Figure):
+        fig = fig.to_plotly_json()
+    spec = json.loads(json.dumps(fig, cls=PlotlyJSONEncoder))
+    data = spec.get("data") or []
+    if len(data) != 1 or data[0].get("type") not in VOLATILE_PATHS:
+        return None
+    trace = data[0]
+    if not _CANONICAL[trace["type"]](trace):
+        return None
+    volatile = {}
+    for path in VOLATILE_PATHS[trace["type"]]:
+        value = _pop_path(trace, path)
+        if value is not None:
+            value = _round_floats(value)
+        volatile[path] = value
+    topology = _digest(spec)
+    for path, value in volatile.items():
+        if value is not None:
+            target = trace
+            for key in path[:-1]:
+                target = target[key]
+            target[path[-1]] = value
+    return spec, topology, volatile
+
+
+def delta_update(fig, previous: Optional[Dict]):
+    """Return ``(figure_or_patch, state)`` for a graph output.
+
+    ``previous`` is the state returned with the figure the client currently
+    shows: ``{"topology": hash, "paths": {dotted path: hash}}``. When the
+    topology differs, the full figure goes out, as a dict in canonical
+    order. When nothing changed at all, ``dash.no_update`` goes out. A
+    figure that cannot be split goes out unchanged with state None.
+    """
+    from dash import Patch, no_update
+
+    split = split_figure(fig)
+    if split is None:
+        return fig, None
+    spec, topology, volatile = split
+    state = {
+        "topology": topology,
+        "paths": {_path_key(path): _digest(value) for path, value in volatile.items()},
+    }
+    if not isinstance(previous, dict) or previous.get("topology") != topology:
+        return spec, state
+    sent = previous.get("paths") or {}
+    changed = [path for path in volatile
+               if sent.get(_path_key(path)) != state["paths"][_path_key(path)]]
+    if not changed:
+        return no_update, state
+    patch = Patch()
+    for path in changed:
+        target = patch["data"][0]
+        for key in path[:-1]:
+            target = target[key]
+        target[path[-1]] = volatile[path]
+    return patch, state
@@ -7,7 +7,9 @@ output file mtime. We look first at the realtime incremental layout
 ``kraken2/*<sample>*`` reports when batch_reports is empty.
 
 Logic is isolated here so it can be unit tested without filesystem
-mocks for callback wiring.
+mocks for callback wiring. While the results directory is being polled the
+mtimes come from the results catalog, which stat-ed every file during the
+poll's freshness check; otherwise the directories are scanned here.
 """
 
 from __future__ import annotations
@@ -15,10 +17,17 @@ from __future__ import annotations
 import os
 from typing import Dict, Iterable, Optional
 
+from nanometa_live.core.utils.results_catalog import scan_file_mtimes
+
 
 def _max_mtime_in_dir(path: str) -> Optional[float]:
     """Return the maximum file mtime in a directory, or None when empty."""
-    if not path or not os.path.isdir(path):
+    if not path:
+        return None
+    cataloged = scan_file_mtimes(path)
+    if cataloged is not None:
+        return max((mt for _name, mt in cataloged), default=None)
+    if not os.path.isdir(path):
         return None
     latest: Optional[float] = None
     try:
@@ -52,6 +61,9 @@ def sample_last_data_ts(main_dir: str, sample: str) -> Optional[float]:
     if nested_mt is not None:
         return nested_mt
 
+    cataloged = scan_file_mtimes(kraken_dir)
+    if cataloged is not None:
+        return max((mt for name, mt in cataloged if sample in name), default=None)
     if not os.path.isdir(kraken_dir):
         return None
     latest: Optional[float] = None
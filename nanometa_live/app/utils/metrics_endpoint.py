@@ -0,0 +1,155 @@
+"""
+Serve the metrics registry at ``/metrics`` and time every Dash callback.
+
+Callbacks are timed at the dispatch route rather than by wrapping each
+registered function. Dash routes every callback (background ones
+included) through ``POST /_dash-update-component``, and the request body
+names the output being updated. One ``before_request`` /
+``after_request`` pair therefore covers callbacks registered with
+``app.callback`` and ``dash.callback``, including any registered after
+startup. The registered functions are left untouched, so tests that reach
+``callback.__wrapped__`` still get the original. The measured time
+includes Dash's own JSON serialisation, which is part of what the operator
+waits for.
+
+Cache sizes and the JSON digest counters are registered as render-time
+callbacks. Their values already live in the loader modules, so nothing is
+mirrored on the hot path.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Dict, Tuple
+
+from flask import Response, g, request
+
+from nanometa_live.core.utils.metrics import (
+    CALLBACK_ERRORS,
+    CALLBACK_SECONDS,
+    REGISTRY,
+    metrics_enabled,
+    render_metrics,
+)
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_PATH_SUFFIX = "/_dash-update-component"
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _cache_entries() -> Dict[Tuple[str, ...], float]:
+    from nanometa_live.core.utils import json_ingest as ji
+    from nanometa_live.core.utils.bounded_cache import cache_stats
+    from nanometa_live.core.watchlist.match_cache import match_cache_stats
+
+    entries = {(name,): stats["entries"] for name, stats in cache_stats().items()}
+    entries[("json_digest",)] = len(ji._digest_cache)
+    entries[("watchlist_match",)] = match_cache_stats()["entries"]
+    return entries
+
+
+def _cache_bytes() -> Dict[Tuple[str, ...], float]:
+    from nanometa_live.core.utils.bounded_cache import cache_stats
+
+    return {(name,): stats["bytes"] for name, stats in cache_stats().items()}
+
+
+def _cache_reads() -> Dict[Tuple[str, ...], float]:
+    from nanometa_live.core.utils.bounded_cache import cache_stats
+
+    samples = {}
+    for name, stats in cache_stats().items():
+        samples[(name, "hit")] = stats["hits"]
+        samples[(name, "miss")] = stats["misses"]
+    return samples
+
+
+def _cache_evictions() -> Dict[Tuple[str, ...], float]:
+    from nanometa_live.core.utils.bounded_cache import cache_stats
+
+    return {(name, reason): count for name, stats in cache_stats().items()
+            for reason, count in stats["evictions"].items()}
+
+
+def _json_digest_counts() -> Dict[Tuple[str, ...], float]:
+    from nanometa_live.core.utils.json_ingest import json_parse_stats
+
+    stats = json_parse_stats()
+    return {("hit",): stats["hits"], ("parse",): stats["parses"]}
+
+
+def _match_cache_counts() -> Dict[Tuple[str, ...], float]:
+    from nanometa_live.core.watchlist.match_cache import match_cache_stats
+
+    stats = match_cache_stats()
+    return {("hit",): stats["hits"], ("miss",): stats["misses"]}
+
+
+def register_cache_collectors() -> None:
+    """Expose loader cache occupancy, evictions and JSON digest reuse on ``/metrics``."""
+    REGISTRY.register_callback(
+        "gauge", "nanometa_cache_entries",
+        "Entries currently held by each loader cache.", ("cache",), _cache_entries,
+    )
+    REGISTRY.register_callback(
+        "gauge", "nanometa_cache_bytes",
+        "Estimated bytes held by each bounded cache.", ("cache",), _cache_bytes,
+    )
+    REGISTRY.register_callback(
+        "counter", "nanometa_cache_reads_total",
+        "Bounded-cache reads that found (hit) or missed an entry.",
+        ("cache", "result"), _cache_reads,
+    )
+    REGISTRY.register_callback(
+        "counter", "nanometa_cache_evictions_total",
+        "Bounded-cache evictions by reason (entries, bytes, ttl, memory, oversize).",
+        ("cache", "reason"), _cache_evictions,
+    )
+    REGISTRY.register_callback(
+        "counter", "nanometa_json_digest_total",
+        "Per-file JSON digest lookups served from cache (hit) or parsed.",
+        ("result",), _json_digest_counts,
+    )
+    REGISTRY.register_callback(
+        "counter", "nanometa_watchlist_match_cache_total",
+        "Watchlist name resolutions served from the match cache (hit) or matched.",
+        ("result",), _match_cache_counts,
+    )
+
+
+def callback_output() -> str:
+    """The output id named in the current Dash dispatch request body."""
+    body = request.get_json(silent=True) or {}
+    output = body.get("output")
+    return output if isinstance(output, str) else "unknown"
+
+
+def instrument_callbacks(server) -> None:
+    """Record every Dash callback request in ``nanometa_callback_seconds``."""
+
+    @server.before_request
+    def _start_callback_timer():
+        if metrics_enabled() and request.path.endswith(DISPATCH_PATH_SUFFIX):
+            g.nanometa_callback_start = time.perf_counter()
+
+    @server.after_request
+    def _record_callback_time(response):
+        start = g.pop("nanometa_callback_start", None)
+        if start is not None:
+            output = callback_output()
+            CALLBACK_SECONDS.observe(time.perf_counter() - start, output=output)
+            if response.status_code >= 400:
+                CALLBACK_ERRORS.inc(output=output)
+        return response
+
+
+def register_metrics(app) -> None:
+    """Add the ``/metrics`` route, callback timing and cache collectors."""
+    register_cache_collectors()
+    instrument_callbacks(app.server)
+
+    @app.server.route("/metrics")
+    def serve_metrics():
+        return Response(render_metrics(), content_type=METRICS_CONTENT_TYPE)
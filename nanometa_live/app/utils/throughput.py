@@ -24,10 +24,18 @@ def append_tick(
     ts: float,
     total_reads: int,
     total_files: int,
+    input_reads: Optional[int] = None,
 ) -> List[Dict[str, float]]:
-    """Append one tick to the buffer and trim to BUFFER_LIMIT entries."""
+    """Append one tick to the buffer and trim to BUFFER_LIMIT entries.
+
+    ``input_reads`` is the ingest tracker's estimate of reads written by
+    MinKNOW so far; omitted when unknown.
+    """
     new_buf = list(buffer or [])
-    new_buf.append({"ts": ts, "reads": int(total_reads), "files": int(total_files)})
+    tick = {"ts": ts, "reads": int(total_reads), "files": int(total_files)}
+    if input_reads is not None:
+        tick["input"] = int(input_reads)
+    new_buf.append(tick)
     if len(new_buf) > BUFFER_LIMIT:
         new_buf = new_buf[-BUFFER_LIMIT:]
     return new_buf
@@ -56,6 +64,22 @@ def compute_rates(
     return (d_reads * 60.0) / dt, (d_files * 60.0) / dt
 
 
+def compute_input_rate(buffer: List[Dict[str, float]]) -> Optional[float]:
+    """Estimated reads-per-minute arriving in the input directory.
+
+    ``None`` unless the first and last ticks both carry an input estimate.
+    """
+    if not buffer or len(buffer) < 2:
+        return None
+    first, last = buffer[0], buffer[-1]
+    if "input" not in first or "input" not in last:
+        return None
+    dt = float(last["ts"]) - float(first["ts"])
+    if dt <= 0:
+        return None
+    return max(0, int(last["input"]) - int(first["input"])) * 60.0 / dt
+
+
 def last_nonzero_delta_ts(buffer: List[Dict[str, float]]) -> Optional[float]:
     """
     Return the timestamp of the most recent tick where reads advanced.
@@ -7,6 +7,11 @@ server. Point it at a ``nextflow run`` output directory.
 
   nanometa-report --results results/Nanometa_Live_Analysis
   nanometa-report -r <outdir> -o ~/report --watchlist cdc_bioterrorism --offline
+  nanometa-report -r archive/run_* -o ~/reports --jobs 8
+
+Several ``--results`` directories are generated in parallel across a process
+pool (``--jobs``), each into ``<output>/<run name>/`` (or ``<results>/report``
+without ``--output``). A run that fails is reported and the rest carry on.
 
 Pathogen screening needs a watchlist: pass ``--watchlist <id>`` (a built-in id
 such as cdc_bioterrorism, clinical_pathogens, ...) so the threat section
@@ -19,7 +24,7 @@ import os
 import sys
 
 
-def _resolve_watchlist_ids(arg_value, results_dir):
+def _resolve_watchlist_ids(arg_value, results_dir, announce=True):
     """Watchlist ids to enable: the --watchlist argument, or the run record.
 
     ``--watchlist none`` forces an unscreened report even when the run
@@ -35,7 +40,7 @@ def _resolve_watchlist_ids(arg_value, results_dir):
     from nanometa_live.core.workflow.backend_manager import BackendManager
     meta = BackendManager.read_run_metadata(results_dir) or {}
     recorded = [w for w in (meta.get("watchlists") or []) if w]
-    if recorded:
+    if recorded and announce:
         print(
             "Using the watchlists recorded by the run: "
             + ", ".join(recorded)
@@ -44,16 +49,73 @@ def _resolve_watchlist_ids(arg_value, results_dir):
     return recorded
 
 
+def _batch_output_dirs(results_dirs, output):
+    """One output dir per run: ``<output>/<run name>``, suffixed on clashes."""
+    if output is None:
+        return [os.path.join(r, "report") for r in results_dirs]
+    seen = {}
+    dirs = []
+    for results in results_dirs:
+        name = os.path.basename(results.rstrip("/")) or "run"
+        seen[name] = seen.get(name, 0) + 1
+        dirs.append(os.path.join(output, name if seen[name] == 1 else f"{name}-{seen[name]}"))
+    return dirs
+
+
+def _run_batch(args, results_dirs, config, output, samples):
+    """Generate a report per results dir across a process pool."""
+    from nanometa_live.core.export.batch_report import ReportJob, generate_reports
+
+    jobs = [
+        ReportJob(
+            results_dir=results,
+            output_dir=out,
+            config={**config, "analysis_name": config.get("analysis_name")
+                    or os.path.basename(results.rstrip("/")) or "Nanometa Report"},
+            watchlist_ids=(_resolve_watchlist_ids(args.watchlist, results, announce=False)
+                           if os.path.isdir(results) else []),
+            samples=samples,
+            include_raw=not args.no_raw,
+        )
+        for results, out in zip(results_dirs, _batch_output_dirs(results_dirs, output))
+    ]
+    done = []
+
+    def report(outcome):
+        done.append(outcome)
+        status = "ok    " if outcome.ok else "FAILED"
+        detail = outcome.report_path if outcome.ok else outcome.error
+        print(f"[{len(done)}/{len(jobs)}] {status} {outcome.results_dir} "
+              f"({outcome.seconds:.1f} s): {detail}")
+        for warning in outcome.warnings:
+            print(f"    Warning: {warning}", file=sys.stderr)
+
+    summary = generate_reports(jobs, workers=args.jobs, on_done=report)
+    ok = len(jobs) - len(summary.failed)
+    print(f"Generated {ok}/{len(jobs)} reports in {summary.elapsed:.1f} s "
+          f"({summary.runs_per_minute:.1f} runs/minute)")
+    if summary.failed:
+        print(f"{len(summary.failed)} run(s) failed:", file=sys.stderr)
+        for outcome in summary.failed:
+            print(f"  {outcome.results_dir}: {outcome.error}", file=sys.stderr)
+        sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="nanometa-report",
         description="Generate the operator HTML report from a nanometanf results "
                     "directory (headless -- no dashboard).",
     )
-    parser.add_argument("--results", "-r", required=True,
-                        help="nanometanf results output directory (contains kraken2/, validation/, ...)")
+    parser.add_argument("--results", "-r", required=True, nargs="+",
+                        help="nanometanf results output directory (contains kraken2/, validation/, ...). "
+                             "Several directories produce one report each, in parallel.")
     parser.add_argument("--output", "-o", default=None,
-                        help="Directory to write the report bundle (default: <results>/report)")
+                        help="Directory to write the report bundle (default: <results>/report). "
+                             "With several --results, each report goes to <output>/<run name>.")
+    parser.add_argument("--jobs", "-j", type=int, default=0,
+                        help="Worker processes for several --results (default: one per CPU; "
+                             "1 runs them one after another)")
     parser.add_argument("--config", "-c", default=None,
                         help="Optional config.yaml (analysis_name, offline_mode, ...)")
     parser.add_argument("--watchlist", "-w", default=None,
@@ -69,8 +131,9 @@ def main():
                         help="Do not copy raw result files into the bundle")
     args = parser.parse_args()
 
-    results = os.path.abspath(os.path.expanduser(args.results))
-    if not os.path.isdir(results):
+    results_dirs = [os.path.abspath(os.path.expanduser(r)) for r in args.results]
+    results = results_dirs[0]
+    if len(results_dirs) == 1 and not os.path.isdir(results):
         print(f"Results directory not found: {results}", file=sys.stderr)
         sys.exit(1)
 
@@ -84,6 +147,11 @@ def main():
             config = yaml.safe_load(f) or {}
     if args.offline:
         config["offline_mode"] = True
+    output = os.path.abspath(os.path.expanduser(args.output)) if args.output else None
+    samples = [s.strip() for s in args.samples.split(",")] if args.samples else None
+    if len(results_dirs) > 1:
+        _run_batch(args, results_dirs, config, output, samples)
+        return
     config.setdefault("analysis_name",
                       os.path.basename(results.rstrip("/")) or "Nanometa Report")
 
@@ -103,9 +171,7 @@ def main():
             except Exception as e:  # noqa: BLE001 -- surface, keep going
                 print(f"Warning: could not enable watchlist '{wl}': {e}", file=sys.stderr)
 
-    output = (os.path.abspath(os.path.expanduser(args.output))
-              if args.output else os.path.join(results, "report"))
-    samples = [s.strip() for s in args.samples.split(",")] if args.samples else None
+    output = output or os.path.join(results, "report")
 
     from nanometa_live.core.export.report_generator import ReportGenerator
     generator = ReportGenerator(results, config)
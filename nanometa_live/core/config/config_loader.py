@@ -112,6 +112,10 @@ class ConfigLoader:
             # plots plus mapping confidence. 'blast' is more thorough but 5-10x slower
             # per pair; 'both' is available for highest confidence at 2x compute.
             "validation_method": "minimap2",  # 'blast', 'minimap2', or 'both'
+            # 'per_taxid' builds one BLAST database per reference genome;
+            # 'consolidated' builds one combined database with a per-taxid
+            # alias, which suits watchlists with hundreds of genomes.
+            "blast_db_mode": "per_taxid",
             "e_val_cutoff": 0.01,
             "validation_hit_rate_threshold": 0.5,
             "validation_identity_threshold": 90.0,
@@ -154,6 +158,16 @@ class ConfigLoader:
             "enable_nanopore_stats_mqc": False,
             # Offline mode: when enabled, skip all network calls and use cached data only
             "offline_mode": False,
+            # Build only the shell and the Dashboard tab at startup; other
+            # tabs are laid out on first navigation. Also set by --lazy-tabs.
+            "lazy_tabs": False,
+            # Worker processes per background-callback lane (see
+            # app/utils/background_pool.py). Heavy jobs -- genome downloads,
+            # BLAST builds, bundle export -- queue behind each other in their
+            # own lane and never delay interactive callbacks. 0 in both
+            # restores Dash's spawn-a-process-per-job behaviour.
+            "background_interactive_workers": 2,
+            "background_heavy_workers": 2,
             # Write the operator HTML report into <outdir>/report/ when a
             # run completes or is stopped, so the verdict survives closing
             # the dashboard. Best-effort; disable to skip.
@@ -634,9 +634,12 @@ def _ensure_blast_dbs_for_validation(genome_manager, genome_taxids):
     except (AttributeError, OSError) as e:
         logging.debug(f"Could not check BLAST DB status: {e}")
         return
-    for taxid in status.get("missing", []):
-        logging.info("Building missing BLAST DB for validation taxid %s", taxid)
-        genome_manager.build_blast_db(taxid)
+    missing = status.get("missing", [])
+    if missing:
+        # Batched so consolidated mode builds one database, not one per taxid.
+        logging.info("Building missing BLAST DBs for validation taxid(s) %s",
+                     ", ".join(str(t) for t in missing))
+        genome_manager.build_blast_dbs_batch(missing)
     # Re-check; anything still missing will have no BLAST results this run.
     still = genome_manager.blast_db_status(genome_taxids)
     if still.get("missing"):
@@ -0,0 +1,175 @@
+"""
+Batch report export across many results directories.
+
+After a watchlist update the lab regenerates reports for dozens of
+archived runs. One ``nanometa-report`` per run paid the interpreter and
+import start-up each time, re-read the plotly.js bundle and the watchlist
+YAML, and used one core. :func:`generate_reports` runs a list of
+:class:`ReportJob` over a process pool instead:
+
+* The read-only inputs every report shares (the plotly.js bundle and the
+  parsed watchlists) are loaded once in the parent by
+  :func:`warm_shared_caches`. Where the platform forks, workers inherit
+  them copy-on-write. Elsewhere each worker warms them once in its
+  initializer, not once per run.
+* Each job runs against a fresh ``WatchlistManager`` holding exactly that
+  run's watchlists, so one run's screen never leaks into the next one
+  handled by the same worker.
+* A failing run becomes a :class:`ReportOutcome` carrying the error. It
+  never aborts the batch.
+
+There is no taxonomy index to share: the report resolves watchlist
+entries through the read matrix (``core.watchlist.screening``), by taxid
+and exact name, and never loads the name matcher or a taxonomy.
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReportJob:
+    """One report to generate: a results directory and where it goes."""
+
+    results_dir: str
+    output_dir: str
+    config: Dict[str, Any] = field(default_factory=dict)
+    watchlist_ids: List[str] = field(default_factory=list)
+    samples: Optional[List[str]] = None
+    include_raw: bool = True
+
+
+@dataclass
+class ReportOutcome:
+    """What happened to one :class:`ReportJob`."""
+
+    results_dir: str
+    report_path: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchSummary:
+    """Outcomes in job order, plus the batch's wall-clock throughput."""
+
+    outcomes: List[ReportOutcome]
+    elapsed: float
+
+    @property
+    def failed(self) -> List[ReportOutcome]:
+        return [o for o in self.outcomes if not o.ok]
+
+    @property
+    def runs_per_minute(self) -> float:
+        done = len(self.outcomes) - len(self.failed)
+        return done * 60.0 / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def warm_shared_caches(watchlist_ids: Iterable[str] = ()) -> None:
+    """Load the read-only inputs every report shares, once per process."""
+    from nanometa_live.core.export.report_charts import local_plotly_js
+    from nanometa_live.core.watchlist.watchlist_loader import get_watchlist_loader
+
+    local_plotly_js()
+    loader = get_watchlist_loader()
+    for watchlist_id in watchlist_ids:
+        try:
+            loader.load_watchlist(watchlist_id)
+        except Exception as e:  # noqa: BLE001 -- the job reports it
+            logger.debug("Could not pre-load watchlist %s: %s", watchlist_id, e)
+
+
+def run_report_job(job: ReportJob) -> ReportOutcome:
+    """Generate one report; any failure is returned, never raised."""
+    from nanometa_live.core.export.report_generator import ReportGenerator
+    from nanometa_live.core.watchlist.watchlist_manager import (
+        get_watchlist_manager,
+        reset_watchlist_manager,
+    )
+
+    start = time.perf_counter()
+    outcome = ReportOutcome(results_dir=job.results_dir)
+    try:
+        if not os.path.isdir(job.results_dir):
+            raise FileNotFoundError(f"Results directory not found: {job.results_dir}")
+        reset_watchlist_manager()
+        wm = get_watchlist_manager()
+        for watchlist_id in job.watchlist_ids:
+            try:
+                wm.enable_watchlist(watchlist_id)
+            except Exception as e:  # noqa: BLE001 -- surface, keep going
+                outcome.warnings.append(f"could not enable watchlist '{watchlist_id}': {e}")
+        generator = ReportGenerator(job.results_dir, dict(job.config))
+        report = generator.generate(job.output_dir, samples=job.samples,
+                                    include_raw=job.include_raw)
+        outcome.report_path = str(report)
+    except Exception as e:  # noqa: BLE001 -- one bad run must not end the batch
+        logger.exception("Report for %s failed", job.results_dir)
+        outcome.error = f"{type(e).__name__}: {e}"
+    outcome.seconds = time.perf_counter() - start
+    return outcome
+
+
+def _pool_context():
+    # Fork where available: workers then inherit the warmed caches instead
+    # of re-reading them. The CLI parent runs no threads, so forking is safe.
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def generate_reports(
+    jobs: List[ReportJob],
+    workers: int = 0,
+    on_done: Optional[Callable[[ReportOutcome], None]] = None,
+) -> BatchSummary:
+    """Generate every job's report; ``workers`` <= 1 runs them in-process.
+
+    ``workers`` of 0 uses one process per CPU, capped at the job count.
+    ``on_done`` is called with each outcome as it completes.
+    """
+    start = time.perf_counter()
+    workers = workers or min(len(jobs), os.cpu_count() or 1)
+    watchlist_ids = sorted({w for job in jobs for w in job.watchlist_ids})
+    warm_shared_caches(watchlist_ids)
+    outcomes: Dict[int, ReportOutcome] = {}
+
+    def record(index: int, outcome: ReportOutcome) -> None:
+        outcomes[index] = outcome
+        if on_done:
+            on_done(outcome)
+
+    if workers <= 1 or len(jobs) <= 1:
+        for index, job in enumerate(jobs):
+            record(index, run_report_job(job))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(jobs)),
+            mp_context=_pool_context(),
+            initializer=warm_shared_caches,
+            initargs=(watchlist_ids,),
+        ) as pool:
+            futures = {pool.submit(run_report_job, job): i for i, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    outcome = future.result()
+                except Exception as e:  # noqa: BLE001 -- a worker died
+                    outcome = ReportOutcome(jobs[index].results_dir,
+                                            error=f"worker failed: {e}")
+                record(index, outcome)
+    return BatchSummary([outcomes[i] for i in range(len(jobs))],
+                        time.perf_counter() - start)
@@ -10,11 +10,16 @@ keeps a thin delegating wrapper so the class's public surface (and its
 existing monkeypatch-based tests) are unaffected.
 """
 
+import logging
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List
 
 import plotly.graph_objects as go
 import plotly.io as pio
 
+logger = logging.getLogger(__name__)
+
 
 def fig_to_json(fig: go.Figure) -> str:
     """Serialize a Plotly figure to JSON for template embedding."""
@@ -141,3 +146,31 @@ def build_charts(data: Dict[str, Any]) -> Dict[str, str]:
             )
 
     return charts
+
+
+@lru_cache(maxsize=1)
+def local_plotly_js() -> str:
+    """The bundled plotly.js source for inline embedding, or "" if none.
+
+    Read once per process: the bundle is ~3.5 MB, and a batch export (or
+    a pool worker forked after the first read) would otherwise re-read it
+    for every report.
+    """
+    try:
+        import dash
+        import plotly
+
+        # Dash bundles plotly.js in its package; plotly ships its own too.
+        dash_dir = Path(dash.__file__).parent
+        candidates = [
+            dash_dir / "dcc" / "plotly.min.js",
+            dash_dir / "dcc" / "async-plotlyjs.js",
+            Path(plotly.__file__).parent / "package_data" / "plotly.min.js",
+        ]
+        for candidate in candidates:
+            if candidate.exists():
+                logger.info("Using local plotly.js from %s", candidate)
+                return candidate.read_text(encoding="utf-8")
+    except (ImportError, AttributeError, FileNotFoundError, PermissionError, OSError, UnicodeDecodeError):
+        pass
+    return ""
@@ -9,22 +9,29 @@ import json
 import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from nanometa_live.core.config.threat_levels import threat_legend
-from nanometa_live.core.export.report_charts import build_charts
-from nanometa_live.core.utils.attribution import is_negative_control
+from nanometa_live.core.export.report_charts import build_charts, local_plotly_js
 from nanometa_live.core.utils.classification_loaders import load_kraken_data
+from nanometa_live.core.utils.file_utils import reflink_or_copy
 from nanometa_live.core.utils.qc_loaders import get_qc_stats
 from nanometa_live.core.utils.sample_detector import (
     get_available_samples,
     get_sample_file_mapping,
     resolve_analysis_directory,
 )
+from nanometa_live.core.watchlist.screening import (
+    ReadMatrix,
+    build_read_matrix,
+    screen_entry,
+)
 from nanometa_live.app.tabs.dashboard_helpers import DEFAULT_LOW_READ_FLOOR
 from nanometa_live.app.utils.callback_helpers import get_classification_stats
 
@@ -59,6 +66,9 @@ _DEFAULT_MAX_RAW_BYTES = 5 * 1024 ** 3  # 5 GiB
 # the raw tree is ever re-used. See the macOS bind-mount note in CLAUDE.md.
 _IGNORE_SIDECARS = shutil.ignore_patterns("._*", ".DS_Store")
 
+# Threads for loading per-sample frames and for copying raw subdirs.
+_LOAD_WORKERS = 4
+_COPY_WORKERS = 4
 
 
 def _order_and_label_by_threat(watched_results: List[Dict[str, Any]]) -> None:
@@ -169,10 +179,7 @@ class ReportGenerator:
         # Per-sample kraken frames are loaded up front so the watchlist screen
         # can attribute each hit to the samples it came from. An aggregate-only
         # screen tells the operator a pathogen is present but not where.
-        sample_frames = {
-            sample: load_kraken_data(self.results_dir, sample)
-            for sample in samples if sample is not None
-        }
+        sample_frames = self._load_sample_frames(samples)
 
         # Watchlist screening, severity-ordered with shared labels attached.
         watched_results = self._screen_watchlist(kraken_all, sample_frames)
@@ -226,6 +233,16 @@ class ReportGenerator:
             "raw_skip_reason": raw_skip_reason,
         }
 
+    def _load_sample_frames(self, samples: List[Optional[str]]) -> Dict[str, pd.DataFrame]:
+        """Per-sample kraken frames, in ``samples`` order, loaded on a small
+        thread pool (file reads and pandas' C parser release the GIL)."""
+        names = [s for s in samples if s is not None]
+        if len(names) < 2:
+            return {s: load_kraken_data(self.results_dir, s) for s in names}
+        with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, len(names))) as pool:
+            frames = pool.map(lambda s: load_kraken_data(self.results_dir, s), names)
+            return dict(zip(names, frames))
+
     def _low_read_floor(self) -> int:
         """Reads below which a negative result has not been earned.
 
@@ -339,31 +356,34 @@ class ReportGenerator:
             })
         return results
 
-    def _match_entry_rows(
-        self,
-        df: pd.DataFrame,
-        match_id: Optional[int],
-        entry_name: Optional[str],
-    ) -> pd.DataFrame:
-        """Rows of *df* belonging to one watchlist entry.
+    def _sample_matrix(
+        self, sample_frames: Optional[Dict[str, pd.DataFrame]]
+    ) -> Optional[ReadMatrix]:
+        """All sample frames as one taxa x samples read matrix.
 
-        Match by the Kraken2 database taxid (``db_taxid`` for GTDB/custom DBs,
-        else the NCBI taxid), then fall back to an exact name match -- the same
-        precedence the dashboard uses.
+        Built once per screen, so each entry's attribution is an index
+        lookup plus an O(samples) array op, instead of a filter and a
+        name-column lower-casing of every frame per entry. The per-sample
+        denominators (classified + unclassified) are computed here once.
         """
-        if df.empty:
-            return df
-        matched = (
-            df[df["taxid"] == match_id] if match_id else df.iloc[0:0]
-        )
-        if matched.empty and entry_name:
-            names_lower = df["name"].astype(str).str.strip().str.lower()
-            matched = df[names_lower == entry_name.strip().lower()]
-        return matched
+        frames = {
+            sample: df for sample, df in (sample_frames or {}).items()
+            if df is not None and not df.empty
+        }
+        if not frames:
+            return None
+        totals = {}
+        for sample, df in frames.items():
+            try:
+                classified, unclassified, _rate = get_classification_stats(df)
+            except (KeyError, ValueError, TypeError):
+                classified = unclassified = 0
+            totals[sample] = classified + unclassified
+        return build_read_matrix(frames, self.config, sample_totals=totals)
 
     def _attribute_entry_to_samples(
         self,
-        sample_frames: Dict[str, pd.DataFrame],
+        samples: Optional[ReadMatrix],
         match_id: Optional[int],
         entry_name: Optional[str],
     ) -> List[Dict[str, Any]]:
@@ -374,28 +394,18 @@ class ReportGenerator:
         second pass over the frames -- see the "Negative controls" contract
         in CLAUDE.md, mirrored here from ``core.utils.attribution`` (the same
         resolver the dashboard's verdict banner uses).
+
+        Matching is by the Kraken2 database taxid (``db_taxid`` for
+        GTDB/custom DBs, else the NCBI taxid), then an exact name match --
+        the same precedence the dashboard uses.
         """
-        rows: List[Dict[str, Any]] = []
-        for sample, df in (sample_frames or {}).items():
-            if df is None or df.empty:
-                continue
-            matched = self._match_entry_rows(df, match_id, entry_name)
-            if matched.empty:
-                continue
-            read_col = "cumul_reads" if "cumul_reads" in df.columns else "reads"
-            reads = int(matched[read_col].sum())
-            if reads <= 0:
-                continue
-            classified, unclassified, _rate = get_classification_stats(df)
-            total = classified + unclassified
-            rows.append({
-                "sample": sample,
-                "reads": reads,
-                "abundance": round((reads / total * 100) if total > 0 else 0, 3),
-                "is_negative_control": is_negative_control(sample, self.config),
-            })
-        rows.sort(key=lambda r: r["reads"], reverse=True)
-        return rows
+        if samples is None:
+            return []
+        screen = screen_entry(samples, samples.entry_reads(match_id, entry_name))
+        totals = samples.sample_totals
+        abundance = np.where(
+            totals > 0, screen.reads / np.maximum(totals, 1) * 100, 0.0)
+        return screen.rows(abundance, digits=3)
 
     def _screen_watchlist(
         self,
@@ -415,6 +425,11 @@ class ReportGenerator:
         raised ``AttributeError`` on the first entry, was swallowed by the
         broad except, and left every exported report showing an empty,
         all-clear screen even when watchlist pathogens were present.
+
+        The aggregate frame and the per-sample frames are each read into a
+        :class:`ReadMatrix` once (``core.watchlist.screening``); entries are
+        then resolved against those, so the screen costs O(distinct taxa)
+        plus O(entries x samples) array work.
         """
         results: List[Dict[str, Any]] = []
         try:
@@ -431,12 +446,11 @@ class ReportGenerator:
             # the dashboard tiles -- not the per-rank reads column.
             classified, unclassified, _rate = get_classification_stats(kraken_df)
             total = classified + unclassified
-            read_col = "cumul_reads" if "cumul_reads" in kraken_df.columns else "reads"
+            aggregate = build_read_matrix({"": kraken_df}, self.config)
+            samples = self._sample_matrix(sample_frames)
 
             for entry in active_entries.values():
-                row = self._screen_watchlist_entry(
-                    entry, kraken_df, sample_frames, read_col, total,
-                )
+                row = self._screen_watchlist_entry(entry, aggregate, samples, total)
                 if row is not None:
                     results.append(row)
 
@@ -448,12 +462,11 @@ class ReportGenerator:
     def _screen_watchlist_entry(
         self,
         entry: Any,
-        kraken_df: pd.DataFrame,
-        sample_frames: Optional[Dict[str, pd.DataFrame]],
-        read_col: str,
+        aggregate: ReadMatrix,
+        samples: Optional[ReadMatrix],
         total: int,
     ) -> Optional[Dict[str, Any]]:
-        """Screen ONE watchlist entry against ``kraken_df``; return its report
+        """Screen ONE watchlist entry against the run; return its report
         row, or ``None`` on failure.
 
         Isolated per entry on purpose: one malformed entry (missing field,
@@ -468,14 +481,11 @@ class ReportGenerator:
             threat_level = threat.value if hasattr(threat, "value") else str(threat)
 
             match_id = getattr(entry, "db_taxid", None) or entry.taxid
-            matched = self._match_entry_rows(kraken_df, match_id, entry.name)
-
-            reads = int(matched[read_col].sum()) if not matched.empty else 0
+            reads = int(aggregate.entry_reads(match_id, entry.name)[0])
             abundance = (reads / total * 100) if total > 0 else 0
             per_sample = (
-                self._attribute_entry_to_samples(
-                    sample_frames, match_id, entry.name
-                ) if reads > 0 else []
+                self._attribute_entry_to_samples(samples, match_id, entry.name)
+                if reads > 0 else []
             )
 
             # Negative controls are reported alongside a detection, never
@@ -562,27 +572,9 @@ class ReportGenerator:
         if self._plotly_js is not None:
             return self._plotly_js
 
-        # Try to find a local copy bundled with Dash
-        try:
-            import dash
-            dash_dir = Path(dash.__file__).parent
-            # Dash bundles plotly.js in its package
-            candidates = [
-                dash_dir / "dcc" / "plotly.min.js",
-                dash_dir / "dcc" / "async-plotlyjs.js",
-            ]
-            # Also check plotly's own bundled JS
-            import plotly
-            plotly_dir = Path(plotly.__file__).parent
-            candidates.append(plotly_dir / "package_data" / "plotly.min.js")
-
-            for candidate in candidates:
-                if candidate.exists():
-                    self._plotly_js = candidate.read_text(encoding="utf-8")
-                    logger.info("Using local plotly.js from %s", candidate)
-                    return self._plotly_js
-        except (ImportError, AttributeError, FileNotFoundError, PermissionError, OSError, UnicodeDecodeError):
-            pass
+        self._plotly_js = local_plotly_js()
+        if self._plotly_js:
+            return self._plotly_js
 
         # No local bundle. In offline mode a CDN reference is useless (and a
         # dangling external request when the report is opened), so the caller
@@ -714,18 +706,25 @@ class ReportGenerator:
             return [], skip_reason
 
         raw_dir = os.path.join(output_dir, "raw")
-        copied: List[str] = []
-        failed: List[str] = []
-        for subdir in present:
+
+        def copy_subdir(subdir: str) -> bool:
             src = os.path.join(self.results_dir, subdir)
             dst = os.path.join(raw_dir, subdir)
             try:
-                shutil.copytree(src, dst, dirs_exist_ok=True, ignore=_IGNORE_SIDECARS)
-                copied.append(subdir)
+                shutil.copytree(src, dst, dirs_exist_ok=True, ignore=_IGNORE_SIDECARS,
+                                copy_function=reflink_or_copy)
                 logger.info("Copied %s to %s", src, dst)
+                return True
             except (FileNotFoundError, PermissionError, OSError, shutil.Error) as e:
                 logger.exception("Could not copy %s: %s", src, e)
-                failed.append(subdir)
+                return False
+
+        # Subdirs copy concurrently (the copy is I/O-bound), and each file
+        # is a reflink where the filesystem supports one.
+        with ThreadPoolExecutor(max_workers=max(1, min(_COPY_WORKERS, len(present)))) as pool:
+            ok = list(pool.map(copy_subdir, present))
+        copied = [s for s, done in zip(present, ok) if done]
+        failed = [s for s, done in zip(present, ok) if not done]
 
         partial_reason = None
         if failed:
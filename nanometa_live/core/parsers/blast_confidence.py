@@ -14,7 +14,10 @@ and a caveat is attached instead.
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+# Below this median k-mer hit fraction a Kraken2 call is weakly anchored.
+KMER_SUPPORT_FLOOR = 0.05
 
 
 def classification_confidence(
@@ -23,6 +26,7 @@ def classification_confidence(
     subject_agreement: float,
     n_reads: int,
     is_concentrated: bool = False,
+    kmer_support: Optional[float] = None,
 ) -> Dict[str, object]:
     """Return a confidence verdict for a BLAST-validated (sample, taxid).
 
@@ -35,6 +39,9 @@ def classification_confidence(
         n_reads: Number of validated reads supporting the call.
         is_concentrated: True for an amplicon / concentrated-coverage locus,
             where low genome-wide breadth is expected and not penalised.
+        kmer_support: Median fraction of each read's k-mers that Kraken2
+            matched to this taxid (0-1), from the per-read profiles. Optional;
+            a call resting on very few k-mers is capped at moderate.
 
     Returns:
         ``{"level": "high"|"moderate"|"low", "score": float, "reasons": [str]}``
@@ -89,6 +96,15 @@ def classification_confidence(
     if n_reads < 10:
         reasons.append(f"Limited read support ({n_reads} reads).")
 
+    # k-mer support: Kraken2's own evidence, independent of BLAST.
+    if kmer_support is not None:
+        if kmer_support < KMER_SUPPORT_FLOOR:
+            reasons.append(f"Weak k-mer support ({kmer_support * 100:.0f}% of k-mers "
+                           "match this taxon); the classification may be borrowed "
+                           "from a relative.")
+        else:
+            reasons.append(f"k-mer support {kmer_support * 100:.0f}% of k-mers.")
+
     components = [id_score, subj_score]
     if breadth_score is not None:
         components.append(breadth_score)
@@ -104,5 +120,7 @@ def classification_confidence(
     # Cap at moderate when read support is thin, regardless of score.
     if n_reads < 10 and level == "high":
         level = "moderate"
+    if kmer_support is not None and kmer_support < KMER_SUPPORT_FLOOR and level == "high":
+        level = "moderate"
 
     return {"level": level, "score": round(score, 3), "reasons": reasons}
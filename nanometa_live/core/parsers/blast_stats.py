@@ -27,6 +27,8 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+from nanometa_live.core.utils.json_ingest import cached_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,8 +40,7 @@ def parse_blast_stats_json(filepath: Path) -> Optional[dict]:
     than losing the result.
     """
     try:
-        with open(filepath, "r") as fh:
-            data = json.load(fh)
+        data = cached_json(filepath)
     except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
         logger.warning("Unreadable BLAST stats %s: %s", filepath, exc)
         return None
@@ -39,14 +39,26 @@ Author: Nanometa Live Development Team
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import pandas as pd
 
+from nanometa_live.core.parsers.validation_cache import (
+    blast_tsv_summary,
+    copy_results,
+    results_cache,
+)
+from nanometa_live.core.utils.json_ingest import cached_json
+from nanometa_live.core.utils.metrics import cache_lookup, timed_loader
+
 logger = logging.getLogger(__name__)
 
+_VALIDATION_HIT = cache_lookup("validation", "hit")
+_VALIDATION_MISS = cache_lookup("validation", "miss")
+
 
 class ValidationStatus(Enum):
     """Validation status categories for pathogen confirmation."""
@@ -244,31 +256,52 @@ class ValidationParser:
         else:
             logger.debug(f"No validation directory found in {self.results_dir}")
 
-        # Per-instance results cache, invalidated on validation-dir mtime
-        # change. Closes P1-T06 from
-        # docs/audit-2026-04-28-throughput-gui.md, where
-        # validation_tab.load_validation_data() called has_validation_data
-        # + get_validation_results + get_validation_summary inside one
-        # tick -- three independent walks of the validation dir at
-        # 24-barcode scale (100-200 file opens per tick). With the
-        # cache, the second and third call now reuse the parsed list
-        # if the directory's mtime is unchanged.
-        self._results_cache_mtime: Optional[float] = None
-        self._results_cache: Optional[List["ValidationResult"]] = None
-
-    def _validation_dir_fingerprint(self) -> Optional[float]:
-        """Latest mtime under ``validation_dir``; ``None`` when missing."""
+        # Results are cached process-wide (core/parsers/validation_cache.py),
+        # keyed by this directory pair and invalidated on a fingerprint
+        # change. Closes P1-T06 from docs/audit-2026-04-28-throughput-gui.md,
+        # where validation_tab.load_validation_data() called
+        # has_validation_data + get_validation_results +
+        # get_validation_summary inside one tick -- three independent walks
+        # of the validation dir at 24-barcode scale. Sharing the cache across
+        # instances also lets the dashboard's validation lookup and the
+        # Validation tab reuse one parse.
+        self._cache_key = (str(self.results_dir), str(self.validation_dir))
+
+    @property
+    def _results_cache(self) -> Optional[List["ValidationResult"]]:
+        entry = results_cache.entry(self._cache_key)
+        return entry[1] if entry else None
+
+    @property
+    def _results_cache_mtime(self):
+        entry = results_cache.entry(self._cache_key)
+        return entry[0] if entry else None
+
+    def _validation_dir_fingerprint(self) -> Optional[Tuple[int, int, int]]:
+        """``(newest mtime_ns, entries, total bytes)`` under ``validation_dir``.
+
+        ``None`` when the directory is missing. The entry count catches a
+        deleted file and the byte total catches a rewrite landing within
+        the same mtime tick.
+        """
         if not self.validation_dir or not self.validation_dir.exists():
             return None
+        latest = count = size = 0
+
+        def fold(path: Path) -> None:
+            nonlocal latest, count, size
+            try:
+                st = path.stat()
+            except OSError:
+                return
+            latest = max(latest, st.st_mtime_ns)
+            count += 1
+            size += st.st_size
+
         try:
-            latest = self.validation_dir.stat().st_mtime
+            fold(self.validation_dir)
             for p in self.validation_dir.iterdir():
-                try:
-                    m = p.stat().st_mtime
-                    if m > latest:
-                        latest = m
-                except OSError:
-                    continue
+                fold(p)
             # The authoritative aggregate JSON is written one level up at
             # validation/validation_results.json (the loader prefers it), but
             # validation_dir often resolves to validation/blast or
@@ -279,13 +312,7 @@ class ValidationParser:
                 self.validation_dir.parent / "validation_results.json",
                 self.results_dir / "validation" / "validation_results.json",
             ):
-                try:
-                    if agg.exists():
-                        m = agg.stat().st_mtime
-                        if m > latest:
-                            latest = m
-                except OSError:
-                    continue
+                fold(agg)
             # Fold in the per-pair method files as well. In realtime mode the
             # cumulative aggregator rewrites validation/{blast,minimap2}
             # files IN PLACE every batch: the file mtime advances but no
@@ -293,24 +320,23 @@ class ValidationParser:
             # alone goes stale -- and since nanometanf defers the aggregate
             # JSON to end of session by default, these files are the only
             # mid-run freshness signal. Both dirs are flat and small (one
-            # file per (sample, taxid)), so this stays cheap.
+            # file per (sample, taxid)), so this stays cheap. On-demand
+            # results supersede pipeline ones, so their directory counts too:
+            # the cache outlives any one parser instance.
+            from nanometa_live.core.parsers.minimap2_stats import minimap2_stats_dirs
             for method_dir in (
                 self.results_dir / "validation" / "blast",
-                self.results_dir / "validation" / "minimap2",
+                *minimap2_stats_dirs(self.results_dir, self.validation_dir),
+                self.results_dir / "on_demand_validation",
             ):
                 if not method_dir.is_dir():
                     continue
                 try:
                     for p in method_dir.iterdir():
-                        try:
-                            m = p.stat().st_mtime
-                            if m > latest:
-                                latest = m
-                        except OSError:
-                            continue
+                        fold(p)
                 except OSError:
                     continue
-            return latest
+            return latest, count, size
         except OSError:
             return None
 
@@ -361,8 +387,7 @@ class ValidationParser:
             ValidationResult or None if parsing fails
         """
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = cached_json(filepath)
 
             result = ValidationResult(
                 sample_id=data.get('sample_id', ''),
@@ -426,71 +451,53 @@ class ValidationParser:
             if not filepath.exists() or filepath.stat().st_size == 0:
                 result.status = ValidationStatus.NO_DATA
                 return result
-
-            # Read BLAST tabular output.
-            # nanometanf BLASTN_VALIDATION uses outfmt 6 with 15 columns:
-            #   qseqid sseqid pident length mismatch gapopen qstart qend
-            #   sstart send evalue bitscore qlen slen qcovs
-            # Legacy files may have only the standard 12 columns.  We
-            # detect the actual column count and assign names accordingly
-            # to avoid misalignment (pandas silently mangles data when
-            # fewer names are given than columns present).
-            _cols_12 = [
-                'qseqid', 'sseqid', 'pident', 'length', 'mismatch', 'gapopen',
-                'qstart', 'qend', 'sstart', 'send', 'evalue', 'bitscore',
-            ]
-            _cols_15 = _cols_12 + ['qlen', 'slen', 'qcovs']
-
-            # Read first, then name columns from the ACTUAL width. Peeking one
-            # line to pick 12-vs-15 names is fragile (a leading blank line shifts
-            # every column); read_csv skips blank lines so df.shape[1] is reliable.
-            df = pd.read_csv(filepath, sep='\t', header=None)
-            if df.empty or df.shape[1] < 12:
-                result.status = ValidationStatus.NO_DATA
-                return result
-            ncols = df.shape[1]
-            base = _cols_15 if ncols >= 15 else _cols_12
-            df.columns = base[:ncols] + [f"col_{i}" for i in range(len(base), ncols)]
-
-            # Count unique validated reads
-            unique_reads = df['qseqid'].nunique()
-            result.validated_reads = unique_reads
-
-            # Calculate percentage if total_reads provided. Clamp to 100: BLAST
-            # can validate more distinct reads than a stale/low Kraken total.
-            if total_reads > 0:
-                result.percent_validated = min(100.0, (unique_reads / total_reads) * 100)
-            else:
-                # Unknown denominator: leave the percentage at 0 so
-                # determine_status reports UNCERTAIN rather than CONFIRMED.
-                # Claiming 100% here turned any nonzero hit count into a
-                # confirmed detection regardless of how many reads Kraken2
-                # actually assigned (audit 2026-08-16, finding L3).
-                result.percent_validated = 0.0
-
-            # Identity statistics
-            result.percent_identity_mean = float(df['pident'].mean())
-            result.percent_identity_min = float(df['pident'].min())
-            result.percent_identity_max = float(df['pident'].max())
-
-            # Alignment length statistics
-            result.alignment_length_mean = float(df['length'].mean())
-
-            # Determine status
-            result.status = result.determine_status()
-
-            logger.debug(
-                f"Parsed BLAST tabular for {sample_id}/{taxid}: "
-                f"{unique_reads} validated reads, {result.percent_identity_mean:.1f}% identity"
-            )
-            return result
-
-        except (FileNotFoundError, PermissionError, OSError, UnicodeDecodeError, pd.errors.ParserError, pd.errors.EmptyDataError, KeyError, ValueError, TypeError) as e:
+        except OSError as e:
             logger.exception(f"Error parsing BLAST tabular {filepath}: {e}")
             result.errors.append(str(e))
             result.status = ValidationStatus.FAILED
             return result
 
+        # nanometanf BLASTN_VALIDATION uses outfmt 6 with 15 columns (qlen,
+        # slen, qcovs appended); legacy files have the standard 12. The
+        # summary is read once per file version and shared process-wide
+        # (core/parsers/validation_cache.py).
+        summary = blast_tsv_summary(filepath)
+        if summary.error:
+            result.errors.append(summary.error)
+            result.status = ValidationStatus.FAILED
+            return result
+        if summary.no_data:
+            result.status = ValidationStatus.NO_DATA
+            return result
+
+        # Count unique validated reads
+        unique_reads = summary.validated_reads
+        result.validated_reads = unique_reads
+
+        # Calculate percentage if total_reads provided. Clamp to 100: BLAST
+        # can validate more distinct reads than a stale/low Kraken total.
+        if total_reads > 0:
+            result.percent_validated = min(100.0, (unique_reads / total_reads) * 100)
+        else:
+            # Unknown denominator: leave the percentage at 0 so
+            # determine_status reports UNCERTAIN rather than CONFIRMED.
+            # Claiming 100% here turned any nonzero hit count into a
+            # confirmed detection regardless of how many reads Kraken2
+            # actually assigned (audit 2026-08-16, finding L3).
+            result.percent_validated = 0.0
+
+        result.percent_identity_mean = summary.identity_mean
+        result.percent_identity_min = summary.identity_min
+        result.percent_identity_max = summary.identity_max
+        result.alignment_length_mean = summary.alignment_length_mean
+        result.status = result.determine_status()
+
+        logger.debug(
+            f"Parsed BLAST tabular for {sample_id}/{taxid}: "
+            f"{unique_reads} validated reads, {result.percent_identity_mean:.1f}% identity"
+        )
+        return result
+
     def _enrich_blast_identity_range(self, results: List['ValidationResult']) -> None:
         """Fill identity min/max + mean alignment length for BLAST results.
 
@@ -541,8 +548,7 @@ class ValidationParser:
         """
         results = []
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = cached_json(filepath)
 
             timestamp = data.get('timestamp', '')
             method_default = data.get('validation_method', 'blast')
@@ -626,6 +632,7 @@ class ValidationParser:
             logger.exception(f"Error parsing nanometanf aggregate JSON {filepath}: {e}")
             return []
 
+    @timed_loader("get_validation_results")
     def get_validation_results(
         self,
         sample: Optional[str] = None,
@@ -648,35 +655,50 @@ class ValidationParser:
             from nanometa_live.core.parsers.validation_batch import collect_batch_results
             return collect_batch_results(self.results_dir, batch_id, sample, taxid, self.parse_blast_tabular)
 
-        # Cache fast-path: if the validation directory has not changed
-        # since the last full parse, reuse the cached unfiltered list
-        # and apply the (sample, taxid) filter in-memory.
+        # The unfiltered list is cached process-wide, so every parser for
+        # this directory -- dashboard lookup, Validation tab, summary --
+        # shares one parse; the (sample, taxid) filter is applied in memory.
+        # A miss re-reads only the files that changed (validation_cache).
         fingerprint = self._validation_dir_fingerprint()
-        if (
-            fingerprint is not None
-            and self._results_cache is not None
-            and self._results_cache_mtime == fingerprint
-        ):
-            cached = self._results_cache
-            if sample is None and taxid is None:
-                return list(cached)
-            return [
-                r for r in cached
-                if (sample is None or r.sample_id == sample)
-                and (taxid is None or r.taxid == taxid)
-            ]
-
-        # Full parse path. When no filters were requested we cache the
-        # result so the next has_validation_data + get_validation_results
-        # + get_validation_summary triple inside the same tick reuses
-        # one parse rather than three.
-        cache_this_call = sample is None and taxid is None
+        cached = (results_cache.get(self._cache_key, fingerprint)
+                  if fingerprint is not None else None)
+        if cached is not None:
+            _VALIDATION_HIT.inc()
+        else:
+            _VALIDATION_MISS.inc()
+            cached = self._collect_shared_results(fingerprint)
+            if fingerprint is not None:
+                results_cache.put(self._cache_key, fingerprint, cached)
+        return copy_results([
+            r for r in cached
+            if (sample is None or r.sample_id == sample)
+            and (taxid is None or r.taxid == taxid)
+        ])
+
+    def _collect_shared_results(self, fingerprint) -> List[ValidationResult]:
+        """``_collect_results()``, parsed once across worker processes.
+
+        Only when ``NANOMETA_SHARED_CACHE`` is set; see ``shared_frames``.
+        """
+        from nanometa_live.core.utils.shared_frames import shared_store
+
+        store = shared_store()
+        if store is None or fingerprint is None:
+            return self._collect_results()
+        key = "validation:" + "|".join(os.path.abspath(p) for p in self._cache_key)
+        return store.value(key, repr(fingerprint), self._collect_results)
+
+    def _collect_results(
+        self, sample: Optional[str] = None, taxid: Optional[int] = None,
+    ) -> List[ValidationResult]:
+        """Merge every validation source into one result list.
+
+        Each source honours the optional filters; ``get_validation_results``
+        calls this unfiltered and filters the cached list.
+        """
         results = []
 
         if not self.validation_dir or not self.validation_dir.exists():
-            if cache_this_call:
-                self._results_cache = []
-                self._results_cache_mtime = fingerprint
             return results
 
         # Build candidate paths for the aggregate JSON, in priority order.
@@ -896,9 +918,6 @@ class ValidationParser:
         self._attach_genome_breadth(results)
 
         logger.info(f"Retrieved {len(results)} validation results")
-        if cache_this_call:
-            self._results_cache = list(results)
-            self._results_cache_mtime = fingerprint
         return results
 
     def _attach_genome_breadth(self, results) -> None:
@@ -0,0 +1,227 @@
+"""
+Multi-resolution coverage depth for zoomable plots.
+
+The coverage depth plot used to smooth the whole per-base depth array with
+a moving average and keep about 5,000 points. Zooming into a 20 kb window
+of a 5 Mb genome then showed interpolated noise, and every species switch
+recomputed the convolution.
+
+A :class:`CoveragePyramid` is built once per PAF (and MAPQ filter). Level 0
+is the depth array itself; each level above it holds the min, sum and max
+of ``FANOUT`` consecutive blocks of the level below. :meth:`tile` answers
+"min / mean / max depth in ``width`` bins over ``[start, end)``" from the
+coarsest level whose blocks are no wider than one bin, so a request
+touches fewer than ``FANOUT * width`` blocks at any zoom, and a window
+narrower than ``width`` base pairs is served at base-pair resolution.
+
+The pyramid also keeps the depth histogram (``depth_counts``), which is all
+the cumulative-coverage curve and the depth distribution need.
+
+Pyramids are cached per ``(PAF, min_mapq)`` while the file's (mtime_ns,
+size) holds, and published under a token so the tile endpoint
+(``app/utils/coverage_tiles.py``) can serve windows without the client
+knowing any paths. A token names the PAF and filter, not the pyramid, so a
+pyramid the global cache cap evicted is rebuilt on its next tile request.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from nanometa_live.core.parsers.paf_coverage_parser import (
+    CoverageData,
+    aggregate_contig_coverage,
+    parse_paf_coverage,
+)
+from nanometa_live.core.parsers.validation_cache import FileLedger
+from nanometa_live.core.utils.bounded_cache import BoundedCache
+
+logger = logging.getLogger(__name__)
+
+#: Blocks merged per level.
+FANOUT = 4
+#: Pyramids kept in memory. A 5 Mb genome costs about 35 MB (depth array
+#: plus levels), so this stays small.
+PYRAMID_CACHE_MAX = 8
+#: Largest ``width`` a tile request may ask for.
+MAX_TILE_WIDTH = 10_000
+
+_ledger = FileLedger(max_entries=PYRAMID_CACHE_MAX, name="coverage_pyramid",
+                     sizeof=lambda pyramid: pyramid.nbytes if pyramid is not None else 0)
+# token -> (PAF path, min_mapq)
+_published = BoundedCache("coverage_tokens", max_entries=PYRAMID_CACHE_MAX)
+
+
+def _fold(values: np.ndarray, fill, op, dtype=None) -> np.ndarray:
+    """``op`` over each run of ``FANOUT`` values, padding the last with ``fill``.
+
+    Combining strided columns is several times faster than reducing along a
+    length-``FANOUT`` axis.
+    """
+    pad = -len(values) % FANOUT
+    if pad:
+        values = np.concatenate([values, np.full(pad, fill, dtype=values.dtype)])
+    out = values[0::FANOUT].astype(dtype or values.dtype)
+    for k in range(1, FANOUT):
+        op(out, values[k::FANOUT], out=out)
+    return out
+
+
+class CoveragePyramid:
+    """Per-level min / sum / max depth over one (concatenated) reference."""
+
+    def __init__(self, coverage: CoverageData, token: str = ""):
+        self.coverage = coverage
+        self.token = token
+        self.ref_length = int(len(coverage.depth_array))
+        depth = np.asarray(coverage.depth_array)
+        # (block size, mins, sums, maxs); level 0 shares the depth array.
+        self.levels: List[Tuple[int, np.ndarray, np.ndarray, np.ndarray]] = [
+            (1, depth, depth, depth)]
+        block, mins, sums, maxs = 1, depth, depth, depth
+        top = np.iinfo(depth.dtype).max if depth.dtype.kind in "ui" else np.inf
+        while len(mins) > 1:
+            mins = _fold(mins, top, np.minimum)
+            maxs = _fold(maxs, 0, np.maximum)
+            sums = _fold(sums, 0, np.add, np.float64)
+            block *= FANOUT
+            self.levels.append((block, mins, sums, maxs))
+        self.depth_counts = (np.bincount(depth)
+                             if self.ref_length else np.zeros(1, dtype=np.int64))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the depth array, the levels above it and the histogram."""
+        above = sum(a.nbytes for _, *arrays in self.levels[1:] for a in arrays)
+        return int(self.levels[0][1].nbytes + above + self.depth_counts.nbytes)
+
+    def _level_for(self, bin_bp: float) -> int:
+        """Coarsest level whose blocks are no wider than ``bin_bp``."""
+        level = 0
+        while level + 1 < len(self.levels) and self.levels[level + 1][0] <= bin_bp:
+            level += 1
+        return level
+
+    def tile(self, start: int, end: int, width: int) -> Dict:
+        """Min / mean / max depth in at most ``width`` bins over ``[start, end)``.
+
+        Bins are aligned to the chosen level's blocks, so the window may grow
+        by less than one bin at either edge. ``x`` is each bin's first base.
+        """
+        start = max(0, min(int(start), self.ref_length))
+        end = max(start, min(int(end), self.ref_length))
+        width = max(1, min(int(width), MAX_TILE_WIDTH))
+        if end == start:
+            return {"start": start, "end": end, "block": 1,
+                    "x": [], "min": [], "mean": [], "max": []}
+        level = self._level_for((end - start) / width)
+        block, mins, sums, maxs = self.levels[level]
+        first, last = start // block, -(-end // block)
+        index = np.arange(first, last)
+        lengths = np.minimum(block, self.ref_length - index * block)
+        if last - first > width:
+            edges = np.unique(np.linspace(0, last - first, width + 1).astype(np.int64)[:-1])
+        else:
+            edges = np.arange(last - first)
+        window = slice(first, last)
+        total = np.add.reduceat(np.asarray(sums[window], dtype=np.float64), edges)
+        return {
+            "start": int(first * block),
+            "end": int(min(last * block, self.ref_length)),
+            "block": int(block),
+            "x": (index[edges] * block).tolist(),
+            "min": np.minimum.reduceat(mins[window], edges).tolist(),
+            "mean": (total / np.add.reduceat(lengths, edges)).tolist(),
+            "max": np.maximum.reduceat(maxs[window], edges).tolist(),
+        }
+
+    def view(self, start: int, end: int, width: int, overview: int = 0) -> Dict:
+        """:meth:`tile` of ``[start, end)`` between coarse tiles of the rest.
+
+        The plot's range slider shows the whole reference, so a zoomed view
+        keeps ``overview`` bins across the genome outside the window.
+        """
+        fine = self.tile(start, end, width)
+        if not overview or not self.ref_length:
+            return fine
+
+        def coarse(lo, hi):
+            bins = int(np.ceil(overview * (hi - lo) / self.ref_length))
+            return self.tile(lo, hi, bins)
+
+        # Coarse blocks are aligned outward; drop the ones the window covers.
+        left, right = coarse(0, fine["start"]), coarse(fine["end"], self.ref_length)
+        keep_left = sum(1 for x in left["x"] if x < fine["start"])
+        skip_right = sum(1 for x in right["x"] if x < fine["end"])
+        merged = dict(fine)
+        for key in ("x", "min", "mean", "max"):
+            merged[key] = left[key][:keep_left] + fine[key] + right[key][skip_right:]
+        return merged
+
+    def count_at_or_above(self, thresholds: np.ndarray) -> np.ndarray:
+        """Positions with depth >= each threshold."""
+        tail = np.concatenate([np.cumsum(self.depth_counts[::-1])[::-1], [0]])
+        return tail[np.clip(np.asarray(thresholds, dtype=np.int64), 0, len(tail) - 1)]
+
+    def covered_percentile(self, q: float) -> float:
+        """``np.percentile`` of the covered (depth > 0) positions, from the histogram."""
+        counts = self.depth_counts[1:]
+        n = int(counts.sum())
+        if n == 0:
+            return 0.0
+        cumulative = np.cumsum(counts)
+        rank = (n - 1) * q / 100.0
+        lo, frac = int(np.floor(rank)), rank - np.floor(rank)
+        value_lo = int(np.searchsorted(cumulative, lo, side="right")) + 1
+        value_hi = int(np.searchsorted(cumulative, min(lo + 1, n - 1), side="right")) + 1
+        return value_lo + (value_hi - value_lo) * frac
+
+
+def _build(path: Path, min_mapq: int) -> Optional[CoveragePyramid]:
+    cov_dict = parse_paf_coverage(path, min_mapq=min_mapq)
+    if not cov_dict:
+        return None
+    try:
+        st = os.stat(path)
+        signature = f"{os.fspath(path)}|{st.st_mtime_ns}|{st.st_size}|{min_mapq}"
+    except OSError:
+        signature = f"{os.fspath(path)}|{min_mapq}"
+    token = hashlib.sha1(signature.encode()).hexdigest()[:16]
+    return CoveragePyramid(aggregate_contig_coverage(cov_dict), token=token)
+
+
+def load_coverage_pyramid(paf_path, min_mapq: int = 0) -> Optional[CoveragePyramid]:
+    """The pyramid for a PAF, or None when no alignment passes ``min_mapq``.
+
+    Rebuilt only when the PAF changes; the result is published for
+    :func:`published_pyramid`.
+    """
+    pyramid = _ledger.get(Path(paf_path), ("coverage_pyramid", min_mapq),
+                          lambda path: _build(path, min_mapq))
+    if pyramid is not None:
+        _published[pyramid.token] = (os.fspath(paf_path), min_mapq)
+    return pyramid
+
+
+def published_pyramid(token: str) -> Optional[CoveragePyramid]:
+    """A pyramid recently returned by :func:`load_coverage_pyramid`.
+
+    None once the PAF has changed, since the token named its old contents.
+    """
+    source = _published.get(token)
+    if source is None:
+        return None
+    paf_path, min_mapq = source
+    pyramid = _ledger.get(Path(paf_path), ("coverage_pyramid", min_mapq),
+                          lambda path: _build(path, min_mapq))
+    return pyramid if pyramid is not None and pyramid.token == token else None
+
+
+def clear_coverage_pyramids() -> None:
+    """Drop cached and published pyramids."""
+    _ledger.clear()
+    _published.clear()
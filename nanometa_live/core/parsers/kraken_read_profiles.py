@@ -0,0 +1,509 @@
+"""
+Streaming reducer for Kraken2 per-read output.
+
+Kraken2's per-read output has one line per read::
+
+    C  <read id>  <taxid>  <length>  <taxid:k-mers taxid:k-mers ... A:k-mers>
+
+Until now the app only read it in full when an operator asked for one
+taxid (``ReadExtractor``). This module tails the files as batches complete
+and keeps, per taxid:
+
+- read count and summed read length;
+- a read-length histogram, log-scale bins (``LENGTH_BINS_PER_DECADE``);
+- a histogram of the k-mer hit fraction: k-mers mapped to the assigned
+  taxid over all non-ambiguous k-mers. This is the exact-taxid part of
+  Kraken2's confidence score (which also counts k-mers of descendant
+  taxa), so it is a lower bound on it.
+
+Memory is O(distinct taxa x bins), independent of the read count.
+
+A chunk of whole lines is reduced with numpy in one pass: line, tab, space
+and colon offsets locate every field, and integers are decoded in bulk. A
+chunk the vectorised path cannot take (paired-end ``len|len`` lengths,
+read ids containing tabs) falls back to a per-line parser that produces the
+same numbers. ``scripts/perf/kraken_reads_bench.py`` measures both.
+
+Per-sample profiles are persisted as ``<results>/.nanometa.read_profiles/
+<sample>.json`` together with the byte offset consumed in each file, so a
+refresh reads only bytes appended since the last one, across restarts too.
+A file that shrank or was replaced causes a rebuild of that sample.
+"""
+
+import logging
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from nanometa_live.core.utils.bounded_cache import BoundedCache
+from nanometa_live.core.utils.sample_state import SampleStateFile
+
+# Log-scale read-length bins: 20 per decade from 1 bp to 1 Mbp (~12% wide).
+LENGTH_BINS_PER_DECADE = 20
+LENGTH_DECADES = 6
+N_LENGTH_BINS = LENGTH_BINS_PER_DECADE * LENGTH_DECADES
+# k-mer hit fraction bins, 5% wide.
+N_CONFIDENCE_BINS = 20
+
+PROFILE_DIRNAME = ".nanometa.read_profiles"
+PROFILE_SCHEMA = 1
+# Bytes reduced per pass. Bounds the transient numpy index arrays.
+CHUNK_BYTES = 8 * 1024 * 1024
+
+# Whole-sample per-read outputs, in ReadExtractor's preference order.
+SAMPLE_OUTPUT_NAMES = (
+    "{s}.kraken2", "{s}.kraken2.txt", "{s}.kraken2.output.txt",
+    "{s}.kraken2.output", "{s}_kraken2.output",
+)
+BATCH_OUTPUT_GLOBS = ("{s}_batch*.kraken2.txt", "{s}_batch*.kraken2.output.txt")
+MERGED_OUTPUT_NAME = "{s}.merged.kraken2.output.txt"
+_OUTPUT_SUFFIXES = (
+    ".merged.kraken2.output.txt", ".kraken2.output.txt", ".kraken2.output",
+    "_kraken2.output", ".kraken2.txt", ".kraken2",
+)
+
+
+def length_bin(lengths: np.ndarray) -> np.ndarray:
+    """Histogram bin of each read length."""
+    logs = np.log10(np.maximum(lengths, 1).astype(np.float64))
+    return np.minimum((logs * LENGTH_BINS_PER_DECADE).astype(np.int64), N_LENGTH_BINS - 1)
+
+
+def length_bin_edges() -> np.ndarray:
+    """The ``N_LENGTH_BINS + 1`` bin edges in bp."""
+    return 10.0 ** (np.arange(N_LENGTH_BINS + 1) / LENGTH_BINS_PER_DECADE)
+
+
+def _confidence_bin(fractions: np.ndarray) -> np.ndarray:
+    return np.minimum((fractions * N_CONFIDENCE_BINS).astype(np.int64), N_CONFIDENCE_BINS - 1)
+
+
+def _hist_quantile(counts: np.ndarray, edges: np.ndarray, q: float, log: bool) -> float:
+    """Quantile ``q`` of a histogram, interpolated within the bin."""
+    total = counts.sum()
+    if total <= 0:
+        return 0.0
+    cum = np.cumsum(counts)
+    i = int(np.searchsorted(cum, q * total))
+    below = cum[i - 1] if i > 0 else 0
+    frac = (q * total - below) / counts[i] if counts[i] else 0.0
+    lo, hi = edges[i], edges[i + 1]
+    if log:
+        return float(10 ** (np.log10(lo) + frac * (np.log10(hi) - np.log10(lo))))
+    return float(lo + frac * (hi - lo))
+
+
+class TaxonProfiles:
+    """Per-taxid read counts, length and k-mer hit-fraction histograms."""
+
+    def __init__(self):
+        self._row: Dict[int, int] = {}
+        self.taxids = np.zeros(0, dtype=np.int64)
+        self.reads = np.zeros(0, dtype=np.int64)
+        self.bases = np.zeros(0, dtype=np.int64)
+        self.length_hist = np.zeros((0, N_LENGTH_BINS), dtype=np.int64)
+        self.confidence_hist = np.zeros((0, N_CONFIDENCE_BINS), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._row)
+
+    def _rows(self, taxids: np.ndarray) -> np.ndarray:
+        """Row of each taxid, growing the tables for unseen ones."""
+        new = [t for t in taxids.tolist() if t not in self._row]
+        if new:
+            start = len(self._row)
+            for i, t in enumerate(new):
+                self._row[t] = start + i
+            grow = len(new)
+            self.taxids = np.concatenate([self.taxids, np.asarray(new, dtype=np.int64)])
+            self.reads = np.concatenate([self.reads, np.zeros(grow, dtype=np.int64)])
+            self.bases = np.concatenate([self.bases, np.zeros(grow, dtype=np.int64)])
+            self.length_hist = np.vstack(
+                [self.length_hist, np.zeros((grow, N_LENGTH_BINS), dtype=np.int64)])
+            self.confidence_hist = np.vstack(
+                [self.confidence_hist, np.zeros((grow, N_CONFIDENCE_BINS), dtype=np.int64)])
+        return np.fromiter((self._row[t] for t in taxids.tolist()), dtype=np.int64,
+                           count=len(taxids))
+
+    def add(self, taxids: np.ndarray, lengths: np.ndarray, fractions: np.ndarray) -> None:
+        """Fold one batch of reads (parallel arrays) into the profiles."""
+        if len(taxids) == 0:
+            return
+        uniq, inverse = np.unique(taxids, return_inverse=True)
+        rows = self._rows(uniq)[inverse]
+        n = len(self._row)
+        self.reads += np.bincount(rows, minlength=n)
+        self.bases += np.bincount(rows, weights=lengths, minlength=n).astype(np.int64)
+        self.length_hist += np.bincount(
+            rows * N_LENGTH_BINS + length_bin(lengths), minlength=n * N_LENGTH_BINS
+        ).reshape(n, N_LENGTH_BINS)
+        self.confidence_hist += np.bincount(
+            rows * N_CONFIDENCE_BINS + _confidence_bin(fractions),
+            minlength=n * N_CONFIDENCE_BINS,
+        ).reshape(n, N_CONFIDENCE_BINS)
+
+    def merge(self, other: "TaxonProfiles") -> "TaxonProfiles":
+        """Add ``other`` into this instance and return it."""
+        if len(other):
+            rows = self._rows(other.taxids)
+            self.reads[rows] += other.reads
+            self.bases[rows] += other.bases
+            self.length_hist[rows] += other.length_hist
+            self.confidence_hist[rows] += other.confidence_hist
+        return self
+
+    def profile(self, taxid: int) -> Optional[Dict]:
+        """Summary of one taxid's reads, or None if none were seen."""
+        row = self._row.get(int(taxid))
+        if row is None or self.reads[row] == 0:
+            return None
+        lengths, conf = self.length_hist[row], self.confidence_hist[row]
+        l_edges = length_bin_edges()
+        c_edges = np.linspace(0.0, 1.0, N_CONFIDENCE_BINS + 1)
+        return {
+            "reads": int(self.reads[row]),
+            "mean_length": float(self.bases[row] / self.reads[row]),
+            "median_length": _hist_quantile(lengths, l_edges, 0.5, log=True),
+            "length_q1": _hist_quantile(lengths, l_edges, 0.25, log=True),
+            "length_q3": _hist_quantile(lengths, l_edges, 0.75, log=True),
+            "median_confidence": _hist_quantile(conf, c_edges, 0.5, log=False),
+            "length_hist": lengths.tolist(),
+            "confidence_hist": conf.tolist(),
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            str(t): [int(self.reads[r]), int(self.bases[r]),
+                     {str(b): int(v) for b, v in enumerate(self.length_hist[r]) if v},
+                     {str(b): int(v) for b, v in enumerate(self.confidence_hist[r]) if v}]
+            for t, r in self._row.items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TaxonProfiles":
+        profiles = cls()
+        rows = profiles._rows(np.asarray([int(t) for t in data], dtype=np.int64))
+        for row, (reads, bases, lengths, conf) in zip(rows.tolist(), data.values()):
+            profiles.reads[row] = int(reads)
+            profiles.bases[row] = int(bases)
+            for b, v in lengths.items():
+                profiles.length_hist[row, int(b)] = int(v)
+            for b, v in conf.items():
+                profiles.confidence_hist[row, int(b)] = int(v)
+        return profiles
+
+
+# ---------------------------------------------------------------------------
+# Chunk reduction
+# ---------------------------------------------------------------------------
+
+class _NotVectorisable(ValueError):
+    """The chunk needs the per-line parser."""
+
+
+def _parse_uints(arr: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Decode the unsigned decimal fields ``arr[starts[i]:ends[i]]`` in bulk.
+
+    One vector pass per digit position, so the transient memory is O(fields)
+    rather than O(fields x width).
+    """
+    value = np.zeros(len(starts), dtype=np.int64)
+    if len(starts) == 0:
+        return value
+    width = ends - starts
+    shortest, longest = int(width.min()), int(width.max())
+    if longest > 18 or shortest < 1:
+        raise _NotVectorisable("field width")
+    # Digits are read right to left, so position k is the 10**k place.
+    for k in range(longest):
+        digit = arr[np.maximum(ends - 1 - k, 0)] - np.uint8(48)  # wraps below '0'
+        if k >= shortest:
+            digit = np.where(width > k, digit, 0)
+        if (digit > 9).any():
+            raise _NotVectorisable("non-digit")
+        value += digit.astype(np.int64) * 10 ** k
+    return value
+
+
+def _hit_counts(arr: np.ndarray, tab4: np.ndarray, ends: np.ndarray,
+                taxids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per line: k-mers on the assigned taxid, and all non-ambiguous k-mers.
+
+    Tokens are ``key:count`` separated by single spaces, so the i-th token
+    ends at the i-th space of its line or at the line end; both token
+    bounds therefore come from the sorted space offsets without a search.
+    """
+    n = len(tab4)
+    colons = np.flatnonzero(arr == 58)  # ':'
+    lo = np.searchsorted(colons, tab4)
+    hi = np.searchsorted(colons, ends)
+    per_line = hi - lo
+    if per_line.sum() != len(colons):  # ':' inside read ids
+        inside = np.bincount(lo, minlength=len(colons) + 1) - np.bincount(hi, minlength=len(colons) + 1)
+        colons = colons[np.cumsum(inside)[:-1] > 0]
+    spaces = np.flatnonzero(arr == 32)
+    if len(spaces) != int(np.maximum(per_line - 1, 0).sum()):
+        raise _NotVectorisable("token separators")
+    if len(colons) == 0:
+        return np.zeros(n, dtype=np.int64), np.zeros(n, dtype=np.int64)
+
+    token_line = np.repeat(np.arange(n), per_line)
+    first_token = np.concatenate([[0], np.cumsum(per_line)[:-1]])
+    within = np.arange(len(colons)) - first_token[token_line]
+    is_first = within == 0
+    is_last = within == per_line[token_line] - 1
+    with_tokens = per_line > 0
+    key_start = np.empty(len(colons), dtype=np.int64)
+    key_start[is_first] = tab4[with_tokens] + 1
+    key_start[~is_first] = spaces + 1
+    count_end = np.empty(len(colons), dtype=np.int64)
+    count_end[is_last] = ends[with_tokens]
+    count_end[~is_last] = spaces
+
+    # Only numeric keys count: "A" (ambiguous k-mers) and "|" (the mate
+    # separator of paired reads) are outside the confidence denominator.
+    numeric = np.flatnonzero(arr[key_start] - np.uint8(48) <= 9)
+    counts = _parse_uints(arr, colons[numeric] + 1, count_end[numeric])
+    keys = _parse_uints(arr, key_start[numeric], colons[numeric])
+    line = token_line[numeric]
+    total = np.bincount(line, weights=counts, minlength=n)
+    on_taxid = keys == taxids[line]
+    hits = np.bincount(line[on_taxid], weights=counts[on_taxid], minlength=n)
+    return hits.astype(np.int64), total.astype(np.int64)
+
+
+def _reduce_vectorised(buf: bytes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    ends = np.flatnonzero(arr == 10)
+    n = len(ends)
+    tabs = np.flatnonzero(arr == 9)
+    if len(tabs) != 4 * n:
+        raise _NotVectorisable("column count")
+    tabs = tabs.reshape(n, 4)
+    # Four tabs in total per line; each line's must precede its own newline.
+    if n and ((tabs[:, 3] > ends).any() or (tabs[1:, 0] < ends[:-1]).any()):
+        raise _NotVectorisable("column count")
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    taxids = _parse_uints(arr, tabs[:, 1] + 1, tabs[:, 2])
+    lengths = _parse_uints(arr, tabs[:, 2] + 1, tabs[:, 3])
+    taxids = np.where(arr[starts] == 67, taxids, 0)  # 'U' lines count as taxid 0
+    hits, total = _hit_counts(arr, tabs[:, 3], ends, taxids)
+    fractions = hits / np.maximum(total, 1)
+    return taxids, lengths, fractions
+
+
+_NAMED_TAXID = re.compile(r"\(taxid (\d+)\)\s*$")
+
+
+def _reduce_line(line: str) -> Optional[Tuple[int, int, float]]:
+    parts = line.rstrip("\r\n").split("\t")
+    if len(parts) < 4:
+        return None
+    try:
+        taxid = 0
+        if parts[0] == "C":
+            # --use-names writes "Name (taxid N)" in the taxid column.
+            named = _NAMED_TAXID.search(parts[2])
+            taxid = int(named.group(1) if named else parts[2])
+        length = sum(int(x) for x in parts[3].split("|"))
+    except ValueError:
+        return None
+    hits = total = 0
+    for token in (parts[4].split() if len(parts) > 4 else ()):
+        key, _, count = token.partition(":")
+        if not key.isdigit() or not count.isdigit():
+            continue  # "A" (ambiguous) and "|" (mate separator) included
+        total += int(count)
+        if int(key) == taxid:
+            hits += int(count)
+    return taxid, length, (hits / total if total else 0.0)
+
+
+def _reduce_per_line(buf: bytes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rows = [r for r in map(_reduce_line, buf.decode("utf-8", "replace").splitlines()) if r]
+    if not rows:
+        return (np.zeros(0, dtype=np.int64),) * 2 + (np.zeros(0),)
+    taxids, lengths, fractions = zip(*rows)
+    return (np.asarray(taxids, dtype=np.int64), np.asarray(lengths, dtype=np.int64),
+            np.asarray(fractions, dtype=np.float64))
+
+
+def reduce_chunk(buf: bytes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``(taxids, lengths, hit_fractions)`` for a buffer of whole lines."""
+    if not buf:
+        return _reduce_per_line(b"")
+    try:
+        return _reduce_vectorised(buf)
+    except _NotVectorisable:
+        return _reduce_per_line(buf)
+
+
+def reduce_stream(fh, profiles: TaxonProfiles, limit: Optional[int] = None,
+                  chunk_bytes: int = CHUNK_BYTES) -> int:
+    """Fold whole lines from a binary file object into ``profiles``.
+
+    Reads at most ``limit`` bytes and stops at the last complete line, so a
+    line still being written is left for the next call. Returns the number
+    of bytes consumed.
+    """
+    consumed = 0
+    carry = b""
+    while limit is None or consumed + len(carry) < limit:
+        want = chunk_bytes if limit is None else min(chunk_bytes, limit - consumed - len(carry))
+        block = fh.read(want)
+        if not block:
+            break
+        data = carry + block
+        cut = data.rfind(b"\n") + 1
+        carry = data[cut:]
+        if cut:
+            profiles.add(*reduce_chunk(data[:cut]))
+            consumed += cut
+    return consumed
+
+
+# ---------------------------------------------------------------------------
+# Per-sample incremental store
+# ---------------------------------------------------------------------------
+
+def _profiles_size(entry: Tuple[Dict[str, Tuple[int, int]], TaxonProfiles]) -> int:
+    offsets, profiles = entry
+    arrays = (profiles.taxids, profiles.reads, profiles.bases,
+              profiles.length_hist, profiles.confidence_hist)
+    return sum(a.nbytes for a in arrays) + 100 * len(profiles) + 200 * len(offsets)
+
+
+_store_lock = threading.Lock()
+# (abs kraken_dir, sample) -> (offsets, profiles). ``offsets`` maps each
+# tailed file's basename to (bytes consumed, inode). An evicted sample is
+# reloaded from its persisted profiles on the next update.
+_sample_profiles = BoundedCache("kraken_read_profiles", sizeof=_profiles_size)
+_PROFILE_FILE = SampleStateFile("read profiles", PROFILE_DIRNAME, PROFILE_SCHEMA,
+                                encode=TaxonProfiles.to_dict, decode=TaxonProfiles.from_dict,
+                                inventory_key="files", state_key="taxa")
+
+
+def profile_path(kraken_dir: str, sample: str) -> str:
+    """Where the persisted profiles for ``sample`` live."""
+    return _PROFILE_FILE.path(kraken_dir, sample)
+
+
+def sample_of_output(filename: str) -> Optional[str]:
+    """Sample name of a per-read output file, or None if it is not one."""
+    for suffix in _OUTPUT_SUFFIXES:
+        if filename.endswith(suffix):
+            return re.sub(r"_batch_?\d+$", "", filename[:-len(suffix)]) or None
+    return None
+
+
+def find_per_read_outputs(kraken_dir: str, sample: str) -> List[str]:
+    """The per-read output files that together cover ``sample``'s reads.
+
+    A whole-sample file wins; otherwise every per-batch file (each holds its
+    own batch's reads); otherwise a merged file. Never a mix, which would
+    count reads twice.
+    """
+    from nanometa_live.core.utils.results_catalog import scan_exists, scan_glob
+    for folder in (kraken_dir, os.path.join(kraken_dir, sample)):
+        for pattern in SAMPLE_OUTPUT_NAMES:
+            path = os.path.join(folder, pattern.format(s=sample))
+            if scan_exists(path):
+                return [path]
+    batches: List[str] = []
+    for folder in (kraken_dir, os.path.join(kraken_dir, sample)):
+        for pattern in BATCH_OUTPUT_GLOBS:
+            batches.extend(scan_glob(os.path.join(folder, pattern.format(s=sample))))
+    if batches:
+        return sorted(dict.fromkeys(batches))
+    merged = os.path.join(kraken_dir, MERGED_OUTPUT_NAME.format(s=sample))
+    return [merged] if scan_exists(merged) else []
+
+
+def samples_with_per_read_output(kraken_dir: str) -> List[str]:
+    """Samples that have per-read output directly under ``kraken_dir``."""
+    from nanometa_live.core.utils.results_catalog import scan_listdir
+    try:
+        names = scan_listdir(kraken_dir)
+    except OSError:
+        return []
+    return sorted({s for s in map(sample_of_output, names) if s})
+
+
+def _needs_rebuild(offsets: Dict[str, Tuple[int, int]], current: Dict[str, str]) -> bool:
+    for name, (consumed, inode) in offsets.items():
+        try:
+            st = os.stat(current[name])
+        except (KeyError, OSError):
+            return True
+        if st.st_ino != inode or st.st_size < consumed:
+            return True
+    return False
+
+
+def update_sample_profiles(kraken_dir: str, sample: str,
+                           files: Optional[Iterable[str]] = None) -> TaxonProfiles:
+    """Bring ``sample``'s profiles up to date with its per-read output.
+
+    Only bytes appended since the last update are read. When a tailed file
+    has disappeared, shrunk or been replaced, the sample is rebuilt from
+    every current file.
+    """
+    key = (os.path.abspath(kraken_dir), sample)
+    path = profile_path(kraken_dir, sample)
+    with _store_lock:
+        entry = _sample_profiles.get(key)
+    if entry is None:
+        entry = _PROFILE_FILE.load(path)
+    offsets, profiles = (dict(entry[0]), entry[1]) if entry else ({}, TaxonProfiles())
+
+    if files is None:
+        files = find_per_read_outputs(kraken_dir, sample)
+    current = {os.path.basename(p): p for p in files}
+    if _needs_rebuild(offsets, current):
+        logging.debug(f"Read profiles for {sample} invalidated; rebuilding")
+        offsets, profiles = {}, TaxonProfiles()
+    else:
+        profiles = TaxonProfiles().merge(profiles)  # never mutate a shared instance
+
+    changed = False
+    for name in sorted(current):
+        done, _inode = offsets.get(name, (0, 0))
+        try:
+            with open(current[name], "rb") as fh:
+                st = os.fstat(fh.fileno())
+                if st.st_size <= done:
+                    continue
+                fh.seek(done)
+                done += reduce_stream(fh, profiles, limit=st.st_size - done)
+        except OSError as exc:
+            logging.debug(f"Could not read per-read output {current[name]}: {exc}")
+            continue
+        offsets[name] = (done, st.st_ino)
+        changed = True
+
+    with _store_lock:
+        _sample_profiles[key] = (offsets, profiles)
+    if changed:
+        _PROFILE_FILE.save(path, offsets, profiles)
+    return profiles
+
+
+def load_read_profiles(main_dir: str, sample: Optional[str] = None) -> TaxonProfiles:
+    """Up-to-date profiles for one sample, or merged over every sample."""
+    from nanometa_live.core.utils.sample_detector import resolve_analysis_directory
+    kraken_dir = os.path.join(resolve_analysis_directory(main_dir), "kraken2")
+    if sample and sample != "All Samples":
+        return update_sample_profiles(kraken_dir, sample)
+    merged = TaxonProfiles()
+    for name in samples_with_per_read_output(kraken_dir):
+        merged.merge(update_sample_profiles(kraken_dir, name))
+    return merged
+
+
+def clear_read_profile_cache() -> None:
+    """Drop every in-memory profile. Persisted profiles are left in place."""
+    with _store_lock:
+        _sample_profiles.clear()
@@ -23,6 +23,8 @@ import logging
 from pathlib import Path
 from typing import List, Optional
 
+from nanometa_live.core.utils.json_ingest import cached_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,8 +62,7 @@ def parse_minimap2_stats_json(filepath: Path):
     from nanometa_live.core.parsers.blast_validation_parser import ValidationResult
 
     try:
-        with open(filepath, "r") as f:
-            d = json.load(f)
+        d = cached_json(filepath)
     except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
         logger.warning(f"Unreadable minimap2 stats {filepath}: {e}")
         return None
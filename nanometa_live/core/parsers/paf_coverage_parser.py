@@ -224,8 +224,9 @@ def aggregate_contig_coverage(
 # taxid) on every poll. Merging intervals gives the same breadth and a local
 # depth in O(n log n) with no big allocation.
 
-#: Cached on (realpath, mtime_ns, size, min_mapq).
-_breadth_cache: Dict[tuple, "PafBreadth"] = {}
+# Summaries are cached per (path, min_mapq) in the process-wide validation
+# file ledger, valid while the PAF's (mtime_ns, size) holds. An unreadable or
+# empty PAF is remembered as None rather than re-read every poll.
 
 
 @dataclass
@@ -260,16 +261,12 @@ class PafBreadth:
 
 def paf_breadth(paf_path, min_mapq: int = 0) -> Optional["PafBreadth"]:
     """Merged-interval coverage summary for a PAF, or None if unreadable."""
-    path = Path(paf_path)
-    try:
-        st = path.stat()
-    except OSError:
-        return None
-    key = (str(path), st.st_mtime_ns, st.st_size, min_mapq)
-    cached = _breadth_cache.get(key)
-    if cached is not None:
-        return cached
+    from nanometa_live.core.parsers.validation_cache import file_ledger
+    return file_ledger.get(Path(paf_path), ("paf_breadth", min_mapq),
+                           lambda path: _compute_paf_breadth(path, min_mapq))
+
 
+def _compute_paf_breadth(path: Path, min_mapq: int) -> Optional["PafBreadth"]:
     intervals: List[tuple] = []
     ref_len = 0
     aligned = 0
@@ -305,6 +302,4 @@ def paf_breadth(paf_path, min_mapq: int = 0) -> Optional["PafBreadth"]:
             cur_end = end
     covered += cur_end - cur_start
 
-    result = PafBreadth(ref_length=ref_len, covered_bp=covered, aligned_bp=aligned)
-    _breadth_cache[key] = result
-    return result
+    return PafBreadth(ref_length=ref_len, covered_bp=covered, aligned_bp=aligned)
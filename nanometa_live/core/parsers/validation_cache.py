@@ -0,0 +1,179 @@
+"""
+Process-wide caches behind ``ValidationParser``.
+
+``ValidationParser`` used to cache one whole-directory result per parser
+instance, keyed on the newest mtime under ``validation/``. In a realtime
+run the cumulative aggregator rewrites one ``validation/{blast,minimap2}``
+file per batch, so every tick invalidated everything and every BLAST TSV
+and PAF was parsed again. Each caller also built its own parser, so the
+dashboard's validation lookup and the Validation tab parsed the same
+directory twice.
+
+Two layers fix that, both shared by every parser in the process:
+
+* :data:`file_ledger` holds one parsed summary per source file, keyed by
+  path and checked against ``(mtime_ns, size)``. When a batch rewrites one
+  file, only that file is parsed again; every other BLAST TSV summary and
+  PAF breadth comes from the ledger. A file that parsed to nothing (an
+  empty TSV, an unreadable PAF) is remembered too.
+* :data:`results_cache` holds the merged result list per results
+  directory, keyed by the directory fingerprint. Any parser for the same
+  directory reuses it. On a miss the merge re-runs in memory over the
+  ledger's summaries, which is cheap next to reading the files.
+
+JSON inputs need neither layer: ``json_ingest.cached_json`` already keys
+its digests by ``(path, mtime_ns, size)``.
+"""
+
+import copy
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Hashable, List, Optional, Tuple, TypeVar
+
+import pandas as pd
+
+from nanometa_live.core.utils.bounded_cache import BoundedCache, estimate_size
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+#: Source files remembered. One entry per (file, summary kind); a 24-barcode
+#: run with a 100-taxon watchlist stays well under this.
+FILE_LEDGER_MAX = 8192
+#: Merged result lists remembered (one per results directory).
+RESULTS_CACHE_MAX = 8
+
+
+class FileLedger:
+    """``{(path, kind): value}``, valid while the file's (mtime_ns, size) holds.
+
+    Backed by a registered :class:`BoundedCache` named ``name``, so entries
+    count against the global cache cap. ``sizeof`` estimates one value.
+    """
+
+    def __init__(self, max_entries: int = FILE_LEDGER_MAX, *, name: str = "file_ledger",
+                 sizeof: Callable[[Any], int] = estimate_size):
+        self.max_entries = max_entries
+        self._entries = BoundedCache(name, max_entries=max_entries,
+                                     sizeof=lambda entry: sizeof(entry[2]))
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path, kind: Hashable, compute: Callable[[Path], T]) -> T:
+        """The cached ``compute(path)``, recomputed only if the file changed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return compute(path)
+        key = (os.fspath(path), kind)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        value = compute(path)
+        self._entries[key] = (st.st_mtime_ns, st.st_size, value)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResultsCache:
+    """Merged validation results per results directory, keyed by fingerprint."""
+
+    def __init__(self, max_entries: int = RESULTS_CACHE_MAX, *, name: str = "validation_results"):
+        self.max_entries = max_entries
+        self._entries = BoundedCache(name, max_entries=max_entries)
+
+    def entry(self, key: Hashable) -> Optional[Tuple[Any, list]]:
+        return self._entries.get(key)
+
+    def get(self, key: Hashable, fingerprint: Any) -> Optional[list]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != fingerprint:
+            return None
+        return entry[1]
+
+    def put(self, key: Hashable, fingerprint: Any, results: list) -> None:
+        self._entries[key] = (fingerprint, list(results))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+file_ledger = FileLedger(name="validation_files")
+results_cache = ResultsCache()
+
+
+def copy_results(results: List[Any]) -> List[Any]:
+    """Shallow copies, so a caller mutating a result cannot edit the cache."""
+    return [copy.copy(r) for r in results]
+
+
+def clear_validation_caches() -> None:
+    """Drop both layers (run boundary, or data known to have changed)."""
+    file_ledger.clear()
+    results_cache.clear()
+
+
+@dataclass(frozen=True)
+class BlastTsvSummary:
+    """What ``parse_blast_tabular`` needs from one ``*.blast.tsv``.
+
+    Independent of the Kraken2 denominator, so a new total never forces a
+    re-read.
+    """
+
+    validated_reads: int = 0
+    identity_mean: float = 0.0
+    identity_min: float = 0.0
+    identity_max: float = 0.0
+    alignment_length_mean: float = 0.0
+    no_data: bool = False
+    error: Optional[str] = None
+
+
+_BLAST_COLS_12 = [
+    'qseqid', 'sseqid', 'pident', 'length', 'mismatch', 'gapopen',
+    'qstart', 'qend', 'sstart', 'send', 'evalue', 'bitscore',
+]
+_BLAST_COLS_15 = _BLAST_COLS_12 + ['qlen', 'slen', 'qcovs']
+
+
+def summarize_blast_tsv(filepath: Path) -> BlastTsvSummary:
+    """Read one BLAST outfmt 6 file (12 or 15 columns) into a summary."""
+    try:
+        # Read first, then name columns from the ACTUAL width. Peeking one
+        # line to pick 12-vs-15 names is fragile (a leading blank line shifts
+        # every column); read_csv skips blank lines so df.shape[1] is reliable.
+        df = pd.read_csv(filepath, sep='\t', header=None)
+        if df.empty or df.shape[1] < 12:
+            return BlastTsvSummary(no_data=True)
+        ncols = df.shape[1]
+        base = _BLAST_COLS_15 if ncols >= 15 else _BLAST_COLS_12
+        df.columns = base[:ncols] + [f"col_{i}" for i in range(len(base), ncols)]
+        return BlastTsvSummary(
+            validated_reads=int(df['qseqid'].nunique()),
+            identity_mean=float(df['pident'].mean()),
+            identity_min=float(df['pident'].min()),
+            identity_max=float(df['pident'].max()),
+            alignment_length_mean=float(df['length'].mean()),
+        )
+    except (FileNotFoundError, PermissionError, OSError, UnicodeDecodeError,
+            pd.errors.ParserError, pd.errors.EmptyDataError, KeyError, ValueError,
+            TypeError) as e:
+        logger.exception(f"Error parsing BLAST tabular {filepath}: {e}")
+        return BlastTsvSummary(error=str(e))
+
+
+def blast_tsv_summary(filepath: Path) -> BlastTsvSummary:
+    """Ledger-backed :func:`summarize_blast_tsv`."""
+    return file_ledger.get(filepath, "blast_tsv", summarize_blast_tsv)
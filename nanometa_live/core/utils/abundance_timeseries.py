@@ -0,0 +1,425 @@
+"""
+Per-batch abundance time series built from Kraken2 batch reports.
+
+The classification loaders sum per-batch reports into one cumulative view
+and throw the batch structure away. "When did this pathogen first appear?"
+and "how fast is it rising?" therefore needed every historical batch report
+re-parsed on each poll.
+
+This module keeps the batch structure instead. Each batch report is absorbed
+once, the first time it is seen stable, as one columnar record: sample,
+batch index, timestamp (the report's mtime) and the parallel arrays
+``taxid`` / ``reads``. ``reads`` is the clade count (``cumul_reads``). For
+the v1.5 incremental layout it is the batch's own delta. For legacy
+cumulative ``<sample>_batchN`` snapshots the previous snapshot is
+subtracted, so both layouts store deltas.
+
+Queries run against the in-memory columns:
+
+- :meth:`AbundanceStore.first_seen` is a dict lookup. The first-seen index
+  is maintained as batches are appended.
+- :meth:`AbundanceStore.rate_trend` binary-searches each batch's sorted
+  taxid column.
+- :meth:`AbundanceStore.top_risers` only touches the last ``2 x window``
+  batches per sample and fits all taxa in one vectorised least-squares pass.
+
+Each sample's series is persisted as append-only JSON lines in
+``<results>/.nanometa.abundance/<sample>.jsonl``, one line per absorbed
+batch. The line is keyed by the report's ``(mtime_ns, size)``. A restart
+replays the lines, so no historical batch report is ever read again. A
+rewritten report appends a superseding line. Like the QC sketches, the
+directory sits outside the watched results subdirectories, so writing it
+never advances the freshness fingerprint.
+"""
+
+import bisect
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from nanometa_live.core.utils.bounded_cache import BoundedCache, estimate_size
+from nanometa_live.core.utils.json_ingest import loads
+from nanometa_live.core.utils.sample_state import persist_failed, sample_state_path
+
+SERIES_DIRNAME = ".nanometa.abundance"
+SERIES_SCHEMA = 1
+
+#: Batches per trend window. ``top_risers`` compares the last window with
+#: the one before it.
+DEFAULT_WINDOW = 5
+
+
+@dataclass
+class BatchRecord:
+    """One absorbed batch report: parallel columns sorted by taxid."""
+
+    file: str
+    sig: Tuple[int, int]
+    batch: int
+    ts: float
+    taxids: np.ndarray
+    reads: np.ndarray
+
+    def reads_for(self, taxid: int) -> int:
+        i = int(np.searchsorted(self.taxids, taxid))
+        if i < len(self.taxids) and self.taxids[i] == taxid:
+            return int(self.reads[i])
+        return 0
+
+    def to_line(self, names: Dict[int, Tuple[str, str]]) -> str:
+        return json.dumps({
+            "schema": SERIES_SCHEMA, "file": self.file, "sig": list(self.sig),
+            "batch": self.batch, "ts": self.ts,
+            "taxid": self.taxids.tolist(), "reads": self.reads.tolist(),
+            "names": {str(t): list(v) for t, v in names.items()},
+        }, separators=(",", ":"))
+
+
+@dataclass
+class SampleSeries:
+    """Every absorbed batch of one sample, ordered by batch index."""
+
+    sample: str
+    records: Dict[str, BatchRecord] = field(default_factory=dict)
+    ordered: List[BatchRecord] = field(default_factory=list)
+    first_seen: Dict[int, Tuple[float, int]] = field(default_factory=dict)
+    names: Dict[int, Tuple[str, str]] = field(default_factory=dict)
+
+    def copy(self) -> "SampleSeries":
+        """A copy that can absorb batches while readers use this one.
+
+        Records are never mutated once built, so they are shared.
+        """
+        return SampleSeries(self.sample, dict(self.records), list(self.ordered),
+                            dict(self.first_seen), dict(self.names))
+
+    def add(self, record: BatchRecord) -> None:
+        """Append ``record``, superseding an earlier record for its file."""
+        replaced = self.records.get(record.file)
+        self.records[record.file] = record
+        if replaced is not None:
+            self._reindex()
+            return
+        keys = [(r.batch, r.ts) for r in self.ordered]
+        self.ordered.insert(bisect.bisect(keys, (record.batch, record.ts)), record)
+        self._note_first_seen(record)
+
+    def _note_first_seen(self, record: BatchRecord) -> None:
+        for taxid in record.taxids[record.reads > 0].tolist():
+            seen = self.first_seen.get(taxid)
+            if seen is None or (record.ts, record.batch) < seen:
+                self.first_seen[taxid] = (record.ts, record.batch)
+
+    def _reindex(self) -> None:
+        self.ordered = sorted(self.records.values(), key=lambda r: (r.batch, r.ts))
+        self.first_seen = {}
+        for record in self.ordered:
+            self._note_first_seen(record)
+
+    def running_totals(self, before_batch: int) -> Dict[int, int]:
+        """Summed reads per taxid over the stored batches before ``before_batch``."""
+        earlier = [r for r in self.ordered if r.batch < before_batch]
+        if not earlier:
+            return {}
+        taxids = np.concatenate([r.taxids for r in earlier])
+        reads = np.concatenate([r.reads for r in earlier])
+        uniq, inverse = np.unique(taxids, return_inverse=True)
+        return dict(zip(uniq.tolist(), np.bincount(inverse, weights=reads).astype(np.int64).tolist()))
+
+
+def series_path(kraken_dir: str, sample: str) -> str:
+    """Where ``sample``'s persisted series lives."""
+    return sample_state_path(kraken_dir, SERIES_DIRNAME, sample, ".jsonl")
+
+
+def _record_from_frame(name: str, st: os.stat_result, batch: int, df: pd.DataFrame,
+                       previous: Optional[Dict[int, int]] = None) -> BatchRecord:
+    frame = df[["taxid", "cumul_reads"]].groupby("taxid", sort=True)["cumul_reads"].sum()
+    taxids = frame.index.to_numpy(dtype=np.int64)
+    reads = frame.to_numpy(dtype=np.int64)
+    if previous:
+        before = np.fromiter((previous.get(t, 0) for t in taxids.tolist()),
+                             dtype=np.int64, count=len(taxids))
+        reads = np.clip(reads - before, 0, None)
+    keep = reads > 0
+    return BatchRecord(name, (st.st_mtime_ns, st.st_size), batch, st.st_mtime,
+                       taxids[keep], reads[keep])
+
+
+def _load_persisted(path: str, sample: str) -> SampleSeries:
+    series = SampleSeries(sample)
+    try:
+        with open(path, "rb") as fh:
+            lines = fh.read().splitlines()
+    except FileNotFoundError:
+        return series
+    except OSError as exc:
+        logging.debug(f"Ignoring unreadable abundance series {path}: {exc}")
+        return series
+    for line in lines:
+        try:
+            row = loads(line)
+            if row.get("schema") != SERIES_SCHEMA:
+                continue
+            record = BatchRecord(
+                row["file"], (int(row["sig"][0]), int(row["sig"][1])), int(row["batch"]),
+                float(row["ts"]), np.asarray(row["taxid"], dtype=np.int64),
+                np.asarray(row["reads"], dtype=np.int64))
+            names = {int(t): (str(v[0]), str(v[1])) for t, v in row.get("names", {}).items()}
+        except (ValueError, KeyError, TypeError, IndexError, AttributeError):
+            # A torn final line from a crash mid-append: the batch it named
+            # is simply absorbed again.
+            continue
+        series.names.update(names)
+        series.add(record)
+    return series
+
+
+def _append(path: str, records: List[Tuple[BatchRecord, Dict[int, Tuple[str, str]]]]) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a+b") as fh:
+            # Start on a fresh line if a crash left the last one torn.
+            torn = fh.tell() > 0 and fh.seek(-1, os.SEEK_END) >= 0 and fh.read(1) != b"\n"
+            body = "".join(r.to_line(names) + "\n" for r, names in records)
+            fh.write((("\n" if torn else "") + body).encode("utf-8"))
+    except OSError as exc:
+        persist_failed("abundance series", path, exc)
+
+
+def _series_size(series: SampleSeries) -> int:
+    arrays = sum(r.taxids.nbytes + r.reads.nbytes + 200 for r in series.ordered)
+    return arrays + estimate_size(series.names) + estimate_size(series.first_seen)
+
+
+# (abs kraken_dir, sample) -> SampleSeries. A published series is never
+# mutated: an update absorbs into a copy and swaps it in, so a query can
+# keep reading the series it was handed. An evicted series is replayed
+# from its persisted lines on the next update.
+_sample_series = BoundedCache("abundance_series", sizeof=_series_size)
+# (abs kraken_dir, sample) -> lock serialising updates of that series, so
+# two refreshes never absorb (and persist) the same batch twice.
+_update_locks_lock = threading.Lock()
+_update_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+
+def _discover_batch_reports(kraken_dir: str) -> Dict[str, List[str]]:
+    """Per-sample batch report paths, nested v1.5 layout and legacy flat."""
+    from nanometa_live.core.utils.classification_loaders import (
+        _report_sample_key,
+        _scan_subdirs_for_pattern,
+    )
+    from nanometa_live.core.utils.results_catalog import scan_glob
+
+    found = _scan_subdirs_for_pattern(kraken_dir, "*.kraken2.report.txt",
+                                      subdir="batch_reports")
+    found.extend(scan_glob(os.path.join(kraken_dir, "*_batch*.kraken2.report.txt")))
+    by_sample: Dict[str, List[str]] = {}
+    for path in dict.fromkeys(os.path.realpath(p) for p in found):
+        by_sample.setdefault(_report_sample_key(path), []).append(path)
+    return by_sample
+
+
+def update_sample_series(kraken_dir: str, sample: str,
+                         batch_files: Iterable[str]) -> SampleSeries:
+    """Absorb every stable batch report of ``sample`` not absorbed before.
+
+    Reports are parsed through the loader's per-file frame cache, so a batch
+    the cumulative view has already parsed costs no second read. A file whose
+    ``(mtime_ns, size)`` matches its stored record is only stat-ed.
+
+    Legacy cumulative snapshots are absorbed strictly in batch order: a
+    snapshot is diffed against the batches before it, so absorbing batch N
+    while N-1 is still being written would count N-1's reads twice.
+    """
+    key = (os.path.abspath(kraken_dir), sample)
+    with _update_locks_lock:
+        lock = _update_locks.setdefault(key, threading.Lock())
+    with lock:
+        current = _sample_series.get(key)
+        if current is None:
+            current = _load_persisted(series_path(kraken_dir, sample), sample)
+        series, appended = _absorb(kraken_dir, sample, current.copy(), batch_files)
+        _sample_series[key] = series
+        if appended:
+            _append(series_path(kraken_dir, sample), appended)
+    return series
+
+
+def _absorb(kraken_dir: str, sample: str, series: SampleSeries, batch_files: Iterable[str]
+            ) -> Tuple[SampleSeries, List[Tuple[BatchRecord, Dict[int, Tuple[str, str]]]]]:
+    """Add the new stable reports in ``batch_files`` to ``series`` (unpublished)."""
+    from nanometa_live.core.utils.classification_loaders import (
+        _BATCH_NUM_RE,
+        _is_incremental_layout,
+        _parse_kraken2_report,
+    )
+    from nanometa_live.core.utils.loader_utils import _is_stat_stable
+
+    layout: List[bool] = []
+
+    def snapshots() -> bool:
+        # Only looked up once a batch is new: a poll with nothing new is stats only.
+        if not layout:
+            layout.append(not _is_incremental_layout(kraken_dir, sample))
+        return layout[0]
+
+    def batch_num(path: str) -> int:
+        m = _BATCH_NUM_RE.search(os.path.basename(path))
+        return int(m.group(1)) if m else -1
+
+    appended: List[Tuple[BatchRecord, Dict[int, Tuple[str, str]]]] = []
+    for path in sorted(batch_files, key=batch_num):
+        name = os.path.basename(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        known = series.records.get(name)
+        if known is not None and known.sig == (st.st_mtime_ns, st.st_size):
+            continue
+        if not _is_stat_stable(path, st):
+            if snapshots():
+                break  # later snapshots wait until this one is absorbed
+            continue
+        df = _parse_kraken2_report(path)
+        if df is None or df.empty:
+            continue
+        batch = batch_num(path)
+        previous = series.running_totals(batch) if snapshots() else None
+        record = _record_from_frame(name, st, batch, df, previous)
+        new_names = {
+            int(t): (str(n).strip(), str(r))
+            for t, n, r in zip(df["taxid"], df["name"], df["rank"])
+            if int(t) not in series.names
+        }
+        series.names.update(new_names)
+        series.add(record)
+        appended.append((record, new_names))
+    return series, appended
+
+
+class AbundanceStore:
+    """Trend queries over every sample's series under one ``kraken2/`` dir."""
+
+    def __init__(self, kraken_dir: str):
+        self.kraken_dir = kraken_dir
+        self.series: Dict[str, SampleSeries] = {}
+
+    @classmethod
+    def for_results(cls, main_dir: str) -> "AbundanceStore":
+        """The store for a results directory, brought up to date."""
+        from nanometa_live.core.utils.sample_detector import resolve_analysis_directory
+        store = cls(os.path.join(resolve_analysis_directory(main_dir), "kraken2"))
+        return store.refresh()
+
+    def refresh(self) -> "AbundanceStore":
+        """Absorb any batch reports that arrived since the last refresh."""
+        for sample, files in _discover_batch_reports(self.kraken_dir).items():
+            self.series[sample] = update_sample_series(self.kraken_dir, sample, files)
+        return self
+
+    def _selected(self, sample: Optional[str]) -> List[SampleSeries]:
+        if sample is None or sample == "All Samples":
+            return [self.series[s] for s in sorted(self.series)]
+        return [self.series[sample]] if sample in self.series else []
+
+    def name_of(self, taxid: int) -> Tuple[str, str]:
+        """``(name, rank)`` as the reports spell them, or ``("", "")``."""
+        for series in self.series.values():
+            if taxid in series.names:
+                return series.names[taxid]
+        return ("", "")
+
+    def first_seen(self, taxid: int, sample: Optional[str] = None
+                   ) -> Optional[Tuple[float, str, int]]:
+        """Earliest ``(timestamp, sample, batch)`` with reads for ``taxid``."""
+        hits = [(s.first_seen[taxid][0], s.sample, s.first_seen[taxid][1])
+                for s in self._selected(sample) if taxid in s.first_seen]
+        return min(hits) if hits else None
+
+    def rate_trend(self, taxid: int, sample: Optional[str] = None,
+                   last_k: Optional[int] = None) -> pd.DataFrame:
+        """Per-batch reads and reads/min for ``taxid``, one row per batch.
+
+        ``reads_per_min`` divides a batch's reads by the time since the
+        sample's previous batch; it is NaN for a sample's first batch.
+        """
+        rows = []
+        for series in self._selected(sample):
+            records = series.ordered[-last_k:] if last_k else series.ordered
+            prev_ts = None
+            for record in records:
+                reads = record.reads_for(taxid)
+                gap_min = (record.ts - prev_ts) / 60.0 if prev_ts is not None else 0.0
+                rate = reads / gap_min if gap_min > 0 else float("nan")
+                rows.append((series.sample, record.batch, record.ts, reads, rate))
+                prev_ts = record.ts
+        return pd.DataFrame(rows, columns=["sample", "batch", "ts", "reads", "reads_per_min"])
+
+    def top_risers(self, k: Optional[int] = 10, window: int = DEFAULT_WINDOW,
+                   sample: Optional[str] = None, ranks: Tuple[str, ...] = ("S",),
+                   min_reads: int = 10) -> List[Dict]:
+        """The ``k`` (sample, taxon) pairs rising fastest over the last ``window`` batches.
+
+        ``k=None`` returns every riser, fastest first.
+
+        ``slope`` is the least-squares reads-per-batch increase across the
+        window. ``rise_factor`` compares the window's mean reads per batch
+        with the preceding window's (``inf`` for a taxon absent before).
+        Taxa with fewer than ``min_reads`` reads in the window are skipped.
+        """
+        risers: List[Dict] = []
+        for series in self._selected(sample):
+            risers.extend(self._sample_risers(series, window, ranks, min_reads))
+        risers.sort(key=lambda r: (-r["slope"], -r["recent_reads"], r["taxid"]))
+        return risers if k is None else risers[:k]
+
+    def _sample_risers(self, series: SampleSeries, window: int,
+                       ranks: Tuple[str, ...], min_reads: int) -> List[Dict]:
+        recent = series.ordered[-window:]
+        if len(recent) < 2:
+            return []
+        before = series.ordered[-2 * window:-window] if len(series.ordered) > window else []
+        span = before + recent
+        taxids = np.concatenate([r.taxids for r in span])
+        uniq, inverse = np.unique(taxids, return_inverse=True)
+        matrix = np.zeros((len(uniq), len(span)), dtype=np.float64)
+        cols = np.repeat(np.arange(len(span)), [len(r.taxids) for r in span])
+        matrix[inverse, cols] = np.concatenate([r.reads for r in span])
+
+        now = matrix[:, len(before):]
+        x = np.arange(now.shape[1], dtype=np.float64) - (now.shape[1] - 1) / 2.0
+        slope = (now - now.mean(axis=1, keepdims=True)) @ x / float(x @ x)
+        recent_mean = now.mean(axis=1)
+        before_mean = matrix[:, :len(before)].mean(axis=1) if before else np.zeros(len(uniq))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.where(before_mean > 0, recent_mean / before_mean, np.inf)
+
+        out = []
+        for i in np.flatnonzero((now.sum(axis=1) >= min_reads) & (slope > 0)).tolist():
+            taxid = int(uniq[i])
+            name, rank = series.names.get(taxid, ("", ""))
+            if ranks and rank not in ranks:
+                continue
+            seen_ts, seen_batch = series.first_seen.get(taxid, (None, None))
+            out.append({
+                "sample": series.sample, "taxid": taxid, "name": name, "rank": rank,
+                "slope": float(slope[i]), "recent_reads": int(now[i].sum()),
+                "recent_mean": float(recent_mean[i]), "previous_mean": float(before_mean[i]),
+                "rise_factor": float(factor[i]), "batches": len(recent),
+                "last_batch": recent[-1].batch,
+                "first_seen_ts": seen_ts, "first_seen_batch": seen_batch,
+            })
+        return out
+
+
+def clear_abundance_series_cache() -> None:
+    """Drop every in-memory series. Persisted series are left in place."""
+    _sample_series.clear()
@@ -152,6 +152,10 @@ class AlertEngine:
             "system": {
                 "max_error_count": 5,
                 "max_pending_files": 50
+            },
+            "trend": {
+                "rise_factor": 2.0,       # Recent vs previous window mean reads/batch
+                "min_recent_reads": 20,   # Reads across the recent window
             }
         }
 
@@ -162,7 +166,8 @@ class AlertEngine:
         qc_stats: Optional[Dict] = None,
         detected_organisms: Optional[List[Dict]] = None,
         watched_species: Optional[List[Dict]] = None,
-        taxid_to_samples: Optional[Dict[int, List[Dict]]] = None
+        taxid_to_samples: Optional[Dict[int, List[Dict]]] = None,
+        abundance_trends: Optional[List[Dict]] = None
     ) -> List[Dict]:
         """
         Generate alerts based on current system state.
@@ -176,6 +181,9 @@ class AlertEngine:
             taxid_to_samples: Optional per-taxid sample attribution, keyed by
                 Kraken2 report taxid (as built by ``_load_per_sample_organisms``).
                 When supplied, pathogen alerts name the samples they came from.
+            abundance_trends: Optional per-sample risers from
+                ``AbundanceStore.top_risers``. Watched pathogens whose read
+                rate is climbing raise rate alerts.
 
         Returns:
             List of alert dictionaries sorted by priority
@@ -189,6 +197,8 @@ class AlertEngine:
                 watched_species,
                 taxid_to_samples
             ))
+        if abundance_trends:
+            alerts.extend(self._check_abundance_trends(abundance_trends, watched_species))
 
         # System status alerts
         alerts.extend(self._check_system_status(status))
@@ -462,6 +472,78 @@ class AlertEngine:
 
         return alerts
 
+    def _check_abundance_trends(
+        self,
+        trends: List[Dict],
+        watched_species: Optional[List[Dict]] = None
+    ) -> List[Alert]:
+        """
+        Rate rules: a watched pathogen whose reads per batch are climbing.
+
+        A taxon rising by ``rise_factor`` over the previous window, or one
+        that first appeared inside the window, raises an alert. Only
+        organisms the pathogen database (or the watchlist) flags are
+        considered; a rising commensal is not actionable.
+
+        Args:
+            trends: Risers as returned by ``AbundanceStore.top_risers``
+            watched_species: Optional user-configured watchlist
+
+        Returns:
+            List of Alert objects for rising pathogens
+        """
+        rules = self.alert_rules["trend"]
+        rising = [
+            t for t in trends
+            if t.get("recent_reads", 0) >= rules["min_recent_reads"]
+            and t.get("rise_factor", 0.0) >= rules["rise_factor"]
+        ]
+        if not rising:
+            return []
+        try:
+            detections = check_for_dangerous_pathogens(
+                [{"taxid": t["taxid"], "name": t.get("name", ""),
+                  "reads": t["recent_reads"]} for t in rising],
+                watched_species
+            )
+        except (KeyError, AttributeError, ValueError, TypeError) as e:
+            logger.exception(f"Error checking rising taxa against the pathogen database: {e}")
+            return []
+        by_taxid = {d.get("detected_taxid"): d for d in detections}
+
+        alerts = []
+        for trend in rising:
+            detection = by_taxid.get(trend["taxid"])
+            if detection is None:
+                continue
+            sample = trend.get("sample", "")
+            severity = (
+                AlertSeverity.WARNING
+                if detection.get("threat_level") in ("critical", "high", "high_risk")
+                else AlertSeverity.INFO
+            )
+            factor = trend.get("rise_factor", 0.0)
+            if factor == float("inf"):
+                change = f"first seen in batch {trend.get('first_seen_batch')}"
+            else:
+                change = f"reads per batch up {factor:.1f}x"
+            alerts.append(Alert(
+                severity=severity,
+                category=AlertCategory.PATHOGEN,
+                message=(
+                    f"RISING: {detection.get('name', trend.get('name'))} {change} "
+                    f"over the last {trend.get('batches')} batches (in {sample})"
+                ),
+                recommendation="Watch the trend; prepare confirmation testing if it keeps rising",
+                samples=[sample] if sample else [],
+                technical_details=(
+                    f"TaxID: {trend['taxid']}, "
+                    f"Recent reads: {trend['recent_reads']:,}, "
+                    f"Slope: {trend.get('slope', 0.0):.1f} reads/batch"
+                )
+            ))
+        return alerts
+
     def _check_qc_stats(self, qc_stats: Dict) -> List[Alert]:
         """Check QC statistics for issues."""
         alerts = []
@@ -0,0 +1,276 @@
+"""
+Time-to-alert tracing: from a Kraken2 report landing to a rendered verdict.
+
+The number an operator cares about is how long a report that contains a
+critical pathogen sits on disk before the banner says ACTION REQUIRED.
+That time is spent in three places: the polling interval before the
+fingerprint moves, the load and matching work, and the callback itself.
+
+Each render that reads classification data opens an :class:`AlertTrace`.
+The trace is stamped with the data epoch's source time: the newest file
+mtime under ``kraken2/``, read from the results catalog the freshness
+check already refreshed, so stamping costs no filesystem access. The
+callback then marks three stages against that stamp:
+
+``loaded``
+    ``load_kraken_data`` returned.
+``alert``
+    The watchlist match and the verdict (or alert panel) were computed.
+``response``
+    The callback is about to return its output to Dash.
+
+Each stage is recorded as seconds since the source mtime. Only the first
+render of each epoch is recorded per surface. Later ticks over the same
+files would otherwise record ever-growing latencies for data already shown.
+
+Recorded events are kept in memory (bounded) and appended as JSON lines to
+``<results>/.nanometa.alert_latency.jsonl`` for post-mortems. The Reports
+tab summarises them per surface, verdict state and sample-count bucket,
+with percentiles and a fixed-bucket histogram. When the GUI was restarted
+and memory is empty, the summary is rebuilt from that log. The log sits
+outside the watched results subdirectories, so appending to it never
+advances the freshness fingerprint.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LATENCY_LOG_NAME = ".nanometa.alert_latency.jsonl"
+
+STAGES = ("loaded", "alert", "response")
+
+# Histogram upper bounds in seconds; a final open bucket catches the rest.
+HISTOGRAM_BOUNDS_S = (1, 2, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+# Sample-count buckets the summary is split by: (label, lowest count).
+SAMPLE_BUCKETS = (("1", 1), ("2-6", 2), ("7-24", 7), ("25-96", 25), ("97+", 97))
+
+# Events retained in memory; the JSON log keeps everything.
+MAX_EVENTS = 4096
+
+
+def sample_bucket(n_samples: Optional[int]) -> str:
+    """Label of the sample-count bucket ``n_samples`` falls in."""
+    if not n_samples or n_samples < 1:
+        return "unknown"
+    label = SAMPLE_BUCKETS[0][0]
+    for name, low in SAMPLE_BUCKETS:
+        if n_samples >= low:
+            label = name
+    return label
+
+
+def newest_source_mtime(main_dir: str) -> Optional[float]:
+    """Newest ``kraken2/`` file mtime from the live results catalog.
+
+    None when no catalog covers ``main_dir`` yet (the freshness check has
+    not run) or the directory holds no Kraken2 output.
+    """
+    from nanometa_live.core.utils.results_catalog import live_catalog
+    from nanometa_live.core.utils.sample_detector import resolve_analysis_directory
+
+    if not main_dir:
+        return None
+    catalog = live_catalog(resolve_analysis_directory(main_dir))
+    if catalog is None:
+        return None
+    latest, n_files = catalog.subdir_summary("kraken2")
+    return latest if n_files and latest > 0 else None
+
+
+class AlertTrace:
+    """Stage timestamps for one render, relative to its source mtime."""
+
+    def __init__(self, tracker: "AlertLatencyTracker", surface: str,
+                 main_dir: str, source_mtime: Optional[float]):
+        self._tracker = tracker
+        self.surface = surface
+        self.main_dir = main_dir
+        self.source_mtime = source_mtime
+        self.marks: Dict[str, float] = {}
+
+    def mark(self, stage: str) -> None:
+        """Record that ``stage`` completed now."""
+        self.marks[stage] = time.time()
+
+    def finish(self, state: str, n_samples: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Mark ``response`` and record the trace; returns the event or None."""
+        self.mark("response")
+        return self._tracker.record(self, state, n_samples)
+
+
+class AlertLatencyTracker:
+    """Collects time-to-alert events, once per surface and data epoch."""
+
+    def __init__(self, max_events: int = MAX_EVENTS):
+        self._lock = threading.Lock()
+        # (main_dir, event); the directory is kept out of the logged event
+        # because the log already lives in it.
+        self._events: Deque[Tuple[str, Dict[str, Any]]] = deque(maxlen=max_events)
+        self._last_source: Dict[Tuple[str, str], float] = {}
+
+    def begin(self, surface: str, main_dir: str) -> AlertTrace:
+        """Open a trace stamped with the current data epoch's source mtime."""
+        try:
+            source = newest_source_mtime(main_dir)
+        except Exception:
+            logger.debug("Alert trace: no source stamp for %s", main_dir, exc_info=True)
+            source = None
+        return AlertTrace(self, surface, main_dir, source)
+
+    def record(self, trace: AlertTrace, state: str,
+               n_samples: Optional[int]) -> Optional[Dict[str, Any]]:
+        if trace.source_mtime is None or "loaded" not in trace.marks:
+            return None
+        key = (trace.surface, trace.main_dir)
+        with self._lock:
+            if self._last_source.get(key) == trace.source_mtime:
+                return None
+            self._last_source[key] = trace.source_mtime
+        event: Dict[str, Any] = {
+            "surface": trace.surface,
+            "state": state,
+            "samples": int(n_samples) if n_samples else None,
+            "source_mtime": round(trace.source_mtime, 3),
+            "recorded_at": round(trace.marks["response"], 3),
+        }
+        for stage in STAGES:
+            stamp = trace.marks.get(stage)
+            # A clock step or a network filesystem can put the mtime in the
+            # future; that is not a negative latency.
+            event[f"{stage}_s"] = (
+                round(max(0.0, stamp - trace.source_mtime), 3)
+                if stamp is not None else None
+            )
+        with self._lock:
+            self._events.append((trace.main_dir, event))
+        _append_log(trace.main_dir, event)
+        return event
+
+    def events(self, main_dir: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Recorded events, optionally only those for ``main_dir``."""
+        with self._lock:
+            return [e for d, e in self._events if main_dir is None or d == main_dir]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._last_source.clear()
+
+
+def latency_log_path(main_dir: str) -> str:
+    return os.path.join(main_dir, LATENCY_LOG_NAME)
+
+
+def _append_log(main_dir: str, event: Dict[str, Any]) -> None:
+    if not main_dir:
+        return
+    try:
+        with open(latency_log_path(main_dir), "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(event, sort_keys=True) + "\n")
+    except OSError as e:
+        # Read-only results (an archived run) must not break the render.
+        logger.debug("Alert latency log not written for %s: %s", main_dir, e)
+
+
+def load_latency_log(main_dir: str) -> List[Dict[str, Any]]:
+    """Events from the JSON log in ``main_dir``; [] when absent. Bad lines are skipped."""
+    events: List[Dict[str, Any]] = []
+    try:
+        with open(latency_log_path(main_dir), "r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(event, dict):
+                    events.append(event)
+    except OSError:
+        return []
+    return events
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _histogram(values: Iterable[float]) -> List[int]:
+    counts = [0] * (len(HISTOGRAM_BOUNDS_S) + 1)
+    for v in values:
+        for i, bound in enumerate(HISTOGRAM_BOUNDS_S):
+            if v <= bound:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+    return counts
+
+
+def summarise_events(events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """One row per (surface, state, sample bucket) with per-stage statistics.
+
+    Each stage carries ``n``, ``p50``, ``p95``, ``max`` (seconds) and a
+    ``histogram`` aligned with :data:`HISTOGRAM_BOUNDS_S` plus an open
+    last bucket. Rows are sorted by surface, state and bucket.
+    """
+    groups: Dict[Tuple[str, str, str], Dict[str, List[float]]] = {}
+    for event in events:
+        key = (
+            str(event.get("surface", "")),
+            str(event.get("state", "")),
+            sample_bucket(event.get("samples")),
+        )
+        stages = groups.setdefault(key, {stage: [] for stage in STAGES})
+        for stage in STAGES:
+            value = event.get(f"{stage}_s")
+            if isinstance(value, (int, float)):
+                stages[stage].append(float(value))
+
+    bucket_order = {label: i for i, (label, _low) in enumerate(SAMPLE_BUCKETS)}
+    rows = []
+    for (surface, state, bucket), stages in sorted(
+        groups.items(),
+        key=lambda item: (item[0][0], item[0][1], bucket_order.get(item[0][2], 99)),
+    ):
+        row: Dict[str, Any] = {"surface": surface, "state": state, "samples": bucket}
+        for stage, values in stages.items():
+            row[stage] = {
+                "n": len(values),
+                "p50": round(_percentile(values, 50), 3) if values else None,
+                "p95": round(_percentile(values, 95), 3) if values else None,
+                "max": round(max(values), 3) if values else None,
+                "histogram": _histogram(values),
+            }
+        rows.append(row)
+    return rows
+
+
+_tracker = AlertLatencyTracker()
+
+
+def begin_alert_trace(surface: str, main_dir: str) -> AlertTrace:
+    """Open a trace on the process-wide tracker."""
+    return _tracker.begin(surface, main_dir)
+
+
+def alert_latency_summary(main_dir: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Summary rows for this session, or from ``main_dir``'s log when there are none."""
+    events = _tracker.events(main_dir)
+    if not events and main_dir:
+        events = load_latency_log(main_dir)
+    return summarise_events(events)
+
+
+def clear_alert_latency() -> None:
+    """Forget in-memory events and the per-epoch dedup state."""
+    _tracker.clear()
@@ -35,14 +35,23 @@ def atomic_write_text(path: Path | str, text: str) -> None:
     not cross filesystems), writes the contents, fsyncs, then renames
     onto the target. On any error the temp file is removed.
     """
+    _atomic_write(path, text, "w")
+
+
+def atomic_write_bytes(path: Path | str, data: bytes) -> None:
+    """Binary counterpart of :func:`atomic_write_text`."""
+    _atomic_write(path, data, "wb")
+
+
+def _atomic_write(path: Path | str, contents, mode: str) -> None:
     dest = Path(path)
     dest.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_name = tempfile.mkstemp(
         prefix=f".{dest.name}.", suffix=".tmp", dir=str(dest.parent)
     )
     try:
-        with os.fdopen(fd, "w") as f:
-            f.write(text)
+        with os.fdopen(fd, mode) as f:
+            f.write(contents)
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp_name, dest)
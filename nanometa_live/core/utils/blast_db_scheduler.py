@@ -0,0 +1,408 @@
+"""
+Resource-aware makeblastdb scheduling and consolidated BLAST databases.
+
+``build_blast_dbs_batch`` used to hand every taxid to a fixed-size thread
+pool: one ``makeblastdb`` per genome, as many at once as the pool allowed,
+regardless of what else the host was doing. With a few hundred watchlist
+genomes that meant hundreds of process spawns, hundreds of three-file
+databases, and a write burst that starved the dashboard on a laptop disk.
+
+:class:`BuildScheduler` sizes concurrency from what the host has free right
+now:
+
+* **cores** -- cores not already busy (``os.getloadavg``), two per build;
+* **disk** -- a short timed write in the BLAST directory, against the rate
+  one ``makeblastdb`` sustains;
+* **memory** -- each build reserves an estimate derived from its genome's
+  size, and a build only starts once its reservation fits in half of the
+  available memory. One build always runs, however large.
+
+Jobs start largest-first, so one big genome does not run alone at the end.
+
+:func:`build_consolidated_db` is the alternative for large watchlists. All
+genomes go into one database in a single ``makeblastdb`` run, with a
+``-taxid_map`` so hits carry their taxid. Each genome's sequences occupy a
+contiguous OID range, and for each taxid a ``blast/<taxid>.fasta.nal`` alias
+restricts the combined database to that range (``FIRST_OID``/``LAST_OID``,
+1-based and inclusive). ``blastn -db blast/<taxid>.fasta`` therefore still
+searches exactly one genome, and ``GenomeDownloadManager.get_blast_db_path``
+keeps returning ``blast/<taxid>.fasta``. The ranges assume one OID per
+header written, so records without residues (which ``makeblastdb`` drops)
+are left out, and the built database's sequence count is checked with
+``blastdbcmd -info`` before any alias is written.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONSOLIDATED_PREFIX = "consolidated_"
+ALIAS_SUFFIX = ".fasta.nal"
+
+# Cores one makeblastdb keeps busy (it is single-threaded, plus I/O wait).
+_CORES_PER_BUILD = 2
+# Sustained write rate of one makeblastdb, MB/s. Concurrency beyond
+# disk_mbps / this only queues writes.
+_BUILD_WRITE_MBPS = 40.0
+# Fixed overhead of a makeblastdb process, MB, before the genome itself.
+_BASE_BUILD_MB = 64.0
+# Share of currently available memory that concurrent builds may reserve.
+_MEMORY_FRACTION = 0.5
+# gzip'd genomes are roughly this much larger once decompressed.
+_GZIP_RATIO = 3.5
+_DISK_PROBE_MB = 8
+
+_BUILD_ERRORS = (subprocess.CalledProcessError, subprocess.TimeoutExpired,
+                 FileNotFoundError, PermissionError, OSError)
+
+_disk_probe_lock = threading.Lock()
+_disk_probe_cache: Dict[str, Optional[float]] = {}
+
+
+def measure_disk_mbps(directory: Path, probe_mb: int = _DISK_PROBE_MB) -> Optional[float]:
+    """Timed, fsync'd write of ``probe_mb`` MB in ``directory``; cached per dir.
+
+    Returns None when the probe cannot run (read-only or full disk).
+    """
+    key = str(directory)
+    with _disk_probe_lock:
+        if key in _disk_probe_cache:
+            return _disk_probe_cache[key]
+        mbps: Optional[float] = None
+        chunk = b"\x5a" * (1024 * 1024)
+        try:
+            fd, tmp = tempfile.mkstemp(prefix=".disk_probe_", dir=key)
+            try:
+                start = time.perf_counter()
+                with os.fdopen(fd, "wb") as f:
+                    for _ in range(probe_mb):
+                        f.write(chunk)
+                    f.flush()
+                    os.fsync(f.fileno())
+                elapsed = time.perf_counter() - start
+            finally:
+                os.unlink(tmp)
+            mbps = probe_mb / elapsed if elapsed > 0 else None
+        except OSError as e:
+            logger.debug(f"Disk throughput probe failed in {directory}: {e}")
+        _disk_probe_cache[key] = mbps
+        return mbps
+
+
+@dataclass(frozen=True)
+class BuildResources:
+    """What the host can give makeblastdb right now."""
+
+    free_cores: float
+    available_mb: Optional[float] = None
+    disk_mbps: Optional[float] = None
+
+    @classmethod
+    def detect(cls, directory: Path) -> "BuildResources":
+        cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") \
+            else (os.cpu_count() or 1)
+        try:
+            busy = os.getloadavg()[0]
+        except (AttributeError, OSError):
+            busy = 0.0
+        try:
+            import psutil
+            available_mb = psutil.virtual_memory().available / (1024 * 1024)
+        except (ImportError, OSError):
+            available_mb = None
+        return cls(
+            free_cores=max(1.0, cores - busy),
+            available_mb=available_mb,
+            disk_mbps=measure_disk_mbps(directory),
+        )
+
+
+def estimate_build_mb(genome_path: Path) -> Tuple[float, float]:
+    """``(genome_mb, reservation_mb)`` for building a DB from ``genome_path``."""
+    try:
+        size_mb = genome_path.stat().st_size / (1024 * 1024)
+    except OSError:
+        size_mb = 0.0
+    if str(genome_path).lower().endswith(".gz"):
+        size_mb *= _GZIP_RATIO
+    return size_mb, _BASE_BUILD_MB + size_mb
+
+
+@dataclass
+class BuildJob:
+    """One database to build; ``key`` is what the build callable receives."""
+
+    key: Any
+    genome_path: Path
+    size_mb: float = 0.0
+    memory_mb: float = 0.0
+
+    @classmethod
+    def for_genome(cls, key: Any, genome_path: Path) -> "BuildJob":
+        size_mb, memory_mb = estimate_build_mb(genome_path)
+        return cls(key, genome_path, size_mb, memory_mb)
+
+
+@dataclass
+class BuildStats:
+    """How the last :meth:`BuildScheduler.run` went."""
+
+    workers: int = 0
+    memory_budget_mb: Optional[float] = None
+    peak_running: int = 0
+    seconds: float = 0.0
+    order: List[Any] = field(default_factory=list)
+
+
+class BuildScheduler:
+    """Run build jobs under core, disk and memory limits.
+
+    Args:
+        resources: Host capacity, normally ``BuildResources.detect(blast_dir)``.
+        max_workers: Hard ceiling on concurrent builds, applied on top of the
+            resource-derived limit.
+    """
+
+    def __init__(self, resources: BuildResources, max_workers: Optional[int] = None):
+        self.resources = resources
+        self.max_workers = max_workers
+        self.stats = BuildStats()
+
+    def workers_for(self, jobs: List[BuildJob]) -> int:
+        limits = [len(jobs), int(self.resources.free_cores // _CORES_PER_BUILD)]
+        if self.resources.disk_mbps:
+            limits.append(int(self.resources.disk_mbps // _BUILD_WRITE_MBPS))
+        if self.max_workers:
+            limits.append(self.max_workers)
+        return max(1, min(limits))
+
+    def memory_budget_mb(self) -> Optional[float]:
+        if self.resources.available_mb is None:
+            return None
+        return self.resources.available_mb * _MEMORY_FRACTION
+
+    def run(self, jobs: Iterable[BuildJob], build: Callable[[Any], Any]) -> Dict[Any, Any]:
+        """Run ``build(job.key)`` for every job; return ``{key: result}``.
+
+        A build that raises yields False: OS and subprocess errors are
+        expected, anything else is logged with its traceback as well.
+        """
+        ordered = sorted(jobs, key=lambda j: j.size_mb, reverse=True)
+        workers = self.workers_for(ordered)
+        budget = self.memory_budget_mb()
+        self.stats = stats = BuildStats(workers=workers, memory_budget_mb=budget)
+        results: Dict[Any, Any] = {}
+        cond = threading.Condition()
+        running = [0, 0.0]  # builds in flight, MB reserved
+        start = time.perf_counter()
+
+        def run_one(job: BuildJob) -> None:
+            try:
+                results[job.key] = build(job.key)
+            except _BUILD_ERRORS as e:
+                logger.exception(f"BLAST DB build failed for {job.key}: {e}")
+                results[job.key] = False
+            finally:
+                with cond:
+                    running[0] -= 1
+                    running[1] -= job.memory_mb
+                    cond.notify_all()
+
+        if ordered:
+            logger.info(
+                f"Building {len(ordered)} BLAST databases (workers={workers}, "
+                f"memory budget={'unbounded' if budget is None else f'{budget:.0f} MB'})"
+            )
+        futures = {}
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="makeblastdb") as pool:
+            for job in ordered:
+                with cond:
+                    while running[0] >= workers or (
+                            budget is not None and running[0]
+                            and running[1] + job.memory_mb > budget):
+                        cond.wait()
+                    running[0] += 1
+                    running[1] += job.memory_mb
+                    stats.peak_running = max(stats.peak_running, running[0])
+                    stats.order.append(job.key)
+                futures[job.key] = pool.submit(run_one, job)
+        for key, future in futures.items():
+            try:
+                future.result()
+            except Exception:
+                logger.exception(f"BLAST DB build for {key} raised unexpectedly")
+                results[key] = False
+        stats.seconds = time.perf_counter() - start
+        return results
+
+
+def _open_genome(path: Path):
+    return gzip.open(path, "rb") if str(path).lower().endswith(".gz") else open(path, "rb")
+
+
+def _write_combined_fasta(
+    genomes: Dict[int, Path], fasta_out: Path, map_out: Path,
+) -> Dict[int, Tuple[int, int]]:
+    """Concatenate genomes with taxid-tagged ids; return 1-based OID ranges.
+
+    Sequence ids are rewritten to ``t<taxid>_<n>`` so they are unique across
+    genomes and parse cleanly under ``-parse_seqids``. The original header
+    text is kept as the title. A header is only written once its record
+    has residues: ``makeblastdb`` drops empty records, which would shift
+    every later OID.
+    """
+    ranges: Dict[int, Tuple[int, int]] = {}
+    oid = 0
+    with open(fasta_out, "wb") as fasta, open(map_out, "w") as taxid_map:
+        for taxid in sorted(genomes):
+            first = oid + 1
+            n = 0
+            pending = None
+            line = b"\n"
+            with _open_genome(genomes[taxid]) as src:
+                for line in src:
+                    if line.startswith(b">"):
+                        pending = line[1:].lstrip()
+                    elif pending is not None and line.strip():
+                        n += 1
+                        seqid = f"t{taxid}_{n}"
+                        fasta.write(b">" + seqid.encode() + b" " + pending)
+                        taxid_map.write(f"{seqid} {taxid}\n")
+                        pending = None
+                        fasta.write(line)
+                    elif line.strip():
+                        fasta.write(line)
+            if not line.endswith(b"\n"):
+                fasta.write(b"\n")
+            if n:
+                oid += n
+                ranges[taxid] = (first, oid)
+    return ranges
+
+
+def consolidated_name(genomes: Dict[int, Path]) -> str:
+    """Stable database name for this exact set of genome files."""
+    digest = hashlib.sha1()
+    for taxid in sorted(genomes):
+        st = genomes[taxid].stat()
+        digest.update(f"{taxid}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return CONSOLIDATED_PREFIX + digest.hexdigest()[:12]
+
+
+def _write_alias(blast_dir: Path, taxid: int, db_name: str, oids: Tuple[int, int]) -> Path:
+    from nanometa_live.core.utils.atomic_write import atomic_write_text
+    alias = blast_dir / f"{taxid}{ALIAS_SUFFIX}"
+    atomic_write_text(alias, (
+        "#\n"
+        f"# Alias file created by nanometa-live: taxid {taxid} in {db_name}\n"
+        "#\n"
+        f"TITLE taxid {taxid}\n"
+        f"DBLIST {db_name}\n"
+        f"FIRST_OID {oids[0]}\n"
+        f"LAST_OID {oids[1]}\n"
+    ))
+    return alias
+
+
+def read_alias(alias: Path) -> Dict[str, str]:
+    """``{KEY: value}`` for a BLAST alias (``.nal``) file."""
+    values: Dict[str, str] = {}
+    for line in alias.read_text().splitlines():
+        if line and not line.startswith("#"):
+            key, _, value = line.partition(" ")
+            values[key] = value.strip()
+    return values
+
+
+def _db_sequence_count(db_path: Path, timeout: int = 300) -> int:
+    """Sequences in a BLAST database, from ``blastdbcmd -info``."""
+    result = subprocess.run(["blastdbcmd", "-db", str(db_path), "-info"],
+                            capture_output=True, text=True, timeout=timeout, check=True)
+    match = re.search(r"([\d,]+) sequences", result.stdout)
+    if match is None:
+        raise ValueError(f"no sequence count in blastdbcmd -info for {db_path.name}")
+    return int(match.group(1).replace(",", ""))
+
+
+def build_consolidated_db(
+    genomes: Dict[int, Path], blast_dir: Path, timeout: int = 3600,
+) -> Tuple[List[int], Optional[str]]:
+    """Build one database for ``genomes`` and a per-taxid alias into it.
+
+    Returns ``(taxids that now have an alias, reason_on_failure)``. Genomes
+    with no sequences get no alias.
+    """
+    if not genomes:
+        return [], None
+    db_name = consolidated_name(genomes)
+    db_path = blast_dir / db_name
+    fasta_out = blast_dir / f".{db_name}.fa"
+    map_out = blast_dir / f".{db_name}.taxid_map"
+    try:
+        ranges = _write_combined_fasta(genomes, fasta_out, map_out)
+        if not ranges:
+            return [], "no sequences in any genome"
+        cmd = ["makeblastdb", "-in", str(fasta_out), "-dbtype", "nucl",
+               "-out", str(db_path), "-title", db_name,
+               "-parse_seqids", "-taxid_map", str(map_out)]
+        logger.info(f"Building consolidated BLAST database {db_name} "
+                    f"for {len(ranges)} genomes")
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        if result.returncode != 0:
+            lines = (result.stderr or "").strip().splitlines()
+            logger.error(f"makeblastdb failed for {db_name}: {result.stderr}")
+            return [], lines[-1] if lines else f"exit code {result.returncode}"
+        expected = max(last for _, last in ranges.values())
+        count = _db_sequence_count(db_path)
+        if count != expected:
+            # The OID ranges would point aliases at the wrong genomes.
+            logger.error(f"{db_name} holds {count} sequences, expected {expected}; "
+                         "not writing per-taxid aliases")
+            prune_consolidated(blast_dir)
+            return [], f"sequence count mismatch ({count} != {expected})"
+        for taxid, oids in ranges.items():
+            _write_alias(blast_dir, taxid, db_name, oids)
+    except (*_BUILD_ERRORS, ValueError) as e:
+        logger.exception(f"Failed to build consolidated BLAST database: {e}")
+        return [], str(e)
+    finally:
+        for tmp in (fasta_out, map_out):
+            try:
+                tmp.unlink()
+            except FileNotFoundError:
+                pass
+    prune_consolidated(blast_dir)
+    return sorted(ranges), None
+
+
+def prune_consolidated(blast_dir: Path) -> int:
+    """Delete consolidated databases that no alias refers to any more."""
+    referenced = set()
+    for alias in blast_dir.glob(f"*{ALIAS_SUFFIX}"):
+        try:
+            referenced.add(read_alias(alias).get("DBLIST", ""))
+        except OSError:
+            continue
+    removed = 0
+    for path in blast_dir.glob(f"{CONSOLIDATED_PREFIX}*"):
+        if path.name.split(".", 1)[0] not in referenced:
+            try:
+                path.unlink() if path.is_file() else shutil.rmtree(path)
+                removed += 1
+            except OSError as e:
+                logger.debug(f"Could not remove stale {path}: {e}")
+    return removed
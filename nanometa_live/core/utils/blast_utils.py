@@ -133,12 +133,13 @@ def check_blast_dbs_exist(
             os.makedirs(blast_dir, exist_ok=True)
             logging.info(f"Created BLAST database directory at {blast_dir}")
 
-        # Check for each species
+        # Check for each species: a per-taxid database has a .nhr header
+        # index, a consolidated one a .nal alias into the combined database.
         for species, taxid in species_to_taxid.items():
             taxid_str = str(taxid)
-            blast_db_file = os.path.join(blast_dir, f"{taxid_str}.fasta.nhr")
+            blast_db = os.path.join(blast_dir, f"{taxid_str}.fasta")
 
-            if not os.path.exists(blast_db_file):
+            if not any(os.path.exists(blast_db + ext) for ext in (".nhr", ".nal")):
                 logging.info(
                     f"BLAST database missing for {species} (taxid: {taxid_str})"
                 )
@@ -186,9 +187,8 @@ def run_blast_validation(
             logging.error(f"Query file {query_file} does not exist")
             return False
 
-        # Check if database exists
-        db_check_file = f"{db_file}.nsq"
-        if not os.path.exists(db_check_file):
+        # Check if database exists (a .nal alias for consolidated databases)
+        if not (os.path.exists(f"{db_file}.nsq") or os.path.exists(f"{db_file}.nal")):
             logging.error(f"BLAST database {db_file} does not exist")
             return False
 
@@ -0,0 +1,330 @@
+"""
+Bounded, instrumented in-process caches and the registry that clears them.
+
+The loaders grew a dozen module-level caches, each with its own eviction
+rule: TTL plus an entry cap swept once a minute, a hand-rolled LRU, or no
+bound at all. Nothing capped their combined size on a long run, and every
+new cache had to be added by hand to ``scripts/perf/instrument.reset_caches``
+and ``clear_all_loader_caches`` -- forgetting one silently left the scaling
+harness measuring warm "cold" cells.
+
+:class:`BoundedCache` is a thread-safe mapping with optional bounds on
+entries (``max_entries``), estimated bytes (``max_bytes``) and age
+(``ttl``), evicting least-recently-used entries first. It counts hits,
+misses and evictions per cache (:func:`cache_stats`, and ``/metrics`` via
+``metrics_endpoint``). Because it is a ``MutableMapping``, it replaces a
+module-level ``dict`` or ``OrderedDict`` without touching call sites that
+only index, test membership or clear.
+
+Every cache registers itself by name. :func:`clear_caches` clears the
+registry: ``clear_all_loader_caches`` clears the run-scoped caches at a
+run boundary, and ``reset_caches`` in the perf harness clears all of them.
+A cache holding process-wide data (the Kraken2 taxonomy) opts out of run
+boundaries with ``run_scoped=False``.
+
+The operator caps the combined estimate with ``NANOMETA_CACHE_MAX_MB``
+(default ``DEFAULT_CACHE_MAX_MB``; ``0`` disables the cap). Over the cap,
+the least-recently-used entry across all registered caches is evicted
+until the total fits. Sizes are estimates (:func:`estimate_size`): exact
+for arrays and fixed-width columns, sampled for strings and large
+containers. An entry that pins data held by another cache stores that
+cache's key, or is charged in full, never as zero.
+
+The cap covers every registered cache, which includes all the large ones:
+the loader and report-frame caches, JSON digests, the validation file
+ledger and merged results, coverage pyramids, the per-sample attribution
+memo, abundance series, the Kraken2 read-profile store and the
+shared-frame mappings. It does not cover the watchlist match caches (one
+per database), the render fingerprints in ``debounce``, or anything on
+disk.
+"""
+
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+#: Environment variable holding the global cap in megabytes.
+CACHE_MEMORY_ENV = "NANOMETA_CACHE_MAX_MB"
+DEFAULT_CACHE_MAX_MB = 2048
+#: Container elements measured before the rest are extrapolated.
+SIZE_SAMPLE = 64
+
+_registry_lock = threading.Lock()
+_registry: Dict[str, "BoundedCache"] = {}
+# Global recency, so the cap can evict the oldest entry across caches.
+_ticks = itertools.count()
+
+
+def _limit_from_env() -> Optional[int]:
+    raw = os.environ.get(CACHE_MEMORY_ENV, "").strip()
+    try:
+        mb = float(raw) if raw else DEFAULT_CACHE_MAX_MB
+    except ValueError:
+        logger.warning("Ignoring %s=%r: not a number", CACHE_MEMORY_ENV, raw)
+        mb = DEFAULT_CACHE_MAX_MB
+    return int(mb * 1024 * 1024) if mb > 0 else None
+
+
+_limit_bytes: Optional[int] = _limit_from_env()
+
+
+def _frame_size(frame) -> int:
+    """Fixed-width columns by dtype, string payloads sampled.
+
+    ``memory_usage(deep=True)`` costs milliseconds per frame, paid on every
+    store; this costs tens of microseconds.
+    """
+    rows = len(frame)
+    if isinstance(frame, pd.Series):
+        columns = [(frame.dtype, lambda: frame.values)]
+    else:
+        columns = [(dtype, lambda name=name: frame[name].values)
+                   for name, dtype in zip(frame.columns, frame.dtypes)]
+    total = rows * 8  # index
+    for dtype, values in columns:
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+            total += rows * dtype.itemsize
+            continue
+        total += rows * 8
+        if isinstance(dtype, pd.CategoricalDtype):
+            continue
+        sample = np.ravel(np.asarray(values()[:SIZE_SAMPLE], dtype=object))
+        if len(sample):
+            total += sum(sys.getsizeof(v) for v in sample) * rows // len(sample)
+    return total
+
+
+def estimate_size(value: Any, _depth: int = 3) -> int:
+    """Approximate bytes held by ``value``.
+
+    Frames, series and arrays report their buffers, with object and string
+    columns extrapolated from their first ``SIZE_SAMPLE`` values.
+    Containers are summed to ``_depth`` levels, extrapolating from the
+    first ``SIZE_SAMPLE`` elements of larger ones.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return _frame_size(value)
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage(deep=False))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes) + 112
+    size = sys.getsizeof(value, 64)
+    if _depth <= 0 or isinstance(value, (str, bytes, bytearray, int, float)):
+        return size
+    if isinstance(value, dict):
+        items: Any = value.items()
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = value
+    else:
+        return size
+    n = len(value)
+    sample = list(itertools.islice(items, SIZE_SAMPLE))
+    if not sample:
+        return size
+    measured = sum(estimate_size(v, _depth - 1) for v in sample)
+    return size + measured * n // len(sample)
+
+
+class BoundedCache(MutableMapping):
+    """An LRU mapping bounded by entries, estimated bytes and age.
+
+    Reads (``get``, ``[]``) count a hit or a miss and refresh recency;
+    membership tests count neither. A value larger than the byte budget is
+    not stored.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        run_scoped: bool = True,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.run_scoped = run_scoped
+        self._sizeof = sizeof
+        self._lock = threading.RLock()
+        # key -> [value, size, stored_at, tick]
+        self._entries: "OrderedDict[Hashable, List[Any]]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions: Dict[str, int] = {}
+        with _registry_lock:
+            _registry[name] = self
+
+    # -- mapping protocol -------------------------------------------------
+    def _live(self, key: Hashable) -> Optional[List[Any]]:
+        """The entry for ``key`` unless absent or expired. Caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is not None and self.ttl is not None and time.time() - entry[2] > self.ttl:
+            self._drop(key, "ttl")
+            return None
+        return entry
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            entry[3] = next(_ticks)
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                self.misses += 1
+                raise KeyError(key)
+            self.hits += 1
+            entry[3] = next(_ticks)
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return self._live(key) is not None
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        size = self._sizeof(value)
+        limit = _limit_bytes
+        with self._lock:
+            if key in self._entries:
+                self._drop(key, None)
+            if (self.max_bytes is not None and size > self.max_bytes) or (
+                    limit is not None and size > limit):
+                self._count("oversize")
+                return
+            self._entries[key] = [value, size, time.time(), next(_ticks)]
+            self.bytes += size
+            while self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)), "entries")
+            while self.max_bytes is not None and self.bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)), "bytes")
+        _enforce_memory_limit()
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            if key not in self._entries:
+                raise KeyError(key)
+            self._drop(key, None)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            keys = list(self._entries)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    # -- eviction ---------------------------------------------------------
+    def _count(self, reason: str) -> None:
+        self.evictions[reason] = self.evictions.get(reason, 0) + 1
+
+    def _drop(self, key: Hashable, reason: Optional[str]) -> None:
+        entry = self._entries.pop(key)
+        self.bytes -= entry[1]
+        if reason is not None:
+            self._count(reason)
+
+    def expire(self) -> int:
+        """Drop every entry older than ``ttl``; returns how many went."""
+        if self.ttl is None:
+            return 0
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            stale = [k for k, e in self._entries.items() if e[2] < cutoff]
+            for key in stale:
+                self._drop(key, "ttl")
+        return len(stale)
+
+    def _oldest_tick(self) -> Optional[int]:
+        with self._lock:
+            if not self._entries:
+                return None
+            # Reads move entries to the end, so the first is the least recent.
+            return next(iter(self._entries.values()))[3]
+
+    def _evict_oldest(self) -> int:
+        with self._lock:
+            if not self._entries:
+                return 0
+            key = next(iter(self._entries))
+            size = self._entries[key][1]
+            self._drop(key, "memory")
+            return size
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.bytes,
+                    "hits": self.hits, "misses": self.misses,
+                    "evictions": dict(self.evictions)}
+
+
+def registered_caches() -> List[BoundedCache]:
+    with _registry_lock:
+        return list(_registry.values())
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """``{name: stats}`` for every registered cache."""
+    return {cache.name: cache.stats() for cache in registered_caches()}
+
+
+def clear_caches(run_scoped_only: bool = False) -> None:
+    """Clear every registered cache, or only the run-scoped ones."""
+    for cache in registered_caches():
+        if cache.run_scoped or not run_scoped_only:
+            cache.clear()
+
+
+def set_cache_memory_limit(megabytes: Optional[float]) -> None:
+    """Set the global cap (``None`` or ``0`` removes it) and enforce it now."""
+    global _limit_bytes
+    _limit_bytes = int(megabytes * 1024 * 1024) if megabytes else None
+    _enforce_memory_limit()
+
+
+def cache_memory_limit() -> Optional[int]:
+    """The global cap in bytes, or None when uncapped."""
+    return _limit_bytes
+
+
+def _enforce_memory_limit() -> None:
+    """Evict the globally least-recently-used entries until under the cap."""
+    limit = _limit_bytes
+    if limit is None:
+        return
+    caches = registered_caches()
+    total = sum(cache.bytes for cache in caches)
+    while total > limit:
+        candidates = [(tick, cache) for cache in caches
+                      if (tick := cache._oldest_tick()) is not None]
+        if not candidates:
+            break
+        total -= min(candidates, key=lambda c: c[0])[1]._evict_oldest()
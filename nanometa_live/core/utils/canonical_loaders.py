@@ -15,6 +15,8 @@ from typing import Any, Dict, List, Optional
 
 import pandas as pd
 
+from nanometa_live.core.utils.results_catalog import scan_exists
+
 
 def load_manifest(results_dir: str) -> Optional[Dict[str, Any]]:
     """
@@ -31,7 +33,7 @@ def load_manifest(results_dir: str) -> Optional[Dict[str, Any]]:
         Parsed manifest dictionary, or None if not found or invalid.
     """
     path = os.path.join(results_dir, "canonical", "_manifest.json")
-    if not os.path.exists(path):
+    if not scan_exists(path):
         return None
     try:
         with open(path, "r") as f:
@@ -63,7 +65,7 @@ def load_canonical_classification(
         results_dir, "canonical", "classification",
         f"{sample_id}.classification.json",
     )
-    if not os.path.exists(path):
+    if not scan_exists(path):
         return None
     try:
         with open(path, "r") as f:
@@ -137,7 +139,7 @@ def load_canonical_qc_stats(
         results_dir, "canonical", "qc",
         f"{sample_id}.qc_stats.json",
     )
-    if not os.path.exists(path):
+    if not scan_exists(path):
         return None
     try:
         with open(path, "r") as f:
@@ -188,7 +190,7 @@ def load_canonical_validation(
     path = os.path.join(
         results_dir, "canonical", "validation", "validation_results.json"
     )
-    if not os.path.exists(path):
+    if not scan_exists(path):
         return None
     try:
         with open(path, "r") as f:
@@ -217,7 +219,7 @@ def load_canonical_assembly(
         results_dir, "canonical", "assembly",
         f"{sample_id}.assembly_stats.json",
     )
-    if not os.path.exists(path):
+    if not scan_exists(path):
         return None
     try:
         with open(path, "r") as f:
@@ -5,17 +5,23 @@ Functions for loading and parsing Kraken2 taxonomic classification reports,
 with support for batch aggregation, cumulative reports, and caching.
 """
 
-import glob
 import logging
 import os
 import re
 import threading
 import time
-from collections import OrderedDict
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
 
+from nanometa_live.core.utils.bounded_cache import BoundedCache
 from nanometa_live.core.utils.canonical_loaders import load_canonical_classification
+from nanometa_live.core.utils.metrics import cache_lookup, timed_loader
+from nanometa_live.core.utils.results_catalog import (
+    scan_exists,
+    scan_glob,
+    scan_isdir,
+    scan_listdir,
+)
 from nanometa_live.core.utils.sample_detector import (
     get_available_samples,
     resolve_analysis_directory
@@ -30,7 +36,9 @@ from nanometa_live.core.utils.loader_utils import (
     _mtime_cache_state,
     _store_mtime_cache,
     _get_parse_lock,
+    _get_path_fingerprint,
 )
+from nanometa_live.core.utils.shared_frames import shared_store
 
 
 # Expected columns for Kraken2 report format
@@ -58,8 +66,14 @@ KRAKEN2_EXPECTED_COLUMN_COUNT = 6
 # retried on the next poll (its mtime is unchanged once it stabilises, so the
 # key alone could not distinguish "unstable then" from "stable now").
 _REPORT_FRAME_CACHE_MAX = 512
-_report_frame_cache: "OrderedDict[Tuple[str, int, int], pd.DataFrame]" = OrderedDict()
+_REPORT_FRAME_CACHE_MAX_BYTES = 512 * 1024 * 1024
+_report_frame_cache = BoundedCache(
+    "report_frame", max_entries=_REPORT_FRAME_CACHE_MAX,
+    max_bytes=_REPORT_FRAME_CACHE_MAX_BYTES)
 _report_frame_cache_lock = threading.Lock()
+_FRAME_HIT = cache_lookup("report_frame", "hit")
+_FRAME_MISS = cache_lookup("report_frame", "miss")
+_KRAKEN_TTL_HIT = cache_lookup("kraken_ttl", "hit")
 
 # Last successful parse per physical report, keyed on realpath alone. Served
 # when the CURRENT file state is transiently unparseable -- nanometanf
@@ -72,14 +86,16 @@ _report_frame_cache_lock = threading.Lock()
 # better than a missing sample. A stable re-parse replaces the entry, and a
 # report the finder no longer lists is never resurrected -- the fallback
 # only answers for paths a caller still asks about.
-_last_good_frame: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+# Holds the parse's _report_frame_cache key, not the frame, so the frame is
+# charged once; if the frame cache has evicted it there is no fallback.
+_last_good_key = BoundedCache("report_last_good", max_entries=_REPORT_FRAME_CACHE_MAX)
 
 
 def clear_report_frame_cache() -> None:
     """Drop the per-file parsed-frame cache (test/teardown helper)."""
     with _report_frame_cache_lock:
         _report_frame_cache.clear()
-        _last_good_frame.clear()
+        _last_good_key.clear()
 
 
 def _diagnose_empty_kraken_dir(kraken_dir: str, sample: Optional[str] = None) -> str:
@@ -148,17 +164,17 @@ def _scan_subdirs_for_pattern(
     """
     results: List[str] = []
     try:
-        entries = os.listdir(parent_dir)
+        entries = scan_listdir(parent_dir)
     except OSError:
         return results
     for entry in entries:
         entry_path = os.path.join(parent_dir, entry)
-        if not os.path.isdir(entry_path):
+        if not scan_isdir(entry_path):
             continue
         scan_path = os.path.join(entry_path, subdir) if subdir else entry_path
-        if not os.path.isdir(scan_path):
+        if not scan_isdir(scan_path):
             continue
-        results.extend(glob.glob(os.path.join(scan_path, file_pattern)))
+        results.extend(scan_glob(os.path.join(scan_path, file_pattern)))
     return results
 
 
@@ -198,17 +214,19 @@ def _parse_kraken2_report(filepath: str, check_stability: bool = True) -> Option
     with _report_frame_cache_lock:
         cached = _report_frame_cache.get(key)
         if cached is not None:
-            _report_frame_cache.move_to_end(key)  # LRU bump
+            _FRAME_HIT.inc()
             return cached
 
+    _FRAME_MISS.inc()
     df = _parse_kraken2_report_uncached(filepath, check_stability)
     if df is None:
         # Transient (unstable/empty/malformed) -- do not cache the miss, but
         # serve the last successful parse of this physical report so the
         # sample does not vanish from the aggregate for the poll that landed
-        # inside nanometanf's per-batch rewrite window (see _last_good_frame).
+        # inside nanometanf's per-batch rewrite window (see _last_good_key).
         with _report_frame_cache_lock:
-            fallback = _last_good_frame.get(key[0])
+            good = _last_good_key.get(key[0])
+            fallback = _report_frame_cache.get(good) if good is not None else None
         if fallback is not None:
             logging.debug(
                 "Report transiently unparseable; serving last good parse: %s",
@@ -218,13 +236,7 @@ def _parse_kraken2_report(filepath: str, check_stability: bool = True) -> Option
 
     with _report_frame_cache_lock:
         _report_frame_cache[key] = df
-        _report_frame_cache.move_to_end(key)
-        while len(_report_frame_cache) > _REPORT_FRAME_CACHE_MAX:
-            _report_frame_cache.popitem(last=False)
-        _last_good_frame[key[0]] = df
-        _last_good_frame.move_to_end(key[0])
-        while len(_last_good_frame) > _REPORT_FRAME_CACHE_MAX:
-            _last_good_frame.popitem(last=False)
+        _last_good_key[key[0]] = key
     return df
 
 
@@ -380,7 +392,7 @@ def _is_incremental_layout(kraken_dir: str, sample: Optional[str] = None) -> boo
     Returns:
         True if a per-sample ``stats/batch_*_report_stats.json`` is found.
     """
-    if not os.path.isdir(kraken_dir):
+    if not scan_isdir(kraken_dir):
         return False
 
     samples_to_check: List[str]
@@ -389,18 +401,18 @@ def _is_incremental_layout(kraken_dir: str, sample: Optional[str] = None) -> boo
     else:
         try:
             samples_to_check = [
-                entry for entry in os.listdir(kraken_dir)
-                if os.path.isdir(os.path.join(kraken_dir, entry))
+                entry for entry in scan_listdir(kraken_dir)
+                if scan_isdir(os.path.join(kraken_dir, entry))
             ]
         except OSError:
             return False
 
     for sample_name in samples_to_check:
         stats_dir = os.path.join(kraken_dir, sample_name, "stats")
-        if not os.path.isdir(stats_dir):
+        if not scan_isdir(stats_dir):
             continue
         try:
-            for entry in os.listdir(stats_dir):
+            for entry in scan_listdir(stats_dir):
                 if entry.startswith("batch_") and entry.endswith("_report_stats.json"):
                     return True
         except OSError:
@@ -481,6 +493,7 @@ def _deduplicate_batch_files(filepaths: List[str]) -> List[str]:
     return result
 
 
+@timed_loader("load_kraken_data")
 def load_kraken_data(main_dir: str, sample: Optional[str] = None) -> pd.DataFrame:
     """
     Load Kraken2 classification data for a specific sample or all samples.
@@ -531,10 +544,10 @@ def load_kraken_data(main_dir: str, sample: Optional[str] = None) -> pd.DataFram
 
     # Fast mtime-based check: if the kraken2 directory has not changed,
     # return the previously cached result without any parsing or TTL lookup.
-    # NOTE: .copy() on cache returns has been removed. All callback callers
-    # that mutate the DataFrame already copy() before modification (verified
-    # in main_tab.py, classification_tab.py). The cache stores its own copy
-    # at write time, so the cached object is safe.
+    # Hits are handed out through _handout: the cached frame may be a
+    # shared, read-only one that was stored without a defensive copy, and a
+    # caller's in-place edit must not reach it. Under copy-on-write that is
+    # a shallow copy, not the full copy the loader used to make per hit.
     mtime_key = f"kraken:{cache_key}"
     # Scope the invalidation fingerprint to this sample's own files. See
     # _sample_fingerprint_paths for why the whole directory is the wrong
@@ -550,7 +563,7 @@ def load_kraken_data(main_dir: str, sample: Optional[str] = None) -> pd.DataFram
     mtime_state, mtime_cached = _mtime_cache_state(mtime_key, fingerprint_paths)
     if mtime_state == "hit":
         logging.debug(f"Mtime cache hit for Kraken data: {cache_key}")
-        return mtime_cached
+        return _handout(mtime_cached)
 
     # Fall back to TTL-based cache -- but only when the mtime check could not
     # answer. A "stale" verdict means the files have demonstrably changed, and
@@ -559,11 +572,13 @@ def load_kraken_data(main_dir: str, sample: Optional[str] = None) -> pd.DataFram
     # though the loader had already detected the update.
     if mtime_state != "stale":
         with _cache_lock:
-            if cache_key in _kraken_cache:
-                cache_time, cached_df = _kraken_cache[cache_key]
+            entry = _kraken_cache.get(cache_key)
+            if entry is not None:
+                cache_time, cached_df = entry
                 if _is_cache_valid(cache_time):
                     logging.debug(f"Using cached Kraken data for {cache_key}")
-                    return cached_df
+                    _KRAKEN_TTL_HIT.inc()
+                    return _handout(cached_df)
 
     # Serialize the parse path: concurrent callbacks that all miss above
     # would otherwise each start their own full re-parse. Holding a
@@ -579,18 +594,52 @@ def load_kraken_data(main_dir: str, sample: Optional[str] = None) -> pd.DataFram
             mtime_key, fingerprint_paths
         )
         if recheck_state == "hit":
-            return mtime_cached
+            return _handout(mtime_cached)
         if recheck_state != "stale":
             with _cache_lock:
-                if cache_key in _kraken_cache:
-                    cache_time, cached_df = _kraken_cache[cache_key]
+                entry = _kraken_cache.get(cache_key)
+                if entry is not None:
+                    cache_time, cached_df = entry
                     if _is_cache_valid(cache_time):
-                        return cached_df
+                        return _handout(cached_df)
+
+        return _parse_kraken_data_shared(
+            main_dir, sample, cache_key, kraken_dir, mtime_key,
+            fingerprint_paths,
+        )
+
 
+def _parse_kraken_data_shared(
+    main_dir: str,
+    sample: Optional[str],
+    cache_key: str,
+    kraken_dir: str,
+    mtime_key: str,
+    fingerprint_paths: List[str],
+) -> pd.DataFrame:
+    """``_parse_kraken_data_uncached`` behind the cross-process tier, if configured.
+
+    With ``NANOMETA_SHARED_CACHE`` set, one worker parses and every other
+    worker maps its result (``shared_frames``). The mapped frame is cached
+    here without the usual defensive copy: copying would give each worker
+    a private heap copy again, and the frame is already read-only.
+    """
+    store = shared_store()
+    if store is None:
         return _parse_kraken_data_uncached(
             main_dir, sample, cache_key, kraken_dir, mtime_key,
             fingerprint_paths,
         )
+    result_df = store.frame(
+        f"{mtime_key}@{os.path.abspath(kraken_dir)}",
+        repr(_get_path_fingerprint(fingerprint_paths)),
+        lambda: _parse_kraken_data_uncached(
+            main_dir, sample, cache_key, kraken_dir, mtime_key,
+            fingerprint_paths,
+        ),
+    )
+    return _cache_and_return(result_df, cache_key, mtime_key, kraken_dir,
+                             fingerprint_paths, copy=False)
 
 
 def _accumulate_kraken_df(
@@ -694,20 +743,20 @@ def _discover_all_sample_reports(kraken_dir: str) -> List[str]:
     """
     # Gather candidates at every tier: top-level globs plus the v1.5 nested
     # per-sample subdirectories.
-    cumulative = glob.glob(os.path.join(kraken_dir, "*.cumulative.kraken2.report.txt"))
+    cumulative = scan_glob(os.path.join(kraken_dir, "*.cumulative.kraken2.report.txt"))
     cumulative.extend(
         _scan_subdirs_for_pattern(kraken_dir, "*.cumulative.kraken2.report.txt")
     )
 
     standard: List[str] = []
-    for f in glob.glob(os.path.join(kraken_dir, "*.kraken2.report.txt")):
+    for f in scan_glob(os.path.join(kraken_dir, "*.kraken2.report.txt")):
         if _is_standard_report(os.path.basename(f)):
             standard.append(f)
     for f in _scan_subdirs_for_pattern(kraken_dir, "*.kraken2.report.txt"):
         if _is_standard_report(os.path.basename(f)):
             standard.append(f)
 
-    candidate_batches = glob.glob(os.path.join(kraken_dir, "*_batch*.kraken2.report.txt"))
+    candidate_batches = scan_glob(os.path.join(kraken_dir, "*_batch*.kraken2.report.txt"))
     candidate_batches.extend(
         _scan_subdirs_for_pattern(kraken_dir, "*.kraken2.report.txt", subdir="batch_reports")
     )
@@ -790,36 +839,36 @@ def _discover_sample_reports(kraken_dir: str, sample: str) -> List[str]:
     """
     # 1. Cumulative report (preferred - already aggregated).
     cumul_path = os.path.join(kraken_dir, f"{sample}.cumulative.kraken2.report.txt")
-    if os.path.exists(cumul_path):
+    if scan_exists(cumul_path):
         logging.debug(f"Found cumulative Kraken2 report for {sample}")
         return [cumul_path]
     nested_cumul = os.path.join(kraken_dir, sample, f"{sample}.cumulative.kraken2.report.txt")
-    if os.path.exists(nested_cumul):
+    if scan_exists(nested_cumul):
         logging.debug(f"Found cumulative Kraken2 report for {sample}")
         return [nested_cumul]
 
     # 2. Standard (non-batch) reports: direct path, nested, then flat re-check.
     sample_files: List[str] = []
     p = os.path.join(kraken_dir, f"{sample}.kraken2.report.txt")
-    if os.path.exists(p):
+    if scan_exists(p):
         sample_files.append(p)
     if not sample_files:
         p = os.path.join(kraken_dir, sample, f"{sample}.kraken2.report.txt")
-        if os.path.exists(p):
+        if scan_exists(p):
             sample_files.append(p)
     if not sample_files:
         p = os.path.join(kraken_dir, f"{sample}.kraken2.report.txt")
-        if os.path.exists(p):
+        if scan_exists(p):
             sample_files.append(p)
     sample_files = list(dict.fromkeys(os.path.realpath(f) for f in sample_files))
     if sample_files:
         return sample_files
 
     # 3. Batch files, dispatching on the upstream layout.
-    candidate_batches = glob.glob(os.path.join(kraken_dir, f"{sample}_batch*.kraken2.report.txt"))
+    candidate_batches = scan_glob(os.path.join(kraken_dir, f"{sample}_batch*.kraken2.report.txt"))
     batch_dir = os.path.join(kraken_dir, sample, "batch_reports")
-    if os.path.isdir(batch_dir):
-        candidate_batches.extend(glob.glob(os.path.join(batch_dir, "*.kraken2.report.txt")))
+    if scan_isdir(batch_dir):
+        candidate_batches.extend(scan_glob(os.path.join(batch_dir, "*.kraken2.report.txt")))
     candidate_batches = _deduplicate_batch_files(candidate_batches)
     if not candidate_batches:
         return []
@@ -868,7 +917,7 @@ def _sample_fingerprint_paths(kraken_dir: str, sample: Optional[str]) -> List[st
     ]
     # Legacy flat batch snapshots sit directly in kraken2/.
     paths.extend(
-        glob.glob(os.path.join(kraken_dir, f"{sample}_batch*.kraken2.report.txt"))
+        scan_glob(os.path.join(kraken_dir, f"{sample}_batch*.kraken2.report.txt"))
     )
     return paths
 
@@ -895,22 +944,45 @@ def _aggregate_to_result_df(agg: Dict[int, List], ordered_taxids: List[int]) ->
     return pd.DataFrame(result_rows)
 
 
+# pandas 3 always copies on write, so a shallow copy of a cached frame is a
+# private view: a caller's in-place edit copies the touched column first.
+# pandas 2.x (still allowed by requirements.txt) shares the column buffers
+# of a shallow copy unless the copy_on_write option is on.
+_COPY_ON_WRITE = (int(pd.__version__.split(".")[0]) >= 3
+                  or pd.get_option("mode.copy_on_write") is True)
+
+
+def _handout(df: pd.DataFrame) -> pd.DataFrame:
+    """A copy of a cached frame that a caller may edit without reaching the cache.
+
+    Shallow (the buffers stay shared) under copy-on-write; deep otherwise,
+    since a shallow copy would expose the cached object columns to in-place
+    edits and the read-only mapped columns of shared frames to writes.
+    """
+    return df.copy(deep=not _COPY_ON_WRITE)
+
+
 def _cache_and_return(result_df: pd.DataFrame, cache_key: str, mtime_key: str,
                       kraken_dir: str,
-                      fingerprint_paths: Optional[List[str]] = None) -> pd.DataFrame:
+                      fingerprint_paths: Optional[List[str]] = None,
+                      copy: bool = True) -> pd.DataFrame:
     """Store result_df in the TTL and mtime caches under the lock, then return it.
 
     ``fingerprint_paths`` must be the same sample-scoped path list used for the
     matching ``_check_mtime_cache`` lookup, or the entry can never be hit.
+    ``copy=False`` stores ``result_df`` itself (a shared, read-only frame)
+    and returns it through :func:`_handout`, as the cache-hit paths of
+    ``load_kraken_data`` do, so an in-place edit by the caller cannot reach
+    the cache.
     """
     with _cache_lock:
-        _kraken_cache[cache_key] = (time.time(), result_df.copy())
+        _kraken_cache[cache_key] = (time.time(), result_df.copy() if copy else result_df)
     _store_mtime_cache(
         mtime_key,
         fingerprint_paths if fingerprint_paths is not None else [kraken_dir],
-        result_df.copy(),
+        result_df.copy() if copy else result_df,
     )
-    return result_df
+    return result_df if copy else _handout(result_df)
 
 
 def _parse_kraken_data_uncached(
@@ -930,7 +1002,7 @@ def _parse_kraken_data_uncached(
     """
     if fingerprint_paths is None:
         fingerprint_paths = _sample_fingerprint_paths(kraken_dir, sample)
-    if not os.path.exists(kraken_dir):
+    if not scan_exists(kraken_dir):
         # DEBUG, not WARNING: a missing kraken2/ subdir is the normal state for
         # a freshly-configured results folder before the pipeline has run.
         # WARNING here produced terminal noise on every Configuration-tab
@@ -972,7 +1044,7 @@ def _parse_kraken_data_uncached(
         # live run); WARNING when the directory is genuinely empty/unreadable.
         try:
             has_any_kreports = any(
-                f.endswith(".kraken2.report.txt") for f in os.listdir(kraken_dir)
+                f.endswith(".kraken2.report.txt") for f in scan_listdir(kraken_dir)
             )
         except OSError:
             has_any_kreports = False
@@ -1045,13 +1117,13 @@ def load_kraken_latest_batch(main_dir: str, sample_name: str) -> pd.DataFrame:
     for ext_pattern in (
         f"{sample_name}_batch*.kraken2.report.txt",
     ):
-        candidate_batches.extend(glob.glob(os.path.join(kraken_dir, ext_pattern)))
+        candidate_batches.extend(scan_glob(os.path.join(kraken_dir, ext_pattern)))
 
     # v1.5 layout: batch_reports/ inside per-sample subdirectory
     batch_dir = os.path.join(kraken_dir, sample_name, "batch_reports")
-    if os.path.isdir(batch_dir):
+    if scan_isdir(batch_dir):
         candidate_batches.extend(
-            glob.glob(os.path.join(batch_dir, "*.kraken2.report.txt"))
+            scan_glob(os.path.join(batch_dir, "*.kraken2.report.txt"))
         )
 
     if candidate_batches:
@@ -1076,7 +1148,7 @@ def load_kraken_latest_batch(main_dir: str, sample_name: str) -> pd.DataFrame:
             os.path.join(kraken_dir, ext),
             os.path.join(kraken_dir, sample_name, ext),
         ):
-            if os.path.exists(candidate):
+            if scan_exists(candidate):
                 df = _parse_kraken2_report(candidate)
                 if df is not None:
                     logging.debug(
@@ -1117,14 +1189,14 @@ def latest_batch_equals_cumulative(main_dir: str, sample_name: str) -> bool:
         os.path.join(kraken_dir, f"{sample_name}.cumulative.kraken2.report.txt"),
         os.path.join(kraken_dir, sample_name, f"{sample_name}.cumulative.kraken2.report.txt"),
     ):
-        if os.path.exists(cumul):
+        if scan_exists(cumul):
             return False
 
     # Any per-batch report means a distinct latest-batch horizon exists.
-    if glob.glob(os.path.join(kraken_dir, f"{sample_name}_batch*.kraken2.report.txt")):
+    if scan_glob(os.path.join(kraken_dir, f"{sample_name}_batch*.kraken2.report.txt")):
         return False
     batch_dir = os.path.join(kraken_dir, sample_name, "batch_reports")
-    if os.path.isdir(batch_dir) and glob.glob(
+    if scan_isdir(batch_dir) and scan_glob(
         os.path.join(batch_dir, "*.kraken2.report.txt")
     ):
         return False
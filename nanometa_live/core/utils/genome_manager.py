@@ -20,7 +20,6 @@ Usage:
 import json
 import logging
 import os
-import re
 import shutil
 import subprocess
 import tempfile
@@ -37,6 +36,19 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 import requests
 
 from nanometa_live.core.taxonomy.taxonomy_api import get_ncbi_client
+from nanometa_live.core.utils.blast_db_scheduler import (
+    BuildJob,
+    BuildResources,
+    BuildScheduler,
+    build_consolidated_db,
+    prune_consolidated,
+)
+from nanometa_live.core.utils.genome_catalog import (
+    ACCESSION_RE,
+    CATALOG_FILENAME,
+    GenomeCatalog,
+    inspect_fasta,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +75,38 @@ def _kingdom_from_gtdb_taxonomy(gtdb_taxonomy) -> Optional[str]:
     return None
 
 
+def _kingdom_from_efetch_taxon(taxon_el) -> Optional[str]:
+    """Kingdom of one efetch ``<Taxon>`` element, from LineageEx or Lineage."""
+    # Parse superkingdom / kingdom from LineageEx
+    superkingdom = None
+    kingdom_name = None
+    lineage_ex = taxon_el.find("LineageEx")
+    if lineage_ex is not None:
+        for child in lineage_ex.findall("Taxon"):
+            rank = child.findtext("Rank", "")
+            name = child.findtext("ScientificName", "")
+            if rank == "superkingdom":
+                superkingdom = name
+            elif rank == "kingdom":
+                kingdom_name = name
+
+    if superkingdom:
+        if superkingdom == "Eukaryota" and kingdom_name == "Fungi":
+            return "Fungi"
+        if superkingdom in ("Bacteria", "Archaea", "Eukaryota", "Viruses"):
+            return superkingdom
+        return None
+
+    # Fallback: Lineage text
+    lineage = taxon_el.findtext("Lineage", "")
+    if lineage:
+        parts = [p.strip() for p in lineage.split(";")]
+        for part in parts[:3]:
+            if part in ("Bacteria", "Archaea", "Eukaryota", "Viruses"):
+                return part
+    return None
+
+
 def _default_download_workers() -> int:
     """Default ThreadPoolExecutor size for genome HTTPS downloads.
 
@@ -74,11 +118,13 @@ def _default_download_workers() -> int:
 
 
 def _default_blast_build_workers() -> int:
-    """Default ThreadPoolExecutor size for parallel makeblastdb invocations.
+    """Ceiling on concurrent makeblastdb invocations.
 
     Each makeblastdb is CPU-bound and consumes 1-2 cores; cap concurrent
     builds at half the host's cpus to leave headroom for the GUI server
     process. Floor of 2 preserves the prior default for small hosts.
+    ``BuildScheduler`` lowers it further to what free cores, memory and
+    disk throughput allow at build time.
     """
     return max(2, min((os.cpu_count() or 4) // 2, 8))
 
@@ -126,14 +172,11 @@ def _extract_fasta_accession(fasta_path: Path) -> Optional[str]:
     Returns:
         Accession string, or None if no recognisable accession found.
     """
-    accession_pattern = re.compile(
-        r'((?:NC|NZ|NW|NT|AC|GCF|GCA)_[A-Z]*\d+(?:\.\d+)?)'
-    )
     try:
         with open(fasta_path, 'r') as f:
             header = f.readline(1024)
         if header.startswith('>'):
-            match = accession_pattern.search(header)
+            match = ACCESSION_RE.search(header)
             if match:
                 return match.group(1)
     except (OSError, UnicodeDecodeError):
@@ -145,7 +188,8 @@ def _validate_fasta(fasta_path: Path) -> bool:
     """Validate that a file is a valid FASTA file.
 
     Checks that the file is non-empty, starts with a header line ('>'),
-    and contains only valid nucleotide/amino-acid sequence characters.
+    and contains only valid nucleotide sequence characters in its first
+    10000 characters of sequence. See ``genome_catalog.inspect_fasta``.
 
     Args:
         fasta_path: Path to the FASTA file to validate.
@@ -153,43 +197,7 @@ def _validate_fasta(fasta_path: Path) -> bool:
     Returns:
         True if the file appears to be a valid FASTA, False otherwise.
     """
-    valid_seq_chars = set("ACGTNURYSWKMBDHVacgtnuryswkmbdhv.-\n\r\t ")
-    try:
-        size = fasta_path.stat().st_size
-        if size == 0:
-            logger.error(f"FASTA validation failed: {fasta_path} is empty")
-            return False
-
-        with open(fasta_path, "r") as f:
-            first_line = f.readline()
-            if not first_line.startswith(">"):
-                logger.error(
-                    f"FASTA validation failed: {fasta_path} does not start "
-                    f"with a header line ('>')"
-                )
-                return False
-
-            # Check first 10000 characters of sequence data for validity
-            chars_checked = 0
-            for line in f:
-                if line.startswith(">"):
-                    continue
-                for ch in line:
-                    if ch not in valid_seq_chars:
-                        logger.error(
-                            f"FASTA validation failed: {fasta_path} contains "
-                            f"invalid character '{ch}' in sequence data"
-                        )
-                        return False
-                chars_checked += len(line)
-                if chars_checked > 10000:
-                    break
-
-        return True
-
-    except (OSError, UnicodeDecodeError) as e:
-        logger.error(f"FASTA validation failed for {fasta_path}: {e}")
-        return False
+    return inspect_fasta(fasta_path)[0]
 
 
 def genome_cache_taxid(entry) -> int:
@@ -296,13 +304,17 @@ class GenomeDownloadManager:
     def _circuit_record_success(cls, host: str) -> None:
         cls._host_failures[host] = 0
 
-    def __init__(self, cache_dir: Optional[str] = None, offline_mode: bool = False):
+    def __init__(self, cache_dir: Optional[str] = None, offline_mode: bool = False,
+                 blast_db_mode: str = "per_taxid"):
         """
         Initialize the genome download manager.
 
         Args:
             cache_dir: Base cache directory. Defaults to ~/.nanometa
             offline_mode: If True, refuse all genome downloads
+            blast_db_mode: The config's ``blast_db_mode``. With
+                ``consolidated``, automatic builds (after a scan or an
+                import) go into one combined database.
         """
         if cache_dir is None:
             # Resolve from NANOMETA_DATA_DIR (set by the CLI entry
@@ -317,6 +329,7 @@ class GenomeDownloadManager:
         self.blast_dir = self.cache_dir / "blast"
         self.metadata_file = self.cache_dir / "genome_metadata.json"
         self.offline_mode = offline_mode
+        self.blast_db_mode = blast_db_mode
 
         # Create directories
         self.genomes_dir.mkdir(parents=True, exist_ok=True)
@@ -331,6 +344,7 @@ class GenomeDownloadManager:
         # inside the lock so the loser is a no-op rather than a redundant build.
         self._blast_build_master_lock = threading.Lock()
         self._blast_build_locks: Dict[int, threading.Lock] = {}
+        self._consolidated_build_lock = threading.Lock()
 
         # Load existing metadata
         self._metadata: Dict[int, GenomeMetadata] = {}
@@ -359,21 +373,7 @@ class GenomeDownloadManager:
             result = ncbi_client.get_by_taxid(taxid)
 
             if result:
-                species_name = result.sciname or f"Unknown (taxid {taxid})"
-
-                # Determine kingdom from lineage or division
-                kingdom = "Unknown"
-                if result.lineage:
-                    # Check lineage for kingdom/domain
-                    for name in result.lineage:
-                        name_lower = name.lower()
-                        if name_lower in ("bacteria", "archaea", "fungi", "viruses", "eukaryota"):
-                            kingdom = name.capitalize()
-                            break
-                elif result.division:
-                    # Fall back to division if lineage not available
-                    kingdom = result.division
-
+                species_name, kingdom = self._name_and_kingdom(taxid, result)
                 logger.info(f"Resolved taxid {taxid}: {species_name} ({kingdom})")
                 return species_name, kingdom
 
@@ -381,7 +381,30 @@ class GenomeDownloadManager:
                 KeyError, TypeError) as e:
             logger.warning(f"Failed to resolve species name for taxid {taxid}: {e}")
 
-        # Fall back to watchlist name if NCBI lookup failed
+        return self._watchlist_name_fallback(taxid)
+
+    @staticmethod
+    def _name_and_kingdom(taxid: int, result: Any) -> Tuple[str, str]:
+        """Species name and kingdom from an ``NCBIResult``."""
+        species_name = result.sciname or f"Unknown (taxid {taxid})"
+
+        # Determine kingdom from lineage or division
+        kingdom = "Unknown"
+        if result.lineage:
+            # Check lineage for kingdom/domain
+            for name in result.lineage:
+                name_lower = name.lower()
+                if name_lower in ("bacteria", "archaea", "fungi", "viruses", "eukaryota"):
+                    kingdom = name.capitalize()
+                    break
+        elif result.division:
+            # Fall back to division if lineage not available
+            kingdom = result.division
+        return species_name, kingdom
+
+    @staticmethod
+    def _watchlist_name_fallback(taxid: int) -> Tuple[str, str]:
+        """The watchlist's name for a taxid NCBI could not resolve."""
         try:
             from nanometa_live.core.watchlist.watchlist_manager import get_watchlist_manager
             wm = get_watchlist_manager()
@@ -394,50 +417,71 @@ class GenomeDownloadManager:
 
         return f"Unknown (taxid {taxid})", "Unknown"
 
+    def _resolve_species_names(self, taxids: List[int]) -> Dict[int, Tuple[str, str]]:
+        """
+        Resolve many taxids at once: taxonomy caches first, then ONE batched
+        NCBI efetch for whatever they miss, then the watchlist name.
+
+        ``_resolve_species_name`` costs one or two NCBI round-trips per
+        taxid, so discovering hundreds of imported genomes stalled for
+        minutes. Offline, only the caches are consulted.
+        """
+        resolved: Dict[int, Tuple[str, str]] = {}
+        pending: List[int] = []
+        try:
+            ncbi_client = get_ncbi_client(offline_mode=self.offline_mode)
+            for taxid in taxids:
+                # Offline, get_by_taxid reads only the local and offline
+                # caches. Online, only the local cache is read here; misses
+                # go to the batched request below.
+                result = (ncbi_client.get_by_taxid(taxid) if self.offline_mode
+                          else ncbi_client.cache.get_ncbi_by_taxid(taxid))
+                if result:
+                    resolved[taxid] = self._name_and_kingdom(taxid, result)
+                elif not self.offline_mode and _is_real_ncbi_taxid(taxid):
+                    pending.append(taxid)
+        except (requests.exceptions.RequestException, ValueError, AttributeError,
+                KeyError, TypeError) as e:
+            logger.warning(f"Taxonomy cache lookup failed during genome scan: {e}")
+
+        if pending:
+            for taxid, (name, kingdom) in self._efetch_taxa(pending).items():
+                if name:
+                    resolved[taxid] = (name, kingdom or "Unknown")
+            logger.info(f"Resolved {len(resolved)}/{len(taxids)} discovered genome taxids")
+
+        for taxid in taxids:
+            if taxid not in resolved:
+                resolved[taxid] = self._watchlist_name_fallback(taxid)
+        return resolved
+
     def _scan_existing_genomes(self) -> None:
         """
         Scan the genomes directory for existing FASTA files without metadata.
 
         This detects genomes that were downloaded manually or by other tools,
-        and creates basic metadata entries for them.
+        and creates basic metadata entries for them. Files failing the FASTA
+        gate are not registered. What reading a file establishes is kept in
+        the genome catalog, so an unchanged file is never re-read; new files
+        are checked on a thread pool, and their species names are resolved
+        in one batched lookup.
         """
         if not self.genomes_dir.exists():
             return
 
-        # Find all FASTA files in the genomes directory
-        fasta_extensions = ['.fasta', '.fna', '.fa', '.fasta.gz', '.fna.gz', '.fa.gz']
-        found_new = 0
-
-        for fasta_file in self.genomes_dir.iterdir():
-            if not fasta_file.is_file():
-                continue
-
-            # Check if it's a FASTA file
-            name_lower = fasta_file.name.lower()
-            if not any(name_lower.endswith(ext) for ext in fasta_extensions):
-                continue
-
-            # Try to extract taxid from filename (expecting {taxid}.fasta pattern)
-            stem = fasta_file.stem
-            # Handle .fasta.gz by removing .fasta too
-            if stem.endswith('.fasta') or stem.endswith('.fna') or stem.endswith('.fa'):
-                stem = Path(stem).stem
-
-            try:
-                taxid = int(stem)
-            except ValueError:
-                # Filename doesn't start with a taxid number, skip
-                continue
-
-            # Skip if we already have metadata for this taxid
-            if taxid in self._metadata:
-                continue
+        files = self._taxid_fasta_files()
+        catalog = GenomeCatalog(self.cache_dir / CATALOG_FILENAME)
+        catalog.prune({path.name for path, _stat in files.values()})
+        new_files = {t: f for t, f in files.items() if t not in self._metadata}
+        facts = self._inspect_genome_files(catalog, new_files)
+        catalog.save()
 
-            # Create metadata entry for discovered genome with resolved species name
+        taxids = sorted(t for t, fact in facts.items() if fact["valid"])
+        names = self._resolve_species_names(taxids) if taxids else {}
+        for taxid in taxids:
+            fasta_file, stat = new_files[taxid]
             logger.info(f"Discovered existing genome file: {fasta_file.name} (taxid: {taxid})")
-
-            # Resolve species name from NCBI (falls back to watchlist)
-            species_name, kingdom = self._resolve_species_name(taxid)
+            species_name, kingdom = names[taxid]
 
             # Infer source from kingdom when possible
             source = "discovered"
@@ -446,35 +490,83 @@ class GenomeDownloadManager:
             elif kingdom in ("Bacteria", "Archaea"):
                 source = "gtdb"
 
-            # Try to extract a real accession from the FASTA header
-            discovered_accession = _extract_fasta_accession(fasta_file) or "discovered"
-
             # Check if a BLAST DB already exists on disk
-            blast_db_path = None
             existing_blast = self.get_blast_db_path(taxid)
-            if existing_blast:
-                blast_db_path = str(existing_blast)
 
             self._metadata[taxid] = GenomeMetadata(
                 taxid=taxid,
                 species_name=species_name,
-                accession=discovered_accession,
+                accession=facts[taxid]["accession"] or "discovered",
                 source=source,
                 kingdom=kingdom,
                 fasta_path=str(fasta_file),
-                blast_db_path=blast_db_path,
-                file_size=fasta_file.stat().st_size,
+                blast_db_path=str(existing_blast) if existing_blast else None,
+                file_size=stat.st_size,
                 is_representative=False,
             )
-            found_new += 1
 
-        if found_new > 0:
-            logger.info(f"Discovered {found_new} existing genome files without metadata")
+        if taxids:
+            logger.info(f"Discovered {len(taxids)} existing genome files without metadata")
             self._save_metadata()
 
         # Build BLAST databases for genomes that don't have them
         self._build_missing_blast_dbs()
 
+    def _taxid_fasta_files(self) -> Dict[int, Tuple[Path, os.stat_result]]:
+        """``{taxid: (path, stat)}`` for every ``<taxid>.<fasta ext>`` file."""
+        fasta_extensions = ['.fasta', '.fna', '.fa', '.fasta.gz', '.fna.gz', '.fa.gz']
+        files: Dict[int, Tuple[Path, os.stat_result]] = {}
+        for fasta_file in self.genomes_dir.iterdir():
+            # Check if it's a FASTA file
+            name_lower = fasta_file.name.lower()
+            if not any(name_lower.endswith(ext) for ext in fasta_extensions):
+                continue
+
+            # Try to extract taxid from filename (expecting {taxid}.fasta pattern)
+            stem = fasta_file.stem
+            # Handle .fasta.gz by removing .fasta too
+            if stem.endswith('.fasta') or stem.endswith('.fna') or stem.endswith('.fa'):
+                stem = Path(stem).stem
+            try:
+                taxid = int(stem)
+                stat = fasta_file.stat()
+            except (ValueError, OSError):
+                # Not a taxid-named file, or gone since the listing
+                continue
+            if taxid not in files and fasta_file.is_file():
+                files[taxid] = (fasta_file, stat)
+        return files
+
+    @staticmethod
+    def _inspect_genome_files(
+        catalog: GenomeCatalog,
+        files: Dict[int, Tuple[Path, os.stat_result]],
+    ) -> Dict[int, Dict[str, Any]]:
+        """Catalog facts for ``files``, reading only new or changed ones."""
+        facts: Dict[int, Dict[str, Any]] = {}
+        unread: List[int] = []
+        for taxid, (path, stat) in files.items():
+            entry = catalog.lookup(path.name, stat)
+            if entry is None:
+                unread.append(taxid)
+            else:
+                facts[taxid] = entry
+        if unread:
+            workers = max(1, min(8, len(unread)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                checked = pool.map(lambda t: inspect_fasta(files[t][0]), unread)
+                for taxid, (valid, accession) in zip(unread, checked):
+                    path, stat = files[taxid]
+                    if not valid:
+                        logger.warning(f"Not registering invalid genome file {path.name}")
+                    facts[taxid] = catalog.record(path.name, stat, valid, accession)
+        return facts
+
+    @property
+    def consolidated_blast_dbs(self) -> bool:
+        """Whether new BLAST databases go into one combined database."""
+        return self.blast_db_mode == "consolidated"
+
     def _build_missing_blast_dbs(self) -> None:
         """
         Build BLAST databases for any genomes that don't have them yet.
@@ -488,7 +580,7 @@ class GenomeDownloadManager:
         if not has_makeblastdb:
             logger.debug("makeblastdb not found, skipping auto-build of BLAST databases")
 
-        built = 0
+        to_build = []
         synced = 0
         for taxid, meta in self._metadata.items():
             # Check if genome file exists
@@ -504,13 +596,18 @@ class GenomeDownloadManager:
                     synced += 1
                 continue
 
-            if not has_makeblastdb:
-                continue
+            if has_makeblastdb:
+                to_build.append(taxid)
 
-            # Build BLAST database
-            logger.info(f"Building BLAST database for taxid {taxid} ({meta.species_name})")
-            if self.build_blast_db(taxid):
-                built += 1
+        if self.consolidated_blast_dbs:
+            built = len(self._build_consolidated_blast_db(to_build)[0]) if to_build else 0
+        else:
+            built = 0
+            for taxid in to_build:
+                logger.info(f"Building BLAST database for taxid {taxid} "
+                            f"({self._metadata[taxid].species_name})")
+                if self.build_blast_db(taxid):
+                    built += 1
 
         if synced > 0:
             logger.info(f"Synced blast_db_path for {synced} existing BLAST databases")
@@ -606,8 +703,9 @@ class GenomeDownloadManager:
             Path to BLAST database if built, None otherwise
         """
         blast_db = self.blast_dir / f"{taxid}.fasta"
-        # Check for .nhr file (BLAST database index)
-        if Path(f"{blast_db}.nhr").exists():
+        # A per-taxid database has a .nhr header index; in consolidated mode
+        # the taxid has a .nal alias into the combined database instead.
+        if Path(f"{blast_db}.nhr").exists() or Path(f"{blast_db}.nal").exists():
             return blast_db
         return None
 
@@ -1642,7 +1740,9 @@ class GenomeDownloadManager:
         """
         return self.build_missing_blast_dbs_detailed()["built"]
 
-    def build_missing_blast_dbs_detailed(self, retry: bool = True) -> Dict[str, Any]:
+    def build_missing_blast_dbs_detailed(
+        self, retry: bool = True, consolidated: Optional[bool] = None,
+    ) -> Dict[str, Any]:
         """Build missing BLAST DBs and report an honest breakdown.
 
         Returns a dict ``{built, already_present, failed}`` where ``failed`` is a
@@ -1652,7 +1752,13 @@ class GenomeDownloadManager:
         ``failed`` (genuine build errors, e.g. a bad FASTA or makeblastdb
         missing). With ``retry`` set, each failure is attempted once more before
         being recorded, since transient causes (brief disk pressure) often clear.
+
+        Builds run through the resource-aware scheduler; with ``consolidated``
+        (default: the manager's ``blast_db_mode``) every missing genome goes
+        into one combined database instead.
         """
+        if consolidated is None:
+            consolidated = self.consolidated_blast_dbs
         report: Dict[str, Any] = {"built": 0, "already_present": 0, "failed": []}
 
         if not shutil.which("makeblastdb"):
@@ -1666,26 +1772,30 @@ class GenomeDownloadManager:
                     })
             return report
 
+        to_build = []
         for taxid, meta in self._metadata.items():
-            genome_path = Path(meta.fasta_path)
-            if not genome_path.exists():
+            if not Path(meta.fasta_path).exists():
                 continue
-
             if self.has_blast_db(taxid):
                 report["already_present"] += 1
-                continue
-
-            logger.info(f"Building BLAST database for taxid {taxid} ({meta.species_name})")
-            ok, reason = self._build_blast_db_with_reason(taxid)
-            if not ok and retry:
-                logger.info(f"Retrying BLAST DB build for taxid {taxid}")
-                ok, reason = self._build_blast_db_with_reason(taxid)
+            else:
+                to_build.append(taxid)
+
+        if consolidated:
+            built, reason = self._build_consolidated_blast_db(to_build)
+            outcomes = {t: (t in built, reason or "no sequences in genome") for t in to_build}
+        else:
+            outcomes = self._blast_build_scheduler().run(
+                self._blast_build_jobs(to_build),
+                lambda taxid: self._build_blast_db_retrying(taxid, retry))
+        for taxid in to_build:
+            ok, reason = outcomes.get(taxid) or (False, None)
             if ok:
                 report["built"] += 1
             else:
                 report["failed"].append({
                     "taxid": taxid,
-                    "species": getattr(meta, "species_name", ""),
+                    "species": getattr(self._metadata[taxid], "species_name", ""),
                     "reason": reason or "unknown error",
                 })
 
@@ -1700,6 +1810,14 @@ class GenomeDownloadManager:
 
         return report
 
+    def _build_blast_db_retrying(self, taxid: int, retry: bool):
+        logger.info(f"Building BLAST database for taxid {taxid}")
+        ok, reason = self._build_blast_db_with_reason(taxid)
+        if not ok and retry:
+            logger.info(f"Retrying BLAST DB build for taxid {taxid}")
+            ok, reason = self._build_blast_db_with_reason(taxid)
+        return ok, reason
+
     def blast_db_status(self, taxids: List[int]) -> Dict[str, List[int]]:
         """Return ``{present, missing}`` taxid lists for the given taxids.
 
@@ -1775,7 +1893,23 @@ class GenomeDownloadManager:
             logger.debug(f"Offline mode: skipping batch NCBI kingdom lookup for {len(taxids)} taxids")
             return {}
 
-        results: Dict[int, str] = {}
+        results = {
+            tid: kingdom
+            for tid, (_name, kingdom) in self._efetch_taxa(taxids).items()
+            if kingdom
+        }
+        logger.info(f"Batch kingdom lookup: resolved {len(results)}/{len(taxids)} taxids")
+        return results
+
+    def _efetch_taxa(self, taxids: List[int]) -> Dict[int, Tuple[str, Optional[str]]]:
+        """
+        Scientific name and kingdom for many taxids via batched NCBI efetch.
+
+        Returns:
+            Dict mapping taxid to ``(scientific name, kingdom or None)``.
+            Taxids NCBI did not return are omitted.
+        """
+        results: Dict[int, Tuple[str, Optional[str]]] = {}
 
         # Process in chunks of 200 to stay within URL length limits
         chunk_size = 200
@@ -1802,42 +1936,15 @@ class GenomeDownloadManager:
                     tid_text = taxon_el.findtext("TaxId")
                     if not tid_text:
                         continue
-                    tid = int(tid_text)
-
-                    # Parse superkingdom / kingdom from LineageEx
-                    superkingdom = None
-                    kingdom_name = None
-                    lineage_ex = taxon_el.find("LineageEx")
-                    if lineage_ex is not None:
-                        for child in lineage_ex.findall("Taxon"):
-                            rank = child.findtext("Rank", "")
-                            name = child.findtext("ScientificName", "")
-                            if rank == "superkingdom":
-                                superkingdom = name
-                            elif rank == "kingdom":
-                                kingdom_name = name
-
-                    if superkingdom:
-                        if superkingdom == "Eukaryota" and kingdom_name == "Fungi":
-                            results[tid] = "Fungi"
-                        elif superkingdom in ("Bacteria", "Archaea", "Eukaryota", "Viruses"):
-                            results[tid] = superkingdom
-                        continue
-
-                    # Fallback: Lineage text
-                    lineage = taxon_el.findtext("Lineage", "")
-                    if lineage:
-                        parts = [p.strip() for p in lineage.split(";")]
-                        for part in parts[:3]:
-                            if part in ("Bacteria", "Archaea", "Eukaryota", "Viruses"):
-                                results[tid] = part
-                                break
+                    results[int(tid_text)] = (
+                        taxon_el.findtext("ScientificName", "") or "",
+                        _kingdom_from_efetch_taxon(taxon_el),
+                    )
 
             except (requests.exceptions.RequestException, ET.ParseError,
                     ValueError, KeyError) as e:
                 logger.exception(f"Batch kingdom lookup failed for chunk starting at index {i}: {e}")
 
-        logger.info(f"Batch kingdom lookup: resolved {len(results)}/{len(taxids)} taxids")
         return results
 
     def fetch_ncbi_accessions_batch(
@@ -2141,23 +2248,25 @@ class GenomeDownloadManager:
         return results
 
     def build_blast_dbs_batch(
-        self, taxids: List[int], max_workers: Optional[int] = None
+        self, taxids: List[int], max_workers: Optional[int] = None,
+        consolidated: Optional[bool] = None,
     ) -> int:
         """
         Build BLAST databases for multiple genomes concurrently.
 
         Args:
             taxids: List of taxonomy IDs to build databases for.
-            max_workers: Maximum concurrent makeblastdb processes. None
-                (default) derives the size from os.cpu_count() via
-                _default_blast_build_workers() (CPU-bound, half cpus,
-                capped at 8).
+            max_workers: Ceiling on concurrent makeblastdb processes. None
+                (default) uses _default_blast_build_workers(); the scheduler
+                lowers it further to fit free cores, memory and disk
+                throughput.
+            consolidated: Build one combined database for all of them, with
+                a per-taxid alias, instead of one database per taxid.
+                Defaults to the manager's ``blast_db_mode``.
 
         Returns:
             Number of databases successfully built.
         """
-        if max_workers is None:
-            max_workers = _default_blast_build_workers()
         if not shutil.which("makeblastdb"):
             logger.error("makeblastdb not found. Install BLAST+ toolkit.")
             return 0
@@ -2172,26 +2281,40 @@ class GenomeDownloadManager:
             logger.info("All BLAST databases already built")
             return 0
 
-        logger.info(f"Building {len(to_build)} BLAST databases (workers={max_workers})")
-        built = 0
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(self.build_blast_db, taxid): taxid
-                for taxid in to_build
-            }
-            for future in as_completed(futures):
-                taxid = futures[future]
-                try:
-                    if future.result():
-                        built += 1
-                except (subprocess.CalledProcessError, subprocess.TimeoutExpired,
-                        FileNotFoundError, PermissionError, OSError) as e:
-                    logger.exception(f"BLAST DB build failed for taxid {taxid}: {e}")
+        if consolidated is None:
+            consolidated = self.consolidated_blast_dbs
+        if consolidated:
+            built_taxids, _reason = self._build_consolidated_blast_db(to_build)
+            built = len(built_taxids)
+        else:
+            results = self._blast_build_scheduler(max_workers).run(
+                self._blast_build_jobs(to_build), self.build_blast_db)
+            built = sum(1 for ok in results.values() if ok)
 
         logger.info(f"Built {built}/{len(to_build)} BLAST databases")
         return built
 
+    def _blast_build_scheduler(self, max_workers: Optional[int] = None) -> BuildScheduler:
+        return BuildScheduler(
+            BuildResources.detect(self.blast_dir),
+            max_workers=max_workers or _default_blast_build_workers(),
+        )
+
+    def _blast_build_jobs(self, taxids: List[int]) -> List[BuildJob]:
+        return [BuildJob.for_genome(taxid, self.get_genome_path(taxid)) for taxid in taxids]
+
+    def _build_consolidated_blast_db(self, taxids: List[int]) -> Tuple[List[int], Optional[str]]:
+        """One makeblastdb for all ``taxids``; return ``(built, reason_on_failure)``."""
+        genomes = {taxid: self.get_genome_path(taxid) for taxid in taxids}
+        with self._consolidated_build_lock:
+            built, reason = build_consolidated_db(genomes, self.blast_dir)
+        for taxid in built:
+            if taxid in self._metadata:
+                self._metadata[taxid].blast_db_path = str(self.blast_dir / f"{taxid}.fasta")
+        if built:
+            self._save_metadata()
+        return built, reason
+
     def delete_genome(self, taxid: int) -> bool:
         """
         Delete a downloaded genome and its BLAST database.
@@ -2210,10 +2333,11 @@ class GenomeDownloadManager:
 
             # Delete BLAST database files
             blast_db = self.blast_dir / f"{taxid}.fasta"
-            for ext in [".nhr", ".nin", ".nsq", ".ndb", ".not", ".ntf", ".nto"]:
+            for ext in [".nhr", ".nin", ".nsq", ".ndb", ".not", ".ntf", ".nto", ".nal"]:
                 db_file = Path(f"{blast_db}{ext}")
                 if db_file.exists():
                     db_file.unlink()
+            prune_consolidated(self.blast_dir)
 
             # Remove from metadata
             if taxid in self._metadata:
@@ -2422,6 +2546,7 @@ _gm_lock = threading.Lock()
 def get_genome_manager(
     cache_dir: Optional[str] = None,
     offline_mode: Optional[bool] = None,
+    blast_db_mode: Optional[str] = None,
 ) -> GenomeDownloadManager:
     """
     Get the GenomeDownloadManager instance.
@@ -2431,6 +2556,8 @@ def get_genome_manager(
                    current manager's cache_dir, a new instance is created.
                    Defaults to ~/.nanometa if not specified.
         offline_mode: If provided, update the instance's offline_mode flag.
+        blast_db_mode: If provided, update the instance's blast_db_mode
+                   (the config's ``blast_db_mode``).
 
     Returns:
         GenomeDownloadManager instance
@@ -2452,13 +2579,14 @@ def get_genome_manager(
                 _genome_manager = GenomeDownloadManager(
                     cache_dir=cache_dir,
                     offline_mode=bool(offline_mode) if offline_mode is not None else False,
+                    blast_db_mode=blast_db_mode or "per_taxid",
                 )
 
     # Reinitialize-on-cache-dir-change and offline_mode toggle both
     # mutate _genome_manager; serialize them under the same lock so a
     # caller observing the new instance also sees the offline_mode
     # update consistently.
-    if cache_dir is not None or offline_mode is not None:
+    if cache_dir is not None or offline_mode is not None or blast_db_mode is not None:
         with _gm_lock:
             if cache_dir is not None and normalized_cache is not None:
                 current_cache = _genome_manager.cache_dir
@@ -2473,6 +2601,7 @@ def get_genome_manager(
                             if offline_mode is not None
                             else _genome_manager.offline_mode
                         ),
+                        blast_db_mode=blast_db_mode or _genome_manager.blast_db_mode,
                     )
 
             if (
@@ -2483,5 +2612,7 @@ def get_genome_manager(
                 logger.info(
                     f"Genome manager offline_mode updated to {offline_mode}"
                 )
+            if blast_db_mode is not None:
+                _genome_manager.blast_db_mode = blast_db_mode
 
     return _genome_manager
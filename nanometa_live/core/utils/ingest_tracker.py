@@ -0,0 +1,459 @@
+"""
+Running counts of the FASTQ files MinKNOW writes into the input directory.
+
+``BackendManager._update_file_counts`` and the dashboard used to
+``os.listdir`` the input directory and every barcode subdirectory to count
+FASTQs, behind a 5 s TTL. A long PromethION run leaves hundreds of
+thousands of files there, often on NFS, so every listing was a large
+readdir for a number that grew by a handful of files.
+
+:class:`IngestTracker` lists the tree once (the first :meth:`refresh`),
+then keeps per-sample counts of files, bytes and estimated reads up to
+date incrementally:
+
+* With the optional ``watchdog`` package installed (``pip install
+  nanometa-live[watch]``), inotify/FSEvents events apply each created,
+  grown, moved or deleted file as it happens. Every
+  :data:`VERIFY_INTERVAL_S` the tracker also runs the polling pass below,
+  in case an event was dropped. Local notification never sees writes made
+  by another host, so on a network filesystem (NFS, SMB, ...; see
+  :func:`is_network_filesystem`) no watcher is started and every refresh
+  polls.
+* Without it, :meth:`refresh` stats the root and each sample directory
+  and re-lists only the directories whose mtime changed. Within a listing,
+  only new files are stat'ed. Files modified in the last
+  :data:`GROWING_WINDOW_S` are re-stat'ed, because MinKNOW appends to the
+  file it is writing and appending does not change the directory mtime.
+
+Reads are estimated as bytes divided by a sampled bytes-per-read ratio
+(:func:`~nanometa_live.core.utils.read_length_probe.sample_bytes_per_read`),
+so no file is opened after the first few.
+
+Counters are read in O(1) through :meth:`IngestTracker.snapshot`.
+"""
+
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FASTQ_SUFFIXES = (".fastq", ".fastq.gz", ".fq", ".fq.gz")
+#: Files modified this recently are re-stat'ed on each poll (still growing).
+GROWING_WINDOW_S = 120.0
+#: While watching, how often the polling pass runs anyway (missed events).
+VERIFY_INTERVAL_S = 600.0
+#: Files sampled for the bytes-per-read ratio.
+RATIO_SAMPLE_FILES = 3
+#: Seconds between ratio attempts while no sampleable file exists yet.
+RATIO_RETRY_S = 60.0
+#: Sample key for FASTQs directly in the input directory (flat layouts).
+ROOT_SAMPLE = ""
+#: Filesystem types whose remote writes raise no local change events.
+NETWORK_FS_TYPES = frozenset({
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "afpfs", "webdav", "davfs",
+    "9p", "afs", "ceph", "glusterfs", "lustre", "gpfs", "beegfs",
+    "fuse.sshfs", "fuse.glusterfs", "fuse.ceph", "fuse.rclone", "fuse.s3fs",
+})
+# BSD/macOS ``mount`` output: "//host/share on /Volumes/share (smbfs, ...)".
+_BSD_MOUNT_LINE = re.compile(r" on (.+) \(([^,)]+)")
+
+
+def is_fastq_name(name: str) -> bool:
+    """True for visible ``*.fastq[.gz]`` / ``*.fq[.gz]`` names (any case)."""
+    return not name.startswith(".") and name.lower().endswith(FASTQ_SUFFIXES)
+
+
+@dataclass
+class SampleCounts:
+    """Running totals for one sample directory."""
+
+    files: int = 0
+    bytes: int = 0
+    last_arrival: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class IngestSnapshot:
+    """The tracker's counters at one moment."""
+
+    files: int = 0
+    bytes: int = 0
+    estimated_reads: Optional[int] = None
+    bytes_per_read: Optional[float] = None
+    #: Wall time the newest file was first seen (its mtime at start-up).
+    last_arrival: Optional[float] = None
+    per_sample: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class _Dir:
+    sample: str
+    mtime_ns: Optional[int] = None
+    #: name -> [size, mtime]
+    files: Dict[str, List[float]] = field(default_factory=dict)
+
+
+class IngestTracker:
+    """Per-sample file, byte and read counts for one input directory."""
+
+    def __init__(self, root: str, clock=time.time):
+        self.root = Path(root).expanduser()
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._dirs: Dict[str, _Dir] = {}
+        self._samples: Dict[str, SampleCounts] = {}
+        self._files = 0
+        self._bytes = 0
+        self._root_mtime_ns: Optional[int] = None
+        self._scanned = False
+        self._bytes_per_read: Optional[float] = None
+        self._ratio_tried_at = 0.0
+        self._observer = None
+        self._verified_at = 0.0
+        self.listings = 0  # directories listed so far (for tests and benchmarks)
+
+    # -- public -------------------------------------------------------------
+
+    def refresh(self) -> IngestSnapshot:
+        """Bring the counters up to date and return them.
+
+        The first call lists the whole tree. Later calls list only what
+        changed, and with a watcher running they usually do no I/O at all.
+        """
+        with self._lock:
+            now = self._clock()
+            if not self._scanned:
+                self._full_scan(now)
+            elif self._observer is None or now - self._verified_at >= VERIFY_INTERVAL_S:
+                self._poll(now)
+            self._ensure_ratio(now)
+            return self.snapshot()
+
+    def snapshot(self) -> IngestSnapshot:
+        """The current counters, without touching the filesystem."""
+        with self._lock:
+            bpr = self._bytes_per_read
+            per_sample = {
+                name: {
+                    "files": c.files,
+                    "bytes": c.bytes,
+                    "estimated_reads": int(c.bytes / bpr) if bpr else None,
+                    "last_arrival": c.last_arrival,
+                }
+                for name, c in self._samples.items()
+            }
+            arrivals = [c.last_arrival for c in self._samples.values() if c.last_arrival]
+            return IngestSnapshot(
+                files=self._files,
+                bytes=self._bytes,
+                estimated_reads=int(self._bytes / bpr) if bpr else None,
+                bytes_per_read=bpr,
+                last_arrival=max(arrivals) if arrivals else None,
+                per_sample=per_sample,
+            )
+
+    def start_watching(self) -> bool:
+        """Apply filesystem events as they happen (needs ``watchdog``).
+
+        Returns False, leaving the tracker polling on every refresh, when
+        ``watchdog`` is missing, the watch cannot be set up, or the root is
+        on a network filesystem.
+        """
+        if is_network_filesystem(self.root):
+            logger.info(f"{self.root} is on a network filesystem; polling it "
+                        "instead of watching for events")
+            return False
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return False
+        tracker = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_created(self, event):
+                if not event.is_directory:
+                    tracker.note_changed(event.src_path)
+                elif Path(event.src_path).parent == tracker.root:
+                    tracker.note_sample_dir(event.src_path)
+
+            def on_modified(self, event):
+                if not event.is_directory:
+                    tracker.note_changed(event.src_path)
+
+            def on_deleted(self, event):
+                if not event.is_directory:
+                    tracker.note_deleted(event.src_path)
+
+            def on_moved(self, event):
+                if not event.is_directory:
+                    tracker.note_deleted(event.src_path)
+                    tracker.note_changed(event.dest_path)
+
+        try:
+            observer = Observer()
+            observer.schedule(_Handler(), str(self.root), recursive=True)
+            observer.daemon = True
+            observer.start()
+        except OSError as e:  # inotify watch limit, root vanished, ...
+            logger.info(f"Input watcher unavailable for {self.root}, polling instead: {e}")
+            return False
+        self._observer = observer
+        return True
+
+    def stop(self) -> None:
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=2)
+
+    # -- event entry points (watcher thread) ---------------------------------
+
+    def note_changed(self, path: str) -> None:
+        """A file was created or written: add it, or update its size."""
+        p = Path(path)
+        if not is_fastq_name(p.name):
+            return
+        with self._lock:
+            d = self._dirs.get(str(p.parent))
+            if d is None:
+                return
+            try:
+                st = os.stat(p)
+            except OSError:
+                return
+            self._set_file(d, p.name, st.st_size, st.st_mtime, self._clock())
+
+    def note_deleted(self, path: str) -> None:
+        p = Path(path)
+        with self._lock:
+            d = self._dirs.get(str(p.parent))
+            if d is not None and p.name in d.files:
+                self._drop_file(d, p.name)
+
+    def note_sample_dir(self, path: str) -> None:
+        """A new subdirectory appeared under the root (a new barcode)."""
+        with self._lock:
+            p = Path(path)
+            if str(p) not in self._dirs and not p.name.startswith("."):
+                self._add_dir(p, p.name, self._clock(), initial=False)
+
+    # -- internals ----------------------------------------------------------
+
+    def _full_scan(self, now: float) -> None:
+        self._dirs.clear()
+        self._samples.clear()
+        self._files = self._bytes = 0
+        self._root_mtime_ns = _mtime_ns(self.root)
+        if self._root_mtime_ns is None:
+            self._scanned = True
+            return
+        self._add_dir(self.root, ROOT_SAMPLE, now, initial=True)
+        for sub in _sample_dirs(self.root) or []:
+            self._add_dir(Path(sub.path), sub.name, now, initial=True)
+        self._scanned = True
+        self._verified_at = now
+
+    def _poll(self, now: float) -> None:
+        root_mtime = _mtime_ns(self.root)
+        if root_mtime != self._root_mtime_ns:
+            self._root_mtime_ns = root_mtime
+            self._rediscover(now)
+        for key, d in list(self._dirs.items()):
+            mtime = _mtime_ns(key)
+            if mtime is None:
+                self._remove_dir(key)
+            elif mtime != d.mtime_ns:
+                self._relist(Path(key), d, now)
+            self._restat_growing(Path(key), d, now)
+        self._verified_at = now
+
+    def _rediscover(self, now: float) -> None:
+        """The root changed: pick up new sample directories, drop gone ones."""
+        if self._root_mtime_ns is None:
+            for key in list(self._dirs):
+                self._remove_dir(key)
+            return
+        subdirs = _sample_dirs(self.root)
+        if subdirs is None:
+            return
+        self.listings += 1
+        present = {str(self.root)} | {e.path for e in subdirs}
+        for key in [k for k in self._dirs if k not in present]:
+            self._remove_dir(key)
+        if str(self.root) not in self._dirs:
+            self._add_dir(self.root, ROOT_SAMPLE, now, initial=False)
+        for e in subdirs:
+            if e.path not in self._dirs:
+                self._add_dir(Path(e.path), e.name, now, initial=False)
+
+    def _add_dir(self, path: Path, sample: str, now: float, initial: bool) -> None:
+        d = _Dir(sample)
+        self._dirs[str(path)] = d
+        self._samples.setdefault(sample, SampleCounts())
+        self._relist(path, d, now, initial=initial)
+
+    def _remove_dir(self, key: str) -> None:
+        d = self._dirs.pop(key)
+        for name in list(d.files):
+            self._drop_file(d, name)
+        if not any(o.sample == d.sample for o in self._dirs.values()):
+            self._samples.pop(d.sample, None)
+
+    def _relist(self, path: Path, d: _Dir, now: float, initial: bool = False) -> None:
+        d.mtime_ns = _mtime_ns(path)
+        try:
+            names = {n for n in os.listdir(path) if is_fastq_name(n)}
+        except OSError:
+            return
+        self.listings += 1
+        for name in [n for n in d.files if n not in names]:
+            self._drop_file(d, name)
+        for name in names - d.files.keys():
+            try:
+                st = os.stat(path / name)
+            except OSError:
+                continue
+            # At start-up a file "arrived" when it was written, not now.
+            self._set_file(d, name, st.st_size, st.st_mtime,
+                           st.st_mtime if initial else now)
+
+    def _restat_growing(self, path: Path, d: _Dir, now: float) -> None:
+        for name, (_size, mtime) in list(d.files.items()):
+            if now - mtime > GROWING_WINDOW_S:
+                continue
+            try:
+                st = os.stat(path / name)
+            except OSError:
+                self._drop_file(d, name)
+                continue
+            self._set_file(d, name, st.st_size, st.st_mtime, None)
+
+    def _set_file(self, d: _Dir, name: str, size: int, mtime: float,
+                  arrival: Optional[float]) -> None:
+        counts = self._samples.setdefault(d.sample, SampleCounts())
+        old = d.files.get(name)
+        if old is None:
+            counts.files += 1
+            self._files += 1
+            if arrival is not None:
+                counts.last_arrival = max(counts.last_arrival or 0.0, arrival)
+        delta = size - (int(old[0]) if old else 0)
+        counts.bytes += delta
+        self._bytes += delta
+        d.files[name] = [size, mtime]
+
+    def _drop_file(self, d: _Dir, name: str) -> None:
+        size, _mtime = d.files.pop(name)
+        counts = self._samples.get(d.sample)
+        if counts is not None:
+            counts.files -= 1
+            counts.bytes -= int(size)
+        self._files -= 1
+        self._bytes -= int(size)
+
+    def _ensure_ratio(self, now: float) -> None:
+        """Sample bytes-per-read once, from files that are no longer growing."""
+        if self._bytes_per_read is not None or not self._files:
+            return
+        if now - self._ratio_tried_at < RATIO_RETRY_S:
+            return
+        self._ratio_tried_at = now
+        from nanometa_live.core.utils.read_length_probe import sample_bytes_per_read
+
+        settled = sorted(
+            (Path(key) / name for key, d in self._dirs.items()
+             for name, (size, mtime) in d.files.items()
+             if size and now - mtime > GROWING_WINDOW_S),
+            key=str,
+        )[:RATIO_SAMPLE_FILES]
+        ratios = [r for r in map(sample_bytes_per_read, settled) if r]
+        if ratios:
+            self._bytes_per_read = sum(ratios) / len(ratios)
+
+
+def _sample_dirs(root: Path) -> Optional[List[os.DirEntry]]:
+    """Every non-hidden subdirectory of ``root``, or None if it cannot be read.
+
+    The start-up scan and later rediscovery both use this, so a sample
+    directory that is still empty at start-up is tracked and its first
+    FASTQs are counted.
+    """
+    try:
+        return [e for e in os.scandir(root) if e.is_dir() and not e.name.startswith(".")]
+    except OSError:
+        return None
+
+
+def _mount_table() -> List[Tuple[str, str]]:
+    """``(mount point, filesystem type)`` for every mount, or ``[]``."""
+    try:
+        with open("/proc/self/mounts") as fh:
+            return [(_unescape_mount(fields[1]), fields[2])
+                    for fields in (line.split() for line in fh) if len(fields) > 2]
+    except OSError:
+        pass
+    try:
+        out = subprocess.run(["mount"], capture_output=True, text=True,
+                             timeout=5, check=True).stdout
+    except (OSError, subprocess.SubprocessError):
+        return []
+    return [m.groups() for m in map(_BSD_MOUNT_LINE.search, out.splitlines()) if m]
+
+
+def _unescape_mount(field: str) -> str:
+    """Undo the octal escapes (``\\040`` for a space) in ``/proc`` mount paths."""
+    return re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), field)
+
+
+def is_network_filesystem(path) -> bool:
+    """True when ``path`` lives on a network filesystem.
+
+    Matches the longest mount point containing ``path`` against
+    :data:`NETWORK_FS_TYPES`. False when the mount table cannot be read.
+    """
+    target = os.path.realpath(os.path.expanduser(str(path)))
+    best, fstype = "", ""
+    for mount_point, kind in _mount_table():
+        inside = target == mount_point or target.startswith(mount_point.rstrip(os.sep) + os.sep)
+        if inside and len(mount_point) >= len(best):
+            best, fstype = mount_point, kind
+    return fstype.lower() in NETWORK_FS_TYPES
+
+
+def _mtime_ns(path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+_trackers: Dict[str, IngestTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_ingest_tracker(root: str) -> IngestTracker:
+    """The process-wide tracker for ``root``, watching it when possible."""
+    key = os.path.realpath(os.path.expanduser(root))
+    with _trackers_lock:
+        tracker = _trackers.get(key)
+        if tracker is None:
+            tracker = _trackers[key] = IngestTracker(key)
+            tracker.start_watching()
+        return tracker
+
+
+def reset_ingest_trackers() -> None:
+    """Stop and forget every tracker (tests, or an input directory change)."""
+    with _trackers_lock:
+        trackers = list(_trackers.values())
+        _trackers.clear()
+    for tracker in trackers:
+        tracker.stop()
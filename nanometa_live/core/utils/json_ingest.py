@@ -0,0 +1,267 @@
+"""
+Summary-only JSON ingestion for the per-poll loaders.
+
+The loaders read a handful of top-level keys from JSON documents that are
+mostly bulk: a fastp report carries per-cycle quality and content curves, a
+k-mer table and a duplication histogram ahead of nothing the GUI uses, yet
+``json.load`` built every one of those objects on each parse. Only
+``summary`` and ``filtering_result`` were ever read.
+
+Three layers, cheapest first:
+
+- :func:`cached_json` keeps a per-file digest keyed by
+  ``(path, mtime_ns, size)``, so an unchanged file is never re-parsed across
+  polling ticks -- the directory-level mtime caches above it invalidate every
+  file in ``fastp/`` when any one of them changes.
+- :func:`extract_keys` streams a document and stops once the requested
+  top-level keys have been seen. fastp writes ``summary`` and
+  ``filtering_result`` first, so a 100 KB report costs one 4 KB read.
+  Values that are not wanted are skipped by bracket matching, never built.
+- :func:`loads` uses ``orjson`` when it is installed and the standard
+  library otherwise. ``orjson`` rejects the ``NaN`` and ``Infinity``
+  literals that Python's ``json.dump`` writes by default (and that some
+  tools' reports contain), so a document it refuses is re-parsed with
+  ``json.loads``, which accepts them.
+
+Every parse error surfaces as :class:`json.JSONDecodeError`, so call sites
+keep their existing ``except`` clauses. Failed parses are never cached.
+"""
+
+import codecs
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
+
+from nanometa_live.core.utils.bounded_cache import BoundedCache
+
+# Entries are one small digest per (file, key set); 4096 covers a long
+# 96-barcode run's fastp, BLAST and minimap2 sidecars with room to spare.
+JSON_DIGEST_CACHE_MAX = 4096
+
+# First read of a streamed document. Later reads grow geometrically so a
+# wanted key that sits behind a large value is still found in O(size).
+EXTRACT_CHUNK_BYTES = 4 * 1024
+
+# Top-level keys the fastp loaders read. Everything after them in the file
+# (curves, k-mer counts, duplication histograms) is never parsed.
+FASTP_SUMMARY_KEYS = ("summary", "filtering_result")
+
+_digest_lock = threading.Lock()
+# (path, keys) -> (mtime_ns, size, digest)
+_digest_cache = BoundedCache("json_digest", max_entries=JSON_DIGEST_CACHE_MAX)
+_parse_stats: Dict[str, float] = {"parses": 0, "hits": 0, "bytes": 0, "seconds": 0.0}
+
+_WS = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.S)
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_SCALAR_END = re.compile(r"[,}\]\s]")
+
+
+class _Incomplete(Exception):
+    """The buffer ended before the current token did; read more."""
+
+
+def loads(data: Any) -> Any:
+    """Parse a JSON ``str`` or ``bytes`` with the fastest available parser.
+
+    Falls back to ``json.loads`` when ``orjson`` refuses the document, so
+    ``NaN``/``Infinity`` parse either way and a genuinely malformed document
+    raises the standard library's error.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _record(nbytes: int, seconds: float) -> None:
+    with _digest_lock:
+        _parse_stats["parses"] += 1
+        _parse_stats["bytes"] += nbytes
+        _parse_stats["seconds"] += seconds
+
+
+def load_json(path: str) -> Any:
+    """Read and parse a whole JSON document (uncached)."""
+    start = time.perf_counter()
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    data = loads(raw)
+    _record(len(raw), time.perf_counter() - start)
+    return data
+
+
+def _skip_value(buf: str, pos: int) -> int:
+    """Return the index just past the JSON value starting at ``buf[pos]``."""
+    if pos >= len(buf):
+        raise _Incomplete
+    ch = buf[pos]
+    if ch == '"':
+        match = _STRING.match(buf, pos)
+        if match is None:
+            raise _Incomplete
+        return match.end()
+    if ch in "{[":
+        depth = 0
+        while True:
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                raise _Incomplete
+            token = match.group()
+            if token == '"':
+                string = _STRING.match(buf, match.start())
+                if string is None:
+                    raise _Incomplete
+                pos = string.end()
+                continue
+            depth += 1 if token in "{[" else -1
+            pos = match.end()
+            if depth == 0:
+                return pos
+    match = _SCALAR_END.search(buf, pos)
+    if match is None:
+        raise _Incomplete
+    return match.start()
+
+
+def _next_char(buf: str, pos: int) -> int:
+    pos = _WS.match(buf, pos).end()
+    if pos >= len(buf):
+        raise _Incomplete
+    return pos
+
+
+def _parse_member(buf: str, pos: int) -> Tuple[Optional[str], int, int, int]:
+    """Parse one ``"key": value`` member of the top-level object.
+
+    Returns ``(key, value_start, value_end, next_pos)``; ``key`` is None
+    when ``pos`` is at the closing brace.
+    """
+    pos = _next_char(buf, pos)
+    if buf[pos] == "}":
+        return None, pos, pos, pos + 1
+    match = _STRING.match(buf, pos)
+    if match is None:
+        if buf[pos] != '"':
+            raise json.JSONDecodeError("Expecting property name", buf, pos)
+        raise _Incomplete
+    key = json.loads(match.group())
+    pos = _next_char(buf, match.end())
+    if buf[pos] != ":":
+        raise json.JSONDecodeError("Expecting ':' delimiter", buf, pos)
+    start = _next_char(buf, pos + 1)
+    end = _skip_value(buf, start)
+    pos = _next_char(buf, end)
+    if buf[pos] == ",":
+        return key, start, end, pos + 1
+    if buf[pos] == "}":
+        return key, start, end, pos
+    raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+
+
+def extract_keys(path: str, keys: Iterable[str]) -> Dict[str, Any]:
+    """Parse only ``keys`` from the top-level object of the JSON at ``path``.
+
+    Reading stops as soon as every requested key has been seen. Keys absent
+    from the document are absent from the result. Raises
+    :class:`json.JSONDecodeError` on malformed or truncated input.
+    """
+    wanted = set(keys)
+    found: Dict[str, Any] = {}
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    start_time = time.perf_counter()
+    nbytes = 0
+    buf = ""
+    eof = False
+
+    with open(path, "rb") as fh:
+
+        def read_more() -> None:
+            nonlocal buf, nbytes, eof
+            if eof:
+                raise json.JSONDecodeError("Unterminated JSON document", buf, len(buf))
+            chunk = fh.read(max(EXTRACT_CHUNK_BYTES, len(buf)))
+            nbytes += len(chunk)
+            eof = not chunk
+            buf += decoder.decode(chunk, final=eof)
+
+        pos = 0
+        while True:
+            try:
+                pos = _next_char(buf, pos)
+                break
+            except _Incomplete:
+                read_more()
+        if buf[pos] != "{":
+            raise json.JSONDecodeError("Expecting a JSON object", buf, pos)
+        pos += 1
+
+        while wanted - found.keys():
+            try:
+                key, start, end, next_pos = _parse_member(buf, pos)
+            except _Incomplete:
+                read_more()
+                continue
+            if key is None:
+                break
+            if key in wanted and key not in found:
+                found[key] = loads(buf[start:end])
+            pos = next_pos
+
+    _record(nbytes, time.perf_counter() - start_time)
+    return found
+
+
+def cached_json(path: str, keys: Optional[Iterable[str]] = None) -> Any:
+    """Return the parsed document at ``path``, re-parsing only when it changed.
+
+    With ``keys``, only those top-level keys are extracted (see
+    :func:`extract_keys`) and a dict of them is returned; without, the whole
+    document is parsed. Entries are keyed by ``(path, mtime_ns, size)``.
+
+    The returned top-level dict is a fresh copy, but nested values are
+    shared with the cache and must not be mutated.
+    """
+    path = os.fspath(path)
+    key_tuple = tuple(keys) if keys is not None else None
+    cache_key = (path, key_tuple)
+    st = os.stat(path)
+
+    with _digest_lock:
+        entry = _digest_cache.get(cache_key)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            _parse_stats["hits"] += 1
+            digest = entry[2]
+            return dict(digest) if isinstance(digest, dict) else digest
+
+    digest = extract_keys(path, key_tuple) if key_tuple is not None else load_json(path)
+
+    with _digest_lock:
+        _digest_cache[cache_key] = (st.st_mtime_ns, st.st_size, digest)
+    logging.debug("Parsed JSON digest for %s (%s)", path, key_tuple or "full")
+    return dict(digest) if isinstance(digest, dict) else digest
+
+
+def json_parse_stats() -> Dict[str, float]:
+    """Cumulative parse counters: ``parses``, ``hits``, ``bytes``, ``seconds``."""
+    with _digest_lock:
+        return dict(_parse_stats)
+
+
+def clear_json_cache() -> None:
+    """Drop every cached digest and reset the parse counters."""
+    with _digest_lock:
+        _digest_cache.clear()
+        for name in _parse_stats:
+            _parse_stats[name] = 0.0 if name == "seconds" else 0
@@ -11,33 +11,31 @@ import logging
 import os
 import threading
 import time
-import pandas as pd
 from typing import Any, Dict, List, Optional, Tuple
 
+from nanometa_live.core.utils.bounded_cache import BoundedCache, clear_caches
+from nanometa_live.core.utils.metrics import cache_lookup, timed_loader
+from nanometa_live.core.utils.results_catalog import (
+    RESULTS_WATCHED_SUBDIRS,
+    catalog_fingerprint,
+    clear_catalog,
+    refresh_catalog,
+)
 from nanometa_live.core.utils.sample_detector import (
     get_available_samples,
     resolve_analysis_directory
 )
 
 
-# Results subdirectories whose contents drive GUI refreshes. This is the
-# single watch list shared by check_data_freshness (the results-fingerprint
-# store) and first-batch detection (app/utils/first_batch.py); the two had
-# drifted apart, and neither watched canonical/ although the loaders read it
-# before any cache (2026-08-17 audit, finding C6).
-RESULTS_WATCHED_SUBDIRS = (
-    "kraken2",
-    "fastp",
-    "seqkit",
-    "validation",
-    "taxpasta",
-    "canonical",
-    "on_demand_validation",
-)
-
+# RESULTS_WATCHED_SUBDIRS -- the single watch list shared by
+# check_data_freshness and first-batch detection -- lives with the results
+# catalog that scans it, and is re-exported here for existing importers.
 # Cache configuration
 CACHE_TTL_SECONDS = 30  # Time-to-live for cached data
 CACHE_MAX_ENTRIES = 100  # Maximum cache entries to prevent unbounded growth
+# The mtime cache holds one entry per (loader, sample): a 96-barcode run
+# needs several hundred. Its memory is bounded by the global cache cap.
+MTIME_CACHE_MAX_ENTRIES = 2048
 CACHE_CLEANUP_INTERVAL_SECONDS = 60  # Run cleanup every 60 seconds
 
 # File stability configuration (for real-time mode)
@@ -47,14 +45,20 @@ FILE_STABILITY_MIN_SIZE_BYTES = 10  # Minimum file size to consider valid
 # Module-level cache storage -- protected by _cache_lock for thread safety.
 # Dash/Flask runs callbacks concurrently in multiple threads, so all reads
 # and writes to these shared dicts must be serialized.
+#
+# Values are (stored_at, result); entries also expire on their own after
+# CACHE_TTL_SECONDS, and the least recently used go past CACHE_MAX_ENTRIES
+# (bounded_cache).
 _cache_lock = threading.Lock()
-_kraken_cache: Dict[str, Tuple[float, pd.DataFrame]] = {}
-_fastp_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_kraken_cache = BoundedCache(
+    "kraken_ttl", max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS)
+_fastp_cache = BoundedCache(
+    "fastp_ttl", max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS)
 _last_cache_cleanup: float = 0.0  # Track last cleanup time
 
 # File mtime/size cache: maps cache_key -> (path_fingerprint, epoch, result).
 # Used for O(stat) freshness checks instead of O(parse).
-_file_mtimes: Dict[str, Tuple[Tuple[float, int, int], int, Any]] = {}
+_file_mtimes = BoundedCache("mtime", max_entries=MTIME_CACHE_MAX_ENTRIES)
 # Last freshness fingerprint for change detection
 _last_freshness_fingerprint: str = ""
 
@@ -75,6 +79,12 @@ _last_freshness_fingerprint: str = ""
 # them stale data.
 _freshness_epoch: int = 0
 
+# /metrics counters for the mtime cache, bound once so a lookup pays only
+# the increment.
+_MTIME_HIT = cache_lookup("mtime", "hit")
+_MTIME_STALE = cache_lookup("mtime", "stale")
+_MTIME_ABSENT = cache_lookup("mtime", "absent")
+
 # Per-key parse locks. Concurrent callbacks that all miss the mtime cache
 # at the same instant (because kraken2/ mtime advanced since their last
 # read) would otherwise each start a full re-parse, despite a shared
@@ -121,25 +131,32 @@ def _is_file_stable(filepath: str, wait_ms: int = FILE_STABILITY_CHECK_INTERVAL_
     """
     try:
         stat_result = os.stat(filepath)
-
-        # File must have minimum content
-        if stat_result.st_size < FILE_STABILITY_MIN_SIZE_BYTES:
-            logging.debug(f"File too small ({stat_result.st_size} bytes), may be incomplete: {filepath}")
-            return False
-
-        # File is stable if its mtime is older than the threshold
-        age_seconds = time.time() - stat_result.st_mtime
-        threshold_seconds = max(wait_ms / 1000.0, 1.0)
-
-        if age_seconds < threshold_seconds:
-            logging.debug(f"File modified {age_seconds:.2f}s ago, may still be written: {filepath}")
-            return False
-
-        return True
-
     except OSError as e:
         logging.warning(f"Error checking file stability for {filepath}: {e}")
         return False
+    return _is_stat_stable(filepath, stat_result, wait_ms)
+
+
+def _is_stat_stable(
+    filepath: str,
+    stat_result: os.stat_result,
+    wait_ms: int = FILE_STABILITY_CHECK_INTERVAL_MS,
+) -> bool:
+    """``_is_file_stable`` for a caller that already holds the stat result."""
+    # File must have minimum content
+    if stat_result.st_size < FILE_STABILITY_MIN_SIZE_BYTES:
+        logging.debug(f"File too small ({stat_result.st_size} bytes), may be incomplete: {filepath}")
+        return False
+
+    # File is stable if its mtime is older than the threshold
+    age_seconds = time.time() - stat_result.st_mtime
+    threshold_seconds = max(wait_ms / 1000.0, 1.0)
+
+    if age_seconds < threshold_seconds:
+        logging.debug(f"File modified {age_seconds:.2f}s ago, may still be written: {filepath}")
+        return False
+
+    return True
 
 
 def _get_cache_key(main_dir: str, sample: Optional[str]) -> str:
@@ -155,10 +172,10 @@ def _is_cache_valid(cache_time: float) -> bool:
 
 def _cleanup_stale_cache_entries():
     """
-    Remove stale entries from caches to prevent memory leaks.
+    Drop expired TTL-cache entries so they do not hold memory until looked up.
 
-    This function is called periodically to remove expired entries.
-    It also enforces a maximum cache size by removing oldest entries.
+    Entry and byte bounds are enforced on every store by ``BoundedCache``;
+    this periodic sweep only frees entries nobody asks for again.
 
     Caller must hold _cache_lock.
     """
@@ -171,59 +188,33 @@ def _cleanup_stale_cache_entries():
         return
 
     _last_cache_cleanup = current_time
-
-    # Clean Kraken cache
-    stale_keys = [
-        key for key, (cache_time, _) in _kraken_cache.items()
-        if not _is_cache_valid(cache_time)
-    ]
-    for key in stale_keys:
-        del _kraken_cache[key]
-
-    # If still too many entries, remove oldest
-    if len(_kraken_cache) > CACHE_MAX_ENTRIES:
-        sorted_entries = sorted(_kraken_cache.items(), key=lambda x: x[1][0])
-        entries_to_remove = len(_kraken_cache) - CACHE_MAX_ENTRIES
-        for key, _ in sorted_entries[:entries_to_remove]:
-            del _kraken_cache[key]
-
-    # Clean FASTP cache
-    stale_keys = [
-        key for key, (cache_time, _) in _fastp_cache.items()
-        if not _is_cache_valid(cache_time)
-    ]
-    for key in stale_keys:
-        del _fastp_cache[key]
-
-    # If still too many entries, remove oldest
-    if len(_fastp_cache) > CACHE_MAX_ENTRIES:
-        sorted_entries = sorted(_fastp_cache.items(), key=lambda x: x[1][0])
-        entries_to_remove = len(_fastp_cache) - CACHE_MAX_ENTRIES
-        for key, _ in sorted_entries[:entries_to_remove]:
-            del _fastp_cache[key]
-
-    # Clean mtime cache (enforce max size)
-    if len(_file_mtimes) > CACHE_MAX_ENTRIES:
-        # Remove entries with oldest cached results (no TTL, just cap size)
-        sorted_entries = sorted(_file_mtimes.items(), key=lambda x: x[1][0])
-        entries_to_remove = len(_file_mtimes) - CACHE_MAX_ENTRIES
-        for key, _ in sorted_entries[:entries_to_remove]:
-            del _file_mtimes[key]
-        removed_mtime = entries_to_remove
-    else:
-        removed_mtime = 0
-
-    total_removed = len(stale_keys) + removed_mtime
+    total_removed = _kraken_cache.expire() + _fastp_cache.expire()
     if total_removed:
         logging.debug(f"Cache cleanup: removed {total_removed} stale entries")
 
 
 def clear_data_cache():
     """Clear all cached data. Call when data is expected to have changed."""
+    from nanometa_live.core.utils.abundance_timeseries import clear_abundance_series_cache
+    from nanometa_live.core.parsers.coverage_pyramid import clear_coverage_pyramids
+    from nanometa_live.core.parsers.kraken_read_profiles import clear_read_profile_cache
+    from nanometa_live.core.parsers.validation_cache import clear_validation_caches
+    from nanometa_live.core.utils.json_ingest import clear_json_cache
+    from nanometa_live.core.utils.qc_sketch import clear_sketch_cache
+    from nanometa_live.core.utils.shared_frames import clear_shared_memo
+
     with _cache_lock:
         _kraken_cache.clear()
         _fastp_cache.clear()
         _file_mtimes.clear()
+    clear_json_cache()
+    clear_sketch_cache()
+    clear_abundance_series_cache()
+    clear_read_profile_cache()
+    clear_validation_caches()
+    clear_coverage_pyramids()
+    clear_shared_memo()
+    clear_catalog()
 
 
 def clear_all_loader_caches():
@@ -236,18 +227,16 @@ def clear_all_loader_caches():
     the next run inside the same process -- the loaders are module-global
     state, so "new run" is invisible to them unless someone says so.
 
-    Imports are local to avoid cycles: classification_loaders and
-    sample_detector both import from this module.
+    The parsed-frame, sample-detector and other per-run caches are
+    ``BoundedCache`` instances and are cleared through the registry, so a
+    new one needs no line here. Imports are local to avoid cycles.
     """
     from nanometa_live.core.utils.alert_engine import get_alert_engine
-    from nanometa_live.core.utils.classification_loaders import (
-        clear_report_frame_cache,
-    )
-    from nanometa_live.core.utils.sample_detector import invalidate_sample_cache
+    from nanometa_live.core.utils.shared_frames import purge_shared_cache
 
     clear_data_cache()
-    clear_report_frame_cache()
-    invalidate_sample_cache()
+    purge_shared_cache()
+    clear_caches(run_scoped_only=True)
     get_alert_engine().clear_alerts()
 
 
@@ -307,7 +296,13 @@ def _get_path_fingerprint(paths: List[str]) -> Tuple[float, int, int]:
     lock in an empty result.
 
     For regular files, uses their individual stat values.
+
+    Paths inside the live results catalog are answered from it: the catalog
+    stat-ed every one of those files in this poll's freshness check.
     """
+    cached = catalog_fingerprint(paths)
+    if cached is not None:
+        return cached
     combined_mtime = 0.0
     combined_size = 0
     file_count = 0
@@ -401,20 +396,25 @@ def _mtime_cache_state(
     ``hit``.
     """
     with _cache_lock:
-        if cache_key not in _file_mtimes:
+        entry = _file_mtimes.get(cache_key)
+        if entry is None:
+            _MTIME_ABSENT.inc()
             return ("absent", None)
-        stored_fp, stored_epoch, cached_result = _file_mtimes[cache_key]
+        stored_fp, stored_epoch, cached_result = entry
         epoch = _freshness_epoch
 
     if epoch and stored_epoch == epoch:
+        _MTIME_HIT.inc()
         return ("hit", cached_result)
 
     current_fp = _get_path_fingerprint(paths)
     if current_fp == stored_fp:
         with _cache_lock:
             _file_mtimes[cache_key] = (stored_fp, epoch, cached_result)
+        _MTIME_HIT.inc()
         return ("hit", cached_result)
 
+    _MTIME_STALE.inc()
     return ("stale", None)
 
 
@@ -433,6 +433,7 @@ def _store_mtime_cache(
         _file_mtimes[cache_key] = (fp, _freshness_epoch, result)
 
 
+@timed_loader("check_data_freshness")
 def check_data_freshness(main_dir: str) -> str:
     """
     Return a fingerprint string representing the freshness of result data.
@@ -463,10 +464,15 @@ def check_data_freshness(main_dir: str) -> str:
     # outdirs, or one emptied by Archive) would otherwise fail to bump the
     # epoch on a switch -- and every mtime-cache entry stamped with the
     # current epoch keeps answering without a filesystem check.
+    #
+    # The walk goes through the results catalog, which lists again only the
+    # directories whose mtime moved and keeps the snapshot the rest of the
+    # poll's glob/exists/fingerprint lookups are answered from. Per subdir
+    # it yields the same (latest mtime, file count) as _get_dir_latest_mtime.
+    catalog = refresh_catalog(main_dir, _MAX_FINGERPRINT_FILES)
     parts = [main_dir]
     for subdir in RESULTS_WATCHED_SUBDIRS:
-        dirpath = os.path.join(main_dir, subdir)
-        mt, n_files = _get_dir_latest_mtime(dirpath)
+        mt, n_files = catalog.subdir_summary(subdir)
         parts.append(f"{subdir}:{mt}:{n_files}")
 
     raw = "|".join(parts)
@@ -0,0 +1,373 @@
+"""
+In-process metrics: counters, gauges and histograms with Prometheus output.
+
+``scripts/perf/instrument.py`` counts syscalls by monkeypatching, which is
+fine offline and far too heavy for a running dashboard. This registry is
+the production counterpart: loaders, caches and the Dash dispatch route
+record into it, and ``/metrics`` renders it in the Prometheus text format
+(see ``app/utils/metrics_endpoint.py``).
+
+Cost is kept to a dictionary update under a lock per recorded event. Hot
+call sites bind their label values once at import with ``.labels(...)``, so
+recording does no label handling per call. A histogram observation is one
+``bisect`` over at most a dozen bounds. Setting ``NANOMETA_METRICS=0`` turns
+every recording call into an early return.
+
+Metrics whose value already lives elsewhere (cache sizes, the JSON digest
+counters) are not mirrored. They are registered with a callback that is
+read only when ``/metrics`` is scraped.
+
+No third-party client is used: ``prometheus_client`` is not a dependency,
+and the exposition format for these three types is a few lines.
+"""
+
+import bisect
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+_enabled = os.environ.get("NANOMETA_METRICS", "1").strip().lower() not in ("0", "false", "no", "off")
+
+# Seconds. Loader calls range from a cache hit (microseconds) to a cold
+# 96-barcode aggregation (seconds); callbacks reach tens of seconds.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def metrics_enabled() -> bool:
+    return _enabled
+
+
+def set_metrics_enabled(enabled: bool) -> None:
+    """Turn recording on or off process-wide (rendering still works)."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: LabelValues,
+                   extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """Sample lines in the Prometheus text format, without the header."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Forget every recorded value."""
+
+
+class _BoundCounter:
+    __slots__ = ("_metric", "_key")
+
+    def __init__(self, metric: "Counter", key: LabelValues):
+        self._metric = metric
+        self._key = key
+
+    def inc(self, amount: float = 1.0) -> None:
+        if _enabled:
+            self._metric._add(self._key, amount)
+
+
+class Counter(_Metric):
+    """Monotonic count, optionally split by labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def labels(self, **labels: str) -> _BoundCounter:
+        return _BoundCounter(self, self._key(labels))
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if _enabled:
+            self._add(self._key(labels), amount)
+
+    def _add(self, key: LabelValues, amount: float) -> None:
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}"
+                for k, v in items]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    """A value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        if _enabled:
+            key = self._key(labels)
+            with self._lock:
+                self._values[key] = float(value)
+
+
+class _BoundHistogram:
+    __slots__ = ("_metric", "_key")
+
+    def __init__(self, metric: "Histogram", key: LabelValues):
+        self._metric = metric
+        self._key = key
+
+    def observe(self, value: float) -> None:
+        if _enabled:
+            self._metric._observe(self._key, value)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram(_Metric):
+    """Fixed-bucket distribution (cumulative buckets, sum and count)."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts..., overflow, sum, count]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def labels(self, **labels: str) -> _BoundHistogram:
+        return _BoundHistogram(self, self._key(labels))
+
+    def observe(self, value: float, **labels: str) -> None:
+        if _enabled:
+            self._observe(self._key(labels), value)
+
+    def _observe(self, key: LabelValues, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 3)
+            state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def snapshot(self, **labels: str) -> Tuple[float, int]:
+        """``(sum, count)`` for one label set."""
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return (state[-2], int(state[-1])) if state else (0.0, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        lines = []
+        for key, state in items:
+            running = 0.0
+            for bound, count in zip(self.buckets + (float("inf"),), state[:-2]):
+                running += count
+                labels = _format_labels(self.labelnames, key, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(running)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(state[-1])}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class _CallbackMetric(_Metric):
+    """A counter or gauge whose samples are read from ``fn`` at render time."""
+
+    def __init__(self, kind: str, name: str, help_text: str,
+                 labelnames: Sequence[str],
+                 fn: Callable[[], Dict[LabelValues, float]]):
+        super().__init__(name, help_text, labelnames)
+        self.kind = kind
+        self._fn = fn
+
+    def render(self) -> List[str]:
+        try:
+            samples = self._fn()
+        except Exception:
+            return []
+        return [f"{self.name}{_format_labels(self.labelnames, tuple(map(str, k)))} "
+                f"{_format_value(v)}" for k, v in sorted(samples.items())]
+
+    def reset(self) -> None:
+        pass
+
+
+class MetricsRegistry:
+    """Named metrics, rendered together in registration order."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"metric {metric.name} already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def register_callback(self, kind: str, name: str, help_text: str,
+                          labelnames: Sequence[str],
+                          fn: Callable[[], Dict[LabelValues, float]]) -> None:
+        """Register a ``counter`` or ``gauge`` read from ``fn`` at render time.
+
+        ``fn`` returns ``{label values tuple: value}``. Re-registering a name
+        replaces the callback.
+        """
+        if kind not in ("counter", "gauge"):
+            raise ValueError(f"callback metrics are counters or gauges, not {kind}")
+        with self._lock:
+            self._metrics[name] = _CallbackMetric(kind, name, help_text, labelnames, fn)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Everything in the Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Zero every recorded value; registrations are kept."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+REGISTRY = MetricsRegistry()
+
+CACHE_LOOKUPS = REGISTRY.counter(
+    "nanometa_cache_lookups_total",
+    "Loader cache lookups by cache and outcome.",
+    ("cache", "result"),
+)
+LOADER_SECONDS = REGISTRY.histogram(
+    "nanometa_loader_seconds",
+    "Wall time of loader calls, cache hits included.",
+    ("loader",),
+)
+CALLBACK_SECONDS = REGISTRY.histogram(
+    "nanometa_callback_seconds",
+    "Wall time of Dash callback requests, by output.",
+    ("output",),
+)
+CALLBACK_ERRORS = REGISTRY.counter(
+    "nanometa_callback_errors_total",
+    "Dash callback requests that returned an HTTP error, by output.",
+    ("output",),
+)
+
+
+def cache_lookup(cache: str, result: str) -> _BoundCounter:
+    """Pre-bound counter for one (cache, result) pair; bind once at import."""
+    return CACHE_LOOKUPS.labels(cache=cache, result=result)
+
+
+def timed_loader(loader: str) -> Callable[[Callable], Callable]:
+    """Decorator recording the wrapped call's duration in ``nanometa_loader_seconds``."""
+    bound = LOADER_SECONDS.labels(loader=loader)
+
+    def decorate(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                bound.observe(time.perf_counter() - start)
+
+        return wrapper
+
+    return decorate
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
+
+
+def reset_metrics() -> None:
+    REGISTRY.reset()
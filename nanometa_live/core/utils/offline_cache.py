@@ -8,11 +8,14 @@ Features:
 - Persistent cache storage in ~/.nanometa/cache/
 - TTL-based cache expiration
 - Offline mode flag for air-gapped environments
-- Pre-bundled taxonomy snapshot support
+- Pre-bundled taxonomy snapshot support, as JSON or as a packed file
+  (``taxonomy_pack``) imported in parallel, resumable batches
+- Statistics from a summary maintained on every write, not a directory scan
 """
 
 import json
 import os
+import re
 import time
 import hashlib
 import logging
@@ -20,6 +23,7 @@ import threading
 from pathlib import Path
 from typing import Dict, Optional, Any
 from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
 logger = logging.getLogger(__name__)
@@ -39,6 +43,17 @@ DEFAULT_CACHE_DIR = _default_cache_dir()
 # Cache TTL (time-to-live) in seconds
 DEFAULT_TTL = 7 * 24 * 60 * 60  # 7 days
 
+CACHE_TYPES = ("gtdb", "ncbi", "species")
+# Entries written per batch by a snapshot import; progress is recorded
+# after each, so an interrupted import resumes at the last batch boundary.
+IMPORT_BATCH = 1024
+_IO_WORKERS = 4
+_IMPORT_MARKER = ".snapshot_import.json"
+# The file names _get_cache_key produces. A pack's index is untrusted
+# input (it arrives inside a bundle), so its keys must match this before
+# they are joined onto the cache directory.
+_PACK_KEY = re.compile(r"(%s)_[A-Za-z0-9._-]+\.json" % "|".join(CACHE_TYPES))
+
 
 @dataclass
 class CacheEntry:
@@ -100,6 +115,9 @@ class OfflineTaxonomyCache:
 
         # Load metadata
         self._metadata = self._load_metadata()
+        if "summary" not in self._metadata:
+            self._rebuild_summary()
+            self._save_metadata()
 
     def _init_directories(self) -> None:
         """Create cache directories if they don't exist."""
@@ -154,14 +172,18 @@ class OfflineTaxonomyCache:
         safe_id = "".join(c if c.isalnum() or c in "._-" else "_" for c in safe_id)
         return f"{cache_type}_{safe_id}.json"
 
-    def _get_cache_path(self, key: str, cache_type: str = "species") -> Path:
-        """Get the file path for a cache key."""
+    def _type_dir(self, cache_type: str) -> Path:
+        """Directory holding one cache type's files."""
         if cache_type == "gtdb":
-            return self.gtdb_cache_dir / key
+            return self.gtdb_cache_dir
         elif cache_type == "ncbi":
-            return self.ncbi_cache_dir / key
+            return self.ncbi_cache_dir
         else:
-            return self.species_cache_dir / key
+            return self.species_cache_dir
+
+    def _get_cache_path(self, key: str, cache_type: str = "species") -> Path:
+        """Get the file path for a cache key."""
+        return self._type_dir(cache_type) / key
 
     def get(
         self,
@@ -223,8 +245,6 @@ class OfflineTaxonomyCache:
             True if successfully cached
         """
         key = self._get_cache_key(identifier, cache_type)
-        cache_path = self._get_cache_path(key, cache_type)
-
         entry = CacheEntry(
             key=key,
             data=data,
@@ -234,8 +254,8 @@ class OfflineTaxonomyCache:
         )
 
         try:
-            cache_path.write_text(json.dumps(entry.to_dict(), indent=2))
-            self._metadata["entry_count"] = self._metadata.get("entry_count", 0) + 1
+            self._store(cache_type, key, json.dumps(entry.to_dict(), indent=2).encode(),
+                        entry.created_at + entry.ttl)
             self._save_metadata()
             logger.debug(f"Cached {identifier}")
             return True
@@ -243,6 +263,81 @@ class OfflineTaxonomyCache:
             logger.warning(f"Error caching {identifier}: {e}")
             return False
 
+    # ------------------------------------------------------------------
+    # Summary: per-type entry count, bytes and expiry times, kept in the
+    # metadata file so statistics never walk the cache directories.
+    # ------------------------------------------------------------------
+
+    def _summary(self, cache_type: str) -> Dict:
+        summary = self._metadata.setdefault("summary", {})
+        return summary.setdefault(cache_type, {"entries": 0, "bytes": 0, "expiries": {}})
+
+    def _account(self, cache_type: str, size: int, expires_at: Optional[float], sign: int) -> None:
+        part = self._summary(cache_type)
+        part["entries"] = max(0, part["entries"] + sign)
+        part["bytes"] = max(0, part["bytes"] + sign * size)
+        if expires_at is not None:
+            second = str(int(expires_at))
+            left = part["expiries"].get(second, 0) + sign
+            if left > 0:
+                part["expiries"][second] = left
+            else:
+                part["expiries"].pop(second, None)
+        self._metadata["entry_count"] = sum(
+            p["entries"] for p in self._metadata["summary"].values())
+
+    def _rebuild_summary(self) -> None:
+        """Recount the summary from the cache files (one directory scan)."""
+        self._metadata["summary"] = {}
+        for cache_type in CACHE_TYPES:
+            self._summary(cache_type)
+            for cache_file in self._type_dir(cache_type).glob("*.json"):
+                try:
+                    raw = cache_file.read_bytes()
+                    self._account(cache_type, len(raw), _expires_at(raw), +1)
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    logger.debug(f"Skipping unreadable cache file {cache_file}: {e}")
+        self._metadata["entry_count"] = sum(
+            p["entries"] for p in self._metadata["summary"].values())
+
+    def _replace_file(self, cache_type: str, key: str, raw: bytes):
+        """Write one cache file; returns the replaced file's (size, expiry) or None."""
+        path = self._get_cache_path(key, cache_type)
+        old = None
+        try:
+            previous = path.read_bytes()
+        except FileNotFoundError:
+            pass
+        else:
+            try:
+                old = (len(previous), _expires_at(previous))
+            except (ValueError, KeyError, TypeError):
+                old = (len(previous), None)
+        path.write_bytes(raw)
+        return old
+
+    def _store(self, cache_type: str, key: str, raw: bytes, expires_at: float) -> None:
+        old = self._replace_file(cache_type, key, raw)
+        if old is not None:
+            self._account(cache_type, old[0], old[1], -1)
+        self._account(cache_type, len(raw), expires_at, +1)
+
+    def _store_batch(self, records) -> int:
+        """Write ``(cache_type, key, raw, expires_at)`` records in parallel.
+
+        The summary is updated once the batch is on disk; the caller saves
+        the metadata.
+        """
+        # Two identifiers can sanitise to one file name; the last one wins.
+        records = list({(r[0], r[1]): r for r in records}.values())
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as pool:
+            olds = list(pool.map(lambda r: self._replace_file(*r[:3]), records))
+        for (cache_type, _key, raw, expires_at), old in zip(records, olds):
+            if old is not None:
+                self._account(cache_type, old[0], old[1], -1)
+            self._account(cache_type, len(raw), expires_at, +1)
+        return len(records)
+
     def get_species_info(self, taxid: int) -> Optional[Dict]:
         """
         Get cached species information by taxid.
@@ -322,7 +417,11 @@ class OfflineTaxonomyCache:
         """
         Load a pre-bundled taxonomy snapshot into the cache.
 
-        Snapshots are JSON files containing bulk taxonomy data for offline use.
+        Accepts a packed snapshot (see ``taxonomy_pack``) or the legacy JSON
+        document. Packed entries keep the timestamps they were cached with
+        and are written in parallel batches; an interrupted import of the
+        same pack resumes after the last completed batch. JSON entries are
+        stamped as fresh ``snapshot`` entries.
 
         Args:
             snapshot_path: Path to snapshot file
@@ -330,11 +429,19 @@ class OfflineTaxonomyCache:
         Returns:
             Number of entries loaded
         """
+        from nanometa_live.core.utils.taxonomy_pack import is_pack
+
         snapshot_path = Path(snapshot_path).expanduser()
 
         if not snapshot_path.exists():
             logger.error(f"Snapshot not found: {snapshot_path}")
             return 0
+        if is_pack(snapshot_path):
+            try:
+                return self._import_pack(snapshot_path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.error(f"Error reading snapshot: {e}")
+                return 0
 
         try:
             snapshot_data = json.loads(snapshot_path.read_text())
@@ -342,37 +449,82 @@ class OfflineTaxonomyCache:
             logger.error(f"Error reading snapshot: {e}")
             return 0
 
-        loaded_count = 0
-
-        # Load GTDB entries
-        for species_name, data in snapshot_data.get("gtdb", {}).items():
-            if self.set(species_name, data, cache_type="gtdb", source="snapshot"):
-                loaded_count += 1
-
-        # Load NCBI entries
-        for taxid, data in snapshot_data.get("ncbi", {}).items():
-            if self.set(taxid, data, cache_type="ncbi", source="snapshot"):
-                loaded_count += 1
+        now = time.time()
+        records = []
+        for cache_type in CACHE_TYPES:
+            for identifier, data in snapshot_data.get(cache_type, {}).items():
+                key = self._get_cache_key(identifier, cache_type)
+                entry = CacheEntry(key=key, data=data, created_at=now,
+                                   ttl=self.ttl, source="snapshot")
+                records.append((cache_type, key,
+                                json.dumps(entry.to_dict(), indent=2).encode(), now + self.ttl))
 
-        # Load species entries
-        for taxid, data in snapshot_data.get("species", {}).items():
-            if self.set(taxid, data, cache_type="species", source="snapshot"):
-                loaded_count += 1
+        loaded_count = 0
+        for start in range(0, len(records), IMPORT_BATCH):
+            try:
+                loaded_count += self._store_batch(records[start:start + IMPORT_BATCH])
+            except IOError as e:
+                logger.warning(f"Error loading snapshot batch: {e}")
+        self._save_metadata()
 
         logger.info(f"Loaded {loaded_count} entries from snapshot")
         return loaded_count
 
+    def _import_pack(self, pack_path: Path) -> int:
+        from nanometa_live.core.utils.taxonomy_pack import PackedSnapshot
+
+        marker = self.cache_dir / _IMPORT_MARKER
+        st = pack_path.stat()
+        ident = {"pack": str(pack_path.resolve()), "size": st.st_size,
+                 "mtime_ns": st.st_mtime_ns}
+        try:
+            progress = json.loads(marker.read_text())
+        except (OSError, ValueError):
+            progress = {}
+        resumed = progress.get("ident") == ident
+        done = int(progress.get("done", 0)) if resumed else 0
+        if resumed:
+            logger.info(f"Resuming snapshot import at entry {done}")
+
+        with PackedSnapshot(pack_path) as pack:
+            _check_pack_keys(pack.rows)
+            for start in range(done, len(pack), IMPORT_BATCH):
+                batch = range(start, min(start + IMPORT_BATCH, len(pack)))
+                raws = pack.raw_batch(batch)
+                self._store_batch(
+                    (pack.rows[i][0], pack.rows[i][1], raw, pack.rows[i][5])
+                    for i, raw in zip(batch, raws)
+                )
+                marker.write_text(json.dumps({"ident": ident, "done": batch.stop}))
+                self._save_metadata()
+            total = len(pack)
+
+        if resumed:
+            # Files written by the interrupted batch were never counted.
+            self._rebuild_summary()
+            self._save_metadata()
+        marker.unlink(missing_ok=True)
+        logger.info(f"Loaded {total - done} entries from snapshot")
+        return total - done
+
     def export_snapshot(self, output_path: str) -> int:
         """
         Export current cache to a snapshot file.
 
+        A path ending in ``taxonomy_pack.PACK_SUFFIX`` gets a packed
+        snapshot; any other path the legacy JSON document.
+
         Args:
             output_path: Path to save snapshot
 
         Returns:
             Number of entries exported
         """
+        from nanometa_live.core.utils.taxonomy_pack import PACK_SUFFIX
+
         output_path = Path(output_path).expanduser()
+        if output_path.suffix == PACK_SUFFIX:
+            return self._export_pack(output_path)
 
         snapshot = {
             "gtdb": {},
@@ -387,12 +539,8 @@ class OfflineTaxonomyCache:
         export_count = 0
 
         # Export each cache type
-        for cache_type, cache_dir in [
-            ("gtdb", self.gtdb_cache_dir),
-            ("ncbi", self.ncbi_cache_dir),
-            ("species", self.species_cache_dir)
-        ]:
-            for cache_file in cache_dir.glob("*.json"):
+        for cache_type in CACHE_TYPES:
+            for cache_file in self._type_dir(cache_type).glob("*.json"):
                 try:
                     entry_data = json.loads(cache_file.read_text())
                     entry = CacheEntry.from_dict(entry_data)
@@ -411,36 +559,68 @@ class OfflineTaxonomyCache:
             logger.error(f"Error writing snapshot: {e}")
             return 0
 
+    def _export_pack(self, output_path: Path) -> int:
+        from nanometa_live.core.utils.taxonomy_pack import write_pack
+
+        def read(item):
+            cache_type, cache_file = item
+            try:
+                raw = cache_file.read_bytes()
+                return cache_type, cache_file.name, raw, _expires_at(raw)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Error reading {cache_file}: {e}")
+                return None
+
+        files = [(t, f) for t in CACHE_TYPES for f in sorted(self._type_dir(t).glob("*.json"))]
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as pool:
+            records = [r for r in pool.map(read, files) if r is not None]
+        try:
+            count = write_pack(output_path, records)
+        except IOError as e:
+            logger.error(f"Error writing snapshot: {e}")
+            return 0
+        logger.info(f"Exported {count} entries to {output_path}")
+        return count
+
+    def _expired_count(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        return sum(
+            count
+            for part in self._metadata.get("summary", {}).values()
+            for second, count in part["expiries"].items()
+            if int(second) < now
+        )
+
     def clear_expired(self) -> int:
         """
         Remove expired cache entries.
 
+        Skips the directory scan when the summary holds no expired entry.
+
         Returns:
             Number of entries removed
         """
         removed_count = 0
-
-        for cache_dir in [
-            self.gtdb_cache_dir,
-            self.ncbi_cache_dir,
-            self.species_cache_dir
-        ]:
-            for cache_file in cache_dir.glob("*.json"):
-                try:
-                    entry_data = json.loads(cache_file.read_text())
-                    entry = CacheEntry.from_dict(entry_data)
-
-                    if entry.is_expired():
-                        cache_file.unlink()
-                        removed_count += 1
-
-                except (json.JSONDecodeError, IOError) as e:
-                    logger.warning(f"Error processing {cache_file}: {e}")
+        if self._expired_count():
+            for cache_dir in [
+                self.gtdb_cache_dir,
+                self.ncbi_cache_dir,
+                self.species_cache_dir
+            ]:
+                for cache_file in cache_dir.glob("*.json"):
+                    try:
+                        entry_data = json.loads(cache_file.read_text())
+                        entry = CacheEntry.from_dict(entry_data)
+
+                        if entry.is_expired():
+                            cache_file.unlink()
+                            removed_count += 1
+
+                    except (json.JSONDecodeError, IOError) as e:
+                        logger.warning(f"Error processing {cache_file}: {e}")
+            self._rebuild_summary()
 
         self._metadata["last_cleanup"] = time.time()
-        self._metadata["entry_count"] = max(
-            0, self._metadata.get("entry_count", 0) - removed_count
-        )
         self._save_metadata()
 
         logger.info(f"Removed {removed_count} expired cache entries")
@@ -468,6 +648,7 @@ class OfflineTaxonomyCache:
                     logger.warning(f"Error removing {cache_file}: {e}")
 
         self._metadata["entry_count"] = 0
+        self._metadata["summary"] = {}
         self._metadata["last_cleanup"] = time.time()
         self._save_metadata()
 
@@ -478,46 +659,53 @@ class OfflineTaxonomyCache:
         """
         Get cache statistics.
 
+        Read from the maintained summary, so the cost does not grow with the
+        number of cached entries' files.
+
         Returns:
             Dictionary with cache statistics
         """
+        summary = self._metadata.get("summary", {})
         stats = {
             "cache_dir": str(self.cache_dir),
             "offline_mode": self.offline_mode,
             "ttl_seconds": self.ttl,
             "ttl_days": self.ttl / (24 * 60 * 60),
-            "gtdb_entries": len(list(self.gtdb_cache_dir.glob("*.json"))),
-            "ncbi_entries": len(list(self.ncbi_cache_dir.glob("*.json"))),
-            "species_entries": len(list(self.species_cache_dir.glob("*.json"))),
             "total_entries": 0,
-            "expired_entries": 0,
+            "expired_entries": self._expired_count(),
             "cache_size_bytes": 0,
             "last_cleanup": self._metadata.get("last_cleanup")
         }
-
-        # Calculate totals
-        for cache_dir in [
-            self.gtdb_cache_dir,
-            self.ncbi_cache_dir,
-            self.species_cache_dir
-        ]:
-            for cache_file in cache_dir.glob("*.json"):
-                stats["total_entries"] += 1
-                stats["cache_size_bytes"] += cache_file.stat().st_size
-
-                try:
-                    entry_data = json.loads(cache_file.read_text())
-                    entry = CacheEntry.from_dict(entry_data)
-                    if entry.is_expired():
-                        stats["expired_entries"] += 1
-                except (FileNotFoundError, PermissionError, OSError, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, ValueError):
-                    pass
+        for cache_type in CACHE_TYPES:
+            part = summary.get(cache_type, {"entries": 0, "bytes": 0})
+            stats[f"{cache_type}_entries"] = part["entries"]
+            stats["total_entries"] += part["entries"]
+            stats["cache_size_bytes"] += part["bytes"]
 
         stats["cache_size_mb"] = round(stats["cache_size_bytes"] / (1024 * 1024), 2)
 
         return stats
 
 
+def _check_pack_keys(rows) -> None:
+    """Raise ValueError, before anything is written, if a pack row names an
+    unknown cache type or a key that is not a plain cache file name of that
+    type (``../x``, absolute paths)."""
+    for row in rows:
+        cache_type, key = row[0], row[1]
+        if cache_type not in CACHE_TYPES:
+            raise ValueError(f"Snapshot pack has unknown cache type {cache_type!r}")
+        match = _PACK_KEY.fullmatch(key) if isinstance(key, str) else None
+        if match is None or match.group(1) != cache_type or Path(key).name != key:
+            raise ValueError(f"Snapshot pack has invalid cache key {key!r}")
+
+
+def _expires_at(raw: bytes) -> float:
+    """Expiry time of a serialised cache entry."""
+    entry = json.loads(raw)
+    return float(entry["created_at"]) + float(entry["ttl"])
+
+
 # Global cache instance -- protected by lock against concurrent initialization.
 _cache_instance: Optional[OfflineTaxonomyCache] = None
 _cache_instance_lock = threading.Lock()
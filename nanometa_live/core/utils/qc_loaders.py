@@ -5,7 +5,6 @@ Functions for loading quality control statistics from fastp, NanoPlot,
 and seqkit outputs, with support for sample filtering and aggregation.
 """
 
-import glob
 import json
 import logging
 import os
@@ -14,6 +13,21 @@ import pandas as pd
 from typing import Any, Dict, List, Optional
 
 from nanometa_live.core.utils.canonical_loaders import load_canonical_qc_stats
+from nanometa_live.core.utils.json_ingest import FASTP_SUMMARY_KEYS, cached_json
+from nanometa_live.core.utils.metrics import timed_loader
+from nanometa_live.core.utils.qc_sketch import (
+    ReadSketch,
+    _safe_int,
+    cached_sample_sketch,
+    forget_sample_sketch,
+    update_sample_sketch,
+)
+from nanometa_live.core.utils.results_catalog import (
+    scan_exists,
+    scan_glob,
+    scan_isdir,
+    scan_listdir,
+)
 from nanometa_live.core.utils.sample_detector import (
     get_available_samples,
     resolve_analysis_directory
@@ -24,6 +38,7 @@ from nanometa_live.core.utils.loader_utils import (
     _mtime_cache_state,
     _store_mtime_cache,
     _is_file_stable,
+    _is_stat_stable,
 )
 
 
@@ -70,8 +85,8 @@ def _find_sample_files(directory: str, sample: str, extensions: List[str]) -> Li
     """
     files: List[str] = []
     for ext in extensions:
-        files.extend(glob.glob(os.path.join(directory, f"{sample}.{ext}")))
-        files.extend(glob.glob(os.path.join(directory, f"{sample}_*.{ext}")))
+        files.extend(scan_glob(os.path.join(directory, f"{sample}.{ext}")))
+        files.extend(scan_glob(os.path.join(directory, f"{sample}_*.{ext}")))
     return files
 
 
@@ -80,7 +95,9 @@ def _aggregate_fastp_files(fastp_files: List[str]) -> Dict[str, Any]:
 
     Stable files are parsed and validated; unstable, malformed, or
     unreadable files are skipped. The q30 rate is recomputed from the
-    accumulated post-filtering q30 and total bases.
+    accumulated post-filtering q30 and total bases. Only the summary keys
+    are read, and an unchanged file is served from the per-file digest
+    cache (see ``json_ingest``).
     """
     aggregated_stats = _empty_fastp_stats()
     acc_q30_bases = 0
@@ -91,8 +108,7 @@ def _aggregate_fastp_files(fastp_files: List[str]) -> Dict[str, Any]:
                 logging.debug(f"Skipping unstable file: {fastp_file}")
                 continue
 
-            with open(fastp_file, 'r') as f:
-                fastp_data = json.load(f)
+            fastp_data = cached_json(fastp_file, FASTP_SUMMARY_KEYS)
 
             if not _validate_fastp_json(fastp_data, fastp_file):
                 continue
@@ -158,7 +174,7 @@ def load_fastp_per_sample(main_dir: str) -> List[Dict[str, Any]]:
     """
     main_dir = resolve_analysis_directory(main_dir)
     fastp_dir = os.path.join(main_dir, "fastp")
-    if not os.path.exists(fastp_dir):
+    if not scan_exists(fastp_dir):
         return []
 
     mtime_key = f"fastp_per_sample:{main_dir}"
@@ -167,12 +183,11 @@ def load_fastp_per_sample(main_dir: str) -> List[Dict[str, Any]]:
         return list(cached)
 
     rows: List[Dict[str, Any]] = []
-    for fastp_file in glob.glob(os.path.join(fastp_dir, "*.fastp.json")):
+    for fastp_file in scan_glob(os.path.join(fastp_dir, "*.fastp.json")):
         try:
             if not _is_file_stable(fastp_file):
                 continue
-            with open(fastp_file, "r") as f:
-                payload = json.load(f)
+            payload = cached_json(fastp_file, FASTP_SUMMARY_KEYS)
             after = payload.get("summary", {}).get("after_filtering", {})
             reads = int(after.get("total_reads", 0))
             if reads <= 0:
@@ -191,6 +206,7 @@ def load_fastp_per_sample(main_dir: str) -> List[Dict[str, Any]]:
     return rows
 
 
+@timed_loader("load_fastp_data")
 def load_fastp_data(main_dir: str, sample: Optional[str] = None) -> Dict[str, Any]:
     """
     Load FASTP statistics for specific sample or all samples.
@@ -224,7 +240,7 @@ def load_fastp_data(main_dir: str, sample: Optional[str] = None) -> Dict[str, An
 
     fastp_dir = os.path.join(main_dir, "fastp")
 
-    if not os.path.exists(fastp_dir):
+    if not scan_exists(fastp_dir):
         logging.debug(f"FASTP directory not found: {fastp_dir}")
         return _empty_fastp_stats()
 
@@ -238,7 +254,7 @@ def load_fastp_data(main_dir: str, sample: Optional[str] = None) -> Dict[str, An
 
     if sample is None or sample == "All Samples":
         # Aggregate all samples
-        fastp_files = glob.glob(os.path.join(fastp_dir, "*.fastp.json"))
+        fastp_files = scan_glob(os.path.join(fastp_dir, "*.fastp.json"))
 
         if not fastp_files:
             logging.warning("No FASTP files found")
@@ -269,11 +285,11 @@ def load_batch_stats(main_dir: str, sample: Optional[str] = None) -> List[Dict[s
     """
     batch_stats_dir = os.path.join(main_dir, "realtime_batch_stats")
 
-    if not os.path.exists(batch_stats_dir):
+    if not scan_exists(batch_stats_dir):
         logging.warning(f"Batch statistics directory not found: {batch_stats_dir}")
         return []
 
-    batch_files = sorted(glob.glob(os.path.join(batch_stats_dir, "batch_*.json")))
+    batch_files = sorted(scan_glob(os.path.join(batch_stats_dir, "batch_*.json")))
 
     if not batch_files:
         logging.warning("No batch statistics files found")
@@ -302,6 +318,7 @@ def load_batch_stats(main_dir: str, sample: Optional[str] = None) -> List[Dict[s
     return all_batches
 
 
+@timed_loader("load_nanoplot_stats")
 def load_nanoplot_stats(main_dir: str, sample: Optional[str] = None) -> Dict[str, Any]:
     """
     Load NanoPlot statistics for quality metrics, with seqkit fallback.
@@ -329,7 +346,7 @@ def load_nanoplot_stats(main_dir: str, sample: Optional[str] = None) -> Dict[str
     nanoplot_dir = os.path.join(main_dir, "nanoplot")
     nanostats_files = []
 
-    if os.path.exists(nanoplot_dir):
+    if scan_exists(nanoplot_dir):
         # Find NanoStats.txt files
         if sample is None or sample == "All Samples":
             # Look for NanoStats.txt in subdirectories or root
@@ -337,7 +354,7 @@ def load_nanoplot_stats(main_dir: str, sample: Optional[str] = None) -> Dict[str
                 os.path.join(nanoplot_dir, "*/NanoStats.txt"),
                 os.path.join(nanoplot_dir, "NanoStats.txt")
             ]:
-                nanostats_files.extend(glob.glob(pattern))
+                nanostats_files.extend(scan_glob(pattern))
         else:
             # Look for sample-specific NanoStats
             sample_patterns = [
@@ -346,7 +363,7 @@ def load_nanoplot_stats(main_dir: str, sample: Optional[str] = None) -> Dict[str
                 os.path.join(nanoplot_dir, f"{sample}/NanoStats.txt")
             ]
             for pattern in sample_patterns:
-                if os.path.exists(pattern):
+                if scan_exists(pattern):
                     nanostats_files.append(pattern)
 
     if not nanostats_files:
@@ -466,13 +483,22 @@ def _load_seqkit_as_nanoplot_stats(main_dir: str, sample: Optional[str] = None)
     total_reads = int(seqkit_df['num_seqs'].sum()) if 'num_seqs' in seqkit_df.columns else 0
     total_bases = int(seqkit_df['sum_len'].sum()) if 'sum_len' in seqkit_df.columns else 0
     mean_length = float(seqkit_df['avg_len'].mean()) if 'avg_len' in seqkit_df.columns else 0.0
-    n50 = int(seqkit_df['N50'].max()) if 'N50' in seqkit_df.columns else 0
 
     # Use AvgQual from seqkit as mean_read_quality (Phred scale)
     mean_quality = float(seqkit_df['AvgQual'].mean()) if 'AvgQual' in seqkit_df.columns else 0.0
 
-    # Estimate median from Q2 (second quartile = median)
-    median_length = float(seqkit_df['Q2'].mean()) if 'Q2' in seqkit_df.columns else mean_length
+    # N50 and medians come from the merged length/quality sketch, which
+    # covers every sample's distribution rather than the max or mean of
+    # per-sample values.
+    sketch = load_seqkit_sketch(main_dir, sample)
+    if sketch is not None and sketch.num_seqs > 0:
+        n50 = int(round(sketch.n50()))
+        median_length = float(round(sketch.length_quantile(0.5), 1))
+        median_quality = sketch.median_quality() or mean_quality
+    else:
+        n50 = int(seqkit_df['N50'].max()) if 'N50' in seqkit_df.columns else 0
+        median_length = float(seqkit_df['Q2'].mean()) if 'Q2' in seqkit_df.columns else mean_length
+        median_quality = mean_quality
 
     logging.debug(f"Seqkit fallback: {total_reads} reads, {total_bases} bases, Q={mean_quality:.1f}")
 
@@ -480,7 +506,7 @@ def _load_seqkit_as_nanoplot_stats(main_dir: str, sample: Optional[str] = None)
         'mean_read_length': mean_length,
         'mean_read_quality': mean_quality,
         'median_read_length': median_length,
-        'median_read_quality': mean_quality,  # Seqkit doesn't provide median quality
+        'median_read_quality': median_quality,
         'number_of_reads': total_reads,
         'read_length_n50': n50,
         'total_bases': total_bases,
@@ -517,7 +543,7 @@ def _is_incremental_seqkit_layout(
         True when at least one sample has ``<sample>/batch_stats/*.tsv``
         but no flat ``<sample>.tsv`` companion.
     """
-    if not os.path.isdir(seqkit_dir):
+    if not scan_isdir(seqkit_dir):
         return False
 
     samples_to_check: List[str]
@@ -526,27 +552,27 @@ def _is_incremental_seqkit_layout(
     else:
         try:
             samples_to_check = [
-                entry for entry in os.listdir(seqkit_dir)
-                if os.path.isdir(os.path.join(seqkit_dir, entry))
+                entry for entry in scan_listdir(seqkit_dir)
+                if scan_isdir(os.path.join(seqkit_dir, entry))
             ]
         except OSError:
             return False
 
     for sample_name in samples_to_check:
         batch_stats_dir = os.path.join(seqkit_dir, sample_name, "batch_stats")
-        if not os.path.isdir(batch_stats_dir):
+        if not scan_isdir(batch_stats_dir):
             continue
         try:
             has_batch_tsv = any(
                 entry.endswith(".tsv")
-                for entry in os.listdir(batch_stats_dir)
+                for entry in scan_listdir(batch_stats_dir)
             )
         except OSError:
             continue
         if not has_batch_tsv:
             continue
         flat_tsv = os.path.join(seqkit_dir, f"{sample_name}.tsv")
-        if not os.path.exists(flat_tsv):
+        if not scan_exists(flat_tsv):
             return True
     return False
 
@@ -567,6 +593,7 @@ def _seqkit_fingerprint_paths(seqkit_dir: str, sample: Optional[str]) -> List[st
     ]
 
 
+@timed_loader("load_seqkit_stats")
 def load_seqkit_stats(main_dir: str, sample: Optional[str] = None) -> pd.DataFrame:
     """
     Load seqkit sequence statistics (used when QC tool is chopper).
@@ -602,7 +629,7 @@ def load_seqkit_stats(main_dir: str, sample: Optional[str] = None) -> pd.DataFra
     """
     seqkit_dir = os.path.join(main_dir, "seqkit")
 
-    if not os.path.exists(seqkit_dir):
+    if not scan_exists(seqkit_dir):
         logging.debug(f"Seqkit directory not found: {seqkit_dir}")
         return pd.DataFrame()
 
@@ -625,7 +652,7 @@ def _load_seqkit_stats_uncached(
 
     if sample is None or sample == "All Samples":
         # Load all flat TSV files
-        tsv_files = glob.glob(os.path.join(seqkit_dir, "*.tsv"))
+        tsv_files = scan_glob(os.path.join(seqkit_dir, "*.tsv"))
     else:
         # Load the specific sample's flat TSV(s)
         tsv_files = _find_sample_files(seqkit_dir, sample, ["tsv"])
@@ -690,9 +717,14 @@ def _load_seqkit_incremental(
     * ``avg_len`` is recomputed as ``sum_len / num_seqs``.
     * ``Q20(%)``, ``Q30(%)``, ``AvgQual`` and ``GC(%)`` are recomputed as
       per-base weighted averages (weighted by ``sum_len``).
-    * ``Q1``, ``Q2``, ``Q3``, ``N50`` and ``N50_num`` are approximated
-      from the cumulative average length, since the raw read-length
-      distribution is not preserved in cumulative stats.
+    * ``Q1``, ``Q2``, ``Q3``, ``N50`` and ``N50_num`` are read from the
+      sample's :class:`~nanometa_live.core.utils.qc_sketch.ReadSketch`,
+      which merges each batch's own quartiles and N50. The raw read-length
+      distribution is not published, so the upstream module cannot do
+      better either.
+
+    The sketch is updated incrementally: a refresh reads only the batch
+    TSVs that appeared since the previous one.
 
     Args:
         seqkit_dir: Path to the ``seqkit/`` output directory.
@@ -707,8 +739,8 @@ def _load_seqkit_incremental(
     else:
         try:
             sample_dirs = [
-                entry for entry in os.listdir(seqkit_dir)
-                if os.path.isdir(os.path.join(seqkit_dir, entry))
+                entry for entry in scan_listdir(seqkit_dir)
+                if scan_isdir(os.path.join(seqkit_dir, entry))
             ]
         except OSError:
             return pd.DataFrame()
@@ -721,45 +753,23 @@ def _load_seqkit_incremental(
         # batch_stats for a sample the flat file already covers made the
         # All-Samples concat count merged samples twice.
         if os.path.isfile(os.path.join(seqkit_dir, f"{sample_name}.tsv")):
+            forget_sample_sketch(seqkit_dir, sample_name)
             continue
         batch_stats_dir = os.path.join(
             seqkit_dir, sample_name, "batch_stats"
         )
-        if not os.path.isdir(batch_stats_dir):
+        if not scan_isdir(batch_stats_dir):
             continue
-        batch_files = sorted(glob.glob(os.path.join(batch_stats_dir, "*.tsv")))
+        batch_files = sorted(scan_glob(os.path.join(batch_stats_dir, "*.tsv")))
         if not batch_files:
             continue
 
-        per_batch: List[pd.DataFrame] = []
-        for batch_file in batch_files:
-            try:
-                if not _is_file_stable(batch_file):
-                    logging.debug(f"Skipping unstable seqkit batch: {batch_file}")
-                    continue
-                df = pd.read_csv(batch_file, sep='\t')
-            except (FileNotFoundError, PermissionError, OSError) as exc:
-                logging.warning(
-                    f"Cannot read seqkit batch file {batch_file}: {exc}"
-                )
-                continue
-            except (
-                pd.errors.ParserError,
-                pd.errors.EmptyDataError,
-                UnicodeDecodeError,
-            ) as exc:
-                logging.warning(
-                    f"Malformed seqkit batch file {batch_file}: {exc}"
-                )
-                continue
-            if df.empty:
-                continue
-            per_batch.append(df)
-
-        if not per_batch:
-            continue
-
-        aggregated = _aggregate_seqkit_batches(per_batch, sample_name)
+        # Only batches the sample's sketch has not absorbed yet are read.
+        sketch = update_sample_sketch(
+            seqkit_dir, sample_name, batch_files,
+            read_batch=_read_seqkit_batch_row, is_stable=_is_stat_stable,
+        )
+        aggregated = sketch.to_seqkit_row(sample_name)
         if aggregated is not None:
             rows.append(aggregated)
 
@@ -769,108 +779,47 @@ def _load_seqkit_incremental(
     return pd.DataFrame(rows)
 
 
-def _aggregate_seqkit_batches(
-    per_batch: List[pd.DataFrame], sample_name: str
-) -> Optional[Dict[str, Any]]:
-    """Sum a list of single-row seqkit batch frames into a cumulative row.
-
-    Mirrors the per-base weighted aggregation used by the upstream
-    SEQKIT_MERGE_STATS module so the GUI's view of an interrupted
-    realtime run matches a completed one.
-    """
-    total_num_seqs = 0
-    total_sum_len = 0
-    total_sum_gap = 0
-    total_sum_n = 0
-    contributing_min_lens: List[int] = []
-    max_len = 0
-    weighted_q20 = 0.0
-    weighted_q30 = 0.0
-    weighted_avgqual = 0.0
-    weighted_gc = 0.0
-
-    file_label = ""
-    fmt_label = ""
-    type_label = ""
-
-    def _safe_int(value: Any) -> int:
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return 0
-
-    def _safe_float(value: Any) -> float:
-        try:
-            return float(str(value).replace('%', ''))
-        except (ValueError, TypeError):
-            return 0.0
-
-    for df in per_batch:
-        row = df.iloc[0]
-        num_seqs = _safe_int(row.get('num_seqs', 0))
-        sum_len = _safe_int(row.get('sum_len', 0))
-        sum_gap = _safe_int(row.get('sum_gap', 0))
-        sum_n = _safe_int(row.get('sum_n', 0))
-        this_min = _safe_int(row.get('min_len', 0))
-        this_max = _safe_int(row.get('max_len', 0))
-
-        total_num_seqs += num_seqs
-        total_sum_len += sum_len
-        total_sum_gap += sum_gap
-        total_sum_n += sum_n
-
-        # Empty batches (num_seqs == 0) report min_len = 0; skip them so
-        # the cumulative min_len reflects only batches that contributed
-        # reads, matching the upstream merge module.
-        if num_seqs > 0:
-            contributing_min_lens.append(this_min)
-            max_len = max(max_len, this_max)
-
-        weighted_q20 += _safe_float(row.get('Q20(%)', 0)) * sum_len
-        weighted_q30 += _safe_float(row.get('Q30(%)', 0)) * sum_len
-        weighted_avgqual += _safe_float(row.get('AvgQual', 0)) * sum_len
-        weighted_gc += _safe_float(row.get('GC(%)', 0)) * sum_len
-
-        if not file_label:
-            file_label = str(row.get('file', f"{sample_name}.fastq.gz"))
-            fmt_label = str(row.get('format', 'FASTQ'))
-            type_label = str(row.get('type', 'DNA'))
-
-    if total_num_seqs == 0:
+def _read_seqkit_batch_row(batch_file: str) -> Optional[Dict[str, Any]]:
+    """Read one single-batch seqkit TSV into its summary row, or None."""
+    try:
+        df = pd.read_csv(batch_file, sep='\t')
+    except (FileNotFoundError, PermissionError, OSError) as exc:
+        logging.warning(f"Cannot read seqkit batch file {batch_file}: {exc}")
+        return None
+    except (
+        pd.errors.ParserError,
+        pd.errors.EmptyDataError,
+        UnicodeDecodeError,
+    ) as exc:
+        logging.warning(f"Malformed seqkit batch file {batch_file}: {exc}")
         return None
+    if df.empty:
+        return None
+    return df.iloc[0].to_dict()
 
-    avg_len = total_sum_len / total_num_seqs if total_num_seqs > 0 else 0.0
-    final_q20 = weighted_q20 / total_sum_len if total_sum_len > 0 else 0.0
-    final_q30 = weighted_q30 / total_sum_len if total_sum_len > 0 else 0.0
-    final_avgqual = (
-        weighted_avgqual / total_sum_len if total_sum_len > 0 else 0.0
-    )
-    final_gc = weighted_gc / total_sum_len if total_sum_len > 0 else 0.0
 
-    min_len = min(contributing_min_lens) if contributing_min_lens else 0
+def load_seqkit_sketch(main_dir: str, sample: Optional[str] = None) -> Optional[ReadSketch]:
+    """Return the read-length/quality sketch behind ``load_seqkit_stats``.
 
-    return {
-        'file': file_label,
-        'format': fmt_label,
-        'type': type_label,
-        'num_seqs': total_num_seqs,
-        'sum_len': total_sum_len,
-        'min_len': min_len,
-        'avg_len': round(avg_len, 1),
-        'max_len': max_len,
-        'Q1': round(avg_len * 0.75, 1),
-        'Q2': round(avg_len, 1),
-        'Q3': round(avg_len * 1.5, 1),
-        'sum_gap': total_sum_gap,
-        'N50': int(avg_len),
-        'N50_num': total_num_seqs // 2,
-        'Q20(%)': round(final_q20, 2),
-        'Q30(%)': round(final_q30, 2),
-        'AvgQual': round(final_avgqual, 2),
-        'GC(%)': round(final_gc, 2),
-        'sum_n': total_sum_n,
-        'sample': sample_name,
-    }
+    For one sample this is its incremental sketch, or one built from its
+    flat TSV row. For None/"All Samples" the per-sample sketches are merged
+    bin-wise, so the run-wide N50 and quartiles come from the combined
+    distribution. The previous approach took the max or mean of per-sample
+    values. Returns None when there is no seqkit data.
+    """
+    seqkit_dir = os.path.join(main_dir, "seqkit")
+    seqkit_df = load_seqkit_stats(main_dir, sample)
+    if seqkit_df.empty:
+        return None
+    merged = ReadSketch()
+    for row in seqkit_df.to_dict("records"):
+        name = str(row.get("sample", ""))
+        incremental = cached_sample_sketch(seqkit_dir, name)
+        if incremental is not None and incremental.num_seqs == _safe_int(row.get("num_seqs")):
+            merged.merge(incremental)
+        else:
+            merged.add_seqkit_row(row)
+    return merged
 
 
 def _kraken_classification_counts(kraken_df: pd.DataFrame) -> tuple:
@@ -898,6 +847,7 @@ def _kraken_classification_counts(kraken_df: pd.DataFrame) -> tuple:
     return classified, unclassified, classified + unclassified
 
 
+@timed_loader("get_sample_statistics_summary")
 def get_sample_statistics_summary(main_dir: str) -> pd.DataFrame:
     """
     Get summary statistics for all samples (for per-barcode breakdown table).
@@ -1159,7 +1109,11 @@ def get_qc_stats(main_dir: str, sample: Optional[str] = None) -> Dict[str, Any]:
         q20_pct = seqkit_df['Q20(%)'].mean() if 'Q20(%)' in seqkit_df.columns else 0
         q30_pct = seqkit_df['Q30(%)'].mean() if 'Q30(%)' in seqkit_df.columns else 0
         avg_qual = seqkit_df['AvgQual'].mean() if 'AvgQual' in seqkit_df.columns else 0
-        n50 = seqkit_df['N50'].mean() if 'N50' in seqkit_df.columns else 0
+        sketch = load_seqkit_sketch(main_dir, sample)
+        if sketch is not None and sketch.num_seqs > 0:
+            n50 = round(sketch.n50())
+        else:
+            n50 = seqkit_df['N50'].mean() if 'N50' in seqkit_df.columns else 0
 
         return {
             'source': 'seqkit',
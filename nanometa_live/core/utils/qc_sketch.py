@@ -0,0 +1,390 @@
+"""
+Mergeable read-length and quality sketches for seqkit QC statistics.
+
+In the incremental seqkit layout every batch publishes its own summary row
+(``num_seqs``, ``min_len``, ``Q1``/``Q2``/``Q3``, ``max_len``, ``N50``,
+``AvgQual`` ...), and the raw read-length distribution is never written.
+Summing those rows gives exact totals but no quartiles or N50, which the
+loader used to approximate from the cumulative mean length (Q1 = 0.75 x
+mean, N50 = mean).
+
+A :class:`ReadSketch` keeps three fixed-bin histograms instead:
+
+- reads by length, log-scale bins. Each batch's quartiles split its reads
+  into four equal-mass segments, spread log-uniformly over
+  ``[min, Q1] .. [Q3, max]``.
+- bases by length, same bins. Half a batch's bases lie below its N50 and
+  half above, by definition, so N50 is the base-weighted median.
+- reads by mean quality, linear bins.
+
+Histograms add bin-wise, so merging batches or samples costs O(bins) and
+is order-independent. Quartiles and N50 are read back by interpolating
+within a bin. For one batch they reproduce its own quartiles and N50 to
+within a bin width (about 2%). For many batches they follow the real
+cumulative distribution rather than a multiple of the mean.
+
+Per-sample sketches are persisted as ``<results>/.nanometa.qc_sketches/
+<sample>.json``, next to the results. Each file records the batch files it
+has absorbed, keyed by ``(mtime_ns, size)``. A QC refresh therefore reads
+only batches that are new since the last one, including across restarts.
+The directory is outside the watched results subdirectories, so writing it
+never advances the freshness fingerprint.
+"""
+
+import logging
+import math
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from nanometa_live.core.utils.sample_state import SampleStateFile
+
+# Log-scale length bins: 100 per decade from 1 bp to 10 Mbp (~2.3% wide).
+LENGTH_BINS_PER_DECADE = 100
+LENGTH_DECADES = 7
+# Linear quality bins, 0.5 Phred wide, covering Q0..Q60.
+QUALITY_BIN_WIDTH = 0.5
+QUALITY_MAX = 60.0
+
+SKETCH_DIRNAME = ".nanometa.qc_sketches"
+SKETCH_SCHEMA = 1
+
+_N_LENGTH_BINS = LENGTH_BINS_PER_DECADE * LENGTH_DECADES
+_N_QUALITY_BINS = int(QUALITY_MAX / QUALITY_BIN_WIDTH)
+
+# Sums that mirror upstream SEQKIT_MERGE_STATS: counts are summed and the
+# percentage metrics are per-base weighted averages.
+_SUMMED = ("num_seqs", "sum_len", "sum_gap", "sum_n")
+_BASE_WEIGHTED = ("Q20(%)", "Q30(%)", "AvgQual", "GC(%)")
+
+
+def _safe_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _safe_float(value: Any) -> float:
+    try:
+        result = float(str(value).replace('%', ''))
+    except (ValueError, TypeError):
+        return 0.0
+    return result if math.isfinite(result) else 0.0
+
+
+def _length_bin(log_len: float) -> int:
+    return min(_N_LENGTH_BINS - 1, max(0, int(log_len * LENGTH_BINS_PER_DECADE)))
+
+
+def _add_log_segment(hist: Dict[int, float], lo: float, hi: float, mass: float) -> None:
+    """Spread ``mass`` log-uniformly over lengths ``[lo, hi]``."""
+    if mass <= 0 or lo <= 0:
+        return
+    a = math.log10(lo)
+    b = math.log10(max(hi, lo))
+    if b - a < 1e-12:
+        idx = _length_bin(a)
+        hist[idx] = hist.get(idx, 0.0) + mass
+        return
+    width = b - a
+    for idx in range(_length_bin(a), _length_bin(b) + 1):
+        bin_lo = idx / LENGTH_BINS_PER_DECADE
+        bin_hi = (idx + 1) / LENGTH_BINS_PER_DECADE
+        overlap = min(b, bin_hi) - max(a, bin_lo)
+        if overlap > 0:
+            hist[idx] = hist.get(idx, 0.0) + mass * overlap / width
+
+
+def _length_quantile(hist: Mapping[int, float], q: float) -> float:
+    """Length below which fraction ``q`` of the histogram's mass lies."""
+    total = sum(hist.values())
+    if total <= 0:
+        return 0.0
+    target = q * total
+    running = 0.0
+    for idx in sorted(hist):
+        mass = hist[idx]
+        if running + mass >= target:
+            frac = (target - running) / mass if mass > 0 else 0.0
+            return 10 ** ((idx + frac) / LENGTH_BINS_PER_DECADE)
+        running += mass
+    return 10 ** ((max(hist) + 1) / LENGTH_BINS_PER_DECADE)
+
+
+def _mass_at_or_above(hist: Mapping[int, float], length: float) -> float:
+    if length <= 0:
+        return sum(hist.values())
+    pos = math.log10(length) * LENGTH_BINS_PER_DECADE
+    total = 0.0
+    for idx, mass in hist.items():
+        if idx >= pos:
+            total += mass
+        elif idx + 1 > pos:
+            total += mass * (idx + 1 - pos)
+    return total
+
+
+@dataclass
+class ReadSketch:
+    """Mergeable length and quality histograms plus seqkit running totals."""
+
+    reads_by_length: Dict[int, float] = field(default_factory=dict)
+    bases_by_length: Dict[int, float] = field(default_factory=dict)
+    reads_by_quality: Dict[int, float] = field(default_factory=dict)
+    totals: Dict[str, float] = field(default_factory=dict)
+    min_len: int = 0
+    max_len: int = 0
+    labels: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def num_seqs(self) -> int:
+        return int(self.totals.get("num_seqs", 0))
+
+    def add_seqkit_row(self, row: Mapping[str, Any]) -> None:
+        """Absorb one seqkit summary row (one batch, or one flat file)."""
+        num_seqs = _safe_int(row.get('num_seqs', 0))
+        sum_len = _safe_int(row.get('sum_len', 0))
+        for name in _SUMMED:
+            self.totals[name] = self.totals.get(name, 0) + _safe_int(row.get(name, 0))
+        for name in _BASE_WEIGHTED:
+            self.totals[name] = (
+                self.totals.get(name, 0.0) + _safe_float(row.get(name, 0)) * sum_len
+            )
+        if not self.labels:
+            self.labels = {
+                'file': str(row.get('file', '')),
+                'format': str(row.get('format', 'FASTQ')),
+                'type': str(row.get('type', 'DNA')),
+            }
+        # Empty batches report min_len = 0; they must not pull the
+        # cumulative minimum down or contribute to the distribution.
+        if num_seqs <= 0:
+            return
+        this_min = _safe_int(row.get('min_len', 0))
+        this_max = _safe_int(row.get('max_len', 0))
+        self.min_len = this_min if not self.min_len else min(self.min_len, this_min)
+        self.max_len = max(self.max_len, this_max)
+
+        avg_len = sum_len / num_seqs
+        points = [_safe_float(row.get(k, 0)) for k in ('min_len', 'Q1', 'Q2', 'Q3', 'max_len')]
+        if points[0] > 0 and all(b >= a for a, b in zip(points, points[1:])):
+            for lo, hi in zip(points, points[1:]):
+                _add_log_segment(self.reads_by_length, lo, hi, num_seqs / 4.0)
+        else:
+            _add_log_segment(self.reads_by_length, avg_len, avg_len, num_seqs)
+
+        n50 = _safe_float(row.get('N50', 0))
+        if points[0] > 0 and points[0] <= n50 <= points[-1]:
+            _add_log_segment(self.bases_by_length, points[0], n50, sum_len / 2.0)
+            _add_log_segment(self.bases_by_length, n50, points[-1], sum_len / 2.0)
+        else:
+            _add_log_segment(self.bases_by_length, avg_len, avg_len, sum_len)
+
+        quality = _safe_float(row.get('AvgQual', 0))
+        if quality > 0:
+            idx = min(_N_QUALITY_BINS - 1, int(quality / QUALITY_BIN_WIDTH))
+            self.reads_by_quality[idx] = self.reads_by_quality.get(idx, 0.0) + num_seqs
+
+    def merge(self, other: "ReadSketch") -> "ReadSketch":
+        """Add ``other`` into this sketch in place and return ``self``."""
+        for mine, theirs in (
+            (self.reads_by_length, other.reads_by_length),
+            (self.bases_by_length, other.bases_by_length),
+            (self.reads_by_quality, other.reads_by_quality),
+            (self.totals, other.totals),
+        ):
+            for key, value in theirs.items():
+                mine[key] = mine.get(key, 0) + value
+        if other.min_len:
+            self.min_len = other.min_len if not self.min_len else min(self.min_len, other.min_len)
+        self.max_len = max(self.max_len, other.max_len)
+        if not self.labels:
+            self.labels = dict(other.labels)
+        return self
+
+    def length_quantile(self, q: float) -> float:
+        """Read length at quantile ``q`` (0.5 is the median)."""
+        return _length_quantile(self.reads_by_length, q)
+
+    def n50(self) -> float:
+        """Length such that reads at least this long hold half the bases."""
+        return _length_quantile(self.bases_by_length, 0.5)
+
+    def n50_num(self) -> int:
+        """Number of reads at least N50 long."""
+        return int(round(_mass_at_or_above(self.reads_by_length, self.n50())))
+
+    def median_quality(self) -> float:
+        """Median per-read mean quality, from the quality histogram."""
+        total = sum(self.reads_by_quality.values())
+        if total <= 0:
+            return 0.0
+        running = 0.0
+        for idx in sorted(self.reads_by_quality):
+            mass = self.reads_by_quality[idx]
+            if running + mass >= total / 2.0:
+                frac = (total / 2.0 - running) / mass
+                return (idx + frac) * QUALITY_BIN_WIDTH
+            running += mass
+        return 0.0
+
+    def to_seqkit_row(self, sample_name: str) -> Optional[Dict[str, Any]]:
+        """Render the sketch as one cumulative seqkit row, or None if empty."""
+        num_seqs = self.num_seqs
+        if num_seqs == 0:
+            return None
+        sum_len = int(self.totals.get("sum_len", 0))
+
+        def weighted(name: str) -> float:
+            return round(self.totals.get(name, 0.0) / sum_len, 2) if sum_len > 0 else 0.0
+
+        return {
+            'file': self.labels.get('file') or f"{sample_name}.fastq.gz",
+            'format': self.labels.get('format', 'FASTQ'),
+            'type': self.labels.get('type', 'DNA'),
+            'num_seqs': num_seqs,
+            'sum_len': sum_len,
+            'min_len': self.min_len,
+            'avg_len': round(sum_len / num_seqs, 1),
+            'max_len': self.max_len,
+            'Q1': round(self.length_quantile(0.25), 1),
+            'Q2': round(self.length_quantile(0.5), 1),
+            'Q3': round(self.length_quantile(0.75), 1),
+            'sum_gap': int(self.totals.get("sum_gap", 0)),
+            'N50': int(round(self.n50())),
+            'N50_num': self.n50_num(),
+            'Q20(%)': weighted('Q20(%)'),
+            'Q30(%)': weighted('Q30(%)'),
+            'AvgQual': weighted('AvgQual'),
+            'GC(%)': weighted('GC(%)'),
+            'sum_n': int(self.totals.get("sum_n", 0)),
+            'sample': sample_name,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "reads_by_length": {str(k): v for k, v in self.reads_by_length.items()},
+            "bases_by_length": {str(k): v for k, v in self.bases_by_length.items()},
+            "reads_by_quality": {str(k): v for k, v in self.reads_by_quality.items()},
+            "totals": dict(self.totals),
+            "min_len": self.min_len,
+            "max_len": self.max_len,
+            "labels": dict(self.labels),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ReadSketch":
+        return cls(
+            reads_by_length={int(k): float(v) for k, v in data.get("reads_by_length", {}).items()},
+            bases_by_length={int(k): float(v) for k, v in data.get("bases_by_length", {}).items()},
+            reads_by_quality={int(k): float(v) for k, v in data.get("reads_by_quality", {}).items()},
+            totals={k: float(v) for k, v in data.get("totals", {}).items()},
+            min_len=int(data.get("min_len", 0)),
+            max_len=int(data.get("max_len", 0)),
+            labels={k: str(v) for k, v in data.get("labels", {}).items()},
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> "ReadSketch":
+        sketch = cls()
+        for row in rows:
+            sketch.add_seqkit_row(row)
+        return sketch
+
+
+# ---------------------------------------------------------------------------
+# Per-sample incremental store
+# ---------------------------------------------------------------------------
+
+# (seqkit_dir, sample) -> (inventory, sketch). ``inventory`` maps each
+# absorbed batch file's basename to its (mtime_ns, size).
+_store_lock = threading.Lock()
+_sample_sketches: Dict[Tuple[str, str], Tuple[Dict[str, Tuple[int, int]], ReadSketch]] = {}
+_SKETCH_FILE = SampleStateFile("QC sketch", SKETCH_DIRNAME, SKETCH_SCHEMA,
+                               encode=ReadSketch.to_dict, decode=ReadSketch.from_dict,
+                               state_key="sketch")
+
+
+def sketch_path(seqkit_dir: str, sample: str) -> str:
+    """Where the persisted sketch for ``sample`` lives."""
+    return _SKETCH_FILE.path(seqkit_dir, sample)
+
+
+def update_sample_sketch(
+    seqkit_dir: str,
+    sample: str,
+    batch_files: List[str],
+    read_batch,
+    is_stable,
+) -> ReadSketch:
+    """Bring ``sample``'s sketch up to date with ``batch_files``.
+
+    ``read_batch(path)`` returns the batch's seqkit row as a mapping (or
+    None to skip it) and is only called for files not absorbed before.
+    ``is_stable(path, stat_result)`` gates files that may still be being
+    written; they are left for a later refresh. When an absorbed file has disappeared or
+    changed, the sketch is rebuilt from every current file.
+    """
+    key = (os.path.abspath(seqkit_dir), sample)
+    path = sketch_path(seqkit_dir, sample)
+    with _store_lock:
+        entry = _sample_sketches.get(key)
+    if entry is None:
+        entry = _SKETCH_FILE.load(path)
+    inventory, sketch = (dict(entry[0]), entry[1]) if entry else ({}, ReadSketch())
+
+    current: Dict[str, str] = {os.path.basename(p): p for p in batch_files}
+    changed = False
+    for name, signature in inventory.items():
+        try:
+            st = os.stat(current[name])
+        except (KeyError, OSError):
+            st = None
+        if st is None or (st.st_mtime_ns, st.st_size) != signature:
+            logging.debug(f"QC sketch for {sample} invalidated by {name}; rebuilding")
+            inventory, sketch = {}, ReadSketch()
+            changed = True
+            break
+    else:
+        sketch = ReadSketch().merge(sketch)  # never mutate a shared instance
+
+    for name in sorted(set(current) - set(inventory)):
+        batch_path = current[name]
+        try:
+            st = os.stat(batch_path)
+        except OSError:
+            continue
+        if not is_stable(batch_path, st):
+            continue
+        row = read_batch(batch_path)
+        if row is not None:
+            sketch.add_seqkit_row(row)
+        inventory[name] = (st.st_mtime_ns, st.st_size)
+        changed = True
+
+    with _store_lock:
+        _sample_sketches[key] = (inventory, sketch)
+    if changed:
+        _SKETCH_FILE.save(path, inventory, sketch)
+    return sketch
+
+
+def cached_sample_sketch(seqkit_dir: str, sample: str) -> Optional[ReadSketch]:
+    """The in-memory sketch from the last ``update_sample_sketch`` call."""
+    with _store_lock:
+        entry = _sample_sketches.get((os.path.abspath(seqkit_dir), sample))
+    return entry[1] if entry else None
+
+
+def forget_sample_sketch(seqkit_dir: str, sample: str) -> None:
+    """Drop ``sample``'s in-memory sketch (e.g. once a flat TSV supersedes it)."""
+    with _store_lock:
+        _sample_sketches.pop((os.path.abspath(seqkit_dir), sample), None)
+
+
+def clear_sketch_cache() -> None:
+    """Drop every in-memory sketch. Persisted sketches are left in place."""
+    with _store_lock:
+        _sample_sketches.clear()
@@ -15,7 +15,9 @@ the same gzip.
 import gzip
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
+
+from nanometa_live.core.utils.bounded_cache import BoundedCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +26,12 @@ _MAX_READS_PER_FILE = 200
 
 _FASTQ_PATTERNS = ("*.fastq", "*.fastq.gz", "*.fq", "*.fq.gz")
 
+# One entry per sampled FASTQ; the ingest tracker samples every new file of
+# a live run, so both caches are bounded.
+_PROBE_CACHE_MAX = 4096
+
 # (realpath, mtime_ns, size, max_reads) -> sampled lengths
-_length_cache: Dict[tuple, List[int]] = {}
+_length_cache = BoundedCache("read_lengths", max_entries=_PROBE_CACHE_MAX)
 
 
 def _open_text(path: Path):
@@ -66,6 +72,50 @@ def sample_read_lengths(fastq_path, max_reads: int = _MAX_READS_PER_FILE) -> Lis
     return lengths
 
 
+# (realpath, mtime_ns, size, max_reads) -> on-disk bytes per read
+_bytes_per_read_cache = BoundedCache("bytes_per_read", max_entries=_PROBE_CACHE_MAX)
+
+
+def sample_bytes_per_read(fastq_path, max_reads: int = 2000) -> Optional[float]:
+    """On-disk (compressed, for ``.gz``) bytes per read over the first reads.
+
+    Counts ``max_reads`` records and divides by the bytes of the file read
+    so far, so a gzip file gives its compressed ratio. The ingest tracker
+    multiplies this by the bytes MinKNOW has written to estimate reads
+    without opening every file. ``None`` when no complete record is read.
+    """
+    p = Path(fastq_path)
+    try:
+        st = p.stat()
+    except OSError:
+        return None
+    key = (str(p.resolve()), st.st_mtime_ns, st.st_size, max_reads)
+    cached = _bytes_per_read_cache.get(key)
+    if cached is not None:
+        return cached
+
+    reads = 0
+    try:
+        with open(p, "rb") as raw:
+            fh = gzip.GzipFile(fileobj=raw) if p.name.endswith(".gz") else raw
+            for i, _line in enumerate(fh):
+                if i % 4 == 3:
+                    reads += 1
+                    if reads >= max_reads:
+                        break
+            # A whole file read is exact; otherwise the raw offset is ahead
+            # of the records by at most one read buffer.
+            consumed = raw.tell() if reads >= max_reads else st.st_size
+    except (OSError, EOFError, gzip.BadGzipFile) as exc:
+        logger.debug("Bytes-per-read sampling failed for %s: %s", p, exc)
+        return None
+    if not reads or not consumed:
+        return None
+    ratio = consumed / reads
+    _bytes_per_read_cache[key] = ratio
+    return ratio
+
+
 def find_input_fastqs(input_dir, max_files: int = _MAX_FILES) -> List[Path]:
     """Locate up to ``max_files`` FASTQ files under the input directory.
 
@@ -0,0 +1,443 @@
+"""
+Single-pass catalog of the results tree.
+
+Every poll used to discover the same files several times over:
+``check_data_freshness`` walked the watched subdirectories, the sample
+detector globbed each tool directory, ``get_sample_file_mapping`` issued about
+five globs per sample, and every loader call re-ran ``resolve_analysis_directory``
+and its own per-sample globs and ``exists`` probes before reaching its cache.
+On the 24-barcode realtime fixture that came to several hundred globs and
+scandirs on a poll where nothing had changed.
+
+:class:`ResultsCatalog` holds one snapshot of the tree instead. It is refreshed
+by ``check_data_freshness`` -- once per poll -- and refreshes incrementally:
+
+- every known directory is ``stat``-ed, and only those whose mtime moved are
+  listed again, so directory listings cost O(changed dirs) per poll;
+- files under the fingerprinted subdirectories are still ``stat``-ed on every
+  refresh, because a report rewritten in place does not change its
+  directory's mtime and the freshness fingerprint must still advance.
+
+The catalog answers ``glob``/``exists``/``isdir`` queries and per-path
+fingerprints from that snapshot through :func:`scan_glob`, :func:`scan_exists`,
+:func:`scan_isdir` and :func:`catalog_fingerprint`. Only the most recently
+refreshed root is live. Paths outside it, and processes that never poll
+(tests, the CLI, one-shot reports), fall through to the filesystem exactly as
+before, so the snapshot can never be older than the last poll -- the same
+contract as the freshness epoch in ``loader_utils``.
+"""
+
+import fnmatch
+import glob
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Results subdirectories whose contents drive GUI refreshes. This is the
+# single watch list shared by check_data_freshness (the results-fingerprint
+# store) and first-batch detection (app/utils/first_batch.py); the two had
+# drifted apart, and neither watched canonical/ although the loaders read it
+# before any cache (2026-08-17 audit, finding C6).
+RESULTS_WATCHED_SUBDIRS = (
+    "kraken2",
+    "fastp",
+    "seqkit",
+    "validation",
+    "taxpasta",
+    "canonical",
+    "on_demand_validation",
+)
+
+# Subdirectories only sample detection reads. They are listed but their files
+# are not stat-ed and they do not feed the freshness fingerprint: NanoPlot
+# writes dozens of plots per sample that the GUI never opens.
+DETECTION_ONLY_SUBDIRS = ("nanoplot", "blast")
+
+# A directory whose mtime was this recent when it was listed is listed again
+# on the next refresh. Filesystems with coarse timestamps (2 s on exFAT, 1 s
+# on some network mounts) can give two changes the same stamp; this is the
+# rule git applies to "racily clean" index entries.
+RACY_LISTING_SECONDS = 2.0
+
+_SCANNED_SUBDIRS = frozenset(RESULTS_WATCHED_SUBDIRS + DETECTION_ONLY_SUBDIRS)
+
+_live_lock = threading.Lock()
+_live_catalog: Optional["ResultsCatalog"] = None
+
+
+def _norm(path: str) -> str:
+    return os.path.normpath(os.path.abspath(os.fspath(path)))
+
+
+class _DirRecord:
+    """One directory's listing, reused while the directory's mtime holds."""
+
+    __slots__ = ("mtime_ns", "files", "subdirs", "walk", "racy")
+
+    def __init__(self, mtime_ns: int, files: List[str], subdirs: List[str],
+                 walk: List[str], racy: bool):
+        self.mtime_ns = mtime_ns
+        self.files = files
+        self.subdirs = subdirs
+        # Subdirectories to descend into: symlinked directories are listed
+        # (so isdir answers correctly) but not followed, as with os.walk.
+        self.walk = walk
+        self.racy = racy
+
+
+class ResultsCatalog:
+    """Snapshot of one results directory, refreshed incrementally."""
+
+    def __init__(self, root: str, max_stat_files: int):
+        self.root = _norm(root)
+        self._prefix = os.path.join(self.root, "")
+        self.max_stat_files = max_stat_files
+        self._dirs: Dict[str, _DirRecord] = {}
+        self._file_stats: Dict[str, Tuple[float, int]] = {}
+        self._summaries: Dict[str, Tuple[float, int]] = {}
+        self._truncated: set = set()
+        self.last_refresh: Dict[str, int] = {}
+
+    # -- refresh -----------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Bring the snapshot up to date with the tree."""
+        dirs: Dict[str, _DirRecord] = {}
+        file_stats: Dict[str, Tuple[float, int]] = {}
+        summaries: Dict[str, Tuple[float, int]] = {}
+        truncated = set()
+        counters = {"dirs_listed": 0, "dirs_reused": 0, "files_stated": 0}
+        now = time.time()
+
+        for subdir in RESULTS_WATCHED_SUBDIRS + DETECTION_ONLY_SUBDIRS:
+            stat_files = subdir in RESULTS_WATCHED_SUBDIRS
+            latest = 0.0
+            files_seen = 0
+            stack = [os.path.join(self.root, subdir)]
+            while stack:
+                path = stack.pop()
+                record = self._refresh_dir(path, now, counters)
+                if record is None:
+                    continue
+                dirs[path] = record
+                if stat_files:
+                    for name in record.files:
+                        files_seen += 1
+                        if files_seen > self.max_stat_files:
+                            truncated.add(subdir)
+                            continue
+                        fpath = os.path.join(path, name)
+                        try:
+                            st = os.stat(fpath)
+                        except OSError:
+                            continue
+                        counters["files_stated"] += 1
+                        file_stats[fpath] = (st.st_mtime, st.st_size)
+                        if st.st_mtime > latest:
+                            latest = st.st_mtime
+                # Reversed so the walk visits subdirectories in listing
+                # order, top-down, as os.walk does.
+                stack.extend(os.path.join(path, d) for d in reversed(record.walk))
+            if stat_files:
+                summaries[subdir] = (latest, files_seen)
+
+        self._dirs = dirs
+        self._file_stats = file_stats
+        self._summaries = summaries
+        self._truncated = truncated
+        self.last_refresh = counters
+
+    def _refresh_dir(self, path: str, now: float,
+                     counters: Dict[str, int]) -> Optional[_DirRecord]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        previous = self._dirs.get(path)
+        if previous is not None and not previous.racy and previous.mtime_ns == st.st_mtime_ns:
+            counters["dirs_reused"] += 1
+            return previous
+
+        files: List[str] = []
+        subdirs: List[str] = []
+        walk: List[str] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        subdirs.append(entry.name)
+                        try:
+                            if not entry.is_symlink():
+                                walk.append(entry.name)
+                        except OSError:
+                            pass
+                    else:
+                        files.append(entry.name)
+        except OSError:
+            return None
+        counters["dirs_listed"] += 1
+        racy = now - st.st_mtime < RACY_LISTING_SECONDS
+        return _DirRecord(st.st_mtime_ns, files, subdirs, walk, racy)
+
+    # -- queries -----------------------------------------------------------
+
+    def subdir_summary(self, subdir: str) -> Tuple[float, int]:
+        """``(latest mtime, file count)`` of a watched subdirectory."""
+        return self._summaries.get(subdir, (0.0, 0))
+
+    def _top(self, path: str) -> Optional[str]:
+        """First component of a normalised ``path`` below the root."""
+        if not path.startswith(self._prefix):
+            return None
+        return path[len(self._prefix):].split(os.sep, 1)[0]
+
+    def covers(self, path: str) -> bool:
+        """True when normalised ``path`` lies inside a scanned subdirectory."""
+        return self._top(path) in _SCANNED_SUBDIRS
+
+    def _lookup_dir(self, path: str) -> Tuple[Optional[_DirRecord], bool]:
+        """Return ``(record, known)`` for a directory path.
+
+        ``known`` is False only when the path sits under a symlinked
+        directory, which the walk lists but does not follow; the snapshot
+        cannot answer for it.
+        """
+        record = self._dirs.get(path)
+        if record is not None:
+            return record, True
+        child, parent = path, os.path.dirname(path)
+        while parent != child and len(parent) >= len(self.root):
+            ancestor = self._dirs.get(parent)
+            if ancestor is not None:
+                name = os.path.basename(child)
+                return None, not (name in ancestor.subdirs and name not in ancestor.walk)
+            child, parent = parent, os.path.dirname(parent)
+        return None, True
+
+    def isdir(self, path: str) -> Optional[bool]:
+        record, known = self._lookup_dir(path)
+        return True if record is not None else (False if known else None)
+
+    def exists(self, path: str) -> Optional[bool]:
+        is_dir = self.isdir(path)
+        if is_dir is not False:
+            return is_dir
+        parent, known = self._lookup_dir(os.path.dirname(path))
+        if parent is None:
+            return False if known else None
+        return os.path.basename(path) in parent.files
+
+    def dir_mtime_ns(self, path: str) -> Optional[int]:
+        """mtime of a directory, 0 when it does not exist, None when unknown."""
+        record, known = self._lookup_dir(path)
+        if record is not None:
+            return record.mtime_ns
+        return 0 if known else None
+
+    def listdir(self, path: str) -> Optional[List[str]]:
+        """Names in ``path``; None when unknown, FileNotFoundError when absent."""
+        record, known = self._lookup_dir(path)
+        if record is None:
+            if known:
+                raise FileNotFoundError(path)
+            return None
+        return record.files + record.subdirs
+
+    def glob(self, dirname: str, pattern: str) -> Optional[List[str]]:
+        """Names in ``dirname`` matching a basename ``pattern``, as glob would."""
+        record, known = self._lookup_dir(dirname)
+        if record is None:
+            return [] if known else None
+        names = fnmatch.filter(record.files + record.subdirs, pattern)
+        if not pattern.startswith("."):
+            names = [n for n in names if not n.startswith(".")]
+        return names
+
+    def file_mtimes(self, dirname: str) -> Optional[List[Tuple[str, float]]]:
+        """``(name, mtime)`` of the stat-ed files directly in ``dirname``.
+
+        None when the snapshot cannot answer (no stats kept for that
+        subdirectory, or the directory sits under a symlink); ``[]`` when the
+        directory does not exist.
+        """
+        record, known = self._lookup_dir(dirname)
+        if not known:
+            return None
+        if record is None:
+            return []
+        top = self._top(dirname)
+        if top not in RESULTS_WATCHED_SUBDIRS or top in self._truncated:
+            return None
+        out = []
+        for name in record.files:
+            stat = self._file_stats.get(os.path.join(dirname, name))
+            if stat is not None:
+                out.append((name, stat[0]))
+        return out
+
+    def fingerprint(self, paths: List[str]) -> Optional[Tuple[float, int, int]]:
+        """``_get_path_fingerprint`` computed from the snapshot.
+
+        Returns None when any path is outside the fingerprinted subdirectories
+        or inside one whose walk hit the stat cap; the caller then walks the
+        filesystem itself.
+        """
+        combined_mtime = 0.0
+        combined_size = 0
+        file_count = 0
+        for raw in paths:
+            path = _norm(raw)
+            top = self._top(path)
+            if top not in RESULTS_WATCHED_SUBDIRS or top in self._truncated:
+                return None
+            if path in self._dirs:
+                stack = [path]
+                while stack:
+                    current = stack.pop()
+                    record = self._dirs[current]
+                    for name in record.files:
+                        stat = self._file_stats.get(os.path.join(current, name))
+                        file_count += 1
+                        if stat is None:
+                            continue
+                        if stat[0] > combined_mtime:
+                            combined_mtime = stat[0]
+                        combined_size += stat[1]
+                    stack.extend(
+                        child for child in
+                        (os.path.join(current, d) for d in record.walk)
+                        if child in self._dirs
+                    )
+                continue
+            stat = self._file_stats.get(path)
+            if stat is None:
+                if not self._lookup_dir(path)[1] or not self._lookup_dir(os.path.dirname(path))[1]:
+                    return None
+                continue
+            file_count += 1
+            if stat[0] > combined_mtime:
+                combined_mtime = stat[0]
+            combined_size += stat[1]
+        return (combined_mtime, combined_size, file_count)
+
+
+def refresh_catalog(root: str, max_stat_files: int) -> ResultsCatalog:
+    """Refresh the catalog for ``root`` and make it the live one."""
+    global _live_catalog
+    root = _norm(root)
+    with _live_lock:
+        catalog = _live_catalog
+    if catalog is None or catalog.root != root or catalog.max_stat_files != max_stat_files:
+        catalog = ResultsCatalog(root, max_stat_files)
+    catalog.refresh()
+    logging.debug(
+        "Results catalog refreshed for %s: %s", root, catalog.last_refresh,
+    )
+    with _live_lock:
+        _live_catalog = catalog
+    return catalog
+
+
+def live_catalog(path: str) -> Optional[ResultsCatalog]:
+    """The live catalog if it covers ``path`` (or is rooted at it), else None."""
+    with _live_lock:
+        catalog = _live_catalog
+    if catalog is None:
+        return None
+    path = _norm(path)
+    if path == catalog.root or catalog.covers(path):
+        return catalog
+    return None
+
+
+def _covering(path: str) -> Tuple[Optional[ResultsCatalog], str]:
+    with _live_lock:
+        catalog = _live_catalog
+    norm = _norm(path)
+    if catalog is None or not catalog.covers(norm):
+        return None, norm
+    return catalog, norm
+
+
+def scan_glob(pattern: str) -> List[str]:
+    """``glob.glob`` answered from the live catalog when it covers the directory.
+
+    Only a wildcard in the final component is served from the snapshot;
+    anything else falls through to :func:`glob.glob`.
+    """
+    dirname, basename = os.path.split(pattern)
+    if dirname and not glob.has_magic(dirname):
+        catalog, norm_dir = _covering(dirname)
+        if catalog is not None:
+            if not glob.has_magic(basename):
+                found = catalog.exists(os.path.join(norm_dir, basename))
+                if found is not None:
+                    return [pattern] if found else []
+            else:
+                names = catalog.glob(norm_dir, basename)
+                if names is not None:
+                    return [os.path.join(dirname, n) for n in names]
+    return glob.glob(pattern)
+
+
+def scan_exists(path: str) -> bool:
+    """``os.path.exists`` answered from the live catalog when it covers ``path``."""
+    catalog, norm = _covering(path)
+    found = catalog.exists(norm) if catalog is not None else None
+    return os.path.exists(path) if found is None else found
+
+
+def scan_isdir(path: str) -> bool:
+    """``os.path.isdir`` answered from the live catalog when it covers ``path``."""
+    catalog, norm = _covering(path)
+    found = catalog.isdir(norm) if catalog is not None else None
+    return os.path.isdir(path) if found is None else found
+
+
+def scan_listdir(path: str) -> List[str]:
+    """``os.listdir`` answered from the live catalog when it covers ``path``.
+
+    Raises :class:`OSError` for a missing directory, as ``os.listdir`` does.
+    """
+    catalog, norm = _covering(path)
+    names = catalog.listdir(norm) if catalog is not None else None
+    return os.listdir(path) if names is None else list(names)
+
+
+def scan_dir_mtime_ns(path: str) -> Optional[int]:
+    """Directory mtime from the live catalog (0 when absent), else None."""
+    catalog, norm = _covering(path)
+    return catalog.dir_mtime_ns(norm) if catalog is not None else None
+
+
+def scan_file_mtimes(dirname: str) -> Optional[List[Tuple[str, float]]]:
+    """``(name, mtime)`` of files in ``dirname`` from the live catalog.
+
+    None when the catalog does not cover the directory; the caller then
+    reads the filesystem itself.
+    """
+    catalog, norm = _covering(dirname)
+    return catalog.file_mtimes(norm) if catalog is not None else None
+
+
+def catalog_fingerprint(paths: List[str]) -> Optional[Tuple[float, int, int]]:
+    """Path fingerprint from the live catalog, or None when it cannot answer."""
+    if not paths:
+        return None
+    catalog = live_catalog(paths[0])
+    if catalog is None:
+        return None
+    return catalog.fingerprint(paths)
+
+
+def clear_catalog() -> None:
+    """Drop the live catalog; the next poll rescans from scratch."""
+    global _live_catalog
+    with _live_lock:
+        _live_catalog = None
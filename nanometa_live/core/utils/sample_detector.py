@@ -14,12 +14,24 @@ import logging
 import threading
 from typing import List, Dict, Optional, Set, Tuple
 
+from nanometa_live.core.utils.bounded_cache import BoundedCache
 from nanometa_live.core.utils.canonical_loaders import load_manifest
+from nanometa_live.core.utils.metrics import cache_lookup, timed_loader
+from nanometa_live.core.utils.results_catalog import (
+    scan_dir_mtime_ns,
+    scan_exists,
+    scan_glob,
+    scan_isdir,
+    scan_listdir,
+)
 
 # Module-level cache for sample detection.
 # Stores (dir_mtimes_fingerprint, cached_sample_list) keyed by main_dir.
+_SAMPLE_CACHE_MAX = 64
 _sample_cache_lock = threading.Lock()
-_sample_cache: Dict[str, Tuple[Tuple[Tuple[str, float], ...], List[str]]] = {}
+_SAMPLE_HIT = cache_lookup("sample", "hit")
+_SAMPLE_MISS = cache_lookup("sample", "miss")
+_sample_cache = BoundedCache("sample", max_entries=_SAMPLE_CACHE_MAX)
 
 # Output subdirectories whose mtime we monitor for cache invalidation.
 #
@@ -78,16 +90,24 @@ def _samples_from_manifest(main_dir: str) -> Optional[List[str]]:
     return ["All Samples"] + sorted(manifest_samples)
 
 
-def _get_dir_mtimes(main_dir: str) -> Tuple[Tuple[str, float], ...]:
-    """Return a hashable fingerprint of top-level output directory mtimes."""
+def _get_dir_mtimes(main_dir: str) -> Tuple[Tuple[str, int], ...]:
+    """Return a hashable fingerprint of top-level output directory mtimes.
+
+    Answered from the live results catalog when it covers ``main_dir``; the
+    catalog stat-ed these directories during this poll's freshness check.
+    """
     mtimes = []
     for subdir in _WATCHED_SUBDIRS:
         path = os.path.join(main_dir, subdir)
+        cataloged = scan_dir_mtime_ns(path)
+        if cataloged is not None:
+            mtimes.append((subdir, cataloged))
+            continue
         try:
             st = os.stat(path)
-            mtimes.append((subdir, st.st_mtime))
+            mtimes.append((subdir, st.st_mtime_ns))
         except OSError:
-            mtimes.append((subdir, 0.0))
+            mtimes.append((subdir, 0))
     return tuple(mtimes)
 
 
@@ -111,12 +131,16 @@ def resolve_analysis_directory(main_dir: str) -> str:
     Returns:
         Path to directory containing actual analysis output
     """
-    if not main_dir or not os.path.exists(main_dir):
+    if not main_dir:
         return main_dir
 
-    # Check if this directory already has analysis output
+    # Check if this directory already has analysis output. The catalog
+    # answers this without a stat once the directory is being polled, which
+    # matters because every loader call resolves its directory first.
     kraken_dir = os.path.join(main_dir, "kraken2")
-    if os.path.exists(kraken_dir):
+    if scan_exists(kraken_dir):
+        return main_dir
+    if not os.path.exists(main_dir):
         return main_dir
 
     # Check for analysis subdirectories (named analysis_YYYYMMDD_HHMMSS)
@@ -229,7 +253,7 @@ def detect_samples_from_kraken(kraken_dir: str) -> Set[str]:
     """
     samples = set()
 
-    if not os.path.exists(kraken_dir):
+    if not scan_exists(kraken_dir):
         logging.debug(f"Kraken2 directory not found: {kraken_dir}")
         return samples
 
@@ -243,7 +267,7 @@ def detect_samples_from_kraken(kraken_dir: str) -> Set[str]:
     ]
     kreport_files = []
     for pattern in kreport_patterns:
-        kreport_files.extend(glob.glob(pattern))
+        kreport_files.extend(scan_glob(pattern))
 
     for file_path in kreport_files:
         sample_name = extract_sample_name(file_path)
@@ -254,17 +278,17 @@ def detect_samples_from_kraken(kraken_dir: str) -> Set[str]:
     # batch_reports/ or batches/ folder, in case no top-level cumulative
     # report has been written yet (early in a run).
     try:
-        kraken_entries = os.listdir(kraken_dir)
+        kraken_entries = scan_listdir(kraken_dir)
     except OSError:
         logging.debug("Cannot list kraken2 directory (may have been removed): %s", kraken_dir)
         return samples
     for item in kraken_entries:
         item_path = os.path.join(kraken_dir, item)
-        if not os.path.isdir(item_path):
+        if not scan_isdir(item_path):
             continue
         has_batch_subdir = (
-            os.path.isdir(os.path.join(item_path, "batch_reports"))
-            or os.path.isdir(os.path.join(item_path, "batches"))
+            scan_isdir(os.path.join(item_path, "batch_reports"))
+            or scan_isdir(os.path.join(item_path, "batches"))
         )
         if has_batch_subdir and item not in samples:
             samples.add(item)
@@ -285,12 +309,12 @@ def detect_samples_from_fastp(fastp_dir: str) -> Set[str]:
     """
     samples = set()
 
-    if not os.path.exists(fastp_dir):
+    if not scan_exists(fastp_dir):
         logging.debug(f"FASTP directory not found: {fastp_dir}")
         return samples
 
     # Find all fastp JSON files
-    fastp_files = glob.glob(os.path.join(fastp_dir, "*.fastp.json"))
+    fastp_files = scan_glob(os.path.join(fastp_dir, "*.fastp.json"))
 
     for file_path in fastp_files:
         sample_name = extract_sample_name(file_path)
@@ -312,7 +336,7 @@ def detect_samples_from_blast(blast_dir: str) -> Set[str]:
     """
     samples = set()
 
-    if not os.path.exists(blast_dir):
+    if not scan_exists(blast_dir):
         logging.debug(f"BLAST directory not found: {blast_dir}")
         return samples
 
@@ -320,8 +344,8 @@ def detect_samples_from_blast(blast_dir: str) -> Set[str]:
     # the legacy layout. The old *.txt-only glob never matched a current
     # pipeline file, so a sample whose only output so far was validation data
     # went undetected.
-    blast_files = glob.glob(os.path.join(blast_dir, "*.blast.tsv"))
-    blast_files.extend(glob.glob(os.path.join(blast_dir, "*.txt")))
+    blast_files = scan_glob(os.path.join(blast_dir, "*.blast.tsv"))
+    blast_files.extend(scan_glob(os.path.join(blast_dir, "*.txt")))
 
     for file_path in blast_files:
         filename = os.path.basename(file_path)
@@ -353,12 +377,12 @@ def detect_samples_from_seqkit(seqkit_dir: str) -> Set[str]:
     """
     samples = set()
 
-    if not os.path.exists(seqkit_dir):
+    if not scan_exists(seqkit_dir):
         logging.debug(f"Seqkit directory not found: {seqkit_dir}")
         return samples
 
     # Find all seqkit TSV files
-    tsv_files = glob.glob(os.path.join(seqkit_dir, "*.tsv"))
+    tsv_files = scan_glob(os.path.join(seqkit_dir, "*.tsv"))
 
     for file_path in tsv_files:
         filename = os.path.basename(file_path)
@@ -387,28 +411,29 @@ def detect_samples_from_nanoplot(nanoplot_dir: str) -> Set[str]:
     """
     samples = set()
 
-    if not os.path.exists(nanoplot_dir):
+    if not scan_exists(nanoplot_dir):
         logging.debug(f"NanoPlot directory not found: {nanoplot_dir}")
         return samples
 
     # NanoPlot usually creates subdirectories per sample
     try:
-        nanoplot_entries = os.listdir(nanoplot_dir)
+        nanoplot_entries = scan_listdir(nanoplot_dir)
     except OSError:
         logging.debug("Cannot list NanoPlot directory (may have been removed): %s", nanoplot_dir)
         return samples
     for item in nanoplot_entries:
         item_path = os.path.join(nanoplot_dir, item)
-        if os.path.isdir(item_path):
+        if scan_isdir(item_path):
             # Check if it contains NanoStats.txt
             nanostats_path = os.path.join(item_path, "NanoStats.txt")
-            if os.path.exists(nanostats_path):
+            if scan_exists(nanostats_path):
                 samples.add(item)
                 logging.debug(f"Detected sample from NanoPlot: {item}")
 
     return samples
 
 
+@timed_loader("get_available_samples")
 def get_available_samples(main_dir: str) -> List[str]:
     """
     Get unified list of available samples from nanometanf output.
@@ -446,7 +471,9 @@ def get_available_samples(main_dir: str) -> List[str]:
             stored_mtimes, stored_result = cached
             if stored_mtimes == current_mtimes:
                 logging.debug("Sample detection cache hit for %s", main_dir)
+                _SAMPLE_HIT.inc()
                 return stored_result
+    _SAMPLE_MISS.inc()
 
     manifest_result = _samples_from_manifest(main_dir)
     if manifest_result is not None:
@@ -454,6 +481,17 @@ def get_available_samples(main_dir: str) -> List[str]:
             _sample_cache[main_dir] = (current_mtimes, manifest_result)
         return manifest_result
 
+    result = ["All Samples"] + _scan_output_samples(main_dir)
+
+    # Store in mtime cache
+    with _sample_cache_lock:
+        _sample_cache[main_dir] = (current_mtimes, result)
+
+    return result
+
+
+def _scan_output_samples(main_dir: str) -> List[str]:
+    """Sorted sample names found across the per-tool output directories."""
     all_samples: Set[str] = set()
 
     # Detect from Kraken2 output
@@ -474,21 +512,11 @@ def get_available_samples(main_dir: str) -> List[str]:
 
     # Detect from BLAST output (nanometanf v1.1+ publishes to validation/blast/)
     blast_dir = os.path.join(main_dir, "validation", "blast")
-    if not os.path.exists(blast_dir):
+    if not scan_exists(blast_dir):
         blast_dir = os.path.join(main_dir, "blast")
     all_samples.update(detect_samples_from_blast(blast_dir))
 
-    # Sort samples alphabetically
-    sorted_samples = sorted(list(all_samples))
-
-    # Always add "All Samples" as the first option
-    result = ["All Samples"] + sorted_samples
-
-    # Store in mtime cache
-    with _sample_cache_lock:
-        _sample_cache[main_dir] = (current_mtimes, result)
-
-    return result
+    return sorted(all_samples)
 
 
 def get_sample_file_mapping(main_dir: str) -> Dict[str, Dict[str, List[str]]]:
@@ -535,7 +563,7 @@ def get_sample_file_mapping(main_dir: str) -> Dict[str, Dict[str, List[str]]]:
         ]
         kraken_files = []
         for pattern in kraken_patterns:
-            kraken_files.extend(glob.glob(pattern))
+            kraken_files.extend(scan_glob(pattern))
         if kraken_files:
             sample_files['kraken2'] = sorted(kraken_files)
 
@@ -548,16 +576,16 @@ def get_sample_file_mapping(main_dir: str) -> Dict[str, Dict[str, List[str]]]:
         ]
         fastp_files = []
         for pattern in fastp_patterns:
-            fastp_files.extend(glob.glob(pattern))
+            fastp_files.extend(scan_glob(pattern))
         if fastp_files:
             sample_files['fastp'] = sorted(fastp_files)
 
         # BLAST files (nanometanf v1.1+ publishes to validation/blast/)
         blast_dir = os.path.join(main_dir, "validation", "blast")
-        if not os.path.exists(blast_dir):
+        if not scan_exists(blast_dir):
             blast_dir = os.path.join(main_dir, "blast")
-        blast_files = glob.glob(os.path.join(blast_dir, f"{sample}_*.blast.tsv"))
-        blast_files.extend(glob.glob(os.path.join(blast_dir, f"{sample}_*.txt")))
+        blast_files = scan_glob(os.path.join(blast_dir, f"{sample}_*.blast.tsv"))
+        blast_files.extend(scan_glob(os.path.join(blast_dir, f"{sample}_*.txt")))
         if blast_files:
             sample_files['blast'] = sorted(blast_files)
 
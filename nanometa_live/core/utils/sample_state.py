@@ -0,0 +1,92 @@
+"""
+Per-sample incremental state persisted next to the results.
+
+Several reducers fold a sample's result files into a compact summary and
+keep it across restarts, so a refresh only reads what is new: QC sketches
+(``qc_sketch``), Kraken2 read profiles (``kraken_read_profiles``) and the
+abundance series (``abundance_timeseries``). Each persists one file per
+sample under a hidden directory of the results folder, outside the watched
+subdirectories, so writing it never advances the freshness fingerprint.
+
+:class:`SampleStateFile` describes one such kind of state: a JSON object
+holding a schema version, an inventory of absorbed files (basename to a
+pair of integers, e.g. ``(mtime_ns, size)`` or ``(offset, inode)``) and the
+state itself. A file with another schema, or one that cannot be parsed,
+reads as absent and the sample is rebuilt.
+
+Persisting is best effort. A results directory the app cannot write to
+only loses the reuse across restarts; :func:`persist_failed` logs that.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from nanometa_live.core.utils.atomic_write import atomic_write_json
+from nanometa_live.core.utils.json_ingest import cached_json
+
+Inventory = Dict[str, Tuple[int, int]]
+
+
+def sample_state_path(source_dir: str, dirname: str, sample: str,
+                      suffix: str = ".json") -> str:
+    """``<results>/<dirname>/<sample><suffix>`` for a results subdirectory."""
+    results_dir = os.path.dirname(os.path.abspath(source_dir))
+    return os.path.join(results_dir, dirname, f"{sample}{suffix}")
+
+
+def persist_failed(label: str, path: str, exc: OSError) -> None:
+    """Note a failed write. A read-only results directory is not an error."""
+    logging.debug(f"Could not persist {label} {path}: {exc}")
+
+
+@dataclass(frozen=True)
+class SampleStateFile:
+    """Layout of one kind of persisted per-sample state.
+
+    ``encode`` turns the state into JSON-ready data and ``decode`` back.
+    ``inventory_key`` and ``state_key`` name the two fields in the file.
+    """
+
+    label: str
+    dirname: str
+    schema: int
+    encode: Callable[[Any], Any]
+    decode: Callable[[Any], Any]
+    inventory_key: str = "inventory"
+    state_key: str = "state"
+
+    def path(self, source_dir: str, sample: str) -> str:
+        """Where ``sample``'s state for ``source_dir`` lives."""
+        return sample_state_path(source_dir, self.dirname, sample)
+
+    def load(self, path: str) -> Optional[Tuple[Inventory, Any]]:
+        """The persisted ``(inventory, state)``, or None if absent or stale."""
+        try:
+            data = cached_json(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logging.debug(f"Ignoring unreadable {self.label} {path}: {exc}")
+            return None
+        if not isinstance(data, dict) or data.get("schema") != self.schema:
+            return None
+        try:
+            inventory = {name: (int(v[0]), int(v[1]))
+                         for name, v in data[self.inventory_key].items()}
+            return inventory, self.decode(data[self.state_key])
+        except (KeyError, TypeError, ValueError, IndexError, AttributeError) as exc:
+            logging.debug(f"Ignoring malformed {self.label} {path}: {exc}")
+            return None
+
+    def save(self, path: str, inventory: Inventory, state: Any) -> None:
+        """Write ``inventory`` and ``state`` atomically, best effort."""
+        try:
+            atomic_write_json(path, {
+                "schema": self.schema,
+                self.inventory_key: {name: list(v) for name, v in sorted(inventory.items())},
+                self.state_key: self.encode(state),
+            }, indent=None)
+        except OSError as exc:
+            persist_failed(self.label, path, exc)
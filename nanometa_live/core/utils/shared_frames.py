@@ -0,0 +1,370 @@
+"""
+Cross-process tier for parsed loader results.
+
+Every loader cache is module-level state, so a dashboard served by N
+worker processes parses each Kraken2 report N times and holds N copies of
+every frame. When ``NANOMETA_SHARED_CACHE`` names a directory -- a tmpfs
+such as ``/dev/shm/nanometa`` is the intended target -- the loaders put a
+:class:`SharedStore` in front of their parse step:
+
+- Each entry is a ``<name>.manifest`` (JSON: version, signature, data file,
+  format) beside its ``<name>.<version>.<format>`` data file. The signature
+  is the caller's source fingerprint, so a stale entry is never served.
+- On a miss the first worker to take the entry's ``flock`` is its leader:
+  it re-reads the manifest (a peer may have just published), computes,
+  writes the data file, swaps the manifest in atomically with the version
+  bumped and unlinks the old data file. Workers waiting on the lock find
+  the new manifest and map it. Readers that still map the old file keep
+  it until they drop it; unlinking never invalidates a mapping.
+- Frames are mapped read-only. With ``pyarrow`` installed they are Arrow
+  IPC files read through ``pa.memory_map``; otherwise a small built-in
+  columnar layout (``NMCOLS01``) whose numeric columns are 64-byte aligned
+  and wrapped with ``np.frombuffer``. Either way numeric columns live in
+  the page cache once, shared by every worker. Object and string columns
+  are pickled and rebuilt per process.
+- :meth:`SharedStore.value` publishes any picklable result the same way;
+  it shares the parse, not the memory.
+
+The tier is off when the variable is unset, and every failure to publish
+or map (full tmpfs, unpicklable value) falls back to the computed value.
+
+Entries are unpickled, so the directory must be trusted: it is created
+``0700``, and an existing one owned by another user or writable by group
+or others is refused (the tier then stays off). Point the variable at a
+directory of your own, e.g. ``/dev/shm/nanometa-$USER``, never at
+``/dev/shm`` itself.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from nanometa_live.core.utils.atomic_write import (
+    atomic_write_bytes,
+    atomic_write_json,
+    file_lock,
+)
+from nanometa_live.core.utils.bounded_cache import BoundedCache
+from nanometa_live.core.utils.metrics import cache_lookup
+
+logger = logging.getLogger(__name__)
+
+#: Directory of the shared tier; unset disables it.
+SHARED_CACHE_ENV = "NANOMETA_SHARED_CACHE"
+#: Entries a process keeps mapped. A mapping costs address space, not RSS.
+SHARED_MEMO_MAX = 256
+
+_MAGIC = b"NMCOLS01"
+_ALIGN = 64
+# Column kinds stored as raw buffers; everything else is pickled.
+_BUFFER_KINDS = "biuf"
+
+_SHARED_HIT = cache_lookup("shared_frames", "hit")
+_SHARED_MAP = cache_lookup("shared_frames", "map")
+_SHARED_MISS = cache_lookup("shared_frames", "miss")
+
+_store_lock = threading.Lock()
+_stores: Dict[str, Optional["SharedStore"]] = {}
+_override: Optional[str] = None
+_ABSENT = object()
+
+
+class _Reformat(Exception):
+    """The chosen format cannot hold this value; retry with ``args[0]``."""
+
+
+def _pad(n: int) -> int:
+    return -n % _ALIGN
+
+
+def _arrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+    except ImportError:  # optional; the built-in layout is used instead
+        return None
+    return pyarrow
+
+
+def _write_columns(path: Path, df: pd.DataFrame) -> None:
+    """Write ``df`` in the ``NMCOLS01`` layout.
+
+    ``magic | header length (u8) | JSON header | pad | column buffers``,
+    each buffer starting on a 64-byte boundary.
+    """
+    blobs, columns, offset = [], [], 0
+    for name in df.columns:
+        series = df[name]
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in _BUFFER_KINDS:
+            data, kind, spec = np.ascontiguousarray(series.to_numpy()).tobytes(), "buffer", dtype.str
+        else:
+            data, kind, spec = pickle.dumps(series.array, pickle.HIGHEST_PROTOCOL), "pickle", ""
+        columns.append({"name": name, "kind": kind, "dtype": spec,
+                        "offset": offset, "nbytes": len(data)})
+        blobs.append(data)
+        offset += len(data) + _pad(len(data))
+    index = pickle.dumps(df.index, pickle.HIGHEST_PROTOCOL)
+    header = json.dumps({"rows": len(df), "columns": columns,
+                         "index": [offset, len(index)]}).encode()
+    prefix = len(_MAGIC) + 8 + len(header)
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(_MAGIC + len(header).to_bytes(8, "little") + header)
+        fh.write(b"\0" * _pad(prefix))
+        for data in blobs:
+            fh.write(data + b"\0" * _pad(len(data)))
+        fh.write(index)
+    os.replace(tmp, path)
+
+
+def _read_columns(path: Path) -> pd.DataFrame:
+    with open(path, "rb") as fh:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    if mm[:len(_MAGIC)] != _MAGIC:
+        raise ValueError(f"{path} is not a shared frame")
+    size = int.from_bytes(mm[len(_MAGIC):len(_MAGIC) + 8], "little")
+    start = len(_MAGIC) + 8
+    header = json.loads(mm[start:start + size])
+    base = start + size + _pad(start + size)
+    data = {}
+    for col in header["columns"]:
+        lo = base + col["offset"]
+        if col["kind"] == "buffer":
+            dtype = np.dtype(col["dtype"])
+            data[col["name"]] = np.frombuffer(mm, dtype=dtype, count=header["rows"], offset=lo)
+        else:
+            data[col["name"]] = pickle.loads(mm[lo:lo + col["nbytes"]])
+    lo, n = header["index"]
+    index = pickle.loads(mm[base + lo:base + lo + n])
+    return pd.DataFrame(data, index=index, copy=False)
+
+
+def _write_arrow(path: Path, df: pd.DataFrame, pa) -> None:
+    table = pa.Table.from_pandas(df)
+    tmp = path.with_name(f".{path.name}.tmp")
+    with pa.OSFile(str(tmp), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp, path)
+
+
+def _read_arrow(path: Path, pa) -> pd.DataFrame:
+    with pa.memory_map(str(path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def _frame_format(df: pd.DataFrame) -> str:
+    if not df.columns.is_unique or not all(isinstance(c, str) for c in df.columns):
+        return "pickle"
+    return "arrow" if _arrow() is not None else "columns"
+
+
+def _write(path: Path, value: Any, fmt: str) -> None:
+    if fmt == "arrow":
+        try:
+            return _write_arrow(path, value, _arrow())
+        except Exception as exc:  # mixed object columns Arrow cannot type
+            raise _Reformat("columns") from exc
+    if fmt == "columns":
+        return _write_columns(path, value)
+    atomic_write_bytes(path, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+
+def _read(path: Path, fmt: str) -> Any:
+    if fmt == "arrow":
+        pa = _arrow()
+        if pa is None:
+            raise ValueError("arrow entry but pyarrow is not installed")
+        return _read_arrow(path, pa)
+    if fmt == "columns":
+        return _read_columns(path)
+    with open(path, "rb") as fh:
+        return pickle.load(fh)
+
+
+def _check_private_dir(root: Path) -> None:
+    """Create ``root`` as ``0700``, or refuse one another user could write.
+
+    Raises:
+        PermissionError: ``root`` is owned by another user or writable by
+            group or others.
+    """
+    root.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = root.stat()
+    if not hasattr(os, "geteuid"):  # Windows: no POSIX ownership to check
+        return
+    if st.st_uid != os.geteuid():
+        raise PermissionError(f"{root} is owned by uid {st.st_uid}, not this user")
+    if st.st_mode & 0o022:
+        raise PermissionError(
+            f"{root} is writable by group or others (mode {st.st_mode & 0o777:o})")
+
+
+class SharedStore:
+    """Versioned entries under one directory, shared by every process using it."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        _check_private_dir(self.root)
+        self._lock = threading.Lock()
+        # name -> (version, signature, value). Mapped frames are charged at
+        # their full size: their pages stay resident while referenced.
+        self._memo = BoundedCache(f"shared_frames:{self.root}", max_entries=SHARED_MEMO_MAX)
+        self.stats = {"hits": 0, "maps": 0, "computes": 0}
+
+    def frame(self, key: str, signature: Optional[str],
+              compute: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """``compute()``'s DataFrame, parsed once across processes per ``signature``.
+
+        The frame returned on a map is backed by read-only memory: copy
+        before mutating it in place.
+        """
+        return self._get(key, signature, compute, frame=True)
+
+    def value(self, key: str, signature: Optional[str], compute: Callable[[], Any]) -> Any:
+        """Like :meth:`frame` for any picklable value (unpickled per process)."""
+        return self._get(key, signature, compute, frame=False)
+
+    def _get(self, key, signature, compute, frame):
+        if signature is None:
+            return compute()
+        name = hashlib.sha1(key.encode()).hexdigest()[:24]
+        manifest_path = self.root / f"{name}.manifest"
+        found = self._lookup(name, manifest_path, signature)
+        if found is not _ABSENT:
+            return found
+        with file_lock(manifest_path):
+            found = self._lookup(name, manifest_path, signature)
+            if found is not _ABSENT:
+                return found
+            _SHARED_MISS.inc()
+            value = compute()
+            with self._lock:
+                self.stats["computes"] += 1
+            try:
+                return self._publish(name, manifest_path, signature, value, frame)
+            except (OSError, pickle.PicklingError, AttributeError, TypeError, ValueError) as exc:
+                logger.warning("Shared cache: could not publish %s: %s", key, exc)
+                return value
+
+    def _lookup(self, name: str, manifest_path: Path, signature: str) -> Any:
+        try:
+            with open(manifest_path, "rb") as fh:
+                manifest = json.loads(fh.read())
+        except (OSError, ValueError):
+            return _ABSENT
+        if manifest.get("signature") != signature:
+            return _ABSENT
+        version = manifest["version"]
+        with self._lock:
+            memo = self._memo.get(name)
+            if memo is not None and memo[:2] == (version, signature):
+                self.stats["hits"] += 1
+                _SHARED_HIT.inc()
+                return memo[2]
+        try:
+            value = _read(self.root / manifest["file"], manifest["format"])
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            # Replaced and unlinked between the two reads; treat as a miss.
+            return _ABSENT
+        self._remember(name, version, signature, value)
+        with self._lock:
+            self.stats["maps"] += 1
+        _SHARED_MAP.inc()
+        return value
+
+    def _publish(self, name, manifest_path, signature, value, frame):
+        try:
+            with open(manifest_path, "rb") as fh:
+                previous = json.loads(fh.read())
+        except (OSError, ValueError):
+            previous = {}
+        version = int(previous.get("version", 0)) + 1
+        fmt = _frame_format(value) if frame and isinstance(value, pd.DataFrame) else "pickle"
+        try:
+            data_file = f"{name}.{version}.{fmt}"
+            _write(self.root / data_file, value, fmt)
+        except _Reformat as retry:
+            fmt = retry.args[0]
+            data_file = f"{name}.{version}.{fmt}"
+            _write(self.root / data_file, value, fmt)
+        atomic_write_json(manifest_path, {"version": version, "signature": signature,
+                                          "file": data_file, "format": fmt}, indent=None)
+        if previous.get("file") and previous["file"] != data_file:
+            try:
+                os.unlink(self.root / previous["file"])
+            except OSError:
+                pass
+        if fmt != "pickle":
+            # Serve the leader from the mapping too, so its heap copy is freed.
+            value = _read(self.root / data_file, fmt)
+        self._remember(name, version, signature, value)
+        return value
+
+    def _remember(self, name: str, version: int, signature: str, value: Any) -> None:
+        with self._lock:
+            self._memo[name] = (version, signature, value)
+
+    def forget(self) -> None:
+        """Drop this process's mappings; the published entries stay."""
+        with self._lock:
+            self._memo.clear()
+
+    def purge(self) -> None:
+        """Delete every published entry (a run boundary). Live mappings survive."""
+        self.forget()
+        for path in self.root.iterdir():
+            # Lock files stay: a peer may hold one, and a new inode would split it.
+            if path.suffix in (".manifest", ".arrow", ".columns", ".pickle"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
+def set_shared_cache_dir(path: Optional[str]) -> None:
+    """Override ``NANOMETA_SHARED_CACHE`` for this process (``None`` restores it)."""
+    global _override
+    _override = os.fspath(path) if path is not None else None
+
+
+def shared_store() -> Optional[SharedStore]:
+    """The store for the configured directory, or None when the tier is off."""
+    root = _override if _override is not None else os.environ.get(SHARED_CACHE_ENV)
+    if not root:
+        return None
+    with _store_lock:
+        if root not in _stores:
+            try:
+                _stores[root] = SharedStore(root)
+            except OSError as exc:
+                # Remembered, so a refused directory is reported once.
+                logger.warning("Shared cache disabled: cannot use %s: %s", root, exc)
+                _stores[root] = None
+        return _stores[root]
+
+
+def clear_shared_memo() -> None:
+    """Drop every store's local mappings (``clear_data_cache``)."""
+    with _store_lock:
+        stores = [store for store in _stores.values() if store is not None]
+    for store in stores:
+        store.forget()
+
+
+def purge_shared_cache() -> None:
+    """Delete the configured store's entries (``clear_all_loader_caches``)."""
+    store = shared_store()
+    if store is not None:
+        store.purge()
@@ -0,0 +1,295 @@
+"""
+Low-frequency statistical stack sampler for the running dashboard.
+
+Operators report stalls ("the dashboard froze at barcode 18") that do not
+reproduce offline, and ``cProfile`` is too invasive to leave on in a live
+run (see ``scripts/perf/README.md``). This sampler is cheap enough to
+leave on: a daemon thread wakes ``hz`` times a second, reads every other
+thread's current frame with :func:`sys._current_frames` and counts the
+stack. The threads it sees include the Werkzeug request threads that run
+Dash callbacks, the Nextflow runner and monitor, and
+``BackendManager._monitor_status``. Nothing is hooked into the sampled
+code, so a sample costs the same whether or not a callback is running.
+
+Samples are aggregated in memory and written as *folded stacks* (one
+``frame;frame;frame count`` line per distinct stack). That is the input
+format of ``flamegraph.pl``, speedscope and inferno. A new file is started
+every ``rotate_seconds``, and only the newest ``keep_files`` are kept, so a
+multi-day run holds a bounded rolling window.
+
+Each stack is rooted at the thread's role (its name with the counter
+stripped, e.g. ``request`` or ``nextflow-monitor``). When the thread is
+serving a Dash callback, the next frame is ``callback:<output id>``. The
+Flask hooks in ``app/callbacks/profiling.py`` set that tag via
+:func:`tag_current_thread`, so a slow tick can be attributed to the
+callback and then to the loader or figure builder below it.
+
+The sampler is wall-clock, so threads blocked on a lock or on I/O are
+counted too; that is what a freeze looks like. Threads parked in an idle
+wait (an empty work queue, the server's accept loop) are dropped unless
+``include_idle`` is set, otherwise they would dominate every file.
+
+Only the dashboard process is sampled. Background callbacks run in the
+worker processes of ``app/utils/background_pool.py`` and do not appear.
+"""
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from nanometa_live.core.utils.atomic_write import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HZ = 20.0
+DEFAULT_ROTATE_SECONDS = 60.0
+DEFAULT_KEEP_FILES = 60
+MAX_DEPTH = 128
+
+PROFILE_PREFIX = "profile-"
+PROFILE_SUFFIX = ".folded"
+
+# Leaf frames that mean "parked, waiting for work". A thread whose
+# innermost Python frame is one of these is idle, not stalled.
+IDLE_LEAVES = frozenset({
+    "threading:Condition.wait",
+    "threading:Event.wait",
+    "threading:Thread.join",
+    "threading:Thread._wait_for_tstate_lock",
+    "queue:Queue.get",
+    "selectors:PollSelector.select",
+    "selectors:EpollSelector.select",
+    "selectors:KqueueSelector.select",
+    "selectors:SelectSelector.select",
+    "socketserver:BaseServer.serve_forever",
+    "socket:socket.accept",
+})
+
+_THREAD_TARGET = re.compile(r"^Thread-\d+ \((.+)\)$")
+_TRAILING_COUNTER = re.compile(r"[-_ ]?\d+$")
+
+# thread ident -> callback tag, set while a Dash callback request is served.
+_thread_tags: Dict[int, str] = {}
+
+
+def tag_current_thread(tag: Optional[str]) -> None:
+    """Tag (or, with None, untag) the calling thread's samples."""
+    ident = threading.get_ident()
+    if tag:
+        _thread_tags[ident] = tag
+    else:
+        _thread_tags.pop(ident, None)
+
+
+def thread_role(name: str) -> str:
+    """Stable root frame for a thread name.
+
+    ``Thread-7 (process_request_thread)`` becomes ``request``; otherwise
+    a trailing counter is stripped so all workers of a pool share a root.
+    """
+    match = _THREAD_TARGET.match(name)
+    if match:
+        target = match.group(1)
+        return "request" if target == "process_request_thread" else target
+    return _TRAILING_COUNTER.sub("", name) or name
+
+
+def frame_label(frame) -> str:
+    """``module:qualname`` for one frame."""
+    code = frame.f_code
+    module = frame.f_globals.get("__name__") or os.path.basename(code.co_filename)
+    return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def folded_stack(frame, max_depth: int = MAX_DEPTH) -> List[str]:
+    """Frame labels from the outermost caller down to ``frame``."""
+    labels: List[str] = []
+    while frame is not None and len(labels) < max_depth:
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+class StackSampler:
+    """Samples all other threads' stacks into rolling folded-stack files."""
+
+    def __init__(self, out_dir: str, hz: float = DEFAULT_HZ,
+                 rotate_seconds: float = DEFAULT_ROTATE_SECONDS,
+                 keep_files: int = DEFAULT_KEEP_FILES,
+                 include_idle: bool = False):
+        if hz <= 0:
+            raise ValueError(f"hz must be positive, got {hz}")
+        self.out_dir = out_dir
+        self.interval = 1.0 / hz
+        self.hz = hz
+        self.rotate_seconds = rotate_seconds
+        self.keep_files = max(1, int(keep_files))
+        self.include_idle = include_idle
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._window_start = 0.0
+        self.started_at: Optional[float] = None
+        self.samples = 0
+        self.files_written = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        os.makedirs(self.out_dir, exist_ok=True)
+        self._stop.clear()
+        self.started_at = self._window_start = time.time()
+        self._thread = threading.Thread(
+            target=self._run, name="nanometa-stack-sampler", daemon=True
+        )
+        self._thread.start()
+        logger.info("Stack sampler started at %.0f Hz, writing to %s", self.hz, self.out_dir)
+
+    def stop(self) -> Optional[str]:
+        """Stop sampling and flush; returns the last file written, if any."""
+        thread = self._thread
+        if thread is None:
+            return None
+        self._stop.set()
+        thread.join(timeout=5.0)
+        self._thread = None
+        path = self.flush()
+        logger.info("Stack sampler stopped after %d samples", self.samples)
+        return path
+
+    def sample_once(self) -> None:
+        """Record one sample of every thread except the sampler itself."""
+        own = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        stacks = []
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            labels = folded_stack(frame)
+            if not labels or (not self.include_idle and labels[-1] in IDLE_LEAVES):
+                continue
+            root = [thread_role(names.get(ident, f"thread-{ident}"))]
+            tag = _thread_tags.get(ident)
+            if tag:
+                root.append(f"callback:{tag}")
+            stacks.append(";".join(root + labels))
+        with self._lock:
+            self._counts.update(stacks)
+            self.samples += 1
+
+    def flush(self) -> Optional[str]:
+        """Write the current window to a new file and prune old ones."""
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            window_start, self._window_start = self._window_start, time.time()
+        if not counts:
+            return None
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(window_start))
+        path = os.path.join(self.out_dir, f"{PROFILE_PREFIX}{stamp}{PROFILE_SUFFIX}")
+        text = "".join(f"{stack} {n}\n" for stack, n in sorted(counts.items()))
+        try:
+            if os.path.exists(path):
+                # Two windows in the same second (a stop/start): keep both.
+                with open(path, "a", encoding="utf-8") as fh:
+                    fh.write(text)
+            else:
+                atomic_write_text(path, text)
+        except OSError as e:
+            logger.warning("Stack sampler could not write %s: %s", path, e)
+            return None
+        self.files_written += 1
+        self._prune()
+        return path
+
+    def _prune(self) -> None:
+        files = profile_files(self.out_dir)
+        for name in files[:-self.keep_files]:
+            try:
+                os.remove(os.path.join(self.out_dir, name))
+            except OSError:
+                pass
+
+    def _run(self) -> None:
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                self.sample_once()
+            except Exception:
+                logger.debug("Stack sample failed", exc_info=True)
+            if time.time() - self._window_start >= self.rotate_seconds:
+                self.flush()
+            next_tick += self.interval
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                # Fell behind (a long GIL hold); do not burst to catch up.
+                next_tick = time.monotonic()
+                delay = 0.0
+            self._stop.wait(delay)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "out_dir": self.out_dir,
+            "hz": self.hz,
+            "started_at": self.started_at,
+            "samples": self.samples,
+            "files": len(profile_files(self.out_dir)),
+        }
+
+
+def profile_files(out_dir: str) -> List[str]:
+    """Folded-stack file names in ``out_dir``, oldest first."""
+    try:
+        names = os.listdir(out_dir)
+    except OSError:
+        return []
+    return sorted(n for n in names
+                  if n.startswith(PROFILE_PREFIX) and n.endswith(PROFILE_SUFFIX))
+
+
+def default_profile_dir(data_dir: str) -> str:
+    return os.path.join(os.path.expanduser(data_dir), "logs", "profiles")
+
+
+_sampler: Optional[StackSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def start_profiler(out_dir: str, **kwargs: Any) -> StackSampler:
+    """Start the process-wide sampler (a no-op when it is already running)."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is not None and _sampler.running:
+            return _sampler
+        _sampler = StackSampler(out_dir, **kwargs)
+        _sampler.start()
+        return _sampler
+
+
+def stop_profiler() -> Optional[str]:
+    """Stop the process-wide sampler; returns the last file written."""
+    with _sampler_lock:
+        sampler = _sampler
+    return sampler.stop() if sampler is not None else None
+
+
+def profiler_running() -> bool:
+    sampler = _sampler
+    return sampler is not None and sampler.running
+
+
+def profiler_status() -> Optional[Dict[str, Any]]:
+    """Status of the last started sampler, or None if none was started."""
+    sampler = _sampler
+    return sampler.status() if sampler is not None else None
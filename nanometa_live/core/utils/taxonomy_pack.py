@@ -0,0 +1,175 @@
+"""
+Packed taxonomy-cache snapshots.
+
+The offline taxonomy cache keeps one JSON file per entry. Moving tens of
+thousands of those between machines as a single JSON document means
+parsing and re-serialising every entry at both ends. A pack is one file:
+
+    header   magic, version, index length            (``_HEADER``)
+    index    zlib-compressed JSON: one row per entry
+    data     one zlib-compressed blob per entry
+
+Each blob is the entry's cache file verbatim, so an import decompresses
+and writes bytes without decoding JSON, and an entry is only parsed when
+something asks for it. The file is read through ``mmap``: opening a pack
+reads the index only, and each blob is sliced out on demand.
+
+The index also carries a per-type summary (entry count, bytes, expiry
+times), so a pack's statistics need no pass over the blobs.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PACK_MAGIC = b"NMTXPACK"
+PACK_VERSION = 1
+PACK_SUFFIX = ".nmpack"
+# magic, version, reserved, index length
+_HEADER = struct.Struct("<8sIIQ")
+# zlib releases the GIL, so compression and decompression scale with threads.
+_PACK_WORKERS = 4
+_COMPRESS_LEVEL = 6
+
+# One index row: cache type, cache file name, data offset, compressed
+# length, raw length, expiry time.
+IndexRow = Tuple[str, str, int, int, int, float]
+
+
+def is_pack(path) -> bool:
+    """True when ``path`` starts with the pack magic."""
+    try:
+        with open(path, "rb") as fh:
+            return fh.read(len(PACK_MAGIC)) == PACK_MAGIC
+    except OSError:
+        return False
+
+
+def write_pack(
+    path,
+    records: Iterable[Tuple[str, str, bytes, float]],
+    source: str = "nanometa_live_cache_export",
+) -> int:
+    """Write ``(cache_type, key, raw_bytes, expires_at)`` records as a pack.
+
+    Blobs are compressed in parallel and the file is written atomically.
+
+    Returns:
+        Number of entries written.
+    """
+    from nanometa_live.core.utils.atomic_write import atomic_write_bytes
+
+    records = list(records)
+    with ThreadPoolExecutor(max_workers=_PACK_WORKERS) as pool:
+        blobs = list(pool.map(lambda r: zlib.compress(r[2], _COMPRESS_LEVEL), records))
+
+    rows: List[IndexRow] = []
+    summary: Dict[str, Dict] = {}
+    offset = 0
+    for (cache_type, key, raw, expires_at), blob in zip(records, blobs):
+        rows.append((cache_type, key, offset, len(blob), len(raw), expires_at))
+        offset += len(blob)
+        _summarise(summary, cache_type, len(raw), expires_at)
+
+    index = zlib.compress(json.dumps({
+        "created_at": time.time(),
+        "source": source,
+        "summary": summary,
+        "entries": rows,
+    }, separators=(",", ":")).encode())
+    header = _HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, len(index))
+    atomic_write_bytes(path, b"".join([header, index, *blobs]))
+    return len(rows)
+
+
+def _summarise(summary: Dict[str, Dict], cache_type: str, size: int, expires_at: float) -> None:
+    """Add one entry to a ``{cache_type: {entries, bytes, expiries}}`` summary."""
+    part = summary.setdefault(cache_type, {"entries": 0, "bytes": 0, "expiries": {}})
+    part["entries"] += 1
+    part["bytes"] += size
+    second = str(int(expires_at))
+    part["expiries"][second] = part["expiries"].get(second, 0) + 1
+
+
+class PackedSnapshot:
+    """Read-only, memory-mapped view of a pack.
+
+    Use as a context manager, or call :meth:`close`. Entries are
+    decompressed and parsed on first access only.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._fh = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, _reserved, index_len = _HEADER.unpack_from(self._map, 0)
+            if magic != PACK_MAGIC:
+                raise ValueError(f"{self.path} is not a taxonomy pack")
+            if version != PACK_VERSION:
+                raise ValueError(f"Unsupported taxonomy pack version {version}")
+            start = _HEADER.size
+            index = json.loads(zlib.decompress(self._map[start:start + index_len]))
+        except BaseException:
+            self.close()
+            raise
+        self._data_start = start + index_len
+        self.created_at: float = index.get("created_at", 0.0)
+        self.source: str = index.get("source", "")
+        self.summary: Dict[str, Dict] = index.get("summary", {})
+        self.rows: List[IndexRow] = [tuple(r) for r in index["entries"]]
+        self._by_key = {(r[0], r[1]): i for i, r in enumerate(self.rows)}
+        self._decoded: Dict[int, Dict] = {}
+
+    def __enter__(self) -> "PackedSnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def close(self) -> None:
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._fh.close()
+
+    def raw(self, i: int) -> bytes:
+        """The cache file bytes of entry ``i``, without parsing them."""
+        _type, _key, offset, length, _size, _exp = self.rows[i]
+        start = self._data_start + offset
+        return zlib.decompress(self._map[start:start + length])
+
+    def raw_batch(self, indices: Iterable[int]) -> List[bytes]:
+        """:meth:`raw` for several entries, decompressed in parallel."""
+        with ThreadPoolExecutor(max_workers=_PACK_WORKERS) as pool:
+            return list(pool.map(self.raw, indices))
+
+    def entry(self, cache_type: str, key: str) -> Optional[Dict]:
+        """The parsed cache entry stored under ``key``, or None."""
+        i = self._by_key.get((cache_type, key))
+        if i is None:
+            return None
+        if i not in self._decoded:
+            self._decoded[i] = json.loads(self.raw(i))
+        return self._decoded[i]
+
+    def keys(self, cache_type: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+        """``(cache_type, key)`` of every entry, optionally of one type."""
+        return ((r[0], r[1]) for r in self.rows if cache_type is None or r[0] == cache_type)
+
+    def stats(self) -> Dict[str, int]:
+        """Entry counts per type and in total, read from the index summary."""
+        counts = {f"{t}_entries": part["entries"] for t, part in self.summary.items()}
+        counts["total_entries"] = len(self.rows)
+        return counts
@@ -12,6 +12,7 @@ import os
 from typing import Any, Dict, List, Optional
 
 from nanometa_live.core.utils.canonical_loaders import load_canonical_validation
+from nanometa_live.core.utils.json_ingest import cached_json
 from nanometa_live.core.utils.sample_detector import resolve_analysis_directory
 
 # Upstream validation status -> dashboard status vocabulary.
@@ -146,8 +147,7 @@ def load_blast_validation_data(
 
     for agg_path in aggregate_paths:
         try:
-            with open(agg_path, 'r') as f:
-                agg_data = json.load(f)
+            agg_data = cached_json(agg_path, ("results",))
 
             filter_sample = None if (sample is None or sample == "All Samples") else sample
 
@@ -0,0 +1,261 @@
+"""
+Persistent cache of detected-taxon -> watchlist-entry resolutions.
+
+``check_organisms_split`` and ``check_organisms_with_mapping_split`` resolve
+every report row to a watchlist entry. The taxid steps are dict lookups,
+but the name fallback normalises the detected name and generates its
+variants each time. The dashboard's ``_pathogen_check_memo`` only helps
+when the whole organism list, read counts included, is unchanged. During a
+run the counts move on every tick, so every tick re-matched every name.
+
+Which entry a row resolves to does not depend on its reads. It is a pure
+function of ``(taxid, name)`` given:
+
+* the active watchlist, which ``WatchlistManager.watchlist_signature``
+  already summarises by content, and
+* what the resolution reads from the database side: the
+  NCBI-compatibility flag, and in the mapping-aware path each mapping's
+  ``db_taxid`` and ``match_score`` (:func:`mapping_signature`).
+
+Those together form the cache *namespace*. A namespace change drops every
+cached row, so a watchlist edit or a regenerated mapping can never serve a
+stale entry. Within a namespace, steady-state matching costs one dict
+lookup per row, and only taxa seen for the first time reach the matcher.
+Misses are cached too, because most rows match nothing.
+
+Rows are keyed on the taxid and name exactly as the report gives them.
+Normalising the name to build the key would cost the work being skipped.
+Cached values hold the entry's ``active_entries`` key, not the entry, so
+they survive a restart. One JSON file per database sits next to the
+database's mapping cache, ``<mappings_dir>/<db_hash>_match_cache.json``,
+and is rewritten atomically after a pass that learned something new.
+Without a known database the cache is memory-only.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+# Rows kept per namespace. A deep environmental run reports a few
+# thousand taxa; past this the cache is reset rather than grown.
+MAX_ENTRIES = 200_000
+
+# (entry key or None, score, match method or None)
+Resolution = Tuple[Optional[Hashable], float, Optional[str]]
+
+# mapping file key -> signature of the collection last hashed.
+_signature_lock = threading.Lock()
+_signature_memo: Dict[Tuple[Any, ...], str] = {}
+
+
+def mapping_signature(mapping_collection: Any) -> str:
+    """Content signature of what matching reads from a mapping collection.
+
+    Covers the NCBI-compatibility flag and each mapping's ``db_taxid`` and
+    ``match_score``. Mappings are edited in place (manual verification), so
+    identity or a count would miss a change. Every edit path ends in
+    ``update_statistics`` and a save, so while the saved mapping file's
+    ``(mtime_ns, size)`` and the collection's ``updated_at`` are unchanged
+    the previous signature is reused instead of hashing every mapping.
+    """
+    if not mapping_collection:
+        return ""
+    key = _mapping_file_key(mapping_collection)
+    if key is not None:
+        with _signature_lock:
+            memo = _signature_memo.get(key)
+        if memo is not None:
+            return memo
+    parts = [repr(bool(mapping_collection.profile.taxids_are_ncbi))]
+    for ncbi_taxid, mapping in sorted(mapping_collection.mappings.items()):
+        parts.append(f"{ncbi_taxid}:{mapping.db_taxid}:{mapping.match_score}")
+    signature = hashlib.md5("|".join(parts).encode("utf-8", "replace")).hexdigest()
+    if key is not None:
+        with _signature_lock:
+            _signature_memo.clear()  # one collection is live at a time
+            _signature_memo[key] = signature
+    return signature
+
+
+def _mapping_file_key(mapping_collection: Any) -> Optional[Tuple[Any, ...]]:
+    """Identity of the collection's saved state, or None if it has no file."""
+    db_hash = getattr(mapping_collection, "database_hash", "")
+    if not db_hash or not isinstance(db_hash, str):
+        return None
+    from nanometa_live.core.utils.paths import get_mappings_dir_from_env
+    path = os.path.join(get_mappings_dir_from_env(), f"{db_hash}_mappings.json")
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (id(mapping_collection), path, st.st_mtime_ns, st.st_size,
+            getattr(mapping_collection, "updated_at", None))
+
+
+def _persistable_taxid(taxid: Any) -> bool:
+    return taxid is None or (isinstance(taxid, int) and not isinstance(taxid, bool))
+
+
+class MatchCache:
+    """Resolutions for one database, valid for one namespace at a time.
+
+    ``get`` and ``put`` name the namespace they resolved under. A pass that
+    raced a watchlist edit then neither reads nor writes the other
+    namespace's rows.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        # (namespace, rows), swapped as one so a lock-free reader never
+        # pairs one namespace with another's rows.
+        self._state: Tuple[Optional[str], Dict[Tuple[Any, str], Resolution]] = (None, {})
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._state[1])
+
+    @property
+    def namespace(self) -> Optional[str]:
+        return self._state[0]
+
+    def bind(self, namespace: str) -> None:
+        """Switch to ``namespace``, dropping rows cached under another one.
+
+        The first bind of a process reads the file, keeping its rows only
+        when they were written under the same namespace.
+        """
+        with self._lock:
+            current = self._state[0]
+            if namespace == current:
+                return
+            rows = self._read(namespace) if current is None else {}
+            self._state = (namespace, rows)
+            self._dirty = False
+
+    def get(self, namespace: str, taxid: Any, name: str) -> Optional[Resolution]:
+        bound, rows = self._state
+        if bound != namespace:
+            return None
+        try:
+            hit = rows.get((taxid, name))
+        except TypeError:  # unhashable taxid from a malformed row
+            return None
+        with self._lock:
+            if hit is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return hit
+
+    def put(self, namespace: str, taxid: Any, name: str, resolution: Resolution) -> None:
+        with self._lock:
+            bound, rows = self._state
+            if bound != namespace:
+                return
+            if len(rows) >= MAX_ENTRIES:
+                rows = {}
+                self._state = (bound, rows)
+            try:
+                if rows.get((taxid, name)) == resolution:
+                    return
+                rows[(taxid, name)] = resolution
+            except TypeError:
+                return
+            # Rows ``flush`` would drop never make the file worth rewriting.
+            if _persistable_taxid(taxid) and _persistable_taxid(resolution[0]):
+                self._dirty = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._state = (None, {})
+            self._dirty = False
+
+    def flush(self) -> bool:
+        """Write the rows out if a persisted row changed since the last write.
+
+        Best effort: the cache is an accelerator, so a read-only or full
+        data dir costs the next process a cold start, nothing more.
+        """
+        with self._lock:
+            namespace, current = self._state
+            if not self._dirty or self.path is None or namespace is None:
+                return False
+            rows: List[list] = [
+                [taxid, name, key, score, method]
+                for (taxid, name), (key, score, method) in current.items()
+                if _persistable_taxid(taxid) and _persistable_taxid(key)
+            ]
+            payload = {"version": CACHE_VERSION, "namespace": namespace, "rows": rows}
+            self._dirty = False
+        from nanometa_live.core.utils.atomic_write import atomic_write_text
+        try:
+            atomic_write_text(self.path, json.dumps(payload, separators=(",", ":")))
+            return True
+        except OSError as e:
+            logger.debug("Could not write match cache %s: %s", self.path, e)
+            return False
+
+    def _read(self, namespace: str) -> Dict[Tuple[Any, str], Resolution]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                data = json.load(fh)
+            if (data.get("version") != CACHE_VERSION
+                    or data.get("namespace") != namespace):
+                return {}
+            return {(taxid, name): (key, float(score), method)
+                    for taxid, name, key, score, method in data.get("rows", [])}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.debug("Ignoring unreadable match cache %s: %s", self.path, e)
+            return {}
+
+
+_caches: Dict[Tuple[str, str], MatchCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_match_cache(db_hash: str = "") -> MatchCache:
+    """The process-wide cache for a database (memory-only without a hash)."""
+    mappings_dir = ""
+    if db_hash:
+        from nanometa_live.core.utils.paths import get_mappings_dir_from_env
+        mappings_dir = get_mappings_dir_from_env()
+    key = (db_hash, mappings_dir)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            path = (Path(mappings_dir) / f"{db_hash}_match_cache.json"
+                    if db_hash else None)
+            cache = _caches[key] = MatchCache(path)
+        return cache
+
+
+def clear_match_caches() -> None:
+    """Forget every in-memory cache (files on disk are left alone)."""
+    with _caches_lock:
+        _caches.clear()
+    with _signature_lock:
+        _signature_memo.clear()
+
+
+def match_cache_stats() -> Dict[str, int]:
+    """Hits, misses and rows summed over every database's cache."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    return {
+        "hits": sum(c.hits for c in caches),
+        "misses": sum(c.misses for c in caches),
+        "entries": sum(len(c) for c in caches),
+    }
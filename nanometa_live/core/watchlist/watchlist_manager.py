@@ -69,6 +69,11 @@ def _get_taxonomy_matcher():
         return _taxonomy_matcher
 
 
+def _database_hash_of(mapping_collection: Any) -> str:
+    db_hash = getattr(mapping_collection, "database_hash", "")
+    return db_hash if isinstance(db_hash, str) else ""
+
+
 def _get_watchlist_loader():
     """Lazy import of WatchlistLoader (thread-safe)."""
     global _watchlist_loader
@@ -1074,9 +1079,10 @@ class WatchlistManager:
 
         Covers every entry field (dataclass repr), so any edit -- toggle,
         threshold, alt names, threat level, db_taxid -- yields a new value.
-        Keys the entry-match index and the dashboard's pathogen-check memo;
-        being content-derived, a missed invalidation hook cannot serve
-        stale results.
+        Keys the entry-match index, the persistent match cache
+        (``core.watchlist.match_cache``) and the dashboard's pathogen-check
+        memo; being content-derived, a missed invalidation hook cannot
+        serve stale results.
         """
         if active_entries is None:
             active_entries = self.get_active_entries()
@@ -1128,39 +1134,86 @@ class WatchlistManager:
         # but ignored by live detection -- the three disagreed.
         db_to_ncbi = self._build_db_taxid_index(active_entries, None)
 
-        for organism in detected_organisms:
-            taxid = organism.get("taxid")
-            name = organism.get("name", "").strip()
-            reads = organism.get("reads", 0)
-
-            # Try to find matching entry using multi-taxonomy matching
-            entry = None
-            best_score = 0.0
-
+        def resolve(taxid, name):
             if taxid and taxid in db_to_ncbi:
                 entry = active_entries.get(db_to_ncbi[taxid][0])
-                best_score = 1.0 if entry else 0.0
-            if entry is None and db_is_ncbi and taxid and taxid in active_entries:
-                entry = active_entries[taxid]
-                best_score = 1.0
-            if entry is None:
-                # Name-based matching against the prebuilt index; equivalent
-                # to looping match_organism over every entry (max score wins,
-                # first entry wins ties) at O(1) instead of O(entries).
-                entry, best_score = matcher.match_row_indexed(
-                    organism.get("name", ""), match_index)
-
+                if entry is not None:
+                    return entry, 1.0, None
+            if db_is_ncbi and taxid and taxid in active_entries:
+                return active_entries[taxid], 1.0, None
+            # Name-based matching against the prebuilt index; equivalent
+            # to looping match_organism over every entry (max score wins,
+            # first entry wins ties) at O(1) instead of O(entries).
+            entry, score = matcher.match_row_indexed(name, match_index)
+            return entry, score, None
+
+        namespace = f"standard|{self.watchlist_signature(active_entries)}|{db_is_ncbi}"
+        for organism, entry, best_score, _ in self._resolve_organisms(
+                detected_organisms, active_entries, namespace, resolve,
+                self._current_database_hash()):
             # 0.7 is the NAME-match floor; alert_threshold then decides which
             # side of the fence the hit lands on. Both sides are real matches
             # -- see check_organisms_with_mapping for why sub-threshold hits
             # are returned rather than dropped.
             if entry and best_score >= 0.7:
+                reads = organism.get("reads", 0)
                 (above if reads >= entry.alert_threshold else below).append(
-                    self._alert_dict(entry, organism, taxid, best_score,
-                                     db_to_ncbi, active_entries))
+                    self._alert_dict(entry, organism, organism.get("taxid"),
+                                     best_score, db_to_ncbi, active_entries))
 
         return self._finalise_alerts(above), self._finalise_alerts(below)
 
+    @staticmethod
+    def _current_database_hash() -> str:
+        """Hash of the database the loaded mapping collection describes."""
+        try:
+            from nanometa_live.core.taxonomy.taxid_mapping import (
+                get_mapping_collection,
+            )
+            return _database_hash_of(get_mapping_collection())
+        except ImportError:
+            return ""
+
+    @staticmethod
+    def _resolve_organisms(
+        detected_organisms: List[Dict[str, Any]],
+        active_entries: Dict[int, WatchlistEntry],
+        namespace: str,
+        resolve,
+        db_hash: str,
+    ) -> List[Tuple[Dict[str, Any], Optional[WatchlistEntry], float, Optional[str]]]:
+        """``(organism, entry, score, method)`` per organism, via the match cache.
+
+        ``resolve(taxid, name)`` runs only for a ``(taxid, name)`` not yet
+        seen under ``namespace``, which must cover everything ``resolve``
+        reads besides its arguments. See ``core.watchlist.match_cache``.
+        """
+        from nanometa_live.core.watchlist.match_cache import get_match_cache
+
+        cache = get_match_cache(db_hash)
+        cache.bind(namespace)
+        keys: Optional[Dict[int, Any]] = None
+        resolved = []
+        for organism in detected_organisms:
+            taxid = organism.get("taxid")
+            name = organism.get("name", "")
+            hit = cache.get(namespace, taxid, name)
+            if hit is not None:
+                key, score, method = hit
+                entry = active_entries.get(key) if key is not None else None
+                if key is None or entry is not None:
+                    resolved.append((organism, entry, score, method))
+                    continue
+            entry, score, method = resolve(taxid, name)
+            if keys is None:
+                keys = {id(e): k for k, e in active_entries.items()}
+            key = keys.get(id(entry)) if entry is not None else None
+            if entry is None or key is not None:
+                cache.put(namespace, taxid, name, (key, score, method))
+            resolved.append((organism, entry, score, method))
+        cache.flush()
+        return resolved
+
     def _alert_dict(
         self,
         entry: WatchlistEntry,
@@ -2100,45 +2153,37 @@ class WatchlistManager:
         # False is the safe default rather than True. Loop-invariant.
         db_is_ncbi = bool(mapping_collection.profile.taxids_are_ncbi)
 
-        for organism in detected_organisms:
-            detected_taxid = organism.get("taxid")
-            name = organism.get("name", "").strip()
-            reads = organism.get("reads", 0)
-
-            entry = None
-            best_score = 0.0
-            match_method = "none"
-
+        def resolve(detected_taxid, name):
             # 1. First, try direct NCBI taxid match.
             if db_is_ncbi and detected_taxid and detected_taxid in active_entries:
-                entry = active_entries[detected_taxid]
-                best_score = 1.0
-                match_method = "direct_ncbi"
-
+                return active_entries[detected_taxid], 1.0, "direct_ncbi"
             # 2. Try reverse mapping from database taxid to NCBI taxid
-            if not entry and detected_taxid and detected_taxid in db_to_ncbi:
+            if detected_taxid and detected_taxid in db_to_ncbi:
                 hit = self._reverse_mapping_hit(
                     detected_taxid, db_to_ncbi, active_entries,
                     mapping_collection)
                 if hit is not None:
-                    entry, best_score = hit
-                    match_method = "taxid_mapping"
-
+                    return hit[0], hit[1], "taxid_mapping"
             # 3. Fall back to name-based matching against the prebuilt
             #    index; equivalent to looping match_organism over every
             #    entry (max score wins, first entry wins ties).
-            if not entry:
-                m_entry, m_score = matcher.match_row_indexed(
-                    organism.get("name", ""), match_index)
-                if m_entry is not None:
-                    entry, best_score = m_entry, m_score
-                    match_method = "name_matching"
-
+            m_entry, m_score = matcher.match_row_indexed(name, match_index)
+            if m_entry is not None:
+                return m_entry, m_score, "name_matching"
+            return None, 0.0, "none"
+
+        from nanometa_live.core.watchlist.match_cache import mapping_signature
+        namespace = (f"mapping|{self.watchlist_signature(active_entries)}|"
+                     f"{mapping_signature(mapping_collection)}")
+        for organism, entry, best_score, match_method in self._resolve_organisms(
+                detected_organisms, active_entries, namespace, resolve,
+                _database_hash_of(mapping_collection)):
             # Threshold decides which side of the fence a match lands on;
             # both sides are real matches.
             if entry and best_score >= 0.7:
+                reads = organism.get("reads", 0)
                 (above if reads >= entry.alert_threshold else below).append(
-                    self._alert_dict(entry, organism, detected_taxid,
+                    self._alert_dict(entry, organism, organism.get("taxid"),
                                      best_score, db_to_ncbi, active_entries,
                                      match_method=match_method))
 
@@ -723,7 +723,7 @@ class BackendManager:
             self.status["last_update"] = time.time()
 
         # Start status monitoring thread
-        self.status_thread = threading.Thread(target=self._monitor_status, daemon=True)
+        self.status_thread = threading.Thread(target=self._monitor_status, name="backend-status-monitor", daemon=True)
         self.status_thread.start()
 
         logging.info(f"Backend started successfully with profile: {profile}")
@@ -908,56 +908,28 @@ class BackendManager:
         remaining = int(int(timeout_minutes) * 60 - elapsed)
         return max(0, remaining)
 
-    # TTL for the cached file count below. Each interval tick on the
-    # dashboard ends up calling _update_file_counts at least once; on a
-    # 24-barcode multiplex run that means 25 os.listdir calls per tick
-    # (root + 24 barcode subdirs) for a quantity that does not change
-    # meaningfully between ticks. Caching for 5 seconds reduces this
-    # to one scan per ~5 ticks at the default 30 s interval, while
-    # still picking up newly arrived files within one cycle of the
-    # human-perceptible "files waiting" indicator. Closes P1-T09 from
-    # docs/audit-2026-04-28-throughput-gui.md.
-    _FILE_COUNT_TTL_SECONDS = 5.0
-
     def _update_file_counts(self):
-        """Update the file processing counts from the file system."""
-        try:
-            now = time.time()
-            cached_at = getattr(self, "_file_count_cached_at", 0.0)
-            if (now - cached_at) < self._FILE_COUNT_TTL_SECONDS:
-                cached = getattr(self, "_file_count_cached_value", None)
-                if cached is not None:
-                    self.status["files_waiting"] = cached
-                    return
+        """Update the input-file counters from the ingest tracker.
 
+        The tracker lists the input tree once, then keeps per-sample counts
+        of files, bytes and estimated reads up to date from filesystem
+        events or by re-listing only the directories that changed (see
+        core.utils.ingest_tracker). Reading them here is O(1) per tick
+        instead of one listdir per barcode directory.
+        """
+        try:
             nanopore_dir = self.config.get("nanopore_output_directory", "")
+            if not nanopore_dir or not os.path.isdir(nanopore_dir):
+                self.status["files_waiting"] = 0
+                return
+            from nanometa_live.core.utils.ingest_tracker import get_ingest_tracker
+            snap = get_ingest_tracker(nanopore_dir).refresh()
 
-            # Count files in nanopore directory (including barcode subdirs)
-            waiting_files = 0
-            extensions = (".fastq", ".fastq.gz", ".fq", ".fq.gz")
-            if os.path.exists(nanopore_dir):
-                for f in os.listdir(nanopore_dir):
-                    if f.endswith(extensions):
-                        waiting_files += 1
-                # Also count files in per-sample subdirectories. The
-                # canonical detector accepts conventional barcode<NN>
-                # plus custom-named subdirs (Turex/, Zymo/, ...) so
-                # this counter stays accurate for non-multiplex
-                # layouts that still use by_barcode mode.
-                from nanometa_live.core.utils.auto_detect import find_sample_subdirs
-                for sample_dir in find_sample_subdirs(nanopore_dir):
-                    try:
-                        for f in os.listdir(str(sample_dir)):
-                            if f.endswith(extensions):
-                                waiting_files += 1
-                    except OSError:
-                        continue
-
-            # Update status with waiting files
             # Processed files comes from workflow_manager status
-            self.status["files_waiting"] = waiting_files
-            self._file_count_cached_value = waiting_files
-            self._file_count_cached_at = now
+            self.status["files_waiting"] = snap.files
+            self.status["input_bytes"] = snap.bytes
+            self.status["input_reads_estimated"] = snap.estimated_reads
+            self.status["input_last_arrival"] = snap.last_arrival
 
         except (FileNotFoundError, PermissionError, OSError) as e:
             logging.exception(f"Error updating file counts: {e}")
@@ -1017,6 +989,11 @@ class BackendManager:
                     last_progress_time = time.time()
                     if running_now > 0 or finished_count > 0:
                         pipeline_has_worked = True
+                # Reads still arriving from MinKNOW also mean the run is
+                # live, even between pipeline batches (ingest tracker).
+                arrival = self.status.get("input_last_arrival")
+                if arrival and arrival > last_progress_time:
+                    last_progress_time = arrival
 
                 # Check realtime timeout (inactivity-based, once work has begun)
                 if timeout_seconds is not None and pipeline_has_worked:
@@ -191,6 +191,29 @@ _BUNDLED_NXF_PLUGINS_DIRNAME = "nextflow_plugins"
 # not import "successfully" while silently dropping required data.
 _SUPPORTED_MANIFEST_VERSIONS = {"1.0", "1.1"}
 
+# Taxonomy-cache entry directories and bookkeeping, shipped as the packed
+# snapshot rather than copied file by file -- unless the pack cannot be
+# written, when _copy_cache_entries ships them the old way.
+_CACHE_ENTRY_NAMES = ("gtdb", "ncbi", "species", "cache_metadata.json",
+                      ".snapshot_import.json")
+
+
+def _copy_cache_entries(src: Path, dst: Path) -> None:
+    """Copy the taxonomy cache's per-entry files (the pack export fallback).
+
+    The in-progress import marker is left behind: it describes an import
+    on this machine, not the entries.
+    """
+    for name in _CACHE_ENTRY_NAMES:
+        path = src / name
+        if name == ".snapshot_import.json" or not path.exists():
+            continue
+        if path.is_dir():
+            shutil.copytree(path, dst / name, dirs_exist_ok=True)
+        else:
+            dst.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, dst / name)
+
 # Home subdirectories copied into a bundle, used by estimate_bundle_size for the
 # pre-export disk-space preflight. The big ones are genomes and blast.
 _BUNDLE_SOURCE_DIRS = ("genomes", "blast", "mappings", "cache",
@@ -699,13 +722,16 @@ class BundleManager:
                 from nanometa_live.core.taxonomy.taxid_mapping import get_database_hash
                 manifest["db_hash"] = get_database_hash(db_path)
 
-            # Copy directories
+            # Copy directories. The taxonomy cache's per-entry files travel
+            # in the packed snapshot exported below, not one file each.
             dirs_to_copy = ["genomes", "blast", "mappings", "cache"]
             for dirname in dirs_to_copy:
                 src = home / dirname
                 if src.exists():
                     dst = staging / dirname
-                    shutil.copytree(src, dst)
+                    ignore = (shutil.ignore_patterns(*_CACHE_ENTRY_NAMES)
+                              if dirname == "cache" else None)
+                    shutil.copytree(src, dst, ignore=ignore)
 
             # Copy watchlists (include actual YAML files, not just references).
             # Under --project-dir the GUI writes uploads to
@@ -742,16 +768,22 @@ class BundleManager:
                 shutil.copytree(containers_dir, staging / "containers")
 
             # Export taxonomy snapshot
+            snapshot_path = staging / "cache" / "taxonomy_snapshot.nmpack"
+            exported = 0
             try:
                 from nanometa_live.core.utils.offline_cache import OfflineTaxonomyCache
-                cache = OfflineTaxonomyCache()
-                snapshot_path = staging / "cache" / "taxonomy_snapshot.json"
+                cache = OfflineTaxonomyCache(cache_dir=str(home / "cache"))
                 snapshot_path.parent.mkdir(parents=True, exist_ok=True)
                 exported = cache.export_snapshot(str(snapshot_path))
                 if exported > 0:
                     logger.info(f"Exported {exported} taxonomy cache entries to bundle")
             except (ImportError, AttributeError, OSError, json.JSONDecodeError) as e:
                 logger.warning(f"Could not export taxonomy snapshot: {e}")
+            if exported <= 0:
+                # No pack (export failed, or nothing to pack): ship the entry
+                # files the cache copy above skipped, as older bundles did.
+                snapshot_path.unlink(missing_ok=True)
+                _copy_cache_entries(home / "cache", staging / "cache")
 
             # Template genome_metadata.json paths. Path-aware: any absolute
             # path that is NOT under the data home cannot be made portable and
@@ -1581,16 +1613,21 @@ class BundleManager:
                     "Imported watchlist_toggle_state.yaml from bundle"
                 )
 
-            # Import taxonomy snapshot
-            taxonomy_snapshot = tmp / "cache" / "taxonomy_snapshot.json"
-            if not taxonomy_snapshot.exists():
-                # Also check if it was extracted into the cache dir
-                taxonomy_snapshot = home / "cache" / "taxonomy_snapshot.json"
+            # Import taxonomy snapshot: the packed form, or the JSON one
+            # older bundles carry. Also check if it was extracted into the
+            # cache dir.
+            taxonomy_snapshot = next(
+                (folder / name
+                 for folder in (tmp / "cache", home / "cache")
+                 for name in ("taxonomy_snapshot.nmpack", "taxonomy_snapshot.json")
+                 if (folder / name).exists()),
+                None,
+            )
 
-            if taxonomy_snapshot.exists():
+            if taxonomy_snapshot is not None:
                 try:
                     from nanometa_live.core.utils.offline_cache import OfflineTaxonomyCache
-                    cache = OfflineTaxonomyCache()
+                    cache = OfflineTaxonomyCache(cache_dir=str(home / "cache"))
                     loaded = cache.load_snapshot(str(taxonomy_snapshot))
                     logger.info(f"Loaded {loaded} taxonomy entries from bundle snapshot")
                 except (ImportError, AttributeError, OSError, json.JSONDecodeError) as e:
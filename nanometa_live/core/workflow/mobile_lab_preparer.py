@@ -274,6 +274,7 @@ class MobileLabPreparer:
         manager = get_genome_manager(
             self.config.get("genome_cache_dir") or str(self.home),
             offline_mode=offline,
+            blast_db_mode=self.config.get("blast_db_mode"),
         )
         entries = self._get_watchlist_entries()
         if not entries:
@@ -350,10 +351,14 @@ class MobileLabPreparer:
         manager = get_genome_manager(
             self.config.get("genome_cache_dir") or str(self.home),
             offline_mode=bool(self.config.get("offline_mode", False)),
+            blast_db_mode=self.config.get("blast_db_mode"),
         )
         self._report(PrepStage.BUILD_BLAST_DBS, idx,
                      "Building missing BLAST databases", 30.0)
-        report = manager.build_missing_blast_dbs_detailed(retry=True)
+        report = manager.build_missing_blast_dbs_detailed(
+            retry=True,
+            consolidated=self.config.get("blast_db_mode") == "consolidated",
+        )
         result.blast_dbs_built = report["built"]
         result.blast_dbs_present = report["already_present"]
         result.blast_dbs_failed = report["failed"]
@@ -375,7 +380,7 @@ class MobileLabPreparer:
         try:
             from nanometa_live.core.utils.offline_cache import OfflineTaxonomyCache
             cache = OfflineTaxonomyCache()
-            snapshot_path = str(self.home / "cache" / "taxonomy_snapshot.json")
+            snapshot_path = str(self.home / "cache" / "taxonomy_snapshot.nmpack")
             count = cache.export_snapshot(snapshot_path)
             logger.info(f"Exported {count} taxonomy cache entries")
         except (ImportError, AttributeError, FileNotFoundError, PermissionError, OSError, TypeError, ValueError) as e:
@@ -625,6 +625,7 @@ class NextflowManager:
                 threading.Thread(
                     target=self._run_workflow,
                     args=(cmd, self._run_config),
+                    name="nextflow-runner",
                     daemon=True
                 ).start()
 
@@ -853,6 +854,7 @@ class NextflowManager:
                 # Start monitoring thread
                 self.monitor_thread = threading.Thread(
                     target=self._monitor_status,
+                    name="nextflow-monitor",
                     daemon=True
                 )
                 self.monitor_thread.start()
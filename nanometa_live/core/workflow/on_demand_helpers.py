@@ -133,6 +133,74 @@ def write_failure_log(
         logger.warning(f"Could not write on-demand failure log: {write_err}")
 
 
+def launch_validation_run(
+    cmd: List[str],
+    launch_dir: Path,
+    env: Dict[str, str],
+    timeout_seconds: int,
+    results_dir: Path,
+) -> bool:
+    """Run one ``nextflow run`` validation launch to completion.
+
+    True on a zero exit. A timeout, a non-zero exit or a failed launch is
+    logged to ``<results>/logs/`` (``write_failure_log``) and returns False.
+    """
+    import traceback
+
+    try:
+        logger.info(f"Running nanometanf validation: {' '.join(cmd)}")
+        # start_new_session=True puts nextflow and everything it spawns
+        # (task scripts, Docker/singularity containers) in its own
+        # process group, mirroring NextflowManager._run_workflow's main
+        # pipeline launch. Without it, subprocess.run's own timeout
+        # handling only killed the top-level `nextflow` PID on
+        # TimeoutExpired -- its already-launched work kept running as an
+        # orphan, invisibly consuming CPU/RAM/disk on the field laptop
+        # while the GUI reported a clean timeout.
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=env,
+            cwd=str(launch_dir),
+            start_new_session=True,
+        )
+        supervised = supervise_validation_process(proc, timeout_seconds)
+        if supervised is None:
+            write_failure_log(
+                results_dir, cmd, launch_dir,
+                f"timed out after {timeout_seconds} seconds\n",
+            )
+            return False
+        returncode, stdout, stderr = supervised
+        if returncode != 0:
+            logger.error(f"nanometanf validation failed: {stderr}")
+            write_failure_log(
+                results_dir, cmd, launch_dir,
+                f"exit code: {returncode}\n"
+                f"--- stdout ---\n{stdout or ''}\n"
+                f"--- stderr ---\n{stderr or ''}\n"
+            )
+            return False
+        return True
+    except FileNotFoundError as e:
+        logger.warning("nextflow not found in PATH")
+        write_failure_log(
+            results_dir, cmd, launch_dir,
+            f"launch failed (nextflow not found in PATH?): {e}\n"
+            f"PATH: {env.get('PATH', '')}\n",
+        )
+        return False
+    except (subprocess.CalledProcessError, PermissionError, OSError) as e:
+        logger.exception(f"nanometanf validation error: {e}")
+        write_failure_log(
+            results_dir, cmd, launch_dir,
+            "unexpected error:\n" + traceback.format_exc(),
+        )
+        return False
+
+
 def _genome_file_looks_valid(path: Path) -> bool:
     """Cheap sanity check that ``path`` is a non-empty FASTA file.
 
@@ -184,3 +252,52 @@ def _pick_result_for_method(results: list, method: str):
             if getattr(r, "validation_method", None) == m:
                 return r
     return ranked[0]
+
+
+def resolve_pipeline_source(config: Dict[str, Any]) -> str:
+    """The ``nextflow run`` target for an on-demand validation launch.
+
+    An explicit ``pipeline_source`` wins; otherwise the local checkout or
+    the remote repository at ``pipeline_branch``, as the Configuration tab
+    selects.
+    """
+    pipeline_source = config.get("pipeline_source", "")
+    if pipeline_source:
+        return pipeline_source
+    if config.get("pipeline_source_type", "remote") == "local":
+        return config.get("pipeline_local_path", "")
+    branch = config.get("pipeline_branch", "master")
+    return f"FOI-Bioinformatics/nanometanf -r {branch}"
+
+
+def parse_nanometanf_result(parser, taxid: int, name: str, sample: str, method: str):
+    """One target's on-demand ``ValidationResult`` from a finished run, or None.
+
+    An aggregate-scope request ("all") must not be used as a literal sample
+    name -- see ``_normalise_sample_filter``. ``get_validation_results``
+    filters by (sample, taxid) but NOT by method, so the result matching the
+    requested method is picked (``_pick_result_for_method``).
+    """
+    from nanometa_live.core.workflow.validation_models import ValidationResult
+
+    results = parser.get_validation_results(
+        sample=_normalise_sample_filter(sample), taxid=taxid
+    )
+    if not results:
+        logger.warning(
+            "No validation results found in nanometanf output for taxid %s", taxid)
+        return None
+    r = _pick_result_for_method(results, method)
+    return ValidationResult(
+        taxid=taxid,
+        name=name,
+        sample=sample,
+        total_classified_reads=r.total_reads,
+        extracted_reads=r.total_reads,
+        validated_reads=r.validated_reads,
+        validation_rate=r.percent_validated,
+        avg_identity=r.percent_identity_mean,
+        min_identity=r.percent_identity_min,
+        max_identity=r.percent_identity_max,
+        success=True,
+    )
@@ -32,11 +32,12 @@ from nanometa_live.core.workflow.on_demand_helpers import (
     _DEFAULT_VALIDATION_TIMEOUT_MINUTES,
     _genome_file_looks_valid,
     _is_int_str,
-    _normalise_sample_filter,
     _pick_result_for_method,
     _validation_timeout_seconds,
+    launch_validation_run,
+    parse_nanometanf_result,
     resolve_launch_context,
-    supervise_validation_process,
+    resolve_pipeline_source,
     write_failure_log,
 )
 from nanometa_live.core.workflow.validation_models import (
@@ -145,8 +146,8 @@ class OnDemandValidator:
 
     def has_blast_db(self, taxid: int) -> bool:
         """Check if a BLAST database exists for a taxid."""
-        blast_db = self.blast_dir / f"{taxid}.fasta.nhr"
-        return blast_db.exists()
+        blast_db = self.blast_dir / f"{taxid}.fasta"
+        return Path(f"{blast_db}.nhr").exists() or Path(f"{blast_db}.nal").exists()
 
     def download_genome(
         self,
@@ -310,75 +311,53 @@ class OnDemandValidator:
             logger.exception(f"Failed to write pathogen genomes JSON: {e}")
             return None, {}
 
-    def validate_via_nanometanf(
+    def _validation_genome(
         self,
         taxid: int,
         name: str,
-        sample: str,
-        method: str = "blast",
-        config: Optional[Dict[str, Any]] = None,
-        progress_callback: Optional[Callable[[str, int], None]] = None
-    ) -> Optional[ValidationResult]:
-        """
-        Run validation by delegating to nanometanf validation-only entry point.
-
-        Cumulative + resume-friendly: each call appends ``taxid`` to a
-        single ``pathogen_genomes.json`` (kept under ``self.validation_dir``)
-        and invokes ``nextflow run -resume`` against the main pipeline's
-        outdir. Nextflow's per-(sample, taxid) work cache means previously-
-        validated pairs are skipped and only the newly-added taxid actually
-        runs through EXTRACT_READS_BY_TAXID + BLASTN_VALIDATION /
-        MINIMAP2_VALIDATION. AGGREGATE_VALIDATION_RESULTS rebuilds the
-        validation_results.json over the full taxid set.
-
-        Args:
-            taxid: Taxonomy ID
-            name: Species name
-            sample: Sample name
-            method: 'blast', 'minimap2', or 'both'
-            config: App configuration dict (for pipeline source, profile, etc.)
-            progress_callback: Optional callback(message, percent)
-
-        Returns:
-            ValidationResult or None if nanometanf is unavailable
-        """
-        if progress_callback:
-            progress_callback("Preparing nanometanf validation...", 5)
-
-        config = config or {}
-
-        # Determine pipeline source
-        pipeline_source = config.get("pipeline_source", "")
-        # Default profile is conda; the operator's environment is built
-        # via the conda profile per the project's nf-core convention.
-        pipeline_profile = config.get("pipeline_profile", "conda")
-
-        if not pipeline_source:
-            # Try to get from pipeline source config
-            source_type = config.get("pipeline_source_type", "remote")
-            if source_type == "local":
-                pipeline_source = config.get("pipeline_local_path", "")
-            else:
-                branch = config.get("pipeline_branch", "master")
-                pipeline_source = f"FOI-Bioinformatics/nanometanf -r {branch}"
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+    ) -> Optional[Path]:
+        """The taxid's genome FASTA, downloaded if missing, or None."""
+        if not self.has_genome(taxid):
+            if progress_callback:
+                progress_callback(f"Downloading genome for {name}...", 10)
+            if not self.download_genome(taxid, name):
+                return None
 
-        if not pipeline_source:
-            logger.warning("No pipeline source configured for nanometanf delegation")
+        # Integrity gate: a zero-byte or non-FASTA genome passes has_genome()
+        # (it only tests existence) but makes the Nextflow validation fail
+        # opaquely downstream. Reject it here with a clear log instead.
+        genome_fasta = self.genomes_dir / f"{taxid}.fasta"
+        if not _genome_file_looks_valid(genome_fasta):
+            logger.error(
+                "Genome file for taxid %s is missing, empty, or not FASTA: %s",
+                taxid, genome_fasta,
+            )
             return None
-
-        # Validation reads the ORIGINAL FASTQ files; the results directory is
-        # not a substitute. The command below used to fall back to it when
-        # input_dir was unset, which pointed --reads_dir at a directory with
-        # no FASTQs -- the pipeline then found nothing and, before its own
-        # guards existed, reported success having validated nothing. Refuse
-        # here instead, where the message can reach the operator.
+        return genome_fasta
+
+    def validation_queue(self):
+        """The cross-process request queue shared by this results dir."""
+        from nanometa_live.core.workflow.validation_queue import ValidationQueue
+        return ValidationQueue(self.validation_dir)
+
+    def _input_dir_usable(self) -> bool:
+        """Whether the original FASTQ directory is configured and present.
+
+        Validation reads the ORIGINAL FASTQ files; the results directory is
+        not a substitute. The command used to fall back to it when
+        input_dir was unset, which pointed --reads_dir at a directory with
+        no FASTQs -- the pipeline then found nothing and, before its own
+        guards existed, reported success having validated nothing. Refuse
+        here instead, where the message can reach the operator.
+        """
         if not self.input_dir:
             logger.error(
                 "On-demand validation needs the original FASTQ directory, but "
                 "no input directory is configured. Set the Nanopore sequence "
                 "data folder in the Configuration tab and try again."
             )
-            return None
+            return False
         if not self.input_dir.exists():
             logger.error(
                 "On-demand validation input directory does not exist: %s. "
@@ -386,58 +365,51 @@ class OnDemandValidator:
                 "against them.",
                 self.input_dir,
             )
-            return None
-
-        # Ensure genome is available
-        if not self.has_genome(taxid):
-            if progress_callback:
-                progress_callback(f"Downloading genome for {name}...", 10)
-            genome_path = self.download_genome(taxid, name)
-            if not genome_path:
-                return None
+            return False
+        return True
 
-        # Integrity gate: a zero-byte or non-FASTA genome passes has_genome()
-        # (it only tests existence) but makes the Nextflow validation fail
-        # opaquely downstream. Reject it here with a clear log instead.
-        genome_fasta = self.genomes_dir / f"{taxid}.fasta"
-        if not _genome_file_looks_valid(genome_fasta):
-            logger.error(
-                "Genome file for taxid %s is missing, empty, or not FASTA: %s",
-                taxid, genome_fasta,
+    def _register_validation_genomes(
+        self,
+        targets: List[Tuple[int, str, str]],
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+    ) -> Tuple[List[int], Optional[Path], Dict[str, str]]:
+        """Append each target's taxid to the cumulative pathogen_genomes mapping.
+
+        Preserves prior taxids so Nextflow's resume cache reuses their
+        work; only the new (sample, taxid) pairs run end-to-end. Locked
+        (see _add_taxid_to_pathogen_genomes) so a concurrent on-demand
+        request from another tab/operator cannot lose an addition to a
+        read-modify-write race.
+
+        Returns ``(indexes of targets with a usable genome, mapping file,
+        mapping)``. A failed write fails every target: the run must not go
+        ahead with a taxid list that was never persisted.
+        """
+        ready: List[int] = []
+        genomes_json_path, mapping = None, {}
+        for i, (taxid, name, _sample) in enumerate(targets):
+            genome_fasta = self._validation_genome(taxid, name, progress_callback)
+            if genome_fasta is None:
+                continue
+            genomes_json_path, mapping = self._add_taxid_to_pathogen_genomes(
+                taxid, genome_fasta
             )
-            return None
-
-        # Append the new taxid to the cumulative pathogen_genomes mapping.
-        # Preserves prior taxids so Nextflow's resume cache reuses their
-        # work; only the new (sample, taxid) pair runs end-to-end. Locked
-        # (see _add_taxid_to_pathogen_genomes) so a concurrent on-demand
-        # request from another tab/operator cannot lose this addition to a
-        # read-modify-write race.
-        genomes_json_path, mapping = self._add_taxid_to_pathogen_genomes(
-            taxid, genome_fasta
-        )
-        if genomes_json_path is None:
-            return None
+            if genomes_json_path is None:
+                return [], None, {}
+            ready.append(i)
+        return ready, genomes_json_path, mapping
 
-        # Comma-separated list of every taxid currently mapped. Nextflow
-        # filters to this set in the validation subworkflow; passing the
-        # whole list is what lets resume keep caches for previously-run
-        # pairs while still adding the new taxid.
-        taxids_to_validate = ",".join(sorted(mapping.keys(), key=int))
-
-        if progress_callback:
-            progress_callback("Launching nanometanf validation...", 20)
-
-        # -resume needs the main run's launch dir + work dir; see
-        # resolve_launch_context for why sharing only the outdir shares
-        # nothing -resume reads.
-        launch_context = resolve_launch_context(config)
-        if launch_context is None:
-            return None
-        launch_dir, work_dir = launch_context
-
-        outdir = self.results_dir
-        cmd = [
+    def _nanometanf_command(
+        self,
+        pipeline_source: str,
+        pipeline_profile: str,
+        method: str,
+        work_dir: Path,
+        genomes_json_path: Path,
+        taxids_to_validate: str,
+    ) -> List[str]:
+        """The validation-only ``nextflow run -resume`` command line."""
+        return [
             "nextflow", "run", pipeline_source,
             "-resume",
             "-work-dir", str(work_dir),
@@ -448,108 +420,107 @@ class OnDemandValidator:
             "--validation_method", method,
             "--pathogen_genomes", str(genomes_json_path),
             "--taxids_to_validate", taxids_to_validate,
-            "--outdir", str(outdir),
+            "--outdir", str(self.results_dir),
             "-profile", pipeline_profile,
         ]
 
-        # Timeout is operator-configurable: large reference genomes or slow
-        # I/O can need more than the historical hardcoded 30 minutes.
-        timeout_seconds = _validation_timeout_seconds(config)
+    def validate_via_nanometanf(
+        self,
+        taxid: int,
+        name: str,
+        sample: str,
+        method: str = "blast",
+        config: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[str, int], None]] = None
+    ) -> Optional[ValidationResult]:
+        """Run validation by delegating to nanometanf validation-only entry point.
 
-        # Every offline guarantee lives in this env (NXF_OFFLINE, the
-        # plugin path, the container cache dirs); launching without it
-        # reached the registries on an air-gapped machine.
-        env = NextflowManager._build_nextflow_env(config)
+        A batch of one (see :meth:`validate_batch_via_nanometanf`). Returns
+        the ValidationResult, or None if nanometanf is unavailable or failed.
+        """
+        return self.validate_batch_via_nanometanf(
+            [(taxid, name, sample)], method, config, progress_callback)[0]
 
-        try:
-            logger.info(f"Running nanometanf validation: {' '.join(cmd)}")
-            # start_new_session=True puts nextflow and everything it spawns
-            # (task scripts, Docker/singularity containers) in its own
-            # process group, mirroring NextflowManager._run_workflow's main
-            # pipeline launch. Without it, subprocess.run's own timeout
-            # handling only killed the top-level `nextflow` PID on
-            # TimeoutExpired -- its already-launched work kept running as an
-            # orphan, invisibly consuming CPU/RAM/disk on the field laptop
-            # while the GUI reported a clean timeout.
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                env=env,
-                cwd=str(launch_dir),
-                start_new_session=True,
-            )
-            supervised = supervise_validation_process(proc, timeout_seconds)
-            if supervised is None:
-                write_failure_log(
-                    self.results_dir, cmd, launch_dir,
-                    f"timed out after {timeout_seconds} seconds\n",
-                )
-                return None
-            returncode, stdout, stderr = supervised
-
-            if returncode != 0:
-                logger.error(f"nanometanf validation failed: {stderr}")
-                write_failure_log(
-                    self.results_dir, cmd, launch_dir,
-                    f"exit code: {returncode}\n"
-                    f"--- stdout ---\n{stdout or ''}\n"
-                    f"--- stderr ---\n{stderr or ''}\n"
-                )
-                return None
+    def validate_batch_via_nanometanf(
+        self,
+        targets: List[Tuple[int, str, str]],
+        method: str = "blast",
+        config: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[str, int], None]] = None
+    ) -> List[Optional[ValidationResult]]:
+        """
+        Validate several ``(taxid, name, sample)`` targets in ONE Nextflow run.
+
+        Each target's taxid is appended to the cumulative
+        ``pathogen_genomes.json`` and one ``nextflow run -resume`` runs
+        against the main pipeline's outdir. The per-(sample, taxid) work
+        cache skips pairs validated before, and AGGREGATE_VALIDATION_RESULTS
+        rebuilds validation_results.json over the full taxid set, so every
+        target parses back from one file.
+
+        Returns one entry per target, in order: its ValidationResult, or
+        None when its genome was unusable, the run failed, or nanometanf
+        reported nothing for it.
+        """
+        results: List[Optional[ValidationResult]] = [None] * len(targets)
+        if progress_callback:
+            progress_callback("Preparing nanometanf validation...", 5)
 
-            if progress_callback:
-                progress_callback("Parsing validation results...", 90)
+        config = config or {}
+        pipeline_source = resolve_pipeline_source(config)
+        if not pipeline_source:
+            logger.warning("No pipeline source configured for nanometanf delegation")
+            return results
+        if not self._input_dir_usable():
+            return results
 
-            # Parse the output validation_results.json. An aggregate-scope
-            # request ("all") must not be used as a literal sample name --
-            # see _normalise_sample_filter.
-            from nanometa_live.core.parsers.blast_validation_parser import ValidationParser
-            parser = ValidationParser(str(outdir))
-            results = parser.get_validation_results(
-                sample=_normalise_sample_filter(sample), taxid=taxid
-            )
+        ready, genomes_json_path, mapping = self._register_validation_genomes(
+            targets, progress_callback)
+        if not ready:
+            return results
 
-            if results:
-                # get_validation_results filters by (sample, taxid) but NOT by
-                # method, so for a pair that already carried a result of the
-                # other method, results[0] may be the wrong one. Return the
-                # result matching the requested method.
-                r = _pick_result_for_method(results, method)
-                return ValidationResult(
-                    taxid=taxid,
-                    name=name,
-                    sample=sample,
-                    total_classified_reads=r.total_reads,
-                    extracted_reads=r.total_reads,
-                    validated_reads=r.validated_reads,
-                    validation_rate=r.percent_validated,
-                    avg_identity=r.percent_identity_mean,
-                    min_identity=r.percent_identity_min,
-                    max_identity=r.percent_identity_max,
-                    success=True,
-                )
+        # Every taxid currently mapped: passing the whole list is what lets
+        # resume keep caches for previously-run pairs.
+        taxids_to_validate = ",".join(sorted(mapping.keys(), key=int))
 
-            logger.warning("No validation results found in nanometanf output")
-            return None
+        if progress_callback:
+            progress_callback("Launching nanometanf validation...", 20)
 
-        except FileNotFoundError as e:
-            logger.warning("nextflow not found in PATH")
-            write_failure_log(
-                self.results_dir, cmd, launch_dir,
-                f"launch failed (nextflow not found in PATH?): {e}\n"
-                f"PATH: {env.get('PATH', '')}\n",
-            )
-            return None
-        except (subprocess.CalledProcessError, PermissionError, OSError,
-                ImportError, AttributeError, KeyError) as e:
+        # -resume needs the main run's launch dir + work dir (see
+        # resolve_launch_context), not just its outdir.
+        launch_context = resolve_launch_context(config)
+        if launch_context is None:
+            return results
+        launch_dir, work_dir = launch_context
+
+        # Default profile is conda, per the project's nf-core convention.
+        cmd = self._nanometanf_command(
+            pipeline_source, config.get("pipeline_profile", "conda"), method, work_dir,
+            genomes_json_path, taxids_to_validate)
+
+        # The timeout is operator-configurable (large genomes, slow I/O).
+        # Every offline guarantee lives in the env (NXF_OFFLINE, the plugin
+        # path, the container cache dirs); launching without it reached the
+        # registries on an air-gapped machine.
+        if not launch_validation_run(cmd, launch_dir,
+                                     NextflowManager._build_nextflow_env(config),
+                                     _validation_timeout_seconds(config),
+                                     self.results_dir):
+            return results
+        if progress_callback:
+            progress_callback("Parsing validation results...", 90)
+        try:
+            from nanometa_live.core.parsers.blast_validation_parser import ValidationParser
+            parser = ValidationParser(str(self.results_dir))
+            for i in ready:
+                results[i] = parse_nanometanf_result(parser, *targets[i], method)
+        except (PermissionError, OSError, ImportError, AttributeError, KeyError) as e:
             logger.exception(f"nanometanf validation error: {e}")
             write_failure_log(
                 self.results_dir, cmd, launch_dir,
                 "unexpected error:\n" + traceback.format_exc(),
             )
-            return None
+        return results
 
     def validate_organism(
         self,
@@ -559,6 +530,9 @@ class OnDemandValidator:
         method: str = "blast",
         progress_callback: Optional[Callable[[str, int], None]] = None,
         config: Optional[Dict[str, Any]] = None,
+        queue: Optional[Any] = None,
+        threat_level: Optional[str] = None,
+        request_id: Optional[str] = None,
     ) -> ValidationResult:
         """
         Run full on-demand validation for an organism via nanometanf.
@@ -567,10 +541,9 @@ class OnDemandValidator:
         run inside the pipeline with ``-resume`` -- previously-validated
         taxids are cached and only the new ``(sample, taxid)`` pair runs
         end-to-end. The legacy local-subprocess fallback was removed in
-        the 2026-05-07 audit pass: maintaining a parallel implementation
-        of the same validation logic was a bug source (drift from the
-        pipeline) and it required users to install blastn/minimap2/
-        samtools system-wide instead of letting conda do it.
+        the 2026-05-07 audit pass: a parallel implementation drifted from
+        the pipeline and needed blastn/minimap2/samtools installed
+        system-wide instead of via conda.
 
         Args:
             taxid: Taxonomy ID
@@ -583,12 +556,13 @@ class OnDemandValidator:
                 so the call can route through nanometanf. Validation now
                 requires the pipeline; configure it in the GUI's
                 Configuration tab before invoking on-demand validation.
+            queue: A ``ValidationQueue`` to coalesce this request with
+                others into one pipeline run; ``threat_level`` orders it
+                and ``request_id`` names a record submitted at click time.
 
         Returns:
             ValidationResult with validation statistics. Failure cases
-            (missing pipeline_source, nanometanf returned no result)
-            produce a ValidationResult with ``success=False`` and a
-            descriptive ``error_message`` rather than raising.
+            produce ``success=False`` and an ``error_message``, not a raise.
         """
         job_id = self._get_job_id(taxid, sample)
         job = ValidationJob(taxid=taxid, name=name, sample=sample)
@@ -604,22 +578,21 @@ class OnDemandValidator:
             job.error_message = error
             return self._create_failed_result(taxid, name, sample, error)
 
-        nf_result = self.validate_via_nanometanf(
-            taxid=taxid,
-            name=name,
-            sample=sample,
-            method=method,
-            config=config,
-            progress_callback=progress_callback,
-        )
+        if queue is not None:
+            nf_result = queue.validate(self, taxid, name, sample, method, config,
+                                       threat_level, progress_callback,
+                                       request_id=request_id)
+        else:
+            nf_result = self.validate_via_nanometanf(
+                taxid=taxid, name=name, sample=sample, method=method,
+                config=config, progress_callback=progress_callback,
+            )
         if nf_result is not None:
             self._complete_and_persist_job(job, nf_result, taxid, method)
             return nf_result
 
-        # nanometanf delegation returned None -- the pipeline run
-        # failed, the genome download failed, or another upstream
-        # condition. Surface a clean failure rather than silently
-        # falling back to a different code path.
+        # nanometanf delegation returned None (pipeline run or genome
+        # download failed). Surface a clean failure, never a fallback.
         error = (
             "nanometanf validation did not return a result. Check "
             "the pipeline log under <results>/logs/ for the underlying "
@@ -28,7 +28,7 @@ import subprocess
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -116,7 +116,17 @@ class ReadinessReport:
 
 
 class ReadinessChecker:
-    """Validates prerequisites for offline Nanometa Live operation."""
+    """Validates prerequisites for offline Nanometa Live operation.
+
+    Checks run concurrently through :class:`ReadinessEngine`. Pass a
+    :class:`CheckCache` (``CheckCache.for_config(config)`` for the on-disk
+    one) to reuse results whose inputs are unchanged within their TTL;
+    without one every check runs on every call.
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache
+        self.engine_stats = None
 
     def check_readiness(
         self,
@@ -124,6 +134,8 @@ class ReadinessChecker:
         nanometa_home: Optional[str] = None,
         watchlist_entries: Optional[List[Dict[str, Any]]] = None,
         reload_genomes: bool = False,
+        on_result: Optional[Callable[[List[CheckResult], int, int], None]] = None,
+        refresh: bool = False,
     ) -> ReadinessReport:
         """
         Run all readiness checks.
@@ -138,10 +150,15 @@ class ReadinessChecker:
                 report "not enabled" even when the operator has enabled entries
                 in the main process. When omitted, the singleton is consulted
                 (correct for in-process callers).
+            on_result: Called as each check finishes with the results so far
+                (completion order), the number of checks finished and the total.
+            refresh: Ignore cached results and run every check.
 
         Returns:
-            ReadinessReport with all check results.
+            ReadinessReport with all check results, in the fixed check order.
         """
+        from nanometa_live.core.workflow.readiness_engine import ReadinessEngine
+
         active_watchlist = self._resolve_active_watchlist(watchlist_entries)
 
         if nanometa_home is None:
@@ -159,86 +176,154 @@ class ReadinessChecker:
         # cache_dir the checks use -- so the checks see the current set.
         if reload_genomes:
             try:
-                from nanometa_live.core.utils.genome_manager import (
-                genome_cache_taxid, get_genome_manager,
-            )
+                from nanometa_live.core.utils.genome_manager import get_genome_manager
                 get_genome_manager(
                     config.get("genome_cache_dir") or str(home)
                 ).reload_metadata()
             except Exception as e:
                 logger.debug(f"genome-manager reload before readiness skipped: {e}")
 
-        report = ReadinessReport()
-
-        # === Data checks (critical) ===
-        report.checks.append(self._check_kraken_db(config))
-        report.checks.append(self._check_kraken_db_location(config))
-        report.checks.append(self._check_db_index(config, home))
-        report.checks.append(self._check_taxid_mappings(config, home, active_watchlist))
-
-        # === Pipeline execution tools (critical) ===
-        # Nextflow runs locally to orchestrate the pipeline
-        report.checks.append(self._check_tool(
-            "nextflow", Severity.CRITICAL,
-            purpose="pipeline orchestration",
-        ))
-        # Container runtime must match pipeline_profile setting
-        report.checks.append(self._check_container_runtime(config))
-
-        # === Preparation tools (warning) ===
-        # These are needed to build indices and download genomes.
-        # Not needed at runtime if preparation was done elsewhere
-        # (e.g. imported via bundle).
-        report.checks.append(self._check_tool(
-            "kraken2-inspect", Severity.WARNING,
-            purpose="building taxonomy index from Kraken2 database",
-        ))
-        report.checks.append(self._check_tool(
-            "datasets", Severity.WARNING,
-            purpose="downloading reference genomes from NCBI",
-        ))
-        report.checks.append(self._check_tool(
-            "makeblastdb", Severity.WARNING,
-            purpose="building BLAST databases from genomes",
-        ))
+        specs = self._check_specs(config, home, active_watchlist)
+        streamed: List[CheckResult] = []
+        finished = [0]
+
+        def _stream(_spec, results):
+            streamed.extend(results)
+            finished[0] += 1
+            on_result(list(streamed), finished[0], len(specs))
+
+        engine = ReadinessEngine(self.cache)
+        checks = engine.run(specs, config, on_result=_stream if on_result else None,
+                            refresh=refresh)
+        self.engine_stats = engine.stats
+        return ReadinessReport(checks=checks)
+
+    def _check_specs(
+        self, config: Dict[str, Any], home: Path,
+        active_watchlist: Optional[List[Dict[str, Any]]],
+    ) -> list:
+        """Every check with its inputs and TTL, in report order."""
+        from nanometa_live.core.utils.paths import get_mappings_dir_from_env
+        from nanometa_live.core.workflow.readiness_engine import CheckSpec
+
+        db = config.get("kraken_db", "") or ""
+        db_inputs = dict(config_keys=("kraken_db",),
+                         paths=(db and Path(db) / "hash.k2d", get_mappings_dir_from_env()))
+        watchlist = sorted(
+            (str(e.get("taxid")), str(e.get("name"))) for e in active_watchlist
+        ) if active_watchlist is not None else None
+        crit, warn = Severity.CRITICAL, Severity.WARNING
+        return [
+            # === Data checks (critical) ===
+            CheckSpec("kraken_db", lambda: self._check_kraken_db(config),
+                      "Kraken2 Database", crit, ttl=300,
+                      config_keys=("kraken_db",), paths=(db,)),
+            CheckSpec("kraken_db_location", lambda: self._check_kraken_db_location(config),
+                      "Database Location", warn, ttl=3600, config_keys=("kraken_db",)),
+            CheckSpec("db_index", lambda: self._check_db_index(config, home),
+                      "DB Taxonomy Index", crit, ttl=300, **db_inputs),
+            CheckSpec("taxid_mappings",
+                      lambda: self._check_taxid_mappings(config, home, active_watchlist),
+                      "Taxid Mappings", crit, ttl=300, extra=watchlist, **db_inputs),
+            *self._tool_check_specs(config),
+            *self._environment_check_specs(config, home, active_watchlist, watchlist),
+        ]
+
+    def _tool_check_specs(self, config: Dict[str, Any]) -> list:
+        from nanometa_live.core.workflow.readiness_engine import CheckSpec
+
+        crit, warn = Severity.CRITICAL, Severity.WARNING
 
+        def tool(name, severity, purpose):
+            return CheckSpec(
+                f"tool:{name}", lambda: self._check_tool(name, severity, purpose=purpose),
+                f"Tool: {name}", severity, ttl=300, env=("PATH",),
+            )
+
+        specs = [
+            # === Pipeline execution tools (critical) ===
+            # Nextflow runs locally to orchestrate the pipeline; the
+            # container runtime must match the pipeline_profile setting.
+            tool("nextflow", crit, "pipeline orchestration"),
+            CheckSpec("container_runtime", lambda: self._check_container_runtime(config),
+                      "Container Runtime", crit, ttl=60,
+                      config_keys=("pipeline_profile",), env=("PATH",)),
+            # === Preparation tools (warning) ===
+            # These are needed to build indices and download genomes.
+            # Not needed at runtime if preparation was done elsewhere
+            # (e.g. imported via bundle).
+            tool("kraken2-inspect", warn, "building taxonomy index from Kraken2 database"),
+            tool("datasets", warn, "downloading reference genomes from NCBI"),
+            tool("makeblastdb", warn, "building BLAST databases from genomes"),
+        ]
         # === Conditional tools ===
         # blastn is only needed when BLAST validation is enabled
         blast_enabled = config.get("blast_validation", False)
         if isinstance(blast_enabled, str):
             blast_enabled = blast_enabled.lower() in ("true", "yes", "1")
         if blast_enabled:
-            report.checks.append(self._check_tool(
-                "blastn", Severity.WARNING,
-                purpose="on-demand read validation",
-            ))
-
+            specs.append(tool("blastn", warn, "on-demand read validation"))
         # minimap2 is only needed when validation_method includes minimap2
-        validation_method = config.get("validation_method", "")
-        if validation_method in ("minimap2", "both"):
-            report.checks.append(self._check_tool(
-                "minimap2", Severity.WARNING,
-                purpose="coverage validation",
-            ))
-
-        # === Input/output checks (warning) ===
-        report.checks.append(self._check_input_directory(config))
-        report.checks.append(self._check_input_read_length(config))
-        report.checks.append(self._check_output_directory(config))
-        report.checks.append(self._check_disk_space(config))
-
-        # === Data completeness (warning) ===
-        report.checks.append(self._check_watchlist_active(config, active_watchlist))
-        report.checks.append(self._check_watchlist_genomes(config, home, active_watchlist))
-        report.checks.append(self._check_blast_dbs(config, home, active_watchlist))
-
-        # === Informational ===
-        report.checks.append(self._check_nextflow_version())
-        report.checks.extend(self._check_network_connectivity(config))
-        report.checks.append(self._check_taxonomy_cache(home))
-        report.checks.append(self._check_pipeline_cached(config))
-
-        return report
+        if config.get("validation_method", "") in ("minimap2", "both"):
+            specs.append(tool("minimap2", warn, "coverage validation"))
+        return specs
+
+    def _environment_check_specs(
+        self, config: Dict[str, Any], home: Path,
+        active_watchlist: Optional[List[Dict[str, Any]]], watchlist: Any,
+    ) -> list:
+        from nanometa_live.core.workflow.readiness_engine import CheckSpec
+
+        input_dir = config.get("nanopore_output_directory") or config.get("nanopore_dir", "")
+        output_dir = config.get("results_output_directory") or config.get("main_dir", "")
+        genome_home = Path(config.get("genome_cache_dir") or str(home))
+        source = str(config.get("pipeline_source", "") or "")
+        local_source = source[len("local:"):] if source.startswith("local:") else source
+        crit, warn, info = Severity.CRITICAL, Severity.WARNING, Severity.INFO
+        input_keys = ("nanopore_output_directory", "nanopore_dir")
+        output_keys = ("results_output_directory", "main_dir")
+        return [
+            # === Input/output checks (warning) ===
+            CheckSpec("input_directory", lambda: self._check_input_directory(config),
+                      "Input Directory", warn, ttl=30,
+                      config_keys=input_keys, paths=(input_dir,)),
+            CheckSpec("input_read_length", lambda: self._check_input_read_length(config),
+                      "Input Read Length", warn, ttl=120,
+                      config_keys=input_keys + ("qc_tool", "chopper_minlength",
+                                                "filtlong_min_length"),
+                      paths=(input_dir,)),
+            CheckSpec("output_directory", lambda: self._check_output_directory(config),
+                      "Output Directory", warn, ttl=30, config_keys=output_keys,
+                      paths=(output_dir, output_dir and Path(output_dir).parent)),
+            CheckSpec("disk_space", lambda: self._check_disk_space(config),
+                      "Disk Space", warn, ttl=60, config_keys=output_keys),
+            # === Data completeness (warning) ===
+            CheckSpec("watchlist_active",
+                      lambda: self._check_watchlist_active(config, active_watchlist),
+                      "Watchlist Active", warn),
+            CheckSpec("watchlist_genomes",
+                      lambda: self._check_watchlist_genomes(config, home, active_watchlist),
+                      "Watchlist Genomes", warn, ttl=60,
+                      config_keys=("genome_cache_dir",),
+                      paths=(genome_home / "genomes",), extra=watchlist),
+            CheckSpec("blast_dbs",
+                      lambda: self._check_blast_dbs(config, home, active_watchlist),
+                      "BLAST Databases", warn, ttl=60,
+                      config_keys=("blast_validation", "genome_cache_dir"),
+                      paths=(genome_home / "blast",), extra=watchlist),
+            # === Informational ===
+            CheckSpec("nextflow_version", self._check_nextflow_version,
+                      "Nextflow Version", warn, ttl=3600, env=("PATH",)),
+            CheckSpec("network", lambda: self._check_network_connectivity(config),
+                      "Network", info, ttl=300,
+                      config_keys=("offline_mode", "network_check_enabled")),
+            CheckSpec("taxonomy_cache", lambda: self._check_taxonomy_cache(home),
+                      "Taxonomy Cache", info, ttl=300, paths=(home / "cache",)),
+            CheckSpec("pipeline_source", lambda: self._check_pipeline_cached(config),
+                      "Pipeline Source", crit, ttl=60,
+                      config_keys=("pipeline_source", "offline_mode"),
+                      paths=(local_source, local_source and Path(local_source) / "main.nf")),
+        ]
 
     # -- Data checks --
 
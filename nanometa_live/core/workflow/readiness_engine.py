@@ -0,0 +1,283 @@
+"""
+Concurrent execution and result reuse for readiness checks.
+
+``ReadinessChecker.check_readiness`` used to run its twenty-odd checks one
+after another: ``which`` lookups, ``docker info`` (5 s), ``nextflow
+-version`` (10 s), two network probes (5 s each), a gzip read-length
+sample and the genome/BLAST directory scans. Every poll paid the sum.
+
+Each check is now described by a :class:`CheckSpec` that names its inputs
+(config keys, filesystem paths, environment variables and any other value)
+and a TTL. :class:`ReadinessEngine` then:
+
+* reuses a stored result while the check's inputs are unchanged and its
+  TTL has not run out, so a warm poll costs a few ``stat`` calls;
+* runs the remaining checks together on a thread pool, so a cold poll is
+  bounded by the slowest check rather than the sum;
+* gives up on a check that outlives its timeout and reports it as failed
+  (timed-out results are never stored);
+* calls ``on_result`` as each check finishes, so a caller can show partial
+  results while the slow probes are still running.
+
+Stored results live in a :class:`CheckCache`. The readiness callback runs
+in a fresh DiskcacheManager worker process per invocation, so the cache is
+a small JSON file under the data directory rather than a module global.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from nanometa_live.core.workflow.readiness_checker import CheckResult, Severity
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "readiness_checks.json"
+CACHE_VERSION = 1
+
+#: Seconds a check may run before it is reported as timed out. The slowest
+#: probes carry their own subprocess/socket timeouts well inside this.
+DEFAULT_CHECK_TIMEOUT = 20.0
+#: Upper bound on concurrently running checks (there are ~22 today).
+MAX_WORKERS = 32
+
+Outcome = Union[CheckResult, List[CheckResult]]
+
+
+@dataclass(frozen=True)
+class CheckSpec:
+    """One readiness check, its inputs and how long its result stays valid.
+
+    ``ttl`` of 0 means the result is never reused. ``name`` and ``severity``
+    label the result reported if the check times out.
+    """
+
+    key: str
+    run: Callable[[], Outcome]
+    name: str
+    severity: Severity = Severity.WARNING
+    ttl: float = 0.0
+    config_keys: Tuple[str, ...] = ()
+    paths: Tuple[Any, ...] = ()
+    env: Tuple[str, ...] = ()
+    extra: Any = None
+    timeout: float = DEFAULT_CHECK_TIMEOUT
+
+    def signature(self, config: Dict[str, Any]) -> str:
+        """Digest of everything the check reads; a change forces a re-run."""
+        stats = []
+        for raw in self.paths:
+            if not raw:
+                stats.append(None)
+                continue
+            try:
+                st = os.stat(raw)
+                stats.append([str(raw), st.st_mtime_ns, st.st_size])
+            except OSError:
+                stats.append([str(raw), None])
+        payload = {
+            "config": {k: config.get(k) for k in self.config_keys},
+            "paths": stats,
+            "env": {k: os.environ.get(k) for k in self.env},
+            "extra": self.extra,
+        }
+        blob = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.md5(blob.encode()).hexdigest()
+
+
+def _as_list(outcome: Outcome) -> List[CheckResult]:
+    return list(outcome) if isinstance(outcome, list) else [outcome]
+
+
+def _encode(results: List[CheckResult]) -> List[Dict[str, Any]]:
+    return [{**asdict(r), "severity": r.severity.value} for r in results]
+
+
+def _decode(rows: List[Dict[str, Any]]) -> List[CheckResult]:
+    return [CheckResult(**{**row, "severity": Severity(row["severity"])}) for row in rows]
+
+
+class CheckCache:
+    """``{check key: {sig, ts, results}}``, optionally persisted to ``path``."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if self.path is not None:
+            self._load()
+
+    @classmethod
+    def for_config(cls, config: Dict[str, Any]) -> "CheckCache":
+        """The on-disk cache for the configured data directory."""
+        from nanometa_live.core.utils.paths import NanometaPaths
+        return cls(NanometaPaths.from_config(config).data_dir / CACHE_FILENAME)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self._entries = dict(data.get("checks") or {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable readiness cache {self.path}: {e}")
+
+    def lookup(self, spec: CheckSpec, sig: str, now: float) -> Optional[List[CheckResult]]:
+        """The stored results for ``spec`` if its inputs and TTL still hold."""
+        if spec.ttl <= 0:
+            return None
+        entry = self._entries.get(spec.key)
+        if not entry or entry.get("sig") != sig:
+            return None
+        if now - float(entry.get("ts") or 0.0) >= spec.ttl:
+            return None
+        try:
+            return _decode(entry["results"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def store(self, spec: CheckSpec, sig: str, now: float,
+              results: List[CheckResult]) -> None:
+        if spec.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[spec.key] = {"sig": sig, "ts": now, "results": _encode(results)}
+            self._dirty = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dirty = self._dirty or bool(self._entries)
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self) -> None:
+        """Write the cache if anything changed. Best effort."""
+        if self.path is None:
+            return
+        from nanometa_live.core.utils.atomic_write import atomic_write_json
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"version": CACHE_VERSION, "checks": dict(self._entries)}
+            self._dirty = False
+        try:
+            atomic_write_json(self.path, payload, indent=None)
+        except OSError as e:
+            logger.debug(f"Could not write readiness cache {self.path}: {e}")
+
+
+def _timed_out(spec: CheckSpec) -> CheckResult:
+    return CheckResult(
+        spec.name, False, spec.severity,
+        f"Check did not finish within {spec.timeout:.0f} s",
+        details="The probe is still running in the background; "
+                "the next readiness poll will try again.",
+    )
+
+
+@dataclass
+class EngineStats:
+    """What the last :meth:`ReadinessEngine.run` did."""
+
+    reused: int = 0
+    ran: int = 0
+    timed_out: int = 0
+    elapsed_s: float = 0.0
+
+
+class ReadinessEngine:
+    """Run :class:`CheckSpec` lists concurrently, reusing cached results."""
+
+    def __init__(self, cache: Optional[CheckCache] = None, max_workers: int = MAX_WORKERS):
+        self.cache = cache if cache is not None else CheckCache()
+        self.max_workers = max_workers
+        self.stats = EngineStats()
+
+    def run(
+        self,
+        specs: Sequence[CheckSpec],
+        config: Dict[str, Any],
+        on_result: Optional[Callable[[CheckSpec, List[CheckResult]], None]] = None,
+        refresh: bool = False,
+    ) -> List[CheckResult]:
+        """Results for every spec, in spec order.
+
+        ``refresh`` ignores stored results (an explicit "Check Everything")
+        but still stores the fresh ones. ``on_result`` is called on this
+        thread, in completion order. An exception raised by a check
+        propagates once the other checks have finished.
+        """
+        start = time.monotonic()
+        now = time.time()
+        self.stats = EngineStats()
+        done: Dict[int, List[CheckResult]] = {}
+        todo: List[Tuple[int, CheckSpec, str]] = []
+        for i, spec in enumerate(specs):
+            sig = spec.signature(config)
+            cached = None if refresh else self.cache.lookup(spec, sig, now)
+            if cached is None:
+                todo.append((i, spec, sig))
+                continue
+            done[i] = cached
+            self.stats.reused += 1
+            if on_result:
+                on_result(spec, cached)
+        if todo:
+            self._run_pending(todo, done, on_result, start)
+        self.cache.save()
+        self.stats.elapsed_s = time.monotonic() - start
+        return [r for i in range(len(specs)) for r in done[i]]
+
+    def _run_pending(self, todo, done, on_result, start) -> None:
+        pool = ThreadPoolExecutor(max_workers=min(len(todo), self.max_workers),
+                                  thread_name_prefix="readiness")
+        futures: Dict[Future, Tuple[int, CheckSpec, str]] = {
+            pool.submit(spec.run): (i, spec, sig) for i, spec, sig in todo
+        }
+        error: Optional[BaseException] = None
+        try:
+            pending = set(futures)
+            while pending:
+                elapsed = time.monotonic() - start
+                next_deadline = min(futures[f][1].timeout for f in pending) - elapsed
+                finished, pending = wait(pending, timeout=max(0.0, next_deadline),
+                                         return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    i, spec, sig = futures[fut]
+                    try:
+                        results = _as_list(fut.result())
+                    except Exception as e:  # re-raised after the others finish
+                        error = error or e
+                        continue
+                    self.cache.store(spec, sig, time.time(), results)
+                    self.stats.ran += 1
+                    done[i] = results
+                    if on_result:
+                        on_result(spec, results)
+                elapsed = time.monotonic() - start
+                for fut in [f for f in pending if futures[f][1].timeout <= elapsed]:
+                    pending.discard(fut)
+                    i, spec, _sig = futures[fut]
+                    logger.warning(f"Readiness check {spec.key} timed out after {spec.timeout} s")
+                    done[i] = [_timed_out(spec)]
+                    self.stats.timed_out += 1
+                    if on_result:
+                        on_result(spec, done[i])
+        finally:
+            # Never join a hung probe: its thread finishes (or hits its own
+            # subprocess timeout) in the background.
+            pool.shutdown(wait=False, cancel_futures=True)
+        if error is not None:
+            raise error
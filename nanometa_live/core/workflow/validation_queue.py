@@ -0,0 +1,383 @@
+"""
+Coalescing queue for on-demand validation requests.
+
+Every "Validate" click used to launch its own ``nextflow run -resume``.
+An operator triaging a fresh alert typically clicks through several
+detections in a few seconds, and each click then paid Nextflow's JVM
+start, the resume-cache scan and the conda activation on its own. Two
+runs in flight also rebuilt ``validation_results.json`` over each other.
+
+The pipeline already validates any number of taxids per run
+(``--taxids_to_validate``), so requests arriving close together can share
+one run. This module batches them:
+
+* A request is recorded in ``validation_queue.json`` under the validator's
+  ``on_demand_validation`` dir. The click submits it from the main
+  process; the run happens in a background-callback worker, so the queue
+  is a file shared across processes, not an in-memory structure.
+  Read-modify-writes hold
+  :func:`~nanometa_live.core.utils.atomic_write.file_lock` and land via an
+  atomic rename.
+* A request for a (sample, taxid, method) that is already pending or
+  running is deduplicated onto the existing record. Its priority is
+  raised if the newcomer's is higher.
+* After a short coalescing window the waiting callbacks race for a
+  non-blocking launch lock. The winner claims the pending requests, most
+  critical threat first, then oldest, up to ``max_batch``. It runs them
+  through :meth:`OnDemandValidator.validate_batch_via_nanometanf` and
+  records each request's result. One batch only carries one validation
+  method, because the method is a pipeline-wide parameter.
+* The winner keeps claiming batches until nothing is pending. The heavy
+  callback lane only has a couple of workers, so most clicks' callbacks
+  are still queued for a worker while a batch runs; their requests are
+  already on file and get run by whoever holds the lock. When their
+  callback finally starts it finds the result waiting.
+* The other callbacks poll the state file and forward their request's
+  queue position, or its batch's progress, to their own card.
+
+The launch lock is held for the whole run, so whoever takes it knows no
+batch is in flight. Any record still marked ``running`` is then an
+orphan of a worker that died mid-run, and is re-queued.
+"""
+
+import json
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from nanometa_live.core.utils.atomic_write import atomic_write_json, file_lock
+from nanometa_live.core.workflow.on_demand_helpers import _validation_timeout_seconds
+from nanometa_live.core.workflow.validation_models import ValidationResult
+
+logger = logging.getLogger(__name__)
+
+QUEUE_FILENAME = "validation_queue.json"
+LAUNCH_LOCK_FILENAME = ".validation_launch.lock"
+
+# Lower runs first. Anything off the watchlist sorts last.
+THREAT_PRIORITY = {"critical": 0, "high": 1, "moderate": 2, "low": 3}
+DEFAULT_PRIORITY = 4
+
+PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+
+# Finished records are kept this long so every waiter can collect them.
+FINISHED_RETENTION_SECONDS = 3600
+
+
+def threat_priority(threat_level: Any) -> int:
+    """Queue priority of a threat level name or ``ThreatLevel`` (lower runs first)."""
+    level = getattr(threat_level, "value", threat_level)
+    return THREAT_PRIORITY.get(str(level or "").lower(), DEFAULT_PRIORITY)
+
+
+def _result_to_dict(result: ValidationResult) -> Dict[str, Any]:
+    data = asdict(result)
+    if data.get("blast_output_file") is not None:
+        data["blast_output_file"] = str(data["blast_output_file"])
+    return data
+
+
+def _result_from_dict(data: Dict[str, Any]) -> ValidationResult:
+    data = dict(data)
+    if data.get("blast_output_file"):
+        data["blast_output_file"] = Path(data["blast_output_file"])
+    return ValidationResult(**data)
+
+
+def _try_lock(fh) -> bool:
+    """Take an exclusive, non-blocking lock on ``fh``; False if held elsewhere."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fh) -> None:
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    else:
+        fh.seek(0)
+        msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class ValidationQueue:
+    """File-backed, cross-process queue of on-demand validation requests.
+
+    Args:
+        validation_dir: The validator's ``on_demand_validation`` directory.
+        window_seconds: How long a new request waits for others to join
+            its batch before anyone launches.
+        poll_seconds: How often a waiting request re-reads the queue.
+        max_batch: Most requests sent to one pipeline run.
+    """
+
+    def __init__(
+        self,
+        validation_dir: Path,
+        window_seconds: float = 3.0,
+        poll_seconds: float = 1.0,
+        max_batch: int = 24,
+    ):
+        self.validation_dir = Path(validation_dir)
+        self.state_path = self.validation_dir / QUEUE_FILENAME
+        self.launch_lock_path = self.validation_dir / LAUNCH_LOCK_FILENAME
+        self.window_seconds = window_seconds
+        self.poll_seconds = poll_seconds
+        self.max_batch = max(1, int(max_batch))
+
+    # ------------------------------------------------------------------
+    # State file
+    # ------------------------------------------------------------------
+
+    def _load(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.state_path, encoding="utf-8") as fh:
+                records = json.load(fh).get("requests", [])
+            return records if isinstance(records, list) else []
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable validation queue {self.state_path}: {e}")
+            return []
+
+    @contextmanager
+    def _locked_records(self) -> Iterator[List[Dict[str, Any]]]:
+        """Read-modify-write the records under the state file's lock."""
+        with file_lock(self.state_path):
+            records = self._load()
+            yield records
+            cutoff = time.time() - FINISHED_RETENTION_SECONDS
+            records[:] = [r for r in records
+                          if r["status"] in (PENDING, RUNNING)
+                          or r.get("finished_at", 0) >= cutoff]
+            atomic_write_json(self.state_path, {"requests": records})
+
+    def requests(self) -> List[Dict[str, Any]]:
+        """Snapshot of every queued, running and recently finished request."""
+        return self._load()
+
+    def _record(self, request_id: str) -> Optional[Dict[str, Any]]:
+        return next((r for r in self._load() if r["request_id"] == request_id), None)
+
+    # ------------------------------------------------------------------
+    # Submitting and claiming
+    # ------------------------------------------------------------------
+
+    def submit(self, taxid: int, name: str, sample: str, method: str = "blast",
+               threat_level: Any = None) -> str:
+        """Queue a request and return its id.
+
+        An identical request already pending or running is reused, so
+        two operators validating the same detection share one result.
+        """
+        priority = threat_priority(threat_level)
+        with self._locked_records() as records:
+            for record in records:
+                if (record["status"] in (PENDING, RUNNING)
+                        and record["taxid"] == int(taxid)
+                        and record["sample"] == sample
+                        and record["method"] == method):
+                    record["priority"] = min(record["priority"], priority)
+                    return record["request_id"]
+            request_id = uuid.uuid4().hex
+            records.append({
+                "request_id": request_id,
+                "taxid": int(taxid),
+                "name": name,
+                "sample": sample,
+                "method": method,
+                "priority": priority,
+                "submitted_at": time.time(),
+                "status": PENDING,
+                "batch_id": None,
+                "message": "Queued for validation...",
+                "percent": 0,
+            })
+        return request_id
+
+    def claim_batch(self) -> List[Dict[str, Any]]:
+        """Mark the next batch running and return its records.
+
+        Only call this while holding the launch lock: it treats every
+        record still ``running`` as orphaned and re-queues it first.
+        """
+        with self._locked_records() as records:
+            for record in records:
+                if record["status"] == RUNNING:
+                    logger.warning(
+                        f"Re-queueing orphaned validation request for taxid "
+                        f"{record['taxid']} (batch {record['batch_id']})")
+                    record.update(status=PENDING, batch_id=None)
+            pending = sorted((r for r in records if r["status"] == PENDING),
+                             key=lambda r: (r["priority"], r["submitted_at"]))
+            if not pending:
+                return []
+            method = pending[0]["method"]
+            batch = [r for r in pending if r["method"] == method][:self.max_batch]
+            batch_id = uuid.uuid4().hex[:12]
+            for record in batch:
+                record.update(status=RUNNING, batch_id=batch_id,
+                              message="Starting validation batch...", percent=5)
+            return [dict(r) for r in batch]
+
+    def _update_batch(self, batch_id: str, **fields: Any) -> None:
+        with self._locked_records() as records:
+            for record in records:
+                if record.get("batch_id") == batch_id and record["status"] == RUNNING:
+                    record.update(fields)
+
+    def _finish(self, outcomes: Dict[str, Dict[str, Any]]) -> None:
+        now = time.time()
+        with self._locked_records() as records:
+            for record in records:
+                outcome = outcomes.get(record["request_id"])
+                if outcome is not None and record["status"] == RUNNING:
+                    record.update(outcome, finished_at=now, percent=100)
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _launch_lock(self) -> Iterator[bool]:
+        """Try, without blocking, to become the process that runs batches."""
+        self.validation_dir.mkdir(parents=True, exist_ok=True)
+        fh = open(self.launch_lock_path, "a+")
+        try:
+            if not _try_lock(fh):
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                _unlock(fh)
+        finally:
+            fh.close()
+
+    def run_batch(self, validator: Any, config: Optional[Dict[str, Any]] = None) -> int:
+        """Claim and run one batch through ``validator``; return its size."""
+        batch = self.claim_batch()
+        if not batch:
+            return 0
+        batch_id, method = batch[0]["batch_id"], batch[0]["method"]
+        size = f"batch of {len(batch)}" if len(batch) > 1 else "single request"
+        logger.info(f"Running validation {size} ({method}): "
+                    f"{', '.join(str(r['taxid']) for r in batch)}")
+        last = [None]
+
+        def progress(message: str, percent: int) -> None:
+            if (message, percent) != last[0]:
+                last[0] = (message, percent)
+                self._update_batch(batch_id, message=f"{message} ({size})",
+                                   percent=percent)
+
+        targets = [(r["taxid"], r["name"], r["sample"]) for r in batch]
+        try:
+            results = validator.validate_batch_via_nanometanf(
+                targets, method, config, progress)
+        except Exception as e:  # noqa: BLE001 - every waiter must be released
+            logger.exception(f"Validation batch {batch_id} failed: {e}")
+            results = [None] * len(batch)
+            error = f"Validation batch failed: {e}"
+        else:
+            error = "nanometanf reported no result"
+        outcomes = {}
+        for record, result in zip(batch, results):
+            if result is None:
+                outcomes[record["request_id"]] = {"status": FAILED, "error": error,
+                                                  "message": error}
+            else:
+                outcomes[record["request_id"]] = {
+                    "status": DONE, "result": _result_to_dict(result),
+                    "message": "Validation complete"}
+        self._finish(outcomes)
+        return len(batch)
+
+    def drain(self, validator: Any, config: Optional[Dict[str, Any]] = None) -> int:
+        """Run batches until nothing is pending; return how many requests ran.
+
+        Only call this while holding the launch lock.
+        """
+        total = 0
+        while True:
+            ran = self.run_batch(validator, config)
+            if not ran:
+                return total
+            total += ran
+
+    def _report(self, record: Dict[str, Any],
+                progress_callback: Optional[Callable[[str, int], None]]) -> None:
+        if not progress_callback:
+            return
+        if record["status"] == PENDING:
+            ahead = [r for r in self._load() if r["status"] == PENDING
+                     and (r["priority"], r["submitted_at"])
+                     < (record["priority"], record["submitted_at"])]
+            progress_callback(
+                f"Queued for validation (position {len(ahead) + 1})...", 2)
+        else:
+            progress_callback(record.get("message") or "Validating...",
+                              int(record.get("percent") or 0))
+
+    def validate(
+        self,
+        validator: Any,
+        taxid: int,
+        name: str,
+        sample: str,
+        method: str = "blast",
+        config: Optional[Dict[str, Any]] = None,
+        threat_level: Any = None,
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        request_id: Optional[str] = None,
+    ) -> Optional[ValidationResult]:
+        """Queue one request and block until its batch has run.
+
+        Drop-in for ``validator.validate_via_nanometanf``: returns the
+        request's ValidationResult, or None when the run failed or
+        reported nothing for it. Pass ``request_id`` when the request was
+        already submitted (at click time); it is submitted here if that
+        record is gone. Gives up after twice the configured validation
+        timeout, which covers waiting out one full batch ahead.
+        """
+        record = self._record(request_id) if request_id else None
+        if record is None:
+            request_id = self.submit(taxid, name, sample, method, threat_level)
+            record = self._record(request_id)
+        deadline = time.monotonic() + 2 * _validation_timeout_seconds(config)
+        # Whatever is left of the coalescing window since the submit.
+        submitted_at = record["submitted_at"] if record else time.time()
+        time.sleep(max(0.0, submitted_at + self.window_seconds - time.time()))
+        while True:
+            record = self._record(request_id)
+            if record is None:
+                logger.warning(f"Validation request {request_id} left the queue")
+                return None
+            if record["status"] == DONE:
+                return _result_from_dict(record["result"])
+            if record["status"] == FAILED:
+                return None
+            with self._launch_lock() as acquired:
+                if acquired:
+                    self.drain(validator, config)
+                    continue
+            self._report(record, progress_callback)
+            if time.monotonic() > deadline:
+                logger.warning(f"Timed out waiting for validation request {request_id}")
+                return None
+            time.sleep(self.poll_seconds)
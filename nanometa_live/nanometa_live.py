@@ -29,6 +29,17 @@ from nanometa_live.core.utils.paths import (
 )
 
 
+def _positive_float(value):
+    """argparse type for a float greater than zero."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a number")
+    if not number > 0:  # also rejects nan
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
 def parse_arguments():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
@@ -80,6 +91,29 @@ def parse_arguments():
              "~/nanometa-projects/<analysis name>)",
     )
 
+    parser.add_argument(
+        "--lazy-tabs",
+        action="store_true",
+        help="Faster startup: build only the Dashboard tab at launch and lay "
+             "out the other tabs when first opened (sets lazy_tabs in config)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run a low-frequency sampling profiler from launch, writing "
+             "rolling flame-graph (folded stack) files to "
+             "<data-dir>/logs/profiles. It can also be started and stopped "
+             "from the Configuration tab.",
+    )
+
+    parser.add_argument(
+        "--profile-hz",
+        type=_positive_float,
+        default=20.0,
+        help="Samples per second for --profile (default: 20)",
+    )
+
     parser.add_argument(
         "--version", action="version", version=f"Nanometa Live v{__version__}"
     )
@@ -109,6 +143,9 @@ def handle_exit(app_runner, backend_manager):
         logging.info("Shutting down Nanometa Live...")
         if backend_manager:
             backend_manager.stop()
+        # Write out the profiler's partial window; a no-op when it never ran.
+        from nanometa_live.core.utils.stack_sampler import stop_profiler
+        stop_profiler()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
@@ -212,6 +249,8 @@ def main():
         logging.warning("Invalid gui_port %r; using 8050", config.get("gui_port"))
         port = 8050
     config["gui_port"] = port
+    if getattr(args, "lazy_tabs", False):
+        config["lazy_tabs"] = True
     if args.main_dir:
         config["results_output_directory"] = os.path.abspath(args.main_dir)
         config["main_dir"] = os.path.abspath(args.main_dir)
@@ -248,6 +287,21 @@ def main():
         logging.getLogger("dash.dash").setLevel(logging.WARNING)
         logging.getLogger("werkzeug").setLevel(logging.WARNING)
 
+    # Pre-start the background-callback worker lanes so the first
+    # interactive background callback does not pay a cold process start.
+    # Skipped in the Werkzeug reloader's parent, which never serves.
+    if not args.debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        from nanometa_live.app import app as app_module
+        start_pool = getattr(app_module.background_callback_manager, "start", None)
+        if start_pool is not None:
+            start_pool()
+
+    # Sampling profiler. Same reloader-parent guard as the pool above: only
+    # the serving process has threads worth sampling.
+    if args.profile and (not args.debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true"):
+        from nanometa_live.core.utils.stack_sampler import default_profile_dir, start_profiler
+        start_profiler(default_profile_dir(data_dir), hz=args.profile_hz)
+
     # Set up signal handlers for graceful exit
     handle_exit(app, backend_manager)
 
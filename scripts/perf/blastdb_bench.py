@@ -0,0 +1,245 @@
+"""BLAST database build benchmark: per-taxid databases vs one consolidated.
+
+Usage::
+
+    python -m scripts.perf.blastdb_bench                       # 200 genomes
+    python -m scripts.perf.blastdb_bench --genomes 500 --genome-kb 100
+    python -m scripts.perf.blastdb_bench --ms-per-mb 200 --startup-ms 80
+
+Nothing here needs BLAST+. A stub ``makeblastdb`` (:func:`write_stub`) is
+put first on ``PATH``. It reads its input, sleeps a fixed start-up cost
+plus a per-MB cost, and writes ``.nhr``/``.nin``/``.nsq`` files holding the
+headers, an index and the residues, so the databases it leaves have
+realistic sizes. Like the real tool it gives records without residues no
+OID, and a stub ``blastdbcmd -info`` reports the sequence count from the
+index. It also checks that every sequence id is in the
+``-taxid_map`` when one is given, and appends each invocation to a log, so
+the number of process spawns is counted exactly. Tests put the same stub on
+``PATH`` to exercise the real build code.
+
+Two numbers per mode:
+
+* ``build`` -- wall time of ``GenomeDownloadManager.build_blast_dbs_batch``,
+  with the count of ``makeblastdb`` spawns and files left in ``blast/``;
+* ``open`` -- the validation-time cost of opening each taxid's database
+  the way ``blastn -db`` does: resolve the path, follow a ``.nal`` alias,
+  open and map the volume files. Reported as files opened, distinct files
+  touched (what the page cache has to hold), and wall time for opening
+  every taxid once.
+
+Wall times are machine-dependent and only printed; nothing is gated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import mmap
+import os
+import random
+import stat
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence
+
+STUB_NAME = "makeblastdb"
+INFO_STUB_NAME = "blastdbcmd"
+VOLUME_EXTS = (".nin", ".nhr", ".nsq")
+
+_STUB_SOURCE = '''\
+import os, sys, time
+args = sys.argv[1:]
+opts = {args[i]: args[i + 1] for i in range(len(args) - 1) if args[i].startswith("-")}
+log = os.environ.get("STUB_MAKEBLASTDB_LOG")
+if log:
+    with open(log, "a") as f:
+        f.write(" ".join(args) + "\\n")
+headers, residues, pending = [], 0, None
+with open(opts["-in"], "rb") as src, open(opts["-out"] + ".nsq", "wb") as nsq:
+    for line in src:
+        if line.startswith(b">"):
+            pending = line[1:].split(None, 1)[0].decode()
+        elif line.strip():
+            # Like makeblastdb, a record without residues gets no OID.
+            if pending is not None:
+                headers.append(pending)
+                pending = None
+            chunk = line.strip()
+            residues += len(chunk)
+            nsq.write(chunk)
+if not headers:
+    sys.stderr.write("BLAST options error: no sequences in input\\n")
+    sys.exit(1)
+if "-taxid_map" in opts:
+    with open(opts["-taxid_map"]) as f:
+        mapped = {line.split()[0] for line in f if line.strip()}
+    missing = [h for h in headers if h not in mapped]
+    if missing:
+        sys.stderr.write("Error: no taxid for " + missing[0] + "\\n")
+        sys.exit(1)
+with open(opts["-out"] + ".nhr", "w") as nhr:
+    nhr.write("\\n".join(headers))
+with open(opts["-out"] + ".nin", "w") as nin:
+    nin.write(f"{len(headers)} {residues}\\n")
+startup = float(os.environ.get("STUB_MAKEBLASTDB_STARTUP_MS", "0"))
+per_mb = float(os.environ.get("STUB_MAKEBLASTDB_MS_PER_MB", "0"))
+time.sleep((startup + per_mb * residues / 1e6) / 1000.0)
+'''
+
+# ``blastdbcmd -db <db> -info``, answered from the stub's ``.nin`` index.
+_INFO_STUB_SOURCE = '''\
+import sys
+args = sys.argv[1:]
+db = args[args.index("-db") + 1]
+with open(db + ".nin") as nin:
+    sequences, residues = nin.read().split()
+print("Database: " + db)
+print(f"\\t{int(sequences):,} sequences; {int(residues):,} total bases")
+'''
+
+
+def write_stub(bin_dir: Path) -> Path:
+    """Write executable stubs ``makeblastdb`` and ``blastdbcmd`` into ``bin_dir``.
+
+    Returns the ``makeblastdb`` stub.
+    """
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    for name, source in ((INFO_STUB_NAME, _INFO_STUB_SOURCE), (STUB_NAME, _STUB_SOURCE)):
+        stub = bin_dir / name
+        stub.write_text(f"#!{sys.executable}\n{source}")
+        stub.chmod(stub.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return stub
+
+
+@contextlib.contextmanager
+def stub_on_path(bin_dir: Path, log: Path, startup_ms: float = 0.0,
+                 ms_per_mb: float = 0.0) -> Iterator[Path]:
+    """Put the stub first on ``PATH`` for the duration of the block."""
+    stub = write_stub(bin_dir)
+    saved = {k: os.environ.get(k) for k in (
+        "PATH", "STUB_MAKEBLASTDB_LOG", "STUB_MAKEBLASTDB_STARTUP_MS",
+        "STUB_MAKEBLASTDB_MS_PER_MB")}
+    os.environ["PATH"] = f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+    os.environ["STUB_MAKEBLASTDB_LOG"] = str(log)
+    os.environ["STUB_MAKEBLASTDB_STARTUP_MS"] = str(startup_ms)
+    os.environ["STUB_MAKEBLASTDB_MS_PER_MB"] = str(ms_per_mb)
+    try:
+        yield stub
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def write_genomes(genomes_dir: Path, taxids: Sequence[int], genome_kb: int,
+                  contigs: int = 2, seed: int = 0) -> None:
+    """Deterministic multi-contig FASTA per taxid."""
+    rng = random.Random(seed)
+    genomes_dir.mkdir(parents=True, exist_ok=True)
+    per_contig = max(1, genome_kb * 1024 // contigs)
+    for taxid in taxids:
+        lines: List[str] = []
+        for n in range(contigs):
+            lines.append(f">NZ_CP{taxid:06d}.{n + 1} synthetic taxon {taxid}")
+            seq = "".join(rng.choice("ACGT") for _ in range(min(per_contig, 4096)))
+            seq = (seq * (per_contig // len(seq) + 1))[:per_contig]
+            lines.extend(seq[i:i + 80] for i in range(0, len(seq), 80))
+        (genomes_dir / f"{taxid}.fasta").write_text("\n".join(lines) + "\n")
+
+
+def _volume_files(db: Path) -> List[Path]:
+    alias = Path(f"{db}.nal")
+    if alias.exists():
+        from nanometa_live.core.utils.blast_db_scheduler import read_alias
+        files = [alias]
+        for name in read_alias(alias).get("DBLIST", "").split():
+            files.extend(_volume_files(alias.parent / name))
+        return files
+    return [Path(f"{db}{ext}") for ext in VOLUME_EXTS]
+
+
+def open_databases(manager, taxids: Sequence[int]) -> Dict[str, float]:
+    """Open every taxid's database the way a ``blastn -db`` start-up does."""
+    opened = 0
+    distinct = set()
+    start = time.perf_counter()
+    for taxid in taxids:
+        db = manager.get_blast_db_path(taxid)
+        for path in _volume_files(db):
+            with open(path, "rb") as f:
+                opened += 1
+                distinct.add(path)
+                if path.suffix == ".nal":
+                    f.read()
+                elif os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                        m[:64]
+    return {"files_opened": opened, "distinct_files": len(distinct),
+            "open_ms": (time.perf_counter() - start) * 1000}
+
+
+def run_mode(root: Path, taxids: Sequence[int], genome_kb: int, consolidated: bool,
+             startup_ms: float, ms_per_mb: float) -> Dict[str, float]:
+    """Build every taxid's database in a fresh data dir; measure build and open."""
+    from nanometa_live.core.utils.genome_manager import GenomeDownloadManager
+
+    data = root / ("consolidated" if consolidated else "per_taxid")
+    # Construct before the genomes exist, so the manager's own scan does
+    # not start building databases before the measured call.
+    manager = GenomeDownloadManager(cache_dir=str(data), offline_mode=True)
+    write_genomes(manager.genomes_dir, taxids, genome_kb)
+    log = data / "makeblastdb.log"
+    with stub_on_path(root / "bin", log, startup_ms, ms_per_mb):
+        start = time.perf_counter()
+        built = manager.build_blast_dbs_batch(list(taxids), consolidated=consolidated)
+        build_ms = (time.perf_counter() - start) * 1000
+    spawns = len(log.read_text().splitlines()) if log.exists() else 0
+    row: Dict[str, float] = {
+        "built": built,
+        "spawns": spawns,
+        "blast_files": sum(1 for _ in manager.blast_dir.iterdir()),
+        "build_ms": build_ms,
+    }
+    row.update(open_databases(manager, taxids))
+    return row
+
+
+def main(argv: Sequence[str] = ()) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--genomes", type=int, default=200)
+    parser.add_argument("--genome-kb", type=int, default=200)
+    parser.add_argument("--startup-ms", type=float, default=40.0,
+                        help="stub makeblastdb fixed cost per spawn")
+    parser.add_argument("--ms-per-mb", type=float, default=100.0,
+                        help="stub makeblastdb cost per MB of residues")
+    parser.add_argument("--json", action="store_true", help="print JSON rows")
+    args = parser.parse_args(list(argv) or None)
+
+    taxids = list(range(1000, 1000 + args.genomes))
+    rows = {}
+    with tempfile.TemporaryDirectory(prefix="blastdb_bench_") as tmp:
+        for consolidated in (False, True):
+            mode = "consolidated" if consolidated else "per_taxid"
+            rows[mode] = run_mode(Path(tmp), taxids, args.genome_kb, consolidated,
+                                  args.startup_ms, args.ms_per_mb)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(f"{args.genomes} genomes x {args.genome_kb} KB, stub makeblastdb "
+          f"{args.startup_ms:.0f} ms/spawn + {args.ms_per_mb:.0f} ms/MB")
+    print(f"{'mode':<14}{'built':>7}{'spawns':>8}{'files':>7}"
+          f"{'build ms':>10}{'opened':>8}{'distinct':>9}{'open ms':>9}")
+    for mode, r in rows.items():
+        print(f"{mode:<14}{r['built']:>7}{r['spawns']:>8}{r['blast_files']:>7}"
+              f"{r['build_ms']:>10.0f}{r['files_opened']:>8}{r['distinct_files']:>9}"
+              f"{r['open_ms']:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
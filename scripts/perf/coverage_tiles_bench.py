@@ -0,0 +1,108 @@
+"""Coverage depth plots: smoothed single trace vs multi-resolution tiles.
+
+Usage::
+
+    python -m scripts.perf.coverage_tiles_bench                # 5 Mb genome
+    python -m scripts.perf.coverage_tiles_bench --genome-mb 12 --reads 200000
+
+Writes a synthetic PAF over one reference and times:
+
+* ``build`` -- parsing the PAF and building its :class:`CoveragePyramid`,
+  paid once per PAF and MAPQ filter (then cached);
+* ``figures`` -- the three coverage figures for a species switch, before
+  (smoothing the whole depth array each time, the previous behaviour) and
+  after (reading the cached pyramid);
+* ``tile`` -- one zoom request at several window sizes, with the number of
+  blocks it touched and the block size of the level it read.
+
+Wall times are machine-dependent and only printed; nothing is gated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from nanometa_live.app.components import coverage_plots
+from nanometa_live.core.parsers import coverage_pyramid as cp
+
+
+def write_paf(path: Path, genome: int, reads: int, seed: int = 0) -> None:
+    rng = np.random.default_rng(seed)
+    lengths = np.minimum(rng.lognormal(8.5, 0.7, reads).astype(int) + 200, genome)
+    starts = (rng.random(reads) * (genome - lengths)).astype(int)
+    with open(path, "w") as fh:
+        for i, (start, length) in enumerate(zip(starts, lengths)):
+            fh.write(f"read{i}\t{length}\t0\t{length}\t+\tref1\t{genome}\t{start}\t"
+                     f"{start + length}\t{length}\t{length}\t60\n")
+
+
+def _smoothed(depth: np.ndarray) -> np.ndarray:
+    """The depth plot's former display series: moving average, then ~5000 points."""
+    window = max(1, len(depth) // 5000)
+    if window > 1:
+        depth = np.convolve(depth, np.ones(window) / window, mode="same")
+    return depth[::max(1, len(depth) // 5000)]
+
+
+def _time(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--genome-mb", type=float, default=5.0)
+    parser.add_argument("--reads", type=int, default=50_000)
+    parser.add_argument("--width", type=int, default=coverage_plots.DEPTH_PLOT_BINS)
+    args = parser.parse_args(argv)
+    genome = int(args.genome_mb * 1e6)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paf = Path(tmp) / "bench.paf"
+        write_paf(paf, genome, args.reads)
+        start = time.perf_counter()
+        pyramid = cp.load_coverage_pyramid(paf)
+        build = time.perf_counter() - start
+    coverage = pyramid.coverage
+    print(f"{genome:,} bp reference, {args.reads:,} reads, "
+          f"{len(pyramid.levels)} pyramid levels")
+    print(f"  build     {build * 1000:8.1f} ms  (once per PAF)")
+
+    def before():
+        _smoothed(coverage.depth_array)
+        depth = coverage.depth_array
+        np.sort(depth)
+        np.histogram(depth[depth > 0], bins=50)
+
+    def after():
+        coverage_plots.create_coverage_depth_figure(coverage, pyramid=pyramid)
+        coverage_plots.create_cumulative_coverage_figure(coverage, pyramid=pyramid)
+        coverage_plots.create_depth_histogram_figure(coverage, pyramid=pyramid)
+
+    print(f"  figures   before {_time(before) * 1000:8.1f} ms (numeric work only)  "
+          f"after {_time(after) * 1000:8.1f} ms (whole figures)")
+
+    for span in (genome, 1_000_000, 20_000, 1_000):
+        span = min(span, genome)
+        lo = (genome - span) // 2
+        seconds = _time(lambda: pyramid.view(lo, lo + span, args.width,
+                                             overview=coverage_plots.DEPTH_OVERVIEW_BINS))
+        tile = pyramid.tile(lo, lo + span, args.width)
+        touched = -(-span // tile["block"])
+        print(f"  tile {span:>10,} bp  {seconds * 1000:6.2f} ms  "
+              f"{touched:>6,} blocks  {tile['block']:>6,} bp/block")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
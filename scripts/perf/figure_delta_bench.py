@@ -0,0 +1,101 @@
+"""Taxonomy-figure refresh payload: full figure vs value-only patch.
+
+Usage::
+
+    python -m scripts.perf.figure_delta_bench                 # 2000 taxa
+    python -m scripts.perf.figure_delta_bench --taxa 8000 --max-taxa 0
+
+Builds two Kraken2 reports over the same taxonomy scaffold, the second
+with ``--growth`` more reads -- a steady-state tick where only counts
+moved (a large growth pushes new taxa over ``min_reads``, which is a real
+topology change and is reported as such) -- and renders
+the Sankey and Sunburst for each with the app's builders. For the second
+tick it reports:
+
+* ``full`` -- the JSON size of the complete figure, what every refresh
+  shipped before ``app.utils.figure_delta``;
+* ``patch`` -- the JSON size of the ``dash.Patch`` that ``delta_update``
+  sends instead, and the server-side cost of deciding (hashing the
+  topology).
+
+Payload size is the proxy for the client cost: a patch only replaces value
+and colour arrays, so Plotly restyles the existing nodes rather than
+rebuilding the figure. Nothing here needs a browser; wall times are only
+printed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import plotly.io as pio
+from dash import Patch
+from plotly.utils import PlotlyJSONEncoder
+
+from nanometa_live.app.tabs.classification_helpers import (
+    create_sankey_data,
+    create_sunburst_data,
+)
+from nanometa_live.app.utils.figure_delta import delta_update
+from nanometa_live.core.utils.classification_loaders import _parse_kraken2_report_uncached
+from scripts.perf.fixtures import FixtureSpec, _render_kraken_report
+from scripts.perf.poll import PERF_CONFIG, _DOMAINS, _TAX_LEVELS
+
+
+def _report_frame(spec: FixtureSpec, total_reads: int, folder: Path):
+    path = folder / f"tick_{total_reads}.kraken2.report.txt"
+    path.write_text(_render_kraken_report(spec, "barcode01", None, total_reads))
+    return _parse_kraken2_report_uncached(str(path), check_stability=False)
+
+
+def _builders(max_taxa: int):
+    return {
+        "sankey": lambda df: create_sankey_data(
+            df, _DOMAINS, _TAX_LEVELS, PERF_CONFIG["min_reads"], max_taxa),
+        "sunburst": lambda df: create_sunburst_data(
+            df, _DOMAINS, _TAX_LEVELS, PERF_CONFIG["min_reads"], PERF_CONFIG,
+            max_taxa_per_level=max_taxa),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--taxa", type=int, default=2000, help="taxa per report")
+    parser.add_argument("--max-taxa", type=int, default=9999,
+                        help="max taxa per level (0 = no limit)")
+    parser.add_argument("--growth", type=float, default=0.02,
+                        help="fractional read growth between the two ticks")
+    args = parser.parse_args(argv)
+    max_taxa = args.max_taxa or 9999
+
+    spec = FixtureSpec(n_samples=1, taxa_per_report=args.taxa)
+    with tempfile.TemporaryDirectory() as tmp:
+        before = _report_frame(spec, 1_000_000, Path(tmp))
+        after = _report_frame(spec, int(1_000_000 * (1 + args.growth)), Path(tmp))
+
+    print(f"{args.taxa} taxa per report, max {max_taxa} per level")
+    for name, build in _builders(max_taxa).items():
+        _fig, topology = delta_update(build(before), None)
+        fig = build(after)
+        start = time.perf_counter()
+        update, _ = delta_update(fig, topology)
+        decide_ms = (time.perf_counter() - start) * 1000
+        full = len(pio.to_json(fig, validate=False))
+        if not isinstance(update, Patch):
+            print(f"  {name:<9} topology changed; full figure {full / 1024:,.1f} KiB")
+            continue
+        ops = update.to_plotly_json()["operations"]
+        paths = ", ".join(".".join(map(str, op["location"][2:])) for op in ops)
+        patch = len(json.dumps(update.to_plotly_json(), cls=PlotlyJSONEncoder))
+        print(f"  {name:<9} full {full / 1024:8,.1f} KiB  patch {patch / 1024:8,.1f} KiB  "
+              f"({patch / full:5.1%})  decide {decide_ms:6.1f} ms  [{paths}]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
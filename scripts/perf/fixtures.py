@@ -46,6 +46,10 @@ LAYOUTS: Tuple[str, ...] = ("batch", "realtime_incremental", "realtime_cumulativ
 
 _DONE_MARKER = ".perf_fixture_done"
 
+# Bumped whenever a renderer changes what it writes, so a tree built by an
+# older harness is rebuilt rather than silently reused.
+_RENDER_VERSION = 2
+
 # Rank scaffold above the species level. Fan-out is fixed so the taxa count
 # is a deterministic function of the requested species count.
 _DOMAINS = 2
@@ -98,7 +102,9 @@ class FixtureSpec:
         return [f"barcode{i:02d}" for i in range(1, self.n_samples + 1)]
 
     def digest(self) -> str:
-        payload = json.dumps(asdict(self), sort_keys=True)
+        payload = json.dumps(
+            {**asdict(self), "render": _RENDER_VERSION}, sort_keys=True
+        )
         return hashlib.sha256(payload.encode()).hexdigest()[:16]
 
 
@@ -286,6 +292,38 @@ def _render_seqkit_tsv(spec: FixtureSpec, sample: str,
     return f"{header}\n{values}\n"
 
 
+# Per-cycle curves fastp writes for each read set. Real nanopore fastp JSONs
+# carry one point per cycle up to the longest read, plus a k-mer table and a
+# duplication histogram; the loaders use none of it, but it is most of the
+# bytes a naive json.load has to parse.
+_FASTP_CYCLES = 500
+_FASTP_BASES = ("A", "T", "C", "G")
+
+
+def _fastp_read_block(spec: FixtureSpec, sample: str, reads: int, avg_len: int,
+                      tag: str) -> Dict[str, object]:
+    cycles = _FASTP_CYCLES
+    curve = [round(12 + (_rng(spec.seed, sample, tag, i) % 1000) / 100.0, 2)
+             for i in range(cycles)]
+    content = [round(0.2 + (_rng(spec.seed, sample, tag, "gc", i) % 100) / 1000.0, 4)
+               for i in range(cycles)]
+    kmers = {}
+    for i in range(4 ** 5):
+        kmer = "".join(_FASTP_BASES[(i >> (2 * k)) & 3] for k in range(5))
+        kmers[kmer] = _rng(spec.seed, sample, tag, kmer) % 5000
+    return {
+        "total_reads": reads,
+        "total_bases": reads * avg_len,
+        "q20_bases": int(reads * avg_len * 0.94),
+        "q30_bases": int(reads * avg_len * 0.81),
+        "total_cycles": cycles,
+        "quality_curves": {**{b: curve for b in _FASTP_BASES}, "mean": curve},
+        "content_curves": {**{b: content for b in _FASTP_BASES},
+                           "N": [0.0] * cycles, "GC": content},
+        "kmer_count": kmers,
+    }
+
+
 def _render_fastp_json(spec: FixtureSpec, sample: str) -> str:
     reads_before = _reads_for(spec, sample, None)
     reads_after = int(reads_before * 0.93)
@@ -311,6 +349,15 @@ def _render_fastp_json(spec: FixtureSpec, sample: str) -> str:
             "passed_filter_reads": reads_after,
             "low_quality_reads": reads_before - reads_after,
         },
+        "duplication": {
+            "rate": 0.012,
+            "histogram": [_spread(spec.seed, 0, 9000, "dup", sample, i)
+                          for i in range(256)],
+        },
+        "read1_before_filtering": _fastp_read_block(
+            spec, sample, reads_before, avg_len, "before"),
+        "read1_after_filtering": _fastp_read_block(
+            spec, sample, reads_after, avg_len, "after"),
     }
     return json.dumps(payload, indent=2)
 
@@ -449,6 +496,13 @@ def touch_all(root: Path, layout: str) -> None:
         touch_sample(root, sample, layout)
 
 
+def clear_derived_state(root: Path) -> None:
+    """Remove files the loaders write next to the results (QC sketches)."""
+    from nanometa_live.core.utils.qc_sketch import SKETCH_DIRNAME
+
+    shutil.rmtree(root / SKETCH_DIRNAME, ignore_errors=True)
+
+
 def build_fixture(spec: FixtureSpec, base: Path) -> Path:
     """Materialise the tree for ``spec`` under ``base`` and validate it.
 
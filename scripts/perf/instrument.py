@@ -63,9 +63,11 @@ ALL_METRICS: Tuple[str, ...] = tuple(
 
 @dataclass
 class CountResult:
-    """Syscall counts plus loader-cache occupancy for one measured region."""
+    """Syscall counts, JSON parse volume and loader-cache occupancy for one region."""
 
     counts: Counter = field(default_factory=Counter)
+    json_bytes: int = 0
+    json_parse_ms: float = 0.0
     frame_cache_len: int = 0
     frame_cache_evictions: int = 0
 
@@ -91,22 +93,47 @@ def count_syscalls() -> Iterator[CountResult]:
 
         return wrapper
 
+    def json_load_wrapper(fn: Callable, label: str) -> Callable:
+        # Also records the bytes handed to the parser and the time spent in
+        # it: the count alone cannot tell a 2 KB summary from a 200 KB fastp
+        # document carrying per-cycle curves.
+        def wrapper(fp, *args, **kwargs):
+            counts[label] += 1
+            try:
+                result.json_bytes += os.fstat(fp.fileno()).st_size
+            except (AttributeError, OSError, ValueError):
+                pass
+            start = time.perf_counter()
+            try:
+                return fn(fp, *args, **kwargs)
+            finally:
+                result.json_parse_ms += (time.perf_counter() - start) * 1000.0
+
+        return wrapper
+
     for module, attr, label in _TARGETS:
         original = getattr(module, attr)
         originals.append((module, attr, original))
-        setattr(module, attr, make_wrapper(original, label))
+        wrap = json_load_wrapper if label == "json.load" else make_wrapper
+        setattr(module, attr, wrap(original, label))
 
     # pandas.read_csv is patched separately: the loaders import it as
     # ``pd.read_csv``, so patching the pandas module attribute is what
     # actually intercepts them.
     import pandas as pd
 
+    from nanometa_live.core.utils.json_ingest import json_parse_stats
+
     pd_original = pd.read_csv
+    json_before = json_parse_stats()
     pd.read_csv = make_wrapper(pd_original, "pandas.read_csv")
 
     try:
         yield result
     finally:
+        json_after = json_parse_stats()
+        result.json_bytes += int(json_after["bytes"] - json_before["bytes"])
+        result.json_parse_ms += (json_after["seconds"] - json_before["seconds"]) * 1000.0
         pd.read_csv = pd_original
         for module, attr, original in reversed(originals):
             setattr(module, attr, original)
@@ -147,21 +174,24 @@ def report_frame_cache_len() -> int:
 def reset_caches() -> None:
     """Drop every module-level loader cache, restoring a cold-start state.
 
-    Maintenance hazard: a new module-level cache added anywhere in the loader
-    stack and not cleared here silently invalidates every "cold" measurement,
-    because the second and later cells would start warm. When adding a cache,
-    add it here.
+    Every ``BoundedCache`` is cleared through the registry, process-wide
+    ones included. Maintenance hazard: a module-level cache that is NOT a
+    ``BoundedCache`` and is not cleared here silently invalidates every
+    "cold" measurement, because the second and later cells would start warm.
     """
-    from nanometa_live.core.utils import classification_loaders as cl
+    from nanometa_live.core.utils import json_ingest as ji
     from nanometa_live.core.utils import loader_utils as lu
+    from nanometa_live.core.utils import qc_sketch as qs
+    from nanometa_live.core.utils import results_catalog as rc
     from nanometa_live.core.utils import sample_detector as sd
+    from nanometa_live.core.utils.bounded_cache import clear_caches
 
     lu.clear_data_cache()
+    ji.clear_json_cache()
+    qs.clear_sketch_cache()
+    rc.clear_catalog()
     lu._last_freshness_fingerprint = ""
-    cl.clear_report_frame_cache()
-
-    with sd._sample_cache_lock:
-        sd._sample_cache.clear()
+    clear_caches()
 
     # Optional caches -- present in some versions of the loader stack.
     for module, name in ((lu, "_poll_fingerprint_cache"),
@@ -0,0 +1,121 @@
+"""Kraken2 per-read output reduction benchmark.
+
+Usage::
+
+    python -m scripts.perf.kraken_reads_bench                  # 1M reads
+    python -m scripts.perf.kraken_reads_bench --reads 5000000 --taxa 5000
+    python -m scripts.perf.kraken_reads_bench --tokens 12 --paired
+
+Writes a synthetic per-read output file (``C``/``U`` lines, nanopore-like
+lengths, ``taxid:k-mers`` mappings with ambiguous ``A:`` runs) and folds it
+into a :class:`TaxonProfiles` three ways:
+
+* ``vectorised`` -- :func:`reduce_stream`, the path the app uses;
+* ``per-line`` -- the pure-Python fallback taken by chunks the vectorised
+  path cannot decode (``--paired`` forces it for every chunk);
+* ``tail`` -- a second :func:`update_sample_profiles` after appending 1% more
+  reads, which must read only the appended bytes.
+
+Reports lines/s and MB/s for each, and checks that both reducers agree.
+Wall times are machine-dependent and only printed; nothing is gated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from nanometa_live.core.parsers import kraken_read_profiles as krp
+
+
+def write_reads(path: str, n_reads: int, n_taxa: int, tokens: int,
+                paired: bool = False, seed: int = 0, mode: str = "w") -> int:
+    """Append ``n_reads`` synthetic per-read lines to ``path``; returns bytes."""
+    rng = np.random.default_rng(seed)
+    taxa = rng.integers(1, 3_000_000, size=n_taxa)
+    written = 0
+    with open(path, mode) as fh:
+        for start in range(0, n_reads, 100_000):
+            n = min(100_000, n_reads - start)
+            assigned = taxa[rng.zipf(1.5, size=n) % n_taxa]
+            lengths = rng.lognormal(8.0, 0.8, size=n).astype(int) + 50
+            classified = rng.random(n) > 0.1
+            lines = []
+            for i in range(n):
+                kmers = max(lengths[i] - 34, 1)
+                split = rng.integers(1, tokens + 1)
+                share = kmers // split
+                others = taxa[rng.integers(0, n_taxa, size=split - 1)].tolist()
+                parts = [f"{t}:{share}" for t in others] + [f"{assigned[i]}:{kmers - share * (split - 1)}"]
+                if i % 7 == 0:
+                    parts.append("A:31")
+                tag, tid = ("C", assigned[i]) if classified[i] else ("U", 0)
+                length = f"{lengths[i] // 2}|{lengths[i] - lengths[i] // 2}" if paired else lengths[i]
+                kmer_col = " ".join(parts[:-1] + ["|:|"] + parts[-1:]) if paired else " ".join(parts)
+                lines.append(f"{tag}\t{start + i:032x}\t{tid}\t{length}\t{kmer_col}\n")
+            block = "".join(lines)
+            fh.write(block)
+            written += len(block)
+    return written
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _report(label: str, n_lines: int, n_bytes: int, seconds: float) -> None:
+    print(f"  {label:<11} {seconds:7.3f}s  {n_lines / seconds / 1e6:6.2f} M lines/s  "
+          f"{n_bytes / seconds / 1e6:7.1f} MB/s")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--reads", type=int, default=1_000_000)
+    parser.add_argument("--taxa", type=int, default=2000)
+    parser.add_argument("--tokens", type=int, default=4,
+                        help="maximum taxid:k-mer tokens per read")
+    parser.add_argument("--paired", action="store_true",
+                        help="paired-end len|len lines (per-line fallback)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kraken_dir = os.path.join(tmp, "results", "kraken2")
+        os.makedirs(kraken_dir)
+        path = os.path.join(kraken_dir, "bench.kraken2")
+        n_bytes = write_reads(path, args.reads, args.taxa, args.tokens, args.paired)
+        print(f"{args.reads:,} reads, {n_bytes / 1e6:.1f} MB, {args.taxa} taxa")
+
+        vectorised = krp.TaxonProfiles()
+        with open(path, "rb") as fh:
+            seconds = _time(lambda: krp.reduce_stream(fh, vectorised))
+        _report("vectorised", args.reads, n_bytes, seconds)
+
+        with open(path, "rb") as fh:
+            data = fh.read()
+        per_line = krp.TaxonProfiles()
+        seconds = _time(lambda: per_line.add(*krp._reduce_per_line(data)))
+        _report("per-line", args.reads, n_bytes, seconds)
+
+        rows = per_line._rows(vectorised.taxids)
+        agree = (np.array_equal(vectorised.reads, per_line.reads[rows])
+                 and np.array_equal(vectorised.confidence_hist, per_line.confidence_hist[rows]))
+        print(f"  reducers agree: {agree}; {len(vectorised)} taxa held")
+
+        krp.update_sample_profiles(kraken_dir, "bench", [path])
+        extra = max(args.reads // 100, 1)
+        extra_bytes = write_reads(path, extra, args.taxa, args.tokens, args.paired,
+                                  seed=1, mode="a")
+        seconds = _time(lambda: krp.update_sample_profiles(kraken_dir, "bench", [path]))
+        _report("tail", extra, extra_bytes, seconds)
+    return 0 if agree else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
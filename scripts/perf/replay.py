@@ -0,0 +1,542 @@
+"""Live-run replay: stream a synthetic nanometanf run and poll it headlessly.
+
+Usage::
+
+    python -m scripts.perf.replay                              # 12 barcodes, 2 h
+    python -m scripts.perf.replay --barcodes 96 --hours 8 --rate 2
+    python -m scripts.perf.replay --json-out replay.json --max-exponent 1.2
+
+:mod:`scripts.perf.scaling_bench` measures one poll against a static tree.
+A field deployment instead sees a tree that grows for hours: every barcode
+gains a Kraken2 batch report, its ``stats/`` marker and a seqkit batch TSV
+at sequencing rate, fastp rewrites its cumulative JSON, validation results
+land as species cross thresholds, and Nextflow appends to its trace. A cache
+that is never pruned or a loader whose cost grows with the file count only
+shows up under that workload, and only after the first hour.
+
+The replay runs on a simulated clock. Each tick advances it by
+``--tick-seconds`` (the dashboard polling interval), writes every file whose
+arrival time falls inside the tick, then runs :func:`simulate_poll` under
+:func:`instrument.count_syscalls`. Nothing sleeps unless ``--speed`` asks
+for it, so eight simulated hours take minutes.
+
+Writes land through a temporary dotfile and :func:`os.replace`, as the
+pipeline's publishDir does, so a poll never sees a half-written report.
+The one exception is the Nextflow trace, which is appended in place because
+that is what Nextflow does. Every published file is stamped a few seconds
+in the past; ``_is_file_stable`` would otherwise hide it until the next tick
+and the replay would lag the run it describes.
+
+Per tick the driver records poll latency, resident set size and the gated
+syscall counts. The summary reports latency percentiles, RSS growth and the
+log-log slope of latency and ``os.stat`` against the number of files in the
+tree: a slope near 1 means each poll pays for the whole tree, and above 1
+means something is super-linear.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.perf import fixtures as fx  # noqa: E402
+from scripts.perf import instrument as inst  # noqa: E402
+from scripts.perf.poll import simulate_poll  # noqa: E402
+from scripts.perf.scaling_bench import _scaling_exponent  # noqa: E402
+
+MAX_BARCODES = 96
+
+# Published files are stamped this far in the past so the stability check
+# accepts them on the tick they arrive.
+_PUBLISH_AGE_S = 5.0
+
+# Nextflow trace columns, in the order ``trace.fields`` writes by default.
+_TRACE_COLUMNS = (
+    "task_id", "hash", "native_id", "name", "status", "exit", "submit",
+    "duration", "realtime", "%cpu", "peak_rss", "peak_vmem", "rchar", "wchar",
+)
+_TRACE_PROCESSES = ("KRAKEN2_REALTIME", "SEQKIT_STATS")
+
+# Ticks at each end of the run compared for the drift figures.
+_DRIFT_WINDOW = 0.1
+
+
+@dataclass(frozen=True)
+class ReplaySpec:
+    """Everything that determines what a replay writes and when."""
+
+    n_barcodes: int = 12
+    batches_per_minute: float = 1.0
+    hours: float = 2.0
+    tick_seconds: float = 30.0
+    taxa_per_report: int = 300
+    fastp_every: int = 5
+    validation_every: int = 10
+    seed: int = 1337
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.n_barcodes <= MAX_BARCODES:
+            raise ValueError(f"n_barcodes must be in 1..{MAX_BARCODES}")
+        if self.batches_per_minute <= 0:
+            raise ValueError("batches_per_minute must be > 0")
+        if self.hours <= 0 or self.tick_seconds <= 0:
+            raise ValueError("hours and tick_seconds must be > 0")
+
+    @property
+    def duration_s(self) -> float:
+        return self.hours * 3600.0
+
+    @property
+    def n_ticks(self) -> int:
+        return max(1, math.ceil(self.duration_s / self.tick_seconds))
+
+    @property
+    def interval_s(self) -> float:
+        return 60.0 / self.batches_per_minute
+
+    @property
+    def expected_batches(self) -> int:
+        return max(1, int(self.duration_s // self.interval_s) + 1)
+
+    def fixture_spec(self) -> fx.FixtureSpec:
+        """The fixture spec whose renderers produce this run's files."""
+        return fx.FixtureSpec(
+            n_samples=self.n_barcodes,
+            layout="realtime_incremental",
+            taxa_per_report=self.taxa_per_report,
+            batches_per_sample=self.expected_batches,
+            seed=self.seed,
+        )
+
+
+@dataclass
+class Tick:
+    """One polling tick of the replay."""
+
+    index: int
+    sim_s: float
+    files_written: int
+    files_total: int
+    latency_ms: float
+    rss_mb: float
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "sim_s": round(self.sim_s, 1),
+            "files_written": self.files_written,
+            "files_total": self.files_total,
+            "latency_ms": round(self.latency_ms, 2),
+            "rss_mb": round(self.rss_mb, 2),
+            "counts": self.counts,
+        }
+
+
+# --------------------------------------------------------------------------
+# Arrival schedule
+# --------------------------------------------------------------------------
+
+def arrival_schedule(spec: ReplaySpec) -> List[Tuple[float, str, int]]:
+    """Every ``(sim_seconds, barcode, batch)`` arrival in time order.
+
+    Barcodes are phase-shifted by a stable per-barcode offset so arrivals
+    spread across ticks instead of landing together, as they do on a real
+    flow cell.
+    """
+    events: List[Tuple[float, str, int]] = []
+    interval = spec.interval_s
+    for barcode in spec.fixture_spec().sample_names:
+        phase = fx._spread(spec.seed, 0, 999, "phase", barcode) / 1000.0 * interval
+        batch = 1
+        t = phase
+        while t < spec.duration_s:
+            events.append((t, barcode, batch))
+            batch += 1
+            t = phase + (batch - 1) * interval
+    events.sort()
+    return events
+
+
+# --------------------------------------------------------------------------
+# Publishing
+# --------------------------------------------------------------------------
+
+def publish(path: Path, content: str) -> None:
+    """Write ``content`` to ``path`` atomically and stamp it stable.
+
+    The temporary name is a dotfile in the target directory, so it is on the
+    same filesystem for :func:`os.replace` and no loader glob matches it.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.part")
+    tmp.write_text(content)
+    stamp = time.time() - _PUBLISH_AGE_S
+    os.utime(tmp, (stamp, stamp))
+    os.replace(tmp, path)
+
+
+class RunWriter:
+    """Materialises arrivals into an outdir laid out like nanometanf's."""
+
+    def __init__(self, spec: ReplaySpec, root: Path) -> None:
+        from nanometa_live.core.testing.mock_data_generator import MockDataGenerator
+
+        self.spec = spec
+        self.fixture = spec.fixture_spec()
+        self.root = root
+        self.files_total = 0
+        self._task_id = 0
+        self._organisms = MockDataGenerator.COMMON_ORGANISMS
+        self._trace = root / "pipeline_info" / "execution_trace.txt"
+        for sub in ("kraken2", "seqkit", "fastp", "validation", "pipeline_info"):
+            (root / sub).mkdir(parents=True, exist_ok=True)
+        self._trace.write_text("\t".join(_TRACE_COLUMNS) + "\n")
+        self.files_total += 1
+
+    def _publish(self, path: Path, content: str) -> None:
+        existed = path.exists()
+        publish(path, content)
+        if not existed:
+            self.files_total += 1
+
+    def write_batch(self, barcode: str, batch: int) -> int:
+        """Publish everything one batch produces; return the file count."""
+        fixture = self.fixture
+        reads = fx._reads_for(fixture, barcode, batch)
+        sample_dir = self.root / "kraken2" / barcode
+        self._publish(
+            sample_dir / "batch_reports" / f"batch_{batch}.kraken2.report.txt",
+            fx._render_kraken_report(fixture, barcode, batch, reads),
+        )
+        self._publish(
+            sample_dir / "stats" / f"batch_{batch}_report_stats.json",
+            json.dumps({"batch_id": batch, "sample": barcode, "reads": reads}),
+        )
+        self._publish(
+            self.root / "seqkit" / barcode / "batch_stats" / f"batch_{batch}.tsv",
+            fx._render_seqkit_tsv(fixture, barcode, batch),
+        )
+        written = 3
+        if batch % self.spec.fastp_every == 0:
+            self._publish(self.root / "fastp" / f"{barcode}.fastp.json",
+                          fx._render_fastp_json(fixture, barcode))
+            written += 1
+        if batch % self.spec.validation_every == 0:
+            self._write_validation(barcode, batch)
+            written += 1
+        self._append_trace(barcode, batch)
+        return written
+
+    def _write_validation(self, barcode: str, batch: int) -> None:
+        organism = self._organisms[
+            fx._rng(self.spec.seed, "validate", barcode, batch) % len(self._organisms)
+        ]
+        total = fx._spread(self.spec.seed, 20, 2000, "vreads", barcode, batch)
+        validated = total * fx._spread(self.spec.seed, 40, 99, "vpct", barcode, batch) // 100
+        payload = {
+            "sample_id": barcode,
+            "taxid": organism["taxid"],
+            "species": organism["name"],
+            "total_reads": total,
+            "validated_reads": validated,
+            "percent_validated": round(validated / total * 100, 2),
+            "percent_identity_mean": 97.5,
+            "validation_method": "blast",
+            "timestamp": f"batch_{batch}",
+        }
+        self._publish(
+            self.root / "validation" / "blast"
+            / f"{barcode}_taxid{organism['taxid']}_validation.json",
+            json.dumps(payload, indent=2),
+        )
+
+    def _append_trace(self, barcode: str, batch: int) -> None:
+        rows = []
+        for process in _TRACE_PROCESSES:
+            self._task_id += 1
+            rows.append("\t".join(str(v) for v in (
+                self._task_id, f"{self._task_id:02x}/{batch:06x}", self._task_id,
+                f"{process} ({barcode}_batch{batch})", "COMPLETED", 0,
+                "-", "4.2s", "3.9s", "98.0%", "512 MB", "1 GB", "80 MB", "2 MB",
+            )))
+        with open(self._trace, "a") as fh:
+            fh.write("\n".join(rows) + "\n")
+
+
+# --------------------------------------------------------------------------
+# Measurement
+# --------------------------------------------------------------------------
+
+def current_rss_mb() -> float:
+    """Resident set size of this process, in MiB.
+
+    Uses psutil when installed; otherwise ``ru_maxrss``, which is the peak
+    rather than the current value but still rises with a leak.
+    """
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty sequence."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def run_replay(
+    spec: ReplaySpec,
+    root: Path,
+    *,
+    build_figures: bool = True,
+    speed: float = 0.0,
+    progress: bool = False,
+) -> List[Tick]:
+    """Stream ``spec`` into ``root`` and poll once per tick.
+
+    ``speed`` is simulated seconds per wall second; 0 runs flat out.
+    """
+    inst.reset_caches()
+    writer = RunWriter(spec, root)
+    events = arrival_schedule(spec)
+    cursor = 0
+    ticks: List[Tick] = []
+    wall_start = time.perf_counter()
+
+    for index in range(spec.n_ticks):
+        sim_end = (index + 1) * spec.tick_seconds
+        written = 0
+        while cursor < len(events) and events[cursor][0] < sim_end:
+            _t, barcode, batch = events[cursor]
+            written += writer.write_batch(barcode, batch)
+            cursor += 1
+
+        if speed > 0:
+            lag = sim_end / speed - (time.perf_counter() - wall_start)
+            if lag > 0:
+                time.sleep(lag)
+
+        with inst.count_syscalls() as counted, inst.timed() as elapsed:
+            simulate_poll(str(root), build_figures=build_figures)
+        counts = counted.as_dict()
+        tick = Tick(
+            index=index,
+            sim_s=sim_end,
+            files_written=written,
+            files_total=writer.files_total,
+            latency_ms=elapsed[0],
+            rss_mb=current_rss_mb(),
+            counts={m: counts[m] for m in inst.GATED_METRICS},
+        )
+        ticks.append(tick)
+        if progress and (index % 20 == 0 or index == spec.n_ticks - 1):
+            print(
+                f"  t={sim_end / 60:7.1f}min  files={tick.files_total:>7}  "
+                f"poll={tick.latency_ms:8.1f}ms  rss={tick.rss_mb:7.1f}MB",
+                flush=True,
+            )
+    return ticks
+
+
+def _window_mean(values: Sequence[float], tail: bool) -> float:
+    size = max(1, int(len(values) * _DRIFT_WINDOW))
+    chunk = values[-size:] if tail else values[:size]
+    return sum(chunk) / len(chunk)
+
+
+def summarise(spec: ReplaySpec, ticks: Sequence[Tick]) -> Dict[str, Any]:
+    """Aggregate the per-tick series into the figures worth comparing."""
+    latencies = [t.latency_ms for t in ticks]
+    # Polls that saw no data yet are excluded from the slopes: log(0) has no
+    # meaning and the first few ticks are dominated by setup.
+    grown = [t for t in ticks if t.files_total > 1 and t.latency_ms > 0]
+    files = [t.files_total for t in grown]
+    totals = {m: sum(t.counts.get(m, 0) for t in ticks) for m in inst.GATED_METRICS}
+    rss = [t.rss_mb for t in ticks]
+    return {
+        "spec": {
+            "n_barcodes": spec.n_barcodes,
+            "batches_per_minute": spec.batches_per_minute,
+            "hours": spec.hours,
+            "tick_seconds": spec.tick_seconds,
+            "taxa_per_report": spec.taxa_per_report,
+            "seed": spec.seed,
+        },
+        "ticks": len(ticks),
+        "files_total": ticks[-1].files_total if ticks else 0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2),
+            "max": round(max(latencies, default=0.0), 2),
+            "first_decile_mean": round(_window_mean(latencies, False), 2) if ticks else 0.0,
+            "last_decile_mean": round(_window_mean(latencies, True), 2) if ticks else 0.0,
+        },
+        "rss_mb": {
+            "start": round(rss[0], 2) if rss else 0.0,
+            "end": round(rss[-1], 2) if rss else 0.0,
+            "growth": round(rss[-1] - rss[0], 2) if rss else 0.0,
+            "growth_per_hour": round((rss[-1] - rss[0]) / spec.hours, 2) if rss else 0.0,
+        },
+        "syscalls_total": totals,
+        "exponent": {
+            "latency_vs_files": round(
+                _scaling_exponent(files, [t.latency_ms for t in grown]), 3),
+            "stat_vs_files": round(
+                _scaling_exponent(files, [t.counts.get("os.stat", 0) for t in grown]), 3),
+        },
+    }
+
+
+def render_summary(summary: Dict[str, Any]) -> str:
+    spec = summary["spec"]
+    lat = summary["latency_ms"]
+    rss = summary["rss_mb"]
+    exp = summary["exponent"]
+    lines = [
+        f"Replay: {spec['n_barcodes']} barcodes x {spec['hours']} h at "
+        f"{spec['batches_per_minute']} batches/min, "
+        f"{summary['ticks']} polls every {spec['tick_seconds']}s, "
+        f"{summary['files_total']} files at end",
+        f"  poll latency ms   p50 {lat['p50']:.1f}  p95 {lat['p95']:.1f}  "
+        f"p99 {lat['p99']:.1f}  max {lat['max']:.1f}",
+        f"  drift             first 10% {lat['first_decile_mean']:.1f}  "
+        f"last 10% {lat['last_decile_mean']:.1f}",
+        f"  rss MB            {rss['start']:.1f} -> {rss['end']:.1f}  "
+        f"(+{rss['growth']:.1f}, {rss['growth_per_hour']:.1f}/h)",
+        f"  slope vs files    latency {exp['latency_vs_files']:.2f}  "
+        f"os.stat {exp['stat_vs_files']:.2f}",
+        "  syscalls          " + "  ".join(
+            f"{k}={v}" for k, v in summary["syscalls_total"].items()),
+    ]
+    return "\n".join(lines)
+
+
+def check_limits(summary: Dict[str, Any], max_exponent: Optional[float],
+                 max_rss_growth_mb: Optional[float]) -> List[str]:
+    failures = []
+    if max_exponent is not None:
+        for name, value in summary["exponent"].items():
+            if not math.isnan(value) and value > max_exponent:
+                failures.append(f"{name} slope {value:.2f} > {max_exponent:.2f}")
+    if max_rss_growth_mb is not None:
+        growth = summary["rss_mb"]["growth"]
+        if growth > max_rss_growth_mb:
+            failures.append(f"rss growth {growth:.1f} MB > {max_rss_growth_mb:.1f} MB")
+    return failures
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay a growing nanometanf run and measure every poll.",
+    )
+    parser.add_argument("--barcodes", type=int, default=12,
+                        help=f"barcodes streaming in parallel (1-{MAX_BARCODES})")
+    parser.add_argument("--rate", type=float, default=1.0,
+                        help="batches per minute per barcode (default 1); each "
+                             "batch publishes a report, its stats marker and a "
+                             "seqkit TSV")
+    parser.add_argument("--hours", type=float, default=2.0,
+                        help="simulated run length (default 2)")
+    parser.add_argument("--tick-seconds", type=float, default=30.0,
+                        help="simulated polling interval (default 30)")
+    parser.add_argument("--taxa", type=int, default=300,
+                        help="taxa per report (default 300)")
+    parser.add_argument("--fastp-every", type=int, default=5,
+                        help="rewrite the fastp JSON every N batches")
+    parser.add_argument("--validation-every", type=int, default=10,
+                        help="publish a validation result every N batches")
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--speed", type=float, default=0.0,
+                        help="simulated seconds per wall second; 0 runs flat out")
+    parser.add_argument("--outdir", type=Path, default=None,
+                        help="empty directory to stream into (default: a "
+                             "temporary directory, removed afterwards)")
+    parser.add_argument("--no-figures", action="store_true",
+                        help="skip Sankey/Sunburst so loader cost is isolated")
+    parser.add_argument("--max-exponent", type=float, default=None,
+                        help="exit non-zero if latency or os.stat grows faster "
+                             "than files**N")
+    parser.add_argument("--max-rss-growth-mb", type=float, default=None,
+                        help="exit non-zero if RSS grows by more than this")
+    parser.add_argument("--json-out", type=Path, default=None,
+                        help="write the summary and every tick as JSON")
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    # Early ticks legitimately find no fastp or seqkit output yet; the
+    # loaders' warnings about it would bury the progress lines.
+    logging.basicConfig(level=logging.ERROR)
+
+    spec = ReplaySpec(
+        n_barcodes=args.barcodes,
+        batches_per_minute=args.rate,
+        hours=args.hours,
+        tick_seconds=args.tick_seconds,
+        taxa_per_report=args.taxa,
+        fastp_every=max(1, args.fastp_every),
+        validation_every=max(1, args.validation_every),
+        seed=args.seed,
+    )
+
+    if args.outdir is not None:
+        if args.outdir.exists() and any(args.outdir.iterdir()):
+            parser.error(f"--outdir {args.outdir} is not empty")
+        args.outdir.mkdir(parents=True, exist_ok=True)
+        root, cleanup = args.outdir, False
+    else:
+        root, cleanup = Path(tempfile.mkdtemp(prefix="nanometa_replay_")), True
+
+    try:
+        ticks = run_replay(spec, root, build_figures=not args.no_figures,
+                           speed=args.speed, progress=not args.quiet)
+    finally:
+        inst.reset_caches()
+        if cleanup:
+            shutil.rmtree(root, ignore_errors=True)
+
+    summary = summarise(spec, ticks)
+    print(render_summary(summary))
+
+    if args.json_out:
+        document = {**summary, "series": [t.as_dict() for t in ticks]}
+        args.json_out.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"\nWrote {args.json_out}")
+
+    failures = check_limits(summary, args.max_exponent, args.max_rss_growth_mb)
+    if failures:
+        print("\nREPLAY LIMIT EXCEEDED")
+        for line in failures:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
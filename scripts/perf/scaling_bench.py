@@ -47,6 +47,10 @@ DEFAULT_LAYOUTS: Tuple[str, ...] = ("batch", "realtime_incremental")
 
 SCHEMA = 1
 
+# Baseline sections owned by other benchmarks (startup_bench, ...). They are
+# carried over unchanged when this driver rewrites the baseline.
+PRESERVED_SECTIONS: Tuple[str, ...] = ("startup",)
+
 # Gate thresholds. A regression must exceed both to fail, so trivially small
 # cells cannot trip on a couple of extra calls.
 GATE_RATIO = 1.05
@@ -65,6 +69,8 @@ class Cell:
     wall_med_ms: float = 0.0
     kraken_loads: int = 0
     frame_cache_len: int = 0
+    json_bytes: int = 0
+    json_parse_ms: float = 0.0
 
     @property
     def key(self) -> str:
@@ -77,6 +83,8 @@ class Cell:
             "wall_med_ms": round(self.wall_med_ms, 2),
             "kraken_loads": self.kraken_loads,
             "frame_cache_len": self.frame_cache_len,
+            "json_bytes": self.json_bytes,
+            "json_parse_ms": round(self.json_parse_ms, 2),
         }
 
 
@@ -92,6 +100,9 @@ def _prepare(scenario: str, root: Path, layout: str,
              build_figures: bool) -> None:
     """Put the caches and the tree into the state the scenario describes."""
     inst.reset_caches()
+    # Persisted QC sketches are derived state written by the poll itself;
+    # drop them so every cold cell is a first launch on the tree.
+    fx.clear_derived_state(root)
     if scenario == "cold":
         return
     # Every non-cold scenario starts from a warm cache.
@@ -128,6 +139,8 @@ def measure(spec: fx.FixtureSpec, scenario: str, base: Path,
         result = simulate_poll(str(root), build_figures=build_figures)
     cell.counts = counted.as_dict()
     cell.frame_cache_len = counted.frame_cache_len
+    cell.json_bytes = counted.json_bytes
+    cell.json_parse_ms = counted.json_parse_ms
     cell.kraken_loads = result.kraken_loads
 
     if result.samples != spec.n_samples:
@@ -238,12 +251,16 @@ def render_table(cells: Dict[str, Cell], baseline: Optional[Dict[str, Any]],
 
     out.append("")
     out.append("Wall time (informational; not gated)")
-    out.append(f"{'cell':<46} {'min ms':>9} {'med ms':>9} {'loads':>7} {'frames':>7}")
+    out.append(
+        f"{'cell':<46} {'min ms':>9} {'med ms':>9} {'loads':>7} {'frames':>7} "
+        f"{'json KB':>9} {'json ms':>8}"
+    )
     for key in sorted(cells):
         c = cells[key]
         out.append(
             f"{key:<46} {c.wall_min_ms:>9.1f} {c.wall_med_ms:>9.1f} "
-            f"{c.kraken_loads:>7} {c.frame_cache_len:>7}"
+            f"{c.kraken_loads:>7} {c.frame_cache_len:>7} "
+            f"{c.json_bytes / 1024.0:>9.1f} {c.json_parse_ms:>8.2f}"
         )
     return "\n".join(out)
 
@@ -380,6 +397,11 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         print(f"\nWrote {args.json_out}")
 
     if args.update_baseline:
+        if BASELINE_PATH.exists():
+            prior = json.loads(BASELINE_PATH.read_text())
+            for section in PRESERVED_SECTIONS:
+                if section in prior:
+                    document[section] = prior[section]
         BASELINE_PATH.write_text(json.dumps(document, indent=2) + "\n")
         print(f"\nWrote {BASELINE_PATH}")
 
@@ -0,0 +1,130 @@
+"""Worker processes with and without the shared cache tier.
+
+Usage::
+
+    python -m scripts.perf.shared_cache_bench                  # 1, 2, 4, 8 workers
+    python -m scripts.perf.shared_cache_bench --workers 1,4,16 --samples 48
+
+Builds a ``realtime_incremental`` fixture tree and starts N worker
+processes at once, each loading every sample's Kraken2 frame plus "All
+Samples" -- what N dashboard workers do on their first poll after new data
+lands. Each round runs twice: with ``NANOMETA_SHARED_CACHE`` unset (every
+worker parses) and pointing at a fresh directory (one worker parses per
+entry, the others map its result; ``core/utils/shared_frames.py``).
+
+Per round it prints the CPU time summed over all workers' load phase and
+the per-worker memory growth over that phase: PSS (proportional set size,
+which charges shared pages 1/N to each mapper) and USS (private pages).
+RSS counts a mapped page in full in every process, so it would hide the
+sharing. Memory is read from ``/proc/self/smaps_rollup`` (Linux).
+
+Wall times and memory are machine-dependent and only printed; nothing is
+gated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SHM = Path("/dev/shm")
+
+
+def _memory_kb() -> dict:
+    fields = {"Rss": 0, "Pss": 0, "Private_Clean": 0, "Private_Dirty": 0}
+    try:
+        with open("/proc/self/smaps_rollup") as fh:
+            for line in fh:
+                key, _, rest = line.partition(":")
+                if key in fields:
+                    fields[key] = int(rest.split()[0])
+    except OSError:
+        pass
+    return {"rss": fields["Rss"], "pss": fields["Pss"],
+            "uss": fields["Private_Clean"] + fields["Private_Dirty"]}
+
+
+def _worker(root: str, start_at: float) -> None:
+    """One worker: import, wait for the common start, load, report JSON."""
+    import gc
+
+    from nanometa_live.core.utils.classification_loaders import load_kraken_data
+    from nanometa_live.core.utils.sample_detector import get_available_samples
+
+    samples = get_available_samples(root)
+    gc.collect()
+    time.sleep(max(0.0, start_at - time.time()))
+    before, cpu = _memory_kb(), os.times()
+    for sample in samples + ["All Samples"]:
+        load_kraken_data(root, sample)
+    gc.collect()
+    after, done = _memory_kb(), os.times()
+    print(json.dumps({
+        "cpu": (done.user + done.system) - (cpu.user + cpu.system),
+        **{k: after[k] - before[k] for k in after},
+    }))
+
+
+def run_round(root: Path, workers: int, shared_dir) -> dict:
+    env = {k: v for k, v in os.environ.items() if k != "NANOMETA_SHARED_CACHE"}
+    if shared_dir is not None:
+        env["NANOMETA_SHARED_CACHE"] = str(shared_dir)
+    # Leave time for every interpreter to import before the load starts.
+    start_at = time.time() + 2.0 + 0.25 * workers
+    procs = [subprocess.Popen(
+        [sys.executable, "-m", "scripts.perf.shared_cache_bench",
+         "--worker", str(root), "--start-at", repr(start_at)],
+        env=env, stdout=subprocess.PIPE, text=True) for _ in range(workers)]
+    reports = [json.loads(p.communicate()[0].strip().splitlines()[-1]) for p in procs]
+    return {
+        "cpu": sum(r["cpu"] for r in reports),
+        **{k: sum(r[k] for r in reports) / workers for k in ("pss", "uss", "rss")},
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--samples", type=int, default=24)
+    parser.add_argument("--taxa", type=int, default=2000)
+    parser.add_argument("--batches", type=int, default=10)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--start-at", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.worker:
+        _worker(args.worker, args.start_at)
+        return 0
+
+    from scripts.perf.fixtures import FixtureSpec, build_fixture
+
+    base = Path(tempfile.mkdtemp(prefix="nanometa-shared-bench-"))
+    spec = FixtureSpec(n_samples=args.samples, layout="realtime_incremental",
+                       taxa_per_report=args.taxa, batches_per_sample=args.batches)
+    root = build_fixture(spec, base)
+    shm_base = SHM if SHM.is_dir() else base
+    print(f"{args.samples} samples x {args.batches} batches, {args.taxa} taxa per report")
+    print(f"{'workers':>7}  {'mode':<6} {'total CPU s':>11} "
+          f"{'PSS MB/worker':>13} {'USS MB/worker':>13} {'RSS MB/worker':>13}")
+    for n in (int(w) for w in args.workers.split(",")):
+        for mode in ("off", "shared"):
+            shared_dir = (Path(tempfile.mkdtemp(prefix="nanometa-", dir=shm_base))
+                          if mode == "shared" else None)
+            try:
+                r = run_round(root, n, shared_dir)
+            finally:
+                if shared_dir is not None:
+                    subprocess.run(["rm", "-rf", str(shared_dir)], check=False)
+            print(f"{n:>7}  {mode:<6} {r['cpu']:>11.2f} {r['pss'] / 1024:>13.1f} "
+                  f"{r['uss'] / 1024:>13.1f} {r['rss'] / 1024:>13.1f}")
+    subprocess.run(["rm", "-rf", str(base)], check=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
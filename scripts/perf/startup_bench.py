@@ -0,0 +1,227 @@
+"""Dashboard cold-start benchmark: import time and time to first response.
+
+Usage::
+
+    python -m scripts.perf.startup_bench                  # eager and lazy
+    python -m scripts.perf.startup_bench --modes lazy --repeat 5
+    python -m scripts.perf.startup_bench --update-baseline
+
+Two numbers per startup mode, each measured in a fresh interpreter so no
+module is already imported:
+
+* ``import_ms`` -- ``python -X importtime -c "import nanometa_live.app.app"``,
+  the cumulative time of the top-level import. The slowest package-owned
+  modules are listed alongside it (informational) so a regression can be
+  attributed to the module that introduced it.
+* ``first_response_ms`` -- wall time from launching a server process to the
+  first successful ``GET /_dash-layout``, i.e. until a browser could render
+  the shell. ``create_app_ms`` is the part of that spent inside
+  ``create_app`` (layouts plus callback registration).
+
+``eager`` builds every tab at startup (the default); ``lazy`` is the
+``lazy_tabs`` mode, which builds only the shell and the Dashboard.
+
+Wall times are machine-dependent, so unlike the per-poll counts nothing is
+gated on them; the numbers are recorded under ``startup`` in
+``scripts/perf/baseline.json`` to be compared on the same machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+MODES: Tuple[str, ...] = ("eager", "lazy")
+IMPORT_TARGET = "nanometa_live.app.app"
+FIRST_RESPONSE_PATH = "/_dash-layout"
+SERVER_TIMEOUT_S = 120.0
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Parse ``-X importtime`` output into ``(module, self_us, cumulative_us)``."""
+    rows: List[Tuple[str, int, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+        except ValueError:
+            continue
+    return rows
+
+
+def measure_import(python: str = sys.executable) -> Dict[str, Any]:
+    """Import the app module in a fresh interpreter under ``-X importtime``."""
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {IMPORT_TARGET}"],
+        cwd=str(REPO_ROOT), capture_output=True, text=True, check=True,
+    )
+    rows = parse_importtime(proc.stderr)
+    total = next((cum for name, _s, cum in rows if name == IMPORT_TARGET), 0)
+    own = sorted(
+        (r for r in rows if r[0].startswith("nanometa_live.")),
+        key=lambda r: r[2], reverse=True,
+    )[:10]
+    return {
+        "import_ms": round(total / 1000.0, 1),
+        "slowest_package_modules_ms": {name: round(cum / 1000.0, 1) for name, _s, cum in own},
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve(mode: str, port: int) -> None:
+    """Child process body: build the app in *mode* and serve it."""
+    start = time.perf_counter()
+    from nanometa_live.app.app import create_app
+    from nanometa_live.core.config.config_loader import ConfigLoader
+    from nanometa_live.core.workflow.backend_manager import BackendManager
+
+    data_dir = os.environ["NANOMETA_DATA_DIR"]
+    config = ConfigLoader(os.path.join(data_dir, "configs")).create_default_config()
+    config.update({
+        "data_dir": data_dir,
+        "genome_cache_dir": data_dir,
+        "offline_mode": True,
+        "lazy_tabs": mode == "lazy",
+    })
+    imported = time.perf_counter()
+    app = create_app(config, data_dir, BackendManager(data_dir))
+    built = time.perf_counter()
+    print(json.dumps({
+        "child_import_ms": round((imported - start) * 1000.0, 1),
+        "create_app_ms": round((built - imported) * 1000.0, 1),
+    }), flush=True)
+    app.run(host="127.0.0.1", port=port, debug=False, threaded=True)
+
+
+def measure_first_response(mode: str, python: str = sys.executable) -> Dict[str, Any]:
+    """Launch a server in *mode* and time it to the first layout response."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}{FIRST_RESPONSE_PATH}"
+    with tempfile.TemporaryDirectory(prefix="nanometa-startup-") as data_dir:
+        env = dict(os.environ, NANOMETA_DATA_DIR=data_dir, PYTHONPATH=str(REPO_ROOT))
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [python, "-m", "scripts.perf.startup_bench", "--serve", mode,
+             "--port", str(port)],
+            cwd=str(REPO_ROOT), env=env, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True,
+        )
+        try:
+            elapsed = _wait_for_response(url, proc, start)
+            child = json.loads(proc.stdout.readline() or "{}")
+        finally:
+            proc.terminate()
+            try:
+                proc.wait(10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+    return {"first_response_ms": round(elapsed * 1000.0, 1), **child}
+
+
+def _wait_for_response(url: str, proc: subprocess.Popen, start: float) -> float:
+    while time.perf_counter() - start < SERVER_TIMEOUT_S:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with status {proc.returncode}")
+        try:
+            with urllib.request.urlopen(url, timeout=5) as resp:
+                if resp.status == 200:
+                    resp.read()
+                    return time.perf_counter() - start
+        except (urllib.error.URLError, ConnectionError, OSError):
+            time.sleep(0.02)
+    raise TimeoutError(f"no response from {url} within {SERVER_TIMEOUT_S:.0f}s")
+
+
+def run(modes: Sequence[str], repeat: int) -> Dict[str, Any]:
+    """Measure every mode *repeat* times; report the minimum of each number."""
+    results: Dict[str, Any] = {}
+    for mode in modes:
+        imports = [measure_import() for _ in range(repeat)]
+        responses = [measure_first_response(mode) for _ in range(repeat)]
+        best_import = min(imports, key=lambda r: r["import_ms"])
+        results[mode] = {
+            "import_ms": best_import["import_ms"],
+            "first_response_ms": min(r["first_response_ms"] for r in responses),
+            "create_app_ms": min(r.get("create_app_ms", 0.0) for r in responses),
+            "slowest_package_modules_ms": best_import["slowest_package_modules_ms"],
+        }
+    return results
+
+
+def render(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> str:
+    base = (baseline or {}).get("modes", {})
+    out = [f"{'mode':<8} {'import ms':>10} {'create_app ms':>14} {'first resp ms':>14}"]
+    for mode, r in results.items():
+        out.append(
+            f"{mode:<8} {r['import_ms']:>10.1f} {r['create_app_ms']:>14.1f} "
+            f"{r['first_response_ms']:>14.1f}"
+        )
+        if mode in base:
+            b = base[mode]
+            out.append(
+                f"{'  base':<8} {b['import_ms']:>10.1f} {b['create_app_ms']:>14.1f} "
+                f"{b['first_response_ms']:>14.1f}"
+            )
+    return "\n".join(out)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure dashboard cold start.")
+    parser.add_argument("--modes", default=",".join(MODES),
+                        help=f"comma-separated, from {MODES}")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="launches per mode; the minimum is reported")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help=f"record results under 'startup' in {BASELINE_PATH}")
+    parser.add_argument("--json-out", type=Path, default=None)
+    parser.add_argument("--serve", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        _serve(args.serve, args.port)
+        return 0
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    results = run(modes, max(1, args.repeat))
+
+    document: Dict[str, Any] = {}
+    if BASELINE_PATH.exists():
+        document = json.loads(BASELINE_PATH.read_text())
+    print(render(results, document.get("startup")))
+
+    section = {"repeat": args.repeat, "modes": results}
+    if args.json_out:
+        args.json_out.write_text(json.dumps(section, indent=2) + "\n")
+        print(f"\nWrote {args.json_out}")
+    if args.update_baseline:
+        document["startup"] = section
+        BASELINE_PATH.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"\nWrote startup section to {BASELINE_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,240 @@
+"""Per-batch abundance series: absorbed once, queried without re-reading."""
+
+import os
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from nanometa_live.app.components.abundance_trend_plot import create_abundance_trend_figure
+from nanometa_live.core.utils import abundance_timeseries as ats
+from nanometa_live.core.utils import classification_loaders
+from nanometa_live.core.utils.abundance_timeseries import AbundanceStore, series_path
+from nanometa_live.core.utils.alert_engine import AlertEngine
+
+pytestmark = pytest.mark.unit
+
+ANTHRACIS = (1392, "Bacillus anthracis")
+COLI = (562, "Escherichia coli")
+BASE_TS = time.time() - 3600
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    ats.clear_abundance_series_cache()
+    classification_loaders.clear_report_frame_cache()
+    yield
+    ats.clear_abundance_series_cache()
+    classification_loaders.clear_report_frame_cache()
+
+
+def _report(path, species, batch):
+    """Write a Kraken2 report of ``{(taxid, name): reads}`` dated by batch."""
+    total = sum(species.values())
+    rows = [f"100.00\t{total}\t0\tR\t1\troot\n"]
+    rows += [f"1.00\t{reads}\t{reads}\tS\t{taxid}\t    {name}\n"
+             for (taxid, name), reads in species.items()]
+    path.write_text("".join(rows))
+    ts = BASE_TS + 60 * batch
+    os.utime(path, (ts, ts))
+
+
+def _incremental(kraken_dir, sample, batches):
+    reports = kraken_dir / sample / "batch_reports"
+    stats = kraken_dir / sample / "stats"
+    reports.mkdir(parents=True, exist_ok=True)
+    stats.mkdir(parents=True, exist_ok=True)
+    for n, species in batches:
+        _report(reports / f"batch_{n}.kraken2.report.txt", species, n)
+        (stats / f"batch_{n}_report_stats.json").write_text("{}")
+
+
+@pytest.fixture
+def results(tmp_path):
+    kraken = tmp_path / "kraken2"
+    _incremental(kraken, "barcode01", [
+        (n, {COLI: 100, ANTHRACIS: 5 * 2 ** n if n >= 3 else 0}) for n in range(8)
+    ])
+    _incremental(kraken, "barcode02", [(n, {COLI: 100 - 5 * n}) for n in range(8)])
+    return tmp_path
+
+
+def _parse_spy():
+    return patch.object(classification_loaders, "_parse_kraken2_report",
+                        wraps=classification_loaders._parse_kraken2_report)
+
+
+class TestQueries:
+    def test_first_seen_is_the_first_batch_with_reads(self, results):
+        store = AbundanceStore.for_results(str(results))
+        ts, sample, batch = store.first_seen(ANTHRACIS[0])
+        assert (sample, batch) == ("barcode01", 3)
+        assert ts == pytest.approx(BASE_TS + 180)
+        assert store.first_seen(ANTHRACIS[0], sample="barcode02") is None
+
+    def test_rate_trend_is_per_batch_reads_and_rate(self, results):
+        trend = AbundanceStore.for_results(str(results)).rate_trend(
+            ANTHRACIS[0], sample="barcode01")
+        assert trend["batch"].tolist() == list(range(8))
+        assert trend["reads"].tolist() == [0, 0, 0, 40, 80, 160, 320, 640]
+        assert np.isnan(trend["reads_per_min"].iloc[0])
+        assert trend["reads_per_min"].iloc[-1] == pytest.approx(640.0)
+
+    def test_top_risers_rank_by_slope_and_report_first_sight(self, results):
+        (top, *rest) = AbundanceStore.for_results(str(results)).top_risers(k=5, window=3)
+        assert (top["sample"], top["taxid"], top["name"]) == ("barcode01", 1392, "Bacillus anthracis")
+        assert top["slope"] == pytest.approx(240.0)
+        assert top["rise_factor"] == pytest.approx(1120 / 3 / (120 / 3))
+        assert top["first_seen_batch"] == 3
+        # E. coli is flat in one sample and falling in the other.
+        assert rest == []
+
+    def test_queries_stay_fast_on_a_long_run(self, tmp_path):
+        series = ats.SampleSeries("barcode01")
+        rng = np.random.default_rng(0)
+        taxids = np.arange(1, 3001, dtype=np.int64)
+        for n in range(400):
+            series.add(ats.BatchRecord(f"batch_{n}", (n, n), n, BASE_TS + n,
+                                       taxids, rng.integers(1, 50, size=3000)))
+        series.names = {int(t): (f"sp{t}", "S") for t in taxids}
+        store = AbundanceStore(str(tmp_path / "kraken2"))
+        store.series["barcode01"] = series
+
+        start = time.perf_counter()
+        store.first_seen(1500)
+        store.rate_trend(1500)
+        store.top_risers(k=10)
+        assert time.perf_counter() - start < 0.25
+
+
+class TestIngestOnce:
+    def test_known_batches_are_only_stated(self, results):
+        AbundanceStore.for_results(str(results))
+        with _parse_spy() as parse:
+            AbundanceStore.for_results(str(results))
+        assert parse.call_count == 0
+
+        _incremental(results / "kraken2", "barcode01", [(8, {ANTHRACIS: 1280})])
+        with _parse_spy() as parse:
+            store = AbundanceStore.for_results(str(results))
+        assert [os.path.basename(c.args[0]) for c in parse.call_args_list] == [
+            "batch_8.kraken2.report.txt"]
+        assert store.rate_trend(ANTHRACIS[0], "barcode01", last_k=1)["reads"].tolist() == [1280]
+
+    def test_a_restart_replays_the_persisted_series(self, results):
+        before = AbundanceStore.for_results(str(results)).top_risers(window=3)
+        ats.clear_abundance_series_cache()  # a new process
+        with _parse_spy() as parse:
+            after = AbundanceStore.for_results(str(results)).top_risers(window=3)
+        assert parse.call_count == 0
+        assert after == before
+        assert os.path.exists(series_path(str(results / "kraken2"), "barcode01"))
+
+    def test_a_torn_last_line_is_absorbed_again(self, results):
+        AbundanceStore.for_results(str(results))
+        path = series_path(str(results / "kraken2"), "barcode02")
+        with open(path, "ab") as fh:
+            fh.write(b'{"schema":1,"file":"batch_9')
+        ats.clear_abundance_series_cache()
+        _incremental(results / "kraken2", "barcode02", [(8, {COLI: 1})])
+        store = AbundanceStore.for_results(str(results))
+        ats.clear_abundance_series_cache()
+        replayed = AbundanceStore.for_results(str(results))
+        assert len(replayed.series["barcode02"].ordered) == 9
+        assert replayed.rate_trend(COLI[0], "barcode02")["reads"].tolist() == \
+            store.rate_trend(COLI[0], "barcode02")["reads"].tolist()
+
+    def test_unstable_reports_wait_for_a_later_refresh(self, results):
+        _incremental(results / "kraken2", "barcode01", [(8, {ANTHRACIS: 1})])
+        fresh = results / "kraken2" / "barcode01" / "batch_reports" / "batch_8.kraken2.report.txt"
+        os.utime(fresh, None)  # just written
+        store = AbundanceStore.for_results(str(results))
+        assert store.series["barcode01"].ordered[-1].batch == 7
+
+    def test_legacy_snapshots_are_stored_as_deltas(self, tmp_path):
+        kraken = tmp_path / "kraken2"
+        kraken.mkdir()
+        for n, reads in enumerate([10, 30, 70]):
+            _report(kraken / f"barcode01_batch{n}.kraken2.report.txt", {ANTHRACIS: reads}, n)
+        trend = AbundanceStore.for_results(str(tmp_path)).rate_trend(ANTHRACIS[0])
+        assert trend["reads"].tolist() == [10, 20, 40]
+
+    def test_a_late_legacy_snapshot_is_not_counted_twice(self, tmp_path):
+        kraken = tmp_path / "kraken2"
+        kraken.mkdir()
+        for n, reads in enumerate([10, 30, 70]):
+            _report(kraken / f"barcode01_batch{n}.kraken2.report.txt", {ANTHRACIS: reads}, n)
+        late = kraken / "barcode01_batch1.kraken2.report.txt"
+        os.utime(late, None)  # batch 1 still being written, batch 2 done
+        first = AbundanceStore.for_results(str(tmp_path)).rate_trend(ANTHRACIS[0])
+        assert first["reads"].tolist() == [10]
+        ts = BASE_TS + 60
+        os.utime(late, (ts, ts))
+        trend = AbundanceStore.for_results(str(tmp_path)).rate_trend(ANTHRACIS[0])
+        assert trend["reads"].tolist() == [10, 20, 40]
+        assert trend["reads"].sum() == 70
+
+    def test_an_update_never_mutates_a_published_series(self, results):
+        held = AbundanceStore.for_results(str(results)).series["barcode01"]
+        ordered, first_seen = list(held.ordered), dict(held.first_seen)
+        _incremental(results / "kraken2", "barcode01", [(8, {(1280, "Staph"): 9})])
+        store = AbundanceStore.for_results(str(results))
+        assert store.series["barcode01"] is not held
+        assert held.ordered == ordered and held.first_seen == first_seen
+        assert len(store.series["barcode01"].ordered) == 9
+
+    def test_concurrent_refreshes_absorb_each_batch_once(self, results):
+        import threading
+
+        threads = [threading.Thread(target=AbundanceStore.for_results, args=(str(results),))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+        with open(series_path(str(results / "kraken2"), "barcode01")) as fh:
+            assert len(fh.read().splitlines()) == 8
+
+
+class TestConsumers:
+    def test_rising_pathogen_raises_a_rate_alert(self, results):
+        trends = AbundanceStore.for_results(str(results)).top_risers(window=3)
+        alerts = AlertEngine().generate_alerts(
+            status={"running": True}, samples=[], abundance_trends=trends)
+        rising = [a for a in alerts if a["message"].startswith("RISING")]
+        assert len(rising) == 1
+        assert "Bacillus anthracis" in rising[0]["message"]
+        assert rising[0]["samples"] == ["barcode01"]
+
+    def test_rising_commensal_is_not_alerted(self):
+        trends = [{"sample": "barcode01", "taxid": 562, "name": "Escherichia coli",
+                   "recent_reads": 900, "rise_factor": 5.0, "slope": 100.0, "batches": 5}]
+        alerts = AlertEngine()._check_abundance_trends(trends)
+        assert alerts == []
+
+    def test_trend_chart_draws_one_line_per_riser(self, results):
+        fig = create_abundance_trend_figure(AbundanceStore.for_results(str(results)), window=3)
+        assert [t.name for t in fig.data] == ["Bacillus anthracis"]
+        assert list(fig.data[0].y) == [0, 0, 0, 40, 80, 160, 320, 640]
+
+    def test_no_batch_reports_draws_nothing(self, tmp_path):
+        (tmp_path / "kraken2").mkdir()
+        store = AbundanceStore.for_results(str(tmp_path))
+        assert store.series == {} and create_abundance_trend_figure(store) is None
+
+    def test_fast_commensals_do_not_crowd_out_a_rising_pathogen(self, tmp_path):
+        from nanometa_live.app.tabs.dashboard_helpers import _load_abundance_trends
+
+        commensals = [(900000 + i, f"Commensal bacterium {i}") for i in range(60)]
+        _incremental(tmp_path / "kraken2", "barcode01", [
+            (n, {**{c: 10000 * n for c in commensals},
+                 ANTHRACIS: 5 * 2 ** n if n >= 3 else 0})
+            for n in range(8)
+        ])
+        trends = _load_abundance_trends(str(tmp_path))
+        assert trends[-1]["taxid"] == ANTHRACIS[0]  # the slowest of 61 risers
+        alerts = AlertEngine().generate_alerts(
+            status={"running": True}, samples=[], abundance_trends=trends)
+        rising = [a for a in alerts if a["message"].startswith("RISING")]
+        assert ["Bacillus anthracis" in a["message"] for a in rising] == [True]
@@ -0,0 +1,148 @@
+"""Tests for time-to-alert latency tracing."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+from nanometa_live.app.tabs.reports_helpers import build_alert_latency_panel
+from nanometa_live.core.utils import alert_latency as al
+from nanometa_live.core.utils import loader_utils as lu
+from nanometa_live.core.utils.alert_latency import (
+    AlertLatencyTracker,
+    alert_latency_summary,
+    load_latency_log,
+    sample_bucket,
+    summarise_events,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    lu.clear_data_cache()
+    al.clear_alert_latency()
+    yield
+    lu.clear_data_cache()
+    al.clear_alert_latency()
+
+
+def _land_report(results, name, age_s):
+    path = results / "kraken2" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("100.00\t10\t10\tR\t1\troot\n")
+    stamp = time.time() - age_s
+    os.utime(path, (stamp, stamp))
+    lu.check_data_freshness(str(results))  # the poll refreshes the catalog
+    return stamp
+
+
+def _trace(tracker, results, state="ALL_CLEAR", n_samples=3):
+    trace = tracker.begin("verdict", str(results))
+    trace.mark("loaded")
+    trace.mark("alert")
+    return trace.finish(state, n_samples)
+
+
+class TestTracker:
+    def test_stages_are_measured_from_the_newest_report_mtime(self, tmp_path):
+        _land_report(tmp_path, "a.kraken2.report.txt", age_s=60)
+        landed = _land_report(tmp_path, "b.kraken2.report.txt", age_s=30)
+        tracker = AlertLatencyTracker()
+        event = _trace(tracker, tmp_path, "ACTION_REQUIRED")
+        assert event["source_mtime"] == pytest.approx(landed, abs=0.01)
+        assert 29 <= event["loaded_s"] <= event["alert_s"] <= event["response_s"] < 40
+        assert event["state"] == "ACTION_REQUIRED"
+        assert event["samples"] == 3
+
+    def test_one_event_per_epoch_and_surface(self, tmp_path):
+        _land_report(tmp_path, "a.kraken2.report.txt", age_s=30)
+        tracker = AlertLatencyTracker()
+        assert _trace(tracker, tmp_path) is not None
+        assert _trace(tracker, tmp_path) is None
+        other = tracker.begin("alert_panel", str(tmp_path))
+        other.mark("loaded")
+        assert other.finish("NO_ALERTS", 3) is not None
+
+        _land_report(tmp_path, "b.kraken2.report.txt", age_s=5)
+        assert _trace(tracker, tmp_path) is not None
+        assert len(tracker.events(str(tmp_path))) == 3
+
+    def test_no_stamp_without_a_catalog_or_kraken_output(self, tmp_path):
+        tracker = AlertLatencyTracker()
+        assert _trace(tracker, tmp_path) is None  # freshness never ran
+        (tmp_path / "kraken2").mkdir()
+        lu.check_data_freshness(str(tmp_path))
+        assert _trace(tracker, tmp_path) is None  # nothing landed yet
+
+    def test_future_mtime_is_clamped_to_zero(self, tmp_path):
+        _land_report(tmp_path, "a.kraken2.report.txt", age_s=-3600)
+        event = _trace(AlertLatencyTracker(), tmp_path)
+        assert event["loaded_s"] == 0.0
+        assert event["response_s"] == 0.0
+
+
+class TestLog:
+    def test_events_are_appended_and_survive_a_restart(self, tmp_path):
+        _land_report(tmp_path, "a.kraken2.report.txt", age_s=20)
+        event = al.begin_alert_trace("verdict", str(tmp_path))
+        event.mark("loaded")
+        event.finish("ALL_CLEAR", 2)
+        assert len(load_latency_log(str(tmp_path))) == 1
+        assert alert_latency_summary(str(tmp_path))[0]["samples"] == "2-6"
+
+        al.clear_alert_latency()  # a new process: only the log remains
+        rows = alert_latency_summary(str(tmp_path))
+        assert rows[0]["response"]["n"] == 1
+
+    def test_log_stays_out_of_the_fingerprint(self, tmp_path):
+        _land_report(tmp_path, "a.kraken2.report.txt", age_s=20)
+        before = lu.check_data_freshness(str(tmp_path))
+        _trace(AlertLatencyTracker(), tmp_path)
+        assert os.path.isfile(al.latency_log_path(str(tmp_path)))
+        assert lu.check_data_freshness(str(tmp_path)) == before
+
+    def test_corrupt_lines_are_skipped(self, tmp_path):
+        with open(al.latency_log_path(str(tmp_path)), "w") as fh:
+            fh.write('{"surface": "verdict", "state": "X", "response_s": 3}\n{oops\n')
+        assert len(load_latency_log(str(tmp_path))) == 1
+
+
+class TestSummary:
+    def test_split_by_surface_state_and_sample_bucket(self):
+        events = [
+            {"surface": "verdict", "state": "ACTION_REQUIRED", "samples": 24,
+             "loaded_s": 10.0, "alert_s": 11.0, "response_s": s}
+            for s in (12.0, 40.0, 700.0)
+        ] + [{"surface": "verdict", "state": "ALL_CLEAR", "samples": 1,
+              "loaded_s": 1.0, "alert_s": 1.5, "response_s": 2.0}]
+        rows = summarise_events(events)
+        assert [(r["state"], r["samples"]) for r in rows] == [
+            ("ACTION_REQUIRED", "7-24"), ("ALL_CLEAR", "1")]
+        response = rows[0]["response"]
+        assert response["n"] == 3
+        assert response["p50"] == 40.0
+        assert response["max"] == 700.0
+        # <=30s, <=60s and >600s.
+        assert response["histogram"][4] == 1
+        assert response["histogram"][5] == 1
+        assert response["histogram"][-2] == 1
+        assert sum(response["histogram"]) == 3
+
+    @pytest.mark.parametrize("n,label", [(None, "unknown"), (1, "1"), (6, "2-6"),
+                                         (7, "7-24"), (96, "25-96"), (200, "97+")])
+    def test_sample_bucket(self, n, label):
+        assert sample_bucket(n) == label
+
+    def test_reports_panel(self):
+        assert build_alert_latency_panel([]) == ""
+        rows = summarise_events([{"surface": "verdict", "state": "ACTION_REQUIRED",
+                                  "samples": 3, "loaded_s": 4.0, "alert_s": 4.5,
+                                  "response_s": 5.0}])
+        rendered = json.dumps(build_alert_latency_panel(rows).to_plotly_json(),
+                              default=lambda o: o.to_plotly_json())
+        assert "Time to Alert" in rendered
+        assert "ACTION REQUIRED" in rendered
+        assert "5.0 s" in rendered
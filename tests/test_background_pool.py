@@ -0,0 +1,234 @@
+"""Tests for the lane-partitioned background-callback worker pool."""
+
+from __future__ import annotations
+
+import ast
+import pathlib
+import time
+
+import diskcache
+import pytest
+
+from nanometa_live.app.utils.background_pool import (
+    CANCELLED,
+    DEFAULT_WORKERS,
+    HEAVY,
+    HEAVY_CALLBACKS,
+    INTERACTIVE,
+    PooledDiskcacheManager,
+    format_queue_depth,
+    lane_for,
+    worker_counts_from_config,
+)
+
+APP_ROOT = pathlib.Path(__file__).resolve().parent.parent / "nanometa_live" / "app"
+
+
+def _background_callback_names():
+    names = set()
+    for path in APP_ROOT.rglob("*.py"):
+        tree = ast.parse(path.read_text())
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.FunctionDef):
+                continue
+            for dec in node.decorator_list:
+                if isinstance(dec, ast.Call) and any(
+                    kw.arg == "background" and getattr(kw.value, "value", None) is True
+                    for kw in dec.keywords
+                ):
+                    names.add(node.name)
+    return names
+
+
+class TestLaneRouting:
+    def test_every_heavy_name_is_a_real_background_callback(self):
+        # A renamed callback would silently fall into the interactive lane.
+        missing = HEAVY_CALLBACKS - _background_callback_names()
+        assert not missing, f"HEAVY_CALLBACKS names no background callback: {missing}"
+
+    def test_lane_for_uses_function_name(self):
+        def download_missing_genomes():
+            pass
+
+        def update_qc_stats():
+            pass
+
+        assert lane_for(download_missing_genomes) == HEAVY
+        assert lane_for(update_qc_stats) == INTERACTIVE
+
+
+class TestConfig:
+    def test_defaults_when_unset(self):
+        assert worker_counts_from_config({}) == DEFAULT_WORKERS
+        assert worker_counts_from_config(None) == DEFAULT_WORKERS
+
+    def test_explicit_values_and_zero(self):
+        counts = worker_counts_from_config({
+            "background_interactive_workers": "3",
+            "background_heavy_workers": 0,
+        })
+        assert counts == {INTERACTIVE: 3, HEAVY: 0}
+
+    def test_invalid_values_fall_back(self):
+        counts = worker_counts_from_config({
+            "background_interactive_workers": "many",
+            "background_heavy_workers": -1,
+        })
+        assert counts == DEFAULT_WORKERS
+
+
+class TestFormatQueueDepth:
+    def test_idle_is_empty(self):
+        assert format_queue_depth(None) == ""
+        assert format_queue_depth({INTERACTIVE: {"running": 0, "queued": 0}}) == ""
+
+    def test_lists_busy_lanes_only(self):
+        text = format_queue_depth({
+            INTERACTIVE: {"running": 0, "queued": 0},
+            HEAVY: {"running": 1, "queued": 2},
+        })
+        assert text == "Jobs: heavy 1 running, 2 queued"
+
+
+def _sleep_then_return(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def download_missing_genomes(seconds):  # routed to the heavy lane by name
+    return _sleep_then_return(seconds)
+
+
+def update_qc_stats(value):
+    return value
+
+
+def _wait_for(predicate, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.mark.integration
+def test_interactive_job_runs_while_heavy_lane_is_busy(tmp_path):
+    cache = diskcache.FanoutCache(str(tmp_path / "cache"), shards=2, timeout=1.0)
+    manager = PooledDiskcacheManager(cache, workers={INTERACTIVE: 1, HEAVY: 1})
+    try:
+        manager.start()
+        heavy_fn = manager.make_job_fn(download_missing_genomes, False)
+        quick_fn = manager.make_job_fn(update_qc_stats, False)
+
+        heavy_a = manager.call_job_fn("heavy-a", heavy_fn, [120], {})
+        heavy_b = manager.call_job_fn("heavy-b", heavy_fn, [120], {})
+        assert heavy_a.startswith(HEAVY) and heavy_b.startswith(HEAVY)
+        assert _wait_for(lambda: manager.queue_metrics()[HEAVY]["running"] == 1)
+        assert manager.queue_metrics()[HEAVY]["queued"] == 1
+
+        quick = manager.call_job_fn("quick", quick_fn, [42], {})
+        assert quick.startswith(INTERACTIVE)
+        assert _wait_for(lambda: manager.result_ready("quick"))
+        assert manager.get_result("quick", quick) == 42
+        assert not manager.job_running(quick)
+
+        # Cancelling the queued job never reaches a worker; cancelling the
+        # running one kills its worker.
+        manager.terminate_job(heavy_b)
+        manager.terminate_job(heavy_a)
+        assert not manager.job_running(heavy_a)
+        assert not manager.job_running(heavy_b)
+        metrics = manager.queue_metrics()
+        assert metrics[HEAVY]["running"] == 0
+        assert metrics[HEAVY]["queued"] == 0
+        assert metrics[HEAVY][CANCELLED] == 2
+        assert not manager.result_ready("heavy-a")
+    finally:
+        manager.shutdown()
+        cache.close()
+
+
+@pytest.mark.integration
+def test_cancelling_the_only_running_job_starts_the_next_one(tmp_path):
+    cache = diskcache.FanoutCache(str(tmp_path / "cache"), shards=2, timeout=1.0)
+    manager = PooledDiskcacheManager(cache, workers={INTERACTIVE: 0, HEAVY: 1})
+    try:
+        manager.start()
+        heavy_fn = manager.make_job_fn(download_missing_genomes, False)
+        running = manager.call_job_fn("heavy-a", heavy_fn, [120], {})
+        queued = manager.call_job_fn("heavy-b", heavy_fn, [0], {})
+        assert _wait_for(lambda: manager._state(running) == "running")
+
+        assert manager.cancel(running)
+        # No further submission and no poll: the cancel itself refills the lane.
+        assert _wait_for(lambda: manager.result_ready("heavy-b"))
+        assert manager.get_result("heavy-b", queued) == 0
+    finally:
+        manager.shutdown()
+        cache.close()
+
+
+@pytest.mark.integration
+def test_a_poll_replaces_workers_that_reached_their_job_quota(tmp_path):
+    cache = diskcache.FanoutCache(str(tmp_path / "cache"), shards=2, timeout=1.0)
+    manager = PooledDiskcacheManager(cache, workers={INTERACTIVE: 1, HEAVY: 0},
+                                     max_jobs_per_worker=1)
+    try:
+        manager.start()
+        quick_fn = manager.make_job_fn(update_qc_stats, False)
+        manager.call_job_fn("first", quick_fn, [1], {})
+        assert _wait_for(lambda: manager.result_ready("first"))
+        assert _wait_for(lambda: manager._lanes[INTERACTIVE].alive() == 0)
+
+        # Queued behind a lane with no workers left; polling must refill it.
+        lane = manager._lanes[INTERACTIVE]
+        job_id = "interactive-late"
+        cache.set(f"__nm_pool__{job_id}", {"state": "queued", "lane": INTERACTIVE})
+        lane.queue.put((job_id, quick_fn, "late", manager._make_progress_key("late"),
+                        [2], {}))
+        assert _wait_for(lambda: manager.job_running(job_id) is False
+                         and manager.result_ready("late"))
+        assert lane.alive() == 1
+    finally:
+        manager.shutdown()
+        cache.close()
+
+
+def test_terminating_finished_job_is_a_noop(tmp_path):
+    cache = diskcache.FanoutCache(str(tmp_path / "cache"), shards=2, timeout=1.0)
+    manager = PooledDiskcacheManager(cache, workers={INTERACTIVE: 1, HEAVY: 0})
+    try:
+        # Dash calls terminate_job right after get_result; that must not
+        # cancel anything or kill the worker.
+        cache.set("__nm_pool__interactive-x", {"state": "done"})
+        assert manager.cancel("interactive-x") is False
+        assert manager.job_running("interactive-x") is False
+    finally:
+        cache.close()
+
+
+def test_collecting_a_result_does_not_kill_the_worker(tmp_path):
+    """get_result -> terminate_job while the worker is still in job_fn's tail.
+
+    The result is written inside job_fn; the worker records DONE only
+    after job_fn returns. terminate_job in between must not cancel.
+    """
+    import subprocess
+    import sys
+
+    cache = diskcache.FanoutCache(str(tmp_path / "cache"), shards=2, timeout=1.0)
+    manager = PooledDiskcacheManager(cache, workers={INTERACTIVE: 1, HEAVY: 0})
+    worker = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    try:
+        cache.set("__nm_pool__interactive-x",
+                  {"state": "running", "lane": INTERACTIVE, "pid": worker.pid})
+        cache.set("result-key", 42)
+        assert manager.get_result("result-key", "interactive-x") == 42
+        assert worker.poll() is None
+        assert manager.cancel("interactive-x") is False
+        assert not manager.job_running("interactive-x")
+    finally:
+        worker.kill()
+        worker.wait()
+        cache.close()
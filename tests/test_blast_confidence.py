@@ -60,3 +60,11 @@ def test_zero_reads_is_low():
 def test_reasons_are_populated():
     c = classification_confidence(96.0, 0.5, 0.9, 100)
     assert isinstance(c["reasons"], list) and c["reasons"]
+
+
+def test_weak_kmer_support_capped_to_moderate():
+    strong = dict(mean_identity=99.0, coverage_breadth=0.8, subject_agreement=1.0, n_reads=100)
+    assert classification_confidence(**strong, kmer_support=0.6)["level"] == "high"
+    c = classification_confidence(**strong, kmer_support=0.02)
+    assert c["level"] == "moderate"
+    assert any("k-mer" in r for r in c["reasons"])
@@ -69,6 +69,11 @@ class TestGenomeLookupTaxids:
         assert out == [DB_TAXID]
 
 
+def _built(mgr):
+    """Every taxid passed to the manager's batch builder."""
+    return [t for c in mgr.build_blast_dbs_batch.call_args_list for t in c.args[0]]
+
+
 class TestEnsureBlastDbsUsesGenomeTaxids:
     def _manager(self, genome_taxids):
         """Genome manager double: genomes exist only under ``genome_taxids``."""
@@ -90,7 +95,7 @@ class TestEnsureBlastDbsUsesGenomeTaxids:
     def test_builds_the_db_for_a_genome_cached_under_its_db_taxid(self):
         mgr = self._manager({DB_TAXID})
         _ensure_blast_dbs_for_validation(mgr, _genome_lookup_taxids(SPECIES))
-        built = [c.args[0] for c in mgr.build_blast_db.call_args_list]
+        built = _built(mgr)
         assert DB_TAXID in built, (
             "the whole Bioshield bacterial set reached the pipeline with no "
             "BLAST database and no warning: BLAST sub-tab silently empty"
@@ -101,12 +106,12 @@ class TestEnsureBlastDbsUsesGenomeTaxids:
         # status call reports no_genome, so nothing is built.
         mgr = self._manager({DB_TAXID})
         _ensure_blast_dbs_for_validation(mgr, [PSEUDO])
-        assert not mgr.build_blast_db.called
+        assert not mgr.build_blast_dbs_batch.called
 
     def test_ncbi_keyed_genome_still_builds(self):
         mgr = self._manager({NCBI_ONLY})
         _ensure_blast_dbs_for_validation(mgr, _genome_lookup_taxids(SPECIES))
-        built = [c.args[0] for c in mgr.build_blast_db.call_args_list]
+        built = _built(mgr)
         assert NCBI_ONLY in built
 
     def test_empty_list_is_a_noop(self):
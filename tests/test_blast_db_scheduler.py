@@ -0,0 +1,185 @@
+"""makeblastdb scheduling and consolidated databases, against a stub makeblastdb."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from nanometa_live.core.utils import blast_db_scheduler as sched
+from nanometa_live.core.utils.blast_db_scheduler import (
+    BuildJob,
+    BuildResources,
+    BuildScheduler,
+    read_alias,
+)
+from nanometa_live.core.utils.genome_manager import GenomeDownloadManager
+from scripts.perf.blastdb_bench import open_databases, stub_on_path, write_genomes
+
+pytestmark = pytest.mark.unit
+
+TAXIDS = [263, 632, 1392]
+
+
+def _job(key, size_mb):
+    return BuildJob(key, Path(f"/g/{key}.fasta"), size_mb, size_mb + 64)
+
+
+class TestScheduler:
+    def test_workers_fit_the_scarcest_resource(self):
+        jobs = [_job(i, 1) for i in range(20)]
+        plenty = BuildResources(free_cores=16, available_mb=64000, disk_mbps=1000)
+        assert BuildScheduler(plenty).workers_for(jobs) == 8
+        assert BuildScheduler(plenty, max_workers=3).workers_for(jobs) == 3
+        slow_disk = BuildResources(free_cores=16, available_mb=64000, disk_mbps=90)
+        assert BuildScheduler(slow_disk).workers_for(jobs) == 2
+        busy = BuildResources(free_cores=1.0, available_mb=64000, disk_mbps=1000)
+        assert BuildScheduler(busy).workers_for(jobs) == 1
+
+    def test_memory_budget_limits_concurrency_largest_first(self):
+        # 2000 MB available -> 1000 MB budget: two 500 MB genomes never overlap
+        # (564 MB each with overhead), the small ones fill around them.
+        scheduler = BuildScheduler(
+            BuildResources(free_cores=16, available_mb=2000, disk_mbps=None))
+        jobs = [_job("small1", 10), _job("big1", 500), _job("small2", 10),
+                _job("big2", 500)]
+        lock = threading.Lock()
+        live, overlap = set(), []
+
+        def build(key):
+            with lock:
+                live.add(key)
+                if {"big1", "big2"} <= live:
+                    overlap.append(key)
+            time.sleep(0.05)
+            with lock:
+                live.discard(key)
+            return True
+
+        results = scheduler.run(jobs, build)
+        assert results == {j.key: True for j in jobs}
+        assert scheduler.stats.order[:2] == ["big1", "big2"]
+        assert not overlap
+
+    def test_a_raising_build_is_a_failure_not_an_abort(self):
+        scheduler = BuildScheduler(BuildResources(free_cores=4))
+
+        def build(key):
+            if key == "bad":
+                raise OSError("disk full")
+            return True
+
+        assert scheduler.run([_job("bad", 1), _job("ok", 1)], build) == {
+            "bad": False, "ok": True}
+
+    def test_an_unexpected_exception_is_logged_and_a_failure(self, caplog):
+        def build(key):
+            if key == "bad":
+                raise ValueError("bad FASTA")
+            return True
+
+        results = BuildScheduler(BuildResources(free_cores=4)).run(
+            [_job("bad", 1), _job("ok", 1)], build)
+        assert results == {"bad": False, "ok": True}
+        assert "bad FASTA" in caplog.text
+
+
+@pytest.fixture
+def manager(tmp_path):
+    mgr = GenomeDownloadManager(cache_dir=str(tmp_path / "data"), offline_mode=True)
+    write_genomes(mgr.genomes_dir, TAXIDS, genome_kb=4)
+    return mgr
+
+
+@pytest.fixture
+def stub(tmp_path):
+    log = tmp_path / "makeblastdb.log"
+    with stub_on_path(tmp_path / "bin", log):
+        yield log
+
+
+def _spawns(log):
+    return log.read_text().splitlines()
+
+
+class TestConsolidated:
+    def test_one_spawn_and_an_alias_per_taxid(self, manager, stub):
+        assert manager.build_blast_dbs_batch(TAXIDS, consolidated=True) == 3
+        (call,) = _spawns(stub)
+        assert "-taxid_map" in call and "-parse_seqids" in call
+
+        ranges = []
+        for taxid in TAXIDS:
+            assert manager.get_blast_db_path(taxid) == manager.blast_dir / f"{taxid}.fasta"
+            alias = read_alias(manager.blast_dir / f"{taxid}.fasta.nal")
+            assert alias["DBLIST"].startswith(sched.CONSOLIDATED_PREFIX)
+            ranges.append((int(alias["FIRST_OID"]), int(alias["LAST_OID"])))
+        assert ranges == [(1, 2), (3, 4), (5, 6)]  # two contigs per genome
+        assert open_databases(manager, TAXIDS)["distinct_files"] == 3 + 3
+        assert not list(manager.blast_dir.glob(".consolidated_*"))  # inputs removed
+
+    def test_deleting_every_genome_prunes_the_combined_db(self, manager, stub):
+        manager.build_blast_dbs_batch(TAXIDS, consolidated=True)
+        manager.delete_genome(263)
+        assert not manager.has_blast_db(263)
+        assert manager.has_blast_db(632)
+        for taxid in (632, 1392):
+            manager.delete_genome(taxid)
+        assert list(manager.blast_dir.iterdir()) == []
+
+    def test_detailed_report_in_consolidated_mode(self, manager, stub):
+        with patch.object(GenomeDownloadManager, "_build_missing_blast_dbs"):
+            manager._scan_existing_genomes()  # register without auto-building
+        report = manager.build_missing_blast_dbs_detailed(consolidated=True)
+        assert (report["built"], report["failed"]) == (3, [])
+        again = manager.build_missing_blast_dbs_detailed(consolidated=True)
+        assert (again["built"], again["already_present"]) == (0, 3)
+        assert len(_spawns(stub)) == 1
+
+    def test_the_managers_mode_is_the_default(self, tmp_path, stub):
+        mgr = GenomeDownloadManager(cache_dir=str(tmp_path / "data"), offline_mode=True,
+                                    blast_db_mode="consolidated")
+        write_genomes(mgr.genomes_dir, TAXIDS, genome_kb=4)
+        assert mgr.build_blast_dbs_batch(TAXIDS) == 3
+        assert len(_spawns(stub)) == 1
+        assert all((mgr.blast_dir / f"{t}.fasta.nal").exists() for t in TAXIDS)
+
+    def test_auto_build_after_a_scan_honours_the_mode(self, manager, stub):
+        manager.blast_db_mode = "consolidated"
+        manager._scan_existing_genomes()
+        assert len(_spawns(stub)) == 1
+        assert all(manager.has_blast_db(t) for t in TAXIDS)
+
+    def test_empty_records_do_not_shift_the_ranges(self, manager, stub):
+        fasta = manager.genomes_dir / "263.fasta"
+        fasta.write_bytes(b">empty contig\n" + fasta.read_bytes() + b">trailing\n\n")
+        assert manager.build_blast_dbs_batch(TAXIDS, consolidated=True) == 3
+        alias = read_alias(manager.blast_dir / "632.fasta.nal")
+        assert (alias["FIRST_OID"], alias["LAST_OID"]) == ("3", "4")
+
+    def test_validation_prep_builds_one_consolidated_db(self, manager, stub):
+        from nanometa_live.core.config.parameter_mapping import (
+            _ensure_blast_dbs_for_validation,
+        )
+
+        manager.blast_db_mode = "consolidated"
+        with patch.object(GenomeDownloadManager, "_build_missing_blast_dbs"):
+            manager._scan_existing_genomes()
+        _ensure_blast_dbs_for_validation(manager, TAXIDS)
+        assert len(_spawns(stub)) == 1
+        assert all((manager.blast_dir / f"{t}.fasta.nal").exists() for t in TAXIDS)
+
+    def test_a_count_mismatch_writes_no_aliases(self, manager, stub):
+        with patch.object(sched, "_db_sequence_count", return_value=5):
+            assert manager.build_blast_dbs_batch(TAXIDS, consolidated=True) == 0
+        assert not list(manager.blast_dir.glob("*.nal"))
+        assert not list(manager.blast_dir.glob(f"{sched.CONSOLIDATED_PREFIX}*"))
+
+
+class TestPerTaxid:
+    def test_one_spawn_per_taxid_through_the_scheduler(self, manager, stub):
+        assert manager.build_blast_dbs_batch(TAXIDS) == 3
+        assert len(_spawns(stub)) == 3
+        assert all(manager.has_blast_db(t) for t in TAXIDS)
+        assert not list(manager.blast_dir.glob("*.nal"))
@@ -28,6 +28,12 @@ class TestCheckBlastDbsExist:
         )
         assert missing == ["1280"]
 
+    def test_consolidated_alias_counts_as_present(self, tmp_path):
+        blast_dir = tmp_path / "blast"
+        blast_dir.mkdir()
+        (blast_dir / "562.fasta.nal").write_text("DBLIST consolidated_abc\n")
+        assert check_blast_dbs_exist({"Escherichia coli": 562}, str(tmp_path)) == []
+
     def test_creates_blast_dir_when_absent(self, tmp_path):
         check_blast_dbs_exist({"E. coli": 562}, str(tmp_path))
         assert (tmp_path / "blast").is_dir()
@@ -0,0 +1,154 @@
+"""Bounded, instrumented caches and the registry behind cache resets."""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nanometa_live.core.utils import bounded_cache as bc
+from nanometa_live.core.utils.bounded_cache import BoundedCache, estimate_size
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def no_cap():
+    previous = bc.cache_memory_limit()
+    bc.set_cache_memory_limit(None)
+    yield
+    bc._limit_bytes = previous
+    with bc._registry_lock:
+        for name in [n for n in bc._registry if n.startswith("t_")]:
+            del bc._registry[name]
+
+
+class TestPolicies:
+    def test_least_recently_used_goes_first(self, no_cap):
+        cache = BoundedCache("t_lru", max_entries=2)
+        cache["a"], cache["b"] = 1, 2
+        assert cache["a"] == 1
+        cache["c"] = 3
+        assert list(cache) == ["a", "c"]
+        assert cache.stats()["evictions"] == {"entries": 1}
+
+    def test_byte_budget_evicts_and_refuses_oversize_values(self, no_cap):
+        cache = BoundedCache("t_bytes", max_bytes=100, sizeof=len)
+        cache["a"], cache["b"] = "x" * 60, "y" * 30
+        cache["c"] = "z" * 30
+        assert list(cache) == ["b", "c"] and cache.bytes == 60
+        cache["d"] = "w" * 101
+        assert "d" not in cache
+        assert cache.stats()["evictions"] == {"bytes": 1, "oversize": 1}
+
+    def test_entries_expire_after_ttl(self, monkeypatch, no_cap):
+        cache = BoundedCache("t_ttl", ttl=30)
+        cache["a"] = 1
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 31)
+        assert cache.get("a") is None and "a" not in cache
+        cache["b"] = 2
+        monkeypatch.setattr(time, "time", lambda: now + 62)
+        assert cache.expire() == 1 and len(cache) == 0
+
+    def test_reads_are_counted(self, no_cap):
+        cache = BoundedCache("t_counts")
+        cache["a"] = 1
+        cache.get("a"), cache.get("b")
+        with pytest.raises(KeyError):
+            cache["b"]
+        assert "a" in cache  # membership is not a read
+        assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+    def test_drop_in_for_a_dict(self, no_cap):
+        cache = BoundedCache("t_dict")
+        cache.update({"a": 1, "b": 2})
+        del cache["a"]
+        assert dict(cache) == {"b": 2} and cache.pop("b") == 2 and not cache
+
+
+class TestGlobalCap:
+    def test_oldest_entry_across_caches_is_evicted(self, monkeypatch, no_cap):
+        monkeypatch.setattr(bc, "_registry", {})
+        first = BoundedCache("t_cap_a", sizeof=lambda v: 400)
+        second = BoundedCache("t_cap_b", sizeof=lambda v: 400)
+        first["old"] = 1
+        second["x"] = 1
+        first["new"] = 1
+        assert first.get("new") == 1
+        bc.set_cache_memory_limit(900 / 1024 / 1024)
+        assert "old" not in first and "x" in second and "new" in first
+        assert first.stats()["evictions"] == {"memory": 1}
+
+    def test_limit_comes_from_the_environment(self, monkeypatch):
+        monkeypatch.setenv(bc.CACHE_MEMORY_ENV, "64")
+        assert bc._limit_from_env() == 64 * 1024 * 1024
+        monkeypatch.setenv(bc.CACHE_MEMORY_ENV, "0")
+        assert bc._limit_from_env() is None
+
+
+class TestRegistry:
+    def test_run_boundary_keeps_process_wide_caches(self, no_cap):
+        from nanometa_live.core.utils.loader_utils import clear_all_loader_caches
+
+        run = BoundedCache("t_run")
+        process = BoundedCache("t_process", run_scoped=False)
+        run["a"] = process["a"] = 1
+        clear_all_loader_caches()
+        assert not run and "a" in process
+        bc.clear_caches()
+        assert not process
+
+    def test_loader_caches_are_registered(self):
+        import nanometa_live.app.tabs.kraken2_helpers  # noqa: F401
+        import nanometa_live.core.utils.classification_loaders  # noqa: F401
+        import nanometa_live.core.utils.read_length_probe  # noqa: F401
+        import nanometa_live.app.tabs.dashboard_helpers  # noqa: F401
+        import nanometa_live.core.parsers.coverage_pyramid  # noqa: F401
+        import nanometa_live.core.utils.abundance_timeseries  # noqa: F401
+
+        names = set(bc.cache_stats())
+        assert {"kraken_ttl", "fastp_ttl", "mtime", "report_frame", "sample",
+                "read_lengths", "kraken2_taxonomy", "json_digest",
+                "validation_files", "validation_results", "coverage_pyramid",
+                "coverage_tokens", "per_sample_attribution",
+                "abundance_series"} <= names
+
+    def test_last_good_report_is_a_key_into_the_frame_cache(self, tmp_path, no_cap):
+        from nanometa_live.core.utils import classification_loaders as cl
+
+        report = tmp_path / "s.kraken2.report.txt"
+        report.write_text("100.00\t10\t0\tR\t1\troot\n50.00\t5\t5\tS\t562\t  E. coli\n")
+        old = time.time() - 60
+        os.utime(report, (old, old))
+        cl.clear_report_frame_cache()
+        assert cl._parse_kraken2_report(str(report)) is not None
+        (key,) = cl._last_good_key.values()
+        assert key in cl._report_frame_cache
+        assert cl._last_good_key.bytes < 1024
+        cl._report_frame_cache.clear()  # evicted: nothing stale is served
+        report.write_text("")
+        assert cl._parse_kraken2_report(str(report)) is None
+        cl.clear_report_frame_cache()
+
+    def test_an_evicted_pyramid_is_rebuilt_for_its_token(self, tmp_path):
+        from nanometa_live.core.parsers import coverage_pyramid as cp
+
+        paf = tmp_path / "s.paf"
+        paf.write_text("".join(
+            f"r{i}\t1000\t0\t1000\t+\tref\t5000\t{i * 10}\t{i * 10 + 1000}\t1000\t1000\t60\n"
+            for i in range(20)))
+        pyramid = cp.load_coverage_pyramid(paf)
+        assert cp._ledger._entries.bytes >= pyramid.nbytes > 0
+        cp._ledger.clear()  # what the global cap does under pressure
+        rebuilt = cp.published_pyramid(pyramid.token)
+        assert rebuilt is not None and rebuilt.token == pyramid.token
+        cp.clear_coverage_pyramids()
+
+
+def test_frame_size_estimate_tracks_memory_usage():
+    df = pd.DataFrame({"n": np.arange(5000), "name": [f"taxon {i}" for i in range(5000)]})
+    deep = df.memory_usage(index=True, deep=True).sum()
+    assert 0.7 * deep < estimate_size(df) < 1.5 * deep
+    assert estimate_size({i: i for i in range(10_000)}) > 10_000 * 50
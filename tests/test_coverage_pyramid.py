@@ -0,0 +1,143 @@
+"""Multi-resolution coverage tiles behind the validation-tab depth plots."""
+
+import numpy as np
+import pytest
+from dash import Dash, html
+
+from nanometa_live.app.components.coverage_plots import (
+    COVERAGE_TILE_ROUTE,
+    DEPTH_PLOT_BINS,
+    create_coverage_depth_figure,
+)
+from nanometa_live.core.parsers import coverage_pyramid as cp
+from nanometa_live.core.parsers.coverage_pyramid import (
+    CoveragePyramid,
+    load_coverage_pyramid,
+    published_pyramid,
+)
+from nanometa_live.core.parsers.paf_coverage_parser import CoverageData
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    cp.clear_coverage_pyramids()
+    yield
+    cp.clear_coverage_pyramids()
+
+
+def _coverage(n=100_003, seed=0):
+    rng = np.random.default_rng(seed)
+    depth = (rng.poisson(30, n) * (rng.random(n) < 0.8)).astype(np.uint32)
+    return CoverageData(ref_name="chr1", ref_length=n, depth_array=depth)
+
+
+def _paf(path, n_reads=20, ref_len=50_000):
+    lines = []
+    for i in range(n_reads):
+        start = (i * 2_000) % (ref_len - 5_000)
+        lines.append("\t".join(map(str, [
+            f"read{i}", 5000, 0, 5000, "+", "ref1", ref_len, start, start + 5000,
+            4900, 5000, 60 if i % 2 else 5])))
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class TestTiles:
+    @pytest.mark.parametrize("start,end,width", [
+        (0, 100_003, 700), (12_345, 67_890, 300), (99_000, 100_003, 50)])
+    def test_bins_match_the_raw_depth(self, start, end, width):
+        cov = _coverage()
+        tile = CoveragePyramid(cov).tile(start, end, width)
+        assert 0 < len(tile["x"]) <= width
+        edges = tile["x"] + [tile["end"]]
+        for i in range(len(tile["x"])):
+            segment = cov.depth_array[edges[i]:edges[i + 1]]
+            assert tile["min"][i] == segment.min() and tile["max"][i] == segment.max()
+            assert tile["mean"][i] == pytest.approx(segment.mean())
+
+    def test_a_narrow_window_is_served_per_base(self):
+        cov = _coverage()
+        tile = CoveragePyramid(cov).tile(40_000, 40_500, 1000)
+        assert tile["block"] == 1 and tile["x"] == list(range(40_000, 40_500))
+        assert tile["mean"] == cov.depth_array[40_000:40_500].tolist()
+
+    def test_request_cost_does_not_grow_with_the_window(self):
+        pyramid = CoveragePyramid(_coverage(n=2_000_000))
+        for span in (10_000, 200_000, 2_000_000):
+            tile = pyramid.tile(0, span, 500)
+            assert len(range(0, span, tile["block"])) < cp.FANOUT * 500
+
+    def test_view_keeps_an_overview_around_the_window(self):
+        tile = CoveragePyramid(_coverage()).view(40_000, 41_000, 200, overview=100)
+        x = np.asarray(tile["x"])
+        assert x[0] == 0 and x[-1] > 90_000 and (np.diff(x) > 0).all()
+        assert ((x >= 40_000) & (x < 41_000)).sum() >= 150
+
+    def test_histogram_statistics_match_numpy(self):
+        cov = _coverage()
+        pyramid = CoveragePyramid(cov)
+        covered = cov.depth_array[cov.depth_array > 0]
+        for q in (1, 50, 99):
+            assert pyramid.covered_percentile(q) == pytest.approx(np.percentile(covered, q))
+        thresholds = np.array([0, 1, 30, 10_000])
+        assert pyramid.count_at_or_above(thresholds).tolist() == [
+            int((cov.depth_array >= t).sum()) for t in thresholds]
+
+
+class TestCache:
+    def test_pyramid_is_reused_until_the_paf_changes(self, tmp_path):
+        paf = _paf(tmp_path / "s_taxid1.paf")
+        first = load_coverage_pyramid(paf)
+        assert load_coverage_pyramid(paf) is first
+        assert published_pyramid(first.token) is first
+        assert load_coverage_pyramid(paf, min_mapq=30) is not first
+        _paf(paf, n_reads=30)
+        assert load_coverage_pyramid(paf) is not first
+
+    def test_no_passing_alignment_is_none(self, tmp_path):
+        assert load_coverage_pyramid(_paf(tmp_path / "s.paf"), min_mapq=100) is None
+
+    def test_clear_data_cache_drops_pyramids(self, tmp_path):
+        from nanometa_live.core.utils.loader_utils import clear_data_cache
+
+        pyramid = load_coverage_pyramid(_paf(tmp_path / "s.paf"))
+        clear_data_cache()
+        assert published_pyramid(pyramid.token) is None
+
+
+class TestEndpointAndFigure:
+    def test_route_serves_a_published_window(self, tmp_path):
+        from nanometa_live.app.utils.coverage_tiles import register_coverage_tiles
+
+        app = Dash(__name__)
+        app.layout = html.Div()
+        register_coverage_tiles(app)
+        pyramid = load_coverage_pyramid(_paf(tmp_path / "s.paf"))
+        client = app.server.test_client()
+        tile = client.get(f"{COVERAGE_TILE_ROUTE}{pyramid.token}?start=1000&end=1400&width=800").json
+        assert tile["block"] == 1 and len(tile["x"]) == 400
+        assert client.get(f"{COVERAGE_TILE_ROUTE}unknown").status_code == 404
+        assert client.get(f"{COVERAGE_TILE_ROUTE}{pyramid.token}?start=x").status_code == 400
+
+    def test_figure_carries_the_tile_source(self, tmp_path):
+        pyramid = load_coverage_pyramid(_paf(tmp_path / "s.paf"))
+        fig = create_coverage_depth_figure(pyramid.coverage, threshold=15, pyramid=pyramid)
+        source = fig.layout.meta["coverage_tiles"]
+        assert source["url"] == COVERAGE_TILE_ROUTE + pyramid.token
+        assert source["threshold"] == 15 and source["width"] == DEPTH_PLOT_BINS
+        assert fig.layout.uirevision == pyramid.token
+        # mean, below-threshold, max, min: the order the clientside zoom relies on
+        assert [t.name for t in fig.data][:2] == ["Depth", "Below 15x"]
+        assert fig.data[3].fill == "tonexty"
+
+    def test_zoom_callback_is_registered(self):
+        from dash_test_utils import make_callback_app
+
+        from nanometa_live.app.tabs.validation_tab import register_validation_callbacks
+
+        app = make_callback_app(register_validation_callbacks)
+        zoom = [s for s in app.callback_map.values()
+                if any(i.get("property") == "relayoutData" for i in s["inputs"])]
+        assert zoom and "coverage-depth-plot.figure" in str(zoom[0]["output"])
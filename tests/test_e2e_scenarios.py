@@ -582,17 +582,23 @@ class TestBackendManagerOfflineGuard:
         )
 
 
-class TestBackendManagerFileCountTTL:
+class TestBackendManagerFileCountTracker:
     """``_update_file_counts`` must not os.listdir on every interval tick.
 
-    The TTL cache (P1-T09 from
-    docs/audit-2026-04-28-throughput-gui.md) reduces 24-barcode-multiplex
-    scan cost from 25 listdirs/tick to 25 listdirs / 5s, picked up
-    within one TTL cycle of any new file arriving.
+    The ingest tracker lists the input tree once and afterwards re-lists
+    only directories whose mtime changed (P1-T09 from
+    docs/audit-2026-04-28-throughput-gui.md, originally a 5 s TTL).
     """
 
-    def test_consecutive_calls_within_ttl_skip_listdir(self, tmp_path, monkeypatch):
-        """Two calls within the TTL window must result in only one listdir."""
+    @pytest.fixture(autouse=True)
+    def _fresh_trackers(self):
+        from nanometa_live.core.utils.ingest_tracker import reset_ingest_trackers
+        reset_ingest_trackers()
+        yield
+        reset_ingest_trackers()
+
+    def test_unchanged_input_is_not_listed_again(self, tmp_path, monkeypatch):
+        """Two calls with no new files must result in only one listing."""
         from nanometa_live.core.workflow.backend_manager import BackendManager
 
         nanopore_dir = tmp_path / "fastq_pass"
@@ -616,27 +622,29 @@ class TestBackendManagerFileCountTTL:
 
         listdir_calls.clear()
         bm._update_file_counts()
-        # Within TTL: must NOT have called listdir again
         assert listdir_calls == [], (
-            f"second call within TTL listdir'd {len(listdir_calls)} paths; "
-            "expected zero"
+            f"second call on an unchanged tree listdir'd {len(listdir_calls)} "
+            "paths; expected zero"
         )
 
-    def test_call_after_ttl_expires_rescans(self, tmp_path, monkeypatch):
-        """When the TTL window has elapsed, the filesystem is consulted again."""
+    def test_new_file_relists_only_its_directory(self, tmp_path, monkeypatch):
+        """A new file is counted on the next call, listing only its barcode dir."""
         from nanometa_live.core.workflow.backend_manager import BackendManager
 
         nanopore_dir = tmp_path / "fastq_pass"
-        nanopore_dir.mkdir()
-        (nanopore_dir / "reads.fastq.gz").write_bytes(b"x")
+        for bc in ("barcode01", "barcode02"):
+            (nanopore_dir / bc).mkdir(parents=True)
+            (nanopore_dir / bc / "reads_0.fastq.gz").write_bytes(b"x")
 
         bm = BackendManager(str(tmp_path))
         bm.config = {"nanopore_output_directory": str(nanopore_dir)}
         bm._update_file_counts()
+        assert bm.status["files_waiting"] == 2
 
-        # Force the cached_at timestamp far enough back that the TTL
-        # check below treats it as expired.
-        bm._file_count_cached_at = bm._file_count_cached_at - bm._FILE_COUNT_TTL_SECONDS - 1
+        new = nanopore_dir / "barcode02" / "reads_1.fastq.gz"
+        new.write_bytes(b"xy")
+        st = new.parent.stat()
+        os.utime(new.parent, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
 
         listdir_calls = []
         original_listdir = os.listdir
@@ -646,4 +654,6 @@ class TestBackendManagerFileCountTTL:
         monkeypatch.setattr(os, "listdir", counting_listdir)
 
         bm._update_file_counts()
-        assert len(listdir_calls) >= 1, "expired TTL must trigger a fresh scan"
+        assert bm.status["files_waiting"] == 3
+        assert bm.status["input_bytes"] == 4
+        assert listdir_calls == [os.path.realpath(nanopore_dir / "barcode02")]
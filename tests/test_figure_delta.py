@@ -0,0 +1,131 @@
+"""Value-only Sankey / Sunburst refreshes through ``dash.Patch``."""
+
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+from dash import Patch, no_update
+
+from nanometa_live.app.utils.figure_delta import delta_update, split_figure
+
+pytestmark = pytest.mark.unit
+
+
+def _sankey(counts, colors=("#111", "#222", "#333")):
+    """Root -> A, Root -> B; nodes and links ordered by count like the builder."""
+    nodes = [("Root", 0.01), ("A", 0.5), ("B", 0.5)]
+    order = [0] + sorted((1, 2), key=lambda i: -counts[i - 1])
+    position = {old: new for new, old in enumerate(order)}
+    links = sorted([(0, 1, counts[0]), (0, 2, counts[1])], key=lambda l: -l[2])
+    return go.Figure(go.Sankey(
+        arrangement="fixed",
+        node=dict(
+            label=[nodes[i][0] for i in order],
+            x=[nodes[i][1] for i in order],
+            y=[0.1 + 0.2 * position[i] for i in order],
+            color=[colors[i] for i in order],
+            customdata=[[sum(counts) if i == 0 else counts[i - 1], 1 / 3, "S", nodes[i][0]]
+                        for i in order],
+        ),
+        link=dict(source=[position[s] for s, _, _ in links],
+                  target=[position[t] for _, t, _ in links],
+                  value=[v for _, _, v in links],
+                  color=["rgba(0,0,0,0.3)"] * 2),
+    ))
+
+
+def _sunburst(values, ids=("root", "a", "b")):
+    return go.Figure(go.Sunburst(ids=list(ids), labels=list(ids), parents=["", "root", "root"],
+                                 values=list(values), branchvalues="total"))
+
+
+def _operations(patch):
+    return {tuple(op["location"][2:]): op["params"]["value"]
+            for op in patch.to_plotly_json()["operations"]}
+
+
+class TestTopology:
+    def test_reordering_by_value_keeps_the_hash(self):
+        assert split_figure(_sankey([10, 5]))[1] == split_figure(_sankey([5, 10]))[1]
+
+    def test_a_new_node_changes_the_hash(self):
+        assert (split_figure(_sunburst([3, 2, 1]))[1]
+                != split_figure(_sunburst([3, 2, 1], ids=("root", "a", "c")))[1])
+
+    def test_unsupported_figures_pass_through(self):
+        fig = go.Figure(go.Bar(x=[1, 2], y=[3, 4]))
+        assert delta_update(fig, None) == (fig, None)
+        two = go.Figure([go.Sunburst(ids=["a"]), go.Sunburst(ids=["b"])])
+        assert delta_update(two, None)[1] is None
+
+
+class TestDeltaUpdate:
+    def test_first_render_sends_the_canonical_figure(self):
+        update, state = delta_update(_sankey([5, 10]), None)
+        assert isinstance(update, dict) and not isinstance(update, Patch)
+        assert update["data"][0]["node"]["label"] == ["A", "B", "Root"]
+        assert set(state["paths"]) >= {"node.y", "link.value"}
+
+    def test_same_topology_patches_only_changed_arrays(self):
+        _fig, state = delta_update(_sankey([10, 5]), None)
+        update, new_state = delta_update(_sankey([10, 7]), state)
+        assert isinstance(update, Patch)
+        ops = _operations(update)
+        assert ("link", "value") in ops and ("node", "customdata") in ops
+        # Colours did not move, so they are not resent.
+        assert ("node", "color") not in ops and ("link", "color") not in ops
+        assert new_state["topology"] == state["topology"]
+
+    def test_recolouring_is_patched(self):
+        _fig, state = delta_update(_sankey([10, 5]), None)
+        update, _ = delta_update(_sankey([10, 5], colors=("#111", "#999", "#333")), state)
+        assert list(_operations(update)) == [("node", "color")]
+
+    def test_identical_figure_sends_nothing(self):
+        _fig, state = delta_update(_sunburst([3, 2, 1]), None)
+        assert delta_update(_sunburst([3, 2, 1]), state)[0] is no_update
+
+    def test_topology_change_sends_the_full_figure(self):
+        _fig, state = delta_update(_sunburst([3, 2, 1]), None)
+        update, new_state = delta_update(_sunburst([3, 2, 1], ids=("root", "a", "c")), state)
+        assert isinstance(update, dict) and new_state["topology"] != state["topology"]
+
+    def test_floats_are_rounded_in_both_paths(self):
+        update, state = delta_update(_sunburst([1 / 3, 0.2, 0.1]), None)
+        assert update["data"][0]["values"] == [0.2, 0.1, 0.333333]  # sorted by id
+        patch, _ = delta_update(_sunburst([2 / 3, 0.2, 0.1]), state)
+        assert _operations(patch)[("values",)][2] == 0.666667
+
+
+def test_real_builder_refresh_is_a_patch():
+    """The Sankey builder reorders by count; a flip in the lead is still a patch."""
+    from nanometa_live.app.tabs.classification_helpers import create_sankey_data
+
+    def build(aureus, coli):
+        rows = [
+            [100.0, aureus + coli, 0, "D", 2, "Bacteria", 1],
+            [50.0, aureus, 0, "P", 1239, "Firmicutes", 2],
+            [50.0, coli, 0, "P", 1224, "Proteobacteria", 2],
+            [50.0, aureus, aureus, "S", 1280, "Staphylococcus aureus", 1239],
+            [50.0, coli, coli, "S", 562, "Escherichia coli", 1224],
+        ]
+        df = pd.DataFrame(rows, columns=["%", "cumul_reads", "reads", "rank",
+                                         "taxid", "name", "parent_taxid"])
+        return create_sankey_data(df, ["Bacteria"], ["D", "P", "S"], 1, 10)
+
+    _fig, state = delta_update(build(600, 400), None)
+    assert state is not None
+    update, _ = delta_update(build(500, 700), state)
+    assert isinstance(update, Patch)
+    assert ("link", "value") in _operations(update)
+
+
+def test_plot_callback_writes_the_delta_state():
+    from dash_test_utils import make_callback_app
+
+    from nanometa_live.app.tabs.classification_tab import register_classification_callbacks
+
+    app = make_callback_app(register_classification_callbacks)
+    key = next(k for k in app.callback_map if "classification-plot.figure" in k)
+    assert "classification-plot-topology.data" in key
+    states = {s["id"] for s in app.callback_map[key]["state"]}
+    assert "classification-plot-topology" in states
@@ -0,0 +1,114 @@
+"""Genome catalog: unchanged files are never re-read, names resolve in one batch."""
+
+import gzip
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from nanometa_live.core.utils import genome_manager as gm
+from nanometa_live.core.utils.genome_catalog import (
+    CATALOG_FILENAME,
+    GenomeCatalog,
+    inspect_fasta,
+)
+from nanometa_live.core.utils.genome_manager import GenomeDownloadManager
+
+pytestmark = pytest.mark.unit
+
+VALID = ">NC_006570.2 Francisella tularensis\nACGTACGTNN\n"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    (tmp_path / "genomes").mkdir()
+    return tmp_path
+
+
+def _manager(cache, offline=True):
+    with patch.object(GenomeDownloadManager, "build_blast_db", lambda self, taxid: False):
+        return GenomeDownloadManager(cache_dir=str(cache), offline_mode=offline)
+
+
+def _counting_inspect():
+    return patch.object(gm, "inspect_fasta", wraps=gm.inspect_fasta)
+
+
+class TestInspect:
+    def test_gzip_genome_and_accession(self, tmp_path):
+        p = tmp_path / "263.fna.gz"
+        p.write_bytes(gzip.compress(VALID.encode()))
+        assert inspect_fasta(p) == (True, "NC_006570.2")
+
+    def test_header_cut_inside_a_multibyte_character(self, tmp_path):
+        p = tmp_path / "263.fasta"
+        header = ">NC_006570.2 " + "x" * (1023 - len(">NC_006570.2 ")) + "é strain"
+        p.write_text(header + "\nACGT\n", encoding="utf-8")
+        assert inspect_fasta(p) == (True, "NC_006570.2")
+        assert gm._extract_fasta_accession(p) == "NC_006570.2"
+
+    def test_invalid_byte_is_reported(self, tmp_path, caplog):
+        p = tmp_path / "263.fasta"
+        p.write_bytes(b">x\nACGT\xff\n")
+        assert inspect_fasta(p) == (False, None)
+        assert "\\xff" in caplog.text
+
+
+class TestScan:
+    def test_unchanged_files_are_not_reread(self, cache):
+        (cache / "genomes" / "263.fasta").write_text(VALID)
+        (cache / "genomes" / "632.fasta").write_text("<html>404</html>\n")
+        with _counting_inspect() as spy:
+            first = _manager(cache)
+        assert spy.call_count == 2
+        assert [(g.taxid, g.accession) for g in first.get_all_genomes()] == [
+            (263, "NC_006570.2")]
+
+        with _counting_inspect() as spy:
+            _manager(cache)
+        assert spy.call_count == 0  # 263 has metadata, 632 is cataloged invalid
+
+        (cache / "genomes" / "632.fasta").write_text(VALID)  # fixed in place
+        with _counting_inspect() as spy:
+            fixed = _manager(cache)
+        assert spy.call_count == 1
+        assert {g.taxid for g in fixed.get_all_genomes()} == {263, 632}
+
+    def test_catalog_forgets_deleted_files(self, cache):
+        (cache / "genomes" / "263.fasta").write_text(VALID)
+        _manager(cache)
+        (cache / "genomes" / "263.fasta").unlink()
+        _manager(cache)
+        assert len(GenomeCatalog(cache / CATALOG_FILENAME)) == 0
+
+    def test_replaced_file_with_same_size_is_rechecked(self, cache):
+        path = cache / "genomes" / "263.fasta"
+        path.write_text(VALID)
+        catalog = GenomeCatalog(cache / CATALOG_FILENAME)
+        catalog.record(path.name, path.stat(), True, None)
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+        assert catalog.lookup(path.name, path.stat()) is None
+
+
+class TestBatchedNames:
+    def test_new_taxids_cost_one_efetch(self, cache):
+        for taxid in (263, 632, 1392):
+            (cache / "genomes" / f"{taxid}.fasta").write_text(VALID)
+        cached = SimpleNamespace(sciname="Yersinia pestis", lineage=["Bacteria"],
+                                 division="")
+        client = SimpleNamespace(cache=SimpleNamespace(
+            get_ncbi_by_taxid=lambda t: cached if t == 632 else None))
+        with patch.object(gm, "get_ncbi_client", lambda offline_mode: client), \
+                patch.object(GenomeDownloadManager, "_efetch_taxa",
+                             return_value={263: ("Francisella tularensis", "Bacteria")}) as efetch, \
+                patch.object(GenomeDownloadManager, "_resolve_species_name") as single:
+            mgr = _manager(cache, offline=False)
+        efetch.assert_called_once_with([263, 1392])
+        single.assert_not_called()
+        names = {g.taxid: (g.species_name, g.source) for g in mgr.get_all_genomes()}
+        assert names == {
+            263: ("Francisella tularensis", "gtdb"),
+            632: ("Yersinia pestis", "gtdb"),
+            1392: ("Unknown (taxid 1392)", "discovered"),
+        }
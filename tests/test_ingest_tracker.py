@@ -0,0 +1,222 @@
+"""Ingest tracker: one full scan, then incremental per-sample counters."""
+
+import gzip
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from nanometa_live.core.utils import ingest_tracker as it
+from nanometa_live.core.utils.ingest_tracker import IngestTracker, ROOT_SAMPLE
+from nanometa_live.core.utils.read_length_probe import sample_bytes_per_read
+
+pytestmark = pytest.mark.unit
+
+OLD = 1_000_000.0  # an mtime well outside the growing window
+
+
+class Clock:
+    def __init__(self, now=OLD + 10_000):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _fastq(path, n_reads, read_len=500, gz=True, mtime=OLD):
+    body = "".join(f"@r{i}\n{'A' * read_len}\n+\n{'I' * read_len}\n" for i in range(n_reads))
+    if gz:
+        with gzip.open(path, "wt") as fh:
+            fh.write(body)
+    else:
+        path.write_text(body)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _touch_dir(path):
+    """Move a directory's mtime on, as adding a file over NFS eventually does."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def run(tmp_path):
+    root = tmp_path / "fastq_pass"
+    for bc in ("barcode01", "barcode02"):
+        (root / bc).mkdir(parents=True)
+        for n in range(3):
+            _fastq(root / bc / f"{bc}_{n}.fastq.gz", 40)
+    return root
+
+
+class TestScanAndPoll:
+    def test_start_up_scan_counts_per_sample(self, run):
+        snap = IngestTracker(str(run), clock=Clock()).refresh()
+        assert snap.files == 6
+        assert snap.per_sample["barcode01"]["files"] == 3
+        assert snap.per_sample[ROOT_SAMPLE]["files"] == 0
+        assert snap.bytes == sum(f.stat().st_size for f in run.rglob("*.fastq.gz"))
+        assert snap.last_arrival == OLD  # arrival of pre-existing files = mtime
+
+    def test_only_changed_directories_are_listed(self, run):
+        clock = Clock()
+        tracker = IngestTracker(str(run), clock=clock)
+        tracker.refresh()
+        listed = tracker.listings
+
+        tracker.refresh()
+        assert tracker.listings == listed
+
+        clock.now += 5
+        _fastq(run / "barcode02" / "late.fastq.gz", 10, mtime=clock.now)
+        _touch_dir(run / "barcode02")
+        snap = tracker.refresh()
+        assert tracker.listings == listed + 1
+        assert snap.per_sample["barcode02"]["files"] == 4
+        assert snap.per_sample["barcode02"]["last_arrival"] == clock.now
+        assert snap.per_sample["barcode01"]["files"] == 3
+
+    def test_a_growing_file_is_restated_without_a_listing(self, run):
+        clock = Clock()
+        tracker = IngestTracker(str(run), clock=clock)
+        growing = _fastq(run / "barcode01" / "open.fastq", 5, gz=False, mtime=clock.now)
+        _touch_dir(run / "barcode01")
+        before = tracker.refresh()
+        listed = tracker.listings
+
+        with open(growing, "a") as fh:
+            fh.write("@x\nACGT\n+\nIIII\n")
+        os.utime(growing, (clock.now, clock.now))
+        after = tracker.refresh()
+        assert tracker.listings == listed
+        assert after.bytes == before.bytes + len("@x\nACGT\n+\nIIII\n")
+        assert after.files == before.files
+
+    def test_deleted_files_and_new_and_removed_barcodes(self, run):
+        tracker = IngestTracker(str(run), clock=Clock())
+        tracker.refresh()
+        (run / "barcode01" / "barcode01_0.fastq.gz").unlink()
+        (run / "barcode03").mkdir()
+        _fastq(run / "barcode03" / "a.fastq.gz", 5)
+        _touch_dir(run)
+        snap = tracker.refresh()
+        assert snap.per_sample["barcode01"]["files"] == 2
+        assert snap.per_sample["barcode03"]["files"] == 1
+
+        for f in (run / "barcode02").iterdir():
+            f.unlink()
+        (run / "barcode02").rmdir()
+        _touch_dir(run)
+        snap = tracker.refresh()
+        assert "barcode02" not in snap.per_sample
+        assert snap.files == 3
+
+    def test_custom_sample_dir_empty_at_start_up_is_counted(self, run):
+        (run / "Zymo").mkdir()
+        clock = Clock()
+        tracker = IngestTracker(str(run), clock=clock)
+        assert tracker.refresh().per_sample["Zymo"]["files"] == 0
+
+        clock.now += 5
+        new = _fastq(run / "Zymo" / "zymo_0.fastq.gz", 5, mtime=clock.now)
+        _touch_dir(run / "Zymo")  # the root's mtime does not move
+        assert tracker.refresh().per_sample["Zymo"]["files"] == 1
+
+        tracker._observer = MagicMock()  # events for it are applied too
+        _fastq(run / "Zymo" / "zymo_1.fastq.gz", 5, mtime=clock.now)
+        tracker.note_changed(str(new.with_name("zymo_1.fastq.gz")))
+        assert tracker.snapshot().per_sample["Zymo"]["files"] == 2
+
+    def test_missing_root_counts_nothing_until_it_appears(self, tmp_path):
+        root = tmp_path / "not_yet"
+        tracker = IngestTracker(str(root), clock=Clock())
+        assert tracker.refresh().files == 0
+        (root / "barcode01").mkdir(parents=True)
+        _fastq(root / "barcode01" / "a.fastq.gz", 5)
+        assert tracker.refresh().files == 1
+
+
+class TestEstimatedReads:
+    def test_reads_are_estimated_from_a_sampled_ratio(self, run):
+        snap = IngestTracker(str(run), clock=Clock()).refresh()
+        assert snap.estimated_reads == pytest.approx(6 * 40, rel=0.02)
+        assert snap.per_sample["barcode02"]["estimated_reads"] == pytest.approx(120, rel=0.02)
+
+    def test_whole_file_ratio_is_exact(self, tmp_path):
+        f = _fastq(tmp_path / "a.fastq", 7, gz=False)
+        assert sample_bytes_per_read(f) == f.stat().st_size / 7
+
+    def test_a_file_still_being_written_is_not_sampled(self, tmp_path):
+        clock = Clock()
+        (tmp_path / "barcode01").mkdir()
+        _fastq(tmp_path / "barcode01" / "a.fastq.gz", 5, mtime=clock.now)
+        snap = IngestTracker(str(tmp_path), clock=clock).refresh()
+        assert snap.files == 1 and snap.estimated_reads is None
+
+
+class TestWatchedEvents:
+    def test_events_update_counts_without_polling(self, run):
+        clock = Clock()
+        tracker = IngestTracker(str(run), clock=clock)
+        tracker.refresh()
+        tracker._observer = MagicMock()  # as if watchdog were running
+        listed = tracker.listings
+
+        clock.now += 5
+        new = _fastq(run / "barcode01" / "new.fastq.gz", 10, mtime=clock.now)
+        tracker.note_changed(str(new))
+        gone = run / "barcode02" / "barcode02_0.fastq.gz"
+        gone.unlink()
+        tracker.note_deleted(str(gone))
+        tracker.note_changed(str(run / "barcode01" / "notes.txt"))  # ignored
+        snap = tracker.refresh()
+        assert tracker.listings == listed
+        assert (snap.per_sample["barcode01"]["files"],
+                snap.per_sample["barcode02"]["files"]) == (4, 2)
+
+        clock.now += it.VERIFY_INTERVAL_S  # periodic safety poll catches misses
+        (run / "barcode02" / "barcode02_1.fastq.gz").unlink()
+        _touch_dir(run / "barcode02")
+        assert tracker.refresh().per_sample["barcode02"]["files"] == 1
+
+    def test_start_watching_without_watchdog_falls_back_to_polling(self, run, monkeypatch):
+        import builtins
+        real_import = builtins.__import__
+
+        def no_watchdog(name, *args, **kwargs):
+            if name.startswith("watchdog"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", no_watchdog)
+        tracker = IngestTracker(str(run))
+        assert tracker.start_watching() is False
+        assert tracker.refresh().files == 6
+
+    def test_network_filesystem_polls_instead_of_watching(self, run, monkeypatch):
+        monkeypatch.setattr(it, "_mount_table", lambda: [
+            ("/", "ext4"), (os.path.realpath(run.parent), "nfs4")])
+        tracker = IngestTracker(str(run))
+        assert tracker.start_watching() is False
+        assert tracker._observer is None
+        assert tracker.refresh().files == 6
+
+
+class TestNetworkFilesystem:
+    def test_longest_mount_point_wins(self, monkeypatch):
+        monkeypatch.setattr(it, "_mount_table", lambda: [
+            ("/", "ext4"), ("/mnt/runs", "cifs"), ("/mnt/runs/local", "xfs"),
+            ("/mnt/runs2", "ext4")])
+        assert it.is_network_filesystem("/mnt/runs/fastq_pass")
+        assert it.is_network_filesystem("/mnt/runs")
+        assert not it.is_network_filesystem("/mnt/runs/local/fastq_pass")
+        assert not it.is_network_filesystem("/mnt/runs2/fastq_pass")
+        assert not it.is_network_filesystem("/home/user")
+
+    def test_unreadable_mount_table_counts_as_local(self, monkeypatch):
+        monkeypatch.setattr(it, "_mount_table", lambda: [])
+        assert not it.is_network_filesystem("/mnt/runs")
+
+    def test_proc_mount_paths_are_unescaped(self):
+        assert it._unescape_mount(r"/mnt/run\040data") == "/mnt/run data"
@@ -0,0 +1,156 @@
+"""Tests for summary-only JSON ingestion and the per-file digest cache."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+
+import pytest
+
+from nanometa_live.core.utils import json_ingest
+from nanometa_live.core.utils.json_ingest import (
+    FASTP_SUMMARY_KEYS,
+    cached_json,
+    clear_json_cache,
+    extract_keys,
+    json_parse_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_json_cache()
+    yield
+    clear_json_cache()
+
+
+def _fastp_document(curve_len=20000):
+    return {
+        "summary": {
+            "before_filtering": {"total_reads": 100, "total_bases": 5000},
+            "after_filtering": {"total_reads": 90, "total_bases": 4500, "q30_bases": 4000},
+        },
+        "filtering_result": {"passed_filter_reads": 90, "low_quality_reads": 10},
+        "read1_after_filtering": {
+            "quality_curves": {"mean": [30.5] * curve_len},
+            "note": "brackets ] } [ { and \"quotes\" inside a string",
+        },
+        "kmer_count": {f"K{i}": i for i in range(2000)},
+    }
+
+
+def _write(path, payload, **dump_kwargs):
+    path.write_text(json.dumps(payload, **dump_kwargs))
+    return str(path)
+
+
+class TestExtractKeys:
+    def test_matches_a_full_parse_for_the_requested_keys(self, tmp_path):
+        doc = _fastp_document()
+        path = _write(tmp_path / "s.fastp.json", doc, indent=2)
+        assert extract_keys(path, FASTP_SUMMARY_KEYS) == {
+            "summary": doc["summary"],
+            "filtering_result": doc["filtering_result"],
+        }
+
+    def test_stops_reading_once_the_keys_are_found(self, tmp_path):
+        path = _write(tmp_path / "s.fastp.json", _fastp_document(), indent=2)
+        extract_keys(path, FASTP_SUMMARY_KEYS)
+        read = json_parse_stats()["bytes"]
+        assert 0 < read < os.path.getsize(path) / 10
+
+    def test_skips_a_large_value_to_reach_a_later_key(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(json_ingest, "EXTRACT_CHUNK_BYTES", 64)
+        doc = _fastp_document()
+        path = _write(tmp_path / "s.fastp.json", doc)
+        assert extract_keys(path, ["kmer_count"]) == {"kmer_count": doc["kmer_count"]}
+
+    def test_strings_with_brackets_do_not_confuse_the_skipper(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(json_ingest, "EXTRACT_CHUNK_BYTES", 16)
+        doc = {"a": {"s": "}}]]\\\"{{", "n": [1, [2, {"x": "]"}]]}, "b": "é", "c": None}
+        path = _write(tmp_path / "d.json", doc, ensure_ascii=False)
+        assert extract_keys(path, ["b", "c"]) == {"b": "é", "c": None}
+
+    def test_missing_keys_are_absent(self, tmp_path):
+        path = _write(tmp_path / "d.json", {"a": 1})
+        assert extract_keys(path, ["a", "zzz"]) == {"a": 1}
+
+    @pytest.mark.parametrize("text", ["", "[1, 2]", '{"summary": {"a": 1', '{"a" 1}'])
+    def test_malformed_or_truncated_raises_decode_error(self, tmp_path, text):
+        path = tmp_path / "bad.json"
+        path.write_text(text)
+        with pytest.raises(json.JSONDecodeError):
+            extract_keys(str(path), ["summary"])
+
+
+class TestCachedJson:
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        path = _write(tmp_path / "s.fastp.json", _fastp_document())
+        first = cached_json(path, FASTP_SUMMARY_KEYS)
+        second = cached_json(path, FASTP_SUMMARY_KEYS)
+        assert first == second
+        stats = json_parse_stats()
+        assert stats["parses"] == 1
+        assert stats["hits"] == 1
+
+    def test_rewritten_file_is_reparsed(self, tmp_path):
+        path = tmp_path / "s.fastp.json"
+        doc = _fastp_document()
+        _write(path, doc)
+        cached_json(str(path), FASTP_SUMMARY_KEYS)
+        doc["summary"]["after_filtering"]["total_reads"] = 12345
+        _write(path, doc)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        result = cached_json(str(path), FASTP_SUMMARY_KEYS)
+        assert result["summary"]["after_filtering"]["total_reads"] == 12345
+
+    def test_full_document_without_keys(self, tmp_path):
+        path = _write(tmp_path / "v.json", {"results": {"s1": {}}, "timestamp": "t"})
+        assert cached_json(path) == {"results": {"s1": {}}, "timestamp": "t"}
+
+    def test_top_level_result_is_a_copy(self, tmp_path):
+        path = _write(tmp_path / "v.json", {"a": 1})
+        cached_json(path)["a"] = 2
+        assert cached_json(path) == {"a": 1}
+
+    def test_errors_are_not_cached(self, tmp_path):
+        path = tmp_path / "v.json"
+        path.write_text("{not json")
+        with pytest.raises(json.JSONDecodeError):
+            cached_json(str(path))
+        _write(path, {"ok": True})
+        assert cached_json(str(path)) == {"ok": True}
+
+    def test_missing_file_raises_oserror(self, tmp_path):
+        with pytest.raises(OSError):
+            cached_json(str(tmp_path / "absent.json"))
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(json_ingest._digest_cache, "max_entries", 2)
+        paths = [_write(tmp_path / f"{i}.json", {"i": i}) for i in range(4)]
+        for p in paths:
+            cached_json(p)
+        assert len(json_ingest._digest_cache) == 2
+
+
+def test_stdlib_fallback_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(json_ingest, "orjson", None)
+    path = _write(tmp_path / "s.fastp.json", _fastp_document())
+    assert cached_json(path, ["filtering_result"]) == {
+        "filtering_result": {"passed_filter_reads": 90, "low_quality_reads": 10},
+    }
+
+
+@pytest.mark.parametrize("with_orjson", [True, False])
+def test_nan_and_infinity_literals_parse(tmp_path, monkeypatch, with_orjson):
+    if not with_orjson:
+        monkeypatch.setattr(json_ingest, "orjson", None)
+    path = _write(tmp_path / "nan.json", {"summary": {"gc": float("nan"), "max": float("inf")},
+                                          "rest": [float("-inf")]})
+    full = cached_json(path)
+    assert math.isnan(full["summary"]["gc"]) and full["rest"] == [float("-inf")]
+    assert extract_keys(path, ["summary"])["summary"]["max"] == float("inf")
+    with pytest.raises(json.JSONDecodeError):
+        json_ingest.loads(b'{"a": NaN')
@@ -0,0 +1,175 @@
+"""Per-taxon read profiles tailed from Kraken2 per-read output."""
+
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nanometa_live.app.tabs.main_tab_helpers import attach_read_profiles
+from nanometa_live.core.parsers import kraken_read_profiles as krp
+from nanometa_live.core.parsers.kraken_read_profiles import (
+    TaxonProfiles,
+    find_per_read_outputs,
+    load_read_profiles,
+    reduce_chunk,
+    update_sample_profiles,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    krp.clear_read_profile_cache()
+    yield
+    krp.clear_read_profile_cache()
+
+
+def _line(taxid, length, kmers, read="r", classified=True):
+    mapping = " ".join(f"{k}:{v}" for k, v in kmers)
+    return f"{'C' if classified else 'U'}\t{read}\t{taxid}\t{length}\t{mapping}\n"
+
+
+def _lines(n, seed=0):
+    rng = np.random.default_rng(seed)
+    out = []
+    for i in range(n):
+        taxid = int(rng.choice([562, 1392, 1280]))
+        length = int(rng.integers(100, 30000))
+        kmers = [(taxid, int(rng.integers(0, 500))), (0, int(rng.integers(0, 50))),
+                 (int(rng.integers(1, 10 ** 6)), int(rng.integers(1, 50))), ("A", 7)]
+        out.append(_line(taxid, length, kmers, read=f"read{i}", classified=i % 9 != 0))
+    return "".join(out)
+
+
+@pytest.fixture
+def results(tmp_path):
+    kraken = tmp_path / "kraken2"
+    kraken.mkdir()
+    return tmp_path
+
+
+class TestReduction:
+    def test_vectorised_matches_per_line(self):
+        buf = _lines(2000).encode()
+        fast = krp._reduce_vectorised(buf)
+        slow = krp._reduce_per_line(buf)
+        for a, b in zip(fast, slow):
+            np.testing.assert_allclose(a, b)
+
+    def test_hit_fraction_excludes_ambiguous_kmers(self):
+        taxids, lengths, fractions = reduce_chunk(
+            _line(562, 1500, [(562, 30), (0, 10), ("A", 60)]).encode())
+        assert taxids.tolist() == [562] and lengths.tolist() == [1500]
+        assert fractions.tolist() == [0.75]
+
+    def test_paired_and_named_lines_fall_back_to_the_same_numbers(self):
+        buf = ("C\tr1\t562\t150|148\t562:40 0:10 |:| 562:50\n"
+               "C\tr2\tEscherichia coli (taxid 562)\t900\t562:20 0:20\n").encode()
+        taxids, lengths, fractions = reduce_chunk(buf)
+        assert taxids.tolist() == [562, 562]
+        assert lengths.tolist() == [298, 900]
+        assert fractions.tolist() == pytest.approx([0.9, 0.5])
+
+    def test_stream_leaves_a_partial_last_line(self, tmp_path):
+        path = tmp_path / "s.kraken2"
+        path.write_bytes(_line(562, 1000, [(562, 5)]).encode() + b"C\tr2\t56")
+        profiles = TaxonProfiles()
+        with open(path, "rb") as fh:
+            consumed = krp.reduce_stream(fh, profiles, chunk_bytes=16)
+        assert consumed == len(_line(562, 1000, [(562, 5)]))
+        assert profiles.profile(562)["reads"] == 1
+
+    def test_profile_quantiles_come_from_the_histograms(self):
+        profiles = TaxonProfiles()
+        lengths = np.arange(1000, 11000, 10)
+        profiles.add(np.full(len(lengths), 562), lengths, np.full(len(lengths), 0.42))
+        p = profiles.profile(562)
+        assert p["reads"] == 1000 and p["mean_length"] == pytest.approx(lengths.mean())
+        assert p["median_length"] == pytest.approx(np.median(lengths), rel=0.06)
+        assert p["length_q1"] < p["median_length"] < p["length_q3"]
+        assert 0.40 <= p["median_confidence"] <= 0.45
+        assert profiles.profile(1392) is None
+
+    def test_memory_is_bounded_by_taxa_not_reads(self):
+        profiles = TaxonProfiles()
+        for seed in range(5):
+            profiles.add(*reduce_chunk(_lines(2000, seed).encode()))
+        assert len(profiles) == 4  # three species and unclassified
+        assert profiles.length_hist.shape == (4, krp.N_LENGTH_BINS)
+
+
+class TestIncrementalStore:
+    def test_only_appended_bytes_are_read(self, results):
+        kraken = str(results / "kraken2")
+        path = results / "kraken2" / "barcode01.kraken2"
+        path.write_text(_lines(300))
+        first = update_sample_profiles(kraken, "barcode01")
+        with open(path, "a") as fh:
+            fh.write(_lines(100, seed=1))
+        with patch.object(krp, "reduce_chunk", wraps=krp.reduce_chunk) as spy:
+            second = update_sample_profiles(kraken, "barcode01")
+        assert sum(len(c.args[0].splitlines()) for c in spy.call_args_list) == 100
+        assert second.reads.sum() == first.reads.sum() + 100
+
+    def test_a_restart_reuses_the_persisted_offsets(self, results):
+        kraken = str(results / "kraken2")
+        (results / "kraken2" / "barcode01.kraken2").write_text(_lines(300))
+        before = update_sample_profiles(kraken, "barcode01").profile(562)
+        krp.clear_read_profile_cache()  # a new process
+        with patch.object(krp, "reduce_chunk") as spy:
+            after = update_sample_profiles(kraken, "barcode01").profile(562)
+        assert spy.call_count == 0
+        assert after == before
+        assert os.path.exists(krp.profile_path(kraken, "barcode01"))
+
+    def test_the_store_is_a_bounded_cache(self, results):
+        from nanometa_live.core.utils.bounded_cache import cache_stats
+        kraken = str(results / "kraken2")
+        (results / "kraken2" / "barcode01.kraken2").write_text(_lines(300))
+        update_sample_profiles(kraken, "barcode01")
+        stats = cache_stats()["kraken_read_profiles"]
+        assert stats["entries"] == 1
+        assert stats["bytes"] >= krp.N_LENGTH_BINS * 8
+
+    def test_a_rewritten_file_is_rebuilt(self, results):
+        kraken = str(results / "kraken2")
+        path = results / "kraken2" / "barcode01.kraken2"
+        path.write_text(_lines(300))
+        update_sample_profiles(kraken, "barcode01")
+        path.write_text(_lines(50, seed=3))
+        assert update_sample_profiles(kraken, "barcode01").reads.sum() == 50
+
+    def test_whole_sample_file_wins_over_batches(self, results):
+        kraken = results / "kraken2"
+        (kraken / "barcode01_batch0.kraken2.txt").write_text(_lines(10))
+        (kraken / "barcode01_batch1.kraken2.txt").write_text(_lines(10))
+        assert [os.path.basename(p) for p in find_per_read_outputs(str(kraken), "barcode01")] == [
+            "barcode01_batch0.kraken2.txt", "barcode01_batch1.kraken2.txt"]
+        (kraken / "barcode01.kraken2").write_text(_lines(20))
+        assert find_per_read_outputs(str(kraken), "barcode01") == [str(kraken / "barcode01.kraken2")]
+
+    def test_all_samples_are_merged(self, results):
+        kraken = results / "kraken2"
+        (kraken / "barcode01.kraken2").write_text(_lines(100))
+        (kraken / "barcode02_batch0.kraken2.txt").write_text(_lines(50, seed=2))
+        assert load_read_profiles(str(results)).reads.sum() == 150
+        assert load_read_profiles(str(results), "barcode02").reads.sum() == 50
+
+
+class TestOrganismTable:
+    def test_columns_are_filled_from_the_profiles(self, results):
+        (results / "kraken2" / "barcode01.kraken2").write_text(
+            _line(562, 2000, [(562, 80), (0, 20)]) * 3)
+        table = pd.DataFrame({"name": ["E. coli", "B. anthracis"], "taxid": [562, 1392]})
+        table = attach_read_profiles(table, str(results), "barcode01")
+        assert table["kmer_support"].tolist()[1] is None
+        assert 75 <= table["kmer_support"][0] <= 85
+        assert table["median_length"][0] == pytest.approx(2000, rel=0.06)
+
+    def test_no_per_read_output_leaves_the_columns_empty(self, results):
+        table = pd.DataFrame({"name": ["E. coli"], "taxid": [562]})
+        table = attach_read_profiles(table, str(results), None)
+        assert table["median_length"].tolist() == [None]
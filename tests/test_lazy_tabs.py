@@ -0,0 +1,194 @@
+"""Tests for deferred tab construction (``lazy_tabs``) and the startup bench."""
+
+from __future__ import annotations
+
+import pytest
+from dash import no_update
+
+from nanometa_live.app import app as app_module
+from nanometa_live.app.app import (
+    EAGER_TABS,
+    LAZY_TAB_BODY,
+    _create_main_tabs,
+    build_tab_layout,
+    register_lazy_tab_callback,
+)
+from scripts.perf.startup_bench import parse_importtime
+
+
+def _tab_bodies(tabs):
+    return {tab.tab_id: tab.children for tab in tabs.children}
+
+
+class TestTabStrip:
+    def test_eager_builds_every_tab(self):
+        bodies = _tab_bodies(_create_main_tabs(lazy=False))
+        assert len(bodies) == len(app_module._TAB_SPECS)
+        for tab_id, body in bodies.items():
+            assert getattr(body, "id", None) != {"type": LAZY_TAB_BODY, "tab": tab_id}
+
+    def test_lazy_builds_only_the_eager_tabs(self):
+        bodies = _tab_bodies(_create_main_tabs(lazy=True))
+        for tab_id, body in bodies.items():
+            if tab_id in EAGER_TABS:
+                assert getattr(body, "id", None) != {"type": LAZY_TAB_BODY, "tab": tab_id}
+            else:
+                assert body.id == {"type": LAZY_TAB_BODY, "tab": tab_id}
+                assert body.children is None
+
+    def test_tab_order_is_the_same_in_both_modes(self):
+        assert list(_tab_bodies(_create_main_tabs(lazy=True))) == list(
+            _tab_bodies(_create_main_tabs(lazy=False))
+        )
+
+    def test_unknown_tab_raises(self):
+        with pytest.raises(KeyError):
+            build_tab_layout("no-such-tab")
+
+
+class _CapturingApp:
+    def __init__(self):
+        self.callbacks = []
+
+    def callback(self, *args, **kwargs):
+        def decorator(fn):
+            self.callbacks.append(fn)
+            return fn
+        return decorator
+
+
+class TestRenderLazyTab:
+    @pytest.fixture
+    def render(self, monkeypatch):
+        built = []
+
+        def fake_build(tab_id):
+            built.append(tab_id)
+            return f"layout:{tab_id}"
+
+        monkeypatch.setattr(app_module, "build_tab_layout", fake_build)
+        fake_app = _CapturingApp()
+        register_lazy_tab_callback(fake_app)
+        (fn,) = fake_app.callbacks
+        return fn, built
+
+    def test_fills_only_the_active_empty_container(self, render):
+        fn, built = render
+        ids = [{"type": LAZY_TAB_BODY, "tab": t} for t in ("qc-tab", "reports-tab")]
+        out = fn("reports-tab", [None, None], ids)
+        assert out == [no_update, "layout:reports-tab"]
+        assert built == ["reports-tab"]
+
+    def test_an_already_built_tab_is_not_rebuilt(self, render):
+        fn, built = render
+        ids = [{"type": LAZY_TAB_BODY, "tab": "qc-tab"}]
+        assert fn("qc-tab", [{"props": {}}], ids) == [no_update]
+        assert built == []
+
+
+def _string_ids(component, acc):
+    """Every string component id under *component*, props included."""
+    from dash.development.base_component import Component
+
+    if isinstance(component, Component):
+        if isinstance(getattr(component, "id", None), str):
+            acc.add(component.id)
+        for prop in component._prop_names:
+            _string_ids(getattr(component, prop, None), acc)
+    elif isinstance(component, (list, tuple)):
+        for child in component:
+            _string_ids(child, acc)
+    return acc
+
+
+class TestCrossTabDependencies:
+    """With lazy_tabs, a callback writing to the always-built shell must not
+    read a component that only exists once a deferred tab is opened.
+
+    Dash skips a callback whose inputs are all missing and raises on one
+    whose inputs are only partly present, so such a callback either never
+    fires or errors until the operator happens to visit the other tab.
+    Allowed: dependencies declared ``allow_optional``, and callbacks whose
+    every non-wildcard Input is a control in that one tab (they cannot fire
+    before it mounts, and mount together with their States).
+    """
+
+    def test_shell_callbacks_do_not_read_deferred_tabs(self, tmp_path):
+        from unittest.mock import MagicMock
+
+        app = app_module.create_app(
+            {"data_dir": str(tmp_path), "project_dir": str(tmp_path),
+             "lazy_tabs": True},
+            str(tmp_path),
+            MagicMock(),
+        )
+        shell = _string_ids(app.layout, set())
+        deferred = {}
+        for tab_id, *_ in app_module._TAB_SPECS:
+            if tab_id not in EAGER_TABS:
+                for cid in _string_ids(build_tab_layout(tab_id), set()) - shell:
+                    deferred[cid] = tab_id
+
+        offenders = {}
+        # The dependency list the browser receives (_dash-dependencies).
+        for spec in app._callback_list:
+            key = spec["output"]
+            outputs = key.strip(".").split("...") if key.startswith("..") else [key]
+            if not all(o.rsplit(".", 1)[0] in shell for o in outputs):
+                continue
+            # An ALL wildcard matching nothing is an empty list, not an error.
+            required = [d for d in spec["inputs"]
+                        if not d.get("allow_optional") and not d["id"].startswith("{")]
+            trigger_tabs = {deferred.get(d["id"]) for d in required}
+            if not required and spec["prevent_initial_call"]:
+                # Fires only on a click on a rendered wildcard item.
+                trigger_tabs = {deferred.get(d["id"]) for d in spec["state"]} - {None}
+            if len(trigger_tabs) == 1 and None not in trigger_tabs:
+                (tab,) = trigger_tabs
+                if all(deferred.get(d["id"], tab) == tab for d in spec["state"]):
+                    continue
+            missing = sorted(
+                f"{d['id']} ({deferred[d['id']]})"
+                for d in spec["inputs"] + spec["state"]
+                if d["id"] in deferred and not d.get("allow_optional")
+            )
+            if missing:
+                offenders[key] = missing
+        assert not offenders, (
+            "Callbacks writing to the app shell read components of a lazily "
+            "built tab; move those stores into the shell (app.py) or mark "
+            f"the dependency allow_optional: {offenders}"
+        )
+
+
+class TestLazyPackageExports:
+    def test_layouts_package_resolves_on_attribute_access(self):
+        import nanometa_live.app.layouts as layouts
+
+        assert callable(layouts.create_dashboard_layout)
+        assert "create_dashboard_layout" in layouts.__all__
+
+    def test_components_package_resolves_on_attribute_access(self):
+        import nanometa_live.app.components as components
+
+        for name in components.__all__:
+            assert getattr(components, name) is not None
+
+    def test_unknown_name_is_an_attribute_error(self):
+        import nanometa_live.app.layouts as layouts
+
+        with pytest.raises(AttributeError):
+            layouts.no_such_layout  # noqa: B018
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 | _io\n"
+        "import time:      2500 |     980000 | nanometa_live.app.app\n"
+        "unrelated warning line\n"
+    )
+    assert parse_importtime(stderr) == [
+        ("_io", 120, 120),
+        ("nanometa_live.app.app", 2500, 980000),
+    ]
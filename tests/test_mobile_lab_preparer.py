@@ -362,7 +362,7 @@ class TestDownloadAndBlastStages:
                 return f"/genomes/{taxid}.fasta"
         monkeypatch.setattr(
             "nanometa_live.core.utils.genome_manager.get_genome_manager",
-            lambda d, offline_mode=False: _Manager(),
+            lambda d, offline_mode=False, blast_db_mode=None: _Manager(),
         )
         prep = make_preparer(tmp_path)
         monkeypatch.setattr(prep, "_get_watchlist_entries", lambda: [
@@ -384,7 +384,7 @@ class TestDownloadAndBlastStages:
                 return None if taxid == 1280 else f"/genomes/{taxid}.fasta"
         monkeypatch.setattr(
             "nanometa_live.core.utils.genome_manager.get_genome_manager",
-            lambda d, offline_mode=False: _Manager(),
+            lambda d, offline_mode=False, blast_db_mode=None: _Manager(),
         )
         prep = make_preparer(tmp_path)
         monkeypatch.setattr(prep, "_get_watchlist_entries", lambda: [
@@ -406,7 +406,7 @@ class TestDownloadAndBlastStages:
                 raise AssertionError("should not download after cancel")
         monkeypatch.setattr(
             "nanometa_live.core.utils.genome_manager.get_genome_manager",
-            lambda d, offline_mode=False: _Manager(),
+            lambda d, offline_mode=False, blast_db_mode=None: _Manager(),
         )
         prep = make_preparer(tmp_path)
         prep.cancel()
@@ -419,11 +419,11 @@ class TestDownloadAndBlastStages:
 
     def test_build_blast_dbs_records_count(self, tmp_path, monkeypatch):
         class _Manager:
-            def build_missing_blast_dbs_detailed(self, retry=True):
+            def build_missing_blast_dbs_detailed(self, retry=True, consolidated=False):
                 return {"built": 4, "already_present": 2, "failed": []}
         monkeypatch.setattr(
             "nanometa_live.core.utils.genome_manager.get_genome_manager",
-            lambda d, offline_mode=False: _Manager(),
+            lambda d, offline_mode=False, blast_db_mode=None: _Manager(),
         )
         prep = make_preparer(tmp_path)
         result = PreparationResult(success=True)
@@ -434,7 +434,7 @@ class TestDownloadAndBlastStages:
 
     def test_build_blast_dbs_reports_failures_as_warning(self, tmp_path, monkeypatch):
         class _Manager:
-            def build_missing_blast_dbs_detailed(self, retry=True):
+            def build_missing_blast_dbs_detailed(self, retry=True, consolidated=False):
                 return {
                     "built": 1,
                     "already_present": 0,
@@ -443,7 +443,7 @@ class TestDownloadAndBlastStages:
                 }
         monkeypatch.setattr(
             "nanometa_live.core.utils.genome_manager.get_genome_manager",
-            lambda d, offline_mode=False: _Manager(),
+            lambda d, offline_mode=False, blast_db_mode=None: _Manager(),
         )
         prep = make_preparer(tmp_path)
         result = PreparationResult(success=True)
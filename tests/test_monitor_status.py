@@ -226,6 +226,33 @@ class TestProgressResetsTheInactivityClock:
         )
 
 
+class TestInputArrivalIsProgress:
+    """Reads still arriving from MinKNOW keep a realtime run alive."""
+
+    def test_arrivals_defer_the_stop_until_the_input_goes_quiet(
+        self, tmp_path, monkeypatch
+    ):
+        manager = make_manager(tmp_path, mode="realtime", timeout_minutes=10)
+        arrivals_until = 1_000_000.0 + 30 * 60
+
+        def ingest_tracker_tick():
+            now = bm_module.time.time()
+            if now <= arrivals_until:
+                manager.status["input_last_arrival"] = now
+
+        manager._update_file_counts = ingest_tracker_tick
+        # One task, then no task activity at all; files keep landing for 30 min.
+        statuses = [status(processes_running=1), status(complete=1)]
+        clock = run_monitor(
+            manager, monkeypatch, statuses, tick_seconds=60.0, max_ticks=100
+        )
+
+        assert manager.workflow_manager.stop.called
+        assert clock.now - arrivals_until >= 10 * 60, (
+            "the inactivity clock ignored input still arriving"
+        )
+
+
 class TestColdStartIsNotInactivity:
     """Guard 3 -- nothing has run yet because the conda env is still building."""
 
@@ -75,7 +75,7 @@ class TestRefusesWithoutInputDirectory:
         """The specific substitution that made the failure silent."""
         import inspect
 
-        source = inspect.getsource(OnDemandValidator.validate_via_nanometanf)
+        source = inspect.getsource(OnDemandValidator._nanometanf_command)
         assert "str(self.results_dir)," not in source.split("--reads_dir")[1][:120], (
             "results_dir is being passed as --reads_dir again; it holds no FASTQs"
         )
@@ -33,6 +33,9 @@ def _result(rate=92.0):
     )
 
 
+_CLICK = {"n_clicks": 1, "request_id": None}
+
+
 @pytest.fixture
 def app():
     return make_callback_app(register_main_callbacks)
@@ -41,7 +44,7 @@ def app():
 def _spec(app):
     for cb_id, spec in app.callback_map.items():
         if "on-demand-validation-results" in cb_id and \
-                "start-on-demand-validation" in str(spec.get("inputs")):
+                "on-demand-validation-request" in str(spec.get("inputs")):
             return spec
     raise AssertionError("validation callback not found")
 
@@ -69,7 +72,7 @@ class TestOnDemandValidationCallback:
     def _fn(self, app):
         return get_callback_fn(
             app, "on-demand-validation-results.data",
-            input_contains="start-on-demand-validation",
+            input_contains="on-demand-validation-request",
         )
 
     def _results_dir(self, tmp_path):
@@ -92,7 +95,7 @@ class TestOnDemandValidationCallback:
             return_value=validator,
         ):
             out = self._fn(app)(
-                set_progress, 1,
+                set_progress, _CLICK,
                 {"taxid": 562, "name": "E. coli", "sample": "all"},
                 {"results_output_directory": str(results)}, {}, "blast",
             )
@@ -106,7 +109,7 @@ class TestOnDemandValidationCallback:
         results = tmp_path / "results"
         results.mkdir()  # no kraken2/ dir -> no per-read output
         out = self._fn(app)(
-            MagicMock(), 1,
+            MagicMock(), _CLICK,
             {"taxid": 562, "name": "x", "sample": "all"},
             {"results_output_directory": str(results)}, {}, "blast",
         )
@@ -122,8 +125,35 @@ class TestOnDemandValidationCallback:
             return_value=validator,
         ):
             out = self._fn(app)(
-                MagicMock(), 1,
+                MagicMock(), _CLICK,
                 {"taxid": 562, "name": "x", "sample": "all"},
                 {"results_output_directory": str(results)}, {}, "blast",
             )
         assert "boom" in str(out[1])
+
+
+class TestClickTimeSubmit:
+    """The click queues its request in the main process, before any worker runs."""
+
+    def _fn(self, app):
+        return get_callback_fn(app, "on-demand-validation-request.data",
+                               input_contains="start-on-demand-validation")
+
+    def test_click_queues_the_request(self, app, tmp_path):
+        from nanometa_live.core.workflow.validation_queue import ValidationQueue
+
+        results = TestOnDemandValidationCallback()._results_dir(tmp_path)
+        config = {"results_output_directory": str(results),
+                  "pipeline_source": "remote:dev"}
+        out = self._fn(app)(2, {"taxid": 562, "name": "E. coli", "sample": "all"},
+                            config, "minimap2")
+        (record,) = ValidationQueue(results / "on_demand_validation").requests()
+        assert out == {"n_clicks": 2, "request_id": record["request_id"]}
+        assert (record["taxid"], record["method"]) == (562, "minimap2")
+
+    def test_nothing_is_queued_when_the_run_cannot_start(self, app, tmp_path):
+        results = TestOnDemandValidationCallback()._results_dir(tmp_path)
+        out = self._fn(app)(1, {"taxid": 562, "name": "E. coli", "sample": "all"},
+                            {"results_output_directory": str(results)}, "blast")
+        assert out == {"n_clicks": 1, "request_id": None}
+        assert not (results / "on_demand_validation").exists()
@@ -167,3 +167,34 @@ class TestPollFidelity:
             dashboard_helpers.load_kraken_data = original
 
         assert sorted(s for s in seen if s) == sorted(spec.sample_names)
+
+
+class TestReplay:
+    def test_streams_every_batch_and_polls_each_tick(self, tmp_path):
+        """A short replay writes the whole schedule and the poll sees it."""
+        from nanometa_live.core.utils.classification_loaders import load_kraken_data
+        from scripts.perf.instrument import reset_caches
+        from scripts.perf.replay import (
+            ReplaySpec, arrival_schedule, run_replay, summarise,
+        )
+
+        spec = ReplaySpec(n_barcodes=2, batches_per_minute=2, hours=0.05,
+                          tick_seconds=60, taxa_per_report=60,
+                          fastp_every=2, validation_every=3)
+        ticks = run_replay(spec, tmp_path, build_figures=False)
+        events = arrival_schedule(spec)
+
+        assert len(ticks) == spec.n_ticks
+        assert [t.files_total for t in ticks] == sorted(t.files_total for t in ticks)
+        reports = list(tmp_path.glob("kraken2/*/batch_reports/*.kraken2.report.txt"))
+        assert len(reports) == len(events)
+        assert not list(tmp_path.rglob(".*.part"))
+
+        summary = summarise(spec, ticks)
+        assert summary["latency_ms"]["p50"] <= summary["latency_ms"]["p99"]
+        assert summary["syscalls_total"]["os.stat"] > 0
+
+        reset_caches()
+        df = load_kraken_data(str(tmp_path), "barcode01")
+        assert not df.empty
+        reset_caches()
@@ -0,0 +1,171 @@
+"""Tests for mergeable seqkit read-length/quality sketches."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+from nanometa_live.core.utils import loader_utils as lu
+from nanometa_live.core.utils.qc_loaders import load_seqkit_sketch, load_seqkit_stats
+from nanometa_live.core.utils.qc_sketch import (
+    ReadSketch,
+    clear_sketch_cache,
+    sketch_path,
+    update_sample_sketch,
+)
+
+HEADER = (
+    "file\tformat\ttype\tnum_seqs\tsum_len\tmin_len\tavg_len\tmax_len"
+    "\tQ1\tQ2\tQ3\tsum_gap\tN50\tN50_num\tQ20(%)\tQ30(%)\tAvgQual\tGC(%)\tsum_n\n"
+)
+
+
+def _row(num_seqs=1000, min_len=200, q1=800, q2=1500, q3=3000, max_len=20000,
+         n50=4000, avg_len=2200, avgqual=15.0):
+    return {
+        "file": "s.fastq.gz", "format": "FASTQ", "type": "DNA",
+        "num_seqs": num_seqs, "sum_len": num_seqs * avg_len,
+        "min_len": min_len, "avg_len": avg_len, "max_len": max_len,
+        "Q1": q1, "Q2": q2, "Q3": q3, "sum_gap": 0, "N50": n50,
+        "N50_num": num_seqs // 4, "Q20(%)": 90.0, "Q30(%)": 80.0,
+        "AvgQual": avgqual, "GC(%)": 40.0, "sum_n": 0,
+    }
+
+
+def _write_batch(path, row):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cols = HEADER.strip().split("\t")
+    path.write_text(HEADER + "\t".join(str(row[c]) for c in cols) + "\n")
+    stamp = time.time() - 10
+    os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches():
+    lu.clear_data_cache()
+    yield
+    lu.clear_data_cache()
+
+
+class TestReadSketch:
+    def test_single_batch_reproduces_its_own_quartiles_and_n50(self):
+        sketch = ReadSketch.from_rows([_row()])
+        assert sketch.length_quantile(0.25) == pytest.approx(800, rel=0.03)
+        assert sketch.length_quantile(0.5) == pytest.approx(1500, rel=0.03)
+        assert sketch.length_quantile(0.75) == pytest.approx(3000, rel=0.03)
+        assert sketch.n50() == pytest.approx(4000, rel=0.03)
+
+    def test_merge_is_order_independent(self):
+        rows = [_row(), _row(num_seqs=50, q1=5000, q2=8000, q3=12000, n50=11000),
+                _row(num_seqs=0, min_len=0, max_len=0)]
+        forward = ReadSketch.from_rows(rows)
+        backward = ReadSketch()
+        for row in reversed(rows):
+            backward.merge(ReadSketch.from_rows([row]))
+        assert forward.to_seqkit_row("s") == backward.to_seqkit_row("s")
+
+    def test_merged_median_follows_the_combined_distribution(self):
+        short = _row(num_seqs=900, min_len=100, q1=300, q2=500, q3=700, max_len=1000,
+                     n50=600, avg_len=500)
+        long_ = _row(num_seqs=100, min_len=5000, q1=8000, q2=10000, q3=12000,
+                     max_len=20000, n50=11000, avg_len=10000)
+        sketch = ReadSketch.from_rows([short, long_])
+        # 90% of reads are short: the median stays short even though the
+        # mean (1450 bp) is pulled up by the long batch.
+        assert sketch.length_quantile(0.5) < 700
+        # Most bases sit in the long reads, so N50 lands among them.
+        assert 5000 <= sketch.n50() <= 12000
+
+    def test_empty_batch_does_not_touch_min_len(self):
+        sketch = ReadSketch.from_rows([_row(min_len=1030), _row(num_seqs=0, min_len=0)])
+        assert sketch.to_seqkit_row("s")["min_len"] == 1030
+
+    def test_round_trips_through_json(self):
+        sketch = ReadSketch.from_rows([_row(), _row(num_seqs=10, avgqual=22.0)])
+        restored = ReadSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+        assert restored.to_seqkit_row("s") == sketch.to_seqkit_row("s")
+        assert restored.median_quality() == sketch.median_quality()
+
+    def test_median_quality(self):
+        sketch = ReadSketch.from_rows([_row(num_seqs=10, avgqual=10.0),
+                                       _row(num_seqs=30, avgqual=20.0)])
+        assert 19.5 <= sketch.median_quality() <= 20.5
+
+
+class TestIncrementalUpdate:
+    def _update(self, seqkit_dir, files, reads):
+        def read_batch(path):
+            reads.append(os.path.basename(path))
+            return _row()
+        return update_sample_sketch(
+            str(seqkit_dir), "s1", [str(f) for f in files],
+            read_batch=read_batch, is_stable=lu._is_stat_stable,
+        )
+
+    def test_reads_only_new_batches_and_survives_a_restart(self, tmp_path):
+        seqkit = tmp_path / "seqkit"
+        files = [seqkit / "s1" / "batch_stats" / f"batch_{i}.tsv" for i in range(3)]
+        for f in files:
+            _write_batch(f, _row())
+
+        reads = []
+        self._update(seqkit, files[:2], reads)
+        assert reads == ["batch_0.tsv", "batch_1.tsv"]
+        sketch = self._update(seqkit, files, reads)
+        assert reads[2:] == ["batch_2.tsv"]
+        assert sketch.num_seqs == 3000
+        assert os.path.isfile(sketch_path(str(seqkit), "s1"))
+
+        clear_sketch_cache()  # a new process: only the persisted file remains
+        sketch = self._update(seqkit, files, reads)
+        assert reads[3:] == []
+        assert sketch.num_seqs == 3000
+
+    def test_a_rewritten_batch_triggers_a_rebuild(self, tmp_path):
+        seqkit = tmp_path / "seqkit"
+        files = [seqkit / "s1" / "batch_stats" / f"batch_{i}.tsv" for i in range(2)]
+        for f in files:
+            _write_batch(f, _row())
+        reads = []
+        self._update(seqkit, files, reads)
+        _write_batch(files[0], _row(num_seqs=12345))
+        os.utime(files[0], ns=(0, os.stat(files[0]).st_mtime_ns - 10**9))
+        self._update(seqkit, files, reads)
+        assert reads[2:] == ["batch_0.tsv", "batch_1.tsv"]
+
+    def test_unstable_batch_is_picked_up_later(self, tmp_path):
+        seqkit = tmp_path / "seqkit"
+        f = seqkit / "s1" / "batch_stats" / "batch_0.tsv"
+        _write_batch(f, _row())
+        os.utime(f, None)  # just written
+        reads = []
+        assert self._update(seqkit, [f], reads).num_seqs == 0
+        stamp = time.time() - 10
+        os.utime(f, (stamp, stamp))
+        assert self._update(seqkit, [f], reads).num_seqs == 1000
+
+
+class TestLoaderIntegration:
+    def test_incremental_quartiles_come_from_the_batches(self, tmp_path):
+        seqkit = tmp_path / "seqkit"
+        _write_batch(seqkit / "s1" / "batch_stats" / "batch_0.tsv", _row())
+        _write_batch(seqkit / "s1" / "batch_stats" / "batch_1.tsv", _row())
+        row = load_seqkit_stats(str(tmp_path), "s1").iloc[0]
+        assert row["num_seqs"] == 2000
+        # Previously Q2 = mean (2200) and N50 = int(mean).
+        assert row["Q2"] == pytest.approx(1500, rel=0.03)
+        assert row["N50"] == pytest.approx(4000, rel=0.03)
+
+    def test_all_samples_sketch_merges_flat_and_incremental(self, tmp_path):
+        seqkit = tmp_path / "seqkit"
+        _write_batch(seqkit / "s1" / "batch_stats" / "batch_0.tsv", _row())
+        _write_batch(seqkit / "s2.tsv", _row(num_seqs=3000))
+        sketch = load_seqkit_sketch(str(tmp_path), None)
+        assert sketch.num_seqs == 4000
+        assert sketch.n50() == pytest.approx(4000, rel=0.03)
+
+    def test_no_data_is_none(self, tmp_path):
+        assert load_seqkit_sketch(str(tmp_path), None) is None
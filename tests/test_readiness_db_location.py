@@ -91,9 +91,9 @@ class TestKrakenDbLocationCheck:
 
     def test_registered_in_check_readiness(self):
         # Wiring pin without running the full checklist (which probes
-        # network APIs): the check must be appended by check_readiness.
+        # network APIs): the check must be in the spec list check_readiness runs.
         import inspect
-        src = inspect.getsource(ReadinessChecker.check_readiness)
+        src = inspect.getsource(ReadinessChecker._check_specs)
         assert "_check_kraken_db_location" in src, (
             "the location check exists but check_readiness never runs it"
         )
@@ -0,0 +1,157 @@
+"""Readiness engine: concurrent checks, per-check TTLs and input invalidation."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from nanometa_live.core.workflow.readiness_checker import (
+    CheckResult,
+    ReadinessChecker,
+    Severity,
+)
+from nanometa_live.core.workflow.readiness_engine import (
+    CheckCache,
+    CheckSpec,
+    ReadinessEngine,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _spec(key, calls, delay=0.0, **kw):
+    def run():
+        calls.append(key)
+        time.sleep(delay)
+        return CheckResult(key, True, Severity.WARNING, f"{key} ok")
+    kw.setdefault("ttl", 60)
+    return CheckSpec(key, run, key, **kw)
+
+
+class TestConcurrency:
+    def test_cold_run_is_bounded_by_the_slowest_check(self):
+        calls = []
+        specs = [_spec(f"c{i}", calls, delay=0.3) for i in range(6)]
+        engine = ReadinessEngine()
+        results = engine.run(specs, {})
+        assert engine.stats.elapsed_s < 1.0  # serial would be 1.8 s
+        assert [r.name for r in results] == [f"c{i}" for i in range(6)]
+
+    def test_partial_results_stream_in_completion_order(self):
+        calls, seen = [], []
+        specs = [_spec("slow", calls, delay=0.3), _spec("fast", calls)]
+        results = ReadinessEngine().run(
+            specs, {}, on_result=lambda spec, rs: seen.append(spec.key))
+        assert seen == ["fast", "slow"]
+        assert [r.name for r in results] == ["slow", "fast"]
+
+    def test_a_hung_check_times_out_and_is_not_cached(self):
+        calls = []
+        cache = CheckCache()
+        specs = [_spec("hung", calls, delay=2.0, timeout=0.1), _spec("ok", calls)]
+        engine = ReadinessEngine(cache)
+        start = time.monotonic()
+        hung, ok = engine.run(specs, {})
+        assert time.monotonic() - start < 1.0
+        assert (hung.passed, hung.name) == (False, "hung")
+        assert "did not finish" in hung.message
+        assert ok.passed and engine.stats.timed_out == 1
+        assert len(cache) == 1  # only "ok"
+
+    def test_a_raising_check_still_propagates(self):
+        def boom():
+            raise RuntimeError("probe exploded")
+        with pytest.raises(RuntimeError, match="probe exploded"):
+            ReadinessEngine().run([CheckSpec("boom", boom, "Boom")], {})
+
+
+class TestReuse:
+    def test_warm_run_reuses_every_result(self):
+        calls = []
+        specs = [_spec(f"c{i}", calls, delay=0.05) for i in range(4)]
+        engine = ReadinessEngine(CheckCache())
+        engine.run(specs, {})
+        calls.clear()
+        engine.run(specs, {})
+        assert calls == [] and engine.stats.reused == 4
+        assert engine.stats.elapsed_s < 0.05
+
+    def test_only_the_check_whose_inputs_changed_reruns(self, tmp_path):
+        calls = []
+        watched = tmp_path / "genomes"
+        watched.mkdir()
+        specs = [
+            _spec("by_config", calls, config_keys=("kraken_db",)),
+            _spec("by_path", calls, paths=(watched,)),
+            _spec("by_env", calls, env=("PATH",)),
+        ]
+        engine = ReadinessEngine(CheckCache())
+        engine.run(specs, {"kraken_db": "/a"})
+
+        calls.clear()
+        engine.run(specs, {"kraken_db": "/b"})
+        assert calls == ["by_config"]
+
+        calls.clear()
+        (watched / "562.fasta").write_text(">x\nACGT\n")
+        engine.run(specs, {"kraken_db": "/b"})
+        assert calls == ["by_path"]
+
+        calls.clear()
+        with patch.dict("os.environ", {"PATH": "/opt/new/bin"}):
+            engine.run(specs, {"kraken_db": "/b"})
+        assert calls == ["by_env"]
+
+    def test_ttl_expiry_and_refresh_force_a_rerun(self):
+        calls = []
+        spec = _spec("c", calls, ttl=30)
+        cache = CheckCache()
+        engine = ReadinessEngine(cache)
+        engine.run([spec], {})
+        sig = spec.signature({})
+        assert cache.lookup(spec, sig, time.time() + 29) is not None
+        assert cache.lookup(spec, sig, time.time() + 31) is None
+        engine.run([spec], {}, refresh=True)
+        assert calls == ["c", "c"]
+
+    def test_zero_ttl_always_runs(self):
+        calls = []
+        engine = ReadinessEngine(CheckCache())
+        for _ in range(2):
+            engine.run([_spec("c", calls, ttl=0)], {})
+        assert calls == ["c", "c"]
+
+    def test_cache_survives_a_new_process(self, tmp_path):
+        calls = []
+        spec = _spec("c", calls, config_keys=("kraken_db",))
+        ReadinessEngine(CheckCache(tmp_path / "rc.json")).run([spec], {"kraken_db": "/a"})
+        (result,) = ReadinessEngine(CheckCache(tmp_path / "rc.json")).run(
+            [spec], {"kraken_db": "/a"})
+        assert calls == ["c"]
+        assert result == CheckResult("c", True, Severity.WARNING, "c ok")
+
+
+class TestReadinessChecker:
+    CONFIG = {"offline_mode": True, "pipeline_profile": "standard"}
+
+    def test_warm_check_readiness_skips_the_probes(self, tmp_path):
+        checker = ReadinessChecker(cache=CheckCache(tmp_path / "rc.json"))
+        probe = CheckResult("Nextflow Version", True, Severity.INFO, "Nextflow 24.4")
+        with patch.object(ReadinessChecker, "_check_nextflow_version",
+                          return_value=probe) as nextflow:
+            first = checker.check_readiness(self.CONFIG, str(tmp_path))
+            second = checker.check_readiness(self.CONFIG, str(tmp_path))
+            assert nextflow.call_count == 1
+            checker.check_readiness(self.CONFIG, str(tmp_path), refresh=True)
+            assert nextflow.call_count == 2
+        assert [c.name for c in first.checks] == [c.name for c in second.checks]
+        assert checker.engine_stats.reused == 0  # refresh ran everything
+
+    def test_on_result_reports_progress_to_completion(self, tmp_path):
+        progress = []
+        report = ReadinessChecker().check_readiness(
+            self.CONFIG, str(tmp_path),
+            on_result=lambda results, done, total: progress.append((len(results), done, total)))
+        total = progress[-1][2]
+        assert [p[1] for p in progress] == list(range(1, total + 1))
+        assert progress[-1][0] == len(report.checks)
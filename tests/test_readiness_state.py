@@ -111,3 +111,22 @@ class TestHeaderPill:
             {"checks": [], "error": "No configuration loaded"})
         assert color == "secondary"
         assert "Not configured" in _text(children)
+
+    def test_streamed_partial_shows_progress(self, render):
+        import time
+        state = {"ready": True, "checks": [{"name": "x", "passed": True}],
+                 "summary": {"passed": 1, "total": 1, "critical_failures": 0}}
+        partial = {"done": 3, "total": 20, "started_at": time.time(),
+                   "checks": [{"name": "Kraken2 Database", "passed": True}] * 3}
+        children, color, popover = render(state, partial)
+        assert color == "secondary"
+        assert "Checking 3/20" in _text(children)
+        assert "Kraken2 Database" in _text(popover)
+
+    def test_finished_or_stale_partial_falls_back_to_state(self, render):
+        state = {"ready": True, "checks": [{"name": "x", "passed": True}],
+                 "summary": {"passed": 1, "total": 1, "critical_failures": 0}}
+        for partial in ({"done": 20, "total": 20, "started_at": 9e12},
+                        {"done": 3, "total": 20, "started_at": 1.0}):
+            _children, color, _popover = render(state, partial)
+            assert color == "success"
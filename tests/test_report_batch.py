@@ -0,0 +1,114 @@
+"""Batch report export: many results dirs, one pool, per-run failures."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from nanometa_live.cli import report as report_cli
+from nanometa_live.core.export import batch_report
+from nanometa_live.core.export.batch_report import ReportJob, generate_reports
+from nanometa_live.core.export.report_charts import local_plotly_js
+from nanometa_live.core.utils.file_utils import reflink_or_copy
+from nanometa_live.core.watchlist.watchlist_manager import reset_watchlist_manager
+
+pytestmark = pytest.mark.unit
+
+_KRAKEN = (
+    " 0.00\t0\t0\tU\t0\tunclassified\n"
+    "100.00\t100\t0\tR\t1\troot\n"
+    "100.00\t100\t0\tD\t2\t  Bacteria\n"
+    "100.00\t100\t100\tS\t562\t    Escherichia coli\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_watchlists():
+    reset_watchlist_manager()
+    yield
+    reset_watchlist_manager()
+
+
+def _run(tmp_path, name):
+    base = tmp_path / "archive" / name
+    (base / "kraken2").mkdir(parents=True)
+    (base / "kraken2" / "barcode01.kraken2.report.txt").write_text(_KRAKEN)
+    (base / "kraken2" / "barcode02.kraken2.report.txt").write_text(_KRAKEN)
+    return base
+
+
+class TestBatchCLI:
+    def test_pool_generates_every_run_and_reports_failures(self, tmp_path, capsys):
+        runs = [_run(tmp_path, "run_a"), _run(tmp_path, "run_b")]
+        out = tmp_path / "reports"
+        argv = ["nanometa-report", "-r", *map(str, runs), str(tmp_path / "gone"),
+                "-o", str(out), "--no-raw", "--jobs", "2", "--watchlist", "none"]
+        with patch("sys.argv", argv), pytest.raises(SystemExit) as exc:
+            report_cli.main()
+        assert exc.value.code == 1
+        assert (out / "run_a" / "report.html").exists()
+        assert (out / "run_b" / "report.html").exists()
+        captured = capsys.readouterr()
+        assert "Generated 2/3 reports" in captured.out
+        assert "runs/minute" in captured.out
+        assert "gone: FileNotFoundError" in captured.err
+
+    def test_clashing_run_names_get_distinct_dirs(self):
+        dirs = report_cli._batch_output_dirs(["/a/run", "/b/run", "/c/other"], "/out")
+        assert dirs == ["/out/run", "/out/run-2", "/out/other"]
+        assert report_cli._batch_output_dirs(["/a/run"], None) == ["/a/run/report"]
+
+
+class TestGenerateReports:
+    def test_a_raising_run_does_not_end_the_batch(self, tmp_path):
+        runs = [_run(tmp_path, "ok"), _run(tmp_path, "bad")]
+        jobs = [ReportJob(str(r), str(tmp_path / "out" / r.name), include_raw=False)
+                for r in runs]
+        from nanometa_live.core.export.report_generator import ReportGenerator
+        real = ReportGenerator.generate
+
+        def generate(self, output_dir, **kw):
+            if output_dir.endswith("bad"):
+                raise RuntimeError("corrupt report")
+            return real(self, output_dir, **kw)
+
+        seen = []
+        with patch.object(ReportGenerator, "generate", generate):
+            summary = generate_reports(jobs, workers=1, on_done=seen.append)
+        assert [o.ok for o in summary.outcomes] == [True, False]
+        assert summary.outcomes[1].error == "RuntimeError: corrupt report"
+        assert len(seen) == 2
+        assert summary.runs_per_minute > 0
+
+    def test_each_job_screens_only_its_own_watchlists(self, tmp_path):
+        run = _run(tmp_path, "r")
+        enabled = []
+        with patch("nanometa_live.core.watchlist.watchlist_manager."
+                   "WatchlistManager.enable_watchlist",
+                   lambda self, wl: enabled.append((self, wl))):
+            generate_reports([
+                ReportJob(str(run), str(tmp_path / "o1"), watchlist_ids=["a"],
+                          include_raw=False),
+                ReportJob(str(run), str(tmp_path / "o2"), watchlist_ids=["b"],
+                          include_raw=False),
+            ], workers=1)
+        assert [wl for _, wl in enabled] == ["a", "b"]
+        assert enabled[0][0] is not enabled[1][0]  # a fresh manager per job
+
+
+class TestSharedInputs:
+    def test_plotly_bundle_is_read_once(self):
+        local_plotly_js.cache_clear()
+        batch_report.warm_shared_caches()
+        local_plotly_js()
+        info = local_plotly_js.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_reflink_or_copy_preserves_content_and_mtime(self, tmp_path):
+        src = tmp_path / "a.txt"
+        src.write_text("payload")
+        os.utime(src, (1_000_000_000, 1_000_000_000))
+        dst = tmp_path / "b.txt"
+        assert reflink_or_copy(str(src), str(dst)) == str(dst)
+        assert dst.read_text() == "payload"
+        assert int(dst.stat().st_mtime) == 1_000_000_000
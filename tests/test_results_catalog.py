@@ -0,0 +1,203 @@
+"""Tests for the single-pass results-tree catalog."""
+
+from __future__ import annotations
+
+import glob
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from nanometa_live.core.utils import loader_utils as lu
+from nanometa_live.core.utils import results_catalog as rc
+from nanometa_live.core.utils.sample_detector import (
+    get_available_samples,
+    get_sample_file_mapping,
+    invalidate_sample_cache,
+)
+
+SAMPLES = ("barcode01", "barcode02", "barcode03")
+
+
+def _touch(path: Path, text: str = "data\n", age: float = 30.0) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+
+
+def _age_dirs(root: Path, age: float = 30.0) -> None:
+    """Backdate directory mtimes so listings are not treated as racy."""
+    stamp = time.time() - age
+    for dirpath, _dirs, _files in os.walk(root):
+        os.utime(dirpath, (stamp, stamp))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for sample in SAMPLES:
+        for batch in range(3):
+            _touch(tmp_path / "kraken2" / sample / "batch_reports"
+                   / f"batch_{batch}.kraken2.report.txt")
+        _touch(tmp_path / "kraken2" / f"{sample}.cumulative.kraken2.report.txt")
+        _touch(tmp_path / "fastp" / f"{sample}.fastp.json", "{}")
+        _touch(tmp_path / "seqkit" / sample / "batch_stats" / "batch_0.tsv")
+    _touch(tmp_path / "kraken2" / ".hidden.kraken2.report.txt")
+    _touch(tmp_path / "nanoplot" / "barcode09" / "NanoStats.txt")
+    _age_dirs(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    lu.clear_data_cache()
+    invalidate_sample_cache()
+    yield
+    lu.clear_data_cache()
+    invalidate_sample_cache()
+
+
+def _count(monkeypatch, module, name):
+    calls = []
+    original = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, wrapper)
+    return calls
+
+
+class TestIncrementalRefresh:
+    def test_unchanged_directories_are_not_listed_again(self, tree):
+        catalog = rc.refresh_catalog(str(tree), 1000)
+        assert catalog.last_refresh["dirs_listed"] > 0
+        catalog = rc.refresh_catalog(str(tree), 1000)
+        assert catalog.last_refresh["dirs_listed"] == 0
+
+    def test_only_the_changed_directory_is_listed(self, tree):
+        rc.refresh_catalog(str(tree), 1000)
+        batch_dir = tree / "kraken2" / "barcode02" / "batch_reports"
+        _touch(batch_dir / "batch_3.kraken2.report.txt")
+        os.utime(batch_dir, ns=(0, os.stat(batch_dir).st_mtime_ns + 10**9))
+        catalog = rc.refresh_catalog(str(tree), 1000)
+        assert catalog.last_refresh["dirs_listed"] == 1
+        assert rc.scan_exists(str(batch_dir / "batch_3.kraken2.report.txt"))
+
+    def test_recently_modified_directory_is_listed_again(self, tree):
+        rc.refresh_catalog(str(tree), 1000)
+        fresh = tree / "fastp"
+        os.utime(fresh, None)
+        rc.refresh_catalog(str(tree), 1000)
+        catalog = rc.refresh_catalog(str(tree), 1000)
+        assert catalog.last_refresh["dirs_listed"] == 1
+
+    def test_summaries_match_the_full_walk(self, tree):
+        catalog = rc.refresh_catalog(str(tree), 1000)
+        for subdir in rc.RESULTS_WATCHED_SUBDIRS:
+            assert catalog.subdir_summary(subdir) == lu._get_dir_latest_mtime(
+                str(tree / subdir)
+            )
+
+
+class TestQueries:
+    @pytest.mark.parametrize("pattern", [
+        "kraken2/*.kraken2.report.txt",
+        "kraken2/barcode01_batch*.kraken2.report.txt",
+        "kraken2/barcode01/batch_reports/*.kraken2.report.txt",
+        "kraken2/*",
+        "kraken2/.hidden*",
+        "fastp/barcode02.fastp.json",
+        "fastp/missing.fastp.json",
+        "nanoplot/*",
+        "validation/blast/*.blast.tsv",
+    ])
+    def test_glob_matches_the_filesystem(self, tree, pattern):
+        rc.refresh_catalog(str(tree), 1000)
+        full = str(tree / pattern)
+        assert sorted(rc.scan_glob(full)) == sorted(glob.glob(full))
+
+    def test_exists_and_isdir(self, tree):
+        rc.refresh_catalog(str(tree), 1000)
+        assert rc.scan_isdir(str(tree / "kraken2" / "barcode01"))
+        assert rc.scan_exists(str(tree / "fastp" / "barcode01.fastp.json"))
+        assert not rc.scan_exists(str(tree / "fastp" / "nope.json"))
+        assert not rc.scan_isdir(str(tree / "taxpasta"))
+        with pytest.raises(OSError):
+            rc.scan_listdir(str(tree / "taxpasta"))
+
+    def test_fingerprint_matches_the_full_walk(self, tree):
+        paths = [
+            str(tree / "kraken2" / "barcode01"),
+            str(tree / "kraken2" / "barcode01.cumulative.kraken2.report.txt"),
+            str(tree / "kraken2" / "absent.kraken2.report.txt"),
+        ]
+        walked = lu._get_path_fingerprint(paths)
+        rc.refresh_catalog(str(tree), 1000)
+        assert rc.catalog_fingerprint(paths) == walked
+
+    def test_truncated_subdir_falls_back_to_the_walk(self, tree):
+        rc.refresh_catalog(str(tree), 2)
+        assert rc.catalog_fingerprint([str(tree / "kraken2")]) is None
+
+    def test_paths_outside_the_root_fall_through(self, tree, tmp_path_factory):
+        other = tmp_path_factory.mktemp("other")
+        _touch(other / "kraken2" / "x.kraken2.report.txt")
+        rc.refresh_catalog(str(tree), 1000)
+        assert rc.scan_exists(str(other / "kraken2" / "x.kraken2.report.txt"))
+        assert rc.catalog_fingerprint([str(other / "kraken2")]) is None
+
+    def test_symlinked_directory_is_answered_by_the_filesystem(self, tree, tmp_path_factory):
+        target = tmp_path_factory.mktemp("elsewhere")
+        _touch(target / "batch_0.kraken2.report.txt")
+        os.symlink(target, tree / "kraken2" / "linked")
+        rc.refresh_catalog(str(tree), 1000)
+        inside = str(tree / "kraken2" / "linked" / "batch_0.kraken2.report.txt")
+        assert rc.scan_exists(inside)
+        assert rc.scan_glob(str(tree / "kraken2" / "linked" / "*.txt")) == [inside]
+
+    def test_snapshot_holds_until_the_next_freshness_check(self, tree):
+        lu.check_data_freshness(str(tree))
+        new = tree / "fastp" / "barcode04.fastp.json"
+        _touch(new, "{}")
+        assert not rc.scan_exists(str(new))
+        lu.check_data_freshness(str(tree))
+        assert rc.scan_exists(str(new))
+
+
+class TestDerivedViews:
+    def test_samples_and_mapping_need_no_directory_scans(self, tree, monkeypatch):
+        expected_samples = get_available_samples(str(tree))
+        expected_mapping = get_sample_file_mapping(str(tree))
+        invalidate_sample_cache()
+
+        lu.check_data_freshness(str(tree))
+        globs = _count(monkeypatch, glob, "glob")
+        listings = _count(monkeypatch, os, "scandir")
+        listdirs = _count(monkeypatch, os, "listdir")
+        assert get_available_samples(str(tree)) == expected_samples
+        assert get_sample_file_mapping(str(tree)) == expected_mapping
+        assert (globs, listings, listdirs) == ([], [], [])
+        assert "barcode09" in expected_samples
+
+    def test_quiet_poll_lists_no_directories(self, tree, monkeypatch):
+        lu.check_data_freshness(str(tree))
+        listings = _count(monkeypatch, os, "scandir")
+        lu.check_data_freshness(str(tree))
+        assert listings == []
+
+    def test_in_place_rewrite_still_advances_the_fingerprint(self, tree):
+        first = lu.check_data_freshness(str(tree))
+        _touch(tree / "kraken2" / "barcode01.cumulative.kraken2.report.txt", "more\n", age=5)
+        assert lu.check_data_freshness(str(tree)) != first
+
+    def test_freshness_map_reads_mtimes_from_the_catalog(self, tree, monkeypatch):
+        from nanometa_live.app.utils.freshness import freshness_map
+
+        expected = freshness_map(str(tree), SAMPLES)
+        lu.check_data_freshness(str(tree))
+        listings = _count(monkeypatch, os, "scandir")
+        assert freshness_map(str(tree), SAMPLES) == expected
+        assert listings == []
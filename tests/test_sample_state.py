@@ -0,0 +1,42 @@
+"""Persisted per-sample state shared by the incremental reducers."""
+
+import json
+
+import pytest
+
+from nanometa_live.core.utils.sample_state import SampleStateFile, sample_state_path
+
+pytestmark = pytest.mark.unit
+
+_STATE = SampleStateFile("test state", ".nanometa.test", 2, encode=dict, decode=dict)
+
+
+def test_path_is_beside_the_results_subdirectory(tmp_path):
+    path = sample_state_path(str(tmp_path / "kraken2"), ".nanometa.test", "barcode01", ".jsonl")
+    assert path == str(tmp_path / ".nanometa.test" / "barcode01.jsonl")
+    assert _STATE.path(str(tmp_path / "kraken2"), "barcode01").endswith("barcode01.json")
+
+
+def test_round_trip(tmp_path):
+    path = _STATE.path(str(tmp_path / "qc"), "barcode01")
+    _STATE.save(path, {"b.tsv": (2, 20), "a.tsv": (1, 10)}, {"total": 3})
+    assert _STATE.load(path) == ({"a.tsv": (1, 10), "b.tsv": (2, 20)}, {"total": 3})
+
+
+@pytest.mark.parametrize("content", [
+    {"schema": 1, "inventory": {}, "state": {}},
+    {"schema": 2, "inventory": [], "state": {}},
+    {"schema": 2, "inventory": {"a": [1]}, "state": {}},
+    {"schema": 2, "state": {}},
+])
+def test_stale_or_malformed_state_reads_as_absent(tmp_path, content):
+    path = tmp_path / "s.json"
+    path.write_text(json.dumps(content))
+    assert _STATE.load(str(path)) is None
+
+
+def test_unwritable_directory_is_not_an_error(tmp_path):
+    blocker = tmp_path / "results"
+    blocker.write_text("")  # a file where the state directory should go
+    _STATE.save(str(blocker / "s.json"), {}, {})
+    assert _STATE.load(str(blocker / "s.json")) is None
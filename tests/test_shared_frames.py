@@ -0,0 +1,198 @@
+"""Cross-process cache tier (``NANOMETA_SHARED_CACHE``) for parsed loader results."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nanometa_live.core.utils import shared_frames as sf
+from nanometa_live.core.utils.shared_frames import SharedStore
+
+pytestmark = pytest.mark.unit
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def shared_dir(tmp_path):
+    from nanometa_live.core.utils.loader_utils import clear_all_loader_caches
+
+    root = tmp_path / "shm"
+    sf.set_shared_cache_dir(str(root))
+    clear_all_loader_caches()
+    yield root
+    sf.set_shared_cache_dir(None)
+    clear_all_loader_caches()
+
+
+def _frame(n=50):
+    return pd.DataFrame({
+        "%": np.linspace(0, 100, n),
+        "cumul_reads": np.arange(n, dtype=np.int64) * 7,
+        "rank": ["S"] * n,
+        "taxid": np.arange(n, dtype=np.int64) + 1000,
+        "name": [f"taxon {i}" if i % 5 else None for i in range(n)],
+    })
+
+
+def _never():
+    raise AssertionError("a published entry must not be recomputed")
+
+
+class TestStore:
+    def test_frame_round_trips_with_numeric_columns_mapped(self, tmp_path):
+        df = _frame()
+        out = SharedStore(tmp_path).frame("k", "sig", lambda: df)
+        pd.testing.assert_frame_equal(out, df)
+        assert not out["cumul_reads"].to_numpy().flags.writeable
+        assert out["cumul_reads"].to_numpy().base is not None
+
+    def test_a_second_process_maps_instead_of_computing(self, tmp_path):
+        SharedStore(tmp_path).frame("k", "sig", _frame)
+        peer = SharedStore(tmp_path)
+        pd.testing.assert_frame_equal(peer.frame("k", "sig", _never), _frame())
+        peer.frame("k", "sig", _never)
+        assert peer.stats == {"hits": 1, "maps": 1, "computes": 0}
+
+    def test_a_new_signature_republishes_and_drops_the_old_file(self, tmp_path):
+        store = SharedStore(tmp_path)
+        store.frame("k", "v1", _frame)
+        out = store.frame("k", "v2", lambda: _frame(3))
+        assert len(out) == 3
+        manifests = list(tmp_path.glob("*.manifest"))
+        manifest = json.loads(manifests[0].read_text())
+        assert manifest["version"] == 2 and manifest["signature"] == "v2"
+        assert [p.name for p in tmp_path.glob("*.columns")] == [manifest["file"]]
+
+    def test_non_string_columns_and_values_are_pickled(self, tmp_path):
+        store = SharedStore(tmp_path)
+        odd = pd.DataFrame({0: [1, 2], 1: ["a", "b"]})
+        pd.testing.assert_frame_equal(store.frame("odd", "s", lambda: odd), odd)
+        assert store.value("v", "s", lambda: [{"a": 1}]) == [{"a": 1}]
+        assert SharedStore(tmp_path).value("v", "s", _never) == [{"a": 1}]
+
+    def test_no_signature_bypasses_the_tier(self, tmp_path):
+        assert SharedStore(tmp_path).frame("k", None, lambda: "x") == "x"
+        assert not list(tmp_path.glob("*.manifest"))
+
+    def test_publish_failure_returns_the_computed_value(self, tmp_path):
+        store = SharedStore(tmp_path)
+        assert store.value("k", "s", lambda: (lambda: 1))() == 1
+
+    def test_arrow_format_when_pyarrow_is_installed(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        df = _frame()
+        SharedStore(tmp_path).frame("k", "sig", lambda: df)
+        assert list(tmp_path.glob("*.arrow"))
+        pd.testing.assert_frame_equal(
+            SharedStore(tmp_path).frame("k", "sig", _never), df, check_dtype=False)
+
+
+class TestConfiguration:
+    def test_off_unless_configured(self, monkeypatch):
+        monkeypatch.delenv(sf.SHARED_CACHE_ENV, raising=False)
+        assert sf.shared_store() is None
+
+    def test_environment_variable_selects_the_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(sf.SHARED_CACHE_ENV, str(tmp_path / "env"))
+        assert sf.shared_store().root == tmp_path / "env"
+
+    def test_directory_is_created_private(self, tmp_path):
+        SharedStore(tmp_path / "new")
+        assert (tmp_path / "new").stat().st_mode & 0o777 == 0o700
+
+    def test_a_directory_others_can_write_is_refused(self, tmp_path):
+        open_dir = tmp_path / "open"
+        open_dir.mkdir()
+        open_dir.chmod(0o777)
+        with pytest.raises(PermissionError):
+            SharedStore(open_dir)
+        sf.set_shared_cache_dir(str(open_dir))
+        try:
+            assert sf.shared_store() is None
+        finally:
+            sf.set_shared_cache_dir(None)
+
+    @pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() != 0,
+                        reason="chown to another user needs root")
+    def test_a_directory_owned_by_another_user_is_refused(self, tmp_path):
+        theirs = tmp_path / "theirs"
+        theirs.mkdir(mode=0o700)
+        os.chown(theirs, 65534, 65534)
+        with pytest.raises(PermissionError):
+            SharedStore(theirs)
+
+    def test_run_boundary_purges_published_entries(self, shared_dir):
+        from nanometa_live.core.utils.loader_utils import clear_all_loader_caches
+
+        sf.shared_store().frame("k", "s", _frame)
+        clear_all_loader_caches()
+        assert not list(shared_dir.glob("*.manifest"))
+        assert not list(shared_dir.glob("*.columns"))
+
+
+class TestLoaders:
+    @pytest.fixture
+    def results(self, tmp_path):
+        from scripts.perf.fixtures import FixtureSpec, build_fixture
+
+        return build_fixture(FixtureSpec(n_samples=3, taxa_per_report=60), tmp_path / "fx")
+
+    def test_kraken_frames_are_parsed_by_one_process(self, shared_dir, results, monkeypatch):
+        from nanometa_live.core.utils import classification_loaders as cl
+
+        code = ("from nanometa_live.core.utils.classification_loaders import load_kraken_data;"
+                f"assert not load_kraken_data({str(results)!r}, 'All Samples').empty")
+        env = {**os.environ, sf.SHARED_CACHE_ENV: str(shared_dir),
+               "PYTHONPATH": str(REPO_ROOT)}
+        subprocess.run([sys.executable, "-c", code], env=env, check=True, cwd=REPO_ROOT)
+
+        monkeypatch.setattr(cl, "_parse_kraken_data_uncached", lambda *a, **k: _never())
+        df = cl.load_kraken_data(str(results), "All Samples")
+        assert not df.empty
+        assert not df["cumul_reads"].to_numpy().flags.writeable
+        again = cl.load_kraken_data(str(results), "All Samples")
+        assert np.shares_memory(again["cumul_reads"].to_numpy(), df["cumul_reads"].to_numpy())
+
+    def test_callers_cannot_mutate_the_cached_frame(self, shared_dir, results):
+        from nanometa_live.core.utils.classification_loaders import load_kraken_data
+
+        first = load_kraken_data(str(results), "barcode01")
+        first.drop(columns=["taxid"], inplace=True)
+        first.loc[:, "name"] = "edited"
+        again = load_kraken_data(str(results), "barcode01")
+        assert "taxid" in again.columns and (again["name"] != "edited").any()
+
+    def test_cache_hits_are_private_copies_too(self, shared_dir, results):
+        from nanometa_live.core.utils.classification_loaders import load_kraken_data
+
+        load_kraken_data(str(results), "barcode01")
+        hit = load_kraken_data(str(results), "barcode01")
+        hit.loc[0, "cumul_reads"] = -1  # copy-on-write, not a read-only error
+        hit.loc[:, "name"] = "edited"
+        again = load_kraken_data(str(results), "barcode01")
+        assert again.loc[0, "cumul_reads"] != -1 and (again["name"] != "edited").all()
+
+    def test_without_copy_on_write_callers_get_deep_copies(self, shared_dir, results,
+                                                           monkeypatch):
+        from nanometa_live.core.utils import classification_loaders as cl
+
+        monkeypatch.setattr(cl, "_COPY_ON_WRITE", False)  # pandas 2.x default
+        first = cl.load_kraken_data(str(results), "barcode01")
+        hit = cl.load_kraken_data(str(results), "barcode01")
+        assert not np.shares_memory(first["cumul_reads"].to_numpy(),
+                                    hit["cumul_reads"].to_numpy())
+
+    def test_validation_results_are_shared(self, shared_dir, tmp_path):
+        from nanometa_live.core.parsers.blast_validation_parser import ValidationParser
+
+        validation = tmp_path / "run" / "validation"
+        validation.mkdir(parents=True)
+        (validation / "validation_results.json").write_text(json.dumps({"results": []}))
+        ValidationParser(str(tmp_path / "run")).get_validation_results()
+        assert len(list(shared_dir.glob("*.pickle"))) == 1
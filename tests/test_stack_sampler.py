@@ -0,0 +1,186 @@
+"""Tests for the sampling profiler and its Configuration-tab controls."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from unittest import mock
+
+import pytest
+from flask import Flask
+
+from nanometa_live.core.utils import stack_sampler as ss
+from nanometa_live.core.utils.stack_sampler import (
+    StackSampler,
+    profile_files,
+    tag_current_thread,
+    thread_role,
+)
+
+
+@pytest.fixture(autouse=True)
+def _stop_global_sampler():
+    yield
+    ss.stop_profiler()
+    ss._sampler = None
+    ss._thread_tags.clear()
+
+
+def _busy_loader_for_test(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    ready = threading.Event()
+
+    def run():
+        tag_current_thread("dashboard-verdict-banner.children")
+        ready.set()
+        _busy_loader_for_test(stop)
+
+    thread = threading.Thread(target=run, name="Thread-9 (process_request_thread)")
+    thread.start()
+    ready.wait(2)
+    yield thread
+    stop.set()
+    thread.join(2)
+
+
+class TestSampling:
+    def test_samples_are_rooted_at_role_and_callback_tag(self, tmp_path, busy_thread):
+        sampler = StackSampler(str(tmp_path))
+        for _ in range(5):
+            sampler.sample_once()
+        path = sampler.flush()
+        lines = open(path).read().splitlines()
+        tagged = [l for l in lines if l.startswith("request;callback:dashboard-verdict-banner.children;")]
+        assert tagged, lines
+        stack, count = tagged[0].rsplit(" ", 1)
+        assert "test_stack_sampler:_busy_loader_for_test" in stack
+        assert int(count) >= 1
+        # The sampling thread (here the test's own) never records itself.
+        assert not any(l.startswith("MainThread;") for l in lines)
+
+    def test_idle_threads_are_dropped_unless_asked_for(self, tmp_path):
+        parked = threading.Event()
+        thread = threading.Thread(target=parked.wait, name="idle-worker-3")
+        thread.start()
+        try:
+            time.sleep(0.05)
+            quiet = StackSampler(str(tmp_path / "quiet"))
+            quiet.sample_once()
+            loud = StackSampler(str(tmp_path / "loud"), include_idle=True)
+            loud.sample_once()
+        finally:
+            parked.set()
+            thread.join(2)
+        assert not any(k.startswith("idle-worker;") for k in quiet._counts)
+        assert any(k.startswith("idle-worker;") for k in loud._counts)
+
+    @pytest.mark.parametrize("name,role", [
+        ("Thread-12 (process_request_thread)", "request"),
+        ("Thread-3 (_worker)", "_worker"),
+        ("nextflow-monitor", "nextflow-monitor"),
+        ("pool-worker-7", "pool-worker"),
+        ("MainThread", "MainThread"),
+    ])
+    def test_thread_role(self, name, role):
+        assert thread_role(name) == role
+
+    def test_invalid_rate_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            StackSampler(str(tmp_path), hz=0)
+
+
+class TestFiles:
+    def test_rotation_keeps_the_newest_files(self, tmp_path):
+        sampler = StackSampler(str(tmp_path), keep_files=2)
+        for i in range(4):
+            sampler._counts["MainThread;a:f"] += 1
+            sampler._window_start = time.time() - 3600 * (4 - i)
+            sampler.flush()
+        files = profile_files(str(tmp_path))
+        assert len(files) == 2
+        assert sampler.files_written == 4
+
+    def test_empty_window_writes_nothing(self, tmp_path):
+        assert StackSampler(str(tmp_path)).flush() is None
+        assert profile_files(str(tmp_path)) == []
+
+    def test_background_run_rotates_and_flushes_on_stop(self, tmp_path, busy_thread):
+        sampler = ss.start_profiler(str(tmp_path), hz=200, rotate_seconds=0.05)
+        assert ss.start_profiler(str(tmp_path)) is sampler  # already running
+        time.sleep(0.3)
+        ss.stop_profiler()
+        assert not ss.profiler_running()
+        status = ss.profiler_status()
+        assert status["samples"] > 5
+        assert status["files"] >= 1
+        assert all(f.endswith(".folded") for f in os.listdir(tmp_path)
+                   if not f.startswith("."))
+
+
+class TestDashWiring:
+    def test_dispatch_requests_are_tagged_only_while_sampling(self, tmp_path):
+        from nanometa_live.app.callbacks.profiling import tag_callback_threads
+
+        server = Flask(__name__)
+        tag_callback_threads(server)
+        seen = []
+
+        @server.route("/_dash-update-component", methods=["POST"])
+        def dispatch():
+            seen.append(ss._thread_tags.get(threading.get_ident()))
+            return "{}"
+
+        client = server.test_client()
+        client.post("/_dash-update-component", json={"output": "qc-plot.figure"})
+        ss.start_profiler(str(tmp_path), hz=1)
+        client.post("/_dash-update-component", json={"output": "qc-plot.figure"})
+        assert seen == [None, "qc-plot.figure"]
+        assert ss._thread_tags == {}  # untagged on teardown
+
+    def test_config_tab_start_and_stop(self, tmp_path):
+        from dash import Dash
+        from dash_test_utils import ctx_with, get_callback_fn
+
+        from nanometa_live.app.callbacks.profiling import register_profiling
+
+        app = Dash(__name__, suppress_callback_exceptions=True)
+        register_profiling(app, mock.MagicMock())
+        fn = get_callback_fn(app, "profiler-status.children")
+
+        with ctx_with(None):
+            _body, start_disabled, stop_disabled = fn(None, None, str(tmp_path))
+        assert (start_disabled, stop_disabled) == (False, True)
+        with ctx_with("profiler-start-btn"):
+            _body, start_disabled, stop_disabled = fn(1, None, str(tmp_path))
+        assert ss.profiler_running()
+        assert ss.profiler_status()["out_dir"] == os.path.join(str(tmp_path), "logs", "profiles")
+        assert (start_disabled, stop_disabled) == (True, False)
+        with ctx_with("profiler-stop-btn"):
+            _body, start_disabled, stop_disabled = fn(1, 1, str(tmp_path))
+        assert not ss.profiler_running()
+        assert (start_disabled, stop_disabled) == (False, True)
+
+    def test_profile_flag(self):
+        from nanometa_live import nanometa_live as entry
+
+        with mock.patch("sys.argv", ["nanometa-live", "--profile", "--profile-hz", "5"]):
+            args = entry.parse_arguments()
+        assert args.profile is True
+        assert args.profile_hz == 5.0
+
+    @pytest.mark.parametrize("hz", ["0", "-5", "nan", "fast"])
+    def test_profile_hz_must_be_positive(self, hz, capsys):
+        from nanometa_live import nanometa_live as entry
+
+        with mock.patch("sys.argv", ["nanometa-live", "--profile", "--profile-hz", hz]):
+            with pytest.raises(SystemExit) as exc:
+                entry.parse_arguments()
+        assert exc.value.code == 2
+        assert "--profile-hz" in capsys.readouterr().err
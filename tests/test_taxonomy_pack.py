@@ -0,0 +1,190 @@
+"""Packed taxonomy snapshots: bulk, resumable import and summary-based stats."""
+
+import json
+import pathlib
+from unittest.mock import patch
+
+import pytest
+
+from nanometa_live.core.utils import offline_cache as oc
+from nanometa_live.core.utils.offline_cache import OfflineTaxonomyCache
+from nanometa_live.core.utils.taxonomy_pack import PackedSnapshot, is_pack
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def source(tmp_path):
+    cache = OfflineTaxonomyCache(cache_dir=str(tmp_path / "src"))
+    for taxid in range(50):
+        cache.cache_species_info(taxid, {"name": f"species {taxid}"})
+        cache.cache_ncbi_taxonomy(taxid, {"lineage": [1, 2, taxid]})
+    cache.cache_gtdb_taxonomy("E. coli", {"gtdb": "s__Escherichia coli"})
+    cache.set("stale", {"v": 1}, cache_type="species", ttl=-100)
+    return cache
+
+
+@pytest.fixture
+def pack(source, tmp_path):
+    path = tmp_path / "taxonomy_snapshot.nmpack"
+    assert source.export_snapshot(str(path)) == 102
+    return path
+
+
+class TestPackFile:
+    def test_round_trip_keeps_identifiers_and_timestamps(self, source, pack, tmp_path):
+        assert is_pack(pack)
+        target = OfflineTaxonomyCache(cache_dir=str(tmp_path / "dst"))
+        assert target.load_snapshot(str(pack)) == 102
+        assert target.get_gtdb_taxonomy("E. coli") == {"gtdb": "s__Escherichia coli"}
+        assert target.get_species_info(7) == {"name": "species 7"}
+        # Entry files are copied verbatim, so an expired entry stays expired.
+        assert target.get("stale") is None
+        assert target.get_stats() == {**source.get_stats(), "cache_dir": str(target.cache_dir)}
+
+    def test_entries_are_decoded_on_first_access(self, pack):
+        with PackedSnapshot(pack) as snap:
+            assert len(snap) == 102 and snap.stats()["ncbi_entries"] == 50
+            assert snap._decoded == {}
+            entry = snap.entry("species", "species_3.json")
+            assert entry["data"] == {"name": "species 3"}
+            assert len(snap._decoded) == 1
+            assert snap.entry("species", "missing.json") is None
+
+    def test_legacy_json_snapshots_still_load(self, tmp_path):
+        legacy = tmp_path / "taxonomy_snapshot.json"
+        legacy.write_text(json.dumps({"ncbi": {"562": {"b": 2}}, "species": {"562": {"c": 3}}}))
+        assert not is_pack(legacy)
+        cache = OfflineTaxonomyCache(cache_dir=str(tmp_path / "c"))
+        assert cache.load_snapshot(str(legacy)) == 2
+        assert cache.get_ncbi_taxonomy(562) == {"b": 2}
+
+
+class TestResumableImport:
+    def test_an_interrupted_import_resumes_after_the_last_batch(self, pack, tmp_path, monkeypatch):
+        monkeypatch.setattr(oc, "IMPORT_BATCH", 20)
+        target = OfflineTaxonomyCache(cache_dir=str(tmp_path / "dst"))
+        real = OfflineTaxonomyCache._store_batch
+        calls = []
+
+        def failing(self, records):
+            calls.append(1)
+            if len(calls) == 3:
+                raise KeyboardInterrupt
+            return real(self, records)
+
+        with patch.object(OfflineTaxonomyCache, "_store_batch", failing):
+            with pytest.raises(KeyboardInterrupt):
+                target.load_snapshot(str(pack))
+        assert target.load_snapshot(str(pack)) == 102 - 40
+        assert not (target.cache_dir / oc._IMPORT_MARKER).exists()
+        assert target.get_stats()["total_entries"] == 102
+        assert target.load_snapshot(str(pack)) == 102  # a finished import starts over
+
+
+class TestHostilePack:
+    @pytest.mark.parametrize("cache_type, key", [
+        ("species", "../escaped.json"),
+        ("species", "species_../../escaped.json"),
+        ("species", "/tmp/escaped.json"),
+        ("species", "ncbi_562.json"),
+        ("species", "species_562.sh"),
+        ("plugins", "plugins_562.json"),
+    ])
+    def test_unsafe_keys_are_refused_before_anything_is_written(self, tmp_path, cache_type, key):
+        from nanometa_live.core.utils.taxonomy_pack import write_pack
+
+        raw = json.dumps({"key": "k", "data": {}, "created_at": 0, "ttl": 1,
+                          "source": "snapshot"}).encode()
+        path = tmp_path / "bundle" / "taxonomy_snapshot.nmpack"
+        path.parent.mkdir()
+        write_pack(path, [("species", "species_1.json", raw, 1.0),
+                          (cache_type, key, raw, 1.0)])
+        target = OfflineTaxonomyCache(cache_dir=str(tmp_path / "dst"))
+
+        assert target.load_snapshot(str(path)) == 0
+        assert not list(tmp_path.rglob("escaped.json"))
+        assert target.get_species_info(1) is None
+
+
+class TestSummaryStats:
+    def test_stats_do_not_scan_the_cache(self, source):
+        with patch.object(pathlib.Path, "glob", side_effect=AssertionError("scanned")):
+            stats = source.get_stats()
+        assert (stats["species_entries"], stats["ncbi_entries"], stats["gtdb_entries"]) == (51, 50, 1)
+        assert stats["expired_entries"] == 1
+        assert stats["cache_size_bytes"] == sum(
+            f.stat().st_size for d in ("gtdb", "ncbi", "species")
+            for f in (source.cache_dir / d).glob("*.json"))
+
+    def test_overwrites_are_not_double_counted(self, source):
+        source.cache_species_info(3, {"name": "renamed"})
+        assert source.get_stats()["species_entries"] == 51
+
+    def test_clear_expired_skips_the_scan_when_nothing_expired(self, source):
+        assert source.clear_expired() == 1
+        with patch.object(pathlib.Path, "glob", side_effect=AssertionError("scanned")):
+            assert source.clear_expired() == 0
+        assert source.get_stats()["total_entries"] == 101
+
+    def test_a_cache_without_a_summary_is_recounted_once(self, source):
+        meta = json.loads(source.metadata_file.read_text())
+        del meta["summary"]
+        source.metadata_file.write_text(json.dumps(meta))
+        reopened = OfflineTaxonomyCache(cache_dir=str(source.cache_dir))
+        assert reopened.get_stats()["total_entries"] == 102
+
+
+def test_bundle_ships_the_pack_instead_of_entry_files(tmp_path, monkeypatch):
+    import tarfile
+
+    from nanometa_live.core.workflow.bundle_manager import BundleManager
+
+    fake_home = tmp_path / "fakehome"
+    fake_home.mkdir()
+    monkeypatch.setattr(pathlib.Path, "home", classmethod(lambda cls: fake_home))
+    build_home = tmp_path / "build_home"
+    cache = OfflineTaxonomyCache(cache_dir=str(build_home / "cache"))
+    for taxid in range(30):
+        cache.cache_ncbi_taxonomy(taxid, {"lineage": [1, taxid]})
+    out = tmp_path / "bundle.tar.gz"
+
+    mgr = BundleManager()
+    mgr.export_bundle(str(out), {"kraken_db": ""}, nanometa_home=str(build_home),
+                      pre_warm_conda_envs=False)
+    with tarfile.open(str(out)) as tar:
+        names = tar.getnames()
+    assert "cache/taxonomy_snapshot.nmpack" in names
+    assert not [n for n in names if n.startswith("cache/ncbi/")]
+
+    field_home = tmp_path / "field_home"
+    field_home.mkdir()
+    (tmp_path / "kraken_db").mkdir()
+    mgr.import_bundle(str(out), kraken_db_path=str(tmp_path / "kraken_db"),
+                      nanometa_home=str(field_home))
+    imported = OfflineTaxonomyCache(cache_dir=str(field_home / "cache"))
+    assert imported.get_ncbi_taxonomy(12) == {"lineage": [1, 12]}
+    assert imported.get_stats()["ncbi_entries"] == 30
+
+
+def test_bundle_falls_back_to_entry_files_when_the_pack_fails(tmp_path, monkeypatch):
+    import tarfile
+
+    from nanometa_live.core.workflow.bundle_manager import BundleManager
+
+    fake_home = tmp_path / "fakehome"
+    fake_home.mkdir()
+    monkeypatch.setattr(pathlib.Path, "home", classmethod(lambda cls: fake_home))
+    build_home = tmp_path / "build_home"
+    cache = OfflineTaxonomyCache(cache_dir=str(build_home / "cache"))
+    cache.cache_ncbi_taxonomy(562, {"lineage": [1, 562]})
+    monkeypatch.setattr(OfflineTaxonomyCache, "_export_pack", lambda self, path: 0)
+    out = tmp_path / "bundle.tar.gz"
+
+    BundleManager().export_bundle(str(out), {"kraken_db": ""}, nanometa_home=str(build_home),
+                                  pre_warm_conda_envs=False)
+    with tarfile.open(str(out)) as tar:
+        names = tar.getnames()
+    assert "cache/taxonomy_snapshot.nmpack" not in names
+    assert "cache/ncbi/ncbi_562.json" in names
+    assert "cache/cache_metadata.json" in names
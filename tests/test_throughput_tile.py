@@ -90,3 +90,13 @@ def test_format_age_seconds():
     assert format_age_seconds(45) == "45s"
     assert format_age_seconds(60) == "1m00s"
     assert format_age_seconds(192) == "3m12s"
+
+
+def test_input_rate_needs_estimates_on_both_ends():
+    from nanometa_live.app.utils.throughput import compute_input_rate
+    buf = append_tick([], 0.0, 0, 0)
+    buf = append_tick(buf, 60.0, 0, 0, input_reads=500)
+    assert compute_input_rate(buf) is None
+    buf = append_tick(buf, 120.0, 0, 0, input_reads=2500)
+    buf = buf[1:]
+    assert compute_input_rate(buf) == pytest.approx(2000.0)
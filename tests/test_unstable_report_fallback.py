@@ -106,13 +106,13 @@ class TestAggregateStaysMonotonic:
 
         # barcode11's report is being rewritten right now. Clear the
         # higher-level result caches so the union genuinely re-parses (the
-        # per-file last-good map deliberately survives).
+        # per-file frames and last-good keys deliberately survive).
         b11.write_text(REPORT)
         from nanometa_live.core.utils.loader_utils import clear_all_loader_caches
-        with_last_good = dict(cl._last_good_frame)
+        frames, last_good = dict(cl._report_frame_cache), dict(cl._last_good_key)
         clear_all_loader_caches()
-        cl._report_frame_cache.clear()
-        cl._last_good_frame.update(with_last_good)
+        cl._report_frame_cache.update(frames)
+        cl._last_good_key.update(last_good)
         again = cl.load_kraken_data(str(tmp_path), "All Samples")
         assert again["cumul_reads"].sum() == total_before, (
             "the aggregate lost a barcode during its per-batch report rewrite"
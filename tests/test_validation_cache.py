@@ -0,0 +1,152 @@
+"""Per-file validation ledger: one rewritten file costs one parse, not all."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from nanometa_live.core.parsers import paf_coverage_parser, validation_cache
+from nanometa_live.core.parsers.blast_validation_parser import ValidationParser
+from nanometa_live.core.parsers.paf_coverage_parser import paf_breadth
+from nanometa_live.core.parsers.validation_cache import file_ledger, results_cache
+
+pytestmark = pytest.mark.unit
+
+TAXIDS = (263, 632, 1392)
+REF_LEN = 1_000_000
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    validation_cache.clear_validation_caches()
+    yield
+    validation_cache.clear_validation_caches()
+
+
+def _blast_rows(n_reads, pident=99.0):
+    return "".join(
+        f"read{i}\tNC_1\t{pident}\t150\t1\t0\t1\t150\t1\t150\t1e-50\t300\n"
+        for i in range(n_reads))
+
+
+def _paf_rows(n_reads):
+    return "".join(
+        f"r{i}\t9000\t0\t9000\t+\tNC_1\t{REF_LEN}\t{i * 10_000}\t{i * 10_000 + 9000}"
+        f"\t9000\t9000\t60\n" for i in range(n_reads))
+
+
+def _bump(path, text):
+    """Rewrite ``path`` and move its mtime on, as a cumulative batch does."""
+    before = path.stat().st_mtime_ns
+    path.write_text(text)
+    os.utime(path, ns=(before + 1_000_000, before + 1_000_000))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    blast = tmp_path / "validation" / "blast"
+    mm2 = tmp_path / "validation" / "minimap2"
+    blast.mkdir(parents=True)
+    mm2.mkdir()
+    for taxid in TAXIDS:
+        stem = f"barcode01_taxid{taxid}"
+        (blast / f"{stem}.blast.tsv").write_text(_blast_rows(20))
+        (mm2 / f"{stem}.paf").write_text(_paf_rows(20))
+        (mm2 / f"{stem}.minimap2_stats.json").write_text(json.dumps({
+            "sample_id": "barcode01", "taxid": taxid, "total_reads": 20,
+            "mapped_reads": 20, "hit_rate": 1.0, "avg_identity": 99.5,
+            "avg_mapq": 60, "ref_name": "NC_1", "ref_length": REF_LEN,
+        }))
+    return tmp_path
+
+
+def _spies():
+    return (
+        patch.object(validation_cache, "summarize_blast_tsv",
+                     wraps=validation_cache.summarize_blast_tsv),
+        patch.object(paf_coverage_parser, "_compute_paf_breadth",
+                     wraps=paf_coverage_parser._compute_paf_breadth),
+    )
+
+
+class TestIncrementalReparse:
+    def test_one_rewritten_tsv_is_the_only_file_parsed(self, tree):
+        ValidationParser(str(tree)).get_validation_results()
+        _bump(tree / "validation" / "blast" / "barcode01_taxid632.blast.tsv",
+              _blast_rows(35, pident=97.0))
+
+        tsv_spy, paf_spy = _spies()
+        with tsv_spy as tsv, paf_spy as paf:
+            results = ValidationParser(str(tree)).get_validation_results()
+        assert [c.args[0].name for c in tsv.call_args_list] == [
+            "barcode01_taxid632.blast.tsv"]
+        assert paf.call_count == 0
+        blast = {r.taxid: r for r in results if r.validation_method == "blast"}
+        assert blast[632].validated_reads == 35
+        assert blast[632].percent_identity_max == 97.0
+        assert blast[263].validated_reads == 20
+
+    def test_one_rewritten_paf_is_the_only_breadth_recomputed(self, tree):
+        ValidationParser(str(tree)).get_validation_results()
+        _bump(tree / "validation" / "minimap2" / "barcode01_taxid263.paf", _paf_rows(50))
+
+        tsv_spy, paf_spy = _spies()
+        with tsv_spy as tsv, paf_spy as paf:
+            results = ValidationParser(str(tree)).get_validation_results()
+        assert tsv.call_count == 0
+        assert [c.args[0].name for c in paf.call_args_list] == ["barcode01_taxid263.paf"]
+        mm2 = {r.taxid: r for r in results if r.validation_method == "minimap2"}
+        assert mm2[263].genome_breadth > mm2[632].genome_breadth
+
+
+class TestSharedAcrossParsers:
+    def test_a_second_parser_reuses_the_merged_results(self, tree):
+        first = ValidationParser(str(tree)).get_validation_results()
+        tsv_spy, paf_spy = _spies()
+        with tsv_spy as tsv, paf_spy as paf, \
+                patch.object(ValidationParser, "_collect_results") as collect:
+            second = ValidationParser(str(tree)).get_validation_results(sample="barcode01")
+        collect.assert_not_called()
+        assert tsv.call_count == paf.call_count == 0
+        assert len(second) == len(first) == 6
+
+    def test_callers_get_copies(self, tree):
+        parser = ValidationParser(str(tree))
+        parser.get_validation_results()[0].species = "edited by a caller"
+        assert all(r.species != "edited by a caller"
+                   for r in parser.get_validation_results())
+
+    def test_on_demand_results_invalidate_the_shared_cache(self, tree):
+        parser = ValidationParser(str(tree))
+        before = parser._validation_dir_fingerprint()
+        on_demand = tree / "on_demand_validation"
+        on_demand.mkdir()
+        (on_demand / "barcode01_taxid263_validation.json").write_text("{}")
+        assert parser._validation_dir_fingerprint() != before
+
+    def test_run_boundary_clears_both_layers(self, tree):
+        from nanometa_live.core.utils.loader_utils import clear_data_cache
+        key = (str(tree), str(tree / "validation" / "blast"))
+        ValidationParser(str(tree)).get_validation_results()
+        assert len(file_ledger) and results_cache.entry(key)
+        clear_data_cache()
+        assert len(file_ledger) == 0 and results_cache.entry(key) is None
+
+
+class TestLedger:
+    def test_unreadable_paf_is_remembered(self, tmp_path):
+        paf = tmp_path / "empty.paf"
+        paf.write_text("")
+        with patch.object(paf_coverage_parser, "_compute_paf_breadth",
+                          return_value=None) as compute:
+            assert paf_breadth(paf) is None
+            assert paf_breadth(paf) is None
+        assert compute.call_count == 1
+
+    def test_ledger_is_bounded(self, tmp_path):
+        ledger = validation_cache.FileLedger(max_entries=2)
+        for i in range(3):
+            (tmp_path / f"{i}.txt").write_text("x")
+            ledger.get(tmp_path / f"{i}.txt", "k", lambda p: p.name)
+        assert len(ledger) == 2
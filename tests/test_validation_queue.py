@@ -0,0 +1,185 @@
+"""Tests for the coalescing on-demand validation queue."""
+
+import threading
+import time
+
+import pytest
+
+from nanometa_live.core.config.pathogen_loader import ThreatLevel
+from nanometa_live.core.workflow import validation_queue as vq
+from nanometa_live.core.workflow.validation_models import ValidationResult
+from nanometa_live.core.workflow.validation_queue import ValidationQueue
+
+pytestmark = pytest.mark.unit
+
+
+def _result(taxid, name, sample):
+    return ValidationResult(
+        taxid=taxid, name=name, sample=sample, total_classified_reads=10,
+        extracted_reads=10, validated_reads=9, validation_rate=0.9,
+        avg_identity=99.0, min_identity=98.0, max_identity=100.0, success=True)
+
+
+class FakeValidator:
+    """Stands in for OnDemandValidator's batch entry point."""
+
+    def __init__(self, delay=0.0, missing=()):
+        self.batches = []
+        self.delay = delay
+        self.missing = set(missing)
+
+    def validate_batch_via_nanometanf(self, targets, method, config, progress):
+        self.batches.append((list(targets), method))
+        progress("Running nanometanf validation...", 50)
+        time.sleep(self.delay)
+        return [None if t[0] in self.missing else _result(*t) for t in targets]
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return ValidationQueue(tmp_path, window_seconds=0.3, poll_seconds=0.02)
+
+
+class TestQueue:
+    def test_claims_critical_first_then_oldest(self, queue):
+        queue.submit(1, "Low one", "barcode01", threat_level="low")
+        queue.submit(2, "Unlisted", "barcode01")
+        queue.submit(3, "Critical", "barcode02", threat_level=ThreatLevel.CRITICAL)
+        queue.submit(4, "High", "barcode01", threat_level="high")
+        batch = queue.claim_batch()
+        assert [r["taxid"] for r in batch] == [3, 4, 1, 2]
+        assert len({r["batch_id"] for r in batch}) == 1
+
+    def test_duplicate_requests_share_one_record(self, queue):
+        first = queue.submit(7, "X y", "barcode01", threat_level="low")
+        again = queue.submit(7, "X y", "barcode01", threat_level="critical")
+        other_method = queue.submit(7, "X y", "barcode01", method="minimap2")
+        assert first == again != other_method
+        records = {r["request_id"]: r for r in queue.requests()}
+        assert records[first]["priority"] == vq.THREAT_PRIORITY["critical"]
+
+    def test_batches_never_mix_methods(self, queue):
+        queue.submit(1, "A", "s", method="minimap2")
+        queue.submit(2, "B", "s", method="blast", threat_level="critical")
+        queue.submit(3, "C", "s", method="blast")
+        validator = FakeValidator()
+        assert queue.run_batch(validator) == 2
+        assert queue.run_batch(validator) == 1
+        assert validator.batches == [([(2, "B", "s"), (3, "C", "s")], "blast"),
+                                     ([(1, "A", "s")], "minimap2")]
+
+    def test_orphaned_running_records_are_requeued(self, queue):
+        queue.submit(1, "A", "s")
+        queue.claim_batch()  # a worker that then died mid-run
+        assert queue.claim_batch()[0]["taxid"] == 1
+
+    def test_unreadable_state_is_an_empty_queue(self, queue):
+        queue.state_path.write_text("{not json")
+        assert queue.requests() == []
+        queue.submit(1, "A", "s")
+        assert len(queue.requests()) == 1
+
+
+class TestValidate:
+    def test_concurrent_clicks_coalesce_into_one_run(self, queue):
+        validator = FakeValidator(delay=0.1, missing={3})
+        out, seen = {}, {}
+
+        def click(taxid, level):
+            seen[taxid] = []
+            out[taxid] = queue.validate(
+                validator, taxid, f"Taxon {taxid}", "barcode01", config={},
+                threat_level=level,
+                progress_callback=lambda msg, pct, t=taxid: seen[t].append((msg, pct)))
+
+        threads = [threading.Thread(target=click, args=(t, lvl))
+                   for t, lvl in [(1, "low"), (2, "critical"), (3, None), (2, "low")]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        assert len(validator.batches) == 1
+        targets, method = validator.batches[0]
+        assert [t[0] for t in targets] == [2, 1, 3]
+        assert method == "blast"
+        assert out[1].validated_reads == 9 and out[2].taxid == 2
+        assert out[3] is None  # nanometanf reported nothing for it
+        statuses = {r["taxid"]: r["status"] for r in queue.requests()}
+        assert statuses == {1: vq.DONE, 2: vq.DONE, 3: vq.FAILED}
+        # Waiters that did not launch the run still saw its progress.
+        waiting = [msgs for msgs in seen.values() if msgs]
+        assert any("(batch of 3)" in msg for msgs in waiting for msg, _ in msgs)
+
+    def test_batch_exception_fails_every_waiter(self, queue):
+        class Broken(FakeValidator):
+            def validate_batch_via_nanometanf(self, *args):
+                raise RuntimeError("nextflow vanished")
+
+        assert queue.validate(Broken(), 5, "A", "s", config={}) is None
+        (record,) = queue.requests()
+        assert record["status"] == vq.FAILED
+        assert "nextflow vanished" in record["error"]
+
+
+    def test_lock_holder_drains_requests_whose_callbacks_are_still_waiting(self, queue):
+        # Clicks submit at click time; with every heavy worker busy their
+        # callbacks have not started, so the lock holder must run them.
+        validator = FakeValidator()
+        mine = queue.submit(1, "A", "s")
+        queue.submit(2, "B", "s", method="minimap2")
+        later = queue.submit(3, "C", "s")
+        assert queue.validate(validator, 1, "A", "s", config={}, request_id=mine).taxid == 1
+        assert [m for _, m in validator.batches] == ["blast", "minimap2"]
+        # The waiting callback, once a worker frees up, just collects its result.
+        assert queue.validate(validator, 3, "C", "s", config={}, request_id=later).taxid == 3
+        assert len(validator.batches) == 2
+
+    def test_request_id_from_click_time_is_not_resubmitted(self, queue):
+        request_id = queue.submit(4, "D", "s")
+        queue.validate(FakeValidator(), 4, "D", "s", config={}, request_id=request_id)
+        assert [r["request_id"] for r in queue.requests()] == [request_id]
+
+    def test_launch_lock_fails_closed_without_fcntl(self, queue, monkeypatch):
+        held = set()
+
+        class FakeMsvcrt:
+            LK_NBLCK, LK_UNLCK = 2, 0
+
+            @staticmethod
+            def locking(fd, mode, nbytes):
+                if mode == FakeMsvcrt.LK_UNLCK:
+                    held.clear()
+                elif held:
+                    raise OSError("locked")
+                else:
+                    held.add(fd)
+
+        monkeypatch.setattr(vq, "fcntl", None)
+        monkeypatch.setattr(vq, "msvcrt", FakeMsvcrt, raising=False)
+        with queue._launch_lock() as first:
+            with queue._launch_lock() as second:
+                assert (first, second) == (True, False)
+        with queue._launch_lock() as again:
+            assert again
+
+
+class TestValidatorWiring:
+    def test_validate_organism_routes_through_the_queue(self, tmp_path, monkeypatch):
+        from nanometa_live.core.workflow.on_demand_validator import OnDemandValidator
+
+        validator = OnDemandValidator(results_dir=tmp_path, input_dir=tmp_path)
+        calls = []
+        monkeypatch.setattr(
+            validator, "validate_batch_via_nanometanf",
+            lambda targets, method, config, progress: calls.append(targets)
+            or [_result(*t) for t in targets])
+        queue = validator.validation_queue()
+        queue.window_seconds = 0
+        result = validator.validate_organism(
+            taxid=562, name="E. coli", sample="barcode01",
+            config={"pipeline_source": "remote:dev"},
+            queue=queue, threat_level="high")
+        assert result.success
+        assert calls == [[(562, "E. coli", "barcode01")]]
+        assert queue.state_path.parent == validator.validation_dir
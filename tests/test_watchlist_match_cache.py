@@ -0,0 +1,205 @@
+"""Tests for the persistent, watchlist-versioned match cache."""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from nanometa_live.core.taxonomy.database_profile import DatabaseProfile
+from nanometa_live.core.taxonomy.taxid_mapping import (
+    TaxidMapping,
+    TaxidMappingCollection,
+)
+from nanometa_live.core.watchlist import match_cache as mc
+from nanometa_live.core.watchlist import watchlist_manager as wm_mod
+from nanometa_live.core.watchlist.watchlist_manager import (
+    WatchlistManager,
+    reset_watchlist_manager,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _isolate(monkeypatch, tmp_path):
+    monkeypatch.setenv("NANOMETA_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr("nanometa_live.core.utils.paths.get_mappings_dir_from_env",
+                        lambda: str(tmp_path / "mappings"))
+    monkeypatch.setattr("nanometa_live.core.taxonomy.taxid_mapping._mapping_collection", None)
+    mc.clear_match_caches()
+    reset_watchlist_manager()
+    yield
+    mc.clear_match_caches()
+    reset_watchlist_manager()
+
+
+@pytest.fixture
+def manager():
+    with patch.object(WatchlistManager, "_save_toggle_state", lambda self: None):
+        mgr = WatchlistManager()
+        mgr._entries.clear()
+        mgr._name_index.clear()
+        mgr.add_custom_entry({"taxid": 1392, "name": "Bacillus anthracis",
+                              "threat_level": "critical", "enabled": True,
+                              "alert_threshold": 5})
+        mgr.add_custom_entry({"taxid": 263, "name": "Francisella tularensis",
+                              "threat_level": "high", "enabled": True,
+                              "alert_threshold": 5})
+        yield mgr
+
+
+def _collection(db_hash="abc123"):
+    collection = TaxidMappingCollection(
+        database_path="/db", database_hash=db_hash,
+        profile=DatabaseProfile(taxids_are_ncbi=False))
+    collection.mappings[263] = TaxidMapping(
+        ncbi_taxid=263, canonical_name="Francisella tularensis",
+        db_taxid=5001, match_score=0.95)
+    return collection
+
+
+def _organisms(reads=50, extra=()):
+    rows = [
+        {"taxid": 9001, "name": "s__Bacillus_anthracis", "reads": reads, "abundance": 1.0},
+        {"taxid": 5001, "name": "Francisella tularensis_A", "reads": reads, "abundance": 1.0},
+        {"taxid": 7, "name": "Escherichia coli", "reads": reads, "abundance": 1.0},
+    ]
+    return rows + list(extra)
+
+
+def _spy():
+    matcher = wm_mod._get_taxonomy_matcher()
+    return patch.object(matcher, "match_row_indexed", wraps=matcher.match_row_indexed)
+
+
+class TestSteadyState:
+    def test_only_new_taxa_reach_the_matcher(self, manager):
+        collection = _collection()
+        with _spy() as spy:
+            cold = manager.check_organisms_with_mapping_split(_organisms(50), collection)
+            assert spy.call_count == 2  # the mapped 5001 never name-matches
+            warm = manager.check_organisms_with_mapping_split(_organisms(80), collection)
+            assert spy.call_count == 2
+            manager.check_organisms_with_mapping_split(
+                _organisms(80, [{"taxid": 8, "name": "Yersinia pestis", "reads": 3}]),
+                collection)
+            assert spy.call_count == 3
+        assert [(a["name"], a["match_method"], a["reads"]) for a in cold[0]] == [
+            ("Bacillus anthracis", "name_matching", 50),
+            ("Francisella tularensis", "taxid_mapping", 50)]
+        assert [a["reads"] for a in warm[0]] == [80, 80]
+
+    def test_cached_pass_equals_a_cold_pass(self, manager):
+        collection = _collection()
+        organisms = _organisms(50, [{"taxid": 1392, "name": "Bacillus anthracis", "reads": 2}])
+        manager.check_organisms_with_mapping_split(organisms, collection)
+        warm = manager.check_organisms_with_mapping_split(organisms, collection)
+        mc.clear_match_caches()
+        cold = manager.check_organisms_with_mapping_split(organisms, collection)
+        assert warm == cold
+        assert manager.check_organisms_split(organisms) == \
+            manager.check_organisms_split(organisms)
+
+
+class TestInvalidation:
+    def test_watchlist_edit_rematches(self, manager):
+        manager.check_organisms_split(_organisms())
+        with _spy() as spy:
+            manager.check_organisms_split(_organisms())
+            assert spy.call_count == 0
+            with patch.object(WatchlistManager, "_save_toggle_state", lambda self: None):
+                manager.toggle_entry(263, False)
+            above, _ = manager.check_organisms_split(_organisms())
+            assert spy.call_count == 3
+        assert [a["name"] for a in above] == ["Bacillus anthracis"]
+
+    def test_mapping_edit_in_place_rematches(self, manager):
+        collection = _collection()
+        manager.check_organisms_with_mapping_split(_organisms(), collection)
+        collection.mappings[263].match_score = 0.5  # an operator downgrades it
+        above, _ = manager.check_organisms_with_mapping_split(_organisms(), collection)
+        assert [a["name"] for a in above] == ["Bacillus anthracis"]
+
+
+    def test_signature_is_reused_while_the_saved_mappings_are_unchanged(self, tmp_path):
+        collection = _collection()
+        collection.save(str(tmp_path / "mappings" / "abc123_mappings.json"))
+        first = mc.mapping_signature(collection)
+        with patch.object(mc.hashlib, "md5", wraps=mc.hashlib.md5) as spy:
+            assert mc.mapping_signature(collection) == first
+            assert spy.call_count == 0
+            collection.mappings[263].match_score = 0.5
+            collection.update_statistics()
+            collection.save(str(tmp_path / "mappings" / "abc123_mappings.json"))
+            assert mc.mapping_signature(collection) != first
+            assert spy.call_count == 1
+
+
+class TestPersistence:
+    def test_a_new_process_starts_warm(self, manager, tmp_path):
+        collection = _collection()
+        manager.check_organisms_with_mapping_split(_organisms(), collection)
+        path = tmp_path / "mappings" / "abc123_match_cache.json"
+        assert len(json.loads(path.read_text())["rows"]) == 3
+
+        mc.clear_match_caches()  # what a restart leaves in memory
+        with _spy() as spy:
+            above, _ = manager.check_organisms_with_mapping_split(_organisms(), collection)
+        assert spy.call_count == 0
+        assert len(above) == 2
+
+    def test_a_file_from_another_watchlist_is_ignored(self, manager, tmp_path):
+        collection = _collection()
+        manager.check_organisms_with_mapping_split(_organisms(), collection)
+        mc.clear_match_caches()
+        with patch.object(WatchlistManager, "_save_toggle_state", lambda self: None):
+            manager.toggle_entry(1392, False)
+        with _spy() as spy:
+            above, _ = manager.check_organisms_with_mapping_split(_organisms(), collection)
+        assert spy.call_count == 2
+        assert [a["name"] for a in above] == ["Francisella tularensis"]
+
+    def test_unreadable_file_is_a_cold_start(self, tmp_path):
+        path = tmp_path / "x_match_cache.json"
+        path.write_text("{not json")
+        cache = mc.MatchCache(path)
+        cache.bind("ns")
+        assert len(cache) == 0
+        cache.put("ns", 1, "A b", (None, 0.0, None))
+        cache.put("other", 2, "C d", (None, 0.0, None))  # a stale pass's write
+        assert cache.flush()
+        assert json.loads(path.read_text())["rows"] == [[1, "A b", None, 0.0, None]]
+
+    def test_flush_only_writes_when_a_persisted_row_changed(self, tmp_path):
+        cache = mc.MatchCache(tmp_path / "x_match_cache.json")
+        cache.bind("ns")
+        cache.put("ns", 1, "A b", (None, 0.0, None))
+        assert cache.flush()
+        cache.put("ns", 1, "A b", (None, 0.0, None))  # already known
+        cache.put("ns", "1", "A b", (None, 0.0, None))  # never persisted
+        assert not cache.flush()
+        cache.put("ns", 1, "A b", (1392, 0.9, "name_matching"))
+        assert cache.flush()
+
+    def test_counters_are_exact_under_concurrent_reads(self):
+        cache = mc.MatchCache()
+        cache.bind("ns")
+        cache.put("ns", 1, "A b", (None, 0.0, None))
+
+        def read():
+            for _ in range(5000):
+                cache.get("ns", 1, "A b")
+                cache.get("ns", 2, "C d")
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert (cache.hits, cache.misses) == (20000, 20000)
+
+    def test_no_database_means_memory_only(self, manager, tmp_path):
+        manager.check_organisms_split(_organisms())
+        assert not list(tmp_path.rglob("*_match_cache.json"))
+        assert mc.match_cache_stats()["entries"] == 3
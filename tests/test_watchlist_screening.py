@@ -0,0 +1,200 @@
+"""Tests for the taxa x samples screening matrix and its two consumers."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nanometa_live.app.tabs import dashboard_helpers as dh
+from nanometa_live.core.utils.attribution import (
+    PER_SAMPLE_DISCOVERY_FLOOR,
+    build_pathogen_attribution,
+    is_negative_control,
+)
+from nanometa_live.core.watchlist.screening import (
+    SampleAttributionMap,
+    build_read_matrix,
+    screen_entry,
+    species_attribution,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _frame(rows):
+    return pd.DataFrame(rows, columns=["%", "cumul_reads", "reads", "rank", "taxid", "name"])
+
+
+def _random_frames(seed: int, n_samples: int = 6, n_taxa: int = 200) -> Dict[str, pd.DataFrame]:
+    rng = random.Random(seed)
+    pool = [(1000 + i, f"Genus{i // 7} species{i}") for i in range(n_taxa)]
+    names = [f"barcode{i:02d}" for i in range(1, n_samples)] + ["NTC"]
+    frames = {}
+    for sample in names:
+        rows = []
+        for taxid, name in rng.sample(pool, k=n_taxa // 2):
+            cumul = rng.choice([0, 2, 4, 5, 6, 40, 900])
+            rank = rng.choice(["S", "S", "S1", "G"])
+            rows.append((round(cumul / 10, 2), cumul, cumul // 2, rank, taxid, name))
+        frames[sample] = _frame(rows)
+    frames["barcode_empty"] = _frame([])
+    return frames
+
+
+def _reference_attribution(frames, config) -> Dict[int, List[Dict[str, Any]]]:
+    """The per-sample dict construction the matrix replaced."""
+    out: Dict[int, List[Dict[str, Any]]] = {}
+    for sample, df in frames.items():
+        if df.empty:
+            continue
+        species = dh._species_discovery_df(df)
+        for org in dh._species_df_to_organisms(species):
+            out.setdefault(org["taxid"], []).append({
+                "sample": sample, "reads": org["reads"],
+                "abundance": org["abundance"],
+                "is_negative_control": is_negative_control(sample, config),
+            })
+    for rows in out.values():
+        rows.sort(key=lambda r: r["reads"], reverse=True)
+    return out
+
+
+class TestMatrix:
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_attribution_matches_the_per_sample_dicts(self, seed):
+        frames = _random_frames(seed)
+        config = {"negative_control_samples": ["barcode02"]}
+        reference = _reference_attribution(frames, config)
+        mapping = species_attribution(frames, config)
+        assert set(mapping) == set(reference)
+        for taxid, rows in reference.items():
+            got = mapping[taxid]
+            assert [(r["sample"], r["reads"], r["is_negative_control"]) for r in got] == \
+                [(r["sample"], r["reads"], r["is_negative_control"]) for r in rows]
+            assert [r["abundance"] for r in got] == pytest.approx(
+                [r["abundance"] for r in rows])
+
+    def test_build_attribution_is_unchanged(self):
+        frames = _random_frames(7)
+        reference = _reference_attribution(frames, None)
+        taxid = next(iter(reference))
+        detection = [{"name": "X", "detected_taxid": taxid, "threshold": 40}]
+        assert build_pathogen_attribution(detection, species_attribution(frames)) == \
+            build_pathogen_attribution(detection, reference)
+
+    def test_missing_taxid_and_mapping_protocol(self):
+        mapping = species_attribution({"barcode01": _frame([(1.0, 50, 50, "S", 9, "A b")])})
+        assert mapping.get(12345) is None
+        assert mapping.get("not-a-taxid") is None
+        assert len(mapping) == 1 and bool(mapping)
+        rows = mapping[9]
+        rows[0]["reads"] = -1  # a caller annotating its copy...
+        assert mapping[9][0]["reads"] == 50  # ...does not touch the next one
+
+    def test_duplicate_taxid_rows_are_summed(self):
+        frames = {"barcode01": _frame([(1.0, 10, 10, "S", 5, "A b"),
+                                       (1.0, 7, 7, "S", 5, "A b")])}
+        matrix = build_read_matrix(frames, species_only=True)
+        assert matrix.reads.tolist() == [[17]]
+
+    def test_species_rows_come_through_the_discovery_gate(self):
+        from unittest.mock import patch
+
+        from nanometa_live.core.watchlist import screening
+
+        frames = {"barcode01": _frame([(1.0, 10, 10, "S", 5, "A b")])}
+        with patch.object(screening, "species_discovery_df",
+                          wraps=screening.species_discovery_df) as gate:
+            species_attribution(frames)
+        gate.assert_called_once()
+        assert gate.call_args.args[1] == screening.PER_SAMPLE_DISCOVERY_FLOOR
+
+    def test_frames_missing_columns_are_skipped(self):
+        bad = pd.DataFrame({"taxid": [1], "name": ["x"]})
+        frames = {"bad": bad, "ok": _frame([(1.0, 10, 10, "S", 5, "A b")])}
+        matrix = build_read_matrix(frames, species_only=True)
+        assert matrix.samples == ["bad", "ok"]
+        assert matrix.reads.tolist() == [[0, 10]]
+
+
+class TestEntryReads:
+    def test_taxid_first_then_name_per_sample(self):
+        frames = {
+            "s1": _frame([(1.0, 30, 30, "S", 1392, "Bacillus anthracis")]),
+            # A sample from a database that spells the taxid differently.
+            "s2": _frame([(1.0, 8, 8, "S", 77643, " bacillus ANTHRACIS ")]),
+            "s3": _frame([(1.0, 4, 4, "S", 1, "Other")]),
+        }
+        matrix = build_read_matrix(frames)
+        assert matrix.entry_reads(1392, "Bacillus anthracis").tolist() == [30, 8, 0]
+        assert matrix.entry_reads(None, "bacillus anthracis").tolist() == [30, 8, 0]
+        assert matrix.entry_reads(99, None).tolist() == [0, 0, 0]
+
+    def test_a_listed_taxid_wins_even_with_no_reads(self):
+        frames = {
+            # The taxid row is present with 0 reads: the name match must not
+            # replace it, as the old per-frame taxid-then-name lookup did not.
+            "s1": _frame([(0.0, 0, 0, "S", 1392, "Bacillus anthracis"),
+                          (1.0, 12, 12, "S", 77643, "Bacillus anthracis")]),
+            "s2": _frame([(1.0, 8, 8, "S", 77643, "Bacillus anthracis")]),
+        }
+        matrix = build_read_matrix(frames)
+        assert matrix.entry_reads(1392, "Bacillus anthracis").tolist() == [0, 8]
+
+    def test_screen_rows_flag_controls_and_sort(self):
+        frames = {
+            "barcode01": _frame([(1.0, 5, 5, "S", 3, "A b")]),
+            "NTC": _frame([(1.0, 9, 9, "S", 3, "A b")]),
+            "barcode02": _frame([(1.0, 9, 9, "S", 3, "A b")]),
+        }
+        matrix = build_read_matrix(frames)
+        screen = screen_entry(matrix, matrix.entry_reads(3, None))
+        rows = screen.rows()
+        assert [(r["sample"], r["is_negative_control"]) for r in rows] == [
+            ("NTC", True), ("barcode02", False), ("barcode01", False)]
+
+
+class TestDashboardMemo:
+    def test_unchanged_frames_reuse_the_attribution(self):
+        frames = _random_frames(4, n_samples=3)
+        dh._per_sample_memo.clear()
+        with patch.object(dh, "load_kraken_data", side_effect=lambda d, s: frames[s]):
+            first = dh._load_per_sample_organisms("/r", ["All Samples", *frames])
+            second = dh._load_per_sample_organisms("/r", ["All Samples", *frames])
+            assert isinstance(first, SampleAttributionMap)
+            assert second is first
+            frames["barcode01"] = frames["barcode01"].copy()  # a report changed
+            third = dh._load_per_sample_organisms("/r", ["All Samples", *frames])
+            assert third is not first
+            declared = dh._load_per_sample_organisms(
+                "/r", ["All Samples", *frames], {"negative_control_samples": ["barcode01"]})
+            assert declared is not third
+        dh._per_sample_memo.clear()
+
+    def test_memo_is_a_registered_cache_charged_for_its_frames(self):
+        from nanometa_live.core.utils.bounded_cache import cache_stats, estimate_size
+
+        frames = _random_frames(4, n_samples=3)
+        dh._per_sample_memo.clear()
+        with patch.object(dh, "load_kraken_data", side_effect=lambda d, s: frames[s]):
+            dh._load_per_sample_organisms("/r", ["All Samples", *frames])
+        stats = cache_stats()["per_sample_attribution"]
+        assert stats["entries"] == 1
+        assert stats["bytes"] > sum(estimate_size(f) for f in frames.values())
+        dh._per_sample_memo.clear()
+
+    def test_lookup_cost_does_not_grow_with_taxa(self):
+        """Only looked-up taxids become dicts."""
+        frames = _random_frames(5, n_samples=24, n_taxa=2000)
+        mapping = species_attribution(frames)
+        with patch("nanometa_live.core.watchlist.screening.screen_entry",
+                   wraps=screen_entry) as spy:
+            taxid = int(np.asarray(mapping.matrix.taxids)[0])
+            mapping.get(taxid)
+            mapping.get(-1)
+        assert spy.call_count == 1